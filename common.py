@@ -3283,6 +3283,32 @@ class Packet(object):
     def is_virtual(self):
         return self.raw_data.get('is_virtual', False)
 
+    def is_stable(self):
+        return self.raw_data.get('is_stable', False)
+
+    def is_side_effect_free(self):
+        side_effect_free = self.raw_data.get('is_side_effect_free')
+
+        if side_effect_free != None:
+            return side_effect_free
+
+        if self.is_stable():
+            return True
+
+        # plain getters only, low-level stream getters advance the stream,
+        # getters with a reset parameter change the device state and getters
+        # with a session ID allocate objects in that session (RED Brick)
+        if self.get_response_expected() != 'always_true' or \
+           self.get_name().space.split(' ')[0] not in ['Get', 'Is'] or \
+           self.get_high_level('stream_out') != None:
+            return False
+
+        for element in self.get_elements(direction='in'):
+            if 'Reset' in element.get_name().space or element.get_name().space == 'Session Id':
+                return False
+
+        return True
+
 class Device(object):
     def __init__(self, raw_data, generator):
         self.raw_data = raw_data
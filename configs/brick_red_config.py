@@ -1148,6 +1148,7 @@ the resulting error code.
 com['packets'].append({
 'type': 'function',
 'name': 'Get Next Directory Entry',
+'is_side_effect_free': False, # advances the directory object
 'elements': [('Directory Id', 'uint16', 1, 'in', {}),
              ('Session Id', 'uint16', 1, 'in', {}),
              ('Error Code', 'uint8', 1, 'out', {'constant_group': 'Error Code'}),
@@ -1211,6 +1211,7 @@ common_packets.append({
 'type': 'function',
 'function_id': 255,
 'name': 'Get Identity',
+'is_stable': True, # result doesn't change while the device is running
 'elements': [('Uid', 'string', 8, 'out', {}),
              ('Connected Uid', 'string', 8, 'out', {}),
              ('Position', 'char', 1, 'out', {'range': ('0', '8')}), # TODO: TNG Position?
@@ -1252,6 +1253,7 @@ common_packets.append({
 'type': 'function',
 'function_id': 255,
 'name': 'Get Identity',
+'is_stable': True, # result doesn't change while the device is running
 'elements': [('Uid', 'string', 8, 'out', {}),
              ('Connected Uid', 'string', 8, 'out', {}),
              ('Position', 'char', 1, 'out', {'range': ('0', '8')}),
@@ -1293,6 +1295,7 @@ common_packets.append({
 'type': 'function',
 'function_id': 255,
 'name': 'Get Identity',
+'is_stable': True, # result doesn't change while the device is running
 'elements': [('Uid', 'string', 8, 'out', {}),
              ('Connected Uid', 'string', 8, 'out', {}),
              ('Position', 'char', 1, 'out', {'range': [('a', 'h'), ('z', 'z')]}),
@@ -1338,6 +1341,7 @@ common_packets.append({
 'type': 'function',
 'function_id': 255,
 'name': 'Get Identity',
+'is_stable': True, # result doesn't change while the device is running
 'elements': [('Uid', 'string', 8, 'out', {}),
              ('Connected Uid', 'string', 8, 'out', {}),
              ('Position', 'char', 1, 'out', {'range': [('i', 'i')]}),
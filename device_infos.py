@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+from collections import namedtuple
+
+DeviceInfo = namedtuple('DeviceInfo', 'identifier category long_display_name short_display_name ref_name hardware_doc_name software_doc_prefix git_name firmware_url_part has_comcu is_released is_documented is_discontinued has_bindings description')
+
+brick_infos = \
+[
+    DeviceInfo(11, 'Brick', 'DC Brick', 'DC', 'dc_brick', 'DC_Brick', 'DC_Brick', 'dc-brick', 'dc', False, True, True, True, True, {'en': 'Drives one brushed DC motor with up to 28V and 5A (peak)', 'de': 'Steuert einen Gleichstrommotor mit bis zu 28V und 5A (Peak)'}),
+    DeviceInfo(None, 'Brick', 'Debug Brick', 'Debug', 'debug_brick', 'Debug_Brick', None, 'debug-brick', None, False, True, True, False, False, {'en': 'For Firmware Developers: JTAG and serial console', 'de': 'Für Firmware Entwickler: JTAG und serielle Konsole'}),
+    DeviceInfo(111, 'Brick', 'HAT Brick', 'HAT', 'hat_brick', 'HAT_Brick', 'HAT_Brick', 'hat-brick', 'hat', True, True, True, False, True, {'en': 'HAT for Raspberry Pi with 8 Bricklets ports and real-time clock', 'de': 'HAT für Raspberry Pi mit 8 Bricklet-Ports und Echtzeituhr'}),
+    DeviceInfo(112, 'Brick', 'HAT Zero Brick', 'HAT Zero', 'hat_zero_brick', 'HAT_Zero_Brick', 'HATZero_Brick', 'hat-zero-brick', 'hat_zero', True, True, True, False, True, {'en': 'HAT for Raspberry Pi Zero with 4 Bricklets ports', 'de': 'HAT für Raspberry Pi Zero mit 4 Bricklet-Ports'}),
+    DeviceInfo(16, 'Brick', 'IMU Brick', 'IMU', 'imu_brick', 'IMU_Brick', 'IMU_Brick', 'imu-brick', 'imu', False, True, True, True, True, {'en': 'Full fledged AHRS with 9 degrees of freedom', 'de': 'Voll ausgestattetes AHRS mit 9 Freiheitsgraden'}),
+    DeviceInfo(18, 'Brick', 'IMU Brick 2.0', 'IMU 2.0', 'imu_v2_brick', 'IMU_V2_Brick', 'IMUV2_Brick', 'imu-v2-brick', 'imu_v2', False, True, True, False, True, {'en': 'Full fledged AHRS with 9 degrees of freedom', 'de': 'Voll ausgestattetes AHRS mit 9 Freiheitsgraden'}),
+    DeviceInfo(13, 'Brick', 'Master Brick', 'Master', 'master_brick', 'Master_Brick', 'Master_Brick', 'master-brick', 'master', False, True, True, False, True, {'en': 'Basis to build stacks and has 4 Bricklet ports', 'de': 'Grundlage um Stapel zu bauen und bietet 4 Bricklet Anschlüsse'}),
+    DeviceInfo(17, 'Brick', 'RED Brick', 'RED', 'red_brick', 'RED_Brick', 'RED_Brick', 'red-brick', None, False, True, True, False, True, {'en': 'Executes user programs and controls other Bricks/Bricklets standalone', 'de': 'Führt Programme aus und steuert andere Bricks/Bricklets selbständig'}),
+    DeviceInfo(14, 'Brick', 'Servo Brick', 'Servo', 'servo_brick', 'Servo_Brick', 'Servo_Brick', 'servo-brick', 'servo', False, True, True, True, True, {'en': 'Drives up to 7 RC Servos with up to 3A', 'de': 'Steuert bis zu 7 RC Servos mit bis zu 3A'}),
+    DeviceInfo(19, 'Brick', 'Silent Stepper Brick', 'Silent Stepper', 'silent_stepper_brick', 'Silent_Stepper_Brick', 'SilentStepper_Brick', 'silent-stepper-brick', 'silent_stepper', False, True, True, False, True, {'en': 'Silently drives one bipolar stepper motor with up to 46V and 1.6A per phase', 'de': 'Steuert einen bipolaren Schrittmotor lautlos mit bis zu 46V und 1,6A pro Phase'}),
+    DeviceInfo(15, 'Brick', 'Stepper Brick', 'Stepper', 'stepper_brick', 'Stepper_Brick', 'Stepper_Brick', 'stepper-brick', 'stepper', False, True, True, True, True, {'en': 'Drives one bipolar stepper motor with up to 38V and 2.5A per phase', 'de': 'Steuert einen bipolaren Schrittmotor mit bis zu 38V und 2,5A pro Phase'}),
+]
+
+bricklet_infos = \
+[
+    DeviceInfo(250, 'Bricklet', 'Accelerometer Bricklet', 'Accelerometer', 'accelerometer_bricklet', 'Accelerometer', 'Accelerometer_Bricklet', 'accelerometer-bricklet', 'accelerometer', False, True, True, True, True, {'en': 'Measures acceleration in three axis', 'de': 'Misst Beschleunigung in drei Achsen'}),
+    DeviceInfo(2130, 'Bricklet', 'Accelerometer Bricklet 2.0', 'Accelerometer 2.0', 'accelerometer_v2_bricklet', 'Accelerometer_V2', 'AccelerometerV2_Bricklet', 'accelerometer-v2-bricklet', 'accelerometer_v2', True, True, True, False, True, {'en': 'Measures acceleration in three axis', 'de': 'Misst Beschleunigung in drei Achsen'}),
+    DeviceInfo(297, 'Bricklet', 'Air Quality Bricklet', 'Air Quality', 'air_quality_bricklet', 'Air_Quality', 'AirQuality_Bricklet', 'air-quality-bricklet', 'air_quality', True, True, True, False, True, {'en': 'Measures IAQ index, temperature, humidity and air pressure', 'de': 'Misst IAQ Index, Temperatur, relative Luftfeuchtigkeit und Luftdruck'}),
+    DeviceInfo(21, 'Bricklet', 'Ambient Light Bricklet', 'Ambient Light', 'ambient_light_bricklet', 'Ambient_Light', 'AmbientLight_Bricklet', 'ambient-light-bricklet', 'ambient_light', False, True, True, True, True, {'en': 'Measures ambient light up to 900lux', 'de': 'Misst Umgebungslicht bis zu 900Lux'}),
+    DeviceInfo(259, 'Bricklet', 'Ambient Light Bricklet 2.0', 'Ambient Light 2.0', 'ambient_light_v2_bricklet', 'Ambient_Light_V2', 'AmbientLightV2_Bricklet', 'ambient-light-v2-bricklet', 'ambient_light_v2', False, True, True, True, True, {'en': 'Measures ambient light up to 64000lux', 'de': 'Misst Umgebungslicht bis zu 64000Lux'}),
+    DeviceInfo(2131, 'Bricklet', 'Ambient Light Bricklet 3.0', 'Ambient Light 3.0', 'ambient_light_v3_bricklet', 'Ambient_Light_V3', 'AmbientLightV3_Bricklet', 'ambient-light-v3-bricklet', 'ambient_light_v3', True, True, True, False, True, {'en': 'Measures ambient light up to 64000lux', 'de': 'Misst Umgebungslicht bis zu 64000Lux'}),
+    DeviceInfo(219, 'Bricklet', 'Analog In Bricklet', 'Analog In', 'analog_in_bricklet', 'Analog_In', 'AnalogIn_Bricklet', 'analog-in-bricklet', 'analog_in', False, True, True, True, True, {'en': 'Measures DC voltage between 0V and 45V', 'de': 'Misst Gleichspannung zwischen 0V und 45V'}),
+    DeviceInfo(251, 'Bricklet', 'Analog In Bricklet 2.0', 'Analog In 2.0', 'analog_in_v2_bricklet', 'Analog_In_V2', 'AnalogInV2_Bricklet', 'analog-in-v2-bricklet', 'analog_in_v2', False, True, True, True, True, {'en': 'Measures DC voltage between 0V and 42V', 'de': 'Misst Gleichspannung zwischen 0V und 42V'}),
+    DeviceInfo(295, 'Bricklet', 'Analog In Bricklet 3.0', 'Analog In 3.0', 'analog_in_v3_bricklet', 'Analog_In_V3', 'AnalogInV3_Bricklet', 'analog-in-v3-bricklet', 'analog_in_v3', True, True, True, False, True, {'en': 'Measures DC voltage between 0V and 42V', 'de': 'Misst Gleichspannung zwischen 0V und 42V'}),
+    DeviceInfo(220, 'Bricklet', 'Analog Out Bricklet', 'Analog Out', 'analog_out_bricklet', 'Analog_Out', 'AnalogOut_Bricklet', 'analog-out-bricklet', 'analog_out', False, True, True, True, True, {'en': 'Generates configurable DC voltage between 0V and 5V', 'de': 'Erzeugt konfigurierbare Gleichspannung zwischen 0V und 5V'}),
+    DeviceInfo(256, 'Bricklet', 'Analog Out Bricklet 2.0', 'Analog Out 2.0', 'analog_out_v2_bricklet', 'Analog_Out_V2', 'AnalogOutV2_Bricklet', 'analog-out-v2-bricklet', 'analog_out_v2', False, True, True, False, True, {'en': 'Generates configurable DC voltage between 0V and 12V', 'de': 'Erzeugt konfigurierbare Gleichspannung zwischen 0V und 12V'}),
+    DeviceInfo(2115, 'Bricklet', 'Analog Out Bricklet 3.0', 'Analog Out 3.0', 'analog_out_v3_bricklet', 'Analog_Out_V3', 'AnalogOutV3_Bricklet', 'analog-out-v3-bricklet', 'analog_out_v3', True, True, True, False, True, {'en': 'Generates configurable DC voltage between 0V and 12V', 'de': 'Erzeugt konfigurierbare Gleichspannung zwischen 0V und 12V'}),
+    DeviceInfo(2160, 'Bricklet', 'ARINC429 Bricklet', 'ARINC429', 'arinc429_bricklet', 'ARINC429', 'ARINC429_Bricklet', 'arinc429-bricklet', 'arinc429', True, False, False, False, True, {'en': 'ARINC429 single transmitter and dual receiver', 'de': 'ARINC429 1 Kanal Sender und 2 Kanal Empfänger'}),
+    DeviceInfo(221, 'Bricklet', 'Barometer Bricklet', 'Barometer', 'barometer_bricklet', 'Barometer', 'Barometer_Bricklet', 'barometer-bricklet', 'barometer', False, True, True, False, True, {'en': 'Measures air pressure and altitude changes', 'de': 'Misst Luftdruck und Höhenänderungen'}),
+    DeviceInfo(2117, 'Bricklet', 'Barometer Bricklet 2.0', 'Barometer 2.0', 'barometer_v2_bricklet', 'Barometer_V2', 'BarometerV2_Bricklet', 'barometer-v2-bricklet', 'barometer_v2', True, True, True, False, True, {'en': 'Measures air pressure and altitude changes', 'de': 'Misst Luftdruck und Höhenänderungen'}),
+    DeviceInfo(None, 'Bricklet', 'Breakout Bricklet', 'Breakout', 'breakout_bricklet', 'Breakout', None, 'breakout-bricklet', None, False, True, True, False, False, {'en': 'Makes all Bricklet signals available', 'de': 'Macht alle Bricklet Signale zugänglich'}),
+    DeviceInfo(270, 'Bricklet', 'CAN Bricklet', 'CAN', 'can_bricklet', 'CAN', 'CAN_Bricklet', 'can-bricklet', 'can', False, True, True, False, True, {'en': 'Communicates with CAN bus devices', 'de': 'Kommuniziert mit CAN-Bus Geräten'}),
+    DeviceInfo(2107, 'Bricklet', 'CAN Bricklet 2.0', 'CAN 2.0', 'can_v2_bricklet', 'CAN_V2', 'CANV2_Bricklet', 'can-v2-bricklet', 'can_v2', True, True, True, False, True, {'en': 'Communicates with CAN bus devices', 'de': 'Kommuniziert mit CAN-Bus Geräten'}),
+    DeviceInfo(262, 'Bricklet', 'CO2 Bricklet', 'CO2', 'co2_bricklet', 'CO2', 'CO2_Bricklet', 'co2-bricklet', 'co2', False, True, True, True, True, {'en': 'Measures CO2 concentration in ppm', 'de': 'Misst CO2-Konzentration in ppm'}),
+    DeviceInfo(2147, 'Bricklet', 'CO2 Bricklet 2.0', 'CO2 2.0', 'co2_v2_bricklet', 'CO2_V2', 'CO2V2_Bricklet', 'co2-v2-bricklet', 'co2_v2', True, True, True, False, True, {'en': 'Measures CO2 concentration, temperature and humidity', 'de': 'Misst CO2-Konzentration, Temperatur und Luftfeuchte'}),
+    DeviceInfo(243, 'Bricklet', 'Color Bricklet', 'Color', 'color_bricklet', 'Color', 'Color_Bricklet', 'color-bricklet', 'color', False, True, True, False, True, {'en': 'Measures color (RGB value), illuminance and color temperature', 'de': 'Misst Farbe (RGB Wert), Beleuchtungsstärke und Farbtemperatur'}),
+    DeviceInfo(2128, 'Bricklet', 'Color Bricklet 2.0', 'Color 2.0', 'color_v2_bricklet', 'Color_V2', 'ColorV2_Bricklet', 'color-v2-bricklet', 'color_v2', True, True, True, False, True, {'en': 'Measures color (RGB value), illuminance and color temperature', 'de': 'Misst Farbe (RGB Wert), Beleuchtungsstärke und Farbtemperatur'}),
+    DeviceInfo(2153, 'Bricklet', 'Compass Bricklet', 'Compass', 'compass_bricklet', 'Compass', 'Compass_Bricklet', 'compass-bricklet', 'compass', True, True, True, False, True, {'en': '3-axis compass with 10 nanotesla and 0.1° resolution', 'de': '3-Achsen Kompass mit 10 Nanotesla und 0,1° Auflösung'}),
+    DeviceInfo(23, 'Bricklet', 'Current12 Bricklet', 'Current12', 'current12_bricklet', 'Current12', 'Current12_Bricklet', 'current12-bricklet', 'current12', False, True, True, True, True, {'en': 'Measures AC/DC current between -12.5A and +12.5A', 'de': 'Misst Gleich- und Wechselstrom zwischen -12,5A und +12,5A'}),
+    DeviceInfo(24, 'Bricklet', 'Current25 Bricklet', 'Current25', 'current25_bricklet', 'Current25', 'Current25_Bricklet', 'current25-bricklet', 'current25', False, True, True, True, True, {'en': 'Measures AC/DC current between -25A and +25A', 'de': 'Misst Gleich- und Wechselstrom zwischen -25A und +25A'}),
+    DeviceInfo(2165, 'Bricklet', 'DC Bricklet 2.0', 'DC 2.0', 'dc_v2_bricklet', 'DC_V2', 'DCV2_Bricklet', 'dc-v2-bricklet', 'dc_v2', True, True, True, False, True, {'en': 'Drives one brushed DC motor with up to 28V and 5A (peak)', 'de': 'Steuert einen Gleichstrommotor mit bis zu 28V und 5A (Peak)'}),
+    DeviceInfo(25, 'Bricklet', 'Distance IR Bricklet', 'Distance IR', 'distance_ir_bricklet', 'Distance_IR', 'DistanceIR_Bricklet', 'distance-ir-bricklet', 'distance_ir', False, True, True, False, True, {'en': 'Measures distance up to 150cm with infrared light', 'de': 'Misst Entfernung bis zu 150cm mit Infrarot-Licht'}),
+    DeviceInfo(2125, 'Bricklet', 'Distance IR Bricklet 2.0', 'Distance IR 2.0', 'distance_ir_v2_bricklet', 'Distance_IR_V2', 'DistanceIRV2_Bricklet', 'distance-ir-v2-bricklet', 'distance_ir_v2', True, True, True, False, True, {'en': 'Measures distance up to 150cm with infrared light', 'de': 'Misst Entfernung bis zu 150cm mit Infrarot-Licht'}),
+    DeviceInfo(229, 'Bricklet', 'Distance US Bricklet', 'Distance US', 'distance_us_bricklet', 'Distance_US', 'DistanceUS_Bricklet', 'distance-us-bricklet', 'distance_us', False, True, True, True, True, {'en': 'Measures distance between 2cm and 400cm with ultrasound', 'de': 'Misst Entfernung zwischen 2cm und 400cm mit Ultraschall'}),
+    DeviceInfo(299, 'Bricklet', 'Distance US Bricklet 2.0', 'Distance US 2.0', 'distance_us_v2_bricklet', 'Distance_US_V2', 'DistanceUSV2_Bricklet', 'distance-us-v2-bricklet', 'distance_us_v2', True, True, True, False, True, {'en': 'Measures distance between 30cm and 500cm with ultrasound', 'de': 'Misst Entfernung zwischen 30cm und 500cm mit Ultraschall'}),
+    DeviceInfo(285, 'Bricklet', 'DMX Bricklet', 'DMX', 'dmx_bricklet', 'DMX', 'DMX_Bricklet', 'dmx-bricklet', 'dmx', True, True, True, False, True, {'en': 'DMX master and slave', 'de': 'DMX Master und Slave'}),
+    DeviceInfo(230, 'Bricklet', 'Dual Button Bricklet', 'Dual Button', 'dual_button_bricklet', 'Dual_Button', 'DualButton_Bricklet', 'dual-button-bricklet', 'dual_button', False, True, True, True, True, {'en': 'Two tactile buttons with built-in blue LEDs', 'de': 'Zwei Taster mit eingebauten blauen LEDs'}),
+    DeviceInfo(2119, 'Bricklet', 'Dual Button Bricklet 2.0', 'Dual Button 2.0', 'dual_button_v2_bricklet', 'Dual_Button_V2', 'DualButtonV2_Bricklet', 'dual-button-v2-bricklet', 'dual_button_v2', True, True, True, False, True, {'en': 'Two tactile buttons with built-in blue LEDs', 'de': 'Zwei Taster mit eingebauten blauen LEDs'}),
+    DeviceInfo(26, 'Bricklet', 'Dual Relay Bricklet', 'Dual Relay', 'dual_relay_bricklet', 'Dual_Relay', 'DualRelay_Bricklet', 'dual-relay-bricklet', 'dual_relay', False, True, True, True, True, {'en': 'Two relays to switch AC/DC devices', 'de': 'Zwei Relais um Gleich- und Wechselstromgeräte zu schalten'}),
+    DeviceInfo(260, 'Bricklet', 'Dust Detector Bricklet', 'Dust Detector', 'dust_detector_bricklet', 'Dust_Detector', 'DustDetector_Bricklet', 'dust-detector-bricklet', 'dust_detector', False, True, True, False, True, {'en': 'Measures dust density', 'de': 'Misst Staubdichte'}),
+    DeviceInfo(2146, 'Bricklet', 'E-Paper 296x128 Bricklet', 'E-Paper 296x128', 'e_paper_296x128_bricklet', 'EPaper_296x128', 'EPaper296x128_Bricklet', 'e-paper-296x128-bricklet', 'e_paper_296x128', True, True, True, False, True, {'en': 'Three color 296x128 e-paper display', 'de': 'Dreifarbiges 296x128 E-Paper-Display'}),
+    DeviceInfo(2152, 'Bricklet', 'Energy Monitor Bricklet', 'Energy Monitor', 'energy_monitor_bricklet', 'Energy_Monitor', 'EnergyMonitor_Bricklet', 'energy-monitor-bricklet', 'energy_monitor', True, True, True, False, True, {'en': 'Measures Voltage, Current, Energy, Real/Apparent/Reactive Power, Power Factor and Frequency', 'de': 'Misst Spannung, Strom, Energie, Wirk-/Schein-/Blindleistung, Leistungsfactor und Frequenz'}),
+    DeviceInfo(2159, 'Bricklet', 'EVSE Bricklet', 'EVSE', 'evse_bricklet', 'EVSE', 'EVSE_Bricklet', 'evse-bricklet', 'evse', True, False, False, False, True, {'en': 'TBD', 'de': 'TBD'}),
+    DeviceInfo(2167, 'Bricklet', 'EVSE Bricklet 2.0', 'EVSE 2.0', 'evse_v2_bricklet', 'EVSE_V2', 'EVSEV2_Bricklet', 'evse-v2-bricklet', 'evse_v2', True, False, False, False, True, {'en': 'TBD', 'de': 'TBD'}),
+    DeviceInfo(222, 'Bricklet', 'GPS Bricklet', 'GPS', 'gps_bricklet', 'GPS', 'GPS_Bricklet', 'gps-bricklet', 'gps', False, True, True, True, True, {'en': 'Determine position, velocity and altitude using GPS', 'de': 'Bestimmt Position, Geschwindigkeit und Höhe mittels GPS'}),
+    DeviceInfo(276, 'Bricklet', 'GPS Bricklet 2.0', 'GPS 2.0', 'gps_v2_bricklet', 'GPS_V2', 'GPSV2_Bricklet', 'gps-v2-bricklet', 'gps_v2', True, True, True, False, True, {'en': 'Determine position, velocity and altitude using GPS', 'de': 'Bestimmt Position, Geschwindigkeit und Höhe mittels GPS'}),
+    DeviceInfo(240, 'Bricklet', 'Hall Effect Bricklet', 'Hall Effect', 'hall_effect_bricklet', 'Hall_Effect', 'HallEffect_Bricklet', 'hall-effect-bricklet', 'hall_effect', False, True, True, False, True, {'en': 'Detects presence of magnetic field', 'de': 'Detektiert Magnetfelder'}),
+    DeviceInfo(2132, 'Bricklet', 'Hall Effect Bricklet 2.0', 'Hall Effect 2.0', 'hall_effect_v2_bricklet', 'Hall_Effect_V2', 'HallEffectV2_Bricklet', 'hall-effect-v2-bricklet', 'hall_effect_v2', True, True, True, False, True, {'en': 'Measures magnetic flux density between -7mT and +7mT', 'de': 'Misst magnetische Flussdichte zwischen -7mT und +7mT'}),
+    DeviceInfo(27, 'Bricklet', 'Humidity Bricklet', 'Humidity', 'humidity_bricklet', 'Humidity', 'Humidity_Bricklet', 'humidity-bricklet', 'humidity', False, True, True, True, True, {'en': 'Measures relative humidity', 'de': 'Misst relative Luftfeuchtigkeit'}),
+    DeviceInfo(283, 'Bricklet', 'Humidity Bricklet 2.0', 'Humidity 2.0', 'humidity_v2_bricklet', 'Humidity_V2', 'HumidityV2_Bricklet', 'humidity-v2-bricklet', 'humidity_v2', True, True, True, False, True, {'en': 'Measures relative humidity', 'de': 'Misst relative Luftfeuchtigkeit'}),
+    DeviceInfo(2161, 'Bricklet', 'IMU Bricklet 3.0', 'IMU 3.0', 'imu_v3_bricklet', 'IMU_V3', 'IMUV3_Bricklet', 'imu-v3-bricklet', 'imu_v3', True, True, True, False, True, {'en': 'Full fledged AHRS with 9 degrees of freedom', 'de': 'Voll ausgestattetes AHRS mit 9 Freiheitsgraden'}),
+    DeviceInfo(258, 'Bricklet', 'Industrial Analog Out Bricklet', 'Industrial Analog Out', 'industrial_analog_out_bricklet', 'Industrial_Analog_Out', 'IndustrialAnalogOut_Bricklet', 'industrial-analog-out-bricklet', 'industrial_analog_out', False, True, True, True, True, {'en': 'Generates configurable DC voltage and current, 0V to 10V and 4mA to 20mA', 'de': 'Erzeugt konfigurierbare Gleichspannung und -strom, 0V bis 10V und 4mA bis 20mA'}),
+    DeviceInfo(2116, 'Bricklet', 'Industrial Analog Out Bricklet 2.0', 'Industrial Analog Out 2.0', 'industrial_analog_out_v2_bricklet', 'Industrial_Analog_Out_V2', 'IndustrialAnalogOutV2_Bricklet', 'industrial-analog-out-v2-bricklet', 'industrial_analog_out_v2', True, True, True, False, True, {'en': 'Generates configurable DC voltage and current, 0V to 10V and 4mA to 20mA', 'de': 'Erzeugt konfigurierbare Gleichspannung und -strom, 0V bis 10V und 4mA bis 20mA'}),
+    DeviceInfo(293, 'Bricklet', 'Industrial Counter Bricklet', 'Industrial Counter', 'industrial_counter_bricklet', 'Industrial_Counter', 'IndustrialCounter_Bricklet', 'industrial-counter-bricklet', 'industrial_counter', True, True, True, False, True, {'en': '4 channel counter up to 4MHz', 'de': '4-Kanal Zähler bis zu 4MHz'}),
+    DeviceInfo(223, 'Bricklet', 'Industrial Digital In 4 Bricklet', 'Industrial Digital In 4', 'industrial_digital_in_4_bricklet', 'Industrial_Digital_In_4', 'IndustrialDigitalIn4_Bricklet', 'industrial-digital-in-4-bricklet', 'industrial_digital_in_4', False, True, True, True, True, {'en': '4 galvanically isolated digital inputs', 'de': '4 galvanisch getrennte digitale Eingänge'}),
+    DeviceInfo(2100, 'Bricklet', 'Industrial Digital In 4 Bricklet 2.0', 'Industrial Digital In 4 2.0', 'industrial_digital_in_4_v2_bricklet', 'Industrial_Digital_In_4_V2', 'IndustrialDigitalIn4V2_Bricklet', 'industrial-digital-in-4-v2-bricklet', 'industrial_digital_in_4_v2', True, True, True, False, True, {'en': '4 galvanically isolated digital inputs', 'de': '4 galvanisch getrennte digitale Eingänge'}),
+    DeviceInfo(224, 'Bricklet', 'Industrial Digital Out 4 Bricklet', 'Industrial Digital Out 4', 'industrial_digital_out_4_bricklet', 'Industrial_Digital_Out_4', 'IndustrialDigitalOut4_Bricklet', 'industrial-digital-out-4-bricklet', 'industrial_digital_out_4', False, True, True, False, True, {'en': '4 galvanically isolated digital outputs', 'de': '4 galvanisch getrennte digitale Ausgänge'}),
+    DeviceInfo(2124, 'Bricklet', 'Industrial Digital Out 4 Bricklet 2.0', 'Industrial Digital Out 4 2.0', 'industrial_digital_out_4_v2_bricklet', 'Industrial_Digital_Out_4_V2', 'IndustrialDigitalOut4V2_Bricklet', 'industrial-digital-out-4-v2-bricklet', 'industrial_digital_out_4_v2', True, True, True, False, True, {'en': '4 galvanically isolated digital outputs', 'de': '4 galvanisch getrennte digitale Ausgänge'}),
+    DeviceInfo(228, 'Bricklet', 'Industrial Dual 0-20mA Bricklet', 'Industrial Dual 0-20mA', 'industrial_dual_0_20ma_bricklet', 'Industrial_Dual_020mA', 'IndustrialDual020mA_Bricklet', 'industrial-dual-0-20ma-bricklet', 'industrial_dual_0_20ma', False, True, True, False, True, {'en': 'Measures two DC currents between 0mA and 20mA (IEC 60381-1)', 'de': 'Misst zwei Gleichströme zwischen 0mA und 20mA (IEC 60381-1)'}),
+    DeviceInfo(2120, 'Bricklet', 'Industrial Dual 0-20mA Bricklet 2.0', 'Industrial Dual 0-20mA 2.0', 'industrial_dual_0_20ma_v2_bricklet', 'Industrial_Dual_020mA_V2', 'IndustrialDual020mAV2_Bricklet', 'industrial-dual-0-20ma-v2-bricklet', 'industrial_dual_0_20ma_v2', True, True, True, False, True, {'en': 'Measures two DC currents between 0mA and 20mA (IEC 60381-1)', 'de': 'Misst zwei Gleichströme zwischen 0mA und 20mA (IEC 60381-1)'}),
+    DeviceInfo(2162, 'Bricklet', 'Industrial Dual AC Relay Bricklet', 'Industrial Dual AC Relay', 'industrial_dual_ac_relay_bricklet', 'Industrial_Dual_AC_Relay', 'IndustrialDualACRelay_Bricklet', 'industrial-dual-ac-relay-bricklet', 'industrial_dual_ac_relay', True, True, True, False, True, {'en': 'Two relays to switch AC devices', 'de': 'Zwei Relais um Wechselstromgeräte zu schalten'}),
+    DeviceInfo(249, 'Bricklet', 'Industrial Dual Analog In Bricklet', 'Industrial Dual Analog In', 'industrial_dual_analog_in_bricklet', 'Industrial_Dual_Analog_In', 'IndustrialDualAnalogIn_Bricklet', 'industrial-dual-analog-in-bricklet', 'industrial_dual_analog_in', False, True, True, True, True, {'en': 'Measures two DC voltages between -35V and +35V with 24bit resolution each', 'de': 'Misst zwei Gleichspannungen zwischen -35V und +35V mit jeweils 24Bit Auflösung'}),
+    DeviceInfo(2121, 'Bricklet', 'Industrial Dual Analog In Bricklet 2.0', 'Industrial Dual Analog In 2.0', 'industrial_dual_analog_in_v2_bricklet', 'Industrial_Dual_Analog_In_V2', 'IndustrialDualAnalogInV2_Bricklet', 'industrial-dual-analog-in-v2-bricklet', 'industrial_dual_analog_in_v2', True, True, True, False, True, {'en': 'Measures two DC voltages between -35V and +35V with 24bit resolution each', 'de': 'Misst zwei Gleichspannungen zwischen -35V und +35V mit jeweils 24Bit Auflösung'}),
+    DeviceInfo(284, 'Bricklet', 'Industrial Dual Relay Bricklet', 'Industrial Dual Relay', 'industrial_dual_relay_bricklet', 'Industrial_Dual_Relay', 'IndustrialDualRelay_Bricklet', 'industrial-dual-relay-bricklet', 'industrial_dual_relay', True, True, True, False, True, {'en': 'Two relays to switch AC/DC devices', 'de': 'Zwei Relais um Gleich- und Wechselstromgeräte zu schalten'}),
+    DeviceInfo(2164, 'Bricklet', 'Industrial PTC Bricklet', 'Industrial PTC', 'industrial_ptc_bricklet', 'Industrial_PTC', 'IndustrialPTC_Bricklet', 'industrial-ptc-bricklet', 'industrial_ptc', True, True, True, False, True, {'en': 'Reads temperatures from Pt100 und Pt1000 sensors', 'de': 'Liest Temperaturen von Pt100 und Pt1000 Sensoren'}),
+    DeviceInfo(225, 'Bricklet', 'Industrial Quad Relay Bricklet', 'Industrial Quad Relay', 'industrial_quad_relay_bricklet', 'Industrial_Quad_Relay', 'IndustrialQuadRelay_Bricklet', 'industrial-quad-relay-bricklet', 'industrial_quad_relay', False, True, True, True, True, {'en': '4 galvanically isolated solid state relays', 'de': '4 galvanisch getrennte Halbleiterrelais (Solid State Relais)'}),
+    DeviceInfo(2102, 'Bricklet', 'Industrial Quad Relay Bricklet 2.0', 'Industrial Quad Relay 2.0', 'industrial_quad_relay_v2_bricklet', 'Industrial_Quad_Relay_V2', 'IndustrialQuadRelayV2_Bricklet', 'industrial-quad-relay-v2-bricklet', 'industrial_quad_relay_v2', True, True, True, False, True, {'en': '4 galvanically isolated solid state relays', 'de': '4 galvanisch getrennte Halbleiterrelais (Solid State Relais)'}),
+    DeviceInfo(28, 'Bricklet', 'IO-16 Bricklet', 'IO-16', 'io16_bricklet', 'IO16', 'IO16_Bricklet', 'io16-bricklet', 'io16', False, True, True, False, True, {'en': '16-channel digital input/output', 'de': '16 digitale Ein- und Ausgänge'}),
+    DeviceInfo(2114, 'Bricklet', 'IO-16 Bricklet 2.0', 'IO-16 2.0', 'io16_v2_bricklet', 'IO16_V2', 'IO16V2_Bricklet', 'io16-v2-bricklet', 'io16_v2', True, True, True, False, True, {'en': '16-channel digital input/output', 'de': '16 digitale Ein- und Ausgänge'}),
+    DeviceInfo(29, 'Bricklet', 'IO-4 Bricklet', 'IO-4', 'io4_bricklet', 'IO4', 'IO4_Bricklet', 'io4-bricklet', 'io4', False, True, True, True, True, {'en': '4-channel digital input/output', 'de': '4 digitale Ein- und Ausgänge'}),
+    DeviceInfo(2111, 'Bricklet', 'IO-4 Bricklet 2.0', 'IO-4 2.0', 'io4_v2_bricklet', 'IO4_V2', 'IO4V2_Bricklet', 'io4-v2-bricklet', 'io4_v2', True, True, True, False, True, {'en': '4-channel digital input/output', 'de': '4 digitale Ein- und Ausgänge'}),
+    DeviceInfo(2122, 'Bricklet', 'Isolator Bricklet', 'Isolator', 'isolator_bricklet', 'Isolator', 'Isolator_Bricklet', 'isolator-bricklet', 'isolator', True, True, True, False, True, {'en': 'Galvanically isolates any Bricklet from any Brick', 'de': 'Trennt Verbindung zwischen Bricklets und Bricks galvanisch'}),
+    DeviceInfo(210, 'Bricklet', 'Joystick Bricklet', 'Joystick', 'joystick_bricklet', 'Joystick', 'Joystick_Bricklet', 'joystick-bricklet', 'joystick', False, True, True, False, True, {'en': '2-axis joystick with push-button', 'de': '2-Achsen Joystick mit Taster'}),
+    DeviceInfo(2138, 'Bricklet', 'Joystick Bricklet 2.0', 'Joystick 2.0', 'joystick_v2_bricklet', 'Joystick_V2', 'JoystickV2_Bricklet', 'joystick-v2-bricklet', 'joystick_v2', True, True, True, False, True, {'en': '2-axis joystick with push-button', 'de': '2-Achsen Joystick mit Taster'}),
+    DeviceInfo(255, 'Bricklet', 'Laser Range Finder Bricklet', 'Laser Range Finder', 'laser_range_finder_bricklet', 'Laser_Range_Finder', 'LaserRangeFinder_Bricklet', 'laser-range-finder-bricklet', 'laser_range_finder', False, True, True, True, True, {'en': 'Measures distance up to 40m with laser light', 'de': 'Misst Entfernung bis zu 40m mit Laser-Licht'}),
+    DeviceInfo(2144, 'Bricklet', 'Laser Range Finder Bricklet 2.0', 'Laser Range Finder 2.0', 'laser_range_finder_v2_bricklet', 'Laser_Range_Finder_V2', 'LaserRangeFinderV2_Bricklet', 'laser-range-finder-v2-bricklet', 'laser_range_finder_v2', True, True, True, False, True, {'en': 'Measures distance up to 40m with laser light', 'de': 'Misst Entfernung bis zu 40m mit Laser-Licht'}),
+    DeviceInfo(298, 'Bricklet', 'LCD 128x64 Bricklet', 'LCD 128x64', 'lcd_128x64_bricklet', 'LCD_128x64', 'LCD128x64_Bricklet', 'lcd-128x64-bricklet', 'lcd_128x64', True, True, True, False, True, {'en': '7.1cm (2.8") display with 128x64 pixel and touch screen', 'de': '7,1cm (2,8") Display mit 128x64 Pixel und Touchscreen'}),
+    DeviceInfo(211, 'Bricklet', 'LCD 16x2 Bricklet', 'LCD 16x2', 'lcd_16x2_bricklet', 'LCD_16x2', 'LCD16x2_Bricklet', 'lcd-16x2-bricklet', 'lcd_16x2', False, True, True, True, True, {'en': '16x2 character alphanumeric display with blue backlight', 'de': '16x2 Zeichen alphanumerisches Display mit blauer Hintergrundbeleuchtung'}),
+    DeviceInfo(212, 'Bricklet', 'LCD 20x4 Bricklet', 'LCD 20x4', 'lcd_20x4_bricklet', 'LCD_20x4', 'LCD20x4_Bricklet', 'lcd-20x4-bricklet', 'lcd_20x4', False, True, True, False, True, {'en': '20x4 character alphanumeric display with blue backlight', 'de': '20x4 Zeichen alphanumerisches Display mit blauer Hintergrundbeleuchtung'}),
+    DeviceInfo(231, 'Bricklet', 'LED Strip Bricklet', 'LED Strip', 'led_strip_bricklet', 'LED_Strip', 'LEDStrip_Bricklet', 'led-strip-bricklet', 'led_strip', False, True, True, True, True, {'en': 'Controls up to 320 RGB LEDs', 'de': 'Steuert bis zu 320 RGB LEDs'}),
+    DeviceInfo(2103, 'Bricklet', 'LED Strip Bricklet 2.0', 'LED Strip 2.0', 'led_strip_v2_bricklet', 'LED_Strip_V2', 'LEDStripV2_Bricklet', 'led-strip-v2-bricklet', 'led_strip_v2', True, True, True, False, True, {'en': 'Controls up to 2048 RGB(W) LEDs', 'de': 'Steuert bis zu 2048 RGB(W) LEDs'}),
+    DeviceInfo(241, 'Bricklet', 'Line Bricklet', 'Line', 'line_bricklet', 'Line', 'Line_Bricklet', 'line-bricklet', 'line', False, True, True, False, True, {'en': 'Measures reflectivity of a surface', 'de': 'Misst Reflektivität einer Oberfläche'}),
+    DeviceInfo(213, 'Bricklet', 'Linear Poti Bricklet', 'Linear Poti', 'linear_poti_bricklet', 'Linear_Poti', 'LinearPoti_Bricklet', 'linear-poti-bricklet', 'linear_poti', False, True, True, False, True, {'en': '59mm linear potentiometer', 'de': '59mm Linearpotentiometer'}),
+    DeviceInfo(2139, 'Bricklet', 'Linear Poti Bricklet 2.0', 'Linear Poti 2.0', 'linear_poti_v2_bricklet', 'Linear_Poti_V2', 'LinearPotiV2_Bricklet', 'linear-poti-v2-bricklet', 'linear_poti_v2', True, True, True, False, True, {'en': '59mm linear potentiometer', 'de': '59mm Linearpotentiometer'}),
+    DeviceInfo(253, 'Bricklet', 'Load Cell Bricklet', 'Load Cell', 'load_cell_bricklet', 'Load_Cell', 'LoadCell_Bricklet', 'load-cell-bricklet', 'load_cell', False, True, True, True, True, {'en': 'Measures weight with a load cell', 'de': 'Misst Gewicht mit einer Wägezelle'}),
+    DeviceInfo(2104, 'Bricklet', 'Load Cell Bricklet 2.0', 'Load Cell 2.0', 'load_cell_v2_bricklet', 'Load_Cell_V2', 'LoadCellV2_Bricklet', 'load-cell-v2-bricklet', 'load_cell_v2', True, True, True, False, True, {'en': 'Measures weight with a load cell', 'de': 'Misst Gewicht mit einer Wägezelle'}),
+    DeviceInfo(232, 'Bricklet', 'Moisture Bricklet', 'Moisture', 'moisture_bricklet', 'Moisture', 'Moisture_Bricklet', 'moisture-bricklet', 'moisture', False, True, True, True, True, {'en': 'Measures soil moisture', 'de': 'Misst Erdfeuchtigkeit'}),
+    DeviceInfo(233, 'Bricklet', 'Motion Detector Bricklet', 'Motion Detector', 'motion_detector_bricklet', 'Motion_Detector', 'MotionDetector_Bricklet', 'motion-detector-bricklet', 'motion_detector', False, True, True, True, True, {'en': 'Passive infrared (PIR) motion sensor with 7m range', 'de': 'Passiver Infrarot (PIR) Bewegungssensor mit 7m Reichweite'}),
+    DeviceInfo(292, 'Bricklet', 'Motion Detector Bricklet 2.0', 'Motion Detector 2.0', 'motion_detector_v2_bricklet', 'Motion_Detector_V2', 'MotionDetectorV2_Bricklet', 'motion-detector-v2-bricklet', 'motion_detector_v2', True, True, True, False, True, {'en': 'Passive infrared (PIR) motion sensor with 12m range and dimmable backlight', 'de': 'Passiver Infrarot (PIR) Bewegungssensor mit 12m Reichweite und dimmbarer Beleuchtung'}),
+    DeviceInfo(267, 'Bricklet', 'Motorized Linear Poti Bricklet', 'Motorized Linear Poti', 'motorized_linear_poti_bricklet', 'Motorized_Linear_Poti', 'MotorizedLinearPoti_Bricklet', 'motorized-linear-poti-bricklet', 'motorized_linear_poti', True, True, True, False, True, {'en': 'Motorized Linear Potentiometer', 'de': 'Motorisiertes Linearpotentiometer'}),
+    DeviceInfo(234, 'Bricklet', 'Multi Touch Bricklet', 'Multi Touch', 'multi_touch_bricklet', 'Multi_Touch', 'MultiTouch_Bricklet', 'multi-touch-bricklet', 'multi_touch', False, True, True, False, True, {'en': 'Capacitive touch sensor for 12 electrodes', 'de': 'Kapazitiver Touch Sensor für 12 Elektroden'}),
+    DeviceInfo(2129, 'Bricklet', 'Multi Touch Bricklet 2.0', 'Multi Touch 2.0', 'multi_touch_v2_bricklet', 'Multi_Touch_V2', 'MultiTouchV2_Bricklet', 'multi-touch-v2-bricklet', 'multi_touch_v2', True, True, True, False, True, {'en': 'Capacitive touch sensor for 12 electrodes', 'de': 'Kapazitiver Touch Sensor für 12 Elektroden'}),
+    DeviceInfo(286, 'Bricklet', 'NFC Bricklet', 'NFC', 'nfc_bricklet', 'NFC', 'NFC_Bricklet', 'nfc-bricklet', 'nfc', True, True, True, False, True, {'en': 'NFC tag read/write, NFC P2P and Card Emulation', 'de': 'NFC Tag Lesen/Schreiben, NFC P2P und Card Emulation'}),
+    DeviceInfo(246, 'Bricklet', 'NFC/RFID Bricklet', 'NFC/RFID', 'nfc_rfid_bricklet', 'NFC_RFID', 'NFCRFID_Bricklet', 'nfc-rfid-bricklet', 'nfc_rfid', False, True, True, True, True, {'en': 'Reads and writes NFC and RFID tags', 'de': 'Liest und schreibt NFC und RFID Tags'}),
+    DeviceInfo(263, 'Bricklet', 'OLED 128x64 Bricklet', 'OLED 128x64', 'oled_128x64_bricklet', 'OLED_128x64', 'OLED128x64_Bricklet', 'oled-128x64-bricklet', 'oled_128x64', False, True, True, True, True, {'en': '3.3cm (1.3") OLED display with 128x64 pixels', 'de': '3,3cm (1,3") OLED Display mit 128x64 Pixel'}),
+    DeviceInfo(2112, 'Bricklet', 'OLED 128x64 Bricklet 2.0', 'OLED 128x64 2.0', 'oled_128x64_v2_bricklet', 'OLED_128x64_V2', 'OLED128x64V2_Bricklet', 'oled-128x64-v2-bricklet', 'oled_128x64_v2', True, True, True, False, True, {'en': '3.3cm (1.3") OLED display with 128x64 pixels', 'de': '3,3cm (1,3") OLED Display mit 128x64 Pixel'}),
+    DeviceInfo(264, 'Bricklet', 'OLED 64x48 Bricklet', 'OLED 64x48', 'oled_64x48_bricklet', 'OLED_64x48', 'OLED64x48_Bricklet', 'oled-64x48-bricklet', 'oled_64x48', False, True, True, False, True, {'en': '1.68cm (0.66") OLED display with 64x48 pixels', 'de': '1,68cm (0,66") OLED Display mit 64x48 Pixel'}),
+    DeviceInfo(2123, 'Bricklet', 'One Wire Bricklet', 'One Wire', 'one_wire_bricklet', 'One_Wire', 'OneWire_Bricklet', 'one-wire-bricklet', 'one_wire', True, True, True, False, True, {'en': 'Communicates with up 64 1-Wire devices', 'de': 'Kommuniziert mit bis zu 64 1-Wire Geräten'}),
+    DeviceInfo(288, 'Bricklet', 'Outdoor Weather Bricklet', 'Outdoor Weather', 'outdoor_weather_bricklet', 'Outdoor_Weather', 'OutdoorWeather_Bricklet', 'outdoor-weather-bricklet', 'outdoor_weather', True, True, True, False, True, {'en': '433MHz receiver for outdoor weather station', 'de': '433MHz Empfänger für Außen-Wetterstation'}),
+    DeviceInfo(2110, 'Bricklet', 'Particulate Matter Bricklet', 'Particulate Matter', 'particulate_matter_bricklet', 'Particulate_Matter', 'ParticulateMatter_Bricklet', 'particulate-matter-bricklet', 'particulate_matter', True, True, True, False, True, {'en': 'Measures Particulate Matter concentration (PM1.0, PM2.5 and PM10)', 'de': 'Misst Feinstaub concentration (PM1.0, PM2.5 und PM10)'}),
+    DeviceInfo(2156, 'Bricklet', 'Performance DC Bricklet', 'Performance DC', 'performance_dc_bricklet', 'Performance_DC', 'PerformanceDC_Bricklet', 'performance-dc-bricklet', 'performance_dc', True, True, True, False, True, {'en': 'Drives one brushed DC motor with up to 36V and 10A', 'de': 'Steuert einen Gleichstrommotor mit bis zu 36V und 10A'}),
+    DeviceInfo(2158, 'Bricklet', 'Performance Stepper Bricklet', 'Performance Stepper', 'performance_stepper_bricklet', 'Performance_Stepper', 'PerformanceStepper_Bricklet', 'performance-stepper-bricklet', 'performance_stepper', True, False, False, False, True, {'en': 'TBD', 'de': 'TBD'}),
+    DeviceInfo(214, 'Bricklet', 'Piezo Buzzer Bricklet', 'Piezo Buzzer', 'piezo_buzzer_bricklet', 'Piezo_Buzzer', 'PiezoBuzzer_Bricklet', 'piezo-buzzer-bricklet', 'piezo_buzzer', False, True, True, True, True, {'en': 'Creates 1kHz beep', 'de': 'Erzeugt 1kHz Piepton'}),
+    DeviceInfo(242, 'Bricklet', 'Piezo Speaker Bricklet', 'Piezo Speaker', 'piezo_speaker_bricklet', 'Piezo_Speaker', 'PiezoSpeaker_Bricklet', 'piezo-speaker-bricklet', 'piezo_speaker', False, True, True, False, True, {'en': 'Creates beep with configurable frequency', 'de': 'Erzeugt Piepton mit konfigurierbarer Frequenz'}),
+    DeviceInfo(2145, 'Bricklet', 'Piezo Speaker Bricklet 2.0', 'Piezo Speaker 2.0', 'piezo_speaker_v2_bricklet', 'Piezo_Speaker_V2', 'PiezoSpeakerV2_Bricklet', 'piezo-speaker-v2-bricklet', 'piezo_speaker_v2', True, True, True, False, True, {'en': 'Creates beep and alarm with configurable volume and frequency', 'de': 'Erzeugt Piepton und Alarm mit konfigurierbarer Lautstärke und Frequenz'}),
+    DeviceInfo(226, 'Bricklet', 'PTC Bricklet', 'PTC', 'ptc_bricklet', 'PTC', 'PTC_Bricklet', 'ptc-bricklet', 'ptc', False, True, True, True, True, {'en': 'Reads temperatures from Pt100 und Pt1000 sensors', 'de': 'Liest Temperaturen von Pt100 und Pt1000 Sensoren'}),
+    DeviceInfo(2101, 'Bricklet', 'PTC Bricklet 2.0', 'PTC 2.0', 'ptc_v2_bricklet', 'PTC_V2', 'PTCV2_Bricklet', 'ptc-v2-bricklet', 'ptc_v2', True, True, True, False, True, {'en': 'Reads temperatures from Pt100 und Pt1000 sensors', 'de': 'Liest Temperaturen von Pt100 und Pt1000 Sensoren'}),
+    DeviceInfo(268, 'Bricklet', 'Real-Time Clock Bricklet', 'Real-Time Clock', 'real_time_clock_bricklet', 'RealTime_Clock', 'RealTimeClock_Bricklet', 'real-time-clock-bricklet', 'real_time_clock', False, True, True, False, True, {'en': 'Battery-backed real-time clock', 'de': 'Batteriegepufferte Echtzeituhr'}),
+    DeviceInfo(2106, 'Bricklet', 'Real-Time Clock Bricklet 2.0', 'Real-Time Clock 2.0', 'real_time_clock_v2_bricklet', 'RealTime_Clock_V2', 'RealTimeClockV2_Bricklet', 'real-time-clock-v2-bricklet', 'real_time_clock_v2', True, True, True, False, True, {'en': 'Battery-backed real-time clock', 'de': 'Batteriegepufferte Echtzeituhr'}),
+    DeviceInfo(235, 'Bricklet', 'Remote Switch Bricklet', 'Remote Switch', 'remote_switch_bricklet', 'Remote_Switch', 'RemoteSwitch_Bricklet', 'remote-switch-bricklet', 'remote_switch', False, True, True, True, True, {'en': 'Controls remote mains switches', 'de': 'Steuert Funksteckdosen'}),
+    DeviceInfo(289, 'Bricklet', 'Remote Switch Bricklet 2.0', 'Remote Switch 2.0', 'remote_switch_v2_bricklet', 'Remote_Switch_V2', 'RemoteSwitchV2_Bricklet', 'remote-switch-v2-bricklet', 'remote_switch_v2', True, True, True, False, True, {'en': 'Controls remote mains switches and receives signals from remotes', 'de': 'Steuert Funksteckdosen und empfängt Signale von Fernbedienungen'}),
+    DeviceInfo(271, 'Bricklet', 'RGB LED Bricklet', 'RGB LED', 'rgb_led_bricklet', 'RGB_LED', 'RGBLED_Bricklet', 'rgb-led-bricklet', 'rgb_led', False, True, True, False, True, {'en': 'Controls one RGB LED', 'de': 'Steuert eine RGB LED'}),
+    DeviceInfo(2127, 'Bricklet', 'RGB LED Bricklet 2.0', 'RGB LED 2.0', 'rgb_led_v2_bricklet', 'RGB_LED_V2', 'RGBLEDV2_Bricklet', 'rgb-led-v2-bricklet', 'rgb_led_v2', True, True, True, False, True, {'en': 'Controls one RGB LED', 'de': 'Steuert eine RGB LED'}),
+    DeviceInfo(282, 'Bricklet', 'RGB LED Button Bricklet', 'RGB LED Button', 'rgb_led_button_bricklet', 'RGB_LED_Button', 'RGBLEDButton_Bricklet', 'rgb-led-button-bricklet', 'rgb_led_button', True, True, True, False, True, {'en': 'Push button with built-in RGB LED', 'de': 'Taster mit eingebauter RGB LED'}),
+    DeviceInfo(272, 'Bricklet', 'RGB LED Matrix Bricklet', 'RGB LED Matrix', 'rgb_led_matrix_bricklet', 'RGB_LED_Matrix', 'RGBLEDMatrix_Bricklet', 'rgb-led-matrix-bricklet', 'rgb_led_matrix', True, True, True, True, True, {'en': 'RGB LED Matrix with 8x8 pixel', 'de': 'RGB LED Matrix mit 8x8 Pixel'}),
+    DeviceInfo(236, 'Bricklet', 'Rotary Encoder Bricklet', 'Rotary Encoder', 'rotary_encoder_bricklet', 'Rotary_Encoder', 'RotaryEncoder_Bricklet', 'rotary-encoder-bricklet', 'rotary_encoder', False, True, True, True, True, {'en': '360° rotary encoder with push-button', 'de': '360° Drehgeber/Drehencoder mit Taster'}),
+    DeviceInfo(294, 'Bricklet', 'Rotary Encoder Bricklet 2.0', 'Rotary Encoder 2.0', 'rotary_encoder_v2_bricklet', 'Rotary_Encoder_V2', 'RotaryEncoderV2_Bricklet', 'rotary-encoder-v2-bricklet', 'rotary_encoder_v2', True, True, True, False, True, {'en': '360° rotary encoder with push-button', 'de': '360° Drehgeber/Drehencoder mit Taster'}),
+    DeviceInfo(215, 'Bricklet', 'Rotary Poti Bricklet', 'Rotary Poti', 'rotary_poti_bricklet', 'Rotary_Poti', 'RotaryPoti_Bricklet', 'rotary-poti-bricklet', 'rotary_poti', False, True, True, False, True, {'en': '300° rotary potentiometer', 'de': '300° Drehpotentiometer'}),
+    DeviceInfo(2140, 'Bricklet', 'Rotary Poti Bricklet 2.0', 'Rotary Poti 2.0', 'rotary_poti_v2_bricklet', 'Rotary_Poti_V2', 'RotaryPotiV2_Bricklet', 'rotary-poti-v2-bricklet', 'rotary_poti_v2', True, True, True, False, True, {'en': '300° rotary potentiometer', 'de': '300° Drehpotentiometer'}),
+    DeviceInfo(254, 'Bricklet', 'RS232 Bricklet', 'RS232', 'rs232_bricklet', 'RS232', 'RS232_Bricklet', 'rs232-bricklet', 'rs232', False, True, True, False, True, {'en': 'Communicates with RS232 devices', 'de': 'Kommuniziert mit RS232 Geräten'}),
+    DeviceInfo(2108, 'Bricklet', 'RS232 Bricklet 2.0', 'RS232 2.0', 'rs232_v2_bricklet', 'RS232_V2', 'RS232V2_Bricklet', 'rs232-v2-bricklet', 'rs232_v2', True, True, True, False, True, {'en': 'Communicates with RS232 devices', 'de': 'Kommuniziert mit RS232 Geräten'}),
+    DeviceInfo(277, 'Bricklet', 'RS485 Bricklet', 'RS485', 'rs485_bricklet', 'RS485', 'RS485_Bricklet', 'rs485-bricklet', 'rs485', True, True, True, False, True, {'en': 'Communicates with RS485/Modbus devices with full- or half-duplex', 'de': 'Kommuniziert mit RS485/Modbus Geräten mit voll- oder halb-duplex'}),
+    DeviceInfo(237, 'Bricklet', 'Segment Display 4x7 Bricklet', 'Segment Display 4x7', 'segment_display_4x7_bricklet', 'Segment_Display_4x7', 'SegmentDisplay4x7_Bricklet', 'segment-display-4x7-bricklet', 'segment_display_4x7', False, True, True, False, True, {'en': 'Four 7-segment displays with switchable colon', 'de': 'Vier 7-Segment-Anzeigen mit schaltbarem Doppelpunkt'}),
+    DeviceInfo(2137, 'Bricklet', 'Segment Display 4x7 Bricklet 2.0', 'Segment Display 4x7 2.0', 'segment_display_4x7_v2_bricklet', 'Segment_Display_4x7_V2', 'SegmentDisplay4x7V2_Bricklet', 'segment-display-4x7-v2-bricklet', 'segment_display_4x7_v2', True, True, True, False, True, {'en': 'Four 7-segment displays with switchable dots', 'de': 'Vier 7-Segment-Anzeigen mit schaltbare Punkten'}),
+    DeviceInfo(2157, 'Bricklet', 'Servo Bricklet 2.0', 'Servo 2.0', 'servo_v2_bricklet', 'Servo_V2', 'ServoV2_Bricklet', 'servo-v2-bricklet', 'servo_v2', True, True, True, False, True, {'en': 'Drives up to 10 RC Servos', 'de': 'Steuert bis zu 10 RC Servos'}),
+    DeviceInfo(2166, 'Bricklet', 'Silent Stepper Bricklet 2.0', 'Silent Stepper 2.0', 'silent_stepper_v2_bricklet', 'Silent_Stepper_V2', 'SilentStepperV2_Bricklet', 'silent-stepper-v2-bricklet', 'silent_stepper_v2', True, True, True, False, True, {'en': 'Silently drives one bipolar stepper motor with up to 46V and 1.6A per phase', 'de': 'Steuert einen bipolaren Schrittmotor lautlos mit bis zu 46V und 1,6A pro Phase'}),
+    DeviceInfo(244, 'Bricklet', 'Solid State Relay Bricklet', 'Solid State Relay', 'solid_state_relay_bricklet', 'Solid_State_Relay', 'SolidStateRelay_Bricklet', 'solid-state-relay-bricklet', 'solid_state_relay', False, True, True, True, True, {'en': 'Controls AC and DC Solid State Relays', 'de': 'Schaltet AC und DC Halbleiterrelais (Solid State Relais)'}),
+    DeviceInfo(296, 'Bricklet', 'Solid State Relay Bricklet 2.0', 'Solid State Relay 2.0', 'solid_state_relay_v2_bricklet', 'Solid_State_Relay_V2', 'SolidStateRelayV2_Bricklet', 'solid-state-relay-v2-bricklet', 'solid_state_relay_v2', True, True, True, False, True, {'en': 'Controls AC and DC Solid State Relays', 'de': 'Schaltet AC und DC Halbleiterrelais (Solid State Relais)'}),
+    DeviceInfo(238, 'Bricklet', 'Sound Intensity Bricklet', 'Sound Intensity', 'sound_intensity_bricklet', 'Sound_Intensity', 'SoundIntensity_Bricklet', 'sound-intensity-bricklet', 'sound_intensity', False, True, True, False, True, {'en': 'Measures sound intensity', 'de': 'Misst Schallintensität'}),
+    DeviceInfo(290, 'Bricklet', 'Sound Pressure Level Bricklet', 'Sound Pressure Level', 'sound_pressure_level_bricklet', 'Sound_Pressure_Level', 'SoundPressureLevel_Bricklet', 'sound-pressure-level-bricklet', 'sound_pressure_level', True, True, True, False, True, {'en': 'Measures Sound Pressure Level in dB(A/B/C/D/Z)', 'de': 'Misst Schalldruck in dB(A/B/C/D/Z)'}),
+    DeviceInfo(21111, 'Bricklet', 'Stream Test Bricklet', 'Stream Test', 'stream_test_bricklet', 'Stream_Test', 'StreamTest_Bricklet', 'stream-test-bricklet', 'stream_test', False, False, False, False, True, {'en': '', 'de': ''}),
+    DeviceInfo(216, 'Bricklet', 'Temperature Bricklet', 'Temperature', 'temperature_bricklet', 'Temperature', 'Temperature_Bricklet', 'temperature-bricklet', 'temperature', False, True, True, False, True, {'en': 'Measures ambient temperature with 0.5°C accuracy', 'de': 'Misst Umgebungstemperatur mit 0,5°C Genauigkeit'}),
+    DeviceInfo(2113, 'Bricklet', 'Temperature Bricklet 2.0', 'Temperature 2.0', 'temperature_v2_bricklet', 'Temperature_V2', 'TemperatureV2_Bricklet', 'temperature-v2-bricklet', 'temperature_v2', True, True, True, False, True, {'en': 'Measures ambient temperature with 0.2°C accuracy', 'de': 'Misst Umgebungstemperatur mit 0,2°C Genauigkeit'}),
+    DeviceInfo(217, 'Bricklet', 'Temperature IR Bricklet', 'Temperature IR', 'temperature_ir_bricklet', 'Temperature_IR', 'TemperatureIR_Bricklet', 'temperature-ir-bricklet', 'temperature_ir', False, True, True, True, True, {'en': 'Measures contactless object temperature between -70°C and +380°C', 'de': 'Kontaktlose Objekttemperaturmessung zwischen -70°C und +380°C'}),
+    DeviceInfo(291, 'Bricklet', 'Temperature IR Bricklet 2.0', 'Temperature IR 2.0', 'temperature_ir_v2_bricklet', 'Temperature_IR_V2', 'TemperatureIRV2_Bricklet', 'temperature-ir-v2-bricklet', 'temperature_ir_v2', True, True, True, False, True, {'en': 'Measures contactless object temperature between -70°C and +380°C', 'de': 'Kontaktlose Objekttemperaturmessung zwischen -70°C und +380°C'}),
+    DeviceInfo(278, 'Bricklet', 'Thermal Imaging Bricklet', 'Thermal Imaging', 'thermal_imaging_bricklet', 'Thermal_Imaging', 'ThermalImaging_Bricklet', 'thermal-imaging-bricklet', 'thermal_imaging', True, True, True, False, True, {'en': '80x60 pixel thermal imaging camera', 'de': '80x60 Pixel Wärmebildkamera'}),
+    DeviceInfo(266, 'Bricklet', 'Thermocouple Bricklet', 'Thermocouple', 'thermocouple_bricklet', 'Thermocouple', 'Thermocouple_Bricklet', 'thermocouple-bricklet', 'thermocouple', False, True, True, True, True, {'en': 'Measures temperature with thermocouples', 'de': 'Misst Temperatur mit Thermoelementen'}),
+    DeviceInfo(2109, 'Bricklet', 'Thermocouple Bricklet 2.0', 'Thermocouple 2.0', 'thermocouple_v2_bricklet', 'Thermocouple_V2', 'ThermocoupleV2_Bricklet', 'thermocouple-v2-bricklet', 'thermocouple_v2', True, True, True, False, True, {'en': 'Measures temperature with thermocouples', 'de': 'Misst Temperatur mit Thermoelementen'}),
+    DeviceInfo(239, 'Bricklet', 'Tilt Bricklet', 'Tilt', 'tilt_bricklet', 'Tilt', 'Tilt_Bricklet', 'tilt-bricklet', 'tilt', False, True, True, False, True, {'en': 'Detects inclination of Bricklet (tilt switch open/closed)', 'de': 'Erkennt Neigung des Bricklets (Neigungsschalter offen/geschlossen)'}),
+    DeviceInfo(-21, 'Bricklet', 'Unknown Bricklet', 'Unknown', 'unknown_bricklet', 'Unknown', 'Unknown_Bricklet', 'unknown-bricklet', 'unknown', True, False, False, False, True, {'en': '', 'de': ''}),
+    DeviceInfo(265, 'Bricklet', 'UV Light Bricklet', 'UV Light', 'uv_light_bricklet', 'UV_Light', 'UVLight_Bricklet', 'uv-light-bricklet', 'uv_light', False, True, True, False, True, {'en': 'Measures UV light', 'de': 'Misst UV-Licht'}),
+    DeviceInfo(2118, 'Bricklet', 'UV Light Bricklet 2.0', 'UV Light 2.0', 'uv_light_v2_bricklet', 'UV_Light_V2', 'UVLightV2_Bricklet', 'uv-light-v2-bricklet', 'uv_light_v2', True, True, True, False, True, {'en': 'Measures UV-A, UV-B and UV index', 'de': 'Misst UV-A, UV-B und UV Index'}),
+    DeviceInfo(218, 'Bricklet', 'Voltage Bricklet', 'Voltage', 'voltage_bricklet', 'Voltage', 'Voltage_Bricklet', 'voltage-bricklet', 'voltage', False, True, True, True, True, {'en': 'Measures DC voltage between 0V and 50V', 'de': 'Misst Gleichspannung zwischen 0V und 50V'}),
+    DeviceInfo(227, 'Bricklet', 'Voltage/Current Bricklet', 'Voltage/Current', 'voltage_current_bricklet', 'Voltage_Current', 'VoltageCurrent_Bricklet', 'voltage-current-bricklet', 'voltage_current', False, True, True, True, True, {'en': 'Measures power, DC voltage and DC current up to 720W/36V/20A', 'de': 'Misst Leistung, Gleichspannung und Gleichstrom bis zu 720W/36V/20A'}),
+    DeviceInfo(2105, 'Bricklet', 'Voltage/Current Bricklet 2.0', 'Voltage/Current 2.0', 'voltage_current_v2_bricklet', 'Voltage_Current_V2', 'VoltageCurrentV2_Bricklet', 'voltage-current-v2-bricklet', 'voltage_current_v2', True, True, True, False, True, {'en': 'Measures power, DC voltage and DC current up to 720W/36V/20A', 'de': 'Misst Leistung, Gleichspannung und Gleichstrom bis zu 720W/36V/20A'}),
+    DeviceInfo(279, 'Bricklet', 'XMC1400 Breakout Bricklet', 'XMC1400 Breakout', 'xmc1400_breakout_bricklet', 'XMC1400_Breakout', 'XMC1400Breakout_Bricklet', 'xmc1400-breakout-bricklet', 'xmc1400_breakout', True, True, True, False, True, {'en': 'Breakout for Infineon XMC1400 microcontroller', 'de': 'Entwicklungsboard für Infineon XMC1400 Mikrocontroller'}),
+]
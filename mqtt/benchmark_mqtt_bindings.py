@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Measures the request throughput of the generated MQTT bindings against an
+# emulated Ambient Light Bricklet 3.0. The MQTT broker is bypassed: messages
+# are fed directly into MQTTBindings.on_message and the published responses
+# are counted instead of being sent.
+#
+# Requires paho-mqtt and the generated bindings/tinkerforge_mqtt script, run
+# generate_mqtt_bindings.py first.
+
+import os
+import sys
+import time
+import json
+import asyncio
+import logging
+import threading
+import importlib.util
+import importlib.machinery
+
+ROOT_DIR = os.path.dirname(os.path.realpath(__file__))
+
+sys.path.append(os.path.join(ROOT_DIR, '..', 'emulator'))
+
+from brick_daemon import BrickDaemon
+from ambient_light_v3_bricklet_skeleton import AmbientLightV3BrickletSkeleton
+
+HOST = '127.0.0.1'
+PORT = 4283
+UID = 'EALV3'
+PREFIX = 'tinkerforge/'
+MESSAGE_COUNT = 10000
+WORKER_COUNT = 4
+
+class AmbientLightV3Bricklet(AmbientLightV3BrickletSkeleton):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._illuminance_range = 3
+        self._integration_time = 2
+
+    async def get_illuminance(self):
+        return 1234
+
+    async def set_configuration(self, illuminance_range, integration_time):
+        self._illuminance_range = illuminance_range
+        self._integration_time = integration_time
+
+    async def get_configuration(self):
+        return self._illuminance_range, self._integration_time
+
+def start_brick_daemon():
+    ready = threading.Event()
+
+    async def run():
+        async with BrickDaemon(HOST, PORT) as brickd:
+            await brickd.add_device(AmbientLightV3Bricklet(UID))
+            ready.set()
+            await brickd.run_forever()
+
+    thread = threading.Thread(name='Brick-Daemon', target=lambda: asyncio.run(run()))
+    thread.daemon = True
+    thread.start()
+
+    ready.wait()
+
+def load_bindings_module():
+    path = os.path.join(ROOT_DIR, 'bindings', 'tinkerforge_mqtt')
+    loader = importlib.machinery.SourceFileLoader('tinkerforge_mqtt', path)
+    spec = importlib.util.spec_from_loader('tinkerforge_mqtt', loader)
+    module = importlib.util.module_from_spec(spec)
+
+    loader.exec_module(module)
+
+    return module
+
+def create_bindings(module, worker_count, binary_payload=False):
+    bindings = module.MQTTBindings(False, True, False, False, PREFIX, 2.5, None, None, None, False,
+                                   worker_count, MESSAGE_COUNT, binary_payload)
+    published = [0]
+    condition = threading.Condition()
+
+    def publish(topic, payload=None, qos=0, retain=False):
+        with condition:
+            published[0] += 1
+            condition.notify_all()
+
+    bindings.mqttc.publish = publish
+    bindings.connect_to_brickd(HOST, PORT, '')
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    def wait_for_published(count):
+        with condition:
+            while published[0] < count:
+                condition.wait()
+
+    return bindings, published, wait_for_published
+
+def benchmark(name, module, worker_count, messages, expected_responses, binary_payload=False):
+    bindings, published, wait_for_published = create_bindings(module, worker_count, binary_payload)
+    on_message = bindings.on_message
+    mqttc = bindings.mqttc
+    prefix_len = len(PREFIX)
+
+    start = time.perf_counter()
+
+    for i in range(MESSAGE_COUNT):
+        on_message(mqttc, prefix_len, messages[i % len(messages)])
+
+    wait_for_published(expected_responses)
+
+    duration = time.perf_counter() - start
+
+    print('{0}: {1} messages in {2:.3f} seconds ({3:.0f} messages/second)'
+          .format(name, MESSAGE_COUNT, duration, MESSAGE_COUNT / duration))
+
+    bindings.ipcon.disconnect()
+
+def benchmark_on_message(module):
+    topic = PREFIX + 'request/ambient_light_v3_bricklet/' + UID + '/'
+    message_tup = module.message_tup
+
+    setters = [message_tup(topic + 'set_configuration', json.dumps({'illuminance_range': '64000lux', 'integration_time': '150ms'}).encode()),
+               message_tup(topic + 'set_configuration', json.dumps({'illuminance_range': 2, 'integration_time': 3}).encode())]
+
+    benchmark('on_message setter', module, 0, setters, 0)
+
+    getters = [message_tup(topic + 'get_illuminance', b''),
+               message_tup(topic + 'get_configuration', b'')]
+
+    benchmark('on_message getter', module, WORKER_COUNT, getters, MESSAGE_COUNT)
+
+    binary_setters = [message_tup(topic + 'set_configuration', bytes([0, 3])),
+                      message_tup(topic + 'set_configuration', bytes([2, 3]))]
+
+    benchmark('on_message binary setter', module, 0, binary_setters, 0, binary_payload=True)
+
+if __name__ == '__main__':
+    start_brick_daemon()
+    benchmark_on_message(load_bindings_module())
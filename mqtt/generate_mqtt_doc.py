@@ -186,6 +186,31 @@ time critical or recurring data from the device. The registration is done
 with the corresponding ``.../register/...`` topic and an optional suffix.
 This suffix can be used to deregister the callback later.
 
+Instead of "true" a JSON object with the member ``register`` can be published
+to configure how messages are published on the callback topic:
+
+* ``max_rate``: Maximum number of messages per second. Messages exceeding the
+  rate are coalesced, only the latest one is published when the rate allows it.
+* ``coalesce``: If false, messages exceeding ``max_rate`` are dropped instead
+  of coalesced (default: true).
+* ``window``: Aggregation window in milliseconds, cannot be combined with
+  ``max_rate``. Once per window a message is published in which numeric
+  members are replaced by objects with the members ``min``, ``max`` and
+  ``mean`` of all messages in the window, all other members are taken from
+  the latest message. The member ``_count`` contains the number of aggregated
+  messages.
+* ``qos`` and ``retain``: MQTT QoS level (default: 0) and retain flag
+  (default: false) used for publishing.
+* ``encoding``: ``"json"`` or ``"binary"``, see :ref:`binary payloads
+  <{0}_mqtt_api>` (default: ``"binary"`` if the bindings were started with
+  ``--binary-payload``, otherwise ``"json"``). Cannot be combined with
+  ``window``.
+
+For example ``{{"register": true, "max_rate": 10}}``. The number of published,
+coalesced and dropped messages per topic is published on
+``.../response/bindings/get_publish_statistics`` for requests to
+``.../request/bindings/get_publish_statistics``.
+
 .. note::
  Using callbacks for recurring events is *always* preferred
  compared to using getters. It will use less USB bandwidth and the latency
@@ -204,6 +229,33 @@ oder wiederkehrende Daten vom Gerät zu erhalten. Die Registrierung kann
 mit dem entsprechenden ``.../register/...``-Topic und einem optionalen Suffix durchgeführt werden.
 Mit diesem Suffix kann das Callback später deregistriert werden.
 
+Anstelle von "true" kann ein JSON-Objekt mit dem Member ``register`` gesendet
+werden, um zu konfigurieren wie Nachrichten auf dem Callback-Topic
+veröffentlicht werden:
+
+* ``max_rate``: Maximale Anzahl an Nachrichten pro Sekunde. Nachrichten, die
+  die Rate überschreiten, werden zusammengefasst, nur die jeweils neueste wird
+  veröffentlicht, sobald die Rate es erlaubt.
+* ``coalesce``: Falls false, werden Nachrichten, die ``max_rate`` überschreiten,
+  verworfen statt zusammengefasst (Standard: true).
+* ``window``: Aggregationsfenster in Millisekunden, kann nicht mit ``max_rate``
+  kombiniert werden. Einmal pro Fenster wird eine Nachricht veröffentlicht, in
+  der numerische Member durch Objekte mit den Membern ``min``, ``max`` und
+  ``mean`` aller Nachrichten des Fensters ersetzt sind, alle anderen Member
+  werden aus der neuesten Nachricht übernommen. Der Member ``_count`` enthält
+  die Anzahl der aggregierten Nachrichten.
+* ``qos`` und ``retain``: MQTT-QoS-Level (Standard: 0) und Retain-Flag
+  (Standard: false) für das Veröffentlichen.
+* ``encoding``: ``"json"`` oder ``"binary"``, siehe :ref:`binäre Payloads
+  <{0}_mqtt_api>` (Standard: ``"binary"`` falls die Bindings mit
+  ``--binary-payload`` gestartet wurden, sonst ``"json"``). Kann nicht mit
+  ``window`` kombiniert werden.
+
+Zum Beispiel ``{{"register": true, "max_rate": 10}}``. Die Anzahl der
+veröffentlichten, zusammengefassten und verworfenen Nachrichten pro Topic wird
+auf ``.../response/bindings/get_publish_statistics`` für Anfragen an
+``.../request/bindings/get_publish_statistics`` veröffentlicht.
+
 .. note::
  Callbacks für wiederkehrende Ereignisse zu verwenden ist
  *immer* zu bevorzugen gegenüber der Verwendung von Abfragen.
@@ -221,10 +273,42 @@ Mit diesem Suffix kann das Callback später deregistriert werden.
 API
 ---
 
-All published payloads to and from the MQTT bindings are in JSON format.
+All published payloads to and from the MQTT bindings are in JSON format, unless binary payloads are enabled (see below).
 
 If an error occures, the bindings publish a JSON object containing the error message as member ``_ERROR``.
 It is published on the corresponding response topic: ``.../response/...`` for ``.../request/...`` and ``.../callback/...`` for ``.../register/...``.
+
+Binary Payloads
+^^^^^^^^^^^^^^^
+
+As an alternative to JSON, requests, responses and callback messages of devices
+can be exchanged as binary payloads. If the bindings are started with
+``--binary-payload``, all payloads on ``.../request/<device>/...`` topics are
+expected to be binary and all responses and callback messages are published
+binary. Independent of this option a JSON request can contain the member
+``_encoding`` with the value ``"binary"`` or ``"json"`` to select the encoding
+of its response, for example ``{{"_encoding": "binary"}}``. For callbacks the
+encoding is selected with the ``encoding`` member of the registration.
+
+A binary payload contains the request or response members in the order they
+are listed for the function or callback, without any separators. Each member is
+encoded as in the Tinkerforge protocol, all numbers are little-endian:
+
+* Integers as 1, 2, 4 or 8 byte integers as given by their type, floats as
+  4 byte IEEE 754 floats.
+* Bools as one byte (0 or 1), bool arrays bit-packed with 8 bools per byte.
+* Chars as one byte (ISO 8859-1), strings zero-padded to their maximum length.
+* Arrays of fixed length as their elements without length prefix.
+* Stream data (for example the ``message_data`` of a high-level function) is
+  prefixed by its number of elements as an unsigned 2 byte integer. Out of sync
+  stream data is sent as 0 elements.
+
+Symbols are not used in binary payloads, the numeric values are sent instead.
+The ``_display_name`` of ``get_identity`` is not included.
+Errors are still published as JSON object with an ``_ERROR`` member. Requests
+to ``.../request/ip_connection/...`` and ``.../request/bindings/...``,
+registrations as well as aggregated callback messages (see ``window``) always
+use JSON.
 {1}
 
 {2}
@@ -235,11 +319,47 @@ It is published on the corresponding response topic: ``.../response/...`` for ``
 API
 ---
 
-Alle veröffentlichten Payloads an die und von den MQTT-Bindings sind im JSON Format.
+Alle veröffentlichten Payloads an die und von den MQTT-Bindings sind im JSON Format, außer binäre Payloads sind aktiviert (siehe unten).
 
 Falls ein Fehler auftritt, veröffentlichen die Bindings ein JSON-Objekt, das die Fehlermeldung als ``_ERROR``-Member enthält.
 Das Objekt wird auf dem zugehörigen Antwort-Topic veröffentlicht: ``.../response/...`` für ``.../request/...`` und ``.../callback/...`` für ``.../register/...``.
 
+Binäre Payloads
+^^^^^^^^^^^^^^^
+
+Als Alternative zu JSON können Anfragen, Antworten und Callback-Nachrichten von
+Geräten als binäre Payloads ausgetauscht werden. Falls die Bindings mit
+``--binary-payload`` gestartet werden, werden alle Payloads auf
+``.../request/<device>/...``-Topics als binär erwartet und alle Antworten und
+Callback-Nachrichten binär veröffentlicht. Unabhängig von dieser Option kann
+eine JSON-Anfrage den Member ``_encoding`` mit dem Wert ``"binary"`` oder
+``"json"`` enthalten, um das Format der Antwort zu wählen, zum Beispiel
+``{{"_encoding": "binary"}}``. Für Callbacks wird das Format mit dem Member
+``encoding`` der Registrierung gewählt.
+
+Eine binäre Payload enthält die Member der Anfrage oder Antwort in der
+Reihenfolge, in der sie für die Funktion bzw. das Callback aufgelistet sind,
+ohne Trennzeichen. Jeder Member ist wie im Tinkerforge-Protokoll kodiert, alle
+Zahlen sind Little-Endian:
+
+* Ganzzahlen als 1, 2, 4 oder 8 Byte Ganzzahl entsprechend ihres Typs, Floats
+  als 4 Byte IEEE 754 Floats.
+* Bools als ein Byte (0 oder 1), Bool-Arrays bitweise gepackt mit 8 Bools pro
+  Byte.
+* Chars als ein Byte (ISO 8859-1), Strings mit Nullen auf ihre maximale Länge
+  aufgefüllt.
+* Arrays fester Länge als ihre Elemente ohne Längenangabe.
+* Stream-Daten (zum Beispiel die ``message_data`` einer High-Level-Funktion)
+  wird ihre Anzahl an Elementen als vorzeichenlose 2 Byte Ganzzahl
+  vorangestellt. Nicht synchrone Stream-Daten werden als 0 Elemente gesendet.
+
+In binären Payloads werden keine Symbole verwendet, stattdessen werden die
+numerischen Werte gesendet. Der ``_display_name`` von ``get_identity`` ist
+nicht enthalten. Fehler werden weiterhin als JSON-Objekt mit einem
+``_ERROR``-Member veröffentlicht. Anfragen an ``.../request/ip_connection/...``
+und ``.../request/bindings/...``, Registrierungen sowie aggregierte
+Callback-Nachrichten (siehe ``window``) verwenden immer JSON.
+
 {1}
 
 {2}
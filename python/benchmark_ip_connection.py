@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+import socket
+import struct
+import threading
+
+from ip_connection import IPConnection, Device
+
+CALLBACK_COUNT = 100000
+CALLBACK_ID = 42
+
+def benchmark_receive_loop():
+    ipcon = IPConnection()
+    device = Device('abc', ipcon, -1, 'Benchmark Device')
+    device.callback_formats[CALLBACK_ID] = (12, 'i')
+    device.registered_callbacks[CALLBACK_ID] = lambda value: None
+    ipcon.add_device(device)
+
+    ipcon_socket, peer_socket = socket.socketpair()
+    ipcon.socket = ipcon_socket
+    ipcon.receive_flag = True
+    ipcon.callback = IPConnection.CallbackContext()
+    ipcon.callback.queue = IPConnection.CallbackQueue(0, ipcon.count_dropped_callback) # not processed, only counted
+
+    packet = struct.pack('<IBBBBi', device.uid, 12, CALLBACK_ID, 0, 0, 1234)
+    data = packet * CALLBACK_COUNT
+
+    def send():
+        peer_socket.sendall(data)
+        peer_socket.close()
+
+    thread = threading.Thread(target=send)
+    start = time.time()
+
+    thread.start()
+    ipcon.receive_loop(0)
+    thread.join()
+
+    duration = time.time() - start
+    packets = ipcon.callback.queue.qsize() - 1 # minus the disconnected callback
+
+    assert(packets == CALLBACK_COUNT)
+
+    print('receive_loop: {0} callback packets in {1:.3f} seconds ({2:.0f} packets/second)'
+          .format(packets, duration, packets / duration))
+
+    ipcon_socket.close()
+
+if __name__ == '__main__':
+    benchmark_receive_loop()
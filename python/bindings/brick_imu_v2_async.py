@@ -0,0 +1,696 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .brick_imu_v2 import BrickIMUV2, GetAcceleration, GetMagneticField, GetAngularVelocity, GetOrientation, GetLinearAcceleration, GetGravityVector, GetQuaternion, GetAllData, GetSensorConfiguration, GetSPITFPBaudrateConfig, GetSPITFPErrorCount, GetProtocol1BrickletName, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from brick_imu_v2 import BrickIMUV2, GetAcceleration, GetMagneticField, GetAngularVelocity, GetOrientation, GetLinearAcceleration, GetGravityVector, GetQuaternion, GetAllData, GetSensorConfiguration, GetSPITFPBaudrateConfig, GetSPITFPErrorCount, GetProtocol1BrickletName, GetIdentity
+
+class BrickIMUV2Async(AsyncDevice, BrickIMUV2):
+    """
+    Full fledged AHRS with 9 degrees of freedom
+
+    asyncio variant of BrickIMUV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_acceleration(self):
+        """
+        Returns the calibrated acceleration from the accelerometer for the
+        x, y and z axis. The acceleration is in the range configured with
+        :func:`Set Sensor Configuration`.
+
+        If you want to get the acceleration periodically, it is recommended
+        to use the :cb:`Acceleration` callback and set the period with
+        :func:`Set Acceleration Period`.
+        """
+        await self.check_validity()
+
+        return GetAcceleration(*await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_ACCELERATION, (), '', 14, BrickIMUV2.CODEC_GET_ACCELERATION_RESPONSE))
+
+    async def get_magnetic_field(self):
+        """
+        Returns the calibrated magnetic field from the magnetometer for the
+        x, y and z axis.
+
+        If you want to get the magnetic field periodically, it is recommended
+        to use the :cb:`Magnetic Field` callback and set the period with
+        :func:`Set Magnetic Field Period`.
+        """
+        await self.check_validity()
+
+        return GetMagneticField(*await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_MAGNETIC_FIELD, (), '', 14, BrickIMUV2.CODEC_GET_MAGNETIC_FIELD_RESPONSE))
+
+    async def get_angular_velocity(self):
+        """
+        Returns the calibrated angular velocity from the gyroscope for the
+        x, y and z axis. The angular velocity is in the range configured with
+        :func:`Set Sensor Configuration`.
+
+        If you want to get the angular velocity periodically, it is recommended
+        to use the :cb:`Angular Velocity` acallback nd set the period with
+        :func:`Set Angular Velocity Period`.
+        """
+        await self.check_validity()
+
+        return GetAngularVelocity(*await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_ANGULAR_VELOCITY, (), '', 14, BrickIMUV2.CODEC_GET_ANGULAR_VELOCITY_RESPONSE))
+
+    async def get_temperature(self):
+        """
+        Returns the temperature of the IMU Brick.
+        The temperature is measured in the core of the BNO055 IC, it is not the
+        ambient temperature
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_TEMPERATURE, (), '', 9, BrickIMUV2.CODEC_GET_TEMPERATURE_RESPONSE)
+
+    async def get_orientation(self):
+        """
+        Returns the current orientation (heading, roll, pitch) of the IMU Brick as
+        independent Euler angles. Note that Euler angles always
+        experience a `gimbal lock <https://en.wikipedia.org/wiki/Gimbal_lock>`__.
+        We recommend that you use quaternions instead, if you need the absolute
+        orientation.
+
+        If you want to get the orientation periodically, it is recommended
+        to use the :cb:`Orientation` callback and set the period with
+        :func:`Set Orientation Period`.
+        """
+        await self.check_validity()
+
+        return GetOrientation(*await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_ORIENTATION, (), '', 14, BrickIMUV2.CODEC_GET_ORIENTATION_RESPONSE))
+
+    async def get_linear_acceleration(self):
+        """
+        Returns the linear acceleration of the IMU Brick for the
+        x, y and z axis. The acceleration is in the range configured with
+        :func:`Set Sensor Configuration`.
+
+        The linear acceleration is the acceleration in each of the three
+        axis of the IMU Brick with the influences of gravity removed.
+
+        It is also possible to get the gravity vector with the influence of linear
+        acceleration removed, see :func:`Get Gravity Vector`.
+
+        If you want to get the linear acceleration periodically, it is recommended
+        to use the :cb:`Linear Acceleration` callback and set the period with
+        :func:`Set Linear Acceleration Period`.
+        """
+        await self.check_validity()
+
+        return GetLinearAcceleration(*await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_LINEAR_ACCELERATION, (), '', 14, BrickIMUV2.CODEC_GET_LINEAR_ACCELERATION_RESPONSE))
+
+    async def get_gravity_vector(self):
+        """
+        Returns the current gravity vector of the IMU Brick for the
+        x, y and z axis.
+
+        The gravity vector is the acceleration that occurs due to gravity.
+        Influences of additional linear acceleration are removed.
+
+        It is also possible to get the linear acceleration with the influence
+        of gravity removed, see :func:`Get Linear Acceleration`.
+
+        If you want to get the gravity vector periodically, it is recommended
+        to use the :cb:`Gravity Vector` callback and set the period with
+        :func:`Set Gravity Vector Period`.
+        """
+        await self.check_validity()
+
+        return GetGravityVector(*await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_GRAVITY_VECTOR, (), '', 14, BrickIMUV2.CODEC_GET_GRAVITY_VECTOR_RESPONSE))
+
+    async def get_quaternion(self):
+        """
+        Returns the current orientation (w, x, y, z) of the IMU Brick as
+        `quaternions <https://en.wikipedia.org/wiki/Quaternions_and_spatial_rotation>`__.
+
+        You have to divide the return values by 16383 (14 bit) to get
+        the usual range of -1.0 to +1.0 for quaternions.
+
+        If you want to get the quaternions periodically, it is recommended
+        to use the :cb:`Quaternion` callback and set the period with
+        :func:`Set Quaternion Period`.
+        """
+        await self.check_validity()
+
+        return GetQuaternion(*await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_QUATERNION, (), '', 16, BrickIMUV2.CODEC_GET_QUATERNION_RESPONSE))
+
+    async def get_all_data(self):
+        """
+        Return all of the available data of the IMU Brick.
+
+        * acceleration (see :func:`Get Acceleration`)
+        * magnetic field (see :func:`Get Magnetic Field`)
+        * angular velocity (see :func:`Get Angular Velocity`)
+        * Euler angles (see :func:`Get Orientation`)
+        * quaternion (see :func:`Get Quaternion`)
+        * linear acceleration (see :func:`Get Linear Acceleration`)
+        * gravity vector (see :func:`Get Gravity Vector`)
+        * temperature (see :func:`Get Temperature`)
+        * calibration status (see below)
+
+        The calibration status consists of four pairs of two bits. Each pair
+        of bits represents the status of the current calibration.
+
+        * bit 0-1: Magnetometer
+        * bit 2-3: Accelerometer
+        * bit 4-5: Gyroscope
+        * bit 6-7: System
+
+        A value of 0 means for "not calibrated" and a value of 3 means
+        "fully calibrated". In your program you should always be able to
+        ignore the calibration status, it is used by the calibration
+        window of the Brick Viewer and it can be ignored after the first
+        calibration. See the documentation in the calibration window for
+        more information regarding the calibration of the IMU Brick.
+
+        If you want to get the data periodically, it is recommended
+        to use the :cb:`All Data` callback and set the period with
+        :func:`Set All Data Period`.
+        """
+        await self.check_validity()
+
+        return GetAllData(*await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_ALL_DATA, (), '', 54, BrickIMUV2.CODEC_GET_ALL_DATA_RESPONSE))
+
+    async def leds_on(self):
+        """
+        Turns the orientation and direction LEDs of the IMU Brick on.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_LEDS_ON, (), '', 0, '')
+
+    async def leds_off(self):
+        """
+        Turns the orientation and direction LEDs of the IMU Brick off.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_LEDS_OFF, (), '', 0, '')
+
+    async def are_leds_on(self):
+        """
+        Returns *true* if the orientation and direction LEDs of the IMU Brick
+        are on, *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_ARE_LEDS_ON, (), '', 9, BrickIMUV2.CODEC_ARE_LEDS_ON_RESPONSE)
+
+    async def save_calibration(self):
+        """
+        A call of this function saves the current calibration to be used
+        as a starting point for the next restart of continuous calibration
+        of the IMU Brick.
+
+        A return value of *true* means that the calibration could be used and
+        *false* means that it could not be used (this happens if the calibration
+        status is not "fully calibrated").
+
+        This function is used by the calibration window of the Brick Viewer, you
+        should not need to call it in your program.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SAVE_CALIBRATION, (), '', 9, BrickIMUV2.CODEC_SAVE_CALIBRATION_RESPONSE)
+
+    async def set_acceleration_period(self, period):
+        """
+        Sets the period with which the :cb:`Acceleration` callback is triggered
+        periodically. A value of 0 turns the callback off.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SET_ACCELERATION_PERIOD, (period,), BrickIMUV2.CODEC_SET_ACCELERATION_PERIOD_REQUEST, 0, '')
+
+    async def get_acceleration_period(self):
+        """
+        Returns the period as set by :func:`Set Acceleration Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_ACCELERATION_PERIOD, (), '', 12, BrickIMUV2.CODEC_GET_ACCELERATION_PERIOD_RESPONSE)
+
+    async def set_magnetic_field_period(self, period):
+        """
+        Sets the period with which the :cb:`Magnetic Field` callback is triggered
+        periodically. A value of 0 turns the callback off.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SET_MAGNETIC_FIELD_PERIOD, (period,), BrickIMUV2.CODEC_SET_MAGNETIC_FIELD_PERIOD_REQUEST, 0, '')
+
+    async def get_magnetic_field_period(self):
+        """
+        Returns the period as set by :func:`Set Magnetic Field Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_MAGNETIC_FIELD_PERIOD, (), '', 12, BrickIMUV2.CODEC_GET_MAGNETIC_FIELD_PERIOD_RESPONSE)
+
+    async def set_angular_velocity_period(self, period):
+        """
+        Sets the period with which the :cb:`Angular Velocity` callback is
+        triggered periodically. A value of 0 turns the callback off.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SET_ANGULAR_VELOCITY_PERIOD, (period,), BrickIMUV2.CODEC_SET_ANGULAR_VELOCITY_PERIOD_REQUEST, 0, '')
+
+    async def get_angular_velocity_period(self):
+        """
+        Returns the period as set by :func:`Set Angular Velocity Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_ANGULAR_VELOCITY_PERIOD, (), '', 12, BrickIMUV2.CODEC_GET_ANGULAR_VELOCITY_PERIOD_RESPONSE)
+
+    async def set_temperature_period(self, period):
+        """
+        Sets the period with which the :cb:`Temperature` callback is triggered
+        periodically. A value of 0 turns the callback off.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SET_TEMPERATURE_PERIOD, (period,), BrickIMUV2.CODEC_SET_TEMPERATURE_PERIOD_REQUEST, 0, '')
+
+    async def get_temperature_period(self):
+        """
+        Returns the period as set by :func:`Set Temperature Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_TEMPERATURE_PERIOD, (), '', 12, BrickIMUV2.CODEC_GET_TEMPERATURE_PERIOD_RESPONSE)
+
+    async def set_orientation_period(self, period):
+        """
+        Sets the period with which the :cb:`Orientation` callback is triggered
+        periodically. A value of 0 turns the callback off.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SET_ORIENTATION_PERIOD, (period,), BrickIMUV2.CODEC_SET_ORIENTATION_PERIOD_REQUEST, 0, '')
+
+    async def get_orientation_period(self):
+        """
+        Returns the period as set by :func:`Set Orientation Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_ORIENTATION_PERIOD, (), '', 12, BrickIMUV2.CODEC_GET_ORIENTATION_PERIOD_RESPONSE)
+
+    async def set_linear_acceleration_period(self, period):
+        """
+        Sets the period with which the :cb:`Linear Acceleration` callback is
+        triggered periodically. A value of 0 turns the callback off.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SET_LINEAR_ACCELERATION_PERIOD, (period,), BrickIMUV2.CODEC_SET_LINEAR_ACCELERATION_PERIOD_REQUEST, 0, '')
+
+    async def get_linear_acceleration_period(self):
+        """
+        Returns the period as set by :func:`Set Linear Acceleration Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_LINEAR_ACCELERATION_PERIOD, (), '', 12, BrickIMUV2.CODEC_GET_LINEAR_ACCELERATION_PERIOD_RESPONSE)
+
+    async def set_gravity_vector_period(self, period):
+        """
+        Sets the period with which the :cb:`Gravity Vector` callback is triggered
+        periodically. A value of 0 turns the callback off.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SET_GRAVITY_VECTOR_PERIOD, (period,), BrickIMUV2.CODEC_SET_GRAVITY_VECTOR_PERIOD_REQUEST, 0, '')
+
+    async def get_gravity_vector_period(self):
+        """
+        Returns the period as set by :func:`Set Gravity Vector Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_GRAVITY_VECTOR_PERIOD, (), '', 12, BrickIMUV2.CODEC_GET_GRAVITY_VECTOR_PERIOD_RESPONSE)
+
+    async def set_quaternion_period(self, period):
+        """
+        Sets the period with which the :cb:`Quaternion` callback is triggered
+        periodically. A value of 0 turns the callback off.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SET_QUATERNION_PERIOD, (period,), BrickIMUV2.CODEC_SET_QUATERNION_PERIOD_REQUEST, 0, '')
+
+    async def get_quaternion_period(self):
+        """
+        Returns the period as set by :func:`Set Quaternion Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_QUATERNION_PERIOD, (), '', 12, BrickIMUV2.CODEC_GET_QUATERNION_PERIOD_RESPONSE)
+
+    async def set_all_data_period(self, period):
+        """
+        Sets the period with which the :cb:`All Data` callback is triggered
+        periodically. A value of 0 turns the callback off.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SET_ALL_DATA_PERIOD, (period,), BrickIMUV2.CODEC_SET_ALL_DATA_PERIOD_REQUEST, 0, '')
+
+    async def get_all_data_period(self):
+        """
+        Returns the period as set by :func:`Set All Data Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_ALL_DATA_PERIOD, (), '', 12, BrickIMUV2.CODEC_GET_ALL_DATA_PERIOD_RESPONSE)
+
+    async def set_sensor_configuration(self, magnetometer_rate, gyroscope_range, gyroscope_bandwidth, accelerometer_range, accelerometer_bandwidth):
+        """
+        Sets the available sensor configuration for the Magnetometer, Gyroscope and
+        Accelerometer. The Accelerometer Range is user selectable in all fusion modes,
+        all other configurations are auto-controlled in fusion mode.
+
+        .. versionadded:: 2.0.5$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        magnetometer_rate = int(magnetometer_rate)
+        gyroscope_range = int(gyroscope_range)
+        gyroscope_bandwidth = int(gyroscope_bandwidth)
+        accelerometer_range = int(accelerometer_range)
+        accelerometer_bandwidth = int(accelerometer_bandwidth)
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SET_SENSOR_CONFIGURATION, (magnetometer_rate, gyroscope_range, gyroscope_bandwidth, accelerometer_range, accelerometer_bandwidth), BrickIMUV2.CODEC_SET_SENSOR_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_sensor_configuration(self):
+        """
+        Returns the sensor configuration as set by :func:`Set Sensor Configuration`.
+
+        .. versionadded:: 2.0.5$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        return GetSensorConfiguration(*await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_SENSOR_CONFIGURATION, (), '', 13, BrickIMUV2.CODEC_GET_SENSOR_CONFIGURATION_RESPONSE))
+
+    async def set_sensor_fusion_mode(self, mode):
+        """
+        If the fusion mode is turned off, the functions :func:`Get Acceleration`,
+        :func:`Get Magnetic Field` and :func:`Get Angular Velocity` return uncalibrated
+        and uncompensated sensor data. All other sensor data getters return no data.
+
+        Since firmware version 2.0.6 you can also use a fusion mode without magnetometer.
+        In this mode the calculated orientation is relative (with magnetometer it is
+        absolute with respect to the earth). However, the calculation can't be influenced
+        by spurious magnetic fields.
+
+        Since firmware version 2.0.13 you can also use a fusion mode without fast
+        magnetometer calibration. This mode is the same as the normal fusion mode,
+        but the fast magnetometer calibration is turned off. So to find the orientation
+        the first time will likely take longer, but small magnetic influences might
+        not affect the automatic calibration as much.
+
+        .. versionadded:: 2.0.5$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SET_SENSOR_FUSION_MODE, (mode,), BrickIMUV2.CODEC_SET_SENSOR_FUSION_MODE_REQUEST, 0, '')
+
+    async def get_sensor_fusion_mode(self):
+        """
+        Returns the sensor fusion mode as set by :func:`Set Sensor Fusion Mode`.
+
+        .. versionadded:: 2.0.5$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_SENSOR_FUSION_MODE, (), '', 9, BrickIMUV2.CODEC_GET_SENSOR_FUSION_MODE_RESPONSE)
+
+    async def set_spitfp_baudrate_config(self, enable_dynamic_baudrate, minimum_dynamic_baudrate):
+        """
+        The SPITF protocol can be used with a dynamic baudrate. If the dynamic baudrate is
+        enabled, the Brick will try to adapt the baudrate for the communication
+        between Bricks and Bricklets according to the amount of data that is transferred.
+
+        The baudrate will be increased exponentially if lots of data is sent/received and
+        decreased linearly if little data is sent/received.
+
+        This lowers the baudrate in applications where little data is transferred (e.g.
+        a weather station) and increases the robustness. If there is lots of data to transfer
+        (e.g. Thermal Imaging Bricklet) it automatically increases the baudrate as needed.
+
+        In cases where some data has to transferred as fast as possible every few seconds
+        (e.g. RS485 Bricklet with a high baudrate but small payload) you may want to turn
+        the dynamic baudrate off to get the highest possible performance.
+
+        The maximum value of the baudrate can be set per port with the function
+        :func:`Set SPITFP Baudrate`. If the dynamic baudrate is disabled, the baudrate
+        as set by :func:`Set SPITFP Baudrate` will be used statically.
+
+        .. versionadded:: 2.0.10$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        enable_dynamic_baudrate = bool(enable_dynamic_baudrate)
+        minimum_dynamic_baudrate = int(minimum_dynamic_baudrate)
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SET_SPITFP_BAUDRATE_CONFIG, (enable_dynamic_baudrate, minimum_dynamic_baudrate), BrickIMUV2.CODEC_SET_SPITFP_BAUDRATE_CONFIG_REQUEST, 0, '')
+
+    async def get_spitfp_baudrate_config(self):
+        """
+        Returns the baudrate config, see :func:`Set SPITFP Baudrate Config`.
+
+        .. versionadded:: 2.0.10$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        return GetSPITFPBaudrateConfig(*await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_SPITFP_BAUDRATE_CONFIG, (), '', 13, BrickIMUV2.CODEC_GET_SPITFP_BAUDRATE_CONFIG_RESPONSE))
+
+    async def get_send_timeout_count(self, communication_method):
+        """
+        Returns the timeout count for the different communication methods.
+
+        The methods 0-2 are available for all Bricks, 3-7 only for Master Bricks.
+
+        This function is mostly used for debugging during development, in normal operation
+        the counters should nearly always stay at 0.
+
+        .. versionadded:: 2.0.7$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        communication_method = int(communication_method)
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_SEND_TIMEOUT_COUNT, (communication_method,), BrickIMUV2.CODEC_GET_SEND_TIMEOUT_COUNT_REQUEST, 12, BrickIMUV2.CODEC_GET_SEND_TIMEOUT_COUNT_RESPONSE)
+
+    async def set_spitfp_baudrate(self, bricklet_port, baudrate):
+        """
+        Sets the baudrate for a specific Bricklet port.
+
+        If you want to increase the throughput of Bricklets you can increase
+        the baudrate. If you get a high error count because of high
+        interference (see :func:`Get SPITFP Error Count`) you can decrease the
+        baudrate.
+
+        If the dynamic baudrate feature is enabled, the baudrate set by this
+        function corresponds to the maximum baudrate (see :func:`Set SPITFP Baudrate Config`).
+
+        Regulatory testing is done with the default baudrate. If CE compatibility
+        or similar is necessary in your applications we recommend to not change
+        the baudrate.
+
+        .. versionadded:: 2.0.5$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        bricklet_port = create_char(bricklet_port)
+        baudrate = int(baudrate)
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_SET_SPITFP_BAUDRATE, (bricklet_port, baudrate), BrickIMUV2.CODEC_SET_SPITFP_BAUDRATE_REQUEST, 0, '')
+
+    async def get_spitfp_baudrate(self, bricklet_port):
+        """
+        Returns the baudrate for a given Bricklet port, see :func:`Set SPITFP Baudrate`.
+
+        .. versionadded:: 2.0.5$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        bricklet_port = create_char(bricklet_port)
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_SPITFP_BAUDRATE, (bricklet_port,), BrickIMUV2.CODEC_GET_SPITFP_BAUDRATE_REQUEST, 12, BrickIMUV2.CODEC_GET_SPITFP_BAUDRATE_RESPONSE)
+
+    async def get_spitfp_error_count(self, bricklet_port):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Brick side. All
+        Bricklets have a similar function that returns the errors on the Bricklet side.
+
+        .. versionadded:: 2.0.5$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        bricklet_port = create_char(bricklet_port)
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_SPITFP_ERROR_COUNT, (bricklet_port,), BrickIMUV2.CODEC_GET_SPITFP_ERROR_COUNT_REQUEST, 24, BrickIMUV2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def enable_status_led(self):
+        """
+        Enables the status LED.
+
+        The status LED is the blue LED next to the USB connector. If enabled is is
+        on and it flickers if data is transfered. If disabled it is always off.
+
+        The default state is enabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_ENABLE_STATUS_LED, (), '', 0, '')
+
+    async def disable_status_led(self):
+        """
+        Disables the status LED.
+
+        The status LED is the blue LED next to the USB connector. If enabled is is
+        on and it flickers if data is transfered. If disabled it is always off.
+
+        The default state is enabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_DISABLE_STATUS_LED, (), '', 0, '')
+
+    async def is_status_led_enabled(self):
+        """
+        Returns *true* if the status LED is enabled, *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_IS_STATUS_LED_ENABLED, (), '', 9, BrickIMUV2.CODEC_IS_STATUS_LED_ENABLED_RESPONSE)
+
+    async def get_protocol1_bricklet_name(self, port):
+        """
+        Returns the firmware and protocol version and the name of the Bricklet for a
+        given port.
+
+        This functions sole purpose is to allow automatic flashing of v1.x.y Bricklet
+        plugins.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+
+        return GetProtocol1BrickletName(*await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, (port,), BrickIMUV2.CODEC_GET_PROTOCOL1_BRICKLET_NAME_REQUEST, 52, BrickIMUV2.CODEC_GET_PROTOCOL1_BRICKLET_NAME_RESPONSE))
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has an
+        accuracy of ±15%. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickIMUV2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Brick. Calling this function
+        on a Brick inside of a stack will reset the whole stack.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_bricklet_plugin(self, port, offset, chunk):
+        """
+        Writes 32 bytes of firmware to the bricklet attached at the given port.
+        The bytes are written to the position offset * 32.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+        offset = int(offset)
+        chunk = list(map(int, chunk))
+
+        await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_WRITE_BRICKLET_PLUGIN, (port, offset, chunk), BrickIMUV2.CODEC_WRITE_BRICKLET_PLUGIN_REQUEST, 0, '')
+
+    async def read_bricklet_plugin(self, port, offset):
+        """
+        Reads 32 bytes of firmware from the bricklet attached at the given port.
+        The bytes are read starting at the position offset * 32.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+        offset = int(offset)
+
+        return await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_READ_BRICKLET_PLUGIN, (port, offset), BrickIMUV2.CODEC_READ_BRICKLET_PLUGIN_REQUEST, 40, BrickIMUV2.CODEC_READ_BRICKLET_PLUGIN_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Brick is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position is the position in the stack from '0' (bottom) to '8' (top).
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickIMUV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickIMUV2.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,960 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .brick_red import BrickRED, CreateSession, AllocateString, GetStringLength, GetStringChunk, AllocateList, GetListLength, GetListItem, OpenFile, CreatePipe, GetFileInfo, ReadFile, WriteFile, SetFilePosition, GetFilePosition, GetFileEvents, OpenDirectory, GetDirectoryName, GetNextDirectoryEntry, GetProcesses, SpawnProcess, GetProcessCommand, GetProcessIdentity, GetProcessStdio, GetProcessState, GetPrograms, DefineProgram, GetProgramIdentifier, GetProgramRootDirectory, GetProgramCommand, GetProgramStdioRedirection, GetProgramSchedule, GetProgramSchedulerState, GetLastSpawnedProgramProcess, GetCustomProgramOptionNames, GetCustomProgramOptionValue, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from brick_red import BrickRED, CreateSession, AllocateString, GetStringLength, GetStringChunk, AllocateList, GetListLength, GetListItem, OpenFile, CreatePipe, GetFileInfo, ReadFile, WriteFile, SetFilePosition, GetFilePosition, GetFileEvents, OpenDirectory, GetDirectoryName, GetNextDirectoryEntry, GetProcesses, SpawnProcess, GetProcessCommand, GetProcessIdentity, GetProcessStdio, GetProcessState, GetPrograms, DefineProgram, GetProgramIdentifier, GetProgramRootDirectory, GetProgramCommand, GetProgramStdioRedirection, GetProgramSchedule, GetProgramSchedulerState, GetLastSpawnedProgramProcess, GetCustomProgramOptionNames, GetCustomProgramOptionValue, GetIdentity
+
+class BrickREDAsync(AsyncDevice, BrickRED):
+    """
+    Executes user programs and controls other Bricks/Bricklets standalone
+
+    asyncio variant of BrickRED for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def create_session(self, lifetime):
+        """
+
+        """
+        await self.check_validity()
+
+        lifetime = int(lifetime)
+
+        return CreateSession(*await self.ipcon.send_request(self, BrickRED.FUNCTION_CREATE_SESSION, (lifetime,), BrickRED.CODEC_CREATE_SESSION_REQUEST, 11, BrickRED.CODEC_CREATE_SESSION_RESPONSE))
+
+    async def expire_session(self, session_id):
+        """
+
+        """
+        await self.check_validity()
+
+        session_id = int(session_id)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_EXPIRE_SESSION, (session_id,), BrickRED.CODEC_EXPIRE_SESSION_REQUEST, 9, BrickRED.CODEC_EXPIRE_SESSION_RESPONSE)
+
+    async def expire_session_unchecked(self, session_id):
+        """
+
+        """
+        await self.check_validity()
+
+        session_id = int(session_id)
+
+        await self.ipcon.send_request(self, BrickRED.FUNCTION_EXPIRE_SESSION_UNCHECKED, (session_id,), BrickRED.CODEC_EXPIRE_SESSION_UNCHECKED_REQUEST, 0, '')
+
+    async def keep_session_alive(self, session_id, lifetime):
+        """
+
+        """
+        await self.check_validity()
+
+        session_id = int(session_id)
+        lifetime = int(lifetime)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_KEEP_SESSION_ALIVE, (session_id, lifetime), BrickRED.CODEC_KEEP_SESSION_ALIVE_REQUEST, 9, BrickRED.CODEC_KEEP_SESSION_ALIVE_RESPONSE)
+
+    async def release_object(self, object_id, session_id):
+        """
+        Decreases the reference count of an object by one and returns the resulting
+        error code. If the reference count reaches zero the object gets destroyed.
+        """
+        await self.check_validity()
+
+        object_id = int(object_id)
+        session_id = int(session_id)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_RELEASE_OBJECT, (object_id, session_id), BrickRED.CODEC_RELEASE_OBJECT_REQUEST, 9, BrickRED.CODEC_RELEASE_OBJECT_RESPONSE)
+
+    async def release_object_unchecked(self, object_id, session_id):
+        """
+
+        """
+        await self.check_validity()
+
+        object_id = int(object_id)
+        session_id = int(session_id)
+
+        await self.ipcon.send_request(self, BrickRED.FUNCTION_RELEASE_OBJECT_UNCHECKED, (object_id, session_id), BrickRED.CODEC_RELEASE_OBJECT_UNCHECKED_REQUEST, 0, '')
+
+    async def allocate_string(self, length_to_reserve, buffer, session_id):
+        """
+        Allocates a new string object, reserves ``length_to_reserve`` bytes memory
+        for it and sets up to the first 60 bytes. Set ``length_to_reserve`` to the
+        length of the string that should be stored in the string object.
+
+        Returns the object ID of the new string object and the resulting error code.
+        """
+        await self.check_validity()
+
+        length_to_reserve = int(length_to_reserve)
+        buffer = create_string(buffer)
+        session_id = int(session_id)
+
+        return AllocateString(*await self.ipcon.send_request(self, BrickRED.FUNCTION_ALLOCATE_STRING, (length_to_reserve, buffer, session_id), BrickRED.CODEC_ALLOCATE_STRING_REQUEST, 11, BrickRED.CODEC_ALLOCATE_STRING_RESPONSE))
+
+    async def truncate_string(self, string_id, length):
+        """
+        Truncates a string object to ``length`` bytes and returns the resulting
+        error code.
+        """
+        await self.check_validity()
+
+        string_id = int(string_id)
+        length = int(length)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_TRUNCATE_STRING, (string_id, length), BrickRED.CODEC_TRUNCATE_STRING_REQUEST, 9, BrickRED.CODEC_TRUNCATE_STRING_RESPONSE)
+
+    async def get_string_length(self, string_id):
+        """
+        Returns the length of a string object and the resulting error code.
+        """
+        await self.check_validity()
+
+        string_id = int(string_id)
+
+        return GetStringLength(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_STRING_LENGTH, (string_id,), BrickRED.CODEC_GET_STRING_LENGTH_REQUEST, 13, BrickRED.CODEC_GET_STRING_LENGTH_RESPONSE))
+
+    async def set_string_chunk(self, string_id, offset, buffer):
+        """
+        Sets a chunk of up to 58 bytes in a string object beginning at ``offset``.
+
+        Returns the resulting error code.
+        """
+        await self.check_validity()
+
+        string_id = int(string_id)
+        offset = int(offset)
+        buffer = create_string(buffer)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_SET_STRING_CHUNK, (string_id, offset, buffer), BrickRED.CODEC_SET_STRING_CHUNK_REQUEST, 9, BrickRED.CODEC_SET_STRING_CHUNK_RESPONSE)
+
+    async def get_string_chunk(self, string_id, offset):
+        """
+        Returns a chunk up to 63 bytes from a string object beginning at ``offset`` and
+        returns the resulting error code.
+        """
+        await self.check_validity()
+
+        string_id = int(string_id)
+        offset = int(offset)
+
+        return GetStringChunk(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_STRING_CHUNK, (string_id, offset), BrickRED.CODEC_GET_STRING_CHUNK_REQUEST, 72, BrickRED.CODEC_GET_STRING_CHUNK_RESPONSE))
+
+    async def allocate_list(self, length_to_reserve, session_id):
+        """
+        Allocates a new list object and reserves memory for ``length_to_reserve``
+        items. Set ``length_to_reserve`` to the number of items that should be stored
+        in the list object.
+
+        Returns the object ID of the new list object and the resulting error code.
+
+        When a list object gets destroyed then the reference count of each object in
+        the list object is decreased by one.
+        """
+        await self.check_validity()
+
+        length_to_reserve = int(length_to_reserve)
+        session_id = int(session_id)
+
+        return AllocateList(*await self.ipcon.send_request(self, BrickRED.FUNCTION_ALLOCATE_LIST, (length_to_reserve, session_id), BrickRED.CODEC_ALLOCATE_LIST_REQUEST, 11, BrickRED.CODEC_ALLOCATE_LIST_RESPONSE))
+
+    async def get_list_length(self, list_id):
+        """
+        Returns the length of a list object in items and the resulting error code.
+        """
+        await self.check_validity()
+
+        list_id = int(list_id)
+
+        return GetListLength(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_LIST_LENGTH, (list_id,), BrickRED.CODEC_GET_LIST_LENGTH_REQUEST, 11, BrickRED.CODEC_GET_LIST_LENGTH_RESPONSE))
+
+    async def get_list_item(self, list_id, index, session_id):
+        """
+        Returns the object ID and type of the object stored at ``index`` in a list
+        object and returns the resulting error code.
+
+        Possible object types are:
+
+        * String = 0
+        * List = 1
+        * File = 2
+        * Directory = 3
+        * Process = 4
+        * Program = 5
+        """
+        await self.check_validity()
+
+        list_id = int(list_id)
+        index = int(index)
+        session_id = int(session_id)
+
+        return GetListItem(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_LIST_ITEM, (list_id, index, session_id), BrickRED.CODEC_GET_LIST_ITEM_REQUEST, 12, BrickRED.CODEC_GET_LIST_ITEM_RESPONSE))
+
+    async def append_to_list(self, list_id, item_object_id):
+        """
+        Appends an object to a list object and increases the reference count of the
+        appended object by one.
+
+        Returns the resulting error code.
+        """
+        await self.check_validity()
+
+        list_id = int(list_id)
+        item_object_id = int(item_object_id)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_APPEND_TO_LIST, (list_id, item_object_id), BrickRED.CODEC_APPEND_TO_LIST_REQUEST, 9, BrickRED.CODEC_APPEND_TO_LIST_RESPONSE)
+
+    async def remove_from_list(self, list_id, index):
+        """
+        Removes the object stored at ``index`` from a list object and decreases the
+        reference count of the removed object by one.
+
+        Returns the resulting error code.
+        """
+        await self.check_validity()
+
+        list_id = int(list_id)
+        index = int(index)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_REMOVE_FROM_LIST, (list_id, index), BrickRED.CODEC_REMOVE_FROM_LIST_REQUEST, 9, BrickRED.CODEC_REMOVE_FROM_LIST_RESPONSE)
+
+    async def open_file(self, name_string_id, flags, permissions, uid, gid, session_id):
+        """
+        Opens an existing file or creates a new file and allocates a new file object
+        for it.
+
+        FIXME: name has to be absolute
+
+        The reference count of the name string object is increased by one. When the
+        file object gets destroyed then the reference count of the name string object is
+        decreased by one. Also the name string object is locked and cannot be modified
+        while the file object holds a reference to it.
+
+        The ``flags`` parameter takes a ORed combination of the following possible file
+        flags (in hexadecimal notation):
+
+        * ReadOnly = 0x0001 (O_RDONLY)
+        * WriteOnly = 0x0002 (O_WRONLY)
+        * ReadWrite = 0x0004 (O_RDWR)
+        * Append = 0x0008 (O_APPEND)
+        * Create = 0x0010 (O_CREAT)
+        * Exclusive = 0x0020 (O_EXCL)
+        * NonBlocking = 0x0040 (O_NONBLOCK)
+        * Truncate = 0x0080 (O_TRUNC)
+        * Temporary = 0x0100
+        * Replace = 0x0200
+
+        FIXME: explain *Temporary* and *Replace* flag
+
+        The ``permissions`` parameter takes a ORed combination of the following
+        possible file permissions (in octal notation) that match the common UNIX
+        permission bits:
+
+        * UserRead = 00400
+        * UserWrite = 00200
+        * UserExecute = 00100
+        * GroupRead = 00040
+        * GroupWrite = 00020
+        * GroupExecute = 00010
+        * OthersRead = 00004
+        * OthersWrite = 00002
+        * OthersExecute = 00001
+
+        Returns the object ID of the new file object and the resulting error code.
+        """
+        await self.check_validity()
+
+        name_string_id = int(name_string_id)
+        flags = int(flags)
+        permissions = int(permissions)
+        uid = int(uid)
+        gid = int(gid)
+        session_id = int(session_id)
+
+        return OpenFile(*await self.ipcon.send_request(self, BrickRED.FUNCTION_OPEN_FILE, (name_string_id, flags, permissions, uid, gid, session_id), BrickRED.CODEC_OPEN_FILE_REQUEST, 11, BrickRED.CODEC_OPEN_FILE_RESPONSE))
+
+    async def create_pipe(self, flags, length, session_id):
+        """
+        Creates a new pipe and allocates a new file object for it.
+
+        The ``flags`` parameter takes a ORed combination of the following possible
+        pipe flags (in hexadecimal notation):
+
+        * NonBlockingRead = 0x0001
+        * NonBlockingWrite = 0x0002
+
+        The length of the pipe buffer can be specified with the ``length`` parameter
+        in bytes. If length is set to zero, then the default pipe buffer length is used.
+
+        Returns the object ID of the new file object and the resulting error code.
+        """
+        await self.check_validity()
+
+        flags = int(flags)
+        length = int(length)
+        session_id = int(session_id)
+
+        return CreatePipe(*await self.ipcon.send_request(self, BrickRED.FUNCTION_CREATE_PIPE, (flags, length, session_id), BrickRED.CODEC_CREATE_PIPE_REQUEST, 11, BrickRED.CODEC_CREATE_PIPE_RESPONSE))
+
+    async def get_file_info(self, file_id, session_id):
+        """
+        Returns various information about a file and the resulting error code.
+
+        Possible file types are:
+
+        * Unknown = 0
+        * Regular = 1
+        * Directory = 2
+        * Character = 3
+        * Block = 4
+        * FIFO = 5
+        * Symlink = 6
+        * Socket = 7
+        * Pipe = 8
+
+        If the file type is *Pipe* then the returned name string object is invalid,
+        because a pipe has no name. Otherwise the returned name string object was used
+        to open or create the file object, as passed to :func:`Open File`.
+
+        The returned flags were used to open or create the file object, as passed to
+        :func:`Open File` or :func:`Create Pipe`. See the respective function for a list
+        of possible file and pipe flags.
+
+        FIXME: everything except flags and length is invalid if file type is *Pipe*
+        """
+        await self.check_validity()
+
+        file_id = int(file_id)
+        session_id = int(session_id)
+
+        return GetFileInfo(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_FILE_INFO, (file_id, session_id), BrickRED.CODEC_GET_FILE_INFO_REQUEST, 58, BrickRED.CODEC_GET_FILE_INFO_RESPONSE))
+
+    async def read_file(self, file_id, length_to_read):
+        """
+        Reads up to 62 bytes from a file object.
+
+        Returns the bytes read, the actual number of bytes read and the resulting
+        error code.
+
+        If there is not data to be read, either because the file position reached
+        end-of-file or because there is not data in the pipe, then zero bytes are
+        returned.
+
+        If the file object was created by :func:`Open File` without the *NonBlocking*
+        flag or by :func:`Create Pipe` without the *NonBlockingRead* flag then the
+        error code *NotSupported* is returned.
+        """
+        await self.check_validity()
+
+        file_id = int(file_id)
+        length_to_read = int(length_to_read)
+
+        return ReadFile(*await self.ipcon.send_request(self, BrickRED.FUNCTION_READ_FILE, (file_id, length_to_read), BrickRED.CODEC_READ_FILE_REQUEST, 72, BrickRED.CODEC_READ_FILE_RESPONSE))
+
+    async def read_file_async(self, file_id, length_to_read):
+        """
+        Reads up to 2\ :sup:`63`\  - 1 bytes from a file object asynchronously.
+
+        Reports the bytes read (in 60 byte chunks), the actual number of bytes read and
+        the resulting error code via the :cb:`Async File Read` callback.
+
+        If there is not data to be read, either because the file position reached
+        end-of-file or because there is not data in the pipe, then zero bytes are
+        reported.
+
+        If the file object was created by :func:`Open File` without the *NonBlocking*
+        flag or by :func:`Create Pipe` without the *NonBlockingRead* flag then the error
+        code *NotSupported* is reported via the :cb:`Async File Read` callback.
+        """
+        await self.check_validity()
+
+        file_id = int(file_id)
+        length_to_read = int(length_to_read)
+
+        await self.ipcon.send_request(self, BrickRED.FUNCTION_READ_FILE_ASYNC, (file_id, length_to_read), BrickRED.CODEC_READ_FILE_ASYNC_REQUEST, 0, '')
+
+    async def abort_async_file_read(self, file_id):
+        """
+        Aborts a :func:`Read File Async` operation in progress.
+
+        Returns the resulting error code.
+
+        On success the :cb:`Async File Read` callback will report *OperationAborted*.
+        """
+        await self.check_validity()
+
+        file_id = int(file_id)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_ABORT_ASYNC_FILE_READ, (file_id,), BrickRED.CODEC_ABORT_ASYNC_FILE_READ_REQUEST, 9, BrickRED.CODEC_ABORT_ASYNC_FILE_READ_RESPONSE)
+
+    async def write_file(self, file_id, buffer, length_to_write):
+        """
+        Writes up to 61 bytes to a file object.
+
+        Returns the actual number of bytes written and the resulting error code.
+
+        If the file object was created by :func:`Open File` without the *NonBlocking*
+        flag or by :func:`Create Pipe` without the *NonBlockingWrite* flag then the
+        error code *NotSupported* is returned.
+        """
+        await self.check_validity()
+
+        file_id = int(file_id)
+        buffer = list(map(int, buffer))
+        length_to_write = int(length_to_write)
+
+        return WriteFile(*await self.ipcon.send_request(self, BrickRED.FUNCTION_WRITE_FILE, (file_id, buffer, length_to_write), BrickRED.CODEC_WRITE_FILE_REQUEST, 10, BrickRED.CODEC_WRITE_FILE_RESPONSE))
+
+    async def write_file_unchecked(self, file_id, buffer, length_to_write):
+        """
+        Writes up to 61 bytes to a file object.
+
+        Does neither report the actual number of bytes written nor the resulting error
+        code.
+
+        If the file object was created by :func:`Open File` without the *NonBlocking*
+        flag or by :func:`Create Pipe` without the *NonBlockingWrite* flag then the
+        write operation will fail silently.
+        """
+        await self.check_validity()
+
+        file_id = int(file_id)
+        buffer = list(map(int, buffer))
+        length_to_write = int(length_to_write)
+
+        await self.ipcon.send_request(self, BrickRED.FUNCTION_WRITE_FILE_UNCHECKED, (file_id, buffer, length_to_write), BrickRED.CODEC_WRITE_FILE_UNCHECKED_REQUEST, 0, '')
+
+    async def write_file_async(self, file_id, buffer, length_to_write):
+        """
+        Writes up to 61 bytes to a file object.
+
+        Reports the actual number of bytes written and the resulting error code via the
+        :cb:`Async File Write` callback.
+
+        If the file object was created by :func:`Open File` without the *NonBlocking*
+        flag or by :func:`Create Pipe` without the *NonBlockingWrite* flag then the
+        error code *NotSupported* is reported via the :cb:`Async File Write` callback.
+        """
+        await self.check_validity()
+
+        file_id = int(file_id)
+        buffer = list(map(int, buffer))
+        length_to_write = int(length_to_write)
+
+        await self.ipcon.send_request(self, BrickRED.FUNCTION_WRITE_FILE_ASYNC, (file_id, buffer, length_to_write), BrickRED.CODEC_WRITE_FILE_ASYNC_REQUEST, 0, '')
+
+    async def set_file_position(self, file_id, offset, origin):
+        """
+        Set the current seek position of a file object relative to ``origin``.
+
+        Possible file origins are:
+
+        * Beginning = 0
+        * Current = 1
+        * End = 2
+
+        Returns the resulting absolute seek position and error code.
+
+        If the file object was created by :func:`Create Pipe` then it has no seek
+        position and the error code *InvalidSeek* is returned.
+        """
+        await self.check_validity()
+
+        file_id = int(file_id)
+        offset = int(offset)
+        origin = int(origin)
+
+        return SetFilePosition(*await self.ipcon.send_request(self, BrickRED.FUNCTION_SET_FILE_POSITION, (file_id, offset, origin), BrickRED.CODEC_SET_FILE_POSITION_REQUEST, 17, BrickRED.CODEC_SET_FILE_POSITION_RESPONSE))
+
+    async def get_file_position(self, file_id):
+        """
+        Returns the current seek position of a file object and returns the
+        resulting error code.
+
+        If the file object was created by :func:`Create Pipe` then it has no seek
+        position and the error code *InvalidSeek* is returned.
+        """
+        await self.check_validity()
+
+        file_id = int(file_id)
+
+        return GetFilePosition(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_FILE_POSITION, (file_id,), BrickRED.CODEC_GET_FILE_POSITION_REQUEST, 17, BrickRED.CODEC_GET_FILE_POSITION_RESPONSE))
+
+    async def set_file_events(self, file_id, events):
+        """
+
+        """
+        await self.check_validity()
+
+        file_id = int(file_id)
+        events = int(events)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_SET_FILE_EVENTS, (file_id, events), BrickRED.CODEC_SET_FILE_EVENTS_REQUEST, 9, BrickRED.CODEC_SET_FILE_EVENTS_RESPONSE)
+
+    async def get_file_events(self, file_id):
+        """
+
+        """
+        await self.check_validity()
+
+        file_id = int(file_id)
+
+        return GetFileEvents(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_FILE_EVENTS, (file_id,), BrickRED.CODEC_GET_FILE_EVENTS_REQUEST, 11, BrickRED.CODEC_GET_FILE_EVENTS_RESPONSE))
+
+    async def open_directory(self, name_string_id, session_id):
+        """
+        Opens an existing directory and allocates a new directory object for it.
+
+        FIXME: name has to be absolute
+
+        The reference count of the name string object is increased by one. When the
+        directory object is destroyed then the reference count of the name string
+        object is decreased by one. Also the name string object is locked and cannot be
+        modified while the directory object holds a reference to it.
+
+        Returns the object ID of the new directory object and the resulting error code.
+        """
+        await self.check_validity()
+
+        name_string_id = int(name_string_id)
+        session_id = int(session_id)
+
+        return OpenDirectory(*await self.ipcon.send_request(self, BrickRED.FUNCTION_OPEN_DIRECTORY, (name_string_id, session_id), BrickRED.CODEC_OPEN_DIRECTORY_REQUEST, 11, BrickRED.CODEC_OPEN_DIRECTORY_RESPONSE))
+
+    async def get_directory_name(self, directory_id, session_id):
+        """
+        Returns the name of a directory object, as passed to :func:`Open Directory`, and
+        the resulting error code.
+        """
+        await self.check_validity()
+
+        directory_id = int(directory_id)
+        session_id = int(session_id)
+
+        return GetDirectoryName(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_DIRECTORY_NAME, (directory_id, session_id), BrickRED.CODEC_GET_DIRECTORY_NAME_REQUEST, 11, BrickRED.CODEC_GET_DIRECTORY_NAME_RESPONSE))
+
+    async def get_next_directory_entry(self, directory_id, session_id):
+        """
+        Returns the next entry in a directory object and the resulting error code.
+
+        If there is not next entry then error code *NoMoreData* is returned. To rewind
+        a directory object call :func:`Rewind Directory`.
+
+        Possible directory entry types are:
+
+        * Unknown = 0
+        * Regular = 1
+        * Directory = 2
+        * Character = 3
+        * Block = 4
+        * FIFO = 5
+        * Symlink = 6
+        * Socket = 7
+        """
+        await self.check_validity()
+
+        directory_id = int(directory_id)
+        session_id = int(session_id)
+
+        return GetNextDirectoryEntry(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_NEXT_DIRECTORY_ENTRY, (directory_id, session_id), BrickRED.CODEC_GET_NEXT_DIRECTORY_ENTRY_REQUEST, 12, BrickRED.CODEC_GET_NEXT_DIRECTORY_ENTRY_RESPONSE))
+
+    async def rewind_directory(self, directory_id):
+        """
+        Rewinds a directory object and returns the resulting error code.
+        """
+        await self.check_validity()
+
+        directory_id = int(directory_id)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_REWIND_DIRECTORY, (directory_id,), BrickRED.CODEC_REWIND_DIRECTORY_REQUEST, 9, BrickRED.CODEC_REWIND_DIRECTORY_RESPONSE)
+
+    async def create_directory(self, name_string_id, flags, permissions, uid, gid):
+        """
+        FIXME: name has to be absolute
+        """
+        await self.check_validity()
+
+        name_string_id = int(name_string_id)
+        flags = int(flags)
+        permissions = int(permissions)
+        uid = int(uid)
+        gid = int(gid)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_CREATE_DIRECTORY, (name_string_id, flags, permissions, uid, gid), BrickRED.CODEC_CREATE_DIRECTORY_REQUEST, 9, BrickRED.CODEC_CREATE_DIRECTORY_RESPONSE)
+
+    async def get_processes(self, session_id):
+        """
+
+        """
+        await self.check_validity()
+
+        session_id = int(session_id)
+
+        return GetProcesses(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_PROCESSES, (session_id,), BrickRED.CODEC_GET_PROCESSES_REQUEST, 11, BrickRED.CODEC_GET_PROCESSES_RESPONSE))
+
+    async def spawn_process(self, executable_string_id, arguments_list_id, environment_list_id, working_directory_string_id, uid, gid, stdin_file_id, stdout_file_id, stderr_file_id, session_id):
+        """
+
+        """
+        await self.check_validity()
+
+        executable_string_id = int(executable_string_id)
+        arguments_list_id = int(arguments_list_id)
+        environment_list_id = int(environment_list_id)
+        working_directory_string_id = int(working_directory_string_id)
+        uid = int(uid)
+        gid = int(gid)
+        stdin_file_id = int(stdin_file_id)
+        stdout_file_id = int(stdout_file_id)
+        stderr_file_id = int(stderr_file_id)
+        session_id = int(session_id)
+
+        return SpawnProcess(*await self.ipcon.send_request(self, BrickRED.FUNCTION_SPAWN_PROCESS, (executable_string_id, arguments_list_id, environment_list_id, working_directory_string_id, uid, gid, stdin_file_id, stdout_file_id, stderr_file_id, session_id), BrickRED.CODEC_SPAWN_PROCESS_REQUEST, 11, BrickRED.CODEC_SPAWN_PROCESS_RESPONSE))
+
+    async def kill_process(self, process_id, signal):
+        """
+        Sends a UNIX signal to a process object and returns the resulting error code.
+
+        Possible UNIX signals are:
+
+        * Interrupt = 2
+        * Quit = 3
+        * Abort = 6
+        * Kill = 9
+        * User1 = 10
+        * User2 = 12
+        * Terminate = 15
+        * Continue =  18
+        * Stop = 19
+        """
+        await self.check_validity()
+
+        process_id = int(process_id)
+        signal = int(signal)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_KILL_PROCESS, (process_id, signal), BrickRED.CODEC_KILL_PROCESS_REQUEST, 9, BrickRED.CODEC_KILL_PROCESS_RESPONSE)
+
+    async def get_process_command(self, process_id, session_id):
+        """
+        Returns the executable, arguments, environment and working directory used to
+        spawn a process object, as passed to :func:`Spawn Process`, and the resulting
+        error code.
+        """
+        await self.check_validity()
+
+        process_id = int(process_id)
+        session_id = int(session_id)
+
+        return GetProcessCommand(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_PROCESS_COMMAND, (process_id, session_id), BrickRED.CODEC_GET_PROCESS_COMMAND_REQUEST, 17, BrickRED.CODEC_GET_PROCESS_COMMAND_RESPONSE))
+
+    async def get_process_identity(self, process_id):
+        """
+        Returns the process ID and the user and group ID used to spawn a process object,
+        as passed to :func:`Spawn Process`, and the resulting error code.
+
+        The process ID is only valid if the state is *Running* or *Stopped*, see
+        :func:`Get Process State`.
+        """
+        await self.check_validity()
+
+        process_id = int(process_id)
+
+        return GetProcessIdentity(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_PROCESS_IDENTITY, (process_id,), BrickRED.CODEC_GET_PROCESS_IDENTITY_REQUEST, 21, BrickRED.CODEC_GET_PROCESS_IDENTITY_RESPONSE))
+
+    async def get_process_stdio(self, process_id, session_id):
+        """
+        Returns the stdin, stdout and stderr files used to spawn a process object, as
+        passed to :func:`Spawn Process`, and the resulting error code.
+        """
+        await self.check_validity()
+
+        process_id = int(process_id)
+        session_id = int(session_id)
+
+        return GetProcessStdio(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_PROCESS_STDIO, (process_id, session_id), BrickRED.CODEC_GET_PROCESS_STDIO_REQUEST, 15, BrickRED.CODEC_GET_PROCESS_STDIO_RESPONSE))
+
+    async def get_process_state(self, process_id):
+        """
+        Returns the current state, timestamp and exit code of a process object, and
+        the resulting error code.
+
+        Possible process states are:
+
+        * Unknown = 0
+        * Running = 1
+        * Error = 2
+        * Exited = 3
+        * Killed = 4
+        * Stopped = 5
+
+        The timestamp represents the UNIX time since when the process is in its current
+        state.
+
+        The exit code is only valid if the state is *Error*, *Exited*, *Killed* or
+        *Stopped* and has different meanings depending on the state:
+
+        * Error: error code for error occurred while spawning the process (see below)
+        * Exited: exit status of the process
+        * Killed: UNIX signal number used to kill the process
+        * Stopped: UNIX signal number used to stop the process
+
+        Possible exit/error codes in *Error* state are:
+
+        * InternalError = 125
+        * CannotExecute = 126
+        * DoesNotExist = 127
+
+        The *CannotExecute* error can be caused by the executable being opened for
+        writing.
+        """
+        await self.check_validity()
+
+        process_id = int(process_id)
+
+        return GetProcessState(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_PROCESS_STATE, (process_id,), BrickRED.CODEC_GET_PROCESS_STATE_REQUEST, 19, BrickRED.CODEC_GET_PROCESS_STATE_RESPONSE))
+
+    async def get_programs(self, session_id):
+        """
+
+        """
+        await self.check_validity()
+
+        session_id = int(session_id)
+
+        return GetPrograms(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_PROGRAMS, (session_id,), BrickRED.CODEC_GET_PROGRAMS_REQUEST, 11, BrickRED.CODEC_GET_PROGRAMS_RESPONSE))
+
+    async def define_program(self, identifier_string_id, session_id):
+        """
+
+        """
+        await self.check_validity()
+
+        identifier_string_id = int(identifier_string_id)
+        session_id = int(session_id)
+
+        return DefineProgram(*await self.ipcon.send_request(self, BrickRED.FUNCTION_DEFINE_PROGRAM, (identifier_string_id, session_id), BrickRED.CODEC_DEFINE_PROGRAM_REQUEST, 11, BrickRED.CODEC_DEFINE_PROGRAM_RESPONSE))
+
+    async def purge_program(self, program_id, cookie):
+        """
+
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        cookie = int(cookie)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_PURGE_PROGRAM, (program_id, cookie), BrickRED.CODEC_PURGE_PROGRAM_REQUEST, 9, BrickRED.CODEC_PURGE_PROGRAM_RESPONSE)
+
+    async def get_program_identifier(self, program_id, session_id):
+        """
+
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        session_id = int(session_id)
+
+        return GetProgramIdentifier(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_PROGRAM_IDENTIFIER, (program_id, session_id), BrickRED.CODEC_GET_PROGRAM_IDENTIFIER_REQUEST, 11, BrickRED.CODEC_GET_PROGRAM_IDENTIFIER_RESPONSE))
+
+    async def get_program_root_directory(self, program_id, session_id):
+        """
+        FIXME: root directory is absolute: <home>/programs/<identifier>
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        session_id = int(session_id)
+
+        return GetProgramRootDirectory(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_PROGRAM_ROOT_DIRECTORY, (program_id, session_id), BrickRED.CODEC_GET_PROGRAM_ROOT_DIRECTORY_REQUEST, 11, BrickRED.CODEC_GET_PROGRAM_ROOT_DIRECTORY_RESPONSE))
+
+    async def set_program_command(self, program_id, executable_string_id, arguments_list_id, environment_list_id, working_directory_string_id):
+        """
+        FIXME: working directory is relative to <home>/programs/<identifier>/bin
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        executable_string_id = int(executable_string_id)
+        arguments_list_id = int(arguments_list_id)
+        environment_list_id = int(environment_list_id)
+        working_directory_string_id = int(working_directory_string_id)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_SET_PROGRAM_COMMAND, (program_id, executable_string_id, arguments_list_id, environment_list_id, working_directory_string_id), BrickRED.CODEC_SET_PROGRAM_COMMAND_REQUEST, 9, BrickRED.CODEC_SET_PROGRAM_COMMAND_RESPONSE)
+
+    async def get_program_command(self, program_id, session_id):
+        """
+        FIXME: working directory is relative to <home>/programs/<identifier>/bin
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        session_id = int(session_id)
+
+        return GetProgramCommand(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_PROGRAM_COMMAND, (program_id, session_id), BrickRED.CODEC_GET_PROGRAM_COMMAND_REQUEST, 17, BrickRED.CODEC_GET_PROGRAM_COMMAND_RESPONSE))
+
+    async def set_program_stdio_redirection(self, program_id, stdin_redirection, stdin_file_name_string_id, stdout_redirection, stdout_file_name_string_id, stderr_redirection, stderr_file_name_string_id):
+        """
+        FIXME: stdio file names are relative to <home>/programs/<identifier>/bin
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        stdin_redirection = int(stdin_redirection)
+        stdin_file_name_string_id = int(stdin_file_name_string_id)
+        stdout_redirection = int(stdout_redirection)
+        stdout_file_name_string_id = int(stdout_file_name_string_id)
+        stderr_redirection = int(stderr_redirection)
+        stderr_file_name_string_id = int(stderr_file_name_string_id)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_SET_PROGRAM_STDIO_REDIRECTION, (program_id, stdin_redirection, stdin_file_name_string_id, stdout_redirection, stdout_file_name_string_id, stderr_redirection, stderr_file_name_string_id), BrickRED.CODEC_SET_PROGRAM_STDIO_REDIRECTION_REQUEST, 9, BrickRED.CODEC_SET_PROGRAM_STDIO_REDIRECTION_RESPONSE)
+
+    async def get_program_stdio_redirection(self, program_id, session_id):
+        """
+        FIXME: stdio file names are relative to <home>/programs/<identifier>/bin
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        session_id = int(session_id)
+
+        return GetProgramStdioRedirection(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_PROGRAM_STDIO_REDIRECTION, (program_id, session_id), BrickRED.CODEC_GET_PROGRAM_STDIO_REDIRECTION_REQUEST, 18, BrickRED.CODEC_GET_PROGRAM_STDIO_REDIRECTION_RESPONSE))
+
+    async def set_program_schedule(self, program_id, start_mode, continue_after_error, start_interval, start_fields_string_id):
+        """
+
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        start_mode = int(start_mode)
+        continue_after_error = bool(continue_after_error)
+        start_interval = int(start_interval)
+        start_fields_string_id = int(start_fields_string_id)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_SET_PROGRAM_SCHEDULE, (program_id, start_mode, continue_after_error, start_interval, start_fields_string_id), BrickRED.CODEC_SET_PROGRAM_SCHEDULE_REQUEST, 9, BrickRED.CODEC_SET_PROGRAM_SCHEDULE_RESPONSE)
+
+    async def get_program_schedule(self, program_id, session_id):
+        """
+
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        session_id = int(session_id)
+
+        return GetProgramSchedule(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_PROGRAM_SCHEDULE, (program_id, session_id), BrickRED.CODEC_GET_PROGRAM_SCHEDULE_REQUEST, 17, BrickRED.CODEC_GET_PROGRAM_SCHEDULE_RESPONSE))
+
+    async def get_program_scheduler_state(self, program_id, session_id):
+        """
+        FIXME: message is currently valid in error-occurred state only
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        session_id = int(session_id)
+
+        return GetProgramSchedulerState(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_PROGRAM_SCHEDULER_STATE, (program_id, session_id), BrickRED.CODEC_GET_PROGRAM_SCHEDULER_STATE_REQUEST, 20, BrickRED.CODEC_GET_PROGRAM_SCHEDULER_STATE_RESPONSE))
+
+    async def continue_program_schedule(self, program_id):
+        """
+
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_CONTINUE_PROGRAM_SCHEDULE, (program_id,), BrickRED.CODEC_CONTINUE_PROGRAM_SCHEDULE_REQUEST, 9, BrickRED.CODEC_CONTINUE_PROGRAM_SCHEDULE_RESPONSE)
+
+    async def start_program(self, program_id):
+        """
+
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_START_PROGRAM, (program_id,), BrickRED.CODEC_START_PROGRAM_REQUEST, 9, BrickRED.CODEC_START_PROGRAM_RESPONSE)
+
+    async def get_last_spawned_program_process(self, program_id, session_id):
+        """
+
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        session_id = int(session_id)
+
+        return GetLastSpawnedProgramProcess(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_LAST_SPAWNED_PROGRAM_PROCESS, (program_id, session_id), BrickRED.CODEC_GET_LAST_SPAWNED_PROGRAM_PROCESS_REQUEST, 19, BrickRED.CODEC_GET_LAST_SPAWNED_PROGRAM_PROCESS_RESPONSE))
+
+    async def get_custom_program_option_names(self, program_id, session_id):
+        """
+
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        session_id = int(session_id)
+
+        return GetCustomProgramOptionNames(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_CUSTOM_PROGRAM_OPTION_NAMES, (program_id, session_id), BrickRED.CODEC_GET_CUSTOM_PROGRAM_OPTION_NAMES_REQUEST, 11, BrickRED.CODEC_GET_CUSTOM_PROGRAM_OPTION_NAMES_RESPONSE))
+
+    async def set_custom_program_option_value(self, program_id, name_string_id, value_string_id):
+        """
+
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        name_string_id = int(name_string_id)
+        value_string_id = int(value_string_id)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_SET_CUSTOM_PROGRAM_OPTION_VALUE, (program_id, name_string_id, value_string_id), BrickRED.CODEC_SET_CUSTOM_PROGRAM_OPTION_VALUE_REQUEST, 9, BrickRED.CODEC_SET_CUSTOM_PROGRAM_OPTION_VALUE_RESPONSE)
+
+    async def get_custom_program_option_value(self, program_id, name_string_id, session_id):
+        """
+
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        name_string_id = int(name_string_id)
+        session_id = int(session_id)
+
+        return GetCustomProgramOptionValue(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_CUSTOM_PROGRAM_OPTION_VALUE, (program_id, name_string_id, session_id), BrickRED.CODEC_GET_CUSTOM_PROGRAM_OPTION_VALUE_REQUEST, 11, BrickRED.CODEC_GET_CUSTOM_PROGRAM_OPTION_VALUE_RESPONSE))
+
+    async def remove_custom_program_option(self, program_id, name_string_id):
+        """
+
+        """
+        await self.check_validity()
+
+        program_id = int(program_id)
+        name_string_id = int(name_string_id)
+
+        return await self.ipcon.send_request(self, BrickRED.FUNCTION_REMOVE_CUSTOM_PROGRAM_OPTION, (program_id, name_string_id), BrickRED.CODEC_REMOVE_CUSTOM_PROGRAM_OPTION_REQUEST, 9, BrickRED.CODEC_REMOVE_CUSTOM_PROGRAM_OPTION_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Brick is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position is the position in the stack from '0' (bottom) to '8' (top).
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickRED.FUNCTION_GET_IDENTITY, (), '', 33, BrickRED.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,924 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .brick_silent_stepper import BrickSilentStepper, GetSpeedRamping, GetStepConfiguration, GetBasicConfiguration, GetSpreadcycleConfiguration, GetStealthConfiguration, GetCoolstepConfiguration, GetMiscConfiguration, GetDriverStatus, GetAllData, GetSPITFPBaudrateConfig, GetSPITFPErrorCount, GetProtocol1BrickletName, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from brick_silent_stepper import BrickSilentStepper, GetSpeedRamping, GetStepConfiguration, GetBasicConfiguration, GetSpreadcycleConfiguration, GetStealthConfiguration, GetCoolstepConfiguration, GetMiscConfiguration, GetDriverStatus, GetAllData, GetSPITFPBaudrateConfig, GetSPITFPErrorCount, GetProtocol1BrickletName, GetIdentity
+
+class BrickSilentStepperAsync(AsyncDevice, BrickSilentStepper):
+    """
+    Silently drives one bipolar stepper motor with up to 46V and 1.6A per phase
+
+    asyncio variant of BrickSilentStepper for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_max_velocity(self, velocity):
+        """
+        Sets the maximum velocity of the stepper motor.
+        This function does *not* start the motor, it merely sets the maximum
+        velocity the stepper motor is accelerated to. To get the motor running use
+        either :func:`Set Target Position`, :func:`Set Steps`, :func:`Drive Forward` or
+        :func:`Drive Backward`.
+        """
+        await self.check_validity()
+
+        velocity = int(velocity)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_MAX_VELOCITY, (velocity,), BrickSilentStepper.CODEC_SET_MAX_VELOCITY_REQUEST, 0, '')
+
+    async def get_max_velocity(self):
+        """
+        Returns the velocity as set by :func:`Set Max Velocity`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_MAX_VELOCITY, (), '', 10, BrickSilentStepper.CODEC_GET_MAX_VELOCITY_RESPONSE)
+
+    async def get_current_velocity(self):
+        """
+        Returns the *current* velocity of the stepper motor.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_CURRENT_VELOCITY, (), '', 10, BrickSilentStepper.CODEC_GET_CURRENT_VELOCITY_RESPONSE)
+
+    async def set_speed_ramping(self, acceleration, deacceleration):
+        """
+        Sets the acceleration and deacceleration of the stepper motor.
+        An acceleration of 1000 means, that
+        every second the velocity is increased by 1000 *steps/s*.
+
+        For example: If the current velocity is 0 and you want to accelerate to a
+        velocity of 8000 *steps/s* in 10 seconds, you should set an acceleration
+        of 800 *steps/s²*.
+
+        An acceleration/deacceleration of 0 means instantaneous
+        acceleration/deacceleration (not recommended)
+        """
+        await self.check_validity()
+
+        acceleration = int(acceleration)
+        deacceleration = int(deacceleration)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_SPEED_RAMPING, (acceleration, deacceleration), BrickSilentStepper.CODEC_SET_SPEED_RAMPING_REQUEST, 0, '')
+
+    async def get_speed_ramping(self):
+        """
+        Returns the acceleration and deacceleration as set by
+        :func:`Set Speed Ramping`.
+        """
+        await self.check_validity()
+
+        return GetSpeedRamping(*await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_SPEED_RAMPING, (), '', 12, BrickSilentStepper.CODEC_GET_SPEED_RAMPING_RESPONSE))
+
+    async def full_brake(self):
+        """
+        Executes an active full brake.
+
+        .. warning::
+         This function is for emergency purposes,
+         where an immediate brake is necessary. Depending on the current velocity and
+         the strength of the motor, a full brake can be quite violent.
+
+        Call :func:`Stop` if you just want to stop the motor.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_FULL_BRAKE, (), '', 0, '')
+
+    async def set_current_position(self, position):
+        """
+        Sets the current steps of the internal step counter. This can be used to
+        set the current position to 0 when some kind of starting position
+        is reached (e.g. when a CNC machine reaches a corner).
+        """
+        await self.check_validity()
+
+        position = int(position)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_CURRENT_POSITION, (position,), BrickSilentStepper.CODEC_SET_CURRENT_POSITION_REQUEST, 0, '')
+
+    async def get_current_position(self):
+        """
+        Returns the current position of the stepper motor in steps. On startup
+        the position is 0. The steps are counted with all possible driving
+        functions (:func:`Set Target Position`, :func:`Set Steps`, :func:`Drive Forward` or
+        :func:`Drive Backward`). It also is possible to reset the steps to 0 or
+        set them to any other desired value with :func:`Set Current Position`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_CURRENT_POSITION, (), '', 12, BrickSilentStepper.CODEC_GET_CURRENT_POSITION_RESPONSE)
+
+    async def set_target_position(self, position):
+        """
+        Sets the target position of the stepper motor in steps. For example,
+        if the current position of the motor is 500 and :func:`Set Target Position` is
+        called with 1000, the stepper motor will drive 500 steps forward. It will
+        use the velocity, acceleration and deacceleration as set by
+        :func:`Set Max Velocity` and :func:`Set Speed Ramping`.
+
+        A call of :func:`Set Target Position` with the parameter *x* is equivalent to
+        a call of :func:`Set Steps` with the parameter
+        (*x* - :func:`Get Current Position`).
+        """
+        await self.check_validity()
+
+        position = int(position)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_TARGET_POSITION, (position,), BrickSilentStepper.CODEC_SET_TARGET_POSITION_REQUEST, 0, '')
+
+    async def get_target_position(self):
+        """
+        Returns the last target position as set by :func:`Set Target Position`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_TARGET_POSITION, (), '', 12, BrickSilentStepper.CODEC_GET_TARGET_POSITION_RESPONSE)
+
+    async def set_steps(self, steps):
+        """
+        Sets the number of steps the stepper motor should run. Positive values
+        will drive the motor forward and negative values backward.
+        The velocity, acceleration and deacceleration as set by
+        :func:`Set Max Velocity` and :func:`Set Speed Ramping` will be used.
+        """
+        await self.check_validity()
+
+        steps = int(steps)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_STEPS, (steps,), BrickSilentStepper.CODEC_SET_STEPS_REQUEST, 0, '')
+
+    async def get_steps(self):
+        """
+        Returns the last steps as set by :func:`Set Steps`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_STEPS, (), '', 12, BrickSilentStepper.CODEC_GET_STEPS_RESPONSE)
+
+    async def get_remaining_steps(self):
+        """
+        Returns the remaining steps of the last call of :func:`Set Steps`.
+        For example, if :func:`Set Steps` is called with 2000 and
+        :func:`Get Remaining Steps` is called after the motor has run for 500 steps,
+        it will return 1500.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_REMAINING_STEPS, (), '', 12, BrickSilentStepper.CODEC_GET_REMAINING_STEPS_RESPONSE)
+
+    async def set_step_configuration(self, step_resolution, interpolation):
+        """
+        Sets the step resolution from full-step up to 1/256-step.
+
+        If interpolation is turned on, the Silent Stepper Brick will always interpolate
+        your step inputs as 1/256-step. If you use full-step mode with interpolation, each
+        step will generate 256 1/256 steps.
+
+        For maximum torque use full-step without interpolation. For maximum resolution use
+        1/256-step. Turn interpolation on to make the Stepper driving less noisy.
+
+        If you often change the speed with high acceleration you should turn the
+        interpolation off.
+        """
+        await self.check_validity()
+
+        step_resolution = int(step_resolution)
+        interpolation = bool(interpolation)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_STEP_CONFIGURATION, (step_resolution, interpolation), BrickSilentStepper.CODEC_SET_STEP_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_step_configuration(self):
+        """
+        Returns the step mode as set by :func:`Set Step Configuration`.
+        """
+        await self.check_validity()
+
+        return GetStepConfiguration(*await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_STEP_CONFIGURATION, (), '', 10, BrickSilentStepper.CODEC_GET_STEP_CONFIGURATION_RESPONSE))
+
+    async def drive_forward(self):
+        """
+        Drives the stepper motor forward until :func:`Drive Backward` or
+        :func:`Stop` is called. The velocity, acceleration and deacceleration as
+        set by :func:`Set Max Velocity` and :func:`Set Speed Ramping` will be used.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_DRIVE_FORWARD, (), '', 0, '')
+
+    async def drive_backward(self):
+        """
+        Drives the stepper motor backward until :func:`Drive Forward` or
+        :func:`Stop` is triggered. The velocity, acceleration and deacceleration as
+        set by :func:`Set Max Velocity` and :func:`Set Speed Ramping` will be used.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_DRIVE_BACKWARD, (), '', 0, '')
+
+    async def stop(self):
+        """
+        Stops the stepper motor with the deacceleration as set by
+        :func:`Set Speed Ramping`.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_STOP, (), '', 0, '')
+
+    async def get_stack_input_voltage(self):
+        """
+        Returns the stack input voltage. The stack input voltage is the
+        voltage that is supplied via the stack, i.e. it is given by a
+        Step-Down or Step-Up Power Supply.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_STACK_INPUT_VOLTAGE, (), '', 10, BrickSilentStepper.CODEC_GET_STACK_INPUT_VOLTAGE_RESPONSE)
+
+    async def get_external_input_voltage(self):
+        """
+        Returns the external input voltage. The external input voltage is
+        given via the black power input connector on the Silent Stepper Brick.
+
+        If there is an external input voltage and a stack input voltage, the motor
+        will be driven by the external input voltage. If there is only a stack
+        voltage present, the motor will be driven by this voltage.
+
+        .. warning::
+         This means, if you have a high stack voltage and a low external voltage,
+         the motor will be driven with the low external voltage. If you then remove
+         the external connection, it will immediately be driven by the high
+         stack voltage
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE, (), '', 10, BrickSilentStepper.CODEC_GET_EXTERNAL_INPUT_VOLTAGE_RESPONSE)
+
+    async def set_motor_current(self, current):
+        """
+        Sets the current with which the motor will be driven.
+
+        .. warning::
+         Do not set this value above the specifications of your stepper motor.
+         Otherwise it may damage your motor.
+        """
+        await self.check_validity()
+
+        current = int(current)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_MOTOR_CURRENT, (current,), BrickSilentStepper.CODEC_SET_MOTOR_CURRENT_REQUEST, 0, '')
+
+    async def get_motor_current(self):
+        """
+        Returns the current as set by :func:`Set Motor Current`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_MOTOR_CURRENT, (), '', 10, BrickSilentStepper.CODEC_GET_MOTOR_CURRENT_RESPONSE)
+
+    async def enable(self):
+        """
+        Enables the driver chip. The driver parameters can be configured (maximum velocity,
+        acceleration, etc) before it is enabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_ENABLE, (), '', 0, '')
+
+    async def disable(self):
+        """
+        Disables the driver chip. The configurations are kept (maximum velocity,
+        acceleration, etc) but the motor is not driven until it is enabled again.
+
+        .. warning::
+         Disabling the driver chip while the motor is still turning can damage the
+         driver chip. The motor should be stopped calling :func:`Stop` function
+         before disabling the motor power. The :func:`Stop` function will **not**
+         wait until the motor is actually stopped. You have to explicitly wait for the
+         appropriate time after calling the :func:`Stop` function before calling
+         the :func:`Disable` function.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_DISABLE, (), '', 0, '')
+
+    async def is_enabled(self):
+        """
+        Returns *true* if the driver chip is enabled, *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_IS_ENABLED, (), '', 9, BrickSilentStepper.CODEC_IS_ENABLED_RESPONSE)
+
+    async def set_basic_configuration(self, standstill_current, motor_run_current, standstill_delay_time, power_down_time, stealth_threshold, coolstep_threshold, classic_threshold, high_velocity_chopper_mode):
+        """
+        Sets the basic configuration parameters for the different modes (Stealth, Coolstep, Classic).
+
+        * Standstill Current: This value can be used to lower the current during stand still. This might
+          be reasonable to reduce the heating of the motor and the Brick. When the motor is in standstill
+          the configured motor phase current will be driven until the configured
+          Power Down Time is elapsed. After that the phase current will be reduced to the standstill
+          current. The elapsed time for this reduction can be configured with the Standstill Delay Time.
+          The maximum allowed value is the configured maximum motor current
+          (see :func:`Set Motor Current`).
+
+        * Motor Run Current: The value sets the motor current when the motor is running.
+          Use a value of at least one half of the global maximum motor current for a good
+          microstep performance. The maximum allowed value is the current
+          motor current. The API maps the entered value to 1/32 ... 32/32 of the maximum
+          motor current. This value should be used to change the motor current during motor movement,
+          whereas the global maximum motor current should not be changed while the motor is moving
+          (see :func:`Set Motor Current`).
+
+        * Standstill Delay Time: Controls the duration for motor power down after a motion
+          as soon as standstill is detected and the Power Down Time is expired. A high Standstill Delay
+          Time results in a smooth transition that avoids motor jerk during power down.
+
+        * Power Down Time: Sets the delay time after a stand still.
+
+        * Stealth Threshold: Sets the upper threshold for Stealth mode.
+          If the velocity of the motor goes above this value, Stealth mode is turned
+          off. Otherwise it is turned on. In Stealth mode the torque declines with high speed.
+
+        * Coolstep Threshold: Sets the lower threshold for Coolstep mode.
+          The Coolstep Threshold needs to be above the Stealth Threshold.
+
+        * Classic Threshold: Sets the lower threshold for classic mode.
+          In classic mode the stepper becomes more noisy, but the torque is maximized.
+
+        * High Velocity Chopper Mode: If High Velocity Chopper Mode is enabled, the stepper control
+          is optimized to run the stepper motors at high velocities.
+
+        If you want to use all three thresholds make sure that
+        Stealth Threshold < Coolstep Threshold < Classic Threshold.
+        """
+        await self.check_validity()
+
+        standstill_current = int(standstill_current)
+        motor_run_current = int(motor_run_current)
+        standstill_delay_time = int(standstill_delay_time)
+        power_down_time = int(power_down_time)
+        stealth_threshold = int(stealth_threshold)
+        coolstep_threshold = int(coolstep_threshold)
+        classic_threshold = int(classic_threshold)
+        high_velocity_chopper_mode = bool(high_velocity_chopper_mode)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_BASIC_CONFIGURATION, (standstill_current, motor_run_current, standstill_delay_time, power_down_time, stealth_threshold, coolstep_threshold, classic_threshold, high_velocity_chopper_mode), BrickSilentStepper.CODEC_SET_BASIC_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_basic_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Basic Configuration`.
+        """
+        await self.check_validity()
+
+        return GetBasicConfiguration(*await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_BASIC_CONFIGURATION, (), '', 23, BrickSilentStepper.CODEC_GET_BASIC_CONFIGURATION_RESPONSE))
+
+    async def set_spreadcycle_configuration(self, slow_decay_duration, enable_random_slow_decay, fast_decay_duration, hysteresis_start_value, hysteresis_end_value, sine_wave_offset, chopper_mode, comparator_blank_time, fast_decay_without_comparator):
+        """
+        Note: If you don't know what any of this means you can very likely keep all of
+        the values as default!
+
+        Sets the Spreadcycle configuration parameters. Spreadcycle is a chopper algorithm which actively
+        controls the motor current flow. More information can be found in the TMC2130 datasheet on page
+        47 (7 spreadCycle and Classic Chopper).
+
+        * Slow Decay Duration: Controls duration of off time setting of slow decay phase.
+          0 = driver disabled, all bridges off. Use 1 only with Comparator Blank time >= 2.
+
+        * Enable Random Slow Decay: Set to false to fix chopper off time as set by Slow Decay Duration.
+          If you set it to true, Decay Duration is randomly modulated.
+
+        * Fast Decay Duration: Sets the fast decay duration. This parameters is
+          only used if the Chopper Mode is set to Fast Decay.
+
+        * Hysteresis Start Value: Sets the hysteresis start value. This parameter is
+          only used if the Chopper Mode is set to Spread Cycle.
+
+        * Hysteresis End Value: Sets the hysteresis end value. This parameter is
+          only used if the Chopper Mode is set to Spread Cycle.
+
+        * Sine Wave Offset: Sets the sine wave offset. This parameters is
+          only used if the Chopper Mode is set to Fast Decay. 1/512 of the value becomes added to the absolute
+          value of the sine wave.
+
+        * Chopper Mode: 0 = Spread Cycle, 1 = Fast Decay.
+
+        * Comparator Blank Time: Sets the blank time of the comparator. Available values are
+
+          * 0 = 16 clocks,
+          * 1 = 24 clocks,
+          * 2 = 36 clocks and
+          * 3 = 54 clocks.
+
+          A value of 1 or 2 is recommended for most applications.
+
+        * Fast Decay Without Comparator: If set to true the current comparator usage for termination of the
+          fast decay cycle is disabled.
+        """
+        await self.check_validity()
+
+        slow_decay_duration = int(slow_decay_duration)
+        enable_random_slow_decay = bool(enable_random_slow_decay)
+        fast_decay_duration = int(fast_decay_duration)
+        hysteresis_start_value = int(hysteresis_start_value)
+        hysteresis_end_value = int(hysteresis_end_value)
+        sine_wave_offset = int(sine_wave_offset)
+        chopper_mode = int(chopper_mode)
+        comparator_blank_time = int(comparator_blank_time)
+        fast_decay_without_comparator = bool(fast_decay_without_comparator)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_SPREADCYCLE_CONFIGURATION, (slow_decay_duration, enable_random_slow_decay, fast_decay_duration, hysteresis_start_value, hysteresis_end_value, sine_wave_offset, chopper_mode, comparator_blank_time, fast_decay_without_comparator), BrickSilentStepper.CODEC_SET_SPREADCYCLE_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_spreadcycle_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Basic Configuration`.
+        """
+        await self.check_validity()
+
+        return GetSpreadcycleConfiguration(*await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_SPREADCYCLE_CONFIGURATION, (), '', 17, BrickSilentStepper.CODEC_GET_SPREADCYCLE_CONFIGURATION_RESPONSE))
+
+    async def set_stealth_configuration(self, enable_stealth, amplitude, gradient, enable_autoscale, force_symmetric, freewheel_mode):
+        """
+        Note: If you don't know what any of this means you can very likely keep all of
+        the values as default!
+
+        Sets the configuration relevant for Stealth mode.
+
+        * Enable Stealth: If set to true the stealth mode is enabled, if set to false the
+          stealth mode is disabled, even if the speed is below the threshold set in :func:`Set Basic Configuration`.
+
+        * Amplitude: If autoscale is disabled, the PWM amplitude is scaled by this value. If autoscale is enabled,
+          this value defines the maximum PWM amplitude change per half wave.
+
+        * Gradient: If autoscale is disabled, the PWM gradient is scaled by this value. If autoscale is enabled,
+          this value defines the maximum PWM gradient. With autoscale a value above 64 is recommended,
+          otherwise the regulation might not be able to measure the current.
+
+        * Enable Autoscale: If set to true, automatic current control is used. Otherwise the user defined
+          amplitude and gradient are used.
+
+        * Force Symmetric: If true, A symmetric PWM cycle is enforced. Otherwise the PWM value may change within each
+          PWM cycle.
+
+        * Freewheel Mode: The freewheel mode defines the behavior in stand still if the Standstill Current
+          (see :func:`Set Basic Configuration`) is set to 0.
+        """
+        await self.check_validity()
+
+        enable_stealth = bool(enable_stealth)
+        amplitude = int(amplitude)
+        gradient = int(gradient)
+        enable_autoscale = bool(enable_autoscale)
+        force_symmetric = bool(force_symmetric)
+        freewheel_mode = int(freewheel_mode)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_STEALTH_CONFIGURATION, (enable_stealth, amplitude, gradient, enable_autoscale, force_symmetric, freewheel_mode), BrickSilentStepper.CODEC_SET_STEALTH_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_stealth_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Stealth Configuration`.
+        """
+        await self.check_validity()
+
+        return GetStealthConfiguration(*await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_STEALTH_CONFIGURATION, (), '', 14, BrickSilentStepper.CODEC_GET_STEALTH_CONFIGURATION_RESPONSE))
+
+    async def set_coolstep_configuration(self, minimum_stallguard_value, maximum_stallguard_value, current_up_step_width, current_down_step_width, minimum_current, stallguard_threshold_value, stallguard_mode):
+        """
+        Note: If you don't know what any of this means you can very likely keep all of
+        the values as default!
+
+        Sets the configuration relevant for Coolstep.
+
+        * Minimum Stallguard Value: If the Stallguard result falls below this value*32, the motor current
+          is increased to reduce motor load angle. A value of 0 turns Coolstep off.
+
+        * Maximum Stallguard Value: If the Stallguard result goes above
+          (Min Stallguard Value + Max Stallguard Value + 1) * 32, the motor current is decreased to save
+          energy.
+
+        * Current Up Step Width: Sets the up step increment per Stallguard value. The value range is 0-3,
+          corresponding to the increments 1, 2, 4 and 8.
+
+        * Current Down Step Width: Sets the down step decrement per Stallguard value. The value range is 0-3,
+          corresponding to the decrements 1, 2, 8 and 16.
+
+        * Minimum Current: Sets the minimum current for Coolstep current control. You can choose between
+          half and quarter of the run current.
+
+        * Stallguard Threshold Value: Sets the level for stall output (see :func:`Get Driver Status`).
+          A lower value gives a higher sensitivity. You have to find a suitable value for your
+          motor by trial and error, 0 works for most motors.
+
+        * Stallguard Mode: Set to 0 for standard resolution or 1 for filtered mode. In filtered mode the Stallguard
+          signal will be updated every four full-steps.
+        """
+        await self.check_validity()
+
+        minimum_stallguard_value = int(minimum_stallguard_value)
+        maximum_stallguard_value = int(maximum_stallguard_value)
+        current_up_step_width = int(current_up_step_width)
+        current_down_step_width = int(current_down_step_width)
+        minimum_current = int(minimum_current)
+        stallguard_threshold_value = int(stallguard_threshold_value)
+        stallguard_mode = int(stallguard_mode)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_COOLSTEP_CONFIGURATION, (minimum_stallguard_value, maximum_stallguard_value, current_up_step_width, current_down_step_width, minimum_current, stallguard_threshold_value, stallguard_mode), BrickSilentStepper.CODEC_SET_COOLSTEP_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_coolstep_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Coolstep Configuration`.
+        """
+        await self.check_validity()
+
+        return GetCoolstepConfiguration(*await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_COOLSTEP_CONFIGURATION, (), '', 15, BrickSilentStepper.CODEC_GET_COOLSTEP_CONFIGURATION_RESPONSE))
+
+    async def set_misc_configuration(self, disable_short_to_ground_protection, synchronize_phase_frequency):
+        """
+        Note: If you don't know what any of this means you can very likely keep all of
+        the values as default!
+
+        Sets miscellaneous configuration parameters.
+
+        * Disable Short To Ground Protection: Set to false to enable short to ground protection, otherwise
+          it is disabled.
+
+        * Synchronize Phase Frequency: With this parameter you can synchronize the chopper for both phases
+          of a two phase motor to avoid the occurrence of a beat. The value range is 0-15. If set to 0,
+          the synchronization is turned off. Otherwise the synchronization is done through the formula
+          f_sync = f_clk/(value*64). In Classic Mode the synchronization is automatically switched off.
+          f_clk is 12.8MHz.
+        """
+        await self.check_validity()
+
+        disable_short_to_ground_protection = bool(disable_short_to_ground_protection)
+        synchronize_phase_frequency = int(synchronize_phase_frequency)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_MISC_CONFIGURATION, (disable_short_to_ground_protection, synchronize_phase_frequency), BrickSilentStepper.CODEC_SET_MISC_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_misc_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Misc Configuration`.
+        """
+        await self.check_validity()
+
+        return GetMiscConfiguration(*await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_MISC_CONFIGURATION, (), '', 10, BrickSilentStepper.CODEC_GET_MISC_CONFIGURATION_RESPONSE))
+
+    async def get_driver_status(self):
+        """
+        Returns the current driver status.
+
+        * Open Load: Indicates if an open load is present on phase A, B or both. This could mean that there is a problem
+          with the wiring of the motor. False detection can occur in fast motion as well as during stand still.
+
+        * Short To Ground: Indicates if a short to ground is present on phase A, B or both. If this is detected the driver
+          automatically becomes disabled and stays disabled until it is enabled again manually.
+
+        * Over Temperature: The over temperature indicator switches to "Warning" if the driver IC warms up. The warning flag
+          is expected during long duration stepper uses. If the temperature limit is reached the indicator switches
+          to "Limit". In this case the driver becomes disabled until it cools down again.
+
+        * Motor Stalled: Is true if a motor stall was detected.
+
+        * Actual Motor Current: Indicates the actual current control scaling as used in Coolstep mode.
+          It represents a multiplier of 1/32 to 32/32 of the
+          ``Motor Run Current`` as set by :func:`Set Basic Configuration`. Example: If a ``Motor Run Current``
+          of 1000mA was set and the returned value is 15, the ``Actual Motor Current`` is 16/32*1000mA = 500mA.
+
+        * Stallguard Result: Indicates the load of the motor. A lower value signals a higher load. Per trial and error
+          you can find out which value corresponds to a suitable torque for the velocity used in your application.
+          After that you can use this threshold value to find out if a motor stall becomes probable and react on it (e.g.
+          decrease velocity).
+          During stand still this value can not be used for stall detection, it shows the chopper on-time for motor coil A.
+
+        * Stealth Voltage Amplitude: Shows the actual PWM scaling. In Stealth mode it can be used to detect motor load and
+          stall if autoscale is enabled (see :func:`Set Stealth Configuration`).
+        """
+        await self.check_validity()
+
+        return GetDriverStatus(*await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_DRIVER_STATUS, (), '', 16, BrickSilentStepper.CODEC_GET_DRIVER_STATUS_RESPONSE))
+
+    async def set_minimum_voltage(self, voltage):
+        """
+        Sets the minimum voltage, below which the :cb:`Under Voltage` callback
+        is triggered. The minimum possible value that works with the Silent Stepper
+        Brick is 8V.
+        You can use this function to detect the discharge of a battery that is used
+        to drive the stepper motor. If you have a fixed power supply, you likely do
+        not need this functionality.
+        """
+        await self.check_validity()
+
+        voltage = int(voltage)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_MINIMUM_VOLTAGE, (voltage,), BrickSilentStepper.CODEC_SET_MINIMUM_VOLTAGE_REQUEST, 0, '')
+
+    async def get_minimum_voltage(self):
+        """
+        Returns the minimum voltage as set by :func:`Set Minimum Voltage`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_MINIMUM_VOLTAGE, (), '', 10, BrickSilentStepper.CODEC_GET_MINIMUM_VOLTAGE_RESPONSE)
+
+    async def set_time_base(self, time_base):
+        """
+        Sets the time base of the velocity and the acceleration of the Silent Stepper
+        Brick.
+
+        For example, if you want to make one step every 1.5 seconds, you can set
+        the time base to 15 and the velocity to 10. Now the velocity is
+        10steps/15s = 1steps/1.5s.
+        """
+        await self.check_validity()
+
+        time_base = int(time_base)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_TIME_BASE, (time_base,), BrickSilentStepper.CODEC_SET_TIME_BASE_REQUEST, 0, '')
+
+    async def get_time_base(self):
+        """
+        Returns the time base as set by :func:`Set Time Base`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_TIME_BASE, (), '', 12, BrickSilentStepper.CODEC_GET_TIME_BASE_RESPONSE)
+
+    async def get_all_data(self):
+        """
+        Returns the following parameters: The current velocity,
+        the current position, the remaining steps, the stack voltage, the external
+        voltage and the current consumption of the stepper motor.
+
+        The current consumption is calculated by multiplying the ``Actual Motor Current``
+        value (see :func:`Set Basic Configuration`) with the ``Motor Run Current``
+        (see :func:`Get Driver Status`). This is an internal calculation of the
+        driver, not an independent external measurement.
+
+        The current consumption calculation was broken up to firmware 2.0.1, it is fixed
+        since firmware 2.0.2.
+
+        There is also a callback for this function, see :cb:`All Data` callback.
+        """
+        await self.check_validity()
+
+        return GetAllData(*await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_ALL_DATA, (), '', 24, BrickSilentStepper.CODEC_GET_ALL_DATA_RESPONSE))
+
+    async def set_all_data_period(self, period):
+        """
+        Sets the period with which the :cb:`All Data` callback is triggered
+        periodically. A value of 0 turns the callback off.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_ALL_DATA_PERIOD, (period,), BrickSilentStepper.CODEC_SET_ALL_DATA_PERIOD_REQUEST, 0, '')
+
+    async def get_all_data_period(self):
+        """
+        Returns the period as set by :func:`Set All Data Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_ALL_DATA_PERIOD, (), '', 12, BrickSilentStepper.CODEC_GET_ALL_DATA_PERIOD_RESPONSE)
+
+    async def set_spitfp_baudrate_config(self, enable_dynamic_baudrate, minimum_dynamic_baudrate):
+        """
+        The SPITF protocol can be used with a dynamic baudrate. If the dynamic baudrate is
+        enabled, the Brick will try to adapt the baudrate for the communication
+        between Bricks and Bricklets according to the amount of data that is transferred.
+
+        The baudrate will be increased exponentially if lots of data is sent/received and
+        decreased linearly if little data is sent/received.
+
+        This lowers the baudrate in applications where little data is transferred (e.g.
+        a weather station) and increases the robustness. If there is lots of data to transfer
+        (e.g. Thermal Imaging Bricklet) it automatically increases the baudrate as needed.
+
+        In cases where some data has to transferred as fast as possible every few seconds
+        (e.g. RS485 Bricklet with a high baudrate but small payload) you may want to turn
+        the dynamic baudrate off to get the highest possible performance.
+
+        The maximum value of the baudrate can be set per port with the function
+        :func:`Set SPITFP Baudrate`. If the dynamic baudrate is disabled, the baudrate
+        as set by :func:`Set SPITFP Baudrate` will be used statically.
+
+        .. versionadded:: 2.0.4$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        enable_dynamic_baudrate = bool(enable_dynamic_baudrate)
+        minimum_dynamic_baudrate = int(minimum_dynamic_baudrate)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_SPITFP_BAUDRATE_CONFIG, (enable_dynamic_baudrate, minimum_dynamic_baudrate), BrickSilentStepper.CODEC_SET_SPITFP_BAUDRATE_CONFIG_REQUEST, 0, '')
+
+    async def get_spitfp_baudrate_config(self):
+        """
+        Returns the baudrate config, see :func:`Set SPITFP Baudrate Config`.
+
+        .. versionadded:: 2.0.4$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        return GetSPITFPBaudrateConfig(*await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_SPITFP_BAUDRATE_CONFIG, (), '', 13, BrickSilentStepper.CODEC_GET_SPITFP_BAUDRATE_CONFIG_RESPONSE))
+
+    async def get_send_timeout_count(self, communication_method):
+        """
+        Returns the timeout count for the different communication methods.
+
+        The methods 0-2 are available for all Bricks, 3-7 only for Master Bricks.
+
+        This function is mostly used for debugging during development, in normal operation
+        the counters should nearly always stay at 0.
+        """
+        await self.check_validity()
+
+        communication_method = int(communication_method)
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_SEND_TIMEOUT_COUNT, (communication_method,), BrickSilentStepper.CODEC_GET_SEND_TIMEOUT_COUNT_REQUEST, 12, BrickSilentStepper.CODEC_GET_SEND_TIMEOUT_COUNT_RESPONSE)
+
+    async def set_spitfp_baudrate(self, bricklet_port, baudrate):
+        """
+        Sets the baudrate for a specific Bricklet port.
+
+        If you want to increase the throughput of Bricklets you can increase
+        the baudrate. If you get a high error count because of high
+        interference (see :func:`Get SPITFP Error Count`) you can decrease the
+        baudrate.
+
+        If the dynamic baudrate feature is enabled, the baudrate set by this
+        function corresponds to the maximum baudrate (see :func:`Set SPITFP Baudrate Config`).
+
+        Regulatory testing is done with the default baudrate. If CE compatibility
+        or similar is necessary in your applications we recommend to not change
+        the baudrate.
+        """
+        await self.check_validity()
+
+        bricklet_port = create_char(bricklet_port)
+        baudrate = int(baudrate)
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_SET_SPITFP_BAUDRATE, (bricklet_port, baudrate), BrickSilentStepper.CODEC_SET_SPITFP_BAUDRATE_REQUEST, 0, '')
+
+    async def get_spitfp_baudrate(self, bricklet_port):
+        """
+        Returns the baudrate for a given Bricklet port, see :func:`Set SPITFP Baudrate`.
+        """
+        await self.check_validity()
+
+        bricklet_port = create_char(bricklet_port)
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_SPITFP_BAUDRATE, (bricklet_port,), BrickSilentStepper.CODEC_GET_SPITFP_BAUDRATE_REQUEST, 12, BrickSilentStepper.CODEC_GET_SPITFP_BAUDRATE_RESPONSE)
+
+    async def get_spitfp_error_count(self, bricklet_port):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Brick side. All
+        Bricklets have a similar function that returns the errors on the Bricklet side.
+        """
+        await self.check_validity()
+
+        bricklet_port = create_char(bricklet_port)
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_SPITFP_ERROR_COUNT, (bricklet_port,), BrickSilentStepper.CODEC_GET_SPITFP_ERROR_COUNT_REQUEST, 24, BrickSilentStepper.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def enable_status_led(self):
+        """
+        Enables the status LED.
+
+        The status LED is the blue LED next to the USB connector. If enabled is is
+        on and it flickers if data is transfered. If disabled it is always off.
+
+        The default state is enabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_ENABLE_STATUS_LED, (), '', 0, '')
+
+    async def disable_status_led(self):
+        """
+        Disables the status LED.
+
+        The status LED is the blue LED next to the USB connector. If enabled is is
+        on and it flickers if data is transfered. If disabled it is always off.
+
+        The default state is enabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_DISABLE_STATUS_LED, (), '', 0, '')
+
+    async def is_status_led_enabled(self):
+        """
+        Returns *true* if the status LED is enabled, *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_IS_STATUS_LED_ENABLED, (), '', 9, BrickSilentStepper.CODEC_IS_STATUS_LED_ENABLED_RESPONSE)
+
+    async def get_protocol1_bricklet_name(self, port):
+        """
+        Returns the firmware and protocol version and the name of the Bricklet for a
+        given port.
+
+        This functions sole purpose is to allow automatic flashing of v1.x.y Bricklet
+        plugins.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+
+        return GetProtocol1BrickletName(*await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, (port,), BrickSilentStepper.CODEC_GET_PROTOCOL1_BRICKLET_NAME_REQUEST, 52, BrickSilentStepper.CODEC_GET_PROTOCOL1_BRICKLET_NAME_RESPONSE))
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has an
+        accuracy of ±15%. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickSilentStepper.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Brick. Calling this function
+        on a Brick inside of a stack will reset the whole stack.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_bricklet_plugin(self, port, offset, chunk):
+        """
+        Writes 32 bytes of firmware to the bricklet attached at the given port.
+        The bytes are written to the position offset * 32.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+        offset = int(offset)
+        chunk = list(map(int, chunk))
+
+        await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_WRITE_BRICKLET_PLUGIN, (port, offset, chunk), BrickSilentStepper.CODEC_WRITE_BRICKLET_PLUGIN_REQUEST, 0, '')
+
+    async def read_bricklet_plugin(self, port, offset):
+        """
+        Reads 32 bytes of firmware from the bricklet attached at the given port.
+        The bytes are read starting at the position offset * 32.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+        offset = int(offset)
+
+        return await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_READ_BRICKLET_PLUGIN, (port, offset), BrickSilentStepper.CODEC_READ_BRICKLET_PLUGIN_REQUEST, 40, BrickSilentStepper.CODEC_READ_BRICKLET_PLUGIN_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Brick is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position is the position in the stack from '0' (bottom) to '8' (top).
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickSilentStepper.FUNCTION_GET_IDENTITY, (), '', 33, BrickSilentStepper.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,719 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .brick_stepper import BrickStepper, GetSpeedRamping, GetAllData, GetSPITFPBaudrateConfig, GetSPITFPErrorCount, GetProtocol1BrickletName, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from brick_stepper import BrickStepper, GetSpeedRamping, GetAllData, GetSPITFPBaudrateConfig, GetSPITFPErrorCount, GetProtocol1BrickletName, GetIdentity
+
+class BrickStepperAsync(AsyncDevice, BrickStepper):
+    """
+    Drives one bipolar stepper motor with up to 38V and 2.5A per phase
+
+    asyncio variant of BrickStepper for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_max_velocity(self, velocity):
+        """
+        Sets the maximum velocity of the stepper motor.
+        This function does *not* start the motor, it merely sets the maximum
+        velocity the stepper motor is accelerated to. To get the motor running use
+        either :func:`Set Target Position`, :func:`Set Steps`, :func:`Drive Forward` or
+        :func:`Drive Backward`.
+        """
+        await self.check_validity()
+
+        velocity = int(velocity)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_MAX_VELOCITY, (velocity,), BrickStepper.CODEC_SET_MAX_VELOCITY_REQUEST, 0, '')
+
+    async def get_max_velocity(self):
+        """
+        Returns the velocity as set by :func:`Set Max Velocity`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_MAX_VELOCITY, (), '', 10, BrickStepper.CODEC_GET_MAX_VELOCITY_RESPONSE)
+
+    async def get_current_velocity(self):
+        """
+        Returns the *current* velocity of the stepper motor.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_CURRENT_VELOCITY, (), '', 10, BrickStepper.CODEC_GET_CURRENT_VELOCITY_RESPONSE)
+
+    async def set_speed_ramping(self, acceleration, deacceleration):
+        """
+        Sets the acceleration and deacceleration of the stepper motor.
+        An acceleration of 1000 means, that
+        every second the velocity is increased by 1000 *steps/s*.
+
+        For example: If the current velocity is 0 and you want to accelerate to a
+        velocity of 8000 *steps/s* in 10 seconds, you should set an acceleration
+        of 800 *steps/s²*.
+
+        An acceleration/deacceleration of 0 means instantaneous
+        acceleration/deacceleration (not recommended)
+        """
+        await self.check_validity()
+
+        acceleration = int(acceleration)
+        deacceleration = int(deacceleration)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_SPEED_RAMPING, (acceleration, deacceleration), BrickStepper.CODEC_SET_SPEED_RAMPING_REQUEST, 0, '')
+
+    async def get_speed_ramping(self):
+        """
+        Returns the acceleration and deacceleration as set by
+        :func:`Set Speed Ramping`.
+        """
+        await self.check_validity()
+
+        return GetSpeedRamping(*await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_SPEED_RAMPING, (), '', 12, BrickStepper.CODEC_GET_SPEED_RAMPING_RESPONSE))
+
+    async def full_brake(self):
+        """
+        Executes an active full brake.
+
+        .. warning::
+         This function is for emergency purposes,
+         where an immediate brake is necessary. Depending on the current velocity and
+         the strength of the motor, a full brake can be quite violent.
+
+        Call :func:`Stop` if you just want to stop the motor.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_FULL_BRAKE, (), '', 0, '')
+
+    async def set_current_position(self, position):
+        """
+        Sets the current steps of the internal step counter. This can be used to
+        set the current position to 0 when some kind of starting position
+        is reached (e.g. when a CNC machine reaches a corner).
+        """
+        await self.check_validity()
+
+        position = int(position)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_CURRENT_POSITION, (position,), BrickStepper.CODEC_SET_CURRENT_POSITION_REQUEST, 0, '')
+
+    async def get_current_position(self):
+        """
+        Returns the current position of the stepper motor in steps. On startup
+        the position is 0. The steps are counted with all possible driving
+        functions (:func:`Set Target Position`, :func:`Set Steps`, :func:`Drive Forward` or
+        :func:`Drive Backward`). It also is possible to reset the steps to 0 or
+        set them to any other desired value with :func:`Set Current Position`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_CURRENT_POSITION, (), '', 12, BrickStepper.CODEC_GET_CURRENT_POSITION_RESPONSE)
+
+    async def set_target_position(self, position):
+        """
+        Sets the target position of the stepper motor in steps. For example,
+        if the current position of the motor is 500 and :func:`Set Target Position` is
+        called with 1000, the stepper motor will drive 500 steps forward. It will
+        use the velocity, acceleration and deacceleration as set by
+        :func:`Set Max Velocity` and :func:`Set Speed Ramping`.
+
+        A call of :func:`Set Target Position` with the parameter *x* is equivalent to
+        a call of :func:`Set Steps` with the parameter
+        (*x* - :func:`Get Current Position`).
+        """
+        await self.check_validity()
+
+        position = int(position)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_TARGET_POSITION, (position,), BrickStepper.CODEC_SET_TARGET_POSITION_REQUEST, 0, '')
+
+    async def get_target_position(self):
+        """
+        Returns the last target position as set by :func:`Set Target Position`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_TARGET_POSITION, (), '', 12, BrickStepper.CODEC_GET_TARGET_POSITION_RESPONSE)
+
+    async def set_steps(self, steps):
+        """
+        Sets the number of steps the stepper motor should run. Positive values
+        will drive the motor forward and negative values backward.
+        The velocity, acceleration and deacceleration as set by
+        :func:`Set Max Velocity` and :func:`Set Speed Ramping` will be used.
+        """
+        await self.check_validity()
+
+        steps = int(steps)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_STEPS, (steps,), BrickStepper.CODEC_SET_STEPS_REQUEST, 0, '')
+
+    async def get_steps(self):
+        """
+        Returns the last steps as set by :func:`Set Steps`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_STEPS, (), '', 12, BrickStepper.CODEC_GET_STEPS_RESPONSE)
+
+    async def get_remaining_steps(self):
+        """
+        Returns the remaining steps of the last call of :func:`Set Steps`.
+        For example, if :func:`Set Steps` is called with 2000 and
+        :func:`Get Remaining Steps` is called after the motor has run for 500 steps,
+        it will return 1500.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_REMAINING_STEPS, (), '', 12, BrickStepper.CODEC_GET_REMAINING_STEPS_RESPONSE)
+
+    async def set_step_mode(self, mode):
+        """
+        Sets the step mode of the stepper motor. Possible values are:
+
+        * Full Step = 1
+        * Half Step = 2
+        * Quarter Step = 4
+        * Eighth Step = 8
+
+        A higher value will increase the resolution and
+        decrease the torque of the stepper motor.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_STEP_MODE, (mode,), BrickStepper.CODEC_SET_STEP_MODE_REQUEST, 0, '')
+
+    async def get_step_mode(self):
+        """
+        Returns the step mode as set by :func:`Set Step Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_STEP_MODE, (), '', 9, BrickStepper.CODEC_GET_STEP_MODE_RESPONSE)
+
+    async def drive_forward(self):
+        """
+        Drives the stepper motor forward until :func:`Drive Backward` or
+        :func:`Stop` is called. The velocity, acceleration and deacceleration as
+        set by :func:`Set Max Velocity` and :func:`Set Speed Ramping` will be used.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_DRIVE_FORWARD, (), '', 0, '')
+
+    async def drive_backward(self):
+        """
+        Drives the stepper motor backward until :func:`Drive Forward` or
+        :func:`Stop` is triggered. The velocity, acceleration and deacceleration as
+        set by :func:`Set Max Velocity` and :func:`Set Speed Ramping` will be used.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_DRIVE_BACKWARD, (), '', 0, '')
+
+    async def stop(self):
+        """
+        Stops the stepper motor with the deacceleration as set by
+        :func:`Set Speed Ramping`.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_STOP, (), '', 0, '')
+
+    async def get_stack_input_voltage(self):
+        """
+        Returns the stack input voltage. The stack input voltage is the
+        voltage that is supplied via the stack, i.e. it is given by a
+        Step-Down or Step-Up Power Supply.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_STACK_INPUT_VOLTAGE, (), '', 10, BrickStepper.CODEC_GET_STACK_INPUT_VOLTAGE_RESPONSE)
+
+    async def get_external_input_voltage(self):
+        """
+        Returns the external input voltage. The external input voltage is
+        given via the black power input connector on the Stepper Brick.
+
+        If there is an external input voltage and a stack input voltage, the motor
+        will be driven by the external input voltage. If there is only a stack
+        voltage present, the motor will be driven by this voltage.
+
+        .. warning::
+         This means, if you have a high stack voltage and a low external voltage,
+         the motor will be driven with the low external voltage. If you then remove
+         the external connection, it will immediately be driven by the high
+         stack voltage
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE, (), '', 10, BrickStepper.CODEC_GET_EXTERNAL_INPUT_VOLTAGE_RESPONSE)
+
+    async def get_current_consumption(self):
+        """
+        Returns the current consumption of the motor.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_CURRENT_CONSUMPTION, (), '', 10, BrickStepper.CODEC_GET_CURRENT_CONSUMPTION_RESPONSE)
+
+    async def set_motor_current(self, current):
+        """
+        Sets the current with which the motor will be driven.
+
+        .. warning::
+         Do not set this value above the specifications of your stepper motor.
+         Otherwise it may damage your motor.
+        """
+        await self.check_validity()
+
+        current = int(current)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_MOTOR_CURRENT, (current,), BrickStepper.CODEC_SET_MOTOR_CURRENT_REQUEST, 0, '')
+
+    async def get_motor_current(self):
+        """
+        Returns the current as set by :func:`Set Motor Current`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_MOTOR_CURRENT, (), '', 10, BrickStepper.CODEC_GET_MOTOR_CURRENT_RESPONSE)
+
+    async def enable(self):
+        """
+        Enables the driver chip. The driver parameters can be configured (maximum velocity,
+        acceleration, etc) before it is enabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_ENABLE, (), '', 0, '')
+
+    async def disable(self):
+        """
+        Disables the driver chip. The configurations are kept (maximum velocity,
+        acceleration, etc) but the motor is not driven until it is enabled again.
+
+        .. warning::
+         Disabling the driver chip while the motor is still turning can damage the
+         driver chip. The motor should be stopped calling :func:`Stop` function
+         before disabling the motor power. The :func:`Stop` function will **not**
+         wait until the motor is actually stopped. You have to explicitly wait for the
+         appropriate time after calling the :func:`Stop` function before calling
+         the :func:`Disable` function.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_DISABLE, (), '', 0, '')
+
+    async def is_enabled(self):
+        """
+        Returns *true* if the driver chip is enabled, *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_IS_ENABLED, (), '', 9, BrickStepper.CODEC_IS_ENABLED_RESPONSE)
+
+    async def set_decay(self, decay):
+        """
+        Sets the decay mode of the stepper motor.
+        A value of 0 sets the fast decay mode, a value of
+        65535 sets the slow decay mode and a value in between sets the mixed
+        decay mode.
+
+        Changing the decay mode is only possible if synchronous rectification
+        is enabled (see :func:`Set Sync Rect`).
+
+        For a good explanation of the different decay modes see
+        `this <https://ebldc.com/?p=86/>`__ blog post by Avayan.
+
+        A good decay mode is unfortunately different for every motor. The best
+        way to work out a good decay mode for your stepper motor, if you can't
+        measure the current with an oscilloscope, is to listen to the sound of
+        the motor. If the value is too low, you often hear a high pitched
+        sound and if it is too high you can often hear a humming sound.
+
+        Generally, fast decay mode (small value) will be noisier but also
+        allow higher motor speeds.
+
+        .. note::
+         There is unfortunately no formula to calculate a perfect decay
+         mode for a given stepper motor. If you have problems with loud noises
+         or the maximum motor speed is too slow, you should try to tinker with
+         the decay value
+        """
+        await self.check_validity()
+
+        decay = int(decay)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_DECAY, (decay,), BrickStepper.CODEC_SET_DECAY_REQUEST, 0, '')
+
+    async def get_decay(self):
+        """
+        Returns the decay mode as set by :func:`Set Decay`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_DECAY, (), '', 10, BrickStepper.CODEC_GET_DECAY_RESPONSE)
+
+    async def set_minimum_voltage(self, voltage):
+        """
+        Sets the minimum voltage, below which the :cb:`Under Voltage` callback
+        is triggered. The minimum possible value that works with the Stepper Brick is 8V.
+        You can use this function to detect the discharge of a battery that is used
+        to drive the stepper motor. If you have a fixed power supply, you likely do
+        not need this functionality.
+        """
+        await self.check_validity()
+
+        voltage = int(voltage)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_MINIMUM_VOLTAGE, (voltage,), BrickStepper.CODEC_SET_MINIMUM_VOLTAGE_REQUEST, 0, '')
+
+    async def get_minimum_voltage(self):
+        """
+        Returns the minimum voltage as set by :func:`Set Minimum Voltage`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_MINIMUM_VOLTAGE, (), '', 10, BrickStepper.CODEC_GET_MINIMUM_VOLTAGE_RESPONSE)
+
+    async def set_sync_rect(self, sync_rect):
+        """
+        Turns synchronous rectification on or off (*true* or *false*).
+
+        With synchronous rectification on, the decay can be changed
+        (see :func:`Set Decay`). Without synchronous rectification fast
+        decay is used.
+
+        For an explanation of synchronous rectification see
+        `here <https://en.wikipedia.org/wiki/Active_rectification>`__.
+
+        .. warning::
+         If you want to use high speeds (> 10000 steps/s) for a large
+         stepper motor with a large inductivity we strongly
+         suggest that you disable synchronous rectification. Otherwise the
+         Brick may not be able to cope with the load and overheat.
+        """
+        await self.check_validity()
+
+        sync_rect = bool(sync_rect)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_SYNC_RECT, (sync_rect,), BrickStepper.CODEC_SET_SYNC_RECT_REQUEST, 0, '')
+
+    async def is_sync_rect(self):
+        """
+        Returns *true* if synchronous rectification is enabled, *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_IS_SYNC_RECT, (), '', 9, BrickStepper.CODEC_IS_SYNC_RECT_RESPONSE)
+
+    async def set_time_base(self, time_base):
+        """
+        Sets the time base of the velocity and the acceleration of the stepper brick.
+
+        For example, if you want to make one step every 1.5 seconds, you can set
+        the time base to 15 and the velocity to 10. Now the velocity is
+        10steps/15s = 1steps/1.5s.
+        """
+        await self.check_validity()
+
+        time_base = int(time_base)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_TIME_BASE, (time_base,), BrickStepper.CODEC_SET_TIME_BASE_REQUEST, 0, '')
+
+    async def get_time_base(self):
+        """
+        Returns the time base as set by :func:`Set Time Base`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_TIME_BASE, (), '', 12, BrickStepper.CODEC_GET_TIME_BASE_RESPONSE)
+
+    async def get_all_data(self):
+        """
+        Returns the following parameters: The current velocity,
+        the current position, the remaining steps, the stack voltage, the external
+        voltage and the current consumption of the stepper motor.
+
+        There is also a callback for this function, see :cb:`All Data` callback.
+        """
+        await self.check_validity()
+
+        return GetAllData(*await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_ALL_DATA, (), '', 24, BrickStepper.CODEC_GET_ALL_DATA_RESPONSE))
+
+    async def set_all_data_period(self, period):
+        """
+        Sets the period with which the :cb:`All Data` callback is triggered
+        periodically. A value of 0 turns the callback off.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_ALL_DATA_PERIOD, (period,), BrickStepper.CODEC_SET_ALL_DATA_PERIOD_REQUEST, 0, '')
+
+    async def get_all_data_period(self):
+        """
+        Returns the period as set by :func:`Set All Data Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_ALL_DATA_PERIOD, (), '', 12, BrickStepper.CODEC_GET_ALL_DATA_PERIOD_RESPONSE)
+
+    async def set_spitfp_baudrate_config(self, enable_dynamic_baudrate, minimum_dynamic_baudrate):
+        """
+        The SPITF protocol can be used with a dynamic baudrate. If the dynamic baudrate is
+        enabled, the Brick will try to adapt the baudrate for the communication
+        between Bricks and Bricklets according to the amount of data that is transferred.
+
+        The baudrate will be increased exponentially if lots of data is sent/received and
+        decreased linearly if little data is sent/received.
+
+        This lowers the baudrate in applications where little data is transferred (e.g.
+        a weather station) and increases the robustness. If there is lots of data to transfer
+        (e.g. Thermal Imaging Bricklet) it automatically increases the baudrate as needed.
+
+        In cases where some data has to transferred as fast as possible every few seconds
+        (e.g. RS485 Bricklet with a high baudrate but small payload) you may want to turn
+        the dynamic baudrate off to get the highest possible performance.
+
+        The maximum value of the baudrate can be set per port with the function
+        :func:`Set SPITFP Baudrate`. If the dynamic baudrate is disabled, the baudrate
+        as set by :func:`Set SPITFP Baudrate` will be used statically.
+
+        .. versionadded:: 2.3.6$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        enable_dynamic_baudrate = bool(enable_dynamic_baudrate)
+        minimum_dynamic_baudrate = int(minimum_dynamic_baudrate)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_SPITFP_BAUDRATE_CONFIG, (enable_dynamic_baudrate, minimum_dynamic_baudrate), BrickStepper.CODEC_SET_SPITFP_BAUDRATE_CONFIG_REQUEST, 0, '')
+
+    async def get_spitfp_baudrate_config(self):
+        """
+        Returns the baudrate config, see :func:`Set SPITFP Baudrate Config`.
+
+        .. versionadded:: 2.3.6$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        return GetSPITFPBaudrateConfig(*await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_SPITFP_BAUDRATE_CONFIG, (), '', 13, BrickStepper.CODEC_GET_SPITFP_BAUDRATE_CONFIG_RESPONSE))
+
+    async def get_send_timeout_count(self, communication_method):
+        """
+        Returns the timeout count for the different communication methods.
+
+        The methods 0-2 are available for all Bricks, 3-7 only for Master Bricks.
+
+        This function is mostly used for debugging during development, in normal operation
+        the counters should nearly always stay at 0.
+
+        .. versionadded:: 2.3.4$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        communication_method = int(communication_method)
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_SEND_TIMEOUT_COUNT, (communication_method,), BrickStepper.CODEC_GET_SEND_TIMEOUT_COUNT_REQUEST, 12, BrickStepper.CODEC_GET_SEND_TIMEOUT_COUNT_RESPONSE)
+
+    async def set_spitfp_baudrate(self, bricklet_port, baudrate):
+        """
+        Sets the baudrate for a specific Bricklet port.
+
+        If you want to increase the throughput of Bricklets you can increase
+        the baudrate. If you get a high error count because of high
+        interference (see :func:`Get SPITFP Error Count`) you can decrease the
+        baudrate.
+
+        If the dynamic baudrate feature is enabled, the baudrate set by this
+        function corresponds to the maximum baudrate (see :func:`Set SPITFP Baudrate Config`).
+
+        Regulatory testing is done with the default baudrate. If CE compatibility
+        or similar is necessary in your applications we recommend to not change
+        the baudrate.
+
+        .. versionadded:: 2.3.3$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        bricklet_port = create_char(bricklet_port)
+        baudrate = int(baudrate)
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_SET_SPITFP_BAUDRATE, (bricklet_port, baudrate), BrickStepper.CODEC_SET_SPITFP_BAUDRATE_REQUEST, 0, '')
+
+    async def get_spitfp_baudrate(self, bricklet_port):
+        """
+        Returns the baudrate for a given Bricklet port, see :func:`Set SPITFP Baudrate`.
+
+        .. versionadded:: 2.3.3$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        bricklet_port = create_char(bricklet_port)
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_SPITFP_BAUDRATE, (bricklet_port,), BrickStepper.CODEC_GET_SPITFP_BAUDRATE_REQUEST, 12, BrickStepper.CODEC_GET_SPITFP_BAUDRATE_RESPONSE)
+
+    async def get_spitfp_error_count(self, bricklet_port):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Brick side. All
+        Bricklets have a similar function that returns the errors on the Bricklet side.
+
+        .. versionadded:: 2.3.3$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        bricklet_port = create_char(bricklet_port)
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_SPITFP_ERROR_COUNT, (bricklet_port,), BrickStepper.CODEC_GET_SPITFP_ERROR_COUNT_REQUEST, 24, BrickStepper.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def enable_status_led(self):
+        """
+        Enables the status LED.
+
+        The status LED is the blue LED next to the USB connector. If enabled is is
+        on and it flickers if data is transfered. If disabled it is always off.
+
+        The default state is enabled.
+
+        .. versionadded:: 2.3.1$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_ENABLE_STATUS_LED, (), '', 0, '')
+
+    async def disable_status_led(self):
+        """
+        Disables the status LED.
+
+        The status LED is the blue LED next to the USB connector. If enabled is is
+        on and it flickers if data is transfered. If disabled it is always off.
+
+        The default state is enabled.
+
+        .. versionadded:: 2.3.1$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_DISABLE_STATUS_LED, (), '', 0, '')
+
+    async def is_status_led_enabled(self):
+        """
+        Returns *true* if the status LED is enabled, *false* otherwise.
+
+        .. versionadded:: 2.3.1$nbsp;(Firmware)
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_IS_STATUS_LED_ENABLED, (), '', 9, BrickStepper.CODEC_IS_STATUS_LED_ENABLED_RESPONSE)
+
+    async def get_protocol1_bricklet_name(self, port):
+        """
+        Returns the firmware and protocol version and the name of the Bricklet for a
+        given port.
+
+        This functions sole purpose is to allow automatic flashing of v1.x.y Bricklet
+        plugins.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+
+        return GetProtocol1BrickletName(*await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, (port,), BrickStepper.CODEC_GET_PROTOCOL1_BRICKLET_NAME_REQUEST, 52, BrickStepper.CODEC_GET_PROTOCOL1_BRICKLET_NAME_RESPONSE))
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has an
+        accuracy of ±15%. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickStepper.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Brick. Calling this function
+        on a Brick inside of a stack will reset the whole stack.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_bricklet_plugin(self, port, offset, chunk):
+        """
+        Writes 32 bytes of firmware to the bricklet attached at the given port.
+        The bytes are written to the position offset * 32.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+        offset = int(offset)
+        chunk = list(map(int, chunk))
+
+        await self.ipcon.send_request(self, BrickStepper.FUNCTION_WRITE_BRICKLET_PLUGIN, (port, offset, chunk), BrickStepper.CODEC_WRITE_BRICKLET_PLUGIN_REQUEST, 0, '')
+
+    async def read_bricklet_plugin(self, port, offset):
+        """
+        Reads 32 bytes of firmware from the bricklet attached at the given port.
+        The bytes are read starting at the position offset * 32.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+        offset = int(offset)
+
+        return await self.ipcon.send_request(self, BrickStepper.FUNCTION_READ_BRICKLET_PLUGIN, (port, offset), BrickStepper.CODEC_READ_BRICKLET_PLUGIN_REQUEST, 40, BrickStepper.CODEC_READ_BRICKLET_PLUGIN_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Brick is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position is the position in the stack from '0' (bottom) to '8' (top).
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickStepper.FUNCTION_GET_IDENTITY, (), '', 33, BrickStepper.CODEC_GET_IDENTITY_RESPONSE))
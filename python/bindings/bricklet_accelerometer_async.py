@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_accelerometer import BrickletAccelerometer, GetAcceleration, GetAccelerationCallbackThreshold, GetConfiguration, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_accelerometer import BrickletAccelerometer, GetAcceleration, GetAccelerationCallbackThreshold, GetConfiguration, GetIdentity
+
+class BrickletAccelerometerAsync(AsyncDevice, BrickletAccelerometer):
+    """
+    Measures acceleration in three axis
+
+    asyncio variant of BrickletAccelerometer for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_acceleration(self):
+        """
+        Returns the acceleration in x, y and z direction. The values
+        are given in gₙ/1000 (1gₙ = 9.80665m/s²). The range is
+        configured with :func:`Set Configuration`.
+
+        If you want to get the acceleration periodically, it is recommended
+        to use the :cb:`Acceleration` callback and set the period with
+        :func:`Set Acceleration Callback Period`.
+        """
+        await self.check_validity()
+
+        return GetAcceleration(*await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_GET_ACCELERATION, (), '', 14, BrickletAccelerometer.CODEC_GET_ACCELERATION_RESPONSE))
+
+    async def set_acceleration_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Acceleration` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Acceleration` callback is only triggered if the acceleration has
+        changed since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_SET_ACCELERATION_CALLBACK_PERIOD, (period,), BrickletAccelerometer.CODEC_SET_ACCELERATION_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_acceleration_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Acceleration Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_GET_ACCELERATION_CALLBACK_PERIOD, (), '', 12, BrickletAccelerometer.CODEC_GET_ACCELERATION_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_acceleration_callback_threshold(self, option, min_x, max_x, min_y, max_y, min_z, max_z):
+        """
+        Sets the thresholds for the :cb:`Acceleration Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the acceleration is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the acceleration is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the acceleration is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the acceleration is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min_x = int(min_x)
+        max_x = int(max_x)
+        min_y = int(min_y)
+        max_y = int(max_y)
+        min_z = int(min_z)
+        max_z = int(max_z)
+
+        await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_SET_ACCELERATION_CALLBACK_THRESHOLD, (option, min_x, max_x, min_y, max_y, min_z, max_z), BrickletAccelerometer.CODEC_SET_ACCELERATION_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_acceleration_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Acceleration Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetAccelerationCallbackThreshold(*await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_GET_ACCELERATION_CALLBACK_THRESHOLD, (), '', 21, BrickletAccelerometer.CODEC_GET_ACCELERATION_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callback
+
+        * :cb:`Acceleration Reached`
+
+        is triggered, if the threshold
+
+        * :func:`Set Acceleration Callback Threshold`
+
+        keeps being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletAccelerometer.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletAccelerometer.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def get_temperature(self):
+        """
+        Returns the temperature of the accelerometer.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_GET_TEMPERATURE, (), '', 10, BrickletAccelerometer.CODEC_GET_TEMPERATURE_RESPONSE)
+
+    async def set_configuration(self, data_rate, full_scale, filter_bandwidth):
+        """
+        Configures the data rate, full scale range and filter bandwidth.
+        Possible values are:
+
+        * Data rate of 0Hz to 1600Hz.
+        * Full scale range of ±2gₙ up to ±16gₙ.
+        * Filter bandwidth between 50Hz and 800Hz.
+
+        Decreasing data rate or full scale range will also decrease the noise on
+        the data.
+        """
+        await self.check_validity()
+
+        data_rate = int(data_rate)
+        full_scale = int(full_scale)
+        filter_bandwidth = int(filter_bandwidth)
+
+        await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_SET_CONFIGURATION, (data_rate, full_scale, filter_bandwidth), BrickletAccelerometer.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        return GetConfiguration(*await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_GET_CONFIGURATION, (), '', 11, BrickletAccelerometer.CODEC_GET_CONFIGURATION_RESPONSE))
+
+    async def led_on(self):
+        """
+        Enables the LED on the Bricklet.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_LED_ON, (), '', 0, '')
+
+    async def led_off(self):
+        """
+        Disables the LED on the Bricklet.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_LED_OFF, (), '', 0, '')
+
+    async def is_led_on(self):
+        """
+        Returns *true* if the LED is enabled, *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_IS_LED_ON, (), '', 9, BrickletAccelerometer.CODEC_IS_LED_ON_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletAccelerometer.FUNCTION_GET_IDENTITY, (), '', 33, BrickletAccelerometer.CODEC_GET_IDENTITY_RESPONSE))
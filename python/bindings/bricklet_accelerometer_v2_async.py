@@ -0,0 +1,379 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_accelerometer_v2 import BrickletAccelerometerV2, GetAcceleration, GetConfiguration, GetAccelerationCallbackConfiguration, GetContinuousAccelerationConfiguration, GetFilterConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_accelerometer_v2 import BrickletAccelerometerV2, GetAcceleration, GetConfiguration, GetAccelerationCallbackConfiguration, GetContinuousAccelerationConfiguration, GetFilterConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletAccelerometerV2Async(AsyncDevice, BrickletAccelerometerV2):
+    """
+    Measures acceleration in three axis
+
+    asyncio variant of BrickletAccelerometerV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_acceleration(self):
+        """
+        Returns the acceleration in x, y and z direction. The values
+        are given in gₙ/10000 (1gₙ = 9.80665m/s²). The range is
+        configured with :func:`Set Configuration`.
+
+        If you want to get the acceleration periodically, it is recommended
+        to use the :cb:`Acceleration` callback and set the period with
+        :func:`Set Acceleration Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAcceleration(*await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_GET_ACCELERATION, (), '', 20, BrickletAccelerometerV2.CODEC_GET_ACCELERATION_RESPONSE))
+
+    async def set_configuration(self, data_rate, full_scale):
+        """
+        Configures the data rate and full scale range.
+        Possible values are:
+
+        * Data rate of 0.781Hz to 25600Hz.
+        * Full scale range of ±2g up to ±8g.
+
+        Decreasing data rate or full scale range will also decrease the noise on
+        the data.
+        """
+        await self.check_validity()
+
+        data_rate = int(data_rate)
+        full_scale = int(full_scale)
+
+        await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_SET_CONFIGURATION, (data_rate, full_scale), BrickletAccelerometerV2.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        return GetConfiguration(*await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_GET_CONFIGURATION, (), '', 10, BrickletAccelerometerV2.CODEC_GET_CONFIGURATION_RESPONSE))
+
+    async def set_acceleration_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`Acceleration`
+        callback is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        If this callback is enabled, the :cb:`Continuous Acceleration 16 Bit` callback
+        and :cb:`Continuous Acceleration 8 Bit` callback will automatically be disabled.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletAccelerometerV2.CODEC_SET_ACCELERATION_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_acceleration_callback_configuration(self):
+        """
+        Returns the callback configuration as set by
+        :func:`Set Acceleration Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAccelerationCallbackConfiguration(*await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION, (), '', 13, BrickletAccelerometerV2.CODEC_GET_ACCELERATION_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_info_led_config(self, config):
+        """
+        Configures the info LED (marked as "Force" on the Bricklet) to be either turned off,
+        turned on, or blink in heartbeat mode.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_SET_INFO_LED_CONFIG, (config,), BrickletAccelerometerV2.CODEC_SET_INFO_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_info_led_config(self):
+        """
+        Returns the LED configuration as set by :func:`Set Info LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_GET_INFO_LED_CONFIG, (), '', 9, BrickletAccelerometerV2.CODEC_GET_INFO_LED_CONFIG_RESPONSE)
+
+    async def set_continuous_acceleration_configuration(self, enable_x, enable_y, enable_z, resolution):
+        """
+        For high throughput of acceleration data (> 1000Hz) you have to use the
+        :cb:`Continuous Acceleration 16 Bit` or :cb:`Continuous Acceleration 8 Bit`
+        callbacks.
+
+        You can enable the callback for each axis (x, y, z) individually and choose a
+        resolution of 8 bit or 16 bit.
+
+        If at least one of the axis is enabled and the resolution is set to 8 bit,
+        the :cb:`Continuous Acceleration 8 Bit` callback is activated. If at least
+        one of the axis is enabled and the resolution is set to 16 bit,
+        the :cb:`Continuous Acceleration 16 Bit` callback is activated.
+
+        The returned values are raw ADC data. If you want to put this data into
+        a FFT to determine the occurrences of specific frequencies we recommend
+        that you use the data as is. It has all of the ADC noise in it. This noise
+        looks like pure noise at first glance, but it might still have some frequnecy
+        information in it that can be utilized by the FFT.
+
+        Otherwise you have to use the following formulas that depend on the configured
+        resolution (8/16 bit) and the full scale range (see :func:`Set Configuration`) to calculate
+        the data in gₙ/10000 (same unit that is returned by :func:`Get Acceleration`):
+
+        * 16 bit, full scale 2g: acceleration = value * 625 / 1024
+        * 16 bit, full scale 4g: acceleration = value * 1250 / 1024
+        * 16 bit, full scale 8g: acceleration = value * 2500 / 1024
+
+        If a resolution of 8 bit is used, only the 8 most significant bits will be
+        transferred, so you can use the following formulas:
+
+        * 8 bit, full scale 2g: acceleration = value * 256 * 625 / 1024
+        * 8 bit, full scale 4g: acceleration = value * 256 * 1250 / 1024
+        * 8 bit, full scale 8g: acceleration = value * 256 * 2500 / 1024
+
+        If no axis is enabled, both callbacks are disabled. If one of the continuous
+        callbacks is enabled, the :cb:`Acceleration` callback is disabled.
+
+        The maximum throughput depends on the exact configuration:
+
+        .. csv-table::
+         :header: "Number of axis enabled", "Throughput 8 bit", "Throughout 16 bit"
+         :widths: 20, 20, 20
+
+         "1", "25600Hz", "25600Hz"
+         "2", "25600Hz", "15000Hz"
+         "3", "20000Hz", "10000Hz"
+        """
+        await self.check_validity()
+
+        enable_x = bool(enable_x)
+        enable_y = bool(enable_y)
+        enable_z = bool(enable_z)
+        resolution = int(resolution)
+
+        await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_SET_CONTINUOUS_ACCELERATION_CONFIGURATION, (enable_x, enable_y, enable_z, resolution), BrickletAccelerometerV2.CODEC_SET_CONTINUOUS_ACCELERATION_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_continuous_acceleration_configuration(self):
+        """
+        Returns the continuous acceleration configuration as set by
+        :func:`Set Continuous Acceleration Configuration`.
+        """
+        await self.check_validity()
+
+        return GetContinuousAccelerationConfiguration(*await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_GET_CONTINUOUS_ACCELERATION_CONFIGURATION, (), '', 12, BrickletAccelerometerV2.CODEC_GET_CONTINUOUS_ACCELERATION_CONFIGURATION_RESPONSE))
+
+    async def set_filter_configuration(self, iir_bypass, low_pass_filter):
+        """
+        Configures IIR Bypass filter mode and low pass filter roll off corner frequency.
+
+        The filter can be applied or bypassed and the corner frequency can be
+        half or a ninth of the output data rate.
+
+        .. image:: /Images/Bricklets/bricklet_accelerometer_v2_filter.png
+           :scale: 100 %
+           :alt: Accelerometer filter
+           :align: center
+           :target: ../../_images/Bricklets/bricklet_accelerometer_v2_filter.png
+
+        .. versionadded:: 2.0.2$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        iir_bypass = int(iir_bypass)
+        low_pass_filter = int(low_pass_filter)
+
+        await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_SET_FILTER_CONFIGURATION, (iir_bypass, low_pass_filter), BrickletAccelerometerV2.CODEC_SET_FILTER_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_filter_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Filter Configuration`.
+
+        .. versionadded:: 2.0.2$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return GetFilterConfiguration(*await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_GET_FILTER_CONFIGURATION, (), '', 10, BrickletAccelerometerV2.CODEC_GET_FILTER_CONFIGURATION_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletAccelerometerV2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletAccelerometerV2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletAccelerometerV2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletAccelerometerV2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletAccelerometerV2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletAccelerometerV2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletAccelerometerV2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletAccelerometerV2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletAccelerometerV2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletAccelerometerV2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_WRITE_UID, (uid,), BrickletAccelerometerV2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_READ_UID, (), '', 12, BrickletAccelerometerV2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletAccelerometerV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletAccelerometerV2.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,555 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_air_quality import BrickletAirQuality, GetAllValues, GetAllValuesCallbackConfiguration, GetIAQIndex, GetIAQIndexCallbackConfiguration, GetTemperatureCallbackConfiguration, GetHumidityCallbackConfiguration, GetAirPressureCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_air_quality import BrickletAirQuality, GetAllValues, GetAllValuesCallbackConfiguration, GetIAQIndex, GetIAQIndexCallbackConfiguration, GetTemperatureCallbackConfiguration, GetHumidityCallbackConfiguration, GetAirPressureCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletAirQualityAsync(AsyncDevice, BrickletAirQuality):
+    """
+    Measures IAQ index, temperature, humidity and air pressure
+
+    asyncio variant of BrickletAirQuality for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_all_values(self):
+        """
+        Returns all values measured by the Air Quality Bricklet. The values are
+        IAQ (Indoor Air Quality) Index (higher value means greater level of air pollution), IAQ Index Accuracy, Temperature, Humidity and
+        Air Pressure.
+
+        .. image:: /Images/Misc/bricklet_air_quality_iaq_index.png
+           :scale: 100 %
+           :alt: Air Quality Index description
+           :align: center
+           :target: ../../_images/Misc/bricklet_air_quality_iaq_index.png
+        """
+        await self.check_validity()
+
+        return GetAllValues(*await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_ALL_VALUES, (), '', 25, BrickletAirQuality.CODEC_GET_ALL_VALUES_RESPONSE))
+
+    async def set_temperature_offset(self, offset):
+        """
+        Sets a temperature offset. A offset of 10 will decrease the measured temperature by 0.1 °C.
+
+        If you install this Bricklet into an enclosure and you want to measure the ambient
+        temperature, you may have to decrease the measured temperature by some value to
+        compensate for the error because of the heating inside of the enclosure.
+
+        We recommend that you leave the parts in the enclosure running for at least
+        24 hours such that a temperature equilibrium can be reached. After that you can measure
+        the temperature directly outside of enclosure and set the difference as offset.
+
+        This temperature offset is used to calculate the relative humidity and
+        IAQ index measurements. In case the Bricklet is installed in an enclosure, we
+        recommend to measure and set the temperature offset to improve the accuracy of
+        the measurements.
+        """
+        await self.check_validity()
+
+        offset = int(offset)
+
+        await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_SET_TEMPERATURE_OFFSET, (offset,), BrickletAirQuality.CODEC_SET_TEMPERATURE_OFFSET_REQUEST, 0, '')
+
+    async def get_temperature_offset(self):
+        """
+        Returns the temperature offset as set by
+        :func:`Set Temperature Offset`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_TEMPERATURE_OFFSET, (), '', 12, BrickletAirQuality.CODEC_GET_TEMPERATURE_OFFSET_RESPONSE)
+
+    async def set_all_values_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`All Values`
+        callback is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after at least one of the values has changed. If the values didn't
+        change within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_SET_ALL_VALUES_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletAirQuality.CODEC_SET_ALL_VALUES_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_all_values_callback_configuration(self):
+        """
+        Returns the callback configuration as set by
+        :func:`Set All Values Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAllValuesCallbackConfiguration(*await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_ALL_VALUES_CALLBACK_CONFIGURATION, (), '', 13, BrickletAirQuality.CODEC_GET_ALL_VALUES_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_iaq_index(self):
+        """
+        Returns the IAQ index and accuracy. The higher the IAQ index, the greater the level of air pollution.
+
+        .. image:: /Images/Misc/bricklet_air_quality_iaq_index.png
+           :scale: 100 %
+           :alt: IAQ index description
+           :align: center
+           :target: ../../_images/Misc/bricklet_air_quality_iaq_index.png
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`IAQ Index` callback. You can set the callback configuration
+        with :func:`Set IAQ Index Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetIAQIndex(*await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_IAQ_INDEX, (), '', 13, BrickletAirQuality.CODEC_GET_IAQ_INDEX_RESPONSE))
+
+    async def set_iaq_index_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`IAQ Index`
+        callback is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after at least one of the values has changed. If the values didn't
+        change within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_SET_IAQ_INDEX_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletAirQuality.CODEC_SET_IAQ_INDEX_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_iaq_index_callback_configuration(self):
+        """
+        Returns the callback configuration as set by
+        :func:`Set IAQ Index Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetIAQIndexCallbackConfiguration(*await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_IAQ_INDEX_CALLBACK_CONFIGURATION, (), '', 13, BrickletAirQuality.CODEC_GET_IAQ_INDEX_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_temperature(self):
+        """
+        Returns temperature.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`Temperature` callback. You can set the callback configuration
+        with :func:`Set Temperature Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_TEMPERATURE, (), '', 12, BrickletAirQuality.CODEC_GET_TEMPERATURE_RESPONSE)
+
+    async def set_temperature_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`Temperature` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`Temperature` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletAirQuality.CODEC_SET_TEMPERATURE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_temperature_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Temperature Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetTemperatureCallbackConfiguration(*await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION, (), '', 22, BrickletAirQuality.CODEC_GET_TEMPERATURE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_humidity(self):
+        """
+        Returns relative humidity.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`Humidity` callback. You can set the callback configuration
+        with :func:`Set Humidity Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_HUMIDITY, (), '', 12, BrickletAirQuality.CODEC_GET_HUMIDITY_RESPONSE)
+
+    async def set_humidity_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`Humidity` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`Humidity` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_SET_HUMIDITY_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletAirQuality.CODEC_SET_HUMIDITY_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_humidity_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Humidity Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetHumidityCallbackConfiguration(*await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_HUMIDITY_CALLBACK_CONFIGURATION, (), '', 22, BrickletAirQuality.CODEC_GET_HUMIDITY_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_air_pressure(self):
+        """
+        Returns air pressure.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`Air Pressure` callback. You can set the callback configuration
+        with :func:`Set Air Pressure Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_AIR_PRESSURE, (), '', 12, BrickletAirQuality.CODEC_GET_AIR_PRESSURE_RESPONSE)
+
+    async def set_air_pressure_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`Air Pressure` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`Air Pressure` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletAirQuality.CODEC_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_air_pressure_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Air Pressure Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAirPressureCallbackConfiguration(*await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION, (), '', 22, BrickletAirQuality.CODEC_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def remove_calibration(self):
+        """
+        Deletes the calibration from flash. After you call this function,
+        you need to power cycle the Air Quality Bricklet.
+
+        On the next power up the Bricklet will start a new calibration, as
+        if it was started for the very first time.
+
+        The calibration is based on the data of the last four days, so it takes
+        four days until a full calibration is re-established.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_REMOVE_CALIBRATION, (), '', 0, '')
+
+    async def set_background_calibration_duration(self, duration):
+        """
+        The Air Quality Bricklet uses an automatic background calibration mechanism to
+        calculate the IAQ Index. This calibration mechanism considers a history of
+        measured data. The duration of this history can be configured to either be
+        4 days or 28 days.
+
+        If you keep the Bricklet mostly at one place and it does not get moved around
+        to different environments, we recommend that you use a duration of 28 days.
+
+        If you change the duration, the current calibration will be discarded and
+        the calibration will start from beginning again. The configuration of the
+        duration is saved in flash, so you should only have to call this function
+        once in the lifetime of the Bricklet.
+
+        The Bricklet has to be power cycled after this function is called
+        for a duration change to take effect.
+
+        Before firmware version 2.0.3 this was not configurable and the duration was
+        4 days.
+
+        The default value (since firmware version 2.0.3) is 28 days.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        duration = int(duration)
+
+        await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_SET_BACKGROUND_CALIBRATION_DURATION, (duration,), BrickletAirQuality.CODEC_SET_BACKGROUND_CALIBRATION_DURATION_REQUEST, 0, '')
+
+    async def get_background_calibration_duration(self):
+        """
+        Returns the background calibration duration as set by
+        :func:`Set Background Calibration Duration`.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_BACKGROUND_CALIBRATION_DURATION, (), '', 9, BrickletAirQuality.CODEC_GET_BACKGROUND_CALIBRATION_DURATION_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletAirQuality.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletAirQuality.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletAirQuality.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletAirQuality.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletAirQuality.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_WRITE_FIRMWARE, (data,), BrickletAirQuality.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletAirQuality.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletAirQuality.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletAirQuality.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletAirQuality.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_WRITE_UID, (uid,), BrickletAirQuality.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_READ_UID, (), '', 12, BrickletAirQuality.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletAirQuality.FUNCTION_GET_IDENTITY, (), '', 33, BrickletAirQuality.CODEC_GET_IDENTITY_RESPONSE))
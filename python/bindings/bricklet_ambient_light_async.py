@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_ambient_light import BrickletAmbientLight, GetIlluminanceCallbackThreshold, GetAnalogValueCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_ambient_light import BrickletAmbientLight, GetIlluminanceCallbackThreshold, GetAnalogValueCallbackThreshold, GetIdentity
+
+class BrickletAmbientLightAsync(AsyncDevice, BrickletAmbientLight):
+    """
+    Measures ambient light up to 900lux
+
+    asyncio variant of BrickletAmbientLight for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_illuminance(self):
+        """
+        Returns the illuminance of the ambient light sensor.
+
+        If you want to get the illuminance periodically, it is recommended to use the
+        :cb:`Illuminance` callback and set the period with
+        :func:`Set Illuminance Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_ILLUMINANCE, (), '', 10, BrickletAmbientLight.CODEC_GET_ILLUMINANCE_RESPONSE)
+
+    async def get_analog_value(self):
+        """
+        Returns the value as read by a 12-bit analog-to-digital converter.
+
+        .. note::
+         The value returned by :func:`Get Illuminance` is averaged over several samples
+         to yield less noise, while :func:`Get Analog Value` gives back raw
+         unfiltered analog values. The only reason to use :func:`Get Analog Value` is,
+         if you need the full resolution of the analog-to-digital converter.
+
+         Also, the analog-to-digital converter covers three different ranges that are
+         set dynamically depending on the light intensity. It is impossible to
+         distinguish between these ranges with the analog value.
+
+        If you want the analog value periodically, it is recommended to use the
+        :cb:`Analog Value` callback and set the period with
+        :func:`Set Analog Value Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_ANALOG_VALUE, (), '', 10, BrickletAmbientLight.CODEC_GET_ANALOG_VALUE_RESPONSE)
+
+    async def set_illuminance_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Illuminance` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Illuminance` callback is only triggered if the illuminance has changed
+        since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_SET_ILLUMINANCE_CALLBACK_PERIOD, (period,), BrickletAmbientLight.CODEC_SET_ILLUMINANCE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_illuminance_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Illuminance Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_ILLUMINANCE_CALLBACK_PERIOD, (), '', 12, BrickletAmbientLight.CODEC_GET_ILLUMINANCE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_analog_value_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Analog Value` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Analog Value` callback is only triggered if the analog value has
+        changed since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD, (period,), BrickletAmbientLight.CODEC_SET_ANALOG_VALUE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_analog_value_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Analog Value Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD, (), '', 12, BrickletAmbientLight.CODEC_GET_ANALOG_VALUE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_illuminance_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Illuminance Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the illuminance is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the illuminance is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the illuminance is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the illuminance is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_SET_ILLUMINANCE_CALLBACK_THRESHOLD, (option, min, max), BrickletAmbientLight.CODEC_SET_ILLUMINANCE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_illuminance_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Illuminance Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetIlluminanceCallbackThreshold(*await self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_ILLUMINANCE_CALLBACK_THRESHOLD, (), '', 13, BrickletAmbientLight.CODEC_GET_ILLUMINANCE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_analog_value_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Analog Value Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the analog value is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the analog value is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the analog value is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the analog value is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD, (option, min, max), BrickletAmbientLight.CODEC_SET_ANALOG_VALUE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_analog_value_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Analog Value Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetAnalogValueCallbackThreshold(*await self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD, (), '', 13, BrickletAmbientLight.CODEC_GET_ANALOG_VALUE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callbacks
+
+        * :cb:`Illuminance Reached`,
+        * :cb:`Analog Value Reached`
+
+        are triggered, if the thresholds
+
+        * :func:`Set Illuminance Callback Threshold`,
+        * :func:`Set Analog Value Callback Threshold`
+
+        keep being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletAmbientLight.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletAmbientLight.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletAmbientLight.FUNCTION_GET_IDENTITY, (), '', 33, BrickletAmbientLight.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_ambient_light_v2 import BrickletAmbientLightV2, GetIlluminanceCallbackThreshold, GetConfiguration, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_ambient_light_v2 import BrickletAmbientLightV2, GetIlluminanceCallbackThreshold, GetConfiguration, GetIdentity
+
+class BrickletAmbientLightV2Async(AsyncDevice, BrickletAmbientLightV2):
+    """
+    Measures ambient light up to 64000lux
+
+    asyncio variant of BrickletAmbientLightV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_illuminance(self):
+        """
+        Returns the illuminance of the ambient light sensor. The measurement range goes
+        up to about 100000lux, but above 64000lux the precision starts to drop.
+
+        .. versionchanged:: 2.0.2$nbsp;(Plugin)
+          An illuminance of 0lux indicates an error condition where the sensor cannot
+          perform a reasonable measurement. This can happen with very dim or very bright
+          light conditions. In bright light conditions this might indicate that the sensor
+          is saturated and the configuration should be modified (:func:`Set Configuration`)
+          to better match the light conditions.
+
+        If you want to get the illuminance periodically, it is recommended to use the
+        :cb:`Illuminance` callback and set the period with
+        :func:`Set Illuminance Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAmbientLightV2.FUNCTION_GET_ILLUMINANCE, (), '', 12, BrickletAmbientLightV2.CODEC_GET_ILLUMINANCE_RESPONSE)
+
+    async def set_illuminance_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Illuminance` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Illuminance` callback is only triggered if the illuminance has changed
+        since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletAmbientLightV2.FUNCTION_SET_ILLUMINANCE_CALLBACK_PERIOD, (period,), BrickletAmbientLightV2.CODEC_SET_ILLUMINANCE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_illuminance_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Illuminance Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAmbientLightV2.FUNCTION_GET_ILLUMINANCE_CALLBACK_PERIOD, (), '', 12, BrickletAmbientLightV2.CODEC_GET_ILLUMINANCE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_illuminance_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Illuminance Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the illuminance is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the illuminance is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the illuminance is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the illuminance is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletAmbientLightV2.FUNCTION_SET_ILLUMINANCE_CALLBACK_THRESHOLD, (option, min, max), BrickletAmbientLightV2.CODEC_SET_ILLUMINANCE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_illuminance_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Illuminance Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetIlluminanceCallbackThreshold(*await self.ipcon.send_request(self, BrickletAmbientLightV2.FUNCTION_GET_ILLUMINANCE_CALLBACK_THRESHOLD, (), '', 17, BrickletAmbientLightV2.CODEC_GET_ILLUMINANCE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callbacks
+
+        * :cb:`Illuminance Reached`,
+
+        are triggered, if the thresholds
+
+        * :func:`Set Illuminance Callback Threshold`,
+
+        keep being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletAmbientLightV2.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletAmbientLightV2.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAmbientLightV2.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletAmbientLightV2.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_configuration(self, illuminance_range, integration_time):
+        """
+        Sets the configuration. It is possible to configure an illuminance range
+        between 0-600lux and 0-64000lux and an integration time between 50ms and 400ms.
+
+        .. versionadded:: 2.0.2$nbsp;(Plugin)
+          The unlimited illuminance range allows to measure up to about 100000lux, but
+          above 64000lux the precision starts to drop.
+
+        A smaller illuminance range increases the resolution of the data. A longer
+        integration time will result in less noise on the data.
+
+        .. versionchanged:: 2.0.2$nbsp;(Plugin)
+          If the actual measure illuminance is out-of-range then the current illuminance
+          range maximum +0.01lux is reported by :func:`Get Illuminance` and the
+          :cb:`Illuminance` callback. For example, 800001 for the 0-8000lux range.
+
+        .. versionchanged:: 2.0.2$nbsp;(Plugin)
+          With a long integration time the sensor might be saturated before the measured
+          value reaches the maximum of the selected illuminance range. In this case 0lux
+          is reported by :func:`Get Illuminance` and the :cb:`Illuminance` callback.
+
+        If the measurement is out-of-range or the sensor is saturated then you should
+        configure the next higher illuminance range. If the highest range is already
+        in use, then start to reduce the integration time.
+        """
+        await self.check_validity()
+
+        illuminance_range = int(illuminance_range)
+        integration_time = int(integration_time)
+
+        await self.ipcon.send_request(self, BrickletAmbientLightV2.FUNCTION_SET_CONFIGURATION, (illuminance_range, integration_time), BrickletAmbientLightV2.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        return GetConfiguration(*await self.ipcon.send_request(self, BrickletAmbientLightV2.FUNCTION_GET_CONFIGURATION, (), '', 10, BrickletAmbientLightV2.CODEC_GET_CONFIGURATION_RESPONSE))
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletAmbientLightV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletAmbientLightV2.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_ambient_light_v3 import BrickletAmbientLightV3, GetIlluminanceCallbackConfiguration, GetConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_ambient_light_v3 import BrickletAmbientLightV3, GetIlluminanceCallbackConfiguration, GetConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletAmbientLightV3Async(AsyncDevice, BrickletAmbientLightV3):
+    """
+    Measures ambient light up to 64000lux
+
+    asyncio variant of BrickletAmbientLightV3 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_illuminance(self):
+        """
+        Returns the illuminance of the ambient light sensor. The measurement range goes
+        up to about 100000lux, but above 64000lux the precision starts to drop.
+        The illuminance is given in lux/100, i.e. a value of 450000 means that an
+        illuminance of 4500lux is measured.
+
+        An illuminance of 0lux indicates an error condition where the sensor cannot
+        perform a reasonable measurement. This can happen with very dim or very bright
+        light conditions. In bright light conditions this might indicate that the sensor
+        is saturated and the configuration should be modified (:func:`Set Configuration`)
+        to better match the conditions.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`Illuminance` callback. You can set the callback configuration
+        with :func:`Set Illuminance Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_GET_ILLUMINANCE, (), '', 12, BrickletAmbientLightV3.CODEC_GET_ILLUMINANCE_RESPONSE)
+
+    async def set_illuminance_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`Illuminance` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`Illuminance` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_SET_ILLUMINANCE_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletAmbientLightV3.CODEC_SET_ILLUMINANCE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_illuminance_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Illuminance Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetIlluminanceCallbackConfiguration(*await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_GET_ILLUMINANCE_CALLBACK_CONFIGURATION, (), '', 22, BrickletAmbientLightV3.CODEC_GET_ILLUMINANCE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_configuration(self, illuminance_range, integration_time):
+        """
+        Sets the configuration. It is possible to configure an illuminance range
+        between 0-600lux and 0-64000lux and an integration time between 50ms and 400ms.
+
+        The unlimited illuminance range allows to measure up to about 100000lux, but
+        above 64000lux the precision starts to drop.
+
+        A smaller illuminance range increases the resolution of the data. A longer
+        integration time will result in less noise on the data.
+
+        If the actual measure illuminance is out-of-range then the current illuminance
+        range maximum +0.01lux is reported by :func:`Get Illuminance` and the
+        :cb:`Illuminance` callback. For example, 800001 for the 0-8000lux range.
+
+        With a long integration time the sensor might be saturated before the measured
+        value reaches the maximum of the selected illuminance range. In this case 0lux
+        is reported by :func:`Get Illuminance` and the :cb:`Illuminance` callback.
+
+        If the measurement is out-of-range or the sensor is saturated then you should
+        configure the next higher illuminance range. If the highest range is already
+        in use, then start to reduce the integration time.
+        """
+        await self.check_validity()
+
+        illuminance_range = int(illuminance_range)
+        integration_time = int(integration_time)
+
+        await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_SET_CONFIGURATION, (illuminance_range, integration_time), BrickletAmbientLightV3.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        return GetConfiguration(*await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_GET_CONFIGURATION, (), '', 10, BrickletAmbientLightV3.CODEC_GET_CONFIGURATION_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletAmbientLightV3.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletAmbientLightV3.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletAmbientLightV3.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletAmbientLightV3.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletAmbientLightV3.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_WRITE_FIRMWARE, (data,), BrickletAmbientLightV3.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletAmbientLightV3.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletAmbientLightV3.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletAmbientLightV3.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletAmbientLightV3.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_WRITE_UID, (uid,), BrickletAmbientLightV3.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_READ_UID, (), '', 12, BrickletAmbientLightV3.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletAmbientLightV3.FUNCTION_GET_IDENTITY, (), '', 33, BrickletAmbientLightV3.CODEC_GET_IDENTITY_RESPONSE))
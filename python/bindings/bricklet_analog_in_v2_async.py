@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_analog_in_v2 import BrickletAnalogInV2, GetVoltageCallbackThreshold, GetAnalogValueCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_analog_in_v2 import BrickletAnalogInV2, GetVoltageCallbackThreshold, GetAnalogValueCallbackThreshold, GetIdentity
+
+class BrickletAnalogInV2Async(AsyncDevice, BrickletAnalogInV2):
+    """
+    Measures DC voltage between 0V and 42V
+
+    asyncio variant of BrickletAnalogInV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_voltage(self):
+        """
+        Returns the measured voltage. The resolution is approximately 10mV.
+
+        If you want to get the voltage periodically, it is recommended to use the
+        :cb:`Voltage` callback and set the period with
+        :func:`Set Voltage Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_GET_VOLTAGE, (), '', 10, BrickletAnalogInV2.CODEC_GET_VOLTAGE_RESPONSE)
+
+    async def get_analog_value(self):
+        """
+        Returns the value as read by a 12-bit analog-to-digital converter.
+
+        If you want the analog value periodically, it is recommended to use the
+        :cb:`Analog Value` callback and set the period with
+        :func:`Set Analog Value Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_GET_ANALOG_VALUE, (), '', 10, BrickletAnalogInV2.CODEC_GET_ANALOG_VALUE_RESPONSE)
+
+    async def set_voltage_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Voltage` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Voltage` callback is only triggered if the voltage has changed since
+        the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_SET_VOLTAGE_CALLBACK_PERIOD, (period,), BrickletAnalogInV2.CODEC_SET_VOLTAGE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_voltage_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Voltage Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD, (), '', 12, BrickletAnalogInV2.CODEC_GET_VOLTAGE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_analog_value_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Analog Value` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Analog Value` callback is only triggered if the analog value has
+        changed since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD, (period,), BrickletAnalogInV2.CODEC_SET_ANALOG_VALUE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_analog_value_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Analog Value Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD, (), '', 12, BrickletAnalogInV2.CODEC_GET_ANALOG_VALUE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_voltage_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Voltage Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the voltage is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the voltage is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the voltage is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the voltage is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_SET_VOLTAGE_CALLBACK_THRESHOLD, (option, min, max), BrickletAnalogInV2.CODEC_SET_VOLTAGE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_voltage_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Voltage Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetVoltageCallbackThreshold(*await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD, (), '', 13, BrickletAnalogInV2.CODEC_GET_VOLTAGE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_analog_value_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Analog Value Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the analog value is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the analog value is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the analog value is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the analog value is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD, (option, min, max), BrickletAnalogInV2.CODEC_SET_ANALOG_VALUE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_analog_value_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Analog Value Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetAnalogValueCallbackThreshold(*await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD, (), '', 13, BrickletAnalogInV2.CODEC_GET_ANALOG_VALUE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callbacks
+
+        * :cb:`Voltage Reached`,
+        * :cb:`Analog Value Reached`
+
+        are triggered, if the thresholds
+
+        * :func:`Set Voltage Callback Threshold`,
+        * :func:`Set Analog Value Callback Threshold`
+
+        keep being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletAnalogInV2.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletAnalogInV2.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_moving_average(self, average):
+        """
+        Sets the length of a `moving averaging <https://en.wikipedia.org/wiki/Moving_average>`__
+        for the voltage.
+
+        Setting the length to 1 will turn the averaging off. With less
+        averaging, there is more noise on the data.
+        """
+        await self.check_validity()
+
+        average = int(average)
+
+        await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_SET_MOVING_AVERAGE, (average,), BrickletAnalogInV2.CODEC_SET_MOVING_AVERAGE_REQUEST, 0, '')
+
+    async def get_moving_average(self):
+        """
+        Returns the length of the moving average as set by :func:`Set Moving Average`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_GET_MOVING_AVERAGE, (), '', 9, BrickletAnalogInV2.CODEC_GET_MOVING_AVERAGE_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletAnalogInV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletAnalogInV2.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_analog_out import BrickletAnalogOut, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_analog_out import BrickletAnalogOut, GetIdentity
+
+class BrickletAnalogOutAsync(AsyncDevice, BrickletAnalogOut):
+    """
+    Generates configurable DC voltage between 0V and 5V
+
+    asyncio variant of BrickletAnalogOut for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_voltage(self, voltage):
+        """
+        Sets the voltage. Calling this function will set
+        the mode to 0 (see :func:`Set Mode`).
+        """
+        await self.check_validity()
+
+        voltage = int(voltage)
+
+        await self.ipcon.send_request(self, BrickletAnalogOut.FUNCTION_SET_VOLTAGE, (voltage,), BrickletAnalogOut.CODEC_SET_VOLTAGE_REQUEST, 0, '')
+
+    async def get_voltage(self):
+        """
+        Returns the voltage as set by :func:`Set Voltage`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAnalogOut.FUNCTION_GET_VOLTAGE, (), '', 10, BrickletAnalogOut.CODEC_GET_VOLTAGE_RESPONSE)
+
+    async def set_mode(self, mode):
+        """
+        Sets the mode of the analog value. Possible modes:
+
+        * 0: Normal Mode (Analog value as set by :func:`Set Voltage` is applied)
+        * 1: 1k Ohm resistor to ground
+        * 2: 100k Ohm resistor to ground
+        * 3: 500k Ohm resistor to ground
+
+        Setting the mode to 0 will result in an output voltage of 0 V. You can jump
+        to a higher output voltage directly by calling :func:`Set Voltage`.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        await self.ipcon.send_request(self, BrickletAnalogOut.FUNCTION_SET_MODE, (mode,), BrickletAnalogOut.CODEC_SET_MODE_REQUEST, 0, '')
+
+    async def get_mode(self):
+        """
+        Returns the mode as set by :func:`Set Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAnalogOut.FUNCTION_GET_MODE, (), '', 9, BrickletAnalogOut.CODEC_GET_MODE_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletAnalogOut.FUNCTION_GET_IDENTITY, (), '', 33, BrickletAnalogOut.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+from collections import namedtuple
+
+try:
+    from .ip_connection import Device, IPConnection, Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list, get_payload_codec
+except ValueError:
+    from ip_connection import Device, IPConnection, Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list, get_payload_codec
+
+GetIdentity = namedtuple('Identity', ['uid', 'connected_uid', 'position', 'hardware_version', 'firmware_version', 'device_identifier'])
+
+class BrickletAnalogOutV2(Device):
+    """
+    Generates configurable DC voltage between 0V and 12V
+    """
+
+    DEVICE_IDENTIFIER = 256
+    DEVICE_DISPLAY_NAME = 'Analog Out Bricklet 2.0'
+    DEVICE_URL_PART = 'analog_out_v2' # internal
+
+
+
+    FUNCTION_SET_OUTPUT_VOLTAGE = 1
+    FUNCTION_GET_OUTPUT_VOLTAGE = 2
+    FUNCTION_GET_INPUT_VOLTAGE = 3
+    FUNCTION_GET_IDENTITY = 255
+
+
+    CODEC_SET_OUTPUT_VOLTAGE_REQUEST = get_payload_codec('H') # internal
+    CODEC_GET_OUTPUT_VOLTAGE_RESPONSE = get_payload_codec('H') # internal
+    CODEC_GET_INPUT_VOLTAGE_RESPONSE = get_payload_codec('H') # internal
+    CODEC_GET_IDENTITY_RESPONSE = get_payload_codec('8s 8s c 3B 3B H') # internal
+
+    # internal, shared by all instances
+    RESPONSE_EXPECTED = Device.create_response_expected({
+        FUNCTION_SET_OUTPUT_VOLTAGE: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_OUTPUT_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_INPUT_VOLTAGE: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    })
+    CALLBACK_FORMATS = {}
+    HIGH_LEVEL_CALLBACKS = {}
+    STABLE_FUNCTIONS = frozenset([FUNCTION_GET_IDENTITY])
+    SIDE_EFFECT_FREE_FUNCTIONS = frozenset([FUNCTION_GET_OUTPUT_VOLTAGE, FUNCTION_GET_INPUT_VOLTAGE, FUNCTION_GET_IDENTITY])
+
+    __slots__ = ()
+
+    def __init__(self, uid, ipcon):
+        """
+        Creates an object with the unique device ID *uid* and adds it to
+        the IP Connection *ipcon*.
+        """
+        Device.__init__(self, uid, ipcon, BrickletAnalogOutV2.DEVICE_IDENTIFIER, BrickletAnalogOutV2.DEVICE_DISPLAY_NAME)
+
+        self.api_version = (2, 0, 0)
+
+        ipcon.add_device(self)
+
+    def set_output_voltage(self, voltage):
+        """
+        Sets the voltage.
+        """
+        self.check_validity()
+
+        voltage = int(voltage)
+
+        self.ipcon.send_request(self, BrickletAnalogOutV2.FUNCTION_SET_OUTPUT_VOLTAGE, (voltage,), BrickletAnalogOutV2.CODEC_SET_OUTPUT_VOLTAGE_REQUEST, 0, '')
+
+    def get_output_voltage(self):
+        """
+        Returns the voltage as set by :func:`Set Output Voltage`.
+        """
+        self.check_validity()
+
+        return self.ipcon.send_request(self, BrickletAnalogOutV2.FUNCTION_GET_OUTPUT_VOLTAGE, (), '', 10, BrickletAnalogOutV2.CODEC_GET_OUTPUT_VOLTAGE_RESPONSE)
+
+    def get_input_voltage(self):
+        """
+        Returns the input voltage.
+        """
+        self.check_validity()
+
+        return self.ipcon.send_request(self, BrickletAnalogOutV2.FUNCTION_GET_INPUT_VOLTAGE, (), '', 10, BrickletAnalogOutV2.CODEC_GET_INPUT_VOLTAGE_RESPONSE)
+
+    def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*self.ipcon.send_request(self, BrickletAnalogOutV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletAnalogOutV2.CODEC_GET_IDENTITY_RESPONSE))
+
+AnalogOutV2 = BrickletAnalogOutV2 # for backward compatibility
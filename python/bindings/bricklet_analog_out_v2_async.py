@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_analog_out_v2 import BrickletAnalogOutV2, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_analog_out_v2 import BrickletAnalogOutV2, GetIdentity
+
+class BrickletAnalogOutV2Async(AsyncDevice, BrickletAnalogOutV2):
+    """
+    Generates configurable DC voltage between 0V and 12V
+
+    asyncio variant of BrickletAnalogOutV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_output_voltage(self, voltage):
+        """
+        Sets the voltage.
+        """
+        await self.check_validity()
+
+        voltage = int(voltage)
+
+        await self.ipcon.send_request(self, BrickletAnalogOutV2.FUNCTION_SET_OUTPUT_VOLTAGE, (voltage,), BrickletAnalogOutV2.CODEC_SET_OUTPUT_VOLTAGE_REQUEST, 0, '')
+
+    async def get_output_voltage(self):
+        """
+        Returns the voltage as set by :func:`Set Output Voltage`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAnalogOutV2.FUNCTION_GET_OUTPUT_VOLTAGE, (), '', 10, BrickletAnalogOutV2.CODEC_GET_OUTPUT_VOLTAGE_RESPONSE)
+
+    async def get_input_voltage(self):
+        """
+        Returns the input voltage.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletAnalogOutV2.FUNCTION_GET_INPUT_VOLTAGE, (), '', 10, BrickletAnalogOutV2.CODEC_GET_INPUT_VOLTAGE_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletAnalogOutV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletAnalogOutV2.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_barometer import BrickletBarometer, GetAirPressureCallbackThreshold, GetAltitudeCallbackThreshold, GetAveraging, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_barometer import BrickletBarometer, GetAirPressureCallbackThreshold, GetAltitudeCallbackThreshold, GetAveraging, GetIdentity
+
+class BrickletBarometerAsync(AsyncDevice, BrickletBarometer):
+    """
+    Measures air pressure and altitude changes
+
+    asyncio variant of BrickletBarometer for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_air_pressure(self):
+        """
+        Returns the air pressure of the air pressure sensor.
+
+        If you want to get the air pressure periodically, it is recommended to use the
+        :cb:`Air Pressure` callback and set the period with
+        :func:`Set Air Pressure Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_AIR_PRESSURE, (), '', 12, BrickletBarometer.CODEC_GET_AIR_PRESSURE_RESPONSE)
+
+    async def get_altitude(self):
+        """
+        Returns the relative altitude of the air pressure sensor. The value is
+        calculated based on the difference between the current air pressure
+        and the reference air pressure that can be set with :func:`Set Reference Air Pressure`.
+
+        If you want to get the altitude periodically, it is recommended to use the
+        :cb:`Altitude` callback and set the period with
+        :func:`Set Altitude Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_ALTITUDE, (), '', 12, BrickletBarometer.CODEC_GET_ALTITUDE_RESPONSE)
+
+    async def set_air_pressure_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Air Pressure` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Air Pressure` callback is only triggered if the air pressure has
+        changed since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_SET_AIR_PRESSURE_CALLBACK_PERIOD, (period,), BrickletBarometer.CODEC_SET_AIR_PRESSURE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_air_pressure_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Air Pressure Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_AIR_PRESSURE_CALLBACK_PERIOD, (), '', 12, BrickletBarometer.CODEC_GET_AIR_PRESSURE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_altitude_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Altitude` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Altitude` callback is only triggered if the altitude has changed since
+        the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD, (period,), BrickletBarometer.CODEC_SET_ALTITUDE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_altitude_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Altitude Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD, (), '', 12, BrickletBarometer.CODEC_GET_ALTITUDE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_air_pressure_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Air Pressure Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the air pressure is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the air pressure is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the air pressure is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the air pressure is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_SET_AIR_PRESSURE_CALLBACK_THRESHOLD, (option, min, max), BrickletBarometer.CODEC_SET_AIR_PRESSURE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_air_pressure_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Air Pressure Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetAirPressureCallbackThreshold(*await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_AIR_PRESSURE_CALLBACK_THRESHOLD, (), '', 17, BrickletBarometer.CODEC_GET_AIR_PRESSURE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_altitude_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Altitude Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the altitude is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the altitude is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the altitude is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the altitude is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_SET_ALTITUDE_CALLBACK_THRESHOLD, (option, min, max), BrickletBarometer.CODEC_SET_ALTITUDE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_altitude_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Altitude Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetAltitudeCallbackThreshold(*await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_ALTITUDE_CALLBACK_THRESHOLD, (), '', 17, BrickletBarometer.CODEC_GET_ALTITUDE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callbacks
+
+        * :cb:`Air Pressure Reached`,
+        * :cb:`Altitude Reached`
+
+        are triggered, if the thresholds
+
+        * :func:`Set Air Pressure Callback Threshold`,
+        * :func:`Set Altitude Callback Threshold`
+
+        keep being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletBarometer.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletBarometer.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_reference_air_pressure(self, air_pressure):
+        """
+        Sets the reference air pressure for the altitude calculation.
+        Setting the reference to the current air pressure results in a calculated
+        altitude of 0cm. Passing 0 is a shortcut for passing the current air pressure as
+        reference.
+
+        Well known reference values are the Q codes
+        `QNH <https://en.wikipedia.org/wiki/QNH>`__ and
+        `QFE <https://en.wikipedia.org/wiki/Mean_sea_level_pressure#Mean_sea_level_pressure>`__
+        used in aviation.
+        """
+        await self.check_validity()
+
+        air_pressure = int(air_pressure)
+
+        await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_SET_REFERENCE_AIR_PRESSURE, (air_pressure,), BrickletBarometer.CODEC_SET_REFERENCE_AIR_PRESSURE_REQUEST, 0, '')
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature of the air pressure sensor.
+
+        This temperature is used internally for temperature compensation of the air
+        pressure measurement. It is not as accurate as the temperature measured by the
+        :ref:`temperature_bricklet` or the :ref:`temperature_ir_bricklet`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletBarometer.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def get_reference_air_pressure(self):
+        """
+        Returns the reference air pressure as set by :func:`Set Reference Air Pressure`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_REFERENCE_AIR_PRESSURE, (), '', 12, BrickletBarometer.CODEC_GET_REFERENCE_AIR_PRESSURE_RESPONSE)
+
+    async def set_averaging(self, moving_average_pressure, average_pressure, average_temperature):
+        """
+        Sets the different averaging parameters. It is possible to set
+        the length of a normal averaging for the temperature and pressure,
+        as well as an additional length of a
+        `moving average <https://en.wikipedia.org/wiki/Moving_average>`__
+        for the pressure. The moving average is calculated from the normal
+        averages.  There is no moving average for the temperature.
+
+        Setting the all three parameters to 0 will turn the averaging
+        completely off. If the averaging is off, there is lots of noise
+        on the data, but the data is without delay. Thus we recommend
+        to turn the averaging off if the Barometer Bricklet data is
+        to be used for sensor fusion with other sensors.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        moving_average_pressure = int(moving_average_pressure)
+        average_pressure = int(average_pressure)
+        average_temperature = int(average_temperature)
+
+        await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_SET_AVERAGING, (moving_average_pressure, average_pressure, average_temperature), BrickletBarometer.CODEC_SET_AVERAGING_REQUEST, 0, '')
+
+    async def get_averaging(self):
+        """
+        Returns the averaging configuration as set by :func:`Set Averaging`.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return GetAveraging(*await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_AVERAGING, (), '', 11, BrickletBarometer.CODEC_GET_AVERAGING_RESPONSE))
+
+    async def set_i2c_mode(self, mode):
+        """
+        Sets the I2C mode. Possible modes are:
+
+        * 0: Fast (400kHz)
+        * 1: Slow (100kHz)
+
+        If you have problems with obvious outliers in the
+        Barometer Bricklet measurements, they may be caused by EMI issues.
+        In this case it may be helpful to lower the I2C speed.
+
+        It is however not recommended to lower the I2C speed in applications where
+        a high throughput needs to be achieved.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_SET_I2C_MODE, (mode,), BrickletBarometer.CODEC_SET_I2C_MODE_REQUEST, 0, '')
+
+    async def get_i2c_mode(self):
+        """
+        Returns the I2C mode as set by :func:`Set I2C Mode`.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_I2C_MODE, (), '', 9, BrickletBarometer.CODEC_GET_I2C_MODE_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletBarometer.FUNCTION_GET_IDENTITY, (), '', 33, BrickletBarometer.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,496 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_barometer_v2 import BrickletBarometerV2, GetAirPressureCallbackConfiguration, GetAltitudeCallbackConfiguration, GetTemperatureCallbackConfiguration, GetMovingAverageConfiguration, GetCalibration, GetSensorConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_barometer_v2 import BrickletBarometerV2, GetAirPressureCallbackConfiguration, GetAltitudeCallbackConfiguration, GetTemperatureCallbackConfiguration, GetMovingAverageConfiguration, GetCalibration, GetSensorConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletBarometerV2Async(AsyncDevice, BrickletBarometerV2):
+    """
+    Measures air pressure and altitude changes
+
+    asyncio variant of BrickletBarometerV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_air_pressure(self):
+        """
+        Returns the measured air pressure.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`Air Pressure` callback. You can set the callback configuration
+        with :func:`Set Air Pressure Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_AIR_PRESSURE, (), '', 12, BrickletBarometerV2.CODEC_GET_AIR_PRESSURE_RESPONSE)
+
+    async def set_air_pressure_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`Air Pressure` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`Air Pressure` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletBarometerV2.CODEC_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_air_pressure_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Air Pressure Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAirPressureCallbackConfiguration(*await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION, (), '', 22, BrickletBarometerV2.CODEC_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_altitude(self):
+        """
+        Returns the relative altitude of the air pressure sensor. The value
+        is calculated based on the difference between the
+        current air pressure and the reference air pressure that can be set
+        with :func:`Set Reference Air Pressure`.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`Altitude` callback. You can set the callback configuration
+        with :func:`Set Altitude Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_ALTITUDE, (), '', 12, BrickletBarometerV2.CODEC_GET_ALTITUDE_RESPONSE)
+
+    async def set_altitude_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`Altitude` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`Altitude` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_SET_ALTITUDE_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletBarometerV2.CODEC_SET_ALTITUDE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_altitude_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Altitude Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAltitudeCallbackConfiguration(*await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_ALTITUDE_CALLBACK_CONFIGURATION, (), '', 22, BrickletBarometerV2.CODEC_GET_ALTITUDE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_temperature(self):
+        """
+        Returns the temperature of the air pressure sensor.
+
+        This temperature is used internally for temperature compensation
+        of the air pressure measurement. It is not as accurate as the
+        temperature measured by the :ref:`temperature_v2_bricklet` or the
+        :ref:`temperature_ir_v2_bricklet`.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`Temperature` callback. You can set the callback configuration
+        with :func:`Set Temperature Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_TEMPERATURE, (), '', 12, BrickletBarometerV2.CODEC_GET_TEMPERATURE_RESPONSE)
+
+    async def set_temperature_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`Temperature` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`Temperature` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletBarometerV2.CODEC_SET_TEMPERATURE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_temperature_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Temperature Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetTemperatureCallbackConfiguration(*await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION, (), '', 22, BrickletBarometerV2.CODEC_GET_TEMPERATURE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_moving_average_configuration(self, moving_average_length_air_pressure, moving_average_length_temperature):
+        """
+        Sets the length of a `moving averaging <https://en.wikipedia.org/wiki/Moving_average>`__
+        for the air pressure and temperature measurements.
+
+        Setting the length to 1 will turn the averaging off. With less
+        averaging, there is more noise on the data.
+
+        If you want to do long term measurements the longest moving average will give
+        the cleanest results.
+        """
+        await self.check_validity()
+
+        moving_average_length_air_pressure = int(moving_average_length_air_pressure)
+        moving_average_length_temperature = int(moving_average_length_temperature)
+
+        await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_SET_MOVING_AVERAGE_CONFIGURATION, (moving_average_length_air_pressure, moving_average_length_temperature), BrickletBarometerV2.CODEC_SET_MOVING_AVERAGE_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_moving_average_configuration(self):
+        """
+        Returns the moving average configuration as set by
+        :func:`Set Moving Average Configuration`.
+        """
+        await self.check_validity()
+
+        return GetMovingAverageConfiguration(*await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_MOVING_AVERAGE_CONFIGURATION, (), '', 12, BrickletBarometerV2.CODEC_GET_MOVING_AVERAGE_CONFIGURATION_RESPONSE))
+
+    async def set_reference_air_pressure(self, air_pressure):
+        """
+        Sets the reference air pressure for the altitude calculation.
+        Setting the reference to the
+        current air pressure results in a calculated altitude of 0mm. Passing 0 is
+        a shortcut for passing the current air pressure as reference.
+
+        Well known reference values are the Q codes
+        `QNH <https://en.wikipedia.org/wiki/QNH>`__ and
+        `QFE <https://en.wikipedia.org/wiki/Mean_sea_level_pressure#Mean_sea_level_pressure>`__
+        used in aviation.
+        """
+        await self.check_validity()
+
+        air_pressure = int(air_pressure)
+
+        await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_SET_REFERENCE_AIR_PRESSURE, (air_pressure,), BrickletBarometerV2.CODEC_SET_REFERENCE_AIR_PRESSURE_REQUEST, 0, '')
+
+    async def get_reference_air_pressure(self):
+        """
+        Returns the reference air pressure as set by :func:`Set Reference Air Pressure`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_REFERENCE_AIR_PRESSURE, (), '', 12, BrickletBarometerV2.CODEC_GET_REFERENCE_AIR_PRESSURE_RESPONSE)
+
+    async def set_calibration(self, measured_air_pressure, actual_air_pressure):
+        """
+        Sets the one point calibration (OPC) values for the air pressure measurement.
+
+        Before the Bricklet can be calibrated any previous calibration has to be removed
+        by setting ``measured air pressure`` and ``actual air pressure`` to 0.
+
+        Then the current air pressure has to be measured using the Bricklet
+        (``measured air pressure``) and with an accurate reference barometer
+        (``actual air pressure``) at the same time and passed to this function.
+
+        After proper calibration the air pressure measurement can achieve an accuracy
+        up to 0.2 hPa.
+
+        The calibration is saved in the EEPROM of the Bricklet and only needs to be
+        configured once.
+        """
+        await self.check_validity()
+
+        measured_air_pressure = int(measured_air_pressure)
+        actual_air_pressure = int(actual_air_pressure)
+
+        await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_SET_CALIBRATION, (measured_air_pressure, actual_air_pressure), BrickletBarometerV2.CODEC_SET_CALIBRATION_REQUEST, 0, '')
+
+    async def get_calibration(self):
+        """
+        Returns the air pressure one point calibration values as set by
+        :func:`Set Calibration`.
+        """
+        await self.check_validity()
+
+        return GetCalibration(*await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_CALIBRATION, (), '', 16, BrickletBarometerV2.CODEC_GET_CALIBRATION_RESPONSE))
+
+    async def set_sensor_configuration(self, data_rate, air_pressure_low_pass_filter):
+        """
+        Configures the data rate and air pressure low pass filter. The low pass filter
+        cut-off frequency (if enabled) can be set to 1/9th or 1/20th of the configure
+        data rate to decrease the noise on the air pressure data.
+
+        The low pass filter configuration only applies to the air pressure measurement.
+        There is no low pass filter for the temperature measurement.
+
+        A higher data rate will result in a less precise temperature because of
+        self-heating of the sensor. If the accuracy of the temperature reading is
+        important to you, we would recommend the 1Hz data rate.
+        """
+        await self.check_validity()
+
+        data_rate = int(data_rate)
+        air_pressure_low_pass_filter = int(air_pressure_low_pass_filter)
+
+        await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_SET_SENSOR_CONFIGURATION, (data_rate, air_pressure_low_pass_filter), BrickletBarometerV2.CODEC_SET_SENSOR_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_sensor_configuration(self):
+        """
+        Returns the sensor configuration as set by :func:`Set Sensor Configuration`.
+        """
+        await self.check_validity()
+
+        return GetSensorConfiguration(*await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_SENSOR_CONFIGURATION, (), '', 10, BrickletBarometerV2.CODEC_GET_SENSOR_CONFIGURATION_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletBarometerV2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletBarometerV2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletBarometerV2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletBarometerV2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletBarometerV2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletBarometerV2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletBarometerV2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletBarometerV2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletBarometerV2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletBarometerV2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_WRITE_UID, (uid,), BrickletBarometerV2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_READ_UID, (), '', 12, BrickletBarometerV2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletBarometerV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletBarometerV2.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_co2 import BrickletCO2, GetCO2ConcentrationCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_co2 import BrickletCO2, GetCO2ConcentrationCallbackThreshold, GetIdentity
+
+class BrickletCO2Async(AsyncDevice, BrickletCO2):
+    """
+    Measures CO2 concentration in ppm
+
+    asyncio variant of BrickletCO2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_co2_concentration(self):
+        """
+        Returns the measured CO2 concentration.
+
+        If you want to get the CO2 concentration periodically, it is recommended to use
+        the :cb:`CO2 Concentration` callback and set the period with
+        :func:`Set CO2 Concentration Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletCO2.FUNCTION_GET_CO2_CONCENTRATION, (), '', 10, BrickletCO2.CODEC_GET_CO2_CONCENTRATION_RESPONSE)
+
+    async def set_co2_concentration_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`CO2 Concentration` callback is
+        triggered periodically. A value of 0 turns the callback off.
+
+        The :cb:`CO2 Concentration` callback is only triggered if the CO2 concentration
+        has changed since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletCO2.FUNCTION_SET_CO2_CONCENTRATION_CALLBACK_PERIOD, (period,), BrickletCO2.CODEC_SET_CO2_CONCENTRATION_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_co2_concentration_callback_period(self):
+        """
+        Returns the period as set by :func:`Set CO2 Concentration Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletCO2.FUNCTION_GET_CO2_CONCENTRATION_CALLBACK_PERIOD, (), '', 12, BrickletCO2.CODEC_GET_CO2_CONCENTRATION_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_co2_concentration_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`CO2 Concentration Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the CO2 concentration is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the CO2 concentration is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the CO2 concentration is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the CO2 concentration is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletCO2.FUNCTION_SET_CO2_CONCENTRATION_CALLBACK_THRESHOLD, (option, min, max), BrickletCO2.CODEC_SET_CO2_CONCENTRATION_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_co2_concentration_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set CO2 Concentration Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetCO2ConcentrationCallbackThreshold(*await self.ipcon.send_request(self, BrickletCO2.FUNCTION_GET_CO2_CONCENTRATION_CALLBACK_THRESHOLD, (), '', 13, BrickletCO2.CODEC_GET_CO2_CONCENTRATION_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callbacks
+
+        * :cb:`CO2 Concentration Reached`,
+
+        are triggered, if the thresholds
+
+        * :func:`Set CO2 Concentration Callback Threshold`,
+
+        keep being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletCO2.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletCO2.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletCO2.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletCO2.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletCO2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletCO2.CODEC_GET_IDENTITY_RESPONSE))
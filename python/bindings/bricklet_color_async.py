@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_color import BrickletColor, GetColor, GetColorCallbackThreshold, GetConfig, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_color import BrickletColor, GetColor, GetColorCallbackThreshold, GetConfig, GetIdentity
+
+class BrickletColorAsync(AsyncDevice, BrickletColor):
+    """
+    Measures color (RGB value), illuminance and color temperature
+
+    asyncio variant of BrickletColor for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_color(self):
+        """
+        Returns the measured color of the sensor.
+
+        The red (r), green (g), blue (b) and clear (c) colors are measured
+        with four different photodiodes that are responsive at different
+        wavelengths:
+
+        .. image:: /Images/Bricklets/bricklet_color_wavelength_chart_600.jpg
+           :scale: 100 %
+           :alt: Chart Responsivity / Wavelength
+           :align: center
+           :target: ../../_images/Bricklets/bricklet_color_wavelength_chart_600.jpg
+
+        If you want to get the color periodically, it is recommended
+        to use the :cb:`Color` callback and set the period with
+        :func:`Set Color Callback Period`.
+        """
+        await self.check_validity()
+
+        return GetColor(*await self.ipcon.send_request(self, BrickletColor.FUNCTION_GET_COLOR, (), '', 16, BrickletColor.CODEC_GET_COLOR_RESPONSE))
+
+    async def set_color_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Color` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Color` callback is only triggered if the color has changed since the
+        last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletColor.FUNCTION_SET_COLOR_CALLBACK_PERIOD, (period,), BrickletColor.CODEC_SET_COLOR_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_color_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Color Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletColor.FUNCTION_GET_COLOR_CALLBACK_PERIOD, (), '', 12, BrickletColor.CODEC_GET_COLOR_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_color_callback_threshold(self, option, min_r, max_r, min_g, max_g, min_b, max_b, min_c, max_c):
+        """
+        Sets the thresholds for the :cb:`Color Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the temperature is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the temperature is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the temperature is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the temperature is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min_r = int(min_r)
+        max_r = int(max_r)
+        min_g = int(min_g)
+        max_g = int(max_g)
+        min_b = int(min_b)
+        max_b = int(max_b)
+        min_c = int(min_c)
+        max_c = int(max_c)
+
+        await self.ipcon.send_request(self, BrickletColor.FUNCTION_SET_COLOR_CALLBACK_THRESHOLD, (option, min_r, max_r, min_g, max_g, min_b, max_b, min_c, max_c), BrickletColor.CODEC_SET_COLOR_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_color_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Color Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetColorCallbackThreshold(*await self.ipcon.send_request(self, BrickletColor.FUNCTION_GET_COLOR_CALLBACK_THRESHOLD, (), '', 25, BrickletColor.CODEC_GET_COLOR_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callback
+
+        * :cb:`Color Reached`
+
+        is triggered, if the threshold
+
+        * :func:`Set Color Callback Threshold`
+
+        keeps being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletColor.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletColor.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletColor.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletColor.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def light_on(self):
+        """
+        Turns the LED on.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletColor.FUNCTION_LIGHT_ON, (), '', 0, '')
+
+    async def light_off(self):
+        """
+        Turns the LED off.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletColor.FUNCTION_LIGHT_OFF, (), '', 0, '')
+
+    async def is_light_on(self):
+        """
+        Returns the state of the LED. Possible values are:
+
+        * 0: On
+        * 1: Off
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletColor.FUNCTION_IS_LIGHT_ON, (), '', 9, BrickletColor.CODEC_IS_LIGHT_ON_RESPONSE)
+
+    async def set_config(self, gain, integration_time):
+        """
+        Sets the configuration of the sensor. Gain and integration time
+        can be configured in this way.
+
+        For configuring the gain:
+
+        * 0: 1x Gain
+        * 1: 4x Gain
+        * 2: 16x Gain
+        * 3: 60x Gain
+
+        For configuring the integration time:
+
+        * 0: 2.4ms
+        * 1: 24ms
+        * 2: 101ms
+        * 3: 154ms
+        * 4: 700ms
+
+        Increasing the gain enables the sensor to detect a
+        color from a higher distance.
+
+        The integration time provides a trade-off between conversion time
+        and accuracy. With a longer integration time the values read will
+        be more accurate but it will take longer time to get the conversion
+        results.
+        """
+        await self.check_validity()
+
+        gain = int(gain)
+        integration_time = int(integration_time)
+
+        await self.ipcon.send_request(self, BrickletColor.FUNCTION_SET_CONFIG, (gain, integration_time), BrickletColor.CODEC_SET_CONFIG_REQUEST, 0, '')
+
+    async def get_config(self):
+        """
+        Returns the configuration as set by :func:`Set Config`.
+        """
+        await self.check_validity()
+
+        return GetConfig(*await self.ipcon.send_request(self, BrickletColor.FUNCTION_GET_CONFIG, (), '', 10, BrickletColor.CODEC_GET_CONFIG_RESPONSE))
+
+    async def get_illuminance(self):
+        """
+        Returns the illuminance affected by the gain and integration time as
+        set by :func:`Set Config`. To get the illuminance in Lux apply this formula::
+
+         lux = illuminance * 700 / gain / integration_time
+
+        To get a correct illuminance measurement make sure that the color
+        values themselves are not saturated. The color value (R, G or B)
+        is saturated if it is equal to the maximum value of 65535.
+        In that case you have to reduce the gain, see :func:`Set Config`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletColor.FUNCTION_GET_ILLUMINANCE, (), '', 12, BrickletColor.CODEC_GET_ILLUMINANCE_RESPONSE)
+
+    async def get_color_temperature(self):
+        """
+        Returns the color temperature.
+
+        To get a correct color temperature measurement make sure that the color
+        values themselves are not saturated. The color value (R, G or B)
+        is saturated if it is equal to the maximum value of 65535.
+        In that case you have to reduce the gain, see :func:`Set Config`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletColor.FUNCTION_GET_COLOR_TEMPERATURE, (), '', 10, BrickletColor.CODEC_GET_COLOR_TEMPERATURE_RESPONSE)
+
+    async def set_illuminance_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Illuminance` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Illuminance` callback is only triggered if the illuminance has changed
+        since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletColor.FUNCTION_SET_ILLUMINANCE_CALLBACK_PERIOD, (period,), BrickletColor.CODEC_SET_ILLUMINANCE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_illuminance_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Illuminance Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletColor.FUNCTION_GET_ILLUMINANCE_CALLBACK_PERIOD, (), '', 12, BrickletColor.CODEC_GET_ILLUMINANCE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_color_temperature_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Color Temperature` callback is
+        triggered periodically. A value of 0 turns the callback off.
+
+        The :cb:`Color Temperature` callback is only triggered if the color temperature
+        has changed since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletColor.FUNCTION_SET_COLOR_TEMPERATURE_CALLBACK_PERIOD, (period,), BrickletColor.CODEC_SET_COLOR_TEMPERATURE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_color_temperature_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Color Temperature Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletColor.FUNCTION_GET_COLOR_TEMPERATURE_CALLBACK_PERIOD, (), '', 12, BrickletColor.CODEC_GET_COLOR_TEMPERATURE_CALLBACK_PERIOD_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletColor.FUNCTION_GET_IDENTITY, (), '', 33, BrickletColor.CODEC_GET_IDENTITY_RESPONSE))
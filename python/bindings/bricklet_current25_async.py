@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_current25 import BrickletCurrent25, GetCurrentCallbackThreshold, GetAnalogValueCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_current25 import BrickletCurrent25, GetCurrentCallbackThreshold, GetAnalogValueCallbackThreshold, GetIdentity
+
+class BrickletCurrent25Async(AsyncDevice, BrickletCurrent25):
+    """
+    Measures AC/DC current between -25A and +25A
+
+    asyncio variant of BrickletCurrent25 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_current(self):
+        """
+        Returns the current of the sensor.
+
+        If you want to get the current periodically, it is recommended to use the
+        :cb:`Current` callback and set the period with
+        :func:`Set Current Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_CURRENT, (), '', 10, BrickletCurrent25.CODEC_GET_CURRENT_RESPONSE)
+
+    async def calibrate(self):
+        """
+        Calibrates the 0 value of the sensor. You have to call this function
+        when there is no current present.
+
+        The zero point of the current sensor
+        is depending on the exact properties of the analog-to-digital converter,
+        the length of the Bricklet cable and the temperature. Thus, if you change
+        the Brick or the environment in which the Bricklet is used, you might
+        have to recalibrate.
+
+        The resulting calibration will be saved on the EEPROM of the Current
+        Bricklet.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_CALIBRATE, (), '', 0, '')
+
+    async def is_over_current(self):
+        """
+        Returns *true* if more than 25A were measured.
+
+        .. note::
+         To reset this value you have to power cycle the Bricklet.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_IS_OVER_CURRENT, (), '', 9, BrickletCurrent25.CODEC_IS_OVER_CURRENT_RESPONSE)
+
+    async def get_analog_value(self):
+        """
+        Returns the value as read by a 12-bit analog-to-digital converter.
+
+        .. note::
+         The value returned by :func:`Get Current` is averaged over several samples
+         to yield less noise, while :func:`Get Analog Value` gives back raw
+         unfiltered analog values. The only reason to use :func:`Get Analog Value` is,
+         if you need the full resolution of the analog-to-digital converter.
+
+        If you want the analog value periodically, it is recommended to use the
+        :cb:`Analog Value` callback and set the period with
+        :func:`Set Analog Value Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_ANALOG_VALUE, (), '', 10, BrickletCurrent25.CODEC_GET_ANALOG_VALUE_RESPONSE)
+
+    async def set_current_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Current` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Current` callback is only triggered if the current has changed since
+        the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_SET_CURRENT_CALLBACK_PERIOD, (period,), BrickletCurrent25.CODEC_SET_CURRENT_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_current_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Current Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_CURRENT_CALLBACK_PERIOD, (), '', 12, BrickletCurrent25.CODEC_GET_CURRENT_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_analog_value_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Analog Value` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Analog Value` callback is only triggered if the analog value has
+        changed since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD, (period,), BrickletCurrent25.CODEC_SET_ANALOG_VALUE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_analog_value_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Analog Value Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD, (), '', 12, BrickletCurrent25.CODEC_GET_ANALOG_VALUE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_current_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Current Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the current is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the current is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the current is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the current is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_SET_CURRENT_CALLBACK_THRESHOLD, (option, min, max), BrickletCurrent25.CODEC_SET_CURRENT_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_current_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Current Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetCurrentCallbackThreshold(*await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD, (), '', 13, BrickletCurrent25.CODEC_GET_CURRENT_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_analog_value_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Analog Value Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the analog value is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the analog value is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the analog value is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the analog value is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD, (option, min, max), BrickletCurrent25.CODEC_SET_ANALOG_VALUE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_analog_value_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Analog Value Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetAnalogValueCallbackThreshold(*await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD, (), '', 13, BrickletCurrent25.CODEC_GET_ANALOG_VALUE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callbacks
+
+        * :cb:`Current Reached`,
+        * :cb:`Analog Value Reached`
+
+        are triggered, if the thresholds
+
+        * :func:`Set Current Callback Threshold`,
+        * :func:`Set Analog Value Callback Threshold`
+
+        keep being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletCurrent25.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletCurrent25.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletCurrent25.FUNCTION_GET_IDENTITY, (), '', 33, BrickletCurrent25.CODEC_GET_IDENTITY_RESPONSE))
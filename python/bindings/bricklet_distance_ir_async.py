@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_distance_ir import BrickletDistanceIR, GetDistanceCallbackThreshold, GetAnalogValueCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_distance_ir import BrickletDistanceIR, GetDistanceCallbackThreshold, GetAnalogValueCallbackThreshold, GetIdentity
+
+class BrickletDistanceIRAsync(AsyncDevice, BrickletDistanceIR):
+    """
+    Measures distance up to 150cm with infrared light
+
+    asyncio variant of BrickletDistanceIR for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_distance(self):
+        """
+        Returns the distance measured by the sensor. Possible
+        distance ranges are 40 to 300, 100 to 800 and 200 to 1500, depending on the
+        selected IR sensor.
+
+        If you want to get the distance periodically, it is recommended to use the
+        :cb:`Distance` callback and set the period with
+        :func:`Set Distance Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_DISTANCE, (), '', 10, BrickletDistanceIR.CODEC_GET_DISTANCE_RESPONSE)
+
+    async def get_analog_value(self):
+        """
+        Returns the value as read by a 12-bit analog-to-digital converter.
+
+        .. note::
+         The value returned by :func:`Get Distance` is averaged over several samples
+         to yield less noise, while :func:`Get Analog Value` gives back raw
+         unfiltered analog values. The only reason to use :func:`Get Analog Value` is,
+         if you need the full resolution of the analog-to-digital converter.
+
+        If you want the analog value periodically, it is recommended to use the
+        :cb:`Analog Value` callback and set the period with
+        :func:`Set Analog Value Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_ANALOG_VALUE, (), '', 10, BrickletDistanceIR.CODEC_GET_ANALOG_VALUE_RESPONSE)
+
+    async def set_sampling_point(self, position, distance):
+        """
+        Sets a sampling point value to a specific position of the lookup table.
+        The lookup table comprises 128 equidistant analog values with
+        corresponding distances.
+
+        If you measure a distance of 50cm at the analog value 2048, you
+        should call this function with (64, 5000). The utilized analog-to-digital
+        converter has a resolution of 12 bit. With 128 sampling points on the
+        whole range, this means that every sampling point has a size of 32
+        analog values. Thus the analog value 2048 has the corresponding sampling
+        point 64 = 2048/32.
+
+        Sampling points are saved on the EEPROM of the Distance IR Bricklet and
+        loaded again on startup.
+
+        .. note::
+         An easy way to calibrate the sampling points of the Distance IR Bricklet is
+         implemented in the Brick Viewer. If you want to calibrate your Bricklet it is
+         highly recommended to use this implementation.
+        """
+        await self.check_validity()
+
+        position = int(position)
+        distance = int(distance)
+
+        await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_SET_SAMPLING_POINT, (position, distance), BrickletDistanceIR.CODEC_SET_SAMPLING_POINT_REQUEST, 0, '')
+
+    async def get_sampling_point(self, position):
+        """
+        Returns the distance to a sampling point position as set by
+        :func:`Set Sampling Point`.
+        """
+        await self.check_validity()
+
+        position = int(position)
+
+        return await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_SAMPLING_POINT, (position,), BrickletDistanceIR.CODEC_GET_SAMPLING_POINT_REQUEST, 10, BrickletDistanceIR.CODEC_GET_SAMPLING_POINT_RESPONSE)
+
+    async def set_distance_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Distance` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Distance` callback is only triggered if the distance has changed since the
+        last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_SET_DISTANCE_CALLBACK_PERIOD, (period,), BrickletDistanceIR.CODEC_SET_DISTANCE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_distance_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Distance Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_DISTANCE_CALLBACK_PERIOD, (), '', 12, BrickletDistanceIR.CODEC_GET_DISTANCE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_analog_value_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Analog Value` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Analog Value` callback is only triggered if the analog value has
+        changed since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD, (period,), BrickletDistanceIR.CODEC_SET_ANALOG_VALUE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_analog_value_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Analog Value Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD, (), '', 12, BrickletDistanceIR.CODEC_GET_ANALOG_VALUE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_distance_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Distance Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the distance is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the distance is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the distance is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the distance is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_SET_DISTANCE_CALLBACK_THRESHOLD, (option, min, max), BrickletDistanceIR.CODEC_SET_DISTANCE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_distance_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Distance Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetDistanceCallbackThreshold(*await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_DISTANCE_CALLBACK_THRESHOLD, (), '', 13, BrickletDistanceIR.CODEC_GET_DISTANCE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_analog_value_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Analog Value Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the analog value is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the analog value is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the analog value is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the analog value is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD, (option, min, max), BrickletDistanceIR.CODEC_SET_ANALOG_VALUE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_analog_value_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Analog Value Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetAnalogValueCallbackThreshold(*await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD, (), '', 13, BrickletDistanceIR.CODEC_GET_ANALOG_VALUE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callbacks
+
+        * :cb:`Distance Reached`,
+        * :cb:`Analog Value Reached`
+
+        are triggered, if the thresholds
+
+        * :func:`Set Distance Callback Threshold`,
+        * :func:`Set Analog Value Callback Threshold`
+
+        keep being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletDistanceIR.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletDistanceIR.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletDistanceIR.FUNCTION_GET_IDENTITY, (), '', 33, BrickletDistanceIR.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_distance_us import BrickletDistanceUS, GetDistanceCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_distance_us import BrickletDistanceUS, GetDistanceCallbackThreshold, GetIdentity
+
+class BrickletDistanceUSAsync(AsyncDevice, BrickletDistanceUS):
+    """
+    Measures distance between 2cm and 400cm with ultrasound
+
+    asyncio variant of BrickletDistanceUS for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_distance_value(self):
+        """
+        Returns the current distance value measured by the sensor.
+        A small value corresponds to a small distance, a big
+        value corresponds to a big distance. The relation between the measured distance
+        value and the actual distance is affected by the 5V supply voltage (deviations
+        in the supply voltage result in deviations in the distance values) and is
+        non-linear (resolution is bigger at close range).
+
+        If you want to get the distance value periodically, it is recommended to
+        use the :cb:`Distance` callback and set the period with
+        :func:`Set Distance Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDistanceUS.FUNCTION_GET_DISTANCE_VALUE, (), '', 10, BrickletDistanceUS.CODEC_GET_DISTANCE_VALUE_RESPONSE)
+
+    async def set_distance_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Distance` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        Der :cb:`Distance` callback is only triggered if the distance value has changed
+        since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletDistanceUS.FUNCTION_SET_DISTANCE_CALLBACK_PERIOD, (period,), BrickletDistanceUS.CODEC_SET_DISTANCE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_distance_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Distance Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDistanceUS.FUNCTION_GET_DISTANCE_CALLBACK_PERIOD, (), '', 12, BrickletDistanceUS.CODEC_GET_DISTANCE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_distance_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Distance Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the distance value is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the distance value is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the distance value is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the distance value is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletDistanceUS.FUNCTION_SET_DISTANCE_CALLBACK_THRESHOLD, (option, min, max), BrickletDistanceUS.CODEC_SET_DISTANCE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_distance_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Distance Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetDistanceCallbackThreshold(*await self.ipcon.send_request(self, BrickletDistanceUS.FUNCTION_GET_DISTANCE_CALLBACK_THRESHOLD, (), '', 13, BrickletDistanceUS.CODEC_GET_DISTANCE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callbacks
+
+        * :cb:`Distance Reached`,
+
+        are triggered, if the thresholds
+
+        * :func:`Set Distance Callback Threshold`,
+
+        keep being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletDistanceUS.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletDistanceUS.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDistanceUS.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletDistanceUS.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_moving_average(self, average):
+        """
+        Sets the length of a `moving averaging <https://en.wikipedia.org/wiki/Moving_average>`__
+        for the distance value.
+
+        Setting the length to 0 will turn the averaging completely off. With less
+        averaging, there is more noise on the data.
+        """
+        await self.check_validity()
+
+        average = int(average)
+
+        await self.ipcon.send_request(self, BrickletDistanceUS.FUNCTION_SET_MOVING_AVERAGE, (average,), BrickletDistanceUS.CODEC_SET_MOVING_AVERAGE_REQUEST, 0, '')
+
+    async def get_moving_average(self):
+        """
+        Returns the length moving average as set by :func:`Set Moving Average`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDistanceUS.FUNCTION_GET_MOVING_AVERAGE, (), '', 9, BrickletDistanceUS.CODEC_GET_MOVING_AVERAGE_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletDistanceUS.FUNCTION_GET_IDENTITY, (), '', 33, BrickletDistanceUS.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,475 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_dmx import BrickletDMX, ReadFrameLowLevel, GetFrameErrorCount, GetFrameCallbackConfig, GetSPITFPErrorCount, GetIdentity, ReadFrame
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_dmx import BrickletDMX, ReadFrameLowLevel, GetFrameErrorCount, GetFrameCallbackConfig, GetSPITFPErrorCount, GetIdentity, ReadFrame
+
+class BrickletDMXAsync(AsyncDevice, BrickletDMX):
+    """
+    DMX master and slave
+
+    asyncio variant of BrickletDMX for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_dmx_mode(self, dmx_mode):
+        """
+        Sets the DMX mode to either master or slave.
+
+        Calling this function sets frame number to 0.
+        """
+        await self.check_validity()
+
+        dmx_mode = int(dmx_mode)
+
+        await self.ipcon.send_request(self, BrickletDMX.FUNCTION_SET_DMX_MODE, (dmx_mode,), BrickletDMX.CODEC_SET_DMX_MODE_REQUEST, 0, '')
+
+    async def get_dmx_mode(self):
+        """
+        Returns the DMX mode, as set by :func:`Set DMX Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDMX.FUNCTION_GET_DMX_MODE, (), '', 9, BrickletDMX.CODEC_GET_DMX_MODE_RESPONSE)
+
+    async def write_frame_low_level(self, frame_length, frame_chunk_offset, frame_chunk_data):
+        """
+        Writes a DMX frame. The maximum frame size is 512 byte. Each byte represents one channel.
+
+        The next frame can be written after the :cb:`Frame Started` callback was called. The frame
+        is double buffered, so a new frame can be written as soon as the writing of the prior frame
+        starts.
+
+        The data will be transfered when the next frame duration ends, see :func:`Set Frame Duration`.
+
+        Generic approach:
+
+        * Set the frame duration to a value that represents the number of frames per second you want to achieve.
+        * Set channels for first frame.
+        * Wait for the :cb:`Frame Started` callback.
+        * Set channels for next frame.
+        * Wait for the :cb:`Frame Started` callback.
+        * and so on.
+
+        This approach ensures that you can set new DMX data with a fixed frame rate.
+
+        This function can only be called in master mode.
+        """
+        await self.check_validity()
+
+        frame_length = int(frame_length)
+        frame_chunk_offset = int(frame_chunk_offset)
+        frame_chunk_data = list(map(int, frame_chunk_data))
+
+        await self.ipcon.send_request(self, BrickletDMX.FUNCTION_WRITE_FRAME_LOW_LEVEL, (frame_length, frame_chunk_offset, frame_chunk_data), BrickletDMX.CODEC_WRITE_FRAME_LOW_LEVEL_REQUEST, 0, '')
+
+    async def read_frame_low_level(self):
+        """
+        Returns the last frame that was written by the DMX master. The size of the array
+        is equivalent to the number of channels in the frame. Each byte represents one channel.
+
+        The next frame is available after the :cb:`Frame Available` callback was called.
+
+        Generic approach:
+
+        * Call :func:`Read Frame` to get first frame.
+        * Wait for the :cb:`Frame Available` callback.
+        * Call :func:`Read Frame` to get second frame.
+        * Wait for the :cb:`Frame Available` callback.
+        * and so on.
+
+        Instead of polling this function you can also use the :cb:`Frame` callback.
+        You can enable it with :func:`Set Frame Callback Config`.
+
+        The frame number starts at 0 and it is increased by one with each received frame.
+
+        This function can only be called in slave mode.
+        """
+        await self.check_validity()
+
+        return ReadFrameLowLevel(*await self.ipcon.send_request(self, BrickletDMX.FUNCTION_READ_FRAME_LOW_LEVEL, (), '', 72, BrickletDMX.CODEC_READ_FRAME_LOW_LEVEL_RESPONSE))
+
+    async def set_frame_duration(self, frame_duration):
+        """
+        Sets the duration of a frame.
+
+        Example: If you want to achieve 20 frames per second, you should
+        set the frame duration to 50ms (50ms * 20 = 1 second).
+
+        If you always want to send a frame as fast as possible you can set
+        this value to 0.
+
+        This setting is only used in master mode.
+        """
+        await self.check_validity()
+
+        frame_duration = int(frame_duration)
+
+        await self.ipcon.send_request(self, BrickletDMX.FUNCTION_SET_FRAME_DURATION, (frame_duration,), BrickletDMX.CODEC_SET_FRAME_DURATION_REQUEST, 0, '')
+
+    async def get_frame_duration(self):
+        """
+        Returns the frame duration as set by :func:`Set Frame Duration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDMX.FUNCTION_GET_FRAME_DURATION, (), '', 10, BrickletDMX.CODEC_GET_FRAME_DURATION_RESPONSE)
+
+    async def get_frame_error_count(self):
+        """
+        Returns the current number of overrun and framing errors.
+        """
+        await self.check_validity()
+
+        return GetFrameErrorCount(*await self.ipcon.send_request(self, BrickletDMX.FUNCTION_GET_FRAME_ERROR_COUNT, (), '', 16, BrickletDMX.CODEC_GET_FRAME_ERROR_COUNT_RESPONSE))
+
+    async def set_communication_led_config(self, config):
+        """
+        Sets the communication LED configuration. By default the LED shows
+        communication traffic, it flickers once for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is off.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletDMX.FUNCTION_SET_COMMUNICATION_LED_CONFIG, (config,), BrickletDMX.CODEC_SET_COMMUNICATION_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_communication_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Communication LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDMX.FUNCTION_GET_COMMUNICATION_LED_CONFIG, (), '', 9, BrickletDMX.CODEC_GET_COMMUNICATION_LED_CONFIG_RESPONSE)
+
+    async def set_error_led_config(self, config):
+        """
+        Sets the error LED configuration.
+
+        By default the error LED turns on if there is any error (see :cb:`Frame Error Count`
+        callback). If you call this function with the Show-Error option again, the LED
+        will turn off until the next error occurs.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is off.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletDMX.FUNCTION_SET_ERROR_LED_CONFIG, (config,), BrickletDMX.CODEC_SET_ERROR_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_error_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Error LED Config`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDMX.FUNCTION_GET_ERROR_LED_CONFIG, (), '', 9, BrickletDMX.CODEC_GET_ERROR_LED_CONFIG_RESPONSE)
+
+    async def set_frame_callback_config(self, frame_started_callback_enabled, frame_available_callback_enabled, frame_callback_enabled, frame_error_count_callback_enabled):
+        """
+        Enables/Disables the different callbacks. By default the
+        :cb:`Frame Started` callback and :cb:`Frame Available` callback are enabled while
+        the :cb:`Frame` callback and :cb:`Frame Error Count` callback are disabled.
+
+        If you want to use the :cb:`Frame` callback you can enable it and disable
+        the cb:`Frame Available` callback at the same time. It becomes redundant in
+        this case.
+        """
+        await self.check_validity()
+
+        frame_started_callback_enabled = bool(frame_started_callback_enabled)
+        frame_available_callback_enabled = bool(frame_available_callback_enabled)
+        frame_callback_enabled = bool(frame_callback_enabled)
+        frame_error_count_callback_enabled = bool(frame_error_count_callback_enabled)
+
+        await self.ipcon.send_request(self, BrickletDMX.FUNCTION_SET_FRAME_CALLBACK_CONFIG, (frame_started_callback_enabled, frame_available_callback_enabled, frame_callback_enabled, frame_error_count_callback_enabled), BrickletDMX.CODEC_SET_FRAME_CALLBACK_CONFIG_REQUEST, 0, '')
+
+    async def get_frame_callback_config(self):
+        """
+        Returns the frame callback config as set by :func:`Set Frame Callback Config`.
+        """
+        await self.check_validity()
+
+        return GetFrameCallbackConfig(*await self.ipcon.send_request(self, BrickletDMX.FUNCTION_GET_FRAME_CALLBACK_CONFIG, (), '', 12, BrickletDMX.CODEC_GET_FRAME_CALLBACK_CONFIG_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletDMX.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletDMX.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletDMX.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletDMX.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletDMX.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDMX.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletDMX.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletDMX.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletDMX.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletDMX.FUNCTION_WRITE_FIRMWARE, (data,), BrickletDMX.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletDMX.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletDMX.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletDMX.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDMX.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletDMX.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDMX.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletDMX.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletDMX.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletDMX.FUNCTION_WRITE_UID, (uid,), BrickletDMX.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDMX.FUNCTION_READ_UID, (), '', 12, BrickletDMX.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletDMX.FUNCTION_GET_IDENTITY, (), '', 33, BrickletDMX.CODEC_GET_IDENTITY_RESPONSE))
+
+    async def write_frame(self, frame):
+        """
+        Writes a DMX frame. The maximum frame size is 512 byte. Each byte represents one channel.
+
+        The next frame can be written after the :cb:`Frame Started` callback was called. The frame
+        is double buffered, so a new frame can be written as soon as the writing of the prior frame
+        starts.
+
+        The data will be transfered when the next frame duration ends, see :func:`Set Frame Duration`.
+
+        Generic approach:
+
+        * Set the frame duration to a value that represents the number of frames per second you want to achieve.
+        * Set channels for first frame.
+        * Wait for the :cb:`Frame Started` callback.
+        * Set channels for next frame.
+        * Wait for the :cb:`Frame Started` callback.
+        * and so on.
+
+        This approach ensures that you can set new DMX data with a fixed frame rate.
+
+        This function can only be called in master mode.
+        """
+        frame = create_number_list(frame, int)
+
+        if len(frame) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Frame can be at most 65535 items long')
+
+        frame_length = len(frame)
+        frame_chunk_offset = 0
+
+        if frame_length == 0:
+            frame_chunk_data = [0] * 60
+            ret = await self.write_frame_low_level(frame_length, frame_chunk_offset, frame_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while frame_chunk_offset < frame_length:
+                    frame_chunk_data = create_chunk_data(frame, frame_chunk_offset, 60, 0)
+                    requests.append((frame_length, frame_chunk_offset, frame_chunk_data))
+                    frame_chunk_offset += 60
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletDMX.FUNCTION_WRITE_FRAME_LOW_LEVEL, requests, BrickletDMX.CODEC_WRITE_FRAME_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def read_frame(self):
+        """
+        Returns the last frame that was written by the DMX master. The size of the array
+        is equivalent to the number of channels in the frame. Each byte represents one channel.
+
+        The next frame is available after the :cb:`Frame Available` callback was called.
+
+        Generic approach:
+
+        * Call :func:`Read Frame` to get first frame.
+        * Wait for the :cb:`Frame Available` callback.
+        * Call :func:`Read Frame` to get second frame.
+        * Wait for the :cb:`Frame Available` callback.
+        * and so on.
+
+        Instead of polling this function you can also use the :cb:`Frame` callback.
+        You can enable it with :func:`Set Frame Callback Config`.
+
+        The frame number starts at 0 and it is increased by one with each received frame.
+
+        This function can only be called in slave mode.
+        """
+        await self.check_validity()
+
+        frame_codec = self.get_stream_codec(BrickletDMX.CODEC_READ_FRAME_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = ReadFrameLowLevel(*await self.ipcon.send_request(self, BrickletDMX.FUNCTION_READ_FRAME_LOW_LEVEL, (), '', 72, frame_codec))
+            frame_length = ret.frame_length
+            frame_out_of_sync = ret.frame_chunk_offset != 0
+            frame_data = self.create_stream_reassembler(frame_length, 'B')
+            frame_data.add_chunk(ret.frame_chunk_data)
+
+            while not frame_out_of_sync and frame_data.offset < frame_length:
+                ret = ReadFrameLowLevel(*await self.ipcon.send_request(self, BrickletDMX.FUNCTION_READ_FRAME_LOW_LEVEL, (), '', 72, frame_codec))
+                frame_length = ret.frame_length
+                frame_out_of_sync = ret.frame_chunk_offset != frame_data.offset
+                frame_data.add_chunk(ret.frame_chunk_data)
+
+            if frame_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.frame_chunk_offset + 56 < frame_length:
+                    ret = ReadFrameLowLevel(*await self.ipcon.send_request(self, BrickletDMX.FUNCTION_READ_FRAME_LOW_LEVEL, (), '', 72, frame_codec))
+                    frame_length = ret.frame_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Frame stream is out-of-sync')
+
+        return ReadFrame(frame_data.get_data(frame_length), ret.frame_number)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_dual_button import BrickletDualButton, GetLEDState, GetButtonState, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_dual_button import BrickletDualButton, GetLEDState, GetButtonState, GetIdentity
+
+class BrickletDualButtonAsync(AsyncDevice, BrickletDualButton):
+    """
+    Two tactile buttons with built-in blue LEDs
+
+    asyncio variant of BrickletDualButton for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_led_state(self, led_l, led_r):
+        """
+        Sets the state of the LEDs. Possible states are:
+
+        * 0 = AutoToggleOn: Enables auto toggle with initially enabled LED.
+        * 1 = AutoToggleOff: Activates auto toggle with initially disabled LED.
+        * 2 = On: Enables LED (auto toggle is disabled).
+        * 3 = Off: Disables LED (auto toggle is disabled).
+
+        In auto toggle mode the LED is toggled automatically at each press of a button.
+
+        If you just want to set one of the LEDs and don't know the current state
+        of the other LED, you can get the state with :func:`Get LED State` or you
+        can use :func:`Set Selected LED State`.
+        """
+        await self.check_validity()
+
+        led_l = int(led_l)
+        led_r = int(led_r)
+
+        await self.ipcon.send_request(self, BrickletDualButton.FUNCTION_SET_LED_STATE, (led_l, led_r), BrickletDualButton.CODEC_SET_LED_STATE_REQUEST, 0, '')
+
+    async def get_led_state(self):
+        """
+        Returns the current state of the LEDs, as set by :func:`Set LED State`.
+        """
+        await self.check_validity()
+
+        return GetLEDState(*await self.ipcon.send_request(self, BrickletDualButton.FUNCTION_GET_LED_STATE, (), '', 10, BrickletDualButton.CODEC_GET_LED_STATE_RESPONSE))
+
+    async def get_button_state(self):
+        """
+        Returns the current state for both buttons. Possible states are:
+
+        * 0 = pressed
+        * 1 = released
+        """
+        await self.check_validity()
+
+        return GetButtonState(*await self.ipcon.send_request(self, BrickletDualButton.FUNCTION_GET_BUTTON_STATE, (), '', 10, BrickletDualButton.CODEC_GET_BUTTON_STATE_RESPONSE))
+
+    async def set_selected_led_state(self, led, state):
+        """
+        Sets the state of the selected LED (0 or 1).
+
+        The other LED remains untouched.
+        """
+        await self.check_validity()
+
+        led = int(led)
+        state = int(state)
+
+        await self.ipcon.send_request(self, BrickletDualButton.FUNCTION_SET_SELECTED_LED_STATE, (led, state), BrickletDualButton.CODEC_SET_SELECTED_LED_STATE_REQUEST, 0, '')
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletDualButton.FUNCTION_GET_IDENTITY, (), '', 33, BrickletDualButton.CODEC_GET_IDENTITY_RESPONSE))
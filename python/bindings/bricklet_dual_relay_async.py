@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_dual_relay import BrickletDualRelay, GetState, GetMonoflop, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_dual_relay import BrickletDualRelay, GetState, GetMonoflop, GetIdentity
+
+class BrickletDualRelayAsync(AsyncDevice, BrickletDualRelay):
+    """
+    Two relays to switch AC/DC devices
+
+    asyncio variant of BrickletDualRelay for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_state(self, relay1, relay2):
+        """
+        Sets the state of the relays, *true* means on and *false* means off.
+        For example: (true, false) turns relay 1 on and relay 2 off.
+
+        If you just want to set one of the relays and don't know the current state
+        of the other relay, you can get the state with :func:`Get State` or you
+        can use :func:`Set Selected State`.
+
+        All running monoflop timers will be aborted if this function is called.
+        """
+        await self.check_validity()
+
+        relay1 = bool(relay1)
+        relay2 = bool(relay2)
+
+        await self.ipcon.send_request(self, BrickletDualRelay.FUNCTION_SET_STATE, (relay1, relay2), BrickletDualRelay.CODEC_SET_STATE_REQUEST, 0, '')
+
+    async def get_state(self):
+        """
+        Returns the state of the relays, *true* means on and *false* means off.
+        """
+        await self.check_validity()
+
+        return GetState(*await self.ipcon.send_request(self, BrickletDualRelay.FUNCTION_GET_STATE, (), '', 10, BrickletDualRelay.CODEC_GET_STATE_RESPONSE))
+
+    async def set_monoflop(self, relay, state, time):
+        """
+        The first parameter can be 1 or 2 (relay 1 or relay 2). The second parameter
+        is the desired state of the relay (*true* means on and *false* means off).
+        The third parameter indicates the time that the relay should hold
+        the state.
+
+        If this function is called with the parameters (1, true, 1500):
+        Relay 1 will turn on and in 1.5s it will turn off again.
+
+        A monoflop can be used as a failsafe mechanism. For example: Lets assume you
+        have a RS485 bus and a Dual Relay Bricklet connected to one of the slave
+        stacks. You can now call this function every second, with a time parameter
+        of two seconds. The relay will be on all the time. If now the RS485
+        connection is lost, the relay will turn off in at most two seconds.
+        """
+        await self.check_validity()
+
+        relay = int(relay)
+        state = bool(state)
+        time = int(time)
+
+        await self.ipcon.send_request(self, BrickletDualRelay.FUNCTION_SET_MONOFLOP, (relay, state, time), BrickletDualRelay.CODEC_SET_MONOFLOP_REQUEST, 0, '')
+
+    async def get_monoflop(self, relay):
+        """
+        Returns (for the given relay) the current state and the time as set by
+        :func:`Set Monoflop` as well as the remaining time until the state flips.
+
+        If the timer is not running currently, the remaining time will be returned
+        as 0.
+        """
+        await self.check_validity()
+
+        relay = int(relay)
+
+        return GetMonoflop(*await self.ipcon.send_request(self, BrickletDualRelay.FUNCTION_GET_MONOFLOP, (relay,), BrickletDualRelay.CODEC_GET_MONOFLOP_REQUEST, 17, BrickletDualRelay.CODEC_GET_MONOFLOP_RESPONSE))
+
+    async def set_selected_state(self, relay, state):
+        """
+        Sets the state of the selected relay (1 or 2), *true* means on and *false* means off.
+
+        A running monoflop timer for the selected relay will be aborted if this function is called.
+
+        The other relay remains untouched.
+        """
+        await self.check_validity()
+
+        relay = int(relay)
+        state = bool(state)
+
+        await self.ipcon.send_request(self, BrickletDualRelay.FUNCTION_SET_SELECTED_STATE, (relay, state), BrickletDualRelay.CODEC_SET_SELECTED_STATE_REQUEST, 0, '')
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletDualRelay.FUNCTION_GET_IDENTITY, (), '', 33, BrickletDualRelay.CODEC_GET_IDENTITY_RESPONSE))
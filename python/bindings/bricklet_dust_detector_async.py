@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_dust_detector import BrickletDustDetector, GetDustDensityCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_dust_detector import BrickletDustDetector, GetDustDensityCallbackThreshold, GetIdentity
+
+class BrickletDustDetectorAsync(AsyncDevice, BrickletDustDetector):
+    """
+    Measures dust density
+
+    asyncio variant of BrickletDustDetector for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_dust_density(self):
+        """
+        Returns the dust density.
+
+        If you want to get the dust density periodically, it is recommended
+        to use the :cb:`Dust Density` callback and set the period with
+        :func:`Set Dust Density Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDustDetector.FUNCTION_GET_DUST_DENSITY, (), '', 10, BrickletDustDetector.CODEC_GET_DUST_DENSITY_RESPONSE)
+
+    async def set_dust_density_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Dust Density` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Dust Density` callback is only triggered if the dust density has
+        changed since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletDustDetector.FUNCTION_SET_DUST_DENSITY_CALLBACK_PERIOD, (period,), BrickletDustDetector.CODEC_SET_DUST_DENSITY_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_dust_density_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Dust Density Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDustDetector.FUNCTION_GET_DUST_DENSITY_CALLBACK_PERIOD, (), '', 12, BrickletDustDetector.CODEC_GET_DUST_DENSITY_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_dust_density_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Dust Density Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the dust density value is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the dust density value is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the dust density value is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the dust density value is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletDustDetector.FUNCTION_SET_DUST_DENSITY_CALLBACK_THRESHOLD, (option, min, max), BrickletDustDetector.CODEC_SET_DUST_DENSITY_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_dust_density_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Dust Density Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetDustDensityCallbackThreshold(*await self.ipcon.send_request(self, BrickletDustDetector.FUNCTION_GET_DUST_DENSITY_CALLBACK_THRESHOLD, (), '', 13, BrickletDustDetector.CODEC_GET_DUST_DENSITY_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callback
+
+        * :cb:`Dust Density Reached`
+
+        is triggered, if the threshold
+
+        * :func:`Set Dust Density Callback Threshold`
+
+        keeps being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletDustDetector.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletDustDetector.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDustDetector.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletDustDetector.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_moving_average(self, average):
+        """
+        Sets the length of a `moving averaging <https://en.wikipedia.org/wiki/Moving_average>`__
+        for the dust density.
+
+        Setting the length to 0 will turn the averaging completely off. With less
+        averaging, there is more noise on the data.
+        """
+        await self.check_validity()
+
+        average = int(average)
+
+        await self.ipcon.send_request(self, BrickletDustDetector.FUNCTION_SET_MOVING_AVERAGE, (average,), BrickletDustDetector.CODEC_SET_MOVING_AVERAGE_REQUEST, 0, '')
+
+    async def get_moving_average(self):
+        """
+        Returns the length moving average as set by :func:`Set Moving Average`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletDustDetector.FUNCTION_GET_MOVING_AVERAGE, (), '', 9, BrickletDustDetector.CODEC_GET_MOVING_AVERAGE_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletDustDetector.FUNCTION_GET_IDENTITY, (), '', 33, BrickletDustDetector.CODEC_GET_IDENTITY_RESPONSE))
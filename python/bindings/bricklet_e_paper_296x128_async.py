@@ -0,0 +1,662 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_e_paper_296x128 import BrickletEPaper296x128, ReadBlackWhiteLowLevel, ReadColorLowLevel, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_e_paper_296x128 import BrickletEPaper296x128, ReadBlackWhiteLowLevel, ReadColorLowLevel, GetSPITFPErrorCount, GetIdentity
+
+class BrickletEPaper296x128Async(AsyncDevice, BrickletEPaper296x128):
+    """
+    Three color 296x128 e-paper display
+
+    asyncio variant of BrickletEPaper296x128 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def draw(self):
+        """
+        Draws the current black/white and red or gray buffer to the e-paper display.
+
+        The Bricklet does not have any double-buffering. You should not call
+        this function while writing to the buffer. See :func:`Get Draw Status`.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_DRAW, (), '', 0, '')
+
+    async def get_draw_status(self):
+        """
+        Returns one of three draw statuses:
+
+        * Idle
+        * Copying: Data is being copied from the buffer of the Bricklet to the buffer of the display.
+        * Drawing: The display is updating its content (during this phase the flickering etc happens).
+
+        You can write to the buffer (through one of the write or draw functions) when the status is
+        either *idle* or *drawing*. You should not write to the buffer while it is being *copied* to the
+        display. There is no double-buffering.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_GET_DRAW_STATUS, (), '', 9, BrickletEPaper296x128.CODEC_GET_DRAW_STATUS_RESPONSE)
+
+    async def write_black_white_low_level(self, x_start, y_start, x_end, y_end, pixels_length, pixels_chunk_offset, pixels_chunk_data):
+        """
+        Writes black/white pixels to the specified window into the buffer.
+
+        The pixels are written into the window line by line top to bottom
+        and each line is written from left to right.
+
+        The value 0 (false) corresponds to a black pixel and the value 1 (true) to a
+        white pixel.
+
+        This function writes the pixels into the black/white pixel buffer, to draw the
+        buffer to the display use :func:`Draw`.
+
+        Use :func:`Write Color` to write red or gray pixels.
+        """
+        await self.check_validity()
+
+        x_start = int(x_start)
+        y_start = int(y_start)
+        x_end = int(x_end)
+        y_end = int(y_end)
+        pixels_length = int(pixels_length)
+        pixels_chunk_offset = int(pixels_chunk_offset)
+        pixels_chunk_data = list(map(bool, pixels_chunk_data))
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_WRITE_BLACK_WHITE_LOW_LEVEL, (x_start, y_start, x_end, y_end, pixels_length, pixels_chunk_offset, pixels_chunk_data), BrickletEPaper296x128.CODEC_WRITE_BLACK_WHITE_LOW_LEVEL_REQUEST, 0, '')
+
+    async def read_black_white_low_level(self, x_start, y_start, x_end, y_end):
+        """
+        Returns the current content of the black/white pixel buffer for the specified window.
+
+        The pixels are read into the window line by line top to bottom and
+        each line is read from left to right.
+
+        The current content of the buffer does not have to be the current content of the display.
+        It is possible that the data was not drawn to the display yet and after a restart of
+        the Bricklet the buffer will be reset to black, while the display retains its content.
+        """
+        await self.check_validity()
+
+        x_start = int(x_start)
+        y_start = int(y_start)
+        x_end = int(x_end)
+        y_end = int(y_end)
+
+        return ReadBlackWhiteLowLevel(*await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_READ_BLACK_WHITE_LOW_LEVEL, (x_start, y_start, x_end, y_end), BrickletEPaper296x128.CODEC_READ_BLACK_WHITE_LOW_LEVEL_REQUEST, 70, BrickletEPaper296x128.CODEC_READ_BLACK_WHITE_LOW_LEVEL_RESPONSE))
+
+    async def write_color_low_level(self, x_start, y_start, x_end, y_end, pixels_length, pixels_chunk_offset, pixels_chunk_data):
+        """
+        The E-Paper 296x128 Bricklet is available with the colors black/white/red and
+        black/white/gray. Depending on the model this function writes either red or
+        gray pixels to the specified window into the buffer.
+
+        The pixels are written into the window line by line top to bottom
+        and each line is written from left to right.
+
+        The value 0 (false) means that this pixel does not have color. It will be either black
+        or white (see :func:`Write Black White`). The value 1 (true) corresponds to a red or gray
+        pixel, depending on the Bricklet model.
+
+        This function writes the pixels into the red or gray pixel buffer, to draw the buffer
+        to the display use :func:`Draw`.
+
+        Use :func:`Write Black White` to write black/white pixels.
+        """
+        await self.check_validity()
+
+        x_start = int(x_start)
+        y_start = int(y_start)
+        x_end = int(x_end)
+        y_end = int(y_end)
+        pixels_length = int(pixels_length)
+        pixels_chunk_offset = int(pixels_chunk_offset)
+        pixels_chunk_data = list(map(bool, pixels_chunk_data))
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_WRITE_COLOR_LOW_LEVEL, (x_start, y_start, x_end, y_end, pixels_length, pixels_chunk_offset, pixels_chunk_data), BrickletEPaper296x128.CODEC_WRITE_COLOR_LOW_LEVEL_REQUEST, 0, '')
+
+    async def read_color_low_level(self, x_start, y_start, x_end, y_end):
+        """
+        Returns the current content of the red or gray pixel buffer for the specified window.
+
+        The pixels are written into the window line by line top to bottom
+        and each line is written from left to right.
+
+        The current content of the buffer does not have to be the current content of the display.
+        It is possible that the data was not drawn to the display yet and after a restart of
+        the Bricklet the buffer will be reset to black, while the display retains its content.
+        """
+        await self.check_validity()
+
+        x_start = int(x_start)
+        y_start = int(y_start)
+        x_end = int(x_end)
+        y_end = int(y_end)
+
+        return ReadColorLowLevel(*await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_READ_COLOR_LOW_LEVEL, (x_start, y_start, x_end, y_end), BrickletEPaper296x128.CODEC_READ_COLOR_LOW_LEVEL_REQUEST, 70, BrickletEPaper296x128.CODEC_READ_COLOR_LOW_LEVEL_RESPONSE))
+
+    async def fill_display(self, color):
+        """
+        Fills the complete content of the display with the given color.
+
+        This function writes the pixels into the black/white/red|gray pixel buffer, to draw the buffer
+        to the display use :func:`Draw`.
+        """
+        await self.check_validity()
+
+        color = int(color)
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_FILL_DISPLAY, (color,), BrickletEPaper296x128.CODEC_FILL_DISPLAY_REQUEST, 0, '')
+
+    async def draw_text(self, position_x, position_y, font, color, orientation, text):
+        """
+        Draws a text with up to 50 characters at the pixel position (x, y).
+
+        You can use one of 9 different font sizes and draw the text in
+        black/white/red|gray. The text can be drawn horizontal or vertical.
+
+        This function writes the pixels into the black/white/red|gray pixel buffer, to draw the buffer
+        to the display use :func:`Draw`.
+        """
+        await self.check_validity()
+
+        position_x = int(position_x)
+        position_y = int(position_y)
+        font = int(font)
+        color = int(color)
+        orientation = int(orientation)
+        text = create_string(text)
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_DRAW_TEXT, (position_x, position_y, font, color, orientation, text), BrickletEPaper296x128.CODEC_DRAW_TEXT_REQUEST, 0, '')
+
+    async def draw_line(self, position_x_start, position_y_start, position_x_end, position_y_end, color):
+        """
+        Draws a line from (x, y)-start to (x, y)-end in the given color.
+
+        This function writes the pixels into the black/white/red|gray pixel buffer, to draw the buffer
+        to the display use :func:`Draw`.
+        """
+        await self.check_validity()
+
+        position_x_start = int(position_x_start)
+        position_y_start = int(position_y_start)
+        position_x_end = int(position_x_end)
+        position_y_end = int(position_y_end)
+        color = int(color)
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_DRAW_LINE, (position_x_start, position_y_start, position_x_end, position_y_end, color), BrickletEPaper296x128.CODEC_DRAW_LINE_REQUEST, 0, '')
+
+    async def draw_box(self, position_x_start, position_y_start, position_x_end, position_y_end, fill, color):
+        """
+        Draws a box from (x, y)-start to (x, y)-end in the given color.
+
+        If you set fill to true, the box will be filled with the
+        color. Otherwise only the outline will be drawn.
+
+        This function writes the pixels into the black/white/red|gray pixel buffer, to draw the buffer
+        to the display use :func:`Draw`.
+        """
+        await self.check_validity()
+
+        position_x_start = int(position_x_start)
+        position_y_start = int(position_y_start)
+        position_x_end = int(position_x_end)
+        position_y_end = int(position_y_end)
+        fill = bool(fill)
+        color = int(color)
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_DRAW_BOX, (position_x_start, position_y_start, position_x_end, position_y_end, fill, color), BrickletEPaper296x128.CODEC_DRAW_BOX_REQUEST, 0, '')
+
+    async def set_update_mode(self, update_mode):
+        """
+        .. note::
+         The default update mode corresponds to the default e-paper display
+         manufacturer settings. All of the other modes are experimental and
+         will result in increased ghosting and possibly other long-term
+         side effects.
+
+         If you want to know more about the inner workings of an e-paper display
+         take a look at this excellent video from Ben Krasnow:
+         `https://www.youtube.com/watch?v=MsbiO8EAsGw <https://www.youtube.com/watch?v=MsbiO8EAsGw>`__.
+
+         If you are not sure about this option, leave the update mode at default.
+
+        Currently there are three update modes available:
+
+        * Default: Settings as given by the manufacturer. An update will take about
+          7.5 seconds and during the update the screen will flicker several times.
+        * Black/White: This will only update the black/white pixel. It uses the manufacturer
+          settings for black/white and ignores the red or gray pixel buffer. With this mode the
+          display will flicker once and it takes about 2.5 seconds. Compared to the default settings
+          there is more ghosting.
+        * Delta: This will only update the black/white pixel. It uses an aggressive method where
+          the changes are not applied for a whole buffer but only for the delta between the last
+          and the next buffer. With this mode the display will not flicker during an update and
+          it takes about 900-950ms. Compared to the other two settings there is more ghosting. This
+          mode can be used for something like a flicker-free live update of a text.
+
+        With the black/white/red display if you use either the black/white or the delta mode,
+        after a while of going back and forth between black and white the white color will
+        start to appear red-ish or pink-ish.
+
+        If you use the aggressive delta mode and rapidly change the content, we recommend that you
+        change back to the default mode every few hours and in the default mode cycle between the
+        three available colors a few times. This will get rid of the ghosting and after that you can
+        go back to the delta mode with flicker-free updates.
+        """
+        await self.check_validity()
+
+        update_mode = int(update_mode)
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_SET_UPDATE_MODE, (update_mode,), BrickletEPaper296x128.CODEC_SET_UPDATE_MODE_REQUEST, 0, '')
+
+    async def get_update_mode(self):
+        """
+        Returns the update mode as set by :func:`Set Update Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_GET_UPDATE_MODE, (), '', 9, BrickletEPaper296x128.CODEC_GET_UPDATE_MODE_RESPONSE)
+
+    async def set_display_type(self, display_type):
+        """
+        Sets the type of the display. The e-paper display is available
+        in black/white/red and black/white/gray. This will be factory set
+        during the flashing and testing phase. The value is saved in
+        non-volatile memory and will stay after a power cycle.
+        """
+        await self.check_validity()
+
+        display_type = int(display_type)
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_SET_DISPLAY_TYPE, (display_type,), BrickletEPaper296x128.CODEC_SET_DISPLAY_TYPE_REQUEST, 0, '')
+
+    async def get_display_type(self):
+        """
+        Returns the type of the e-paper display. It can either be
+        black/white/red or black/white/gray.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_GET_DISPLAY_TYPE, (), '', 9, BrickletEPaper296x128.CODEC_GET_DISPLAY_TYPE_RESPONSE)
+
+    async def set_display_driver(self, display_driver):
+        """
+        Sets the type of display driver. The Bricklet can currently support
+        SSD1675A and SSD1680. This will be factory set
+        during the flashing and testing phase. The value is saved in
+        non-volatile memory and will stay after a power cycle.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        display_driver = int(display_driver)
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_SET_DISPLAY_DRIVER, (display_driver,), BrickletEPaper296x128.CODEC_SET_DISPLAY_DRIVER_REQUEST, 0, '')
+
+    async def get_display_driver(self):
+        """
+        Returns the e-paper display driver.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_GET_DISPLAY_DRIVER, (), '', 9, BrickletEPaper296x128.CODEC_GET_DISPLAY_DRIVER_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletEPaper296x128.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletEPaper296x128.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletEPaper296x128.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletEPaper296x128.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletEPaper296x128.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_WRITE_FIRMWARE, (data,), BrickletEPaper296x128.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletEPaper296x128.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletEPaper296x128.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletEPaper296x128.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletEPaper296x128.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_WRITE_UID, (uid,), BrickletEPaper296x128.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_READ_UID, (), '', 12, BrickletEPaper296x128.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_GET_IDENTITY, (), '', 33, BrickletEPaper296x128.CODEC_GET_IDENTITY_RESPONSE))
+
+    async def write_black_white(self, x_start, y_start, x_end, y_end, pixels):
+        """
+        Writes black/white pixels to the specified window into the buffer.
+
+        The pixels are written into the window line by line top to bottom
+        and each line is written from left to right.
+
+        The value 0 (false) corresponds to a black pixel and the value 1 (true) to a
+        white pixel.
+
+        This function writes the pixels into the black/white pixel buffer, to draw the
+        buffer to the display use :func:`Draw`.
+
+        Use :func:`Write Color` to write red or gray pixels.
+        """
+        x_start = int(x_start)
+        y_start = int(y_start)
+        x_end = int(x_end)
+        y_end = int(y_end)
+        pixels = create_number_list(pixels, bool)
+
+        if len(pixels) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Pixels can be at most 65535 items long')
+
+        pixels_length = len(pixels)
+        pixels_chunk_offset = 0
+
+        if pixels_length == 0:
+            pixels_chunk_data = [False] * 432
+            ret = await self.write_black_white_low_level(x_start, y_start, x_end, y_end, pixels_length, pixels_chunk_offset, pixels_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while pixels_chunk_offset < pixels_length:
+                    pixels_chunk_data = create_chunk_data(pixels, pixels_chunk_offset, 432, False)
+                    requests.append((x_start, y_start, x_end, y_end, pixels_length, pixels_chunk_offset, pixels_chunk_data))
+                    pixels_chunk_offset += 432
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletEPaper296x128.FUNCTION_WRITE_BLACK_WHITE_LOW_LEVEL, requests, BrickletEPaper296x128.CODEC_WRITE_BLACK_WHITE_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def read_black_white(self, x_start, y_start, x_end, y_end):
+        """
+        Returns the current content of the black/white pixel buffer for the specified window.
+
+        The pixels are read into the window line by line top to bottom and
+        each line is read from left to right.
+
+        The current content of the buffer does not have to be the current content of the display.
+        It is possible that the data was not drawn to the display yet and after a restart of
+        the Bricklet the buffer will be reset to black, while the display retains its content.
+        """
+        x_start = int(x_start)
+        y_start = int(y_start)
+        x_end = int(x_end)
+        y_end = int(y_end)
+
+        await self.check_validity()
+
+        pixels_codec = self.get_stream_codec(BrickletEPaper296x128.CODEC_READ_BLACK_WHITE_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = ReadBlackWhiteLowLevel(*await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_READ_BLACK_WHITE_LOW_LEVEL, (x_start, y_start, x_end, y_end), BrickletEPaper296x128.CODEC_READ_BLACK_WHITE_LOW_LEVEL_REQUEST, 70, pixels_codec))
+            pixels_length = ret.pixels_length
+            pixels_out_of_sync = ret.pixels_chunk_offset != 0
+            pixels_data = self.create_stream_reassembler(pixels_length, '!')
+            pixels_data.add_chunk(ret.pixels_chunk_data)
+
+            while not pixels_out_of_sync and pixels_data.offset < pixels_length:
+                ret = ReadBlackWhiteLowLevel(*await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_READ_BLACK_WHITE_LOW_LEVEL, (x_start, y_start, x_end, y_end), BrickletEPaper296x128.CODEC_READ_BLACK_WHITE_LOW_LEVEL_REQUEST, 70, pixels_codec))
+                pixels_length = ret.pixels_length
+                pixels_out_of_sync = ret.pixels_chunk_offset != pixels_data.offset
+                pixels_data.add_chunk(ret.pixels_chunk_data)
+
+            if pixels_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.pixels_chunk_offset + 464 < pixels_length:
+                    ret = ReadBlackWhiteLowLevel(*await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_READ_BLACK_WHITE_LOW_LEVEL, (x_start, y_start, x_end, y_end), BrickletEPaper296x128.CODEC_READ_BLACK_WHITE_LOW_LEVEL_REQUEST, 70, pixels_codec))
+                    pixels_length = ret.pixels_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Pixels stream is out-of-sync')
+
+        return pixels_data.get_data(pixels_length)
+
+    async def write_color(self, x_start, y_start, x_end, y_end, pixels):
+        """
+        The E-Paper 296x128 Bricklet is available with the colors black/white/red and
+        black/white/gray. Depending on the model this function writes either red or
+        gray pixels to the specified window into the buffer.
+
+        The pixels are written into the window line by line top to bottom
+        and each line is written from left to right.
+
+        The value 0 (false) means that this pixel does not have color. It will be either black
+        or white (see :func:`Write Black White`). The value 1 (true) corresponds to a red or gray
+        pixel, depending on the Bricklet model.
+
+        This function writes the pixels into the red or gray pixel buffer, to draw the buffer
+        to the display use :func:`Draw`.
+
+        Use :func:`Write Black White` to write black/white pixels.
+        """
+        x_start = int(x_start)
+        y_start = int(y_start)
+        x_end = int(x_end)
+        y_end = int(y_end)
+        pixels = create_number_list(pixels, bool)
+
+        if len(pixels) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Pixels can be at most 65535 items long')
+
+        pixels_length = len(pixels)
+        pixels_chunk_offset = 0
+
+        if pixels_length == 0:
+            pixels_chunk_data = [False] * 432
+            ret = await self.write_color_low_level(x_start, y_start, x_end, y_end, pixels_length, pixels_chunk_offset, pixels_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while pixels_chunk_offset < pixels_length:
+                    pixels_chunk_data = create_chunk_data(pixels, pixels_chunk_offset, 432, False)
+                    requests.append((x_start, y_start, x_end, y_end, pixels_length, pixels_chunk_offset, pixels_chunk_data))
+                    pixels_chunk_offset += 432
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletEPaper296x128.FUNCTION_WRITE_COLOR_LOW_LEVEL, requests, BrickletEPaper296x128.CODEC_WRITE_COLOR_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def read_color(self, x_start, y_start, x_end, y_end):
+        """
+        Returns the current content of the red or gray pixel buffer for the specified window.
+
+        The pixels are written into the window line by line top to bottom
+        and each line is written from left to right.
+
+        The current content of the buffer does not have to be the current content of the display.
+        It is possible that the data was not drawn to the display yet and after a restart of
+        the Bricklet the buffer will be reset to black, while the display retains its content.
+        """
+        x_start = int(x_start)
+        y_start = int(y_start)
+        x_end = int(x_end)
+        y_end = int(y_end)
+
+        await self.check_validity()
+
+        pixels_codec = self.get_stream_codec(BrickletEPaper296x128.CODEC_READ_COLOR_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = ReadColorLowLevel(*await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_READ_COLOR_LOW_LEVEL, (x_start, y_start, x_end, y_end), BrickletEPaper296x128.CODEC_READ_COLOR_LOW_LEVEL_REQUEST, 70, pixels_codec))
+            pixels_length = ret.pixels_length
+            pixels_out_of_sync = ret.pixels_chunk_offset != 0
+            pixels_data = self.create_stream_reassembler(pixels_length, '!')
+            pixels_data.add_chunk(ret.pixels_chunk_data)
+
+            while not pixels_out_of_sync and pixels_data.offset < pixels_length:
+                ret = ReadColorLowLevel(*await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_READ_COLOR_LOW_LEVEL, (x_start, y_start, x_end, y_end), BrickletEPaper296x128.CODEC_READ_COLOR_LOW_LEVEL_REQUEST, 70, pixels_codec))
+                pixels_length = ret.pixels_length
+                pixels_out_of_sync = ret.pixels_chunk_offset != pixels_data.offset
+                pixels_data.add_chunk(ret.pixels_chunk_data)
+
+            if pixels_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.pixels_chunk_offset + 464 < pixels_length:
+                    ret = ReadColorLowLevel(*await self.ipcon.send_request(self, BrickletEPaper296x128.FUNCTION_READ_COLOR_LOW_LEVEL, (x_start, y_start, x_end, y_end), BrickletEPaper296x128.CODEC_READ_COLOR_LOW_LEVEL_REQUEST, 70, pixels_codec))
+                    pixels_length = ret.pixels_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Pixels stream is out-of-sync')
+
+        return pixels_data.get_data(pixels_length)
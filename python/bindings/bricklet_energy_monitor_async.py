@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_energy_monitor import BrickletEnergyMonitor, GetEnergyData, GetWaveformLowLevel, GetTransformerStatus, GetTransformerCalibration, GetEnergyDataCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_energy_monitor import BrickletEnergyMonitor, GetEnergyData, GetWaveformLowLevel, GetTransformerStatus, GetTransformerCalibration, GetEnergyDataCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletEnergyMonitorAsync(AsyncDevice, BrickletEnergyMonitor):
+    """
+    Measures Voltage, Current, Energy, Real/Apparent/Reactive Power, Power Factor and Frequency
+
+    asyncio variant of BrickletEnergyMonitor for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_energy_data(self):
+        """
+        Returns all of the measurements that are done by the Energy Monitor Bricklet.
+
+        * Voltage RMS
+        * Current RMS
+        * Energy (integrated over time)
+        * Real Power
+        * Apparent Power
+        * Reactive Power
+        * Power Factor
+        * Frequency (AC Frequency of the mains voltage)
+
+        The frequency is recalculated every 6 seconds.
+
+        All other values are integrated over 10 zero-crossings of the voltage sine wave.
+        With a standard AC mains voltage frequency of 50Hz this results in a 5 measurements
+        per second (or an integration time of 200ms per measurement).
+
+        If no voltage transformer is connected, the Bricklet will use the current waveform
+        to calculate the frequency and it will use an integration time of
+        10 zero-crossings of the current waveform.
+        """
+        await self.check_validity()
+
+        return GetEnergyData(*await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_GET_ENERGY_DATA, (), '', 36, BrickletEnergyMonitor.CODEC_GET_ENERGY_DATA_RESPONSE))
+
+    async def reset_energy(self):
+        """
+        Sets the energy value (see :func:`Get Energy Data`) back to 0Wh.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_RESET_ENERGY, (), '', 0, '')
+
+    async def get_waveform_low_level(self):
+        """
+        Returns a snapshot of the voltage and current waveform. The values
+        in the returned array alternate between voltage and current. The data from
+        one getter call contains 768 data points for voltage and current, which
+        correspond to about 3 full sine waves.
+
+        The voltage is given with a resolution of 100mV and the current is given
+        with a resolution of 10mA.
+
+        This data is meant to be used for a non-realtime graphical representation of
+        the voltage and current waveforms.
+        """
+        await self.check_validity()
+
+        return GetWaveformLowLevel(*await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_GET_WAVEFORM_LOW_LEVEL, (), '', 70, BrickletEnergyMonitor.CODEC_GET_WAVEFORM_LOW_LEVEL_RESPONSE))
+
+    async def get_transformer_status(self):
+        """
+        Returns *true* if a voltage/current transformer is connected to the Bricklet.
+        """
+        await self.check_validity()
+
+        return GetTransformerStatus(*await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_GET_TRANSFORMER_STATUS, (), '', 10, BrickletEnergyMonitor.CODEC_GET_TRANSFORMER_STATUS_RESPONSE))
+
+    async def set_transformer_calibration(self, voltage_ratio, current_ratio, phase_shift):
+        """
+        Sets the transformer ratio for the voltage and current transformer in 1/100 form.
+
+        Example: If your mains voltage is 230V, you use 9V voltage transformer and a
+        1V:30A current clamp your voltage ratio is 230/9 = 25.56 and your current ratio
+        is 30/1 = 30.
+
+        In this case you have to set the values 2556 and 3000 for voltage ratio and current
+        ratio.
+
+        The calibration is saved in non-volatile memory, you only have to set it once.
+
+        Set the phase shift to 0. It is for future use and currently not supported by the Bricklet.
+        """
+        await self.check_validity()
+
+        voltage_ratio = int(voltage_ratio)
+        current_ratio = int(current_ratio)
+        phase_shift = int(phase_shift)
+
+        await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_SET_TRANSFORMER_CALIBRATION, (voltage_ratio, current_ratio, phase_shift), BrickletEnergyMonitor.CODEC_SET_TRANSFORMER_CALIBRATION_REQUEST, 0, '')
+
+    async def get_transformer_calibration(self):
+        """
+        Returns the transformer calibration as set by :func:`Set Transformer Calibration`.
+        """
+        await self.check_validity()
+
+        return GetTransformerCalibration(*await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_GET_TRANSFORMER_CALIBRATION, (), '', 14, BrickletEnergyMonitor.CODEC_GET_TRANSFORMER_CALIBRATION_RESPONSE))
+
+    async def calibrate_offset(self):
+        """
+        Calling this function will start an offset calibration. The offset calibration will
+        integrate the voltage and current waveform over a longer time period to find the 0
+        transition point in the sine wave.
+
+        The Bricklet comes with a factory-calibrated offset value, you should not have to
+        call this function.
+
+        If you want to re-calibrate the offset we recommend that you connect a load that
+        has a smooth sinusoidal voltage and current waveform. Alternatively you can also
+        short both inputs.
+
+        The calibration is saved in non-volatile memory, you only have to set it once.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_CALIBRATE_OFFSET, (), '', 0, '')
+
+    async def set_energy_data_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`Energy Data`
+        callback is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_SET_ENERGY_DATA_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletEnergyMonitor.CODEC_SET_ENERGY_DATA_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_energy_data_callback_configuration(self):
+        """
+        Returns the callback configuration as set by
+        :func:`Set Energy Data Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetEnergyDataCallbackConfiguration(*await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_GET_ENERGY_DATA_CALLBACK_CONFIGURATION, (), '', 13, BrickletEnergyMonitor.CODEC_GET_ENERGY_DATA_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletEnergyMonitor.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletEnergyMonitor.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletEnergyMonitor.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletEnergyMonitor.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletEnergyMonitor.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_WRITE_FIRMWARE, (data,), BrickletEnergyMonitor.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletEnergyMonitor.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletEnergyMonitor.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletEnergyMonitor.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletEnergyMonitor.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_WRITE_UID, (uid,), BrickletEnergyMonitor.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_READ_UID, (), '', 12, BrickletEnergyMonitor.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_GET_IDENTITY, (), '', 33, BrickletEnergyMonitor.CODEC_GET_IDENTITY_RESPONSE))
+
+    async def get_waveform(self):
+        """
+        Returns a snapshot of the voltage and current waveform. The values
+        in the returned array alternate between voltage and current. The data from
+        one getter call contains 768 data points for voltage and current, which
+        correspond to about 3 full sine waves.
+
+        The voltage is given with a resolution of 100mV and the current is given
+        with a resolution of 10mA.
+
+        This data is meant to be used for a non-realtime graphical representation of
+        the voltage and current waveforms.
+        """
+        waveform_length = 1536
+
+        await self.check_validity()
+
+        waveform_codec = self.get_stream_codec(BrickletEnergyMonitor.CODEC_GET_WAVEFORM_LOW_LEVEL_RESPONSE, 1)
+
+        async with self.stream_lock:
+            ret = GetWaveformLowLevel(*await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_GET_WAVEFORM_LOW_LEVEL, (), '', 70, waveform_codec))
+
+            if ret.waveform_chunk_offset == (1 << 16) - 1: # maximum chunk offset -> stream has no data
+                waveform_length = 0
+                waveform_out_of_sync = False
+                waveform_data = self.create_stream_reassembler(0, 'h')
+            else:
+                waveform_out_of_sync = ret.waveform_chunk_offset != 0
+                waveform_data = self.create_stream_reassembler(waveform_length, 'h')
+                waveform_data.add_chunk(ret.waveform_chunk_data)
+
+            while not waveform_out_of_sync and waveform_data.offset < waveform_length:
+                ret = GetWaveformLowLevel(*await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_GET_WAVEFORM_LOW_LEVEL, (), '', 70, waveform_codec))
+                waveform_out_of_sync = ret.waveform_chunk_offset != waveform_data.offset
+                waveform_data.add_chunk(ret.waveform_chunk_data)
+
+            if waveform_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.waveform_chunk_offset + 30 < waveform_length:
+                    ret = GetWaveformLowLevel(*await self.ipcon.send_request(self, BrickletEnergyMonitor.FUNCTION_GET_WAVEFORM_LOW_LEVEL, (), '', 70, waveform_codec))
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Waveform stream is out-of-sync')
+
+        return waveform_data.get_data(waveform_length)
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+#### __DEVICE_IS_NOT_RELEASED__ ####
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_evse import BrickletEVSE, GetState, GetHardwareConfiguration, GetLowLevelState, GetMaxChargingCurrent, GetUserCalibration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_evse import BrickletEVSE, GetState, GetHardwareConfiguration, GetLowLevelState, GetMaxChargingCurrent, GetUserCalibration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletEVSEAsync(AsyncDevice, BrickletEVSE):
+    """
+    TBD
+
+    asyncio variant of BrickletEVSE for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_state(self):
+        """
+        TODO
+
+        .. versionadded:: 2.0.5$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return GetState(*await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_GET_STATE, (), '', 25, BrickletEVSE.CODEC_GET_STATE_RESPONSE))
+
+    async def get_hardware_configuration(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return GetHardwareConfiguration(*await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_GET_HARDWARE_CONFIGURATION, (), '', 10, BrickletEVSE.CODEC_GET_HARDWARE_CONFIGURATION_RESPONSE))
+
+    async def get_low_level_state(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return GetLowLevelState(*await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_GET_LOW_LEVEL_STATE, (), '', 31, BrickletEVSE.CODEC_GET_LOW_LEVEL_STATE_RESPONSE))
+
+    async def set_max_charging_current(self, max_current):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        max_current = int(max_current)
+
+        await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_SET_MAX_CHARGING_CURRENT, (max_current,), BrickletEVSE.CODEC_SET_MAX_CHARGING_CURRENT_REQUEST, 0, '')
+
+    async def get_max_charging_current(self):
+        """
+        * Max Current Configured -> set with :func:`Set Max Charging Current`
+        * Max Current Incoming Cable -> set with jumper on EVSE
+        * Max Current Outgoing Cable -> set with resistor between PP/PE (if fixed cable is used)
+
+        TODO
+
+        .. versionadded:: 2.0.6$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return GetMaxChargingCurrent(*await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_GET_MAX_CHARGING_CURRENT, (), '', 16, BrickletEVSE.CODEC_GET_MAX_CHARGING_CURRENT_RESPONSE))
+
+    async def calibrate(self, state, password, value):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        state = int(state)
+        password = int(password)
+        value = int(value)
+
+        return await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_CALIBRATE, (state, password, value), BrickletEVSE.CODEC_CALIBRATE_REQUEST, 9, BrickletEVSE.CODEC_CALIBRATE_RESPONSE)
+
+    async def start_charging(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_START_CHARGING, (), '', 0, '')
+
+    async def stop_charging(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_STOP_CHARGING, (), '', 0, '')
+
+    async def set_charging_autostart(self, autostart):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        autostart = bool(autostart)
+
+        await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_SET_CHARGING_AUTOSTART, (autostart,), BrickletEVSE.CODEC_SET_CHARGING_AUTOSTART_REQUEST, 0, '')
+
+    async def get_charging_autostart(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_GET_CHARGING_AUTOSTART, (), '', 9, BrickletEVSE.CODEC_GET_CHARGING_AUTOSTART_RESPONSE)
+
+    async def get_managed(self):
+        """
+        TODO
+
+        .. versionadded:: 2.0.6$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_GET_MANAGED, (), '', 9, BrickletEVSE.CODEC_GET_MANAGED_RESPONSE)
+
+    async def set_managed(self, managed, password):
+        """
+        TODO
+
+        .. versionadded:: 2.0.6$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        managed = bool(managed)
+        password = int(password)
+
+        await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_SET_MANAGED, (managed, password), BrickletEVSE.CODEC_SET_MANAGED_REQUEST, 0, '')
+
+    async def set_managed_current(self, current):
+        """
+        TODO
+
+        .. versionadded:: 2.0.6$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        current = int(current)
+
+        await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_SET_MANAGED_CURRENT, (current,), BrickletEVSE.CODEC_SET_MANAGED_CURRENT_REQUEST, 0, '')
+
+    async def get_user_calibration(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return GetUserCalibration(*await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_GET_USER_CALIBRATION, (), '', 45, BrickletEVSE.CODEC_GET_USER_CALIBRATION_RESPONSE))
+
+    async def set_user_calibration(self, password, user_calibration_active, voltage_diff, voltage_mul, voltage_div, resistance_2700, resistance_880):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        password = int(password)
+        user_calibration_active = bool(user_calibration_active)
+        voltage_diff = int(voltage_diff)
+        voltage_mul = int(voltage_mul)
+        voltage_div = int(voltage_div)
+        resistance_2700 = int(resistance_2700)
+        resistance_880 = list(map(int, resistance_880))
+
+        await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_SET_USER_CALIBRATION, (password, user_calibration_active, voltage_diff, voltage_mul, voltage_div, resistance_2700, resistance_880), BrickletEVSE.CODEC_SET_USER_CALIBRATION_REQUEST, 0, '')
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletEVSE.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletEVSE.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletEVSE.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletEVSE.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletEVSE.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_WRITE_FIRMWARE, (data,), BrickletEVSE.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletEVSE.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletEVSE.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletEVSE.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletEVSE.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_WRITE_UID, (uid,), BrickletEVSE.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_READ_UID, (), '', 12, BrickletEVSE.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletEVSE.FUNCTION_GET_IDENTITY, (), '', 33, BrickletEVSE.CODEC_GET_IDENTITY_RESPONSE))
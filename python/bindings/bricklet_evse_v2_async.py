@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+#### __DEVICE_IS_NOT_RELEASED__ ####
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_evse_v2 import BrickletEVSEV2, GetState, GetHardwareConfiguration, GetLowLevelState, GetMaxChargingCurrent, GetEnergyMeterValues, GetEnergyMeterState, GetGPIOConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_evse_v2 import BrickletEVSEV2, GetState, GetHardwareConfiguration, GetLowLevelState, GetMaxChargingCurrent, GetEnergyMeterValues, GetEnergyMeterState, GetGPIOConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletEVSEV2Async(AsyncDevice, BrickletEVSEV2):
+    """
+    TBD
+
+    asyncio variant of BrickletEVSEV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_state(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return GetState(*await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_STATE, (), '', 25, BrickletEVSEV2.CODEC_GET_STATE_RESPONSE))
+
+    async def get_hardware_configuration(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return GetHardwareConfiguration(*await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_HARDWARE_CONFIGURATION, (), '', 10, BrickletEVSEV2.CODEC_GET_HARDWARE_CONFIGURATION_RESPONSE))
+
+    async def get_low_level_state(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return GetLowLevelState(*await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_LOW_LEVEL_STATE, (), '', 42, BrickletEVSEV2.CODEC_GET_LOW_LEVEL_STATE_RESPONSE))
+
+    async def set_max_charging_current(self, max_current):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        max_current = int(max_current)
+
+        await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_SET_MAX_CHARGING_CURRENT, (max_current,), BrickletEVSEV2.CODEC_SET_MAX_CHARGING_CURRENT_REQUEST, 0, '')
+
+    async def get_max_charging_current(self):
+        """
+        * Max Current Configured -> set with :func:`Set Max Charging Current`
+        * Max Current Incoming Cable -> set with jumper on EVSE
+        * Max Current Outgoing Cable -> set with resistor between PP/PE (if fixed cable is used)
+
+        TODO
+        """
+        await self.check_validity()
+
+        return GetMaxChargingCurrent(*await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_MAX_CHARGING_CURRENT, (), '', 14, BrickletEVSEV2.CODEC_GET_MAX_CHARGING_CURRENT_RESPONSE))
+
+    async def start_charging(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_START_CHARGING, (), '', 0, '')
+
+    async def stop_charging(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_STOP_CHARGING, (), '', 0, '')
+
+    async def set_charging_autostart(self, autostart):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        autostart = bool(autostart)
+
+        await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_SET_CHARGING_AUTOSTART, (autostart,), BrickletEVSEV2.CODEC_SET_CHARGING_AUTOSTART_REQUEST, 0, '')
+
+    async def get_charging_autostart(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_CHARGING_AUTOSTART, (), '', 9, BrickletEVSEV2.CODEC_GET_CHARGING_AUTOSTART_RESPONSE)
+
+    async def get_energy_meter_values(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return GetEnergyMeterValues(*await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_ENERGY_METER_VALUES, (), '', 20, BrickletEVSEV2.CODEC_GET_ENERGY_METER_VALUES_RESPONSE))
+
+    async def get_energy_meter_state(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return GetEnergyMeterState(*await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_ENERGY_METER_STATE, (), '', 33, BrickletEVSEV2.CODEC_GET_ENERGY_METER_STATE_RESPONSE))
+
+    async def reset_energy_meter(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_RESET_ENERGY_METER, (), '', 0, '')
+
+    async def get_dc_fault_current_state(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_DC_FAULT_CURRENT_STATE, (), '', 9, BrickletEVSEV2.CODEC_GET_DC_FAULT_CURRENT_STATE_RESPONSE)
+
+    async def reset_dc_fault_current(self, password):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        password = int(password)
+
+        await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_RESET_DC_FAULT_CURRENT, (password,), BrickletEVSEV2.CODEC_RESET_DC_FAULT_CURRENT_REQUEST, 0, '')
+
+    async def set_gpio_configuration(self, input_configuration, output_configuration):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        input_configuration = int(input_configuration)
+        output_configuration = int(output_configuration)
+
+        await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_SET_GPIO_CONFIGURATION, (input_configuration, output_configuration), BrickletEVSEV2.CODEC_SET_GPIO_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_gpio_configuration(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return GetGPIOConfiguration(*await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_GPIO_CONFIGURATION, (), '', 10, BrickletEVSEV2.CODEC_GET_GPIO_CONFIGURATION_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletEVSEV2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletEVSEV2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletEVSEV2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletEVSEV2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletEVSEV2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletEVSEV2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletEVSEV2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletEVSEV2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletEVSEV2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletEVSEV2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_WRITE_UID, (uid,), BrickletEVSEV2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_READ_UID, (), '', 12, BrickletEVSEV2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletEVSEV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletEVSEV2.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_gps import BrickletGPS, GetCoordinates, GetStatus, GetAltitude, GetMotion, GetDateTime, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_gps import BrickletGPS, GetCoordinates, GetStatus, GetAltitude, GetMotion, GetDateTime, GetIdentity
+
+class BrickletGPSAsync(AsyncDevice, BrickletGPS):
+    """
+    Determine position, velocity and altitude using GPS
+
+    asyncio variant of BrickletGPS for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_coordinates(self):
+        """
+        Returns the GPS coordinates. Latitude and longitude are given in the
+        ``DD.dddddd°`` format, the value 57123468 means 57.123468°.
+        The parameter ``ns`` and ``ew`` are the cardinal directions for
+        latitude and longitude. Possible values for ``ns`` and ``ew`` are 'N', 'S', 'E'
+        and 'W' (north, south, east and west).
+
+        PDOP, HDOP and VDOP are the dilution of precision (DOP) values. They specify
+        the additional multiplicative effect of GPS satellite geometry on GPS
+        precision. See
+        `here <https://en.wikipedia.org/wiki/Dilution_of_precision_(GPS)>`__
+        for more information.
+
+        EPE is the "Estimated Position Error". This is not the
+        absolute maximum error, it is the error with a specific confidence. See
+        `here <https://www.nps.gov/gis/gps/WhatisEPE.html>`__ for more information.
+
+        This data is only valid if there is currently a fix as indicated by
+        :func:`Get Status`.
+        """
+        await self.check_validity()
+
+        return GetCoordinates(*await self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_COORDINATES, (), '', 26, BrickletGPS.CODEC_GET_COORDINATES_RESPONSE))
+
+    async def get_status(self):
+        """
+        Returns the current fix status, the number of satellites that are in view and
+        the number of satellites that are currently used.
+
+        Possible fix status values can be:
+
+        .. csv-table::
+         :header: "Value", "Description"
+         :widths: 10, 100
+
+         "1", "No Fix, :func:`Get Coordinates`, :func:`Get Altitude` and :func:`Get Motion` return invalid data"
+         "2", "2D Fix, only :func:`Get Coordinates` and :func:`Get Motion` return valid data"
+         "3", "3D Fix, :func:`Get Coordinates`, :func:`Get Altitude` and :func:`Get Motion` return valid data"
+
+        There is also a :ref:`blue LED <gps_bricklet_fix_led>` on the Bricklet that
+        indicates the fix status.
+        """
+        await self.check_validity()
+
+        return GetStatus(*await self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_STATUS, (), '', 11, BrickletGPS.CODEC_GET_STATUS_RESPONSE))
+
+    async def get_altitude(self):
+        """
+        Returns the current altitude and corresponding geoidal separation.
+
+        This data is only valid if there is currently a fix as indicated by
+        :func:`Get Status`.
+        """
+        await self.check_validity()
+
+        return GetAltitude(*await self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_ALTITUDE, (), '', 16, BrickletGPS.CODEC_GET_ALTITUDE_RESPONSE))
+
+    async def get_motion(self):
+        """
+        Returns the current course and speed. A course of 0° means the Bricklet is
+        traveling north bound and 90° means it is traveling east bound.
+
+        Please note that this only returns useful values if an actual movement
+        is present.
+
+        This data is only valid if there is currently a fix as indicated by
+        :func:`Get Status`.
+        """
+        await self.check_validity()
+
+        return GetMotion(*await self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_MOTION, (), '', 16, BrickletGPS.CODEC_GET_MOTION_RESPONSE))
+
+    async def get_date_time(self):
+        """
+        Returns the current date and time. The date is
+        given in the format ``ddmmyy`` and the time is given
+        in the format ``hhmmss.sss``. For example, 140713 means
+        14.07.13 as date and 195923568 means 19:59:23.568 as time.
+        """
+        await self.check_validity()
+
+        return GetDateTime(*await self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_DATE_TIME, (), '', 16, BrickletGPS.CODEC_GET_DATE_TIME_RESPONSE))
+
+    async def restart(self, restart_type):
+        """
+        Restarts the GPS Bricklet, the following restart types are available:
+
+        .. csv-table::
+         :header: "Value", "Description"
+         :widths: 10, 100
+
+         "0", "Hot start (use all available data in the NV store)"
+         "1", "Warm start (don't use ephemeris at restart)"
+         "2", "Cold start (don't use time, position, almanacs and ephemeris at restart)"
+         "3", "Factory reset (clear all system/user configurations at restart)"
+        """
+        await self.check_validity()
+
+        restart_type = int(restart_type)
+
+        await self.ipcon.send_request(self, BrickletGPS.FUNCTION_RESTART, (restart_type,), BrickletGPS.CODEC_RESTART_REQUEST, 0, '')
+
+    async def set_coordinates_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Coordinates` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Coordinates` callback is only triggered if the coordinates changed
+        since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletGPS.FUNCTION_SET_COORDINATES_CALLBACK_PERIOD, (period,), BrickletGPS.CODEC_SET_COORDINATES_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_coordinates_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Coordinates Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_COORDINATES_CALLBACK_PERIOD, (), '', 12, BrickletGPS.CODEC_GET_COORDINATES_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_status_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Status` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Status` callback is only triggered if the status changed since the
+        last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletGPS.FUNCTION_SET_STATUS_CALLBACK_PERIOD, (period,), BrickletGPS.CODEC_SET_STATUS_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_status_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Status Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_STATUS_CALLBACK_PERIOD, (), '', 12, BrickletGPS.CODEC_GET_STATUS_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_altitude_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Altitude` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Altitude` callback is only triggered if the altitude changed since
+        the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletGPS.FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD, (period,), BrickletGPS.CODEC_SET_ALTITUDE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_altitude_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Altitude Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD, (), '', 12, BrickletGPS.CODEC_GET_ALTITUDE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_motion_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Motion` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Motion` callback is only triggered if the motion changed since the
+        last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletGPS.FUNCTION_SET_MOTION_CALLBACK_PERIOD, (period,), BrickletGPS.CODEC_SET_MOTION_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_motion_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Motion Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_MOTION_CALLBACK_PERIOD, (), '', 12, BrickletGPS.CODEC_GET_MOTION_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_date_time_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Date Time` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Date Time` callback is only triggered if the date or time changed
+        since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletGPS.FUNCTION_SET_DATE_TIME_CALLBACK_PERIOD, (period,), BrickletGPS.CODEC_SET_DATE_TIME_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_date_time_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Date Time Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD, (), '', 12, BrickletGPS.CODEC_GET_DATE_TIME_CALLBACK_PERIOD_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletGPS.FUNCTION_GET_IDENTITY, (), '', 33, BrickletGPS.CODEC_GET_IDENTITY_RESPONSE))
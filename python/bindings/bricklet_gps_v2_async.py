@@ -0,0 +1,499 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_gps_v2 import BrickletGPSV2, GetCoordinates, GetStatus, GetAltitude, GetMotion, GetDateTime, GetSatelliteSystemStatusLowLevel, GetSatelliteStatus, GetSPITFPErrorCount, GetIdentity, GetSatelliteSystemStatus
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_gps_v2 import BrickletGPSV2, GetCoordinates, GetStatus, GetAltitude, GetMotion, GetDateTime, GetSatelliteSystemStatusLowLevel, GetSatelliteStatus, GetSPITFPErrorCount, GetIdentity, GetSatelliteSystemStatus
+
+class BrickletGPSV2Async(AsyncDevice, BrickletGPSV2):
+    """
+    Determine position, velocity and altitude using GPS
+
+    asyncio variant of BrickletGPSV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_coordinates(self):
+        """
+        Returns the GPS coordinates. Latitude and longitude are given in the
+        ``DD.dddddd°`` format, the value 57123468 means 57.123468°.
+        The parameter ``ns`` and ``ew`` are the cardinal directions for
+        latitude and longitude. Possible values for ``ns`` and ``ew`` are 'N', 'S', 'E'
+        and 'W' (north, south, east and west).
+
+        This data is only valid if there is currently a fix as indicated by
+        :func:`Get Status`.
+        """
+        await self.check_validity()
+
+        return GetCoordinates(*await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_COORDINATES, (), '', 18, BrickletGPSV2.CODEC_GET_COORDINATES_RESPONSE))
+
+    async def get_status(self):
+        """
+        Returns if a fix is currently available as well as the, the number of
+        satellites that are in view.
+
+        There is also a :ref:`green LED <gps_v2_bricklet_fix_led>` on the Bricklet that
+        indicates the fix status.
+        """
+        await self.check_validity()
+
+        return GetStatus(*await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_STATUS, (), '', 10, BrickletGPSV2.CODEC_GET_STATUS_RESPONSE))
+
+    async def get_altitude(self):
+        """
+        Returns the current altitude and corresponding geoidal separation.
+
+        This data is only valid if there is currently a fix as indicated by
+        :func:`Get Status`.
+        """
+        await self.check_validity()
+
+        return GetAltitude(*await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_ALTITUDE, (), '', 16, BrickletGPSV2.CODEC_GET_ALTITUDE_RESPONSE))
+
+    async def get_motion(self):
+        """
+        Returns the current course and speed. A course of 0° means the Bricklet is
+        traveling north bound and 90° means it is traveling east bound.
+
+        Please note that this only returns useful values if an actual movement
+        is present.
+
+        This data is only valid if there is currently a fix as indicated by
+        :func:`Get Status`.
+        """
+        await self.check_validity()
+
+        return GetMotion(*await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_MOTION, (), '', 16, BrickletGPSV2.CODEC_GET_MOTION_RESPONSE))
+
+    async def get_date_time(self):
+        """
+        Returns the current date and time. The date is
+        given in the format ``ddmmyy`` and the time is given
+        in the format ``hhmmss.sss``. For example, 140713 means
+        14.07.13 as date and 195923568 means 19:59:23.568 as time.
+        """
+        await self.check_validity()
+
+        return GetDateTime(*await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_DATE_TIME, (), '', 16, BrickletGPSV2.CODEC_GET_DATE_TIME_RESPONSE))
+
+    async def restart(self, restart_type):
+        """
+        Restarts the GPS Bricklet, the following restart types are available:
+
+        .. csv-table::
+         :header: "Value", "Description"
+         :widths: 10, 100
+
+         "0", "Hot start (use all available data in the NV store)"
+         "1", "Warm start (don't use ephemeris at restart)"
+         "2", "Cold start (don't use time, position, almanacs and ephemeris at restart)"
+         "3", "Factory reset (clear all system/user configurations at restart)"
+        """
+        await self.check_validity()
+
+        restart_type = int(restart_type)
+
+        await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_RESTART, (restart_type,), BrickletGPSV2.CODEC_RESTART_REQUEST, 0, '')
+
+    async def get_satellite_system_status_low_level(self, satellite_system):
+        """
+        Returns the
+
+        * satellite numbers list (up to 12 items)
+        * fix value,
+        * PDOP value,
+        * HDOP value and
+        * VDOP value
+
+        for a given satellite system. Currently GPS and GLONASS are supported, Galileo
+        is not yet supported.
+
+        The GPS and GLONASS satellites have unique numbers and the satellite list gives
+        the numbers of the satellites that are currently utilized. The number 0 is not
+        a valid satellite number and can be ignored in the list.
+        """
+        await self.check_validity()
+
+        satellite_system = int(satellite_system)
+
+        return GetSatelliteSystemStatusLowLevel(*await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_SATELLITE_SYSTEM_STATUS_LOW_LEVEL, (satellite_system,), BrickletGPSV2.CODEC_GET_SATELLITE_SYSTEM_STATUS_LOW_LEVEL_REQUEST, 28, BrickletGPSV2.CODEC_GET_SATELLITE_SYSTEM_STATUS_LOW_LEVEL_RESPONSE))
+
+    async def get_satellite_status(self, satellite_system, satellite_number):
+        """
+        Returns the current elevation, azimuth and SNR
+        for a given satellite and satellite system.
+
+        The satellite number here always goes from 1 to 32. For GLONASS it corresponds to
+        the satellites 65-96.
+
+        Galileo is not yet supported.
+        """
+        await self.check_validity()
+
+        satellite_system = int(satellite_system)
+        satellite_number = int(satellite_number)
+
+        return GetSatelliteStatus(*await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_SATELLITE_STATUS, (satellite_system, satellite_number), BrickletGPSV2.CODEC_GET_SATELLITE_STATUS_REQUEST, 14, BrickletGPSV2.CODEC_GET_SATELLITE_STATUS_RESPONSE))
+
+    async def set_fix_led_config(self, config):
+        """
+        Sets the fix LED configuration. By default the LED shows if
+        the Bricklet got a GPS fix yet. If a fix is established the LED turns on.
+        If there is no fix then the LED is turned off.
+
+        You can also turn the LED permanently on/off, show a heartbeat or let it blink
+        in sync with the PPS (pulse per second) output of the GPS module.
+
+        If the Bricklet is in bootloader mode, the LED is off.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_SET_FIX_LED_CONFIG, (config,), BrickletGPSV2.CODEC_SET_FIX_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_fix_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Fix LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_FIX_LED_CONFIG, (), '', 9, BrickletGPSV2.CODEC_GET_FIX_LED_CONFIG_RESPONSE)
+
+    async def set_coordinates_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Coordinates` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Coordinates` callback is only triggered if the coordinates changed
+        since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_SET_COORDINATES_CALLBACK_PERIOD, (period,), BrickletGPSV2.CODEC_SET_COORDINATES_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_coordinates_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Coordinates Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_COORDINATES_CALLBACK_PERIOD, (), '', 12, BrickletGPSV2.CODEC_GET_COORDINATES_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_status_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Status` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Status` callback is only triggered if the status changed since the
+        last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_SET_STATUS_CALLBACK_PERIOD, (period,), BrickletGPSV2.CODEC_SET_STATUS_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_status_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Status Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_STATUS_CALLBACK_PERIOD, (), '', 12, BrickletGPSV2.CODEC_GET_STATUS_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_altitude_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Altitude` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Altitude` callback is only triggered if the altitude changed since the
+        last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD, (period,), BrickletGPSV2.CODEC_SET_ALTITUDE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_altitude_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Altitude Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD, (), '', 12, BrickletGPSV2.CODEC_GET_ALTITUDE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_motion_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Motion` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Motion` callback is only triggered if the motion changed since the
+        last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_SET_MOTION_CALLBACK_PERIOD, (period,), BrickletGPSV2.CODEC_SET_MOTION_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_motion_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Motion Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_MOTION_CALLBACK_PERIOD, (), '', 12, BrickletGPSV2.CODEC_GET_MOTION_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_date_time_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Date Time` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Date Time` callback is only triggered if the date or time changed
+        since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_SET_DATE_TIME_CALLBACK_PERIOD, (period,), BrickletGPSV2.CODEC_SET_DATE_TIME_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_date_time_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Date Time Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD, (), '', 12, BrickletGPSV2.CODEC_GET_DATE_TIME_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_sbas_config(self, sbas_config):
+        """
+        If `SBAS <https://en.wikipedia.org/wiki/GNSS_augmentation#Satellite-based_augmentation_system>`__ is enabled,
+        the position accuracy increases (if SBAS satellites are in view),
+        but the update rate is limited to 5Hz. With SBAS disabled the update rate is increased to 10Hz.
+
+        .. versionadded:: 2.0.2$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        sbas_config = int(sbas_config)
+
+        await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_SET_SBAS_CONFIG, (sbas_config,), BrickletGPSV2.CODEC_SET_SBAS_CONFIG_REQUEST, 0, '')
+
+    async def get_sbas_config(self):
+        """
+        Returns the SBAS configuration as set by :func:`Set SBAS Config`
+
+        .. versionadded:: 2.0.2$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_SBAS_CONFIG, (), '', 9, BrickletGPSV2.CODEC_GET_SBAS_CONFIG_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletGPSV2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletGPSV2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletGPSV2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletGPSV2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletGPSV2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletGPSV2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletGPSV2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletGPSV2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletGPSV2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletGPSV2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_WRITE_UID, (uid,), BrickletGPSV2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_READ_UID, (), '', 12, BrickletGPSV2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletGPSV2.CODEC_GET_IDENTITY_RESPONSE))
+
+    async def get_satellite_system_status(self, satellite_system):
+        """
+        Returns the
+
+        * satellite numbers list (up to 12 items)
+        * fix value,
+        * PDOP value,
+        * HDOP value and
+        * VDOP value
+
+        for a given satellite system. Currently GPS and GLONASS are supported, Galileo
+        is not yet supported.
+
+        The GPS and GLONASS satellites have unique numbers and the satellite list gives
+        the numbers of the satellites that are currently utilized. The number 0 is not
+        a valid satellite number and can be ignored in the list.
+        """
+        satellite_system = int(satellite_system)
+
+        await self.check_validity()
+
+        satellite_numbers_codec = self.get_stream_codec(BrickletGPSV2.CODEC_GET_SATELLITE_SYSTEM_STATUS_LOW_LEVEL_RESPONSE, 1)
+        ret = GetSatelliteSystemStatusLowLevel(*await self.ipcon.send_request(self, BrickletGPSV2.FUNCTION_GET_SATELLITE_SYSTEM_STATUS_LOW_LEVEL, (satellite_system,), BrickletGPSV2.CODEC_GET_SATELLITE_SYSTEM_STATUS_LOW_LEVEL_REQUEST, 28, satellite_numbers_codec))
+
+        return GetSatelliteSystemStatus(self.create_stream_data(ret.satellite_numbers_data, ret.satellite_numbers_length, 'B'), ret.fix, ret.pdop, ret.hdop, ret.vdop)
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_hall_effect import BrickletHallEffect, GetEdgeCountConfig, EdgeInterrupt, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_hall_effect import BrickletHallEffect, GetEdgeCountConfig, EdgeInterrupt, GetIdentity
+
+class BrickletHallEffectAsync(AsyncDevice, BrickletHallEffect):
+    """
+    Detects presence of magnetic field
+
+    asyncio variant of BrickletHallEffect for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_value(self):
+        """
+        Returns *true* if a magnetic field of 3.5 millitesla or greater is detected.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletHallEffect.FUNCTION_GET_VALUE, (), '', 9, BrickletHallEffect.CODEC_GET_VALUE_RESPONSE)
+
+    async def get_edge_count(self, reset_counter):
+        """
+        Returns the current value of the edge counter. You can configure
+        edge type (rising, falling, both) that is counted with
+        :func:`Set Edge Count Config`.
+
+        If you set the reset counter to *true*, the count is set back to 0
+        directly after it is read.
+        """
+        await self.check_validity()
+
+        reset_counter = bool(reset_counter)
+
+        return await self.ipcon.send_request(self, BrickletHallEffect.FUNCTION_GET_EDGE_COUNT, (reset_counter,), BrickletHallEffect.CODEC_GET_EDGE_COUNT_REQUEST, 12, BrickletHallEffect.CODEC_GET_EDGE_COUNT_RESPONSE)
+
+    async def set_edge_count_config(self, edge_type, debounce):
+        """
+        The edge type parameter configures if rising edges, falling edges or
+        both are counted. Possible edge types are:
+
+        * 0 = rising
+        * 1 = falling
+        * 2 = both
+
+        A magnetic field of 3.5 millitesla or greater causes a falling edge and a
+        magnetic field of 2.5 millitesla or smaller causes a rising edge.
+
+        If a magnet comes near the Bricklet the signal goes low (falling edge), if
+        a magnet is removed from the vicinity the signal goes high (rising edge).
+
+        Configuring an edge counter resets its value to 0.
+
+        If you don't know what any of this means, just leave it at default. The
+        default configuration is very likely OK for you.
+        """
+        await self.check_validity()
+
+        edge_type = int(edge_type)
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletHallEffect.FUNCTION_SET_EDGE_COUNT_CONFIG, (edge_type, debounce), BrickletHallEffect.CODEC_SET_EDGE_COUNT_CONFIG_REQUEST, 0, '')
+
+    async def get_edge_count_config(self):
+        """
+        Returns the edge type and debounce time as set by :func:`Set Edge Count Config`.
+        """
+        await self.check_validity()
+
+        return GetEdgeCountConfig(*await self.ipcon.send_request(self, BrickletHallEffect.FUNCTION_GET_EDGE_COUNT_CONFIG, (), '', 10, BrickletHallEffect.CODEC_GET_EDGE_COUNT_CONFIG_RESPONSE))
+
+    async def set_edge_interrupt(self, edges):
+        """
+        Sets the number of edges until an interrupt is invoked.
+
+        If *edges* is set to n, an interrupt is invoked for every n-th detected edge.
+
+        If *edges* is set to 0, the interrupt is disabled.
+        """
+        await self.check_validity()
+
+        edges = int(edges)
+
+        await self.ipcon.send_request(self, BrickletHallEffect.FUNCTION_SET_EDGE_INTERRUPT, (edges,), BrickletHallEffect.CODEC_SET_EDGE_INTERRUPT_REQUEST, 0, '')
+
+    async def get_edge_interrupt(self):
+        """
+        Returns the edges as set by :func:`Set Edge Interrupt`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletHallEffect.FUNCTION_GET_EDGE_INTERRUPT, (), '', 12, BrickletHallEffect.CODEC_GET_EDGE_INTERRUPT_RESPONSE)
+
+    async def set_edge_count_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Edge Count` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Edge Count` callback is only triggered if the edge count has changed
+        since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletHallEffect.FUNCTION_SET_EDGE_COUNT_CALLBACK_PERIOD, (period,), BrickletHallEffect.CODEC_SET_EDGE_COUNT_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_edge_count_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Edge Count Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletHallEffect.FUNCTION_GET_EDGE_COUNT_CALLBACK_PERIOD, (), '', 12, BrickletHallEffect.CODEC_GET_EDGE_COUNT_CALLBACK_PERIOD_RESPONSE)
+
+    async def edge_interrupt(self):
+        """
+        This callback is triggered every n-th count, as configured with
+        :func:`Set Edge Interrupt`. The parameters are the
+        current count and the current value (see :func:`Get Value` and
+        :func:`Get Edge Count`).
+        """
+        await self.check_validity()
+
+        return EdgeInterrupt(*await self.ipcon.send_request(self, BrickletHallEffect.FUNCTION_EDGE_INTERRUPT, (), '', 13, BrickletHallEffect.CODEC_EDGE_INTERRUPT_RESPONSE))
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletHallEffect.FUNCTION_GET_IDENTITY, (), '', 33, BrickletHallEffect.CODEC_GET_IDENTITY_RESPONSE))
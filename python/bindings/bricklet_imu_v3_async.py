@@ -0,0 +1,665 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_imu_v3 import BrickletIMUV3, GetAcceleration, GetMagneticField, GetAngularVelocity, GetOrientation, GetLinearAcceleration, GetGravityVector, GetQuaternion, GetAllData, GetSensorConfiguration, GetAccelerationCallbackConfiguration, GetMagneticFieldCallbackConfiguration, GetAngularVelocityCallbackConfiguration, GetTemperatureCallbackConfiguration, GetOrientationCallbackConfiguration, GetLinearAccelerationCallbackConfiguration, GetGravityVectorCallbackConfiguration, GetQuaternionCallbackConfiguration, GetAllDataCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_imu_v3 import BrickletIMUV3, GetAcceleration, GetMagneticField, GetAngularVelocity, GetOrientation, GetLinearAcceleration, GetGravityVector, GetQuaternion, GetAllData, GetSensorConfiguration, GetAccelerationCallbackConfiguration, GetMagneticFieldCallbackConfiguration, GetAngularVelocityCallbackConfiguration, GetTemperatureCallbackConfiguration, GetOrientationCallbackConfiguration, GetLinearAccelerationCallbackConfiguration, GetGravityVectorCallbackConfiguration, GetQuaternionCallbackConfiguration, GetAllDataCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletIMUV3Async(AsyncDevice, BrickletIMUV3):
+    """
+    Full fledged AHRS with 9 degrees of freedom
+
+    asyncio variant of BrickletIMUV3 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_acceleration(self):
+        """
+        Returns the calibrated acceleration from the accelerometer for the
+        x, y and z axis. The acceleration is in the range configured with
+        :func:`Set Sensor Configuration`.
+
+        If you want to get the acceleration periodically, it is recommended
+        to use the :cb:`Acceleration` callback and set the period with
+        :func:`Set Acceleration Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAcceleration(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_ACCELERATION, (), '', 14, BrickletIMUV3.CODEC_GET_ACCELERATION_RESPONSE))
+
+    async def get_magnetic_field(self):
+        """
+        Returns the calibrated magnetic field from the magnetometer for the
+        x, y and z axis.
+
+        If you want to get the magnetic field periodically, it is recommended
+        to use the :cb:`Magnetic Field` callback and set the period with
+        :func:`Set Magnetic Field Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetMagneticField(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_MAGNETIC_FIELD, (), '', 14, BrickletIMUV3.CODEC_GET_MAGNETIC_FIELD_RESPONSE))
+
+    async def get_angular_velocity(self):
+        """
+        Returns the calibrated angular velocity from the gyroscope for the
+        x, y and z axis. The angular velocity is in the range configured with
+        :func:`Set Sensor Configuration`.
+
+        If you want to get the angular velocity periodically, it is recommended
+        to use the :cb:`Angular Velocity` acallback nd set the period with
+        :func:`Set Angular Velocity Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAngularVelocity(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_ANGULAR_VELOCITY, (), '', 14, BrickletIMUV3.CODEC_GET_ANGULAR_VELOCITY_RESPONSE))
+
+    async def get_temperature(self):
+        """
+        Returns the temperature of the IMU Brick.
+        The temperature is measured in the core of the BNO055 IC, it is not the
+        ambient temperature
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_TEMPERATURE, (), '', 9, BrickletIMUV3.CODEC_GET_TEMPERATURE_RESPONSE)
+
+    async def get_orientation(self):
+        """
+        Returns the current orientation (heading, roll, pitch) of the IMU Brick as
+        independent Euler angles. Note that Euler angles always
+        experience a `gimbal lock <https://en.wikipedia.org/wiki/Gimbal_lock>`__.
+        We recommend that you use quaternions instead, if you need the absolute
+        orientation.
+
+        If you want to get the orientation periodically, it is recommended
+        to use the :cb:`Orientation` callback and set the period with
+        :func:`Set Orientation Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetOrientation(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_ORIENTATION, (), '', 14, BrickletIMUV3.CODEC_GET_ORIENTATION_RESPONSE))
+
+    async def get_linear_acceleration(self):
+        """
+        Returns the linear acceleration of the IMU Brick for the
+        x, y and z axis. The acceleration is in the range configured with
+        :func:`Set Sensor Configuration`.
+
+        The linear acceleration is the acceleration in each of the three
+        axis of the IMU Brick with the influences of gravity removed.
+
+        It is also possible to get the gravity vector with the influence of linear
+        acceleration removed, see :func:`Get Gravity Vector`.
+
+        If you want to get the linear acceleration periodically, it is recommended
+        to use the :cb:`Linear Acceleration` callback and set the period with
+        :func:`Set Linear Acceleration Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetLinearAcceleration(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_LINEAR_ACCELERATION, (), '', 14, BrickletIMUV3.CODEC_GET_LINEAR_ACCELERATION_RESPONSE))
+
+    async def get_gravity_vector(self):
+        """
+        Returns the current gravity vector of the IMU Brick for the
+        x, y and z axis.
+
+        The gravity vector is the acceleration that occurs due to gravity.
+        Influences of additional linear acceleration are removed.
+
+        It is also possible to get the linear acceleration with the influence
+        of gravity removed, see :func:`Get Linear Acceleration`.
+
+        If you want to get the gravity vector periodically, it is recommended
+        to use the :cb:`Gravity Vector` callback and set the period with
+        :func:`Set Gravity Vector Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetGravityVector(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_GRAVITY_VECTOR, (), '', 14, BrickletIMUV3.CODEC_GET_GRAVITY_VECTOR_RESPONSE))
+
+    async def get_quaternion(self):
+        """
+        Returns the current orientation (w, x, y, z) of the IMU Brick as
+        `quaternions <https://en.wikipedia.org/wiki/Quaternions_and_spatial_rotation>`__.
+
+        You have to divide the return values by 16383 (14 bit) to get
+        the usual range of -1.0 to +1.0 for quaternions.
+
+        If you want to get the quaternions periodically, it is recommended
+        to use the :cb:`Quaternion` callback and set the period with
+        :func:`Set Quaternion Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetQuaternion(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_QUATERNION, (), '', 16, BrickletIMUV3.CODEC_GET_QUATERNION_RESPONSE))
+
+    async def get_all_data(self):
+        """
+        Return all of the available data of the IMU Brick.
+
+        * acceleration (see :func:`Get Acceleration`)
+        * magnetic field (see :func:`Get Magnetic Field`)
+        * angular velocity (see :func:`Get Angular Velocity`)
+        * Euler angles (see :func:`Get Orientation`)
+        * quaternion (see :func:`Get Quaternion`)
+        * linear acceleration (see :func:`Get Linear Acceleration`)
+        * gravity vector (see :func:`Get Gravity Vector`)
+        * temperature (see :func:`Get Temperature`)
+        * calibration status (see below)
+
+        The calibration status consists of four pairs of two bits. Each pair
+        of bits represents the status of the current calibration.
+
+        * bit 0-1: Magnetometer
+        * bit 2-3: Accelerometer
+        * bit 4-5: Gyroscope
+        * bit 6-7: System
+
+        A value of 0 means for "not calibrated" and a value of 3 means
+        "fully calibrated". In your program you should always be able to
+        ignore the calibration status, it is used by the calibration
+        window of the Brick Viewer and it can be ignored after the first
+        calibration. See the documentation in the calibration window for
+        more information regarding the calibration of the IMU Brick.
+
+        If you want to get the data periodically, it is recommended
+        to use the :cb:`All Data` callback and set the period with
+        :func:`Set All Data Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAllData(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_ALL_DATA, (), '', 54, BrickletIMUV3.CODEC_GET_ALL_DATA_RESPONSE))
+
+    async def save_calibration(self):
+        """
+        A call of this function saves the current calibration to be used
+        as a starting point for the next restart of continuous calibration
+        of the IMU Brick.
+
+        A return value of *true* means that the calibration could be used and
+        *false* means that it could not be used (this happens if the calibration
+        status is not "fully calibrated").
+
+        This function is used by the calibration window of the Brick Viewer, you
+        should not need to call it in your program.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SAVE_CALIBRATION, (), '', 9, BrickletIMUV3.CODEC_SAVE_CALIBRATION_RESPONSE)
+
+    async def set_sensor_configuration(self, magnetometer_rate, gyroscope_range, gyroscope_bandwidth, accelerometer_range, accelerometer_bandwidth):
+        """
+        Sets the available sensor configuration for the Magnetometer, Gyroscope and
+        Accelerometer. The Accelerometer Range is user selectable in all fusion modes,
+        all other configurations are auto-controlled in fusion mode.
+        """
+        await self.check_validity()
+
+        magnetometer_rate = int(magnetometer_rate)
+        gyroscope_range = int(gyroscope_range)
+        gyroscope_bandwidth = int(gyroscope_bandwidth)
+        accelerometer_range = int(accelerometer_range)
+        accelerometer_bandwidth = int(accelerometer_bandwidth)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_SENSOR_CONFIGURATION, (magnetometer_rate, gyroscope_range, gyroscope_bandwidth, accelerometer_range, accelerometer_bandwidth), BrickletIMUV3.CODEC_SET_SENSOR_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_sensor_configuration(self):
+        """
+        Returns the sensor configuration as set by :func:`Set Sensor Configuration`.
+        """
+        await self.check_validity()
+
+        return GetSensorConfiguration(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_SENSOR_CONFIGURATION, (), '', 13, BrickletIMUV3.CODEC_GET_SENSOR_CONFIGURATION_RESPONSE))
+
+    async def set_sensor_fusion_mode(self, mode):
+        """
+        If the fusion mode is turned off, the functions :func:`Get Acceleration`,
+        :func:`Get Magnetic Field` and :func:`Get Angular Velocity` return uncalibrated
+        and uncompensated sensor data. All other sensor data getters return no data.
+
+        Since firmware version 2.0.6 you can also use a fusion mode without magnetometer.
+        In this mode the calculated orientation is relative (with magnetometer it is
+        absolute with respect to the earth). However, the calculation can't be influenced
+        by spurious magnetic fields.
+
+        Since firmware version 2.0.13 you can also use a fusion mode without fast
+        magnetometer calibration. This mode is the same as the normal fusion mode,
+        but the fast magnetometer calibration is turned off. So to find the orientation
+        the first time will likely take longer, but small magnetic influences might
+        not affect the automatic calibration as much.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_SENSOR_FUSION_MODE, (mode,), BrickletIMUV3.CODEC_SET_SENSOR_FUSION_MODE_REQUEST, 0, '')
+
+    async def get_sensor_fusion_mode(self):
+        """
+        Returns the sensor fusion mode as set by :func:`Set Sensor Fusion Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_SENSOR_FUSION_MODE, (), '', 9, BrickletIMUV3.CODEC_GET_SENSOR_FUSION_MODE_RESPONSE)
+
+    async def set_acceleration_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`Acceleration` callback
+        is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletIMUV3.CODEC_SET_ACCELERATION_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_acceleration_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Acceleration Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAccelerationCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION, (), '', 13, BrickletIMUV3.CODEC_GET_ACCELERATION_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_magnetic_field_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`Magnetic Field` callback
+        is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletIMUV3.CODEC_SET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_magnetic_field_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Magnetic Field Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetMagneticFieldCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION, (), '', 13, BrickletIMUV3.CODEC_GET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_angular_velocity_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`Angular Velocity` callback
+        is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletIMUV3.CODEC_SET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_angular_velocity_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Angular Velocity Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAngularVelocityCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION, (), '', 13, BrickletIMUV3.CODEC_GET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_temperature_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`Temperature` callback
+        is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletIMUV3.CODEC_SET_TEMPERATURE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_temperature_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Temperature Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetTemperatureCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION, (), '', 13, BrickletIMUV3.CODEC_GET_TEMPERATURE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_orientation_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`Orientation` callback
+        is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_ORIENTATION_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletIMUV3.CODEC_SET_ORIENTATION_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_orientation_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Orientation Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetOrientationCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_ORIENTATION_CALLBACK_CONFIGURATION, (), '', 13, BrickletIMUV3.CODEC_GET_ORIENTATION_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_linear_acceleration_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`Linear Acceleration` callback
+        is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletIMUV3.CODEC_SET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_linear_acceleration_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Linear Acceleration Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetLinearAccelerationCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION, (), '', 13, BrickletIMUV3.CODEC_GET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_gravity_vector_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`Gravity Vector` callback
+        is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletIMUV3.CODEC_SET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_gravity_vector_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Gravity Vector Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetGravityVectorCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION, (), '', 13, BrickletIMUV3.CODEC_GET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_quaternion_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`Quaternion` callback
+        is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_QUATERNION_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletIMUV3.CODEC_SET_QUATERNION_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_quaternion_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Quaternion Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetQuaternionCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_QUATERNION_CALLBACK_CONFIGURATION, (), '', 13, BrickletIMUV3.CODEC_GET_QUATERNION_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_all_data_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`All Data` callback
+        is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_ALL_DATA_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletIMUV3.CODEC_SET_ALL_DATA_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_all_data_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set All Data Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAllDataCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_ALL_DATA_CALLBACK_CONFIGURATION, (), '', 13, BrickletIMUV3.CODEC_GET_ALL_DATA_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletIMUV3.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletIMUV3.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletIMUV3.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletIMUV3.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletIMUV3.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_WRITE_FIRMWARE, (data,), BrickletIMUV3.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletIMUV3.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletIMUV3.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletIMUV3.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletIMUV3.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_WRITE_UID, (uid,), BrickletIMUV3.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_READ_UID, (), '', 12, BrickletIMUV3.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIMUV3.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIMUV3.CODEC_GET_IDENTITY_RESPONSE))
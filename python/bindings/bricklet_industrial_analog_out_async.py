@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_industrial_analog_out import BrickletIndustrialAnalogOut, GetConfiguration, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_industrial_analog_out import BrickletIndustrialAnalogOut, GetConfiguration, GetIdentity
+
+class BrickletIndustrialAnalogOutAsync(AsyncDevice, BrickletIndustrialAnalogOut):
+    """
+    Generates configurable DC voltage and current, 0V to 10V and 4mA to 20mA
+
+    asyncio variant of BrickletIndustrialAnalogOut for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def enable(self):
+        """
+        Enables the output of voltage and current.
+
+        The default is disabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOut.FUNCTION_ENABLE, (), '', 0, '')
+
+    async def disable(self):
+        """
+        Disables the output of voltage and current.
+
+        The default is disabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOut.FUNCTION_DISABLE, (), '', 0, '')
+
+    async def is_enabled(self):
+        """
+        Returns *true* if output of voltage and current is enabled, *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialAnalogOut.FUNCTION_IS_ENABLED, (), '', 9, BrickletIndustrialAnalogOut.CODEC_IS_ENABLED_RESPONSE)
+
+    async def set_voltage(self, voltage):
+        """
+        Sets the output voltage.
+
+        The output voltage and output current are linked. Changing the output voltage
+        also changes the output current.
+        """
+        await self.check_validity()
+
+        voltage = int(voltage)
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOut.FUNCTION_SET_VOLTAGE, (voltage,), BrickletIndustrialAnalogOut.CODEC_SET_VOLTAGE_REQUEST, 0, '')
+
+    async def get_voltage(self):
+        """
+        Returns the voltage as set by :func:`Set Voltage`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialAnalogOut.FUNCTION_GET_VOLTAGE, (), '', 10, BrickletIndustrialAnalogOut.CODEC_GET_VOLTAGE_RESPONSE)
+
+    async def set_current(self, current):
+        """
+        Sets the output current.
+
+        The output current and output voltage are linked. Changing the output current
+        also changes the output voltage.
+        """
+        await self.check_validity()
+
+        current = int(current)
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOut.FUNCTION_SET_CURRENT, (current,), BrickletIndustrialAnalogOut.CODEC_SET_CURRENT_REQUEST, 0, '')
+
+    async def get_current(self):
+        """
+        Returns the current as set by :func:`Set Current`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialAnalogOut.FUNCTION_GET_CURRENT, (), '', 10, BrickletIndustrialAnalogOut.CODEC_GET_CURRENT_RESPONSE)
+
+    async def set_configuration(self, voltage_range, current_range):
+        """
+        Configures the voltage and current range.
+
+        Possible voltage ranges are:
+
+        * 0V to 5V
+        * 0V to 10V
+
+        Possible current ranges are:
+
+        * 4mA to 20mA
+        * 0mA to 20mA
+        * 0mA to 24mA
+
+        The resolution will always be 12 bit. This means, that the
+        precision is higher with a smaller range.
+        """
+        await self.check_validity()
+
+        voltage_range = int(voltage_range)
+        current_range = int(current_range)
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOut.FUNCTION_SET_CONFIGURATION, (voltage_range, current_range), BrickletIndustrialAnalogOut.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        return GetConfiguration(*await self.ipcon.send_request(self, BrickletIndustrialAnalogOut.FUNCTION_GET_CONFIGURATION, (), '', 10, BrickletIndustrialAnalogOut.CODEC_GET_CONFIGURATION_RESPONSE))
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIndustrialAnalogOut.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIndustrialAnalogOut.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_industrial_analog_out_v2 import BrickletIndustrialAnalogOutV2, GetConfiguration, GetOutLEDStatusConfig, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_industrial_analog_out_v2 import BrickletIndustrialAnalogOutV2, GetConfiguration, GetOutLEDStatusConfig, GetSPITFPErrorCount, GetIdentity
+
+class BrickletIndustrialAnalogOutV2Async(AsyncDevice, BrickletIndustrialAnalogOutV2):
+    """
+    Generates configurable DC voltage and current, 0V to 10V and 4mA to 20mA
+
+    asyncio variant of BrickletIndustrialAnalogOutV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_enabled(self, enabled):
+        """
+        Enables/disables the output of voltage and current.
+        """
+        await self.check_validity()
+
+        enabled = bool(enabled)
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_SET_ENABLED, (enabled,), BrickletIndustrialAnalogOutV2.CODEC_SET_ENABLED_REQUEST, 0, '')
+
+    async def get_enabled(self):
+        """
+        Returns *true* if output of voltage and current is enabled, *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_GET_ENABLED, (), '', 9, BrickletIndustrialAnalogOutV2.CODEC_GET_ENABLED_RESPONSE)
+
+    async def set_voltage(self, voltage):
+        """
+        Sets the output voltage.
+
+        The output voltage and output current are linked. Changing the output voltage
+        also changes the output current.
+        """
+        await self.check_validity()
+
+        voltage = int(voltage)
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_SET_VOLTAGE, (voltage,), BrickletIndustrialAnalogOutV2.CODEC_SET_VOLTAGE_REQUEST, 0, '')
+
+    async def get_voltage(self):
+        """
+        Returns the voltage as set by :func:`Set Voltage`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_GET_VOLTAGE, (), '', 10, BrickletIndustrialAnalogOutV2.CODEC_GET_VOLTAGE_RESPONSE)
+
+    async def set_current(self, current):
+        """
+        Sets the output current.
+
+        The output current and output voltage are linked. Changing the output current
+        also changes the output voltage.
+        """
+        await self.check_validity()
+
+        current = int(current)
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_SET_CURRENT, (current,), BrickletIndustrialAnalogOutV2.CODEC_SET_CURRENT_REQUEST, 0, '')
+
+    async def get_current(self):
+        """
+        Returns the current as set by :func:`Set Current`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_GET_CURRENT, (), '', 10, BrickletIndustrialAnalogOutV2.CODEC_GET_CURRENT_RESPONSE)
+
+    async def set_configuration(self, voltage_range, current_range):
+        """
+        Configures the voltage and current range.
+
+        Possible voltage ranges are:
+
+        * 0V to 5V
+        * 0V to 10V
+
+        Possible current ranges are:
+
+        * 4mA to 20mA
+        * 0mA to 20mA
+        * 0mA to 24mA
+
+        The resolution will always be 12 bit. This means, that the
+        precision is higher with a smaller range.
+        """
+        await self.check_validity()
+
+        voltage_range = int(voltage_range)
+        current_range = int(current_range)
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_SET_CONFIGURATION, (voltage_range, current_range), BrickletIndustrialAnalogOutV2.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        return GetConfiguration(*await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_GET_CONFIGURATION, (), '', 10, BrickletIndustrialAnalogOutV2.CODEC_GET_CONFIGURATION_RESPONSE))
+
+    async def set_out_led_config(self, config):
+        """
+        You can turn the Out LED off, on or show a
+        heartbeat. You can also set the LED to "Out Status". In this mode the
+        LED can either be turned on with a pre-defined threshold or the intensity
+        of the LED can change with the output value (voltage or current).
+
+        You can configure the channel status behavior with :func:`Set Out LED Status Config`.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_SET_OUT_LED_CONFIG, (config,), BrickletIndustrialAnalogOutV2.CODEC_SET_OUT_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_out_led_config(self):
+        """
+        Returns the Out LED configuration as set by :func:`Set Out LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_GET_OUT_LED_CONFIG, (), '', 9, BrickletIndustrialAnalogOutV2.CODEC_GET_OUT_LED_CONFIG_RESPONSE)
+
+    async def set_out_led_status_config(self, min, max, config):
+        """
+        Sets the Out LED status config. This config is used if the Out LED is
+        configured as "Out Status", see :func:`Set Out LED Config`.
+
+        For each channel you can choose between threshold and intensity mode.
+
+        In threshold mode you can define a positive or a negative threshold.
+        For a positive threshold set the "min" parameter to the threshold value in mV or
+        µA above which the LED should turn on and set the "max" parameter to 0. Example:
+        If you set a positive threshold of 5V, the LED will turn on as soon as the
+        output value exceeds 5V and turn off again if it goes below 5V.
+        For a negative threshold set the "max" parameter to the threshold value in mV or
+        µA below which the LED should turn on and set the "min" parameter to 0. Example:
+        If you set a negative threshold of 5V, the LED will turn on as soon as the
+        output value goes below 5V and the LED will turn off when the output value
+        exceeds 5V.
+
+        In intensity mode you can define a range mV or µA that is used to scale the brightness
+        of the LED. Example with min=2V, max=8V: The LED is off at 2V and below, on at
+        8V and above and the brightness is linearly scaled between the values 2V and 8V.
+        If the min value is greater than the max value, the LED brightness is scaled the
+        other way around.
+        """
+        await self.check_validity()
+
+        min = int(min)
+        max = int(max)
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_SET_OUT_LED_STATUS_CONFIG, (min, max, config), BrickletIndustrialAnalogOutV2.CODEC_SET_OUT_LED_STATUS_CONFIG_REQUEST, 0, '')
+
+    async def get_out_led_status_config(self):
+        """
+        Returns the Out LED status configuration as set by :func:`Set Out LED Status Config`.
+        """
+        await self.check_validity()
+
+        return GetOutLEDStatusConfig(*await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_GET_OUT_LED_STATUS_CONFIG, (), '', 13, BrickletIndustrialAnalogOutV2.CODEC_GET_OUT_LED_STATUS_CONFIG_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletIndustrialAnalogOutV2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletIndustrialAnalogOutV2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletIndustrialAnalogOutV2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletIndustrialAnalogOutV2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletIndustrialAnalogOutV2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletIndustrialAnalogOutV2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletIndustrialAnalogOutV2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletIndustrialAnalogOutV2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletIndustrialAnalogOutV2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletIndustrialAnalogOutV2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_WRITE_UID, (uid,), BrickletIndustrialAnalogOutV2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_READ_UID, (), '', 12, BrickletIndustrialAnalogOutV2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIndustrialAnalogOutV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIndustrialAnalogOutV2.CODEC_GET_IDENTITY_RESPONSE))
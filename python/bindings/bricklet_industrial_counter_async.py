@@ -0,0 +1,421 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_industrial_counter import BrickletIndustrialCounter, GetSignalData, GetAllSignalData, GetCounterConfiguration, GetAllCounterCallbackConfiguration, GetAllSignalDataCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_industrial_counter import BrickletIndustrialCounter, GetSignalData, GetAllSignalData, GetCounterConfiguration, GetAllCounterCallbackConfiguration, GetAllSignalDataCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletIndustrialCounterAsync(AsyncDevice, BrickletIndustrialCounter):
+    """
+    4 channel counter up to 4MHz
+
+    asyncio variant of BrickletIndustrialCounter for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_counter(self, channel):
+        """
+        Returns the current counter value for the given channel.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_COUNTER, (channel,), BrickletIndustrialCounter.CODEC_GET_COUNTER_REQUEST, 16, BrickletIndustrialCounter.CODEC_GET_COUNTER_RESPONSE)
+
+    async def get_all_counter(self):
+        """
+        Returns the current counter values for all four channels.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_ALL_COUNTER, (), '', 40, BrickletIndustrialCounter.CODEC_GET_ALL_COUNTER_RESPONSE)
+
+    async def set_counter(self, channel, counter):
+        """
+        Sets the counter value for the given channel.
+
+        The default value for the counters on startup is 0.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        counter = int(counter)
+
+        await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_SET_COUNTER, (channel, counter), BrickletIndustrialCounter.CODEC_SET_COUNTER_REQUEST, 0, '')
+
+    async def set_all_counter(self, counter):
+        """
+        Sets the counter values for all four channels.
+
+        The default value for the counters on startup is 0.
+        """
+        await self.check_validity()
+
+        counter = list(map(int, counter))
+
+        await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_SET_ALL_COUNTER, (counter,), BrickletIndustrialCounter.CODEC_SET_ALL_COUNTER_REQUEST, 0, '')
+
+    async def get_signal_data(self, channel):
+        """
+        Returns the signal data (duty cycle, period, frequency and value) for the
+        given channel.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetSignalData(*await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_SIGNAL_DATA, (channel,), BrickletIndustrialCounter.CODEC_GET_SIGNAL_DATA_REQUEST, 23, BrickletIndustrialCounter.CODEC_GET_SIGNAL_DATA_RESPONSE))
+
+    async def get_all_signal_data(self):
+        """
+        Returns the signal data (duty cycle, period, frequency and value) for all four
+        channels.
+        """
+        await self.check_validity()
+
+        return GetAllSignalData(*await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_ALL_SIGNAL_DATA, (), '', 65, BrickletIndustrialCounter.CODEC_GET_ALL_SIGNAL_DATA_RESPONSE))
+
+    async def set_counter_active(self, channel, active):
+        """
+        Activates/deactivates the counter of the given channel.
+
+        true = activate, false = deactivate.
+
+        By default all channels are activated.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        active = bool(active)
+
+        await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_SET_COUNTER_ACTIVE, (channel, active), BrickletIndustrialCounter.CODEC_SET_COUNTER_ACTIVE_REQUEST, 0, '')
+
+    async def set_all_counter_active(self, active):
+        """
+        Activates/deactivates the counter of all four channels.
+
+        true = activate, false = deactivate.
+
+        By default all channels are activated.
+        """
+        await self.check_validity()
+
+        active = list(map(bool, active))
+
+        await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_SET_ALL_COUNTER_ACTIVE, (active,), BrickletIndustrialCounter.CODEC_SET_ALL_COUNTER_ACTIVE_REQUEST, 0, '')
+
+    async def get_counter_active(self, channel):
+        """
+        Returns the activation state of the given channel.
+
+        true = activated, false = deactivated.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_COUNTER_ACTIVE, (channel,), BrickletIndustrialCounter.CODEC_GET_COUNTER_ACTIVE_REQUEST, 9, BrickletIndustrialCounter.CODEC_GET_COUNTER_ACTIVE_RESPONSE)
+
+    async def get_all_counter_active(self):
+        """
+        Returns the activation state of all four channels.
+
+        true = activated, false = deactivated.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_ALL_COUNTER_ACTIVE, (), '', 9, BrickletIndustrialCounter.CODEC_GET_ALL_COUNTER_ACTIVE_RESPONSE)
+
+    async def set_counter_configuration(self, channel, count_edge, count_direction, duty_cycle_prescaler, frequency_integration_time):
+        """
+        Sets the counter configuration for the given channel.
+
+        * Count Edge: Counter can count on rising, falling or both edges.
+        * Count Direction: Counter can count up or down. You can also use
+          another channel as direction input, see
+          `here <https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Industrial_Counter.html#external-count-direction>`__
+          for details.
+        * Duty Cycle Prescaler: Sets a divider for the internal clock. See
+          `here <https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Industrial_Counter.html#duty-cycle-prescaler-and-frequency-integration-time>`__
+          for details.
+        * Frequency Integration Time: Sets the integration time for the
+          frequency measurement. See
+          `here <https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Industrial_Counter.html#duty-cycle-prescaler-and-frequency-integration-time>`__
+          for details.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        count_edge = int(count_edge)
+        count_direction = int(count_direction)
+        duty_cycle_prescaler = int(duty_cycle_prescaler)
+        frequency_integration_time = int(frequency_integration_time)
+
+        await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_SET_COUNTER_CONFIGURATION, (channel, count_edge, count_direction, duty_cycle_prescaler, frequency_integration_time), BrickletIndustrialCounter.CODEC_SET_COUNTER_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_counter_configuration(self, channel):
+        """
+        Returns the counter configuration as set by :func:`Set Counter Configuration`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetCounterConfiguration(*await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_COUNTER_CONFIGURATION, (channel,), BrickletIndustrialCounter.CODEC_GET_COUNTER_CONFIGURATION_REQUEST, 12, BrickletIndustrialCounter.CODEC_GET_COUNTER_CONFIGURATION_RESPONSE))
+
+    async def set_all_counter_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`All Counter`
+        callback is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_SET_ALL_COUNTER_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletIndustrialCounter.CODEC_SET_ALL_COUNTER_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_all_counter_callback_configuration(self):
+        """
+        Returns the callback configuration as set by
+        :func:`Set All Counter Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAllCounterCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_ALL_COUNTER_CALLBACK_CONFIGURATION, (), '', 13, BrickletIndustrialCounter.CODEC_GET_ALL_COUNTER_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_all_signal_data_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`All Signal Data`
+        callback is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_SET_ALL_SIGNAL_DATA_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletIndustrialCounter.CODEC_SET_ALL_SIGNAL_DATA_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_all_signal_data_callback_configuration(self):
+        """
+        Returns the callback configuration as set by
+        :func:`Set All Signal Data Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAllSignalDataCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_ALL_SIGNAL_DATA_CALLBACK_CONFIGURATION, (), '', 13, BrickletIndustrialCounter.CODEC_GET_ALL_SIGNAL_DATA_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_channel_led_config(self, channel, config):
+        """
+        Each channel has a corresponding LED. You can turn the LED off, on or show a
+        heartbeat. You can also set the LED to "Channel Status". In this mode the
+        LED is on if the channel is high and off otherwise.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_SET_CHANNEL_LED_CONFIG, (channel, config), BrickletIndustrialCounter.CODEC_SET_CHANNEL_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_channel_led_config(self, channel):
+        """
+        Returns the channel LED configuration as set by :func:`Set Channel LED Config`
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_CHANNEL_LED_CONFIG, (channel,), BrickletIndustrialCounter.CODEC_GET_CHANNEL_LED_CONFIG_REQUEST, 9, BrickletIndustrialCounter.CODEC_GET_CHANNEL_LED_CONFIG_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletIndustrialCounter.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletIndustrialCounter.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletIndustrialCounter.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletIndustrialCounter.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletIndustrialCounter.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_WRITE_FIRMWARE, (data,), BrickletIndustrialCounter.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletIndustrialCounter.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletIndustrialCounter.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletIndustrialCounter.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletIndustrialCounter.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_WRITE_UID, (uid,), BrickletIndustrialCounter.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_READ_UID, (), '', 12, BrickletIndustrialCounter.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIndustrialCounter.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIndustrialCounter.CODEC_GET_IDENTITY_RESPONSE))
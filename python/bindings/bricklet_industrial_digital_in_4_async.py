@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_industrial_digital_in_4 import BrickletIndustrialDigitalIn4, GetEdgeCountConfig, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_industrial_digital_in_4 import BrickletIndustrialDigitalIn4, GetEdgeCountConfig, GetIdentity
+
+class BrickletIndustrialDigitalIn4Async(AsyncDevice, BrickletIndustrialDigitalIn4):
+    """
+    4 galvanically isolated digital inputs
+
+    asyncio variant of BrickletIndustrialDigitalIn4 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_value(self):
+        """
+        Returns the input value with a bitmask. The bitmask is 16bit long, *true*
+        refers to high and *false* refers to low.
+
+        For example: The value 3 or 0b0011 means that pins 0-1 are high and the other
+        pins are low.
+
+        If no groups are used (see :func:`Set Group`), the pins correspond to the
+        markings on the IndustrialDigital In 4 Bricklet.
+
+        If groups are used, the pins correspond to the element in the group.
+        Element 1 in the group will get pins 0-3, element 2 pins 4-7, element 3
+        pins 8-11 and element 4 pins 12-15.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_VALUE, (), '', 10, BrickletIndustrialDigitalIn4.CODEC_GET_VALUE_RESPONSE)
+
+    async def set_group(self, group):
+        """
+        Sets a group of Digital In 4 Bricklets that should work together. You can
+        find Bricklets that can be grouped together with :func:`Get Available For Group`.
+
+        The group consists of 4 elements. Element 1 in the group will get pins 0-3,
+        element 2 pins 4-7, element 3 pins 8-11 and element 4 pins 12-15.
+
+        Each element can either be one of the ports ('a' to 'd') or 'n' if it should
+        not be used.
+
+        For example: If you have two Digital In 4 Bricklets connected to port A and
+        port B respectively, you could call with ``['a', 'b', 'n', 'n']``.
+
+        Now the pins on the Digital In 4 on port A are assigned to 0-3 and the
+        pins on the Digital In 4 on port B are assigned to 4-7. It is now possible
+        to call :func:`Get Value` and read out two Bricklets at the same time.
+
+        Changing the group configuration resets all edge counter configurations
+        and values.
+        """
+        await self.check_validity()
+
+        group = create_char_list(group)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_SET_GROUP, (group,), BrickletIndustrialDigitalIn4.CODEC_SET_GROUP_REQUEST, 0, '')
+
+    async def get_group(self):
+        """
+        Returns the group as set by :func:`Set Group`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_GROUP, (), '', 12, BrickletIndustrialDigitalIn4.CODEC_GET_GROUP_RESPONSE)
+
+    async def get_available_for_group(self):
+        """
+        Returns a bitmask of ports that are available for grouping. For example the
+        value 5 or 0b0101 means: Port A and port C are connected to Bricklets that
+        can be grouped together.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_AVAILABLE_FOR_GROUP, (), '', 9, BrickletIndustrialDigitalIn4.CODEC_GET_AVAILABLE_FOR_GROUP_RESPONSE)
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the debounce period of the :cb:`Interrupt` callback.
+
+        For example: If you set this value to 100, you will get the interrupt
+        maximal every 100ms. This is necessary if something that bounces is
+        connected to the Digital In 4 Bricklet, such as a button.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletIndustrialDigitalIn4.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletIndustrialDigitalIn4.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_interrupt(self, interrupt_mask):
+        """
+        Sets the pins on which an interrupt is activated with a bitmask.
+        Interrupts are triggered on changes of the voltage level of the pin,
+        i.e. changes from high to low and low to high.
+
+        For example: An interrupt bitmask of 9 or 0b1001 will enable the interrupt for
+        pins 0 and 3.
+
+        The interrupts use the grouping as set by :func:`Set Group`.
+
+        The interrupt is delivered with the :cb:`Interrupt` callback.
+        """
+        await self.check_validity()
+
+        interrupt_mask = int(interrupt_mask)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_SET_INTERRUPT, (interrupt_mask,), BrickletIndustrialDigitalIn4.CODEC_SET_INTERRUPT_REQUEST, 0, '')
+
+    async def get_interrupt(self):
+        """
+        Returns the interrupt bitmask as set by :func:`Set Interrupt`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_INTERRUPT, (), '', 10, BrickletIndustrialDigitalIn4.CODEC_GET_INTERRUPT_RESPONSE)
+
+    async def get_edge_count(self, pin, reset_counter):
+        """
+        Returns the current value of the edge counter for the selected pin. You can
+        configure the edges that are counted with :func:`Set Edge Count Config`.
+
+        If you set the reset counter to *true*, the count is set back to 0
+        directly after it is read.
+
+        The edge counters use the grouping as set by :func:`Set Group`.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        pin = int(pin)
+        reset_counter = bool(reset_counter)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_EDGE_COUNT, (pin, reset_counter), BrickletIndustrialDigitalIn4.CODEC_GET_EDGE_COUNT_REQUEST, 12, BrickletIndustrialDigitalIn4.CODEC_GET_EDGE_COUNT_RESPONSE)
+
+    async def set_edge_count_config(self, selection_mask, edge_type, debounce):
+        """
+        Configures the edge counter for the selected pins. A bitmask of 9 or 0b1001 will
+        enable the edge counter for pins 0 and 3.
+
+        The edge type parameter configures if rising edges, falling edges or
+        both are counted if the pin is configured for input. Possible edge types are:
+
+        * 0 = rising
+        * 1 = falling
+        * 2 = both
+
+        Configuring an edge counter resets its value to 0.
+
+        If you don't know what any of this means, just leave it at default. The
+        default configuration is very likely OK for you.
+
+        The edge counters use the grouping as set by :func:`Set Group`.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        selection_mask = int(selection_mask)
+        edge_type = int(edge_type)
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_SET_EDGE_COUNT_CONFIG, (selection_mask, edge_type, debounce), BrickletIndustrialDigitalIn4.CODEC_SET_EDGE_COUNT_CONFIG_REQUEST, 0, '')
+
+    async def get_edge_count_config(self, pin):
+        """
+        Returns the edge type and debounce time for the selected pin as set by
+        :func:`Set Edge Count Config`.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        pin = int(pin)
+
+        return GetEdgeCountConfig(*await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_EDGE_COUNT_CONFIG, (pin,), BrickletIndustrialDigitalIn4.CODEC_GET_EDGE_COUNT_CONFIG_REQUEST, 10, BrickletIndustrialDigitalIn4.CODEC_GET_EDGE_COUNT_CONFIG_RESPONSE))
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIndustrialDigitalIn4.CODEC_GET_IDENTITY_RESPONSE))
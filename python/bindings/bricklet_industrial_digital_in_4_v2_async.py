@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_industrial_digital_in_4_v2 import BrickletIndustrialDigitalIn4V2, GetValueCallbackConfiguration, GetAllValueCallbackConfiguration, GetEdgeCountConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_industrial_digital_in_4_v2 import BrickletIndustrialDigitalIn4V2, GetValueCallbackConfiguration, GetAllValueCallbackConfiguration, GetEdgeCountConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletIndustrialDigitalIn4V2Async(AsyncDevice, BrickletIndustrialDigitalIn4V2):
+    """
+    4 galvanically isolated digital inputs
+
+    asyncio variant of BrickletIndustrialDigitalIn4V2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_value(self):
+        """
+        Returns the input value as bools, *true* refers to high and *false* refers to low.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_GET_VALUE, (), '', 9, BrickletIndustrialDigitalIn4V2.CODEC_GET_VALUE_RESPONSE)
+
+    async def set_value_callback_configuration(self, channel, period, value_has_to_change):
+        """
+        This callback can be configured per channel.
+
+        The period is the period with which the :cb:`Value`
+        callback is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_SET_VALUE_CALLBACK_CONFIGURATION, (channel, period, value_has_to_change), BrickletIndustrialDigitalIn4V2.CODEC_SET_VALUE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_value_callback_configuration(self, channel):
+        """
+        Returns the callback configuration for the given channel as set by
+        :func:`Set Value Callback Configuration`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetValueCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_GET_VALUE_CALLBACK_CONFIGURATION, (channel,), BrickletIndustrialDigitalIn4V2.CODEC_GET_VALUE_CALLBACK_CONFIGURATION_REQUEST, 13, BrickletIndustrialDigitalIn4V2.CODEC_GET_VALUE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_all_value_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`All Value`
+        callback is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_SET_ALL_VALUE_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletIndustrialDigitalIn4V2.CODEC_SET_ALL_VALUE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_all_value_callback_configuration(self):
+        """
+        Returns the callback configuration as set by
+        :func:`Set All Value Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAllValueCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_GET_ALL_VALUE_CALLBACK_CONFIGURATION, (), '', 13, BrickletIndustrialDigitalIn4V2.CODEC_GET_ALL_VALUE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_edge_count(self, channel, reset_counter):
+        """
+        Returns the current value of the edge counter for the selected channel. You can
+        configure the edges that are counted with :func:`Set Edge Count Configuration`.
+
+        If you set the reset counter to *true*, the count is set back to 0
+        directly after it is read.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        reset_counter = bool(reset_counter)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_GET_EDGE_COUNT, (channel, reset_counter), BrickletIndustrialDigitalIn4V2.CODEC_GET_EDGE_COUNT_REQUEST, 12, BrickletIndustrialDigitalIn4V2.CODEC_GET_EDGE_COUNT_RESPONSE)
+
+    async def set_edge_count_configuration(self, channel, edge_type, debounce):
+        """
+        Configures the edge counter for a specific channel.
+
+        The edge type parameter configures if rising edges, falling edges or both are
+        counted. Possible edge types are:
+
+        * 0 = rising
+        * 1 = falling
+        * 2 = both
+
+        Configuring an edge counter resets its value to 0.
+
+        If you don't know what any of this means, just leave it at default. The
+        default configuration is very likely OK for you.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        edge_type = int(edge_type)
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_SET_EDGE_COUNT_CONFIGURATION, (channel, edge_type, debounce), BrickletIndustrialDigitalIn4V2.CODEC_SET_EDGE_COUNT_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_edge_count_configuration(self, channel):
+        """
+        Returns the edge type and debounce time for the selected channel as set by
+        :func:`Set Edge Count Configuration`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetEdgeCountConfiguration(*await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_GET_EDGE_COUNT_CONFIGURATION, (channel,), BrickletIndustrialDigitalIn4V2.CODEC_GET_EDGE_COUNT_CONFIGURATION_REQUEST, 10, BrickletIndustrialDigitalIn4V2.CODEC_GET_EDGE_COUNT_CONFIGURATION_RESPONSE))
+
+    async def set_channel_led_config(self, channel, config):
+        """
+        Each channel has a corresponding LED. You can turn the LED off, on or show a
+        heartbeat. You can also set the LED to "Channel Status". In this mode the
+        LED is on if the channel is high and off otherwise.
+
+        By default all channel LEDs are configured as "Channel Status".
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_SET_CHANNEL_LED_CONFIG, (channel, config), BrickletIndustrialDigitalIn4V2.CODEC_SET_CHANNEL_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_channel_led_config(self, channel):
+        """
+        Returns the channel LED configuration as set by :func:`Set Channel LED Config`
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_GET_CHANNEL_LED_CONFIG, (channel,), BrickletIndustrialDigitalIn4V2.CODEC_GET_CHANNEL_LED_CONFIG_REQUEST, 9, BrickletIndustrialDigitalIn4V2.CODEC_GET_CHANNEL_LED_CONFIG_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletIndustrialDigitalIn4V2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletIndustrialDigitalIn4V2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletIndustrialDigitalIn4V2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletIndustrialDigitalIn4V2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletIndustrialDigitalIn4V2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletIndustrialDigitalIn4V2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletIndustrialDigitalIn4V2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletIndustrialDigitalIn4V2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletIndustrialDigitalIn4V2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletIndustrialDigitalIn4V2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_WRITE_UID, (uid,), BrickletIndustrialDigitalIn4V2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_READ_UID, (), '', 12, BrickletIndustrialDigitalIn4V2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIndustrialDigitalIn4V2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIndustrialDigitalIn4V2.CODEC_GET_IDENTITY_RESPONSE))
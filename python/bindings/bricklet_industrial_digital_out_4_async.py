@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_industrial_digital_out_4 import BrickletIndustrialDigitalOut4, GetMonoflop, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_industrial_digital_out_4 import BrickletIndustrialDigitalOut4, GetMonoflop, GetIdentity
+
+class BrickletIndustrialDigitalOut4Async(AsyncDevice, BrickletIndustrialDigitalOut4):
+    """
+    4 galvanically isolated digital outputs
+
+    asyncio variant of BrickletIndustrialDigitalOut4 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_value(self, value_mask):
+        """
+        Sets the output value with a bitmask (16bit). A 1 in the bitmask means high
+        and a 0 in the bitmask means low.
+
+        For example: The value 3 or 0b0011 will turn pins 0-1 high and the other pins
+        low.
+
+        If no groups are used (see :func:`Set Group`), the pins correspond to the
+        markings on the Industrial Digital Out 4 Bricklet.
+
+        If groups are used, the pins correspond to the element in the group.
+        Element 1 in the group will get pins 0-3, element 2 pins 4-7, element 3
+        pins 8-11 and element 4 pins 12-15.
+
+        All running monoflop timers will be aborted if this function is called.
+        """
+        await self.check_validity()
+
+        value_mask = int(value_mask)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalOut4.FUNCTION_SET_VALUE, (value_mask,), BrickletIndustrialDigitalOut4.CODEC_SET_VALUE_REQUEST, 0, '')
+
+    async def get_value(self):
+        """
+        Returns the bitmask as set by :func:`Set Value`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalOut4.FUNCTION_GET_VALUE, (), '', 10, BrickletIndustrialDigitalOut4.CODEC_GET_VALUE_RESPONSE)
+
+    async def set_monoflop(self, selection_mask, value_mask, time):
+        """
+        Configures a monoflop of the pins specified by the first parameter
+        bitmask.
+
+        The second parameter is a bitmask with the desired value of the specified
+        pins. A 1 in the bitmask means high and a 0 in the bitmask means low.
+
+        The third parameter indicates the time that the pins should hold
+        the value.
+
+        If this function is called with the parameters (9, 1, 1500) or
+        (0b1001, 0b0001, 1500): Pin 0 will get high and pin 3 will get low. In 1.5s
+        pin 0 will get low and pin 3 will get high again.
+
+        A monoflop can be used as a fail-safe mechanism. For example: Lets assume you
+        have a RS485 bus and a Digital Out 4 Bricklet connected to one of the slave
+        stacks. You can now call this function every second, with a time parameter
+        of two seconds and pin 0 high. Pin 0 will be high all the time. If now
+        the RS485 connection is lost, then pin 0 will turn low in at most two seconds.
+        """
+        await self.check_validity()
+
+        selection_mask = int(selection_mask)
+        value_mask = int(value_mask)
+        time = int(time)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalOut4.FUNCTION_SET_MONOFLOP, (selection_mask, value_mask, time), BrickletIndustrialDigitalOut4.CODEC_SET_MONOFLOP_REQUEST, 0, '')
+
+    async def get_monoflop(self, pin):
+        """
+        Returns (for the given pin) the current value and the time as set by
+        :func:`Set Monoflop` as well as the remaining time until the value flips.
+
+        If the timer is not running currently, the remaining time will be returned
+        as 0.
+        """
+        await self.check_validity()
+
+        pin = int(pin)
+
+        return GetMonoflop(*await self.ipcon.send_request(self, BrickletIndustrialDigitalOut4.FUNCTION_GET_MONOFLOP, (pin,), BrickletIndustrialDigitalOut4.CODEC_GET_MONOFLOP_REQUEST, 18, BrickletIndustrialDigitalOut4.CODEC_GET_MONOFLOP_RESPONSE))
+
+    async def set_group(self, group):
+        """
+        Sets a group of Digital Out 4 Bricklets that should work together. You can
+        find Bricklets that can be grouped together with :func:`Get Available For Group`.
+
+        The group consists of 4 elements. Element 1 in the group will get pins 0-3,
+        element 2 pins 4-7, element 3 pins 8-11 and element 4 pins 12-15.
+
+        Each element can either be one of the ports ('a' to 'd') or 'n' if it should
+        not be used.
+
+        For example: If you have two Digital Out 4 Bricklets connected to port A and
+        port B respectively, you could call with ``['a', 'b', 'n', 'n']``.
+
+        Now the pins on the Digital Out 4 on port A are assigned to 0-3 and the
+        pins on the Digital Out 4 on port B are assigned to 4-7. It is now possible
+        to call :func:`Set Value` and control two Bricklets at the same time.
+        """
+        await self.check_validity()
+
+        group = create_char_list(group)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalOut4.FUNCTION_SET_GROUP, (group,), BrickletIndustrialDigitalOut4.CODEC_SET_GROUP_REQUEST, 0, '')
+
+    async def get_group(self):
+        """
+        Returns the group as set by :func:`Set Group`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalOut4.FUNCTION_GET_GROUP, (), '', 12, BrickletIndustrialDigitalOut4.CODEC_GET_GROUP_RESPONSE)
+
+    async def get_available_for_group(self):
+        """
+        Returns a bitmask of ports that are available for grouping. For example the
+        value 5 or 0b0101 means: Port A and port C are connected to Bricklets that
+        can be grouped together.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDigitalOut4.FUNCTION_GET_AVAILABLE_FOR_GROUP, (), '', 9, BrickletIndustrialDigitalOut4.CODEC_GET_AVAILABLE_FOR_GROUP_RESPONSE)
+
+    async def set_selected_values(self, selection_mask, value_mask):
+        """
+        Sets the output value with a bitmask, according to the selection mask.
+        The bitmask is 16 bit long, *true* refers to high and *false* refers to
+        low.
+
+        For example: The values (3, 1) or (0b0011, 0b0001) will turn pin 0 high, pin 1
+        low the other pins remain untouched.
+
+        If no groups are used (see :func:`Set Group`), the pins correspond to the
+        markings on the Industrial Digital Out 4 Bricklet.
+
+        If groups are used, the pins correspond to the element in the group.
+        Element 1 in the group will get pins 0-3, element 2 pins 4-7, element 3
+        pins 8-11 and element 4 pins 12-15.
+
+        Running monoflop timers for the selected pins will be aborted if this function
+        is called.
+        """
+        await self.check_validity()
+
+        selection_mask = int(selection_mask)
+        value_mask = int(value_mask)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDigitalOut4.FUNCTION_SET_SELECTED_VALUES, (selection_mask, value_mask), BrickletIndustrialDigitalOut4.CODEC_SET_SELECTED_VALUES_REQUEST, 0, '')
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIndustrialDigitalOut4.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIndustrialDigitalOut4.CODEC_GET_IDENTITY_RESPONSE))
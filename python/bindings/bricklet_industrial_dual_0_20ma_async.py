@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_industrial_dual_0_20ma import BrickletIndustrialDual020mA, GetCurrentCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_industrial_dual_0_20ma import BrickletIndustrialDual020mA, GetCurrentCallbackThreshold, GetIdentity
+
+class BrickletIndustrialDual020mAAsync(AsyncDevice, BrickletIndustrialDual020mA):
+    """
+    Measures two DC currents between 0mA and 20mA (IEC 60381-1)
+
+    asyncio variant of BrickletIndustrialDual020mA for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_current(self, sensor):
+        """
+        Returns the current of the specified sensor.
+
+        It is possible to detect if an IEC 60381-1 compatible sensor is connected
+        and if it works properly.
+
+        If the returned current is below 4mA, there is likely no sensor connected
+        or the sensor may be defect. If the returned current is over 20mA, there might
+        be a short circuit or the sensor may be defect.
+
+        If you want to get the current periodically, it is recommended to use the
+        :cb:`Current` callback and set the period with
+        :func:`Set Current Callback Period`.
+        """
+        await self.check_validity()
+
+        sensor = int(sensor)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mA.FUNCTION_GET_CURRENT, (sensor,), BrickletIndustrialDual020mA.CODEC_GET_CURRENT_REQUEST, 12, BrickletIndustrialDual020mA.CODEC_GET_CURRENT_RESPONSE)
+
+    async def set_current_callback_period(self, sensor, period):
+        """
+        Sets the period with which the :cb:`Current` callback is triggered
+        periodically for the given sensor. A value of 0 turns the callback off.
+
+        The :cb:`Current` callback is only triggered if the current has changed since the
+        last triggering.
+        """
+        await self.check_validity()
+
+        sensor = int(sensor)
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDual020mA.FUNCTION_SET_CURRENT_CALLBACK_PERIOD, (sensor, period), BrickletIndustrialDual020mA.CODEC_SET_CURRENT_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_current_callback_period(self, sensor):
+        """
+        Returns the period as set by :func:`Set Current Callback Period`.
+        """
+        await self.check_validity()
+
+        sensor = int(sensor)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mA.FUNCTION_GET_CURRENT_CALLBACK_PERIOD, (sensor,), BrickletIndustrialDual020mA.CODEC_GET_CURRENT_CALLBACK_PERIOD_REQUEST, 12, BrickletIndustrialDual020mA.CODEC_GET_CURRENT_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_current_callback_threshold(self, sensor, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Current Reached` callback for the given
+        sensor.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the current is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the current is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the current is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the current is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        sensor = int(sensor)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDual020mA.FUNCTION_SET_CURRENT_CALLBACK_THRESHOLD, (sensor, option, min, max), BrickletIndustrialDual020mA.CODEC_SET_CURRENT_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_current_callback_threshold(self, sensor):
+        """
+        Returns the threshold as set by :func:`Set Current Callback Threshold`.
+        """
+        await self.check_validity()
+
+        sensor = int(sensor)
+
+        return GetCurrentCallbackThreshold(*await self.ipcon.send_request(self, BrickletIndustrialDual020mA.FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD, (sensor,), BrickletIndustrialDual020mA.CODEC_GET_CURRENT_CALLBACK_THRESHOLD_REQUEST, 17, BrickletIndustrialDual020mA.CODEC_GET_CURRENT_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callback
+
+        * :cb:`Current Reached`
+
+        is triggered, if the threshold
+
+        * :func:`Set Current Callback Threshold`
+
+        keeps being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDual020mA.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletIndustrialDual020mA.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mA.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletIndustrialDual020mA.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_sample_rate(self, rate):
+        """
+        Sets the sample rate to either 240, 60, 15 or 4 samples per second.
+        The resolution for the rates is 12, 14, 16 and 18 bit respectively.
+
+        .. csv-table::
+         :header: "Value", "Description"
+         :widths: 10, 100
+
+         "0",    "240 samples per second, 12 bit resolution"
+         "1",    "60 samples per second, 14 bit resolution"
+         "2",    "15 samples per second, 16 bit resolution"
+         "3",    "4 samples per second, 18 bit resolution"
+        """
+        await self.check_validity()
+
+        rate = int(rate)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDual020mA.FUNCTION_SET_SAMPLE_RATE, (rate,), BrickletIndustrialDual020mA.CODEC_SET_SAMPLE_RATE_REQUEST, 0, '')
+
+    async def get_sample_rate(self):
+        """
+        Returns the sample rate as set by :func:`Set Sample Rate`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mA.FUNCTION_GET_SAMPLE_RATE, (), '', 9, BrickletIndustrialDual020mA.CODEC_GET_SAMPLE_RATE_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIndustrialDual020mA.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIndustrialDual020mA.CODEC_GET_IDENTITY_RESPONSE))
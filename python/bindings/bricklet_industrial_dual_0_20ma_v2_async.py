@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_industrial_dual_0_20ma_v2 import BrickletIndustrialDual020mAV2, GetCurrentCallbackConfiguration, GetChannelLEDStatusConfig, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_industrial_dual_0_20ma_v2 import BrickletIndustrialDual020mAV2, GetCurrentCallbackConfiguration, GetChannelLEDStatusConfig, GetSPITFPErrorCount, GetIdentity
+
+class BrickletIndustrialDual020mAV2Async(AsyncDevice, BrickletIndustrialDual020mAV2):
+    """
+    Measures two DC currents between 0mA and 20mA (IEC 60381-1)
+
+    asyncio variant of BrickletIndustrialDual020mAV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_current(self, channel):
+        """
+        Returns the current of the specified channel.
+
+        It is possible to detect if an IEC 60381-1 compatible sensor is connected
+        and if it works probably.
+
+        If the returned current is below 4mA, there is likely no sensor connected
+        or the connected sensor is defective. If the returned current is over 20mA,
+        there might be a short circuit or the sensor is defective.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`Current` callback. You can set the callback configuration
+        with :func:`Set Current Callback Configuration`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_GET_CURRENT, (channel,), BrickletIndustrialDual020mAV2.CODEC_GET_CURRENT_REQUEST, 12, BrickletIndustrialDual020mAV2.CODEC_GET_CURRENT_RESPONSE)
+
+    async def set_current_callback_configuration(self, channel, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`Current` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`Current` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_SET_CURRENT_CALLBACK_CONFIGURATION, (channel, period, value_has_to_change, option, min, max), BrickletIndustrialDual020mAV2.CODEC_SET_CURRENT_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_current_callback_configuration(self, channel):
+        """
+        Returns the callback configuration as set by :func:`Set Current Callback Configuration`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetCurrentCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_GET_CURRENT_CALLBACK_CONFIGURATION, (channel,), BrickletIndustrialDual020mAV2.CODEC_GET_CURRENT_CALLBACK_CONFIGURATION_REQUEST, 22, BrickletIndustrialDual020mAV2.CODEC_GET_CURRENT_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_sample_rate(self, rate):
+        """
+        Sets the sample rate to either 240, 60, 15 or 4 samples per second.
+        The resolution for the rates is 12, 14, 16 and 18 bit respectively.
+
+        .. csv-table::
+         :header: "Value", "Description"
+         :widths: 10, 100
+
+         "0",    "240 samples per second, 12 bit resolution"
+         "1",    "60 samples per second, 14 bit resolution"
+         "2",    "15 samples per second, 16 bit resolution"
+         "3",    "4 samples per second, 18 bit resolution"
+        """
+        await self.check_validity()
+
+        rate = int(rate)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_SET_SAMPLE_RATE, (rate,), BrickletIndustrialDual020mAV2.CODEC_SET_SAMPLE_RATE_REQUEST, 0, '')
+
+    async def get_sample_rate(self):
+        """
+        Returns the sample rate as set by :func:`Set Sample Rate`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_GET_SAMPLE_RATE, (), '', 9, BrickletIndustrialDual020mAV2.CODEC_GET_SAMPLE_RATE_RESPONSE)
+
+    async def set_gain(self, gain):
+        """
+        Sets a gain between 1x and 8x. If you want to measure a very small current,
+        you can increase the gain to get some more resolution.
+
+        Example: If you measure 0.5mA with a gain of 8x the return value will be
+        4mA.
+        """
+        await self.check_validity()
+
+        gain = int(gain)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_SET_GAIN, (gain,), BrickletIndustrialDual020mAV2.CODEC_SET_GAIN_REQUEST, 0, '')
+
+    async def get_gain(self):
+        """
+        Returns the gain as set by :func:`Set Gain`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_GET_GAIN, (), '', 9, BrickletIndustrialDual020mAV2.CODEC_GET_GAIN_RESPONSE)
+
+    async def set_channel_led_config(self, channel, config):
+        """
+        Each channel has a corresponding LED. You can turn the LED off, on or show a
+        heartbeat. You can also set the LED to "Channel Status". In this mode the
+        LED can either be turned on with a pre-defined threshold or the intensity
+        of the LED can change with the measured value.
+
+        You can configure the channel status behavior with :func:`Set Channel LED Status Config`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_SET_CHANNEL_LED_CONFIG, (channel, config), BrickletIndustrialDual020mAV2.CODEC_SET_CHANNEL_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_channel_led_config(self, channel):
+        """
+        Returns the channel LED configuration as set by :func:`Set Channel LED Config`
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_GET_CHANNEL_LED_CONFIG, (channel,), BrickletIndustrialDual020mAV2.CODEC_GET_CHANNEL_LED_CONFIG_REQUEST, 9, BrickletIndustrialDual020mAV2.CODEC_GET_CHANNEL_LED_CONFIG_RESPONSE)
+
+    async def set_channel_led_status_config(self, channel, min, max, config):
+        """
+        Sets the channel LED status config. This config is used if the channel LED is
+        configured as "Channel Status", see :func:`Set Channel LED Config`.
+
+        For each channel you can choose between threshold and intensity mode.
+
+        In threshold mode you can define a positive or a negative threshold.
+        For a positive threshold set the "min" parameter to the threshold value in nA
+        above which the LED should turn on and set the "max" parameter to 0. Example:
+        If you set a positive threshold of 10mA, the LED will turn on as soon as the
+        current exceeds 10mA and turn off again if it goes below 10mA.
+        For a negative threshold set the "max" parameter to the threshold value in nA
+        below which the LED should turn on and set the "min" parameter to 0. Example:
+        If you set a negative threshold of 10mA, the LED will turn on as soon as the
+        current goes below 10mA and the LED will turn off when the current exceeds 10mA.
+
+        In intensity mode you can define a range in nA that is used to scale the brightness
+        of the LED. Example with min=4mA and max=20mA: The LED is off at 4mA and below,
+        on at 20mA and above and the brightness is linearly scaled between the values
+        4mA and 20mA. If the min value is greater than the max value, the LED brightness
+        is scaled the other way around.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        min = int(min)
+        max = int(max)
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_SET_CHANNEL_LED_STATUS_CONFIG, (channel, min, max, config), BrickletIndustrialDual020mAV2.CODEC_SET_CHANNEL_LED_STATUS_CONFIG_REQUEST, 0, '')
+
+    async def get_channel_led_status_config(self, channel):
+        """
+        Returns the channel LED status configuration as set by
+        :func:`Set Channel LED Status Config`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetChannelLEDStatusConfig(*await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_GET_CHANNEL_LED_STATUS_CONFIG, (channel,), BrickletIndustrialDual020mAV2.CODEC_GET_CHANNEL_LED_STATUS_CONFIG_REQUEST, 17, BrickletIndustrialDual020mAV2.CODEC_GET_CHANNEL_LED_STATUS_CONFIG_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletIndustrialDual020mAV2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletIndustrialDual020mAV2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletIndustrialDual020mAV2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletIndustrialDual020mAV2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletIndustrialDual020mAV2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletIndustrialDual020mAV2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletIndustrialDual020mAV2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletIndustrialDual020mAV2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletIndustrialDual020mAV2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletIndustrialDual020mAV2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_WRITE_UID, (uid,), BrickletIndustrialDual020mAV2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_READ_UID, (), '', 12, BrickletIndustrialDual020mAV2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIndustrialDual020mAV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIndustrialDual020mAV2.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_industrial_dual_analog_in import BrickletIndustrialDualAnalogIn, GetVoltageCallbackThreshold, GetCalibration, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_industrial_dual_analog_in import BrickletIndustrialDualAnalogIn, GetVoltageCallbackThreshold, GetCalibration, GetIdentity
+
+class BrickletIndustrialDualAnalogInAsync(AsyncDevice, BrickletIndustrialDualAnalogIn):
+    """
+    Measures two DC voltages between -35V and +35V with 24bit resolution each
+
+    asyncio variant of BrickletIndustrialDualAnalogIn for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_voltage(self, channel):
+        """
+        Returns the voltage for the given channel.
+
+        If you want to get the voltage periodically, it is recommended to use the
+        :cb:`Voltage` callback and set the period with
+        :func:`Set Voltage Callback Period`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDualAnalogIn.FUNCTION_GET_VOLTAGE, (channel,), BrickletIndustrialDualAnalogIn.CODEC_GET_VOLTAGE_REQUEST, 12, BrickletIndustrialDualAnalogIn.CODEC_GET_VOLTAGE_RESPONSE)
+
+    async def set_voltage_callback_period(self, channel, period):
+        """
+        Sets the period with which the :cb:`Voltage` callback is triggered
+        periodically for the given channel. A value of 0 turns the callback off.
+
+        The :cb:`Voltage` callback is only triggered if the voltage has changed since the
+        last triggering.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDualAnalogIn.FUNCTION_SET_VOLTAGE_CALLBACK_PERIOD, (channel, period), BrickletIndustrialDualAnalogIn.CODEC_SET_VOLTAGE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_voltage_callback_period(self, channel):
+        """
+        Returns the period as set by :func:`Set Voltage Callback Period`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDualAnalogIn.FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD, (channel,), BrickletIndustrialDualAnalogIn.CODEC_GET_VOLTAGE_CALLBACK_PERIOD_REQUEST, 12, BrickletIndustrialDualAnalogIn.CODEC_GET_VOLTAGE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_voltage_callback_threshold(self, channel, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Voltage Reached` callback for the given
+        channel.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the voltage is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the voltage is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the voltage is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the voltage is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDualAnalogIn.FUNCTION_SET_VOLTAGE_CALLBACK_THRESHOLD, (channel, option, min, max), BrickletIndustrialDualAnalogIn.CODEC_SET_VOLTAGE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_voltage_callback_threshold(self, channel):
+        """
+        Returns the threshold as set by :func:`Set Voltage Callback Threshold`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetVoltageCallbackThreshold(*await self.ipcon.send_request(self, BrickletIndustrialDualAnalogIn.FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD, (channel,), BrickletIndustrialDualAnalogIn.CODEC_GET_VOLTAGE_CALLBACK_THRESHOLD_REQUEST, 17, BrickletIndustrialDualAnalogIn.CODEC_GET_VOLTAGE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callback
+
+        * :cb:`Voltage Reached`
+
+        is triggered, if the threshold
+
+        * :func:`Set Voltage Callback Threshold`
+
+        keeps being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDualAnalogIn.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletIndustrialDualAnalogIn.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDualAnalogIn.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletIndustrialDualAnalogIn.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_sample_rate(self, rate):
+        """
+        Sets the sample rate. The sample rate can be between 1 sample per second
+        and 976 samples per second. Decreasing the sample rate will also decrease the
+        noise on the data.
+        """
+        await self.check_validity()
+
+        rate = int(rate)
+
+        await self.ipcon.send_request(self, BrickletIndustrialDualAnalogIn.FUNCTION_SET_SAMPLE_RATE, (rate,), BrickletIndustrialDualAnalogIn.CODEC_SET_SAMPLE_RATE_REQUEST, 0, '')
+
+    async def get_sample_rate(self):
+        """
+        Returns the sample rate as set by :func:`Set Sample Rate`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDualAnalogIn.FUNCTION_GET_SAMPLE_RATE, (), '', 9, BrickletIndustrialDualAnalogIn.CODEC_GET_SAMPLE_RATE_RESPONSE)
+
+    async def set_calibration(self, offset, gain):
+        """
+        Sets offset and gain of MCP3911 internal calibration registers.
+
+        See MCP3911 datasheet 7.7 and 7.8. The Industrial Dual Analog In Bricklet
+        is already factory calibrated by Tinkerforge. It should not be necessary
+        for you to use this function
+        """
+        await self.check_validity()
+
+        offset = list(map(int, offset))
+        gain = list(map(int, gain))
+
+        await self.ipcon.send_request(self, BrickletIndustrialDualAnalogIn.FUNCTION_SET_CALIBRATION, (offset, gain), BrickletIndustrialDualAnalogIn.CODEC_SET_CALIBRATION_REQUEST, 0, '')
+
+    async def get_calibration(self):
+        """
+        Returns the calibration as set by :func:`Set Calibration`.
+        """
+        await self.check_validity()
+
+        return GetCalibration(*await self.ipcon.send_request(self, BrickletIndustrialDualAnalogIn.FUNCTION_GET_CALIBRATION, (), '', 24, BrickletIndustrialDualAnalogIn.CODEC_GET_CALIBRATION_RESPONSE))
+
+    async def get_adc_values(self):
+        """
+        Returns the ADC values as given by the MCP3911 IC. This function
+        is needed for proper calibration, see :func:`Set Calibration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialDualAnalogIn.FUNCTION_GET_ADC_VALUES, (), '', 16, BrickletIndustrialDualAnalogIn.CODEC_GET_ADC_VALUES_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIndustrialDualAnalogIn.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIndustrialDualAnalogIn.CODEC_GET_IDENTITY_RESPONSE))
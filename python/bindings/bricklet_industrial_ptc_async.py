@@ -0,0 +1,424 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_industrial_ptc import BrickletIndustrialPTC, GetTemperatureCallbackConfiguration, GetResistanceCallbackConfiguration, GetMovingAverageConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_industrial_ptc import BrickletIndustrialPTC, GetTemperatureCallbackConfiguration, GetResistanceCallbackConfiguration, GetMovingAverageConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletIndustrialPTCAsync(AsyncDevice, BrickletIndustrialPTC):
+    """
+    Reads temperatures from Pt100 und Pt1000 sensors
+
+    asyncio variant of BrickletIndustrialPTC for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_temperature(self):
+        """
+        Returns the temperature of the connected sensor.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`Temperature` callback. You can set the callback configuration
+        with :func:`Set Temperature Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_GET_TEMPERATURE, (), '', 12, BrickletIndustrialPTC.CODEC_GET_TEMPERATURE_RESPONSE)
+
+    async def set_temperature_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`Temperature` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`Temperature` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletIndustrialPTC.CODEC_SET_TEMPERATURE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_temperature_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Temperature Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetTemperatureCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION, (), '', 22, BrickletIndustrialPTC.CODEC_GET_TEMPERATURE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_resistance(self):
+        """
+        Returns the value as measured by the MAX31865 precision delta-sigma ADC.
+
+        The value can be converted with the following formulas:
+
+        * Pt100:  resistance = (value * 390) / 32768
+        * Pt1000: resistance = (value * 3900) / 32768
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`Resistance` callback. You can set the callback configuration
+        with :func:`Set Resistance Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_GET_RESISTANCE, (), '', 12, BrickletIndustrialPTC.CODEC_GET_RESISTANCE_RESPONSE)
+
+    async def set_resistance_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`Resistance` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`Resistance` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_SET_RESISTANCE_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletIndustrialPTC.CODEC_SET_RESISTANCE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_resistance_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Resistance Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetResistanceCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_GET_RESISTANCE_CALLBACK_CONFIGURATION, (), '', 22, BrickletIndustrialPTC.CODEC_GET_RESISTANCE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_noise_rejection_filter(self, filter):
+        """
+        Sets the noise rejection filter to either 50Hz (0) or 60Hz (1).
+        Noise from 50Hz or 60Hz power sources (including
+        harmonics of the AC power's fundamental frequency) is
+        attenuated by 82dB.
+        """
+        await self.check_validity()
+
+        filter = int(filter)
+
+        await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_SET_NOISE_REJECTION_FILTER, (filter,), BrickletIndustrialPTC.CODEC_SET_NOISE_REJECTION_FILTER_REQUEST, 0, '')
+
+    async def get_noise_rejection_filter(self):
+        """
+        Returns the noise rejection filter option as set by
+        :func:`Set Noise Rejection Filter`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_GET_NOISE_REJECTION_FILTER, (), '', 9, BrickletIndustrialPTC.CODEC_GET_NOISE_REJECTION_FILTER_RESPONSE)
+
+    async def is_sensor_connected(self):
+        """
+        Returns *true* if the sensor is connected correctly.
+
+        If this function
+        returns *false*, there is either no Pt100 or Pt1000 sensor connected,
+        the sensor is connected incorrectly or the sensor itself is faulty.
+
+        If you want to get the status automatically, it is recommended to use the
+        :cb:`Sensor Connected` callback. You can set the callback configuration
+        with :func:`Set Sensor Connected Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_IS_SENSOR_CONNECTED, (), '', 9, BrickletIndustrialPTC.CODEC_IS_SENSOR_CONNECTED_RESPONSE)
+
+    async def set_wire_mode(self, mode):
+        """
+        Sets the wire mode of the sensor. Possible values are 2, 3 and 4 which
+        correspond to 2-, 3- and 4-wire sensors. The value has to match the jumper
+        configuration on the Bricklet.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_SET_WIRE_MODE, (mode,), BrickletIndustrialPTC.CODEC_SET_WIRE_MODE_REQUEST, 0, '')
+
+    async def get_wire_mode(self):
+        """
+        Returns the wire mode as set by :func:`Set Wire Mode`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_GET_WIRE_MODE, (), '', 9, BrickletIndustrialPTC.CODEC_GET_WIRE_MODE_RESPONSE)
+
+    async def set_moving_average_configuration(self, moving_average_length_resistance, moving_average_length_temperature):
+        """
+        Sets the length of a `moving averaging <https://en.wikipedia.org/wiki/Moving_average>`__
+        for the resistance and temperature.
+
+        Setting the length to 1 will turn the averaging off. With less
+        averaging, there is more noise on the data.
+
+        New data is gathered every 20ms. With a moving average of length 1000 the resulting
+        averaging window has a length of 20s. If you want to do long term measurements the longest
+        moving average will give the cleanest results.
+
+        The default values match the non-changeable averaging settings of the old PTC Bricklet 1.0
+        """
+        await self.check_validity()
+
+        moving_average_length_resistance = int(moving_average_length_resistance)
+        moving_average_length_temperature = int(moving_average_length_temperature)
+
+        await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_SET_MOVING_AVERAGE_CONFIGURATION, (moving_average_length_resistance, moving_average_length_temperature), BrickletIndustrialPTC.CODEC_SET_MOVING_AVERAGE_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_moving_average_configuration(self):
+        """
+        Returns the moving average configuration as set by :func:`Set Moving Average Configuration`.
+        """
+        await self.check_validity()
+
+        return GetMovingAverageConfiguration(*await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_GET_MOVING_AVERAGE_CONFIGURATION, (), '', 12, BrickletIndustrialPTC.CODEC_GET_MOVING_AVERAGE_CONFIGURATION_RESPONSE))
+
+    async def set_sensor_connected_callback_configuration(self, enabled):
+        """
+        If you enable this callback, the :cb:`Sensor Connected` callback is triggered
+        every time a Pt sensor is connected/disconnected.
+        """
+        await self.check_validity()
+
+        enabled = bool(enabled)
+
+        await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_SET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION, (enabled,), BrickletIndustrialPTC.CODEC_SET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_sensor_connected_callback_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Sensor Connected Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_GET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION, (), '', 9, BrickletIndustrialPTC.CODEC_GET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletIndustrialPTC.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletIndustrialPTC.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletIndustrialPTC.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletIndustrialPTC.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletIndustrialPTC.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_WRITE_FIRMWARE, (data,), BrickletIndustrialPTC.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletIndustrialPTC.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletIndustrialPTC.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletIndustrialPTC.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletIndustrialPTC.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_WRITE_UID, (uid,), BrickletIndustrialPTC.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_READ_UID, (), '', 12, BrickletIndustrialPTC.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIndustrialPTC.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIndustrialPTC.CODEC_GET_IDENTITY_RESPONSE))
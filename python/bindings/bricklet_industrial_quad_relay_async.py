@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_industrial_quad_relay import BrickletIndustrialQuadRelay, GetMonoflop, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_industrial_quad_relay import BrickletIndustrialQuadRelay, GetMonoflop, GetIdentity
+
+class BrickletIndustrialQuadRelayAsync(AsyncDevice, BrickletIndustrialQuadRelay):
+    """
+    4 galvanically isolated solid state relays
+
+    asyncio variant of BrickletIndustrialQuadRelay for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_value(self, value_mask):
+        """
+        Sets the output value with a bitmask (16bit). A 1 in the bitmask means relay
+        closed and a 0 means relay open.
+
+        For example: The value 3 or 0b0011 will close the relay of pins 0-1 and open
+        the other pins.
+
+        If no groups are used (see :func:`Set Group`), the pins correspond to the
+        markings on the Industrial Quad Relay Bricklet.
+
+        If groups are used, the pins correspond to the element in the group.
+        Element 1 in the group will get pins 0-3, element 2 pins 4-7, element 3
+        pins 8-11 and element 4 pins 12-15.
+
+        All running monoflop timers will be aborted if this function is called.
+        """
+        await self.check_validity()
+
+        value_mask = int(value_mask)
+
+        await self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_SET_VALUE, (value_mask,), BrickletIndustrialQuadRelay.CODEC_SET_VALUE_REQUEST, 0, '')
+
+    async def get_value(self):
+        """
+        Returns the bitmask as set by :func:`Set Value`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_GET_VALUE, (), '', 10, BrickletIndustrialQuadRelay.CODEC_GET_VALUE_RESPONSE)
+
+    async def set_monoflop(self, selection_mask, value_mask, time):
+        """
+        Configures a monoflop of the pins specified by the first parameter
+        bitmask.
+
+        The second parameter is a bitmask with the desired value of the specified
+        pins. A 1 in the bitmask means relay closed and a 0 means relay open.
+
+        The third parameter indicates the time that the pins should hold
+        the value.
+
+        If this function is called with the parameters (9, 1, 1500) or
+        (0b1001, 0b0001, 1500): Pin 0 will close and pin 3 will open. In 1.5s pin 0
+        will open and pin 3 will close again.
+
+        A monoflop can be used as a fail-safe mechanism. For example: Lets assume you
+        have a RS485 bus and a Quad Relay Bricklet connected to one of the slave
+        stacks. You can now call this function every second, with a time parameter
+        of two seconds and pin 0 closed. Pin 0 will be closed all the time. If now
+        the RS485 connection is lost, then pin 0 will be opened in at most two seconds.
+        """
+        await self.check_validity()
+
+        selection_mask = int(selection_mask)
+        value_mask = int(value_mask)
+        time = int(time)
+
+        await self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_SET_MONOFLOP, (selection_mask, value_mask, time), BrickletIndustrialQuadRelay.CODEC_SET_MONOFLOP_REQUEST, 0, '')
+
+    async def get_monoflop(self, pin):
+        """
+        Returns (for the given pin) the current value and the time as set by
+        :func:`Set Monoflop` as well as the remaining time until the value flips.
+
+        If the timer is not running currently, the remaining time will be returned
+        as 0.
+        """
+        await self.check_validity()
+
+        pin = int(pin)
+
+        return GetMonoflop(*await self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_GET_MONOFLOP, (pin,), BrickletIndustrialQuadRelay.CODEC_GET_MONOFLOP_REQUEST, 18, BrickletIndustrialQuadRelay.CODEC_GET_MONOFLOP_RESPONSE))
+
+    async def set_group(self, group):
+        """
+        Sets a group of Quad Relay Bricklets that should work together. You can
+        find Bricklets that can be grouped together with :func:`Get Available For Group`.
+
+        The group consists of 4 elements. Element 1 in the group will get pins 0-3,
+        element 2 pins 4-7, element 3 pins 8-11 and element 4 pins 12-15.
+
+        Each element can either be one of the ports ('a' to 'd') or 'n' if it should
+        not be used.
+
+        For example: If you have two Quad Relay Bricklets connected to port A and
+        port B respectively, you could call with ``['a', 'b', 'n', 'n']``.
+
+        Now the pins on the Quad Relay on port A are assigned to 0-3 and the
+        pins on the Quad Relay on port B are assigned to 4-7. It is now possible
+        to call :func:`Set Value` and control two Bricklets at the same time.
+        """
+        await self.check_validity()
+
+        group = create_char_list(group)
+
+        await self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_SET_GROUP, (group,), BrickletIndustrialQuadRelay.CODEC_SET_GROUP_REQUEST, 0, '')
+
+    async def get_group(self):
+        """
+        Returns the group as set by :func:`Set Group`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_GET_GROUP, (), '', 12, BrickletIndustrialQuadRelay.CODEC_GET_GROUP_RESPONSE)
+
+    async def get_available_for_group(self):
+        """
+        Returns a bitmask of ports that are available for grouping. For example the
+        value 5 or 0b0101 means: Port A and port C are connected to Bricklets that
+        can be grouped together.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_GET_AVAILABLE_FOR_GROUP, (), '', 9, BrickletIndustrialQuadRelay.CODEC_GET_AVAILABLE_FOR_GROUP_RESPONSE)
+
+    async def set_selected_values(self, selection_mask, value_mask):
+        """
+        Sets the output value with a bitmask, according to the selection mask.
+        The bitmask is 16 bit long, *true* refers to a closed relay and
+        *false* refers to an open relay.
+
+        For example: The values (3, 1) or (0b0011, 0b0001) will close the relay of
+        pin 0, open the relay of pin 1 and leave the others untouched.
+
+        If no groups are used (see :func:`Set Group`), the pins correspond to the
+        markings on the Industrial Quad Relay Bricklet.
+
+        If groups are used, the pins correspond to the element in the group.
+        Element 1 in the group will get pins 0-3, element 2 pins 4-7, element 3
+        pins 8-11 and element 4 pins 12-15.
+
+        Running monoflop timers for the selected relays will be aborted if this function
+        is called.
+        """
+        await self.check_validity()
+
+        selection_mask = int(selection_mask)
+        value_mask = int(value_mask)
+
+        await self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_SET_SELECTED_VALUES, (selection_mask, value_mask), BrickletIndustrialQuadRelay.CODEC_SET_SELECTED_VALUES_REQUEST, 0, '')
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIndustrialQuadRelay.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIndustrialQuadRelay.CODEC_GET_IDENTITY_RESPONSE))
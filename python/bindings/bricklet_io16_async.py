@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_io16 import BrickletIO16, GetPortConfiguration, GetPortMonoflop, GetEdgeCountConfig, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_io16 import BrickletIO16, GetPortConfiguration, GetPortMonoflop, GetEdgeCountConfig, GetIdentity
+
+class BrickletIO16Async(AsyncDevice, BrickletIO16):
+    """
+    16-channel digital input/output
+
+    asyncio variant of BrickletIO16 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_port(self, port, value_mask):
+        """
+        Sets the output value (high or low) for a port ("a" or "b") with a bitmask
+        (8bit). A 1 in the bitmask means high and a 0 in the bitmask means low.
+
+        For example: The value 15 or 0b00001111 will turn the pins 0-3 high and the
+        pins 4-7 low for the specified port.
+
+        All running monoflop timers of the given port will be aborted if this function
+        is called.
+
+        .. note::
+         This function does nothing for pins that are configured as input.
+         Pull-up resistors can be switched on with :func:`Set Port Configuration`.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+        value_mask = int(value_mask)
+
+        await self.ipcon.send_request(self, BrickletIO16.FUNCTION_SET_PORT, (port, value_mask), BrickletIO16.CODEC_SET_PORT_REQUEST, 0, '')
+
+    async def get_port(self, port):
+        """
+        Returns a bitmask of the values that are currently measured on the
+        specified port. This function works if the pin is configured to input
+        as well as if it is configured to output.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+
+        return await self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_PORT, (port,), BrickletIO16.CODEC_GET_PORT_REQUEST, 9, BrickletIO16.CODEC_GET_PORT_RESPONSE)
+
+    async def set_port_configuration(self, port, selection_mask, direction, value):
+        """
+        Configures the value and direction of a specified port. Possible directions
+        are 'i' and 'o' for input and output.
+
+        If the direction is configured as output, the value is either high or low
+        (set as *true* or *false*).
+
+        If the direction is configured as input, the value is either pull-up or
+        default (set as *true* or *false*).
+
+        For example:
+
+        * ('a', 255, 'i', true) or ('a', 0b11111111, 'i', true) will set all pins of port A as input pull-up.
+        * ('a', 128, 'i', false) or ('a', 0b10000000, 'i', false) will set pin 7 of port A as input default (floating if nothing is connected).
+        * ('b', 3, 'o', false) or ('b', 0b00000011, 'o', false) will set pins 0 and 1 of port B as output low.
+        * ('b', 4, 'o', true) or ('b', 0b00000100, 'o', true) will set pin 2 of port B as output high.
+
+        Running monoflop timers for the selected pins will be aborted if this
+        function is called.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+        selection_mask = int(selection_mask)
+        direction = create_char(direction)
+        value = bool(value)
+
+        await self.ipcon.send_request(self, BrickletIO16.FUNCTION_SET_PORT_CONFIGURATION, (port, selection_mask, direction, value), BrickletIO16.CODEC_SET_PORT_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_port_configuration(self, port):
+        """
+        Returns a direction bitmask and a value bitmask for the specified port. A 1 in
+        the direction bitmask means input and a 0 in the bitmask means output.
+
+        For example: A return value of (15, 51) or (0b00001111, 0b00110011) for
+        direction and value means that:
+
+        * pins 0 and 1 are configured as input pull-up,
+        * pins 2 and 3 are configured as input default,
+        * pins 4 and 5 are configured as output high
+        * and pins 6 and 7 are configured as output low.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+
+        return GetPortConfiguration(*await self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_PORT_CONFIGURATION, (port,), BrickletIO16.CODEC_GET_PORT_CONFIGURATION_REQUEST, 10, BrickletIO16.CODEC_GET_PORT_CONFIGURATION_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the debounce period of the :cb:`Interrupt` callback.
+
+        For example: If you set this value to 100, you will get the interrupt
+        maximal every 100ms. This is necessary if something that bounces is
+        connected to the IO-16 Bricklet, such as a button.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletIO16.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletIO16.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletIO16.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_port_interrupt(self, port, interrupt_mask):
+        """
+        Sets the pins on which an interrupt is activated with a bitmask.
+        Interrupts are triggered on changes of the voltage level of the pin,
+        i.e. changes from high to low and low to high.
+
+        For example: ('a', 129) or ('a', 0b10000001) will enable the interrupt for
+        pins 0 and 7 of port a.
+
+        The interrupt is delivered with the :cb:`Interrupt` callback.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+        interrupt_mask = int(interrupt_mask)
+
+        await self.ipcon.send_request(self, BrickletIO16.FUNCTION_SET_PORT_INTERRUPT, (port, interrupt_mask), BrickletIO16.CODEC_SET_PORT_INTERRUPT_REQUEST, 0, '')
+
+    async def get_port_interrupt(self, port):
+        """
+        Returns the interrupt bitmask for the specified port as set by
+        :func:`Set Port Interrupt`.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+
+        return await self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_PORT_INTERRUPT, (port,), BrickletIO16.CODEC_GET_PORT_INTERRUPT_REQUEST, 9, BrickletIO16.CODEC_GET_PORT_INTERRUPT_RESPONSE)
+
+    async def set_port_monoflop(self, port, selection_mask, value_mask, time):
+        """
+        Configures a monoflop of the pins specified by the second parameter as 8 bit
+        long bitmask. The specified pins must be configured for output. Non-output
+        pins will be ignored.
+
+        The third parameter is a bitmask with the desired value of the specified
+        output pins. A 1 in the bitmask means high and a 0 in the bitmask means low.
+
+        The forth parameter indicates the time that the pins should hold
+        the value.
+
+        If this function is called with the parameters ('a', 9, 1, 1500) or
+        ('a', 0b00001001, 0b00000001, 1500): Pin 0 will get high and pin 3 will get
+        low on port 'a'. In 1.5s pin 0 will get low and pin 3 will get high again.
+
+        A monoflop can be used as a fail-safe mechanism. For example: Lets assume you
+        have a RS485 bus and an IO-16 Bricklet connected to one of the slave
+        stacks. You can now call this function every second, with a time parameter
+        of two seconds and pin 0 set to high. Pin 0 will be high all the time. If now
+        the RS485 connection is lost, then pin 0 will get low in at most two seconds.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+        selection_mask = int(selection_mask)
+        value_mask = int(value_mask)
+        time = int(time)
+
+        await self.ipcon.send_request(self, BrickletIO16.FUNCTION_SET_PORT_MONOFLOP, (port, selection_mask, value_mask, time), BrickletIO16.CODEC_SET_PORT_MONOFLOP_REQUEST, 0, '')
+
+    async def get_port_monoflop(self, port, pin):
+        """
+        Returns (for the given pin) the current value and the time as set by
+        :func:`Set Port Monoflop` as well as the remaining time until the value flips.
+
+        If the timer is not running currently, the remaining time will be returned
+        as 0.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+        pin = int(pin)
+
+        return GetPortMonoflop(*await self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_PORT_MONOFLOP, (port, pin), BrickletIO16.CODEC_GET_PORT_MONOFLOP_REQUEST, 17, BrickletIO16.CODEC_GET_PORT_MONOFLOP_RESPONSE))
+
+    async def set_selected_values(self, port, selection_mask, value_mask):
+        """
+        Sets the output value (high or low) for a port ("a" or "b" with a bitmask,
+        according to the selection mask. The bitmask is 8 bit long and a 1 in the
+        bitmask means high and a 0 in the bitmask means low.
+
+        For example: The parameters ('a', 192, 128) or ('a', 0b11000000, 0b10000000)
+        will turn pin 7 high and pin 6 low on port A, pins 0-6 will remain untouched.
+
+        Running monoflop timers for the selected pins will be aborted if this
+        function is called.
+
+        .. note::
+         This function does nothing for pins that are configured as input.
+         Pull-up resistors can be switched on with :func:`Set Port Configuration`.
+        """
+        await self.check_validity()
+
+        port = create_char(port)
+        selection_mask = int(selection_mask)
+        value_mask = int(value_mask)
+
+        await self.ipcon.send_request(self, BrickletIO16.FUNCTION_SET_SELECTED_VALUES, (port, selection_mask, value_mask), BrickletIO16.CODEC_SET_SELECTED_VALUES_REQUEST, 0, '')
+
+    async def get_edge_count(self, pin, reset_counter):
+        """
+        Returns the current value of the edge counter for the selected pin on port A.
+        You can configure the edges that are counted with :func:`Set Edge Count Config`.
+
+        If you set the reset counter to *true*, the count is set back to 0
+        directly after it is read.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        pin = int(pin)
+        reset_counter = bool(reset_counter)
+
+        return await self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_EDGE_COUNT, (pin, reset_counter), BrickletIO16.CODEC_GET_EDGE_COUNT_REQUEST, 12, BrickletIO16.CODEC_GET_EDGE_COUNT_RESPONSE)
+
+    async def set_edge_count_config(self, pin, edge_type, debounce):
+        """
+        Configures the edge counter for the selected pin of port A. Pins 0 and 1
+        are available for edge counting.
+
+        The edge type parameter configures if rising edges, falling edges or
+        both are counted if the pin is configured for input. Possible edge types are:
+
+        * 0 = rising
+        * 1 = falling
+        * 2 = both
+
+        Configuring an edge counter resets its value to 0.
+
+        If you don't know what any of this means, just leave it at default. The
+        default configuration is very likely OK for you.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        pin = int(pin)
+        edge_type = int(edge_type)
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletIO16.FUNCTION_SET_EDGE_COUNT_CONFIG, (pin, edge_type, debounce), BrickletIO16.CODEC_SET_EDGE_COUNT_CONFIG_REQUEST, 0, '')
+
+    async def get_edge_count_config(self, pin):
+        """
+        Returns the edge type and debounce time for the selected pin of port A as set by
+        :func:`Set Edge Count Config`.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        pin = int(pin)
+
+        return GetEdgeCountConfig(*await self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_EDGE_COUNT_CONFIG, (pin,), BrickletIO16.CODEC_GET_EDGE_COUNT_CONFIG_REQUEST, 10, BrickletIO16.CODEC_GET_EDGE_COUNT_CONFIG_RESPONSE))
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIO16.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIO16.CODEC_GET_IDENTITY_RESPONSE))
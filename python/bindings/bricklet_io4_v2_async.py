@@ -0,0 +1,468 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_io4_v2 import BrickletIO4V2, GetConfiguration, GetInputValueCallbackConfiguration, GetAllInputValueCallbackConfiguration, GetMonoflop, GetEdgeCountConfiguration, GetPWMConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_io4_v2 import BrickletIO4V2, GetConfiguration, GetInputValueCallbackConfiguration, GetAllInputValueCallbackConfiguration, GetMonoflop, GetEdgeCountConfiguration, GetPWMConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletIO4V2Async(AsyncDevice, BrickletIO4V2):
+    """
+    4-channel digital input/output
+
+    asyncio variant of BrickletIO4V2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_value(self, value):
+        """
+        Sets the output value of all four channels. A value of *true* or *false* outputs
+        logic 1 or logic 0 respectively on the corresponding channel.
+
+        Use :func:`Set Selected Value` to change only one output channel state.
+
+        For example: (True, True, False, False) will turn the channels 0-1 high and the
+        channels 2-3 low.
+
+        All running monoflop timers and PWMs will be aborted if this function is called.
+
+        .. note::
+         This function does nothing for channels that are configured as input. Pull-up
+         resistors can be switched on with :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        value = list(map(bool, value))
+
+        await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_SET_VALUE, (value,), BrickletIO4V2.CODEC_SET_VALUE_REQUEST, 0, '')
+
+    async def get_value(self):
+        """
+        Returns the logic levels that are currently measured on the channels.
+        This function works if the channel is configured as input as well as if it is
+        configured as output.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_GET_VALUE, (), '', 9, BrickletIO4V2.CODEC_GET_VALUE_RESPONSE)
+
+    async def set_selected_value(self, channel, value):
+        """
+        Sets the output value of a specific channel without affecting the other channels.
+
+        A running monoflop timer or PWM for the specific channel will be aborted if this
+        function is called.
+
+        .. note::
+         This function does nothing for channels that are configured as input. Pull-up
+         resistors can be switched on with :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        value = bool(value)
+
+        await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_SET_SELECTED_VALUE, (channel, value), BrickletIO4V2.CODEC_SET_SELECTED_VALUE_REQUEST, 0, '')
+
+    async def set_configuration(self, channel, direction, value):
+        """
+        Configures the value and direction of a specific channel. Possible directions
+        are 'i' and 'o' for input and output.
+
+        If the direction is configured as output, the value is either high or low
+        (set as *true* or *false*).
+
+        If the direction is configured as input, the value is either pull-up or
+        default (set as *true* or *false*).
+
+        For example:
+
+        * (0, 'i', true) will set channel 0 as input pull-up.
+        * (1, 'i', false) will set channel 1 as input default (floating if nothing is connected).
+        * (2, 'o', true) will set channel 2 as output high.
+        * (3, 'o', false) will set channel 3 as output low.
+
+        A running monoflop timer or PWM for the specific channel will be aborted if this
+        function is called.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        direction = create_char(direction)
+        value = bool(value)
+
+        await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_SET_CONFIGURATION, (channel, direction, value), BrickletIO4V2.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self, channel):
+        """
+        Returns the channel configuration as set by :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetConfiguration(*await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_GET_CONFIGURATION, (channel,), BrickletIO4V2.CODEC_GET_CONFIGURATION_REQUEST, 10, BrickletIO4V2.CODEC_GET_CONFIGURATION_RESPONSE))
+
+    async def set_input_value_callback_configuration(self, channel, period, value_has_to_change):
+        """
+        This callback can be configured per channel.
+
+        The period is the period with which the :cb:`Input Value`
+        callback is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_SET_INPUT_VALUE_CALLBACK_CONFIGURATION, (channel, period, value_has_to_change), BrickletIO4V2.CODEC_SET_INPUT_VALUE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_input_value_callback_configuration(self, channel):
+        """
+        Returns the callback configuration for the given channel as set by
+        :func:`Set Input Value Callback Configuration`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetInputValueCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_GET_INPUT_VALUE_CALLBACK_CONFIGURATION, (channel,), BrickletIO4V2.CODEC_GET_INPUT_VALUE_CALLBACK_CONFIGURATION_REQUEST, 13, BrickletIO4V2.CODEC_GET_INPUT_VALUE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_all_input_value_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`All Input Value`
+        callback is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_SET_ALL_INPUT_VALUE_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletIO4V2.CODEC_SET_ALL_INPUT_VALUE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_all_input_value_callback_configuration(self):
+        """
+        Returns the callback configuration as set by
+        :func:`Set All Input Value Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAllInputValueCallbackConfiguration(*await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_GET_ALL_INPUT_VALUE_CALLBACK_CONFIGURATION, (), '', 13, BrickletIO4V2.CODEC_GET_ALL_INPUT_VALUE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_monoflop(self, channel, value, time):
+        """
+        The first parameter is the desired state of the channel (*true* means output *high*
+        and *false* means output *low*). The second parameter indicates the time that
+        the channel should hold the state.
+
+        If this function is called with the parameters (true, 1500):
+        The channel will turn on and in 1.5s it will turn off again.
+
+        A PWM for the selected channel will be aborted if this function is called.
+
+        A monoflop can be used as a failsafe mechanism. For example: Lets assume you
+        have a RS485 bus and a IO-4 Bricklet 2.0 is connected to one of the slave
+        stacks. You can now call this function every second, with a time parameter
+        of two seconds. The channel will be *high* all the time. If now the RS485
+        connection is lost, the channel will turn *low* in at most two seconds.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        value = bool(value)
+        time = int(time)
+
+        await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_SET_MONOFLOP, (channel, value, time), BrickletIO4V2.CODEC_SET_MONOFLOP_REQUEST, 0, '')
+
+    async def get_monoflop(self, channel):
+        """
+        Returns (for the given channel) the current value and the time as set by
+        :func:`Set Monoflop` as well as the remaining time until the value flips.
+
+        If the timer is not running currently, the remaining time will be returned
+        as 0.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetMonoflop(*await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_GET_MONOFLOP, (channel,), BrickletIO4V2.CODEC_GET_MONOFLOP_REQUEST, 17, BrickletIO4V2.CODEC_GET_MONOFLOP_RESPONSE))
+
+    async def get_edge_count(self, channel, reset_counter):
+        """
+        Returns the current value of the edge counter for the selected channel. You can
+        configure the edges that are counted with :func:`Set Edge Count Configuration`.
+
+        If you set the reset counter to *true*, the count is set back to 0
+        directly after it is read.
+
+        .. note::
+         Calling this function is only allowed for channels configured as input.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        reset_counter = bool(reset_counter)
+
+        return await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_GET_EDGE_COUNT, (channel, reset_counter), BrickletIO4V2.CODEC_GET_EDGE_COUNT_REQUEST, 12, BrickletIO4V2.CODEC_GET_EDGE_COUNT_RESPONSE)
+
+    async def set_edge_count_configuration(self, channel, edge_type, debounce):
+        """
+        Configures the edge counter for a specific channel.
+
+        The edge type parameter configures if rising edges, falling edges or
+        both are counted if the channel is configured for input. Possible edge types are:
+
+        * 0 = rising
+        * 1 = falling
+        * 2 = both
+
+        Configuring an edge counter resets its value to 0.
+
+        If you don't know what any of this means, just leave it at default. The
+        default configuration is very likely OK for you.
+
+        .. note::
+         Calling this function is only allowed for channels configured as input.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        edge_type = int(edge_type)
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_SET_EDGE_COUNT_CONFIGURATION, (channel, edge_type, debounce), BrickletIO4V2.CODEC_SET_EDGE_COUNT_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_edge_count_configuration(self, channel):
+        """
+        Returns the edge type and debounce time for the selected channel as set by
+        :func:`Set Edge Count Configuration`.
+
+        .. note::
+         Calling this function is only allowed for channels configured as input.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetEdgeCountConfiguration(*await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_GET_EDGE_COUNT_CONFIGURATION, (channel,), BrickletIO4V2.CODEC_GET_EDGE_COUNT_CONFIGURATION_REQUEST, 10, BrickletIO4V2.CODEC_GET_EDGE_COUNT_CONFIGURATION_RESPONSE))
+
+    async def set_pwm_configuration(self, channel, frequency, duty_cycle):
+        """
+        Activates a PWM for the given channel.
+
+        You need to set the channel to output before you call this function, otherwise it will
+        report an invalid parameter error. To turn the PWM off again, you can set the frequency to 0 or any other
+        function that changes a value of the channel (e.g. :func:`Set Selected Value`).
+
+        A running monoflop timer for the given channel will be aborted if this function
+        is called.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        frequency = int(frequency)
+        duty_cycle = int(duty_cycle)
+
+        await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_SET_PWM_CONFIGURATION, (channel, frequency, duty_cycle), BrickletIO4V2.CODEC_SET_PWM_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_pwm_configuration(self, channel):
+        """
+        Returns the PWM configuration as set by :func:`Set PWM Configuration`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetPWMConfiguration(*await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_GET_PWM_CONFIGURATION, (channel,), BrickletIO4V2.CODEC_GET_PWM_CONFIGURATION_REQUEST, 14, BrickletIO4V2.CODEC_GET_PWM_CONFIGURATION_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletIO4V2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletIO4V2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletIO4V2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletIO4V2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletIO4V2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletIO4V2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletIO4V2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletIO4V2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletIO4V2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletIO4V2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_WRITE_UID, (uid,), BrickletIO4V2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_READ_UID, (), '', 12, BrickletIO4V2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletIO4V2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletIO4V2.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_joystick import BrickletJoystick, GetPosition, GetAnalogValue, GetPositionCallbackThreshold, GetAnalogValueCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_joystick import BrickletJoystick, GetPosition, GetAnalogValue, GetPositionCallbackThreshold, GetAnalogValueCallbackThreshold, GetIdentity
+
+class BrickletJoystickAsync(AsyncDevice, BrickletJoystick):
+    """
+    2-axis joystick with push-button
+
+    asyncio variant of BrickletJoystick for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_position(self):
+        """
+        Returns the position of the joystick. The middle position of the joystick is x=0, y=0.
+        The returned values are averaged and calibrated (see :func:`Calibrate`).
+
+        If you want to get the position periodically, it is recommended to use the
+        :cb:`Position` callback and set the period with
+        :func:`Set Position Callback Period`.
+        """
+        await self.check_validity()
+
+        return GetPosition(*await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_GET_POSITION, (), '', 12, BrickletJoystick.CODEC_GET_POSITION_RESPONSE))
+
+    async def is_pressed(self):
+        """
+        Returns *true* if the button is pressed and *false* otherwise.
+
+        It is recommended to use the :cb:`Pressed` and :cb:`Released` callbacks
+        to handle the button.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_IS_PRESSED, (), '', 9, BrickletJoystick.CODEC_IS_PRESSED_RESPONSE)
+
+    async def get_analog_value(self):
+        """
+        Returns the values as read by a 12-bit analog-to-digital converter.
+
+        .. note::
+         The values returned by :func:`Get Position` are averaged over several samples
+         to yield less noise, while :func:`Get Analog Value` gives back raw
+         unfiltered analog values. The only reason to use :func:`Get Analog Value` is,
+         if you need the full resolution of the analog-to-digital converter.
+
+        If you want the analog values periodically, it is recommended to use the
+        :cb:`Analog Value` callback and set the period with
+        :func:`Set Analog Value Callback Period`.
+        """
+        await self.check_validity()
+
+        return GetAnalogValue(*await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_GET_ANALOG_VALUE, (), '', 12, BrickletJoystick.CODEC_GET_ANALOG_VALUE_RESPONSE))
+
+    async def calibrate(self):
+        """
+        Calibrates the middle position of the joystick. If your Joystick Bricklet
+        does not return x=0 and y=0 in the middle position, call this function
+        while the joystick is standing still in the middle position.
+
+        The resulting calibration will be saved on the EEPROM of the Joystick
+        Bricklet, thus you only have to calibrate it once.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_CALIBRATE, (), '', 0, '')
+
+    async def set_position_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Position` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Position` callback is only triggered if the position has changed since the
+        last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_SET_POSITION_CALLBACK_PERIOD, (period,), BrickletJoystick.CODEC_SET_POSITION_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_position_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Position Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_GET_POSITION_CALLBACK_PERIOD, (), '', 12, BrickletJoystick.CODEC_GET_POSITION_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_analog_value_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Analog Value` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Analog Value` callback is only triggered if the analog values have
+        changed since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD, (period,), BrickletJoystick.CODEC_SET_ANALOG_VALUE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_analog_value_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Analog Value Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD, (), '', 12, BrickletJoystick.CODEC_GET_ANALOG_VALUE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_position_callback_threshold(self, option, min_x, max_x, min_y, max_y):
+        """
+        Sets the thresholds for the :cb:`Position Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the position is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the position is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the position is smaller than the min values (max is ignored)"
+         "'>'",    "Callback is triggered when the position is greater than the min values (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min_x = int(min_x)
+        max_x = int(max_x)
+        min_y = int(min_y)
+        max_y = int(max_y)
+
+        await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_SET_POSITION_CALLBACK_THRESHOLD, (option, min_x, max_x, min_y, max_y), BrickletJoystick.CODEC_SET_POSITION_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_position_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Position Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetPositionCallbackThreshold(*await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_GET_POSITION_CALLBACK_THRESHOLD, (), '', 17, BrickletJoystick.CODEC_GET_POSITION_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_analog_value_callback_threshold(self, option, min_x, max_x, min_y, max_y):
+        """
+        Sets the thresholds for the :cb:`Analog Value Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the analog values are *outside* the min and max values"
+         "'i'",    "Callback is triggered when the analog values are *inside* the min and max values"
+         "'<'",    "Callback is triggered when the analog values are smaller than the min values (max is ignored)"
+         "'>'",    "Callback is triggered when the analog values are greater than the min values (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min_x = int(min_x)
+        max_x = int(max_x)
+        min_y = int(min_y)
+        max_y = int(max_y)
+
+        await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD, (option, min_x, max_x, min_y, max_y), BrickletJoystick.CODEC_SET_ANALOG_VALUE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_analog_value_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Analog Value Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetAnalogValueCallbackThreshold(*await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD, (), '', 17, BrickletJoystick.CODEC_GET_ANALOG_VALUE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callbacks
+
+        * :cb:`Position Reached`,
+        * :cb:`Analog Value Reached`
+
+        are triggered, if the thresholds
+
+        * :func:`Set Position Callback Threshold`,
+        * :func:`Set Analog Value Callback Threshold`
+
+        keep being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletJoystick.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletJoystick.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletJoystick.FUNCTION_GET_IDENTITY, (), '', 33, BrickletJoystick.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_laser_range_finder import BrickletLaserRangeFinder, GetDistanceCallbackThreshold, GetVelocityCallbackThreshold, GetMovingAverage, GetConfiguration, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_laser_range_finder import BrickletLaserRangeFinder, GetDistanceCallbackThreshold, GetVelocityCallbackThreshold, GetMovingAverage, GetConfiguration, GetIdentity
+
+class BrickletLaserRangeFinderAsync(AsyncDevice, BrickletLaserRangeFinder):
+    """
+    Measures distance up to 40m with laser light
+
+    asyncio variant of BrickletLaserRangeFinder for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_distance(self):
+        """
+        Returns the measured distance.
+
+        Sensor hardware version 1 (see :func:`Get Sensor Hardware Version`) cannot
+        measure distance and velocity at the same time. Therefore, the distance mode
+        has to be enabled using :func:`Set Mode`.
+        Sensor hardware version 3 can measure distance and velocity at the same
+        time. Also the laser has to be enabled, see :func:`Enable Laser`.
+
+        If you want to get the distance periodically, it is recommended to
+        use the :cb:`Distance` callback and set the period with
+        :func:`Set Distance Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_GET_DISTANCE, (), '', 10, BrickletLaserRangeFinder.CODEC_GET_DISTANCE_RESPONSE)
+
+    async def get_velocity(self):
+        """
+        Returns the measured velocity.
+
+        Sensor hardware version 1 (see :func:`Get Sensor Hardware Version`) cannot
+        measure distance and velocity at the same time. Therefore, the velocity mode
+        has to be enabled using :func:`Set Mode`.
+        Sensor hardware version 3 can measure distance and velocity at the same
+        time, but the velocity measurement only produces stables results if a fixed
+        measurement rate (see :func:`Set Configuration`) is configured. Also the laser
+        has to be enabled, see :func:`Enable Laser`.
+
+        If you want to get the velocity periodically, it is recommended to
+        use the :cb:`Velocity` callback and set the period with
+        :func:`Set Velocity Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_GET_VELOCITY, (), '', 10, BrickletLaserRangeFinder.CODEC_GET_VELOCITY_RESPONSE)
+
+    async def set_distance_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Distance` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Distance` callback is only triggered if the distance value has
+        changed since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_SET_DISTANCE_CALLBACK_PERIOD, (period,), BrickletLaserRangeFinder.CODEC_SET_DISTANCE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_distance_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Distance Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_GET_DISTANCE_CALLBACK_PERIOD, (), '', 12, BrickletLaserRangeFinder.CODEC_GET_DISTANCE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_velocity_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Velocity` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Velocity` callback is only triggered if the velocity value has
+        changed since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_SET_VELOCITY_CALLBACK_PERIOD, (period,), BrickletLaserRangeFinder.CODEC_SET_VELOCITY_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_velocity_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Velocity Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_GET_VELOCITY_CALLBACK_PERIOD, (), '', 12, BrickletLaserRangeFinder.CODEC_GET_VELOCITY_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_distance_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Distance Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the distance value is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the distance value is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the distance value is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the distance value is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_SET_DISTANCE_CALLBACK_THRESHOLD, (option, min, max), BrickletLaserRangeFinder.CODEC_SET_DISTANCE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_distance_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Distance Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetDistanceCallbackThreshold(*await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_GET_DISTANCE_CALLBACK_THRESHOLD, (), '', 13, BrickletLaserRangeFinder.CODEC_GET_DISTANCE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_velocity_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Velocity Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the velocity is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the velocity is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the velocity is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the velocity is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_SET_VELOCITY_CALLBACK_THRESHOLD, (option, min, max), BrickletLaserRangeFinder.CODEC_SET_VELOCITY_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_velocity_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Velocity Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetVelocityCallbackThreshold(*await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_GET_VELOCITY_CALLBACK_THRESHOLD, (), '', 13, BrickletLaserRangeFinder.CODEC_GET_VELOCITY_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callbacks
+
+        * :cb:`Distance Reached`,
+        * :cb:`Velocity Reached`,
+
+        are triggered, if the thresholds
+
+        * :func:`Set Distance Callback Threshold`,
+        * :func:`Set Velocity Callback Threshold`,
+
+        keep being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletLaserRangeFinder.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletLaserRangeFinder.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_moving_average(self, distance_average_length, velocity_average_length):
+        """
+        Sets the length of a `moving averaging <https://en.wikipedia.org/wiki/Moving_average>`__
+        for the distance and velocity.
+
+        Setting the length to 0 will turn the averaging completely off. With less
+        averaging, there is more noise on the data.
+        """
+        await self.check_validity()
+
+        distance_average_length = int(distance_average_length)
+        velocity_average_length = int(velocity_average_length)
+
+        await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_SET_MOVING_AVERAGE, (distance_average_length, velocity_average_length), BrickletLaserRangeFinder.CODEC_SET_MOVING_AVERAGE_REQUEST, 0, '')
+
+    async def get_moving_average(self):
+        """
+        Returns the length moving average as set by :func:`Set Moving Average`.
+        """
+        await self.check_validity()
+
+        return GetMovingAverage(*await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_GET_MOVING_AVERAGE, (), '', 10, BrickletLaserRangeFinder.CODEC_GET_MOVING_AVERAGE_RESPONSE))
+
+    async def set_mode(self, mode):
+        """
+        .. note::
+         This function is only available if you have a LIDAR-Lite sensor with hardware
+         version 1. Use :func:`Set Configuration` for hardware version 3. You can check
+         the sensor hardware version using :func:`Get Sensor Hardware Version`.
+
+        The LIDAR-Lite sensor (hardware version 1) has five different modes. One mode is
+        for distance measurements and four modes are for velocity measurements with
+        different ranges.
+
+        The following modes are available:
+
+        * 0: Distance is measured with resolution 1.0 cm and range 0-4000 cm
+        * 1: Velocity is measured with resolution 0.1 m/s and range is 0-12.7 m/s
+        * 2: Velocity is measured with resolution 0.25 m/s and range is 0-31.75 m/s
+        * 3: Velocity is measured with resolution 0.5 m/s and range is 0-63.5 m/s
+        * 4: Velocity is measured with resolution 1.0 m/s and range is 0-127 m/s
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_SET_MODE, (mode,), BrickletLaserRangeFinder.CODEC_SET_MODE_REQUEST, 0, '')
+
+    async def get_mode(self):
+        """
+        Returns the mode as set by :func:`Set Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_GET_MODE, (), '', 9, BrickletLaserRangeFinder.CODEC_GET_MODE_RESPONSE)
+
+    async def enable_laser(self):
+        """
+        Activates the laser of the LIDAR.
+
+        We recommend that you wait 250ms after enabling the laser before
+        the first call of :func:`Get Distance` to ensure stable measurements.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_ENABLE_LASER, (), '', 0, '')
+
+    async def disable_laser(self):
+        """
+        Deactivates the laser of the LIDAR.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_DISABLE_LASER, (), '', 0, '')
+
+    async def is_laser_enabled(self):
+        """
+        Returns *true* if the laser is enabled, *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_IS_LASER_ENABLED, (), '', 9, BrickletLaserRangeFinder.CODEC_IS_LASER_ENABLED_RESPONSE)
+
+    async def get_sensor_hardware_version(self):
+        """
+        Returns the LIDAR-Lite hardware version.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_GET_SENSOR_HARDWARE_VERSION, (), '', 9, BrickletLaserRangeFinder.CODEC_GET_SENSOR_HARDWARE_VERSION_RESPONSE)
+
+    async def set_configuration(self, acquisition_count, enable_quick_termination, threshold_value, measurement_frequency):
+        """
+        .. note::
+         This function is only available if you have a LIDAR-Lite sensor with hardware
+         version 3. Use :func:`Set Mode` for hardware version 1. You can check
+         the sensor hardware version using :func:`Get Sensor Hardware Version`.
+
+        The **Acquisition Count** defines the number of times the Laser Range Finder Bricklet
+        will integrate acquisitions to find a correlation record peak. With a higher count,
+        the Bricklet can measure longer distances. With a lower count, the rate increases. The
+        allowed values are 1-255.
+
+        If you set **Enable Quick Termination** to true, the distance measurement will be terminated
+        early if a high peak was already detected. This means that a higher measurement rate can be achieved
+        and long distances can be measured at the same time. However, the chance of false-positive
+        distance measurements increases.
+
+        Normally the distance is calculated with a detection algorithm that uses peak value,
+        signal strength and noise. You can however also define a fixed **Threshold Value**.
+        Set this to a low value if you want to measure the distance to something that has
+        very little reflection (e.g. glass) and set it to a high value if you want to measure
+        the distance to something with a very high reflection (e.g. mirror). Set this to 0 to
+        use the default algorithm. The other allowed values are 1-255.
+
+        Set the **Measurement Frequency** to force a fixed measurement rate. If set to 0,
+        the Laser Range Finder Bricklet will use the optimal frequency according to the other
+        configurations and the actual measured distance. Since the rate is not fixed in this case,
+        the velocity measurement is not stable. For a stable velocity measurement you should
+        set a fixed measurement frequency. The lower the frequency, the higher is the resolution
+        of the calculated velocity. The allowed values are 10Hz-500Hz (and 0 to turn the fixed
+        frequency off).
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        acquisition_count = int(acquisition_count)
+        enable_quick_termination = bool(enable_quick_termination)
+        threshold_value = int(threshold_value)
+        measurement_frequency = int(measurement_frequency)
+
+        await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_SET_CONFIGURATION, (acquisition_count, enable_quick_termination, threshold_value, measurement_frequency), BrickletLaserRangeFinder.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Configuration`.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return GetConfiguration(*await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_GET_CONFIGURATION, (), '', 13, BrickletLaserRangeFinder.CODEC_GET_CONFIGURATION_RESPONSE))
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletLaserRangeFinder.FUNCTION_GET_IDENTITY, (), '', 33, BrickletLaserRangeFinder.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_lcd_16x2 import BrickletLCD16x2, GetConfig, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_lcd_16x2 import BrickletLCD16x2, GetConfig, GetIdentity
+
+class BrickletLCD16x2Async(AsyncDevice, BrickletLCD16x2):
+    """
+    16x2 character alphanumeric display with blue backlight
+
+    asyncio variant of BrickletLCD16x2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def write_line(self, line, position, text):
+        """
+        Writes text to a specific line with a specific position.
+        The text can have a maximum of 16 characters.
+
+        For example: (0, 5, "Hello") will write *Hello* in the middle of the
+        first line of the display.
+
+        The display uses a special charset that includes all ASCII characters except
+        backslash and tilde. The LCD charset also includes several other non-ASCII characters, see
+        the `charset specification <https://github.com/Tinkerforge/lcd-16x2-bricklet/raw/master/datasheets/standard_charset.pdf>`__
+        for details. The Unicode example above shows how to specify non-ASCII characters
+        and how to translate from Unicode to the LCD charset.
+        """
+        await self.check_validity()
+
+        line = int(line)
+        position = int(position)
+        text = create_string(text)
+
+        await self.ipcon.send_request(self, BrickletLCD16x2.FUNCTION_WRITE_LINE, (line, position, text), BrickletLCD16x2.CODEC_WRITE_LINE_REQUEST, 0, '')
+
+    async def clear_display(self):
+        """
+        Deletes all characters from the display.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletLCD16x2.FUNCTION_CLEAR_DISPLAY, (), '', 0, '')
+
+    async def backlight_on(self):
+        """
+        Turns the backlight on.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletLCD16x2.FUNCTION_BACKLIGHT_ON, (), '', 0, '')
+
+    async def backlight_off(self):
+        """
+        Turns the backlight off.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletLCD16x2.FUNCTION_BACKLIGHT_OFF, (), '', 0, '')
+
+    async def is_backlight_on(self):
+        """
+        Returns *true* if the backlight is on and *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLCD16x2.FUNCTION_IS_BACKLIGHT_ON, (), '', 9, BrickletLCD16x2.CODEC_IS_BACKLIGHT_ON_RESPONSE)
+
+    async def set_config(self, cursor, blinking):
+        """
+        Configures if the cursor (shown as "_") should be visible and if it
+        should be blinking (shown as a blinking block). The cursor position
+        is one character behind the the last text written with
+        :func:`Write Line`.
+        """
+        await self.check_validity()
+
+        cursor = bool(cursor)
+        blinking = bool(blinking)
+
+        await self.ipcon.send_request(self, BrickletLCD16x2.FUNCTION_SET_CONFIG, (cursor, blinking), BrickletLCD16x2.CODEC_SET_CONFIG_REQUEST, 0, '')
+
+    async def get_config(self):
+        """
+        Returns the configuration as set by :func:`Set Config`.
+        """
+        await self.check_validity()
+
+        return GetConfig(*await self.ipcon.send_request(self, BrickletLCD16x2.FUNCTION_GET_CONFIG, (), '', 10, BrickletLCD16x2.CODEC_GET_CONFIG_RESPONSE))
+
+    async def is_button_pressed(self, button):
+        """
+        Returns *true* if the button is pressed.
+
+        If you want to react on button presses and releases it is recommended to use the
+        :cb:`Button Pressed` and :cb:`Button Released` callbacks.
+        """
+        await self.check_validity()
+
+        button = int(button)
+
+        return await self.ipcon.send_request(self, BrickletLCD16x2.FUNCTION_IS_BUTTON_PRESSED, (button,), BrickletLCD16x2.CODEC_IS_BUTTON_PRESSED_REQUEST, 9, BrickletLCD16x2.CODEC_IS_BUTTON_PRESSED_RESPONSE)
+
+    async def set_custom_character(self, index, character):
+        """
+        The LCD 16x2 Bricklet can store up to 8 custom characters. The characters
+        consist of 5x8 pixels and can be addressed with the index 0-7. To describe
+        the pixels, the first 5 bits of 8 bytes are used. For example, to make
+        a custom character "H", you should transfer the following:
+
+        * ``character[0] = 0b00010001`` (decimal value 17)
+        * ``character[1] = 0b00010001`` (decimal value 17)
+        * ``character[2] = 0b00010001`` (decimal value 17)
+        * ``character[3] = 0b00011111`` (decimal value 31)
+        * ``character[4] = 0b00010001`` (decimal value 17)
+        * ``character[5] = 0b00010001`` (decimal value 17)
+        * ``character[6] = 0b00010001`` (decimal value 17)
+        * ``character[7] = 0b00000000`` (decimal value 0)
+
+        The characters can later be written with :func:`Write Line` by using the
+        characters with the byte representation 8 ("\\x08" or "\\u0008") to 15
+        ("\\x0F" or "\\u000F").
+
+        You can play around with the custom characters in Brick Viewer since
+        version 2.0.1.
+
+        Custom characters are stored by the LCD in RAM, so they have to be set
+        after each startup.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        index = int(index)
+        character = list(map(int, character))
+
+        await self.ipcon.send_request(self, BrickletLCD16x2.FUNCTION_SET_CUSTOM_CHARACTER, (index, character), BrickletLCD16x2.CODEC_SET_CUSTOM_CHARACTER_REQUEST, 0, '')
+
+    async def get_custom_character(self, index):
+        """
+        Returns the custom character for a given index, as set with
+        :func:`Set Custom Character`.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        index = int(index)
+
+        return await self.ipcon.send_request(self, BrickletLCD16x2.FUNCTION_GET_CUSTOM_CHARACTER, (index,), BrickletLCD16x2.CODEC_GET_CUSTOM_CHARACTER_REQUEST, 16, BrickletLCD16x2.CODEC_GET_CUSTOM_CHARACTER_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletLCD16x2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletLCD16x2.CODEC_GET_IDENTITY_RESPONSE))
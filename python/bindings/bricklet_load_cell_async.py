@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_load_cell import BrickletLoadCell, GetWeightCallbackThreshold, GetConfiguration, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_load_cell import BrickletLoadCell, GetWeightCallbackThreshold, GetConfiguration, GetIdentity
+
+class BrickletLoadCellAsync(AsyncDevice, BrickletLoadCell):
+    """
+    Measures weight with a load cell
+
+    asyncio variant of BrickletLoadCell for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_weight(self):
+        """
+        Returns the currently measured weight.
+
+        If you want to get the weight periodically, it is recommended
+        to use the :cb:`Weight` callback and set the period with
+        :func:`Set Weight Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_GET_WEIGHT, (), '', 12, BrickletLoadCell.CODEC_GET_WEIGHT_RESPONSE)
+
+    async def set_weight_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Weight` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Weight` callback is only triggered if the weight has changed since the
+        last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_SET_WEIGHT_CALLBACK_PERIOD, (period,), BrickletLoadCell.CODEC_SET_WEIGHT_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_weight_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Weight Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_GET_WEIGHT_CALLBACK_PERIOD, (), '', 12, BrickletLoadCell.CODEC_GET_WEIGHT_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_weight_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Weight Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the weight is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the weight is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the weight is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the weight is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_SET_WEIGHT_CALLBACK_THRESHOLD, (option, min, max), BrickletLoadCell.CODEC_SET_WEIGHT_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_weight_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Weight Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetWeightCallbackThreshold(*await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_GET_WEIGHT_CALLBACK_THRESHOLD, (), '', 17, BrickletLoadCell.CODEC_GET_WEIGHT_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callback
+
+        * :cb:`Weight Reached`
+
+        is triggered, if the threshold
+
+        * :func:`Set Weight Callback Threshold`
+
+        keeps being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletLoadCell.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletLoadCell.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_moving_average(self, average):
+        """
+        Sets the length of a `moving averaging <https://en.wikipedia.org/wiki/Moving_average>`__
+        for the weight value.
+
+        Setting the length to 1 will turn the averaging off. With less
+        averaging, there is more noise on the data.
+        """
+        await self.check_validity()
+
+        average = int(average)
+
+        await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_SET_MOVING_AVERAGE, (average,), BrickletLoadCell.CODEC_SET_MOVING_AVERAGE_REQUEST, 0, '')
+
+    async def get_moving_average(self):
+        """
+        Returns the length moving average as set by :func:`Set Moving Average`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_GET_MOVING_AVERAGE, (), '', 9, BrickletLoadCell.CODEC_GET_MOVING_AVERAGE_RESPONSE)
+
+    async def led_on(self):
+        """
+        Turns the LED on.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_LED_ON, (), '', 0, '')
+
+    async def led_off(self):
+        """
+        Turns the LED off.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_LED_OFF, (), '', 0, '')
+
+    async def is_led_on(self):
+        """
+        Returns *true* if the led is on, *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_IS_LED_ON, (), '', 9, BrickletLoadCell.CODEC_IS_LED_ON_RESPONSE)
+
+    async def calibrate(self, weight):
+        """
+        To calibrate your Load Cell Bricklet you have to
+
+        * empty the scale and call this function with 0 and
+        * add a known weight to the scale and call this function with the weight.
+
+        The calibration is saved in the EEPROM of the Bricklet and only
+        needs to be done once.
+
+        We recommend to use the Brick Viewer for calibration, you don't need
+        to call this function in your source code.
+        """
+        await self.check_validity()
+
+        weight = int(weight)
+
+        await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_CALIBRATE, (weight,), BrickletLoadCell.CODEC_CALIBRATE_REQUEST, 0, '')
+
+    async def tare(self):
+        """
+        Sets the currently measured weight as tare weight.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_TARE, (), '', 0, '')
+
+    async def set_configuration(self, rate, gain):
+        """
+        The measurement rate and gain are configurable.
+
+        The rate can be either 10Hz or 80Hz. A faster rate will produce more noise.
+        It is additionally possible to add a moving average
+        (see :func:`Set Moving Average`) to the measurements.
+
+        The gain can be 128x, 64x or 32x. It represents a measurement range of
+        ±20mV, ±40mV and ±80mV respectively. The Load Cell Bricklet uses an
+        excitation voltage of 5V and most load cells use an output of 2mV/V. That
+        means the voltage range is ±15mV for most load cells (i.e. gain of 128x
+        is best). If you don't know what all of this means you should keep it at
+        128x, it will most likely be correct.
+
+        The configuration is saved in the EEPROM of the Bricklet and only
+        needs to be done once.
+
+        We recommend to use the Brick Viewer for configuration, you don't need
+        to call this function in your source code.
+        """
+        await self.check_validity()
+
+        rate = int(rate)
+        gain = int(gain)
+
+        await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_SET_CONFIGURATION, (rate, gain), BrickletLoadCell.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        return GetConfiguration(*await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_GET_CONFIGURATION, (), '', 10, BrickletLoadCell.CODEC_GET_CONFIGURATION_RESPONSE))
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletLoadCell.FUNCTION_GET_IDENTITY, (), '', 33, BrickletLoadCell.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_moisture import BrickletMoisture, GetMoistureCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_moisture import BrickletMoisture, GetMoistureCallbackThreshold, GetIdentity
+
+class BrickletMoistureAsync(AsyncDevice, BrickletMoisture):
+    """
+    Measures soil moisture
+
+    asyncio variant of BrickletMoisture for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_moisture_value(self):
+        """
+        Returns the current moisture value.
+        A small value corresponds to little moisture, a big
+        value corresponds to much moisture.
+
+        If you want to get the moisture value periodically, it is recommended
+        to use the :cb:`Moisture` callback and set the period with
+        :func:`Set Moisture Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletMoisture.FUNCTION_GET_MOISTURE_VALUE, (), '', 10, BrickletMoisture.CODEC_GET_MOISTURE_VALUE_RESPONSE)
+
+    async def set_moisture_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Moisture` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Moisture` callback is only triggered if the moisture value has changed
+        since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletMoisture.FUNCTION_SET_MOISTURE_CALLBACK_PERIOD, (period,), BrickletMoisture.CODEC_SET_MOISTURE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_moisture_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Moisture Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletMoisture.FUNCTION_GET_MOISTURE_CALLBACK_PERIOD, (), '', 12, BrickletMoisture.CODEC_GET_MOISTURE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_moisture_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Moisture Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the moisture value is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the moisture value is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the moisture value is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the moisture value is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletMoisture.FUNCTION_SET_MOISTURE_CALLBACK_THRESHOLD, (option, min, max), BrickletMoisture.CODEC_SET_MOISTURE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_moisture_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Moisture Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetMoistureCallbackThreshold(*await self.ipcon.send_request(self, BrickletMoisture.FUNCTION_GET_MOISTURE_CALLBACK_THRESHOLD, (), '', 13, BrickletMoisture.CODEC_GET_MOISTURE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callback
+
+        * :cb:`Moisture Reached`
+
+        is triggered, if the threshold
+
+        * :func:`Set Moisture Callback Threshold`
+
+        keeps being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletMoisture.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletMoisture.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletMoisture.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletMoisture.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_moving_average(self, average):
+        """
+        Sets the length of a `moving averaging <https://en.wikipedia.org/wiki/Moving_average>`__
+        for the moisture value.
+
+        Setting the length to 0 will turn the averaging completely off. With less
+        averaging, there is more noise on the data.
+        """
+        await self.check_validity()
+
+        average = int(average)
+
+        await self.ipcon.send_request(self, BrickletMoisture.FUNCTION_SET_MOVING_AVERAGE, (average,), BrickletMoisture.CODEC_SET_MOVING_AVERAGE_REQUEST, 0, '')
+
+    async def get_moving_average(self):
+        """
+        Returns the length moving average as set by :func:`Set Moving Average`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletMoisture.FUNCTION_GET_MOVING_AVERAGE, (), '', 9, BrickletMoisture.CODEC_GET_MOVING_AVERAGE_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletMoisture.FUNCTION_GET_IDENTITY, (), '', 33, BrickletMoisture.CODEC_GET_IDENTITY_RESPONSE))
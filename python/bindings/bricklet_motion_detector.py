@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+from collections import namedtuple
+
+try:
+    from .ip_connection import Device, IPConnection, Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list, get_payload_codec
+except ValueError:
+    from ip_connection import Device, IPConnection, Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list, get_payload_codec
+
+GetIdentity = namedtuple('Identity', ['uid', 'connected_uid', 'position', 'hardware_version', 'firmware_version', 'device_identifier'])
+
+class BrickletMotionDetector(Device):
+    """
+    Passive infrared (PIR) motion sensor with 7m range
+    """
+
+    DEVICE_IDENTIFIER = 233
+    DEVICE_DISPLAY_NAME = 'Motion Detector Bricklet'
+    DEVICE_URL_PART = 'motion_detector' # internal
+
+    CALLBACK_MOTION_DETECTED = 2
+    CALLBACK_DETECTION_CYCLE_ENDED = 3
+
+
+    FUNCTION_GET_MOTION_DETECTED = 1
+    FUNCTION_SET_STATUS_LED_CONFIG = 4
+    FUNCTION_GET_STATUS_LED_CONFIG = 5
+    FUNCTION_GET_IDENTITY = 255
+
+    MOTION_NOT_DETECTED = 0
+    MOTION_DETECTED = 1
+    STATUS_LED_CONFIG_OFF = 0
+    STATUS_LED_CONFIG_ON = 1
+    STATUS_LED_CONFIG_SHOW_STATUS = 2
+
+    CODEC_GET_MOTION_DETECTED_RESPONSE = get_payload_codec('B') # internal
+    CODEC_SET_STATUS_LED_CONFIG_REQUEST = get_payload_codec('B') # internal
+    CODEC_GET_STATUS_LED_CONFIG_RESPONSE = get_payload_codec('B') # internal
+    CODEC_GET_IDENTITY_RESPONSE = get_payload_codec('8s 8s c 3B 3B H') # internal
+    CODEC_CALLBACK_MOTION_DETECTED = get_payload_codec('') # internal
+    CODEC_CALLBACK_DETECTION_CYCLE_ENDED = get_payload_codec('') # internal
+
+    # internal, shared by all instances
+    RESPONSE_EXPECTED = Device.create_response_expected({
+        FUNCTION_GET_MOTION_DETECTED: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_SET_STATUS_LED_CONFIG: Device.RESPONSE_EXPECTED_FALSE,
+        FUNCTION_GET_STATUS_LED_CONFIG: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+        FUNCTION_GET_IDENTITY: Device.RESPONSE_EXPECTED_ALWAYS_TRUE,
+    })
+    CALLBACK_FORMATS = {
+        CALLBACK_MOTION_DETECTED: (8, CODEC_CALLBACK_MOTION_DETECTED),
+        CALLBACK_DETECTION_CYCLE_ENDED: (8, CODEC_CALLBACK_DETECTION_CYCLE_ENDED),
+    }
+    HIGH_LEVEL_CALLBACKS = {}
+    STABLE_FUNCTIONS = frozenset([FUNCTION_GET_IDENTITY])
+    SIDE_EFFECT_FREE_FUNCTIONS = frozenset([FUNCTION_GET_MOTION_DETECTED, FUNCTION_GET_STATUS_LED_CONFIG, FUNCTION_GET_IDENTITY])
+
+    __slots__ = ()
+
+    def __init__(self, uid, ipcon):
+        """
+        Creates an object with the unique device ID *uid* and adds it to
+        the IP Connection *ipcon*.
+        """
+        Device.__init__(self, uid, ipcon, BrickletMotionDetector.DEVICE_IDENTIFIER, BrickletMotionDetector.DEVICE_DISPLAY_NAME)
+
+        self.api_version = (2, 0, 1)
+
+        ipcon.add_device(self)
+
+    def get_motion_detected(self):
+        """
+        Returns 1 if a motion was detected. How long this returns 1 after a motion
+        was detected can be adjusted with one of the small potentiometers on the
+        Motion Detector Bricklet, see :ref:`here
+        <motion_detector_bricklet_sensitivity_delay_block_time>`.
+
+        There is also a blue LED on the Bricklet that is on as long as the Bricklet is
+        in the "motion detected" state.
+        """
+        self.check_validity()
+
+        return self.ipcon.send_request(self, BrickletMotionDetector.FUNCTION_GET_MOTION_DETECTED, (), '', 9, BrickletMotionDetector.CODEC_GET_MOTION_DETECTED_RESPONSE)
+
+    def set_status_led_config(self, config):
+        """
+        Sets the status led configuration.
+
+        By default the status LED turns on if a motion is detected and off is no motion
+        is detected.
+
+        You can also turn the LED permanently on/off.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        self.check_validity()
+
+        config = int(config)
+
+        self.ipcon.send_request(self, BrickletMotionDetector.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletMotionDetector.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        self.check_validity()
+
+        return self.ipcon.send_request(self, BrickletMotionDetector.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletMotionDetector.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*self.ipcon.send_request(self, BrickletMotionDetector.FUNCTION_GET_IDENTITY, (), '', 33, BrickletMotionDetector.CODEC_GET_IDENTITY_RESPONSE))
+
+    def register_callback(self, callback_id, function):
+        """
+        Registers the given *function* with the given *callback_id*.
+        """
+        if function is None:
+            self.registered_callbacks.pop(callback_id, None)
+        else:
+            self.registered_callbacks[callback_id] = function
+
+MotionDetector = BrickletMotionDetector # for backward compatibility
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_motion_detector import BrickletMotionDetector, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_motion_detector import BrickletMotionDetector, GetIdentity
+
+class BrickletMotionDetectorAsync(AsyncDevice, BrickletMotionDetector):
+    """
+    Passive infrared (PIR) motion sensor with 7m range
+
+    asyncio variant of BrickletMotionDetector for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_motion_detected(self):
+        """
+        Returns 1 if a motion was detected. How long this returns 1 after a motion
+        was detected can be adjusted with one of the small potentiometers on the
+        Motion Detector Bricklet, see :ref:`here
+        <motion_detector_bricklet_sensitivity_delay_block_time>`.
+
+        There is also a blue LED on the Bricklet that is on as long as the Bricklet is
+        in the "motion detected" state.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletMotionDetector.FUNCTION_GET_MOTION_DETECTED, (), '', 9, BrickletMotionDetector.CODEC_GET_MOTION_DETECTED_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status led configuration.
+
+        By default the status LED turns on if a motion is detected and off is no motion
+        is detected.
+
+        You can also turn the LED permanently on/off.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletMotionDetector.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletMotionDetector.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletMotionDetector.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletMotionDetector.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletMotionDetector.FUNCTION_GET_IDENTITY, (), '', 33, BrickletMotionDetector.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_nfc_rfid import BrickletNFCRFID, GetTagID, GetState, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_nfc_rfid import BrickletNFCRFID, GetTagID, GetState, GetIdentity
+
+class BrickletNFCRFIDAsync(AsyncDevice, BrickletNFCRFID):
+    """
+    Reads and writes NFC and RFID tags
+
+    asyncio variant of BrickletNFCRFID for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def request_tag_id(self, tag_type):
+        """
+        To read or write a tag that is in proximity of the NFC/RFID Bricklet you
+        first have to call this function with the expected tag type as parameter.
+        It is no problem if you don't know the tag type. You can cycle through
+        the available tag types until the tag gives an answer to the request.
+
+        Currently the following tag types are supported:
+
+        * Mifare Classic
+        * NFC Forum Type 1
+        * NFC Forum Type 2
+
+        After you call :func:`Request Tag ID` the NFC/RFID Bricklet will try to read
+        the tag ID from the tag. After this process is done the state will change.
+        You can either register the :cb:`State Changed` callback or you can poll
+        :func:`Get State` to find out about the state change.
+
+        If the state changes to *RequestTagIDError* it means that either there was
+        no tag present or that the tag is of an incompatible type. If the state
+        changes to *RequestTagIDReady* it means that a compatible tag was found
+        and that the tag ID could be read out. You can now get the tag ID by
+        calling :func:`Get Tag ID`.
+
+        If two tags are in the proximity of the NFC/RFID Bricklet, this
+        function will cycle through the tags. To select a specific tag you have
+        to call :func:`Request Tag ID` until the correct tag id is found.
+
+        In case of any *Error* state the selection is lost and you have to
+        start again by calling :func:`Request Tag ID`.
+        """
+        await self.check_validity()
+
+        tag_type = int(tag_type)
+
+        await self.ipcon.send_request(self, BrickletNFCRFID.FUNCTION_REQUEST_TAG_ID, (tag_type,), BrickletNFCRFID.CODEC_REQUEST_TAG_ID_REQUEST, 0, '')
+
+    async def get_tag_id(self):
+        """
+        Returns the tag type, tag ID and the length of the tag ID
+        (4 or 7 bytes are possible length). This function can only be called if the
+        NFC/RFID is currently in one of the *Ready* states. The returned ID
+        is the ID that was saved through the last call of :func:`Request Tag ID`.
+
+        To get the tag ID of a tag the approach is as follows:
+
+        1. Call :func:`Request Tag ID`
+        2. Wait for state to change to *RequestTagIDReady* (see :func:`Get State` or
+           :cb:`State Changed` callback)
+        3. Call :func:`Get Tag ID`
+        """
+        await self.check_validity()
+
+        return GetTagID(*await self.ipcon.send_request(self, BrickletNFCRFID.FUNCTION_GET_TAG_ID, (), '', 17, BrickletNFCRFID.CODEC_GET_TAG_ID_RESPONSE))
+
+    async def get_state(self):
+        """
+        Returns the current state of the NFC/RFID Bricklet.
+
+        On startup the Bricklet will be in the *Initialization* state. The
+        initialization will only take about 20ms. After that it changes to *Idle*.
+
+        The functions of this Bricklet can be called in the *Idle* state and all of
+        the *Ready* and *Error* states.
+
+        Example: If you call :func:`Request Page`, the state will change to
+        *RequestPage* until the reading of the page is finished. Then it will change
+        to either *RequestPageReady* if it worked or to *RequestPageError* if it
+        didn't. If the request worked you can get the page by calling :func:`Get Page`.
+
+        The same approach is used analogously for the other API functions.
+        """
+        await self.check_validity()
+
+        return GetState(*await self.ipcon.send_request(self, BrickletNFCRFID.FUNCTION_GET_STATE, (), '', 10, BrickletNFCRFID.CODEC_GET_STATE_RESPONSE))
+
+    async def authenticate_mifare_classic_page(self, page, key_number, key):
+        """
+        Mifare Classic tags use authentication. If you want to read from or write to
+        a Mifare Classic page you have to authenticate it beforehand.
+        Each page can be authenticated with two keys: A (``key_number`` = 0) and B
+        (``key_number`` = 1). A new Mifare Classic
+        tag that has not yet been written to can be accessed with key A
+        and the default key ``[0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF]``.
+
+        The approach to read or write a Mifare Classic page is as follows:
+
+        1. Call :func:`Request Tag ID`
+        2. Wait for state to change to *RequestTagIDReady* (see :func:`Get State`
+           or :cb:`State Changed` callback)
+        3. If looking for a specific tag then call :func:`Get Tag ID` and check if the
+           expected tag was found, if it was not found go back to step 1
+        4. Call :func:`Authenticate Mifare Classic Page` with page and key for the page
+        5. Wait for state to change to *AuthenticatingMifareClassicPageReady* (see
+           :func:`Get State` or :cb:`State Changed` callback)
+        6. Call :func:`Request Page` or :func:`Write Page` to read/write page
+        """
+        await self.check_validity()
+
+        page = int(page)
+        key_number = int(key_number)
+        key = list(map(int, key))
+
+        await self.ipcon.send_request(self, BrickletNFCRFID.FUNCTION_AUTHENTICATE_MIFARE_CLASSIC_PAGE, (page, key_number, key), BrickletNFCRFID.CODEC_AUTHENTICATE_MIFARE_CLASSIC_PAGE_REQUEST, 0, '')
+
+    async def write_page(self, page, data):
+        """
+        Writes 16 bytes starting from the given page. How many pages are written
+        depends on the tag type. The page sizes are as follows:
+
+        * Mifare Classic page size: 16 byte (one page is written)
+        * NFC Forum Type 1 page size: 8 byte (two pages are written)
+        * NFC Forum Type 2 page size: 4 byte (four pages are written)
+
+        The general approach for writing to a tag is as follows:
+
+        1. Call :func:`Request Tag ID`
+        2. Wait for state to change to *RequestTagIDReady* (see :func:`Get State` or
+           :cb:`State Changed` callback)
+        3. If looking for a specific tag then call :func:`Get Tag ID` and check if the
+           expected tag was found, if it was not found got back to step 1
+        4. Call :func:`Write Page` with page number and data
+        5. Wait for state to change to *WritePageReady* (see :func:`Get State` or
+           :cb:`State Changed` callback)
+
+        If you use a Mifare Classic tag you have to authenticate a page before you
+        can write to it. See :func:`Authenticate Mifare Classic Page`.
+        """
+        await self.check_validity()
+
+        page = int(page)
+        data = list(map(int, data))
+
+        await self.ipcon.send_request(self, BrickletNFCRFID.FUNCTION_WRITE_PAGE, (page, data), BrickletNFCRFID.CODEC_WRITE_PAGE_REQUEST, 0, '')
+
+    async def request_page(self, page):
+        """
+        Reads 16 bytes starting from the given page and stores them into a buffer.
+        The buffer can then be read out with :func:`Get Page`.
+        How many pages are read depends on the tag type. The page sizes are
+        as follows:
+
+        * Mifare Classic page size: 16 byte (one page is read)
+        * NFC Forum Type 1 page size: 8 byte (two pages are read)
+        * NFC Forum Type 2 page size: 4 byte (four pages are read)
+
+        The general approach for reading a tag is as follows:
+
+        1. Call :func:`Request Tag ID`
+        2. Wait for state to change to *RequestTagIDReady* (see :func:`Get State`
+           or :cb:`State Changed` callback)
+        3. If looking for a specific tag then call :func:`Get Tag ID` and check if the
+           expected tag was found, if it was not found got back to step 1
+        4. Call :func:`Request Page` with page number
+        5. Wait for state to change to *RequestPageReady* (see :func:`Get State`
+           or :cb:`State Changed` callback)
+        6. Call :func:`Get Page` to retrieve the page from the buffer
+
+        If you use a Mifare Classic tag you have to authenticate a page before you
+        can read it. See :func:`Authenticate Mifare Classic Page`.
+        """
+        await self.check_validity()
+
+        page = int(page)
+
+        await self.ipcon.send_request(self, BrickletNFCRFID.FUNCTION_REQUEST_PAGE, (page,), BrickletNFCRFID.CODEC_REQUEST_PAGE_REQUEST, 0, '')
+
+    async def get_page(self):
+        """
+        Returns 16 bytes of data from an internal buffer. To fill the buffer
+        with specific pages you have to call :func:`Request Page` beforehand.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletNFCRFID.FUNCTION_GET_PAGE, (), '', 24, BrickletNFCRFID.CODEC_GET_PAGE_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletNFCRFID.FUNCTION_GET_IDENTITY, (), '', 33, BrickletNFCRFID.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_oled_128x64 import BrickletOLED128x64, GetDisplayConfiguration, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_oled_128x64 import BrickletOLED128x64, GetDisplayConfiguration, GetIdentity
+
+class BrickletOLED128x64Async(AsyncDevice, BrickletOLED128x64):
+    """
+    3.3cm (1.3") OLED display with 128x64 pixels
+
+    asyncio variant of BrickletOLED128x64 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def write(self, data):
+        """
+        Appends 64 byte of data to the window as set by :func:`New Window`.
+
+        Each row has a height of 8 pixels which corresponds to one byte of data.
+
+        Example: if you call :func:`New Window` with column from 0 to 127 and row
+        from 0 to 7 (the whole display) each call of :func:`Write` (red arrow) will
+        write half of a row.
+
+        .. image:: /Images/Bricklets/bricklet_oled_128x64_display.png
+           :scale: 100 %
+           :alt: Display pixel order
+           :align: center
+           :target: ../../_images/Bricklets/bricklet_oled_128x64_display.png
+
+        The LSB (D0) of each data byte is at the top and the MSB (D7) is at the
+        bottom of the row.
+
+        The next call of :func:`Write` will write the second half of the row
+        and the next two the second row and so on. To fill the whole display
+        you need to call :func:`Write` 16 times.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        await self.ipcon.send_request(self, BrickletOLED128x64.FUNCTION_WRITE, (data,), BrickletOLED128x64.CODEC_WRITE_REQUEST, 0, '')
+
+    async def new_window(self, column_from, column_to, row_from, row_to):
+        """
+        Sets the window in which you can write with :func:`Write`. One row
+        has a height of 8 pixels.
+        """
+        await self.check_validity()
+
+        column_from = int(column_from)
+        column_to = int(column_to)
+        row_from = int(row_from)
+        row_to = int(row_to)
+
+        await self.ipcon.send_request(self, BrickletOLED128x64.FUNCTION_NEW_WINDOW, (column_from, column_to, row_from, row_to), BrickletOLED128x64.CODEC_NEW_WINDOW_REQUEST, 0, '')
+
+    async def clear_display(self):
+        """
+        Clears the current content of the window as set by :func:`New Window`.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletOLED128x64.FUNCTION_CLEAR_DISPLAY, (), '', 0, '')
+
+    async def set_display_configuration(self, contrast, invert):
+        """
+        Sets the configuration of the display.
+
+        You can set a contrast value from 0 to 255 and you can invert the color
+        (black/white) of the display.
+        """
+        await self.check_validity()
+
+        contrast = int(contrast)
+        invert = bool(invert)
+
+        await self.ipcon.send_request(self, BrickletOLED128x64.FUNCTION_SET_DISPLAY_CONFIGURATION, (contrast, invert), BrickletOLED128x64.CODEC_SET_DISPLAY_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_display_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Display Configuration`.
+        """
+        await self.check_validity()
+
+        return GetDisplayConfiguration(*await self.ipcon.send_request(self, BrickletOLED128x64.FUNCTION_GET_DISPLAY_CONFIGURATION, (), '', 10, BrickletOLED128x64.CODEC_GET_DISPLAY_CONFIGURATION_RESPONSE))
+
+    async def write_line(self, line, position, text):
+        """
+        Writes text to a specific line with a specific position.
+        The text can have a maximum of 26 characters.
+
+        For example: (1, 10, "Hello") will write *Hello* in the middle of the
+        second line of the display.
+
+        You can draw to the display with :func:`Write` and then add text to it
+        afterwards.
+
+        The display uses a special 5x7 pixel charset. You can view the characters
+        of the charset in Brick Viewer.
+        """
+        await self.check_validity()
+
+        line = int(line)
+        position = int(position)
+        text = create_string(text)
+
+        await self.ipcon.send_request(self, BrickletOLED128x64.FUNCTION_WRITE_LINE, (line, position, text), BrickletOLED128x64.CODEC_WRITE_LINE_REQUEST, 0, '')
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletOLED128x64.FUNCTION_GET_IDENTITY, (), '', 33, BrickletOLED128x64.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_one_wire import BrickletOneWire, SearchBusLowLevel, Read, GetSPITFPErrorCount, GetIdentity, SearchBus
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_one_wire import BrickletOneWire, SearchBusLowLevel, Read, GetSPITFPErrorCount, GetIdentity, SearchBus
+
+class BrickletOneWireAsync(AsyncDevice, BrickletOneWire):
+    """
+    Communicates with up 64 1-Wire devices
+
+    asyncio variant of BrickletOneWire for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def search_bus_low_level(self):
+        """
+        Returns a list of up to 64 identifiers of the connected 1-Wire devices.
+        Each identifier is 64-bit and consists of 8-bit family code, 48-bit ID and
+        8-bit CRC.
+
+        To get these identifiers the Bricklet runs the
+        `SEARCH ROM algorithm <https://www.maximintegrated.com/en/app-notes/index.mvp/id/187>`__,
+        as defined by Maxim.
+        """
+        await self.check_validity()
+
+        return SearchBusLowLevel(*await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_SEARCH_BUS_LOW_LEVEL, (), '', 69, BrickletOneWire.CODEC_SEARCH_BUS_LOW_LEVEL_RESPONSE))
+
+    async def reset_bus(self):
+        """
+        Resets the bus with the 1-Wire reset operation.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_RESET_BUS, (), '', 9, BrickletOneWire.CODEC_RESET_BUS_RESPONSE)
+
+    async def write(self, data):
+        """
+        Writes a byte of data to the 1-Wire bus.
+        """
+        await self.check_validity()
+
+        data = int(data)
+
+        return await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_WRITE, (data,), BrickletOneWire.CODEC_WRITE_REQUEST, 9, BrickletOneWire.CODEC_WRITE_RESPONSE)
+
+    async def read(self):
+        """
+        Reads a byte of data from the 1-Wire bus.
+        """
+        await self.check_validity()
+
+        return Read(*await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_READ, (), '', 10, BrickletOneWire.CODEC_READ_RESPONSE))
+
+    async def write_command(self, identifier, command):
+        """
+        Writes a command to the 1-Wire device with the given identifier. You can obtain
+        the identifier by calling :func:`Search Bus`. The MATCH ROM operation is used to
+        write the command.
+
+        If you only have one device connected or want to broadcast to all devices
+        you can set the identifier to 0. In this case the SKIP ROM operation is used to
+        write the command.
+        """
+        await self.check_validity()
+
+        identifier = int(identifier)
+        command = int(command)
+
+        return await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_WRITE_COMMAND, (identifier, command), BrickletOneWire.CODEC_WRITE_COMMAND_REQUEST, 9, BrickletOneWire.CODEC_WRITE_COMMAND_RESPONSE)
+
+    async def set_communication_led_config(self, config):
+        """
+        Sets the communication LED configuration. By default the LED shows 1-wire
+        communication traffic by flickering.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is off.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_SET_COMMUNICATION_LED_CONFIG, (config,), BrickletOneWire.CODEC_SET_COMMUNICATION_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_communication_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Communication LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_GET_COMMUNICATION_LED_CONFIG, (), '', 9, BrickletOneWire.CODEC_GET_COMMUNICATION_LED_CONFIG_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletOneWire.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletOneWire.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletOneWire.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletOneWire.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletOneWire.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_WRITE_FIRMWARE, (data,), BrickletOneWire.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletOneWire.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletOneWire.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletOneWire.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletOneWire.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_WRITE_UID, (uid,), BrickletOneWire.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_READ_UID, (), '', 12, BrickletOneWire.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_GET_IDENTITY, (), '', 33, BrickletOneWire.CODEC_GET_IDENTITY_RESPONSE))
+
+    async def search_bus(self):
+        """
+        Returns a list of up to 64 identifiers of the connected 1-Wire devices.
+        Each identifier is 64-bit and consists of 8-bit family code, 48-bit ID and
+        8-bit CRC.
+
+        To get these identifiers the Bricklet runs the
+        `SEARCH ROM algorithm <https://www.maximintegrated.com/en/app-notes/index.mvp/id/187>`__,
+        as defined by Maxim.
+        """
+        await self.check_validity()
+
+        identifier_codec = self.get_stream_codec(BrickletOneWire.CODEC_SEARCH_BUS_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = SearchBusLowLevel(*await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_SEARCH_BUS_LOW_LEVEL, (), '', 69, identifier_codec))
+            identifier_length = ret.identifier_length
+            identifier_out_of_sync = ret.identifier_chunk_offset != 0
+            identifier_data = self.create_stream_reassembler(identifier_length, 'Q')
+            identifier_data.add_chunk(ret.identifier_chunk_data)
+
+            while not identifier_out_of_sync and identifier_data.offset < identifier_length:
+                ret = SearchBusLowLevel(*await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_SEARCH_BUS_LOW_LEVEL, (), '', 69, identifier_codec))
+                identifier_length = ret.identifier_length
+                identifier_out_of_sync = ret.identifier_chunk_offset != identifier_data.offset
+                identifier_data.add_chunk(ret.identifier_chunk_data)
+
+            if identifier_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.identifier_chunk_offset + 7 < identifier_length:
+                    ret = SearchBusLowLevel(*await self.ipcon.send_request(self, BrickletOneWire.FUNCTION_SEARCH_BUS_LOW_LEVEL, (), '', 69, identifier_codec))
+                    identifier_length = ret.identifier_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Identifier stream is out-of-sync')
+
+        return SearchBus(identifier_data.get_data(identifier_length), ret.status)
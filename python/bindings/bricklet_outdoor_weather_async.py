@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_outdoor_weather import BrickletOutdoorWeather, GetStationIdentifiersLowLevel, GetSensorIdentifiersLowLevel, GetStationData, GetSensorData, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_outdoor_weather import BrickletOutdoorWeather, GetStationIdentifiersLowLevel, GetSensorIdentifiersLowLevel, GetStationData, GetSensorData, GetSPITFPErrorCount, GetIdentity
+
+class BrickletOutdoorWeatherAsync(AsyncDevice, BrickletOutdoorWeather):
+    """
+    433MHz receiver for outdoor weather station
+
+    asyncio variant of BrickletOutdoorWeather for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_station_identifiers_low_level(self):
+        """
+        Returns the identifiers (number between 0 and 255) of all `stations
+        <https://www.tinkerforge.com/en/shop/accessories/sensors/outdoor-weather-station-ws-6147.html>`__
+        that have been seen since the startup of the Bricklet.
+
+        Each station gives itself a random identifier on first startup.
+
+        Since firmware version 2.0.2 a station is removed from the list if no data was received for
+        12 hours.
+        """
+        await self.check_validity()
+
+        return GetStationIdentifiersLowLevel(*await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_STATION_IDENTIFIERS_LOW_LEVEL, (), '', 72, BrickletOutdoorWeather.CODEC_GET_STATION_IDENTIFIERS_LOW_LEVEL_RESPONSE))
+
+    async def get_sensor_identifiers_low_level(self):
+        """
+        Returns the identifiers (number between 0 and 255) of all `sensors
+        <https://www.tinkerforge.com/en/shop/accessories/sensors/temperature-humidity-sensor-th-6148.html>`__
+        that have been seen since the startup of the Bricklet.
+
+        Each sensor gives itself a random identifier on first startup.
+
+        Since firmware version 2.0.2 a sensor is removed from the list if no data was received for
+        12 hours.
+        """
+        await self.check_validity()
+
+        return GetSensorIdentifiersLowLevel(*await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_SENSOR_IDENTIFIERS_LOW_LEVEL, (), '', 72, BrickletOutdoorWeather.CODEC_GET_SENSOR_IDENTIFIERS_LOW_LEVEL_RESPONSE))
+
+    async def get_station_data(self, identifier):
+        """
+        Returns the last received data for a station with the given identifier.
+        Call :func:`Get Station Identifiers` for a list of all available identifiers.
+
+        The return values are:
+
+        * Temperature,
+        * Humidity,
+        * Wind Speed,
+        * Gust Speed,
+        * Rain Fall (accumulated since station power-up),
+        * Wind Direction,
+        * Battery Low (true if battery is low) and
+        * Last Change (seconds since the reception of this data).
+        """
+        await self.check_validity()
+
+        identifier = int(identifier)
+
+        return GetStationData(*await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_STATION_DATA, (identifier,), BrickletOutdoorWeather.CODEC_GET_STATION_DATA_REQUEST, 27, BrickletOutdoorWeather.CODEC_GET_STATION_DATA_RESPONSE))
+
+    async def get_sensor_data(self, identifier):
+        """
+        Returns the last measured data for a sensor with the given identifier.
+        Call :func:`Get Sensor Identifiers` for a list of all available identifiers.
+
+        The return values are:
+
+        * Temperature,
+        * Humidity and
+        * Last Change (seconds since the last reception of data).
+        """
+        await self.check_validity()
+
+        identifier = int(identifier)
+
+        return GetSensorData(*await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_SENSOR_DATA, (identifier,), BrickletOutdoorWeather.CODEC_GET_SENSOR_DATA_REQUEST, 13, BrickletOutdoorWeather.CODEC_GET_SENSOR_DATA_RESPONSE))
+
+    async def set_station_callback_configuration(self, enable_callback):
+        """
+        Turns callback for station data on or off.
+        """
+        await self.check_validity()
+
+        enable_callback = bool(enable_callback)
+
+        await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_SET_STATION_CALLBACK_CONFIGURATION, (enable_callback,), BrickletOutdoorWeather.CODEC_SET_STATION_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_station_callback_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Station Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_STATION_CALLBACK_CONFIGURATION, (), '', 9, BrickletOutdoorWeather.CODEC_GET_STATION_CALLBACK_CONFIGURATION_RESPONSE)
+
+    async def set_sensor_callback_configuration(self, enable_callback):
+        """
+        Turns callback for sensor data on or off.
+        """
+        await self.check_validity()
+
+        enable_callback = bool(enable_callback)
+
+        await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_SET_SENSOR_CALLBACK_CONFIGURATION, (enable_callback,), BrickletOutdoorWeather.CODEC_SET_SENSOR_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_sensor_callback_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Sensor Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_SENSOR_CALLBACK_CONFIGURATION, (), '', 9, BrickletOutdoorWeather.CODEC_GET_SENSOR_CALLBACK_CONFIGURATION_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletOutdoorWeather.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletOutdoorWeather.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletOutdoorWeather.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletOutdoorWeather.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletOutdoorWeather.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_WRITE_FIRMWARE, (data,), BrickletOutdoorWeather.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletOutdoorWeather.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletOutdoorWeather.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletOutdoorWeather.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletOutdoorWeather.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_WRITE_UID, (uid,), BrickletOutdoorWeather.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_READ_UID, (), '', 12, BrickletOutdoorWeather.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_IDENTITY, (), '', 33, BrickletOutdoorWeather.CODEC_GET_IDENTITY_RESPONSE))
+
+    async def get_station_identifiers(self):
+        """
+        Returns the identifiers (number between 0 and 255) of all `stations
+        <https://www.tinkerforge.com/en/shop/accessories/sensors/outdoor-weather-station-ws-6147.html>`__
+        that have been seen since the startup of the Bricklet.
+
+        Each station gives itself a random identifier on first startup.
+
+        Since firmware version 2.0.2 a station is removed from the list if no data was received for
+        12 hours.
+        """
+        await self.check_validity()
+
+        identifiers_codec = self.get_stream_codec(BrickletOutdoorWeather.CODEC_GET_STATION_IDENTIFIERS_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = GetStationIdentifiersLowLevel(*await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_STATION_IDENTIFIERS_LOW_LEVEL, (), '', 72, identifiers_codec))
+            identifiers_length = ret.identifiers_length
+            identifiers_out_of_sync = ret.identifiers_chunk_offset != 0
+            identifiers_data = self.create_stream_reassembler(identifiers_length, 'B')
+            identifiers_data.add_chunk(ret.identifiers_chunk_data)
+
+            while not identifiers_out_of_sync and identifiers_data.offset < identifiers_length:
+                ret = GetStationIdentifiersLowLevel(*await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_STATION_IDENTIFIERS_LOW_LEVEL, (), '', 72, identifiers_codec))
+                identifiers_length = ret.identifiers_length
+                identifiers_out_of_sync = ret.identifiers_chunk_offset != identifiers_data.offset
+                identifiers_data.add_chunk(ret.identifiers_chunk_data)
+
+            if identifiers_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.identifiers_chunk_offset + 60 < identifiers_length:
+                    ret = GetStationIdentifiersLowLevel(*await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_STATION_IDENTIFIERS_LOW_LEVEL, (), '', 72, identifiers_codec))
+                    identifiers_length = ret.identifiers_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Identifiers stream is out-of-sync')
+
+        return identifiers_data.get_data(identifiers_length)
+
+    async def get_sensor_identifiers(self):
+        """
+        Returns the identifiers (number between 0 and 255) of all `sensors
+        <https://www.tinkerforge.com/en/shop/accessories/sensors/temperature-humidity-sensor-th-6148.html>`__
+        that have been seen since the startup of the Bricklet.
+
+        Each sensor gives itself a random identifier on first startup.
+
+        Since firmware version 2.0.2 a sensor is removed from the list if no data was received for
+        12 hours.
+        """
+        await self.check_validity()
+
+        identifiers_codec = self.get_stream_codec(BrickletOutdoorWeather.CODEC_GET_SENSOR_IDENTIFIERS_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = GetSensorIdentifiersLowLevel(*await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_SENSOR_IDENTIFIERS_LOW_LEVEL, (), '', 72, identifiers_codec))
+            identifiers_length = ret.identifiers_length
+            identifiers_out_of_sync = ret.identifiers_chunk_offset != 0
+            identifiers_data = self.create_stream_reassembler(identifiers_length, 'B')
+            identifiers_data.add_chunk(ret.identifiers_chunk_data)
+
+            while not identifiers_out_of_sync and identifiers_data.offset < identifiers_length:
+                ret = GetSensorIdentifiersLowLevel(*await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_SENSOR_IDENTIFIERS_LOW_LEVEL, (), '', 72, identifiers_codec))
+                identifiers_length = ret.identifiers_length
+                identifiers_out_of_sync = ret.identifiers_chunk_offset != identifiers_data.offset
+                identifiers_data.add_chunk(ret.identifiers_chunk_data)
+
+            if identifiers_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.identifiers_chunk_offset + 60 < identifiers_length:
+                    ret = GetSensorIdentifiersLowLevel(*await self.ipcon.send_request(self, BrickletOutdoorWeather.FUNCTION_GET_SENSOR_IDENTIFIERS_LOW_LEVEL, (), '', 72, identifiers_codec))
+                    identifiers_length = ret.identifiers_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Identifiers stream is out-of-sync')
+
+        return identifiers_data.get_data(identifiers_length)
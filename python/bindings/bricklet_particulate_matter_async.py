@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_particulate_matter import BrickletParticulateMatter, GetPMConcentration, GetPMCount, GetSensorInfo, GetPMConcentrationCallbackConfiguration, GetPMCountCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_particulate_matter import BrickletParticulateMatter, GetPMConcentration, GetPMCount, GetSensorInfo, GetPMConcentrationCallbackConfiguration, GetPMCountCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletParticulateMatterAsync(AsyncDevice, BrickletParticulateMatter):
+    """
+    Measures Particulate Matter concentration (PM1.0, PM2.5 and PM10)
+
+    asyncio variant of BrickletParticulateMatter for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_pm_concentration(self):
+        """
+        Returns the particulate matter concentration, broken down as:
+
+        * PM\ :sub:`1.0`\ ,
+        * PM\ :sub:`2.5`\  and
+        * PM\ :sub:`10.0`\ .
+
+        If the sensor is disabled (see :func:`Set Enable`) then the last known good
+        values from the sensor are returned.
+
+        If you want to get the values periodically, it is recommended to use the
+        :cb:`PM Concentration` callback. You can set the callback configuration
+        with :func:`Set PM Concentration Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetPMConcentration(*await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_GET_PM_CONCENTRATION, (), '', 14, BrickletParticulateMatter.CODEC_GET_PM_CONCENTRATION_RESPONSE))
+
+    async def get_pm_count(self):
+        """
+        Returns the number of particulates in 100 ml of air, broken down by their
+        diameter:
+
+        * greater 0.3µm,
+        * greater 0.5µm,
+        * greater 1.0µm,
+        * greater 2.5µm,
+        * greater 5.0µm and
+        * greater 10.0µm.
+
+        If the sensor is disabled (see :func:`Set Enable`) then the last known good
+        value from the sensor is returned.
+
+        If you want to get the values periodically, it is recommended to use the
+        :cb:`PM Count` callback. You can set the callback configuration
+        with :func:`Set PM Count Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetPMCount(*await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_GET_PM_COUNT, (), '', 20, BrickletParticulateMatter.CODEC_GET_PM_COUNT_RESPONSE))
+
+    async def set_enable(self, enable):
+        """
+        Enables/Disables the fan and the laser diode of the sensors.
+
+        The sensor takes about 30 seconds after it is enabled to settle and produce stable
+        values.
+
+        The laser diode has a lifetime of about 8000 hours. If you want to measure in
+        an interval with a long idle time (e.g. hourly) you should turn the
+        laser diode off between the measurements.
+        """
+        await self.check_validity()
+
+        enable = bool(enable)
+
+        await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_SET_ENABLE, (enable,), BrickletParticulateMatter.CODEC_SET_ENABLE_REQUEST, 0, '')
+
+    async def get_enable(self):
+        """
+        Returns the state of the sensor as set by :func:`Set Enable`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_GET_ENABLE, (), '', 9, BrickletParticulateMatter.CODEC_GET_ENABLE_RESPONSE)
+
+    async def get_sensor_info(self):
+        """
+        Returns information about the sensor:
+
+        * the sensor version number,
+        * the last error code reported by the sensor (0 means no error) and
+        * the number of framing and checksum errors that occurred in the communication
+          with the sensor.
+        """
+        await self.check_validity()
+
+        return GetSensorInfo(*await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_GET_SENSOR_INFO, (), '', 12, BrickletParticulateMatter.CODEC_GET_SENSOR_INFO_RESPONSE))
+
+    async def set_pm_concentration_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`PM Concentration`
+        callback is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_SET_PM_CONCENTRATION_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletParticulateMatter.CODEC_SET_PM_CONCENTRATION_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_pm_concentration_callback_configuration(self):
+        """
+        Returns the callback configuration as set by
+        :func:`Set PM Concentration Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetPMConcentrationCallbackConfiguration(*await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_GET_PM_CONCENTRATION_CALLBACK_CONFIGURATION, (), '', 13, BrickletParticulateMatter.CODEC_GET_PM_CONCENTRATION_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_pm_count_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`PM Count` callback
+        is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_SET_PM_COUNT_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletParticulateMatter.CODEC_SET_PM_COUNT_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_pm_count_callback_configuration(self):
+        """
+        Returns the callback configuration as set by
+        :func:`Set PM Count Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetPMCountCallbackConfiguration(*await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_GET_PM_COUNT_CALLBACK_CONFIGURATION, (), '', 13, BrickletParticulateMatter.CODEC_GET_PM_COUNT_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletParticulateMatter.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletParticulateMatter.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletParticulateMatter.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletParticulateMatter.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletParticulateMatter.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_WRITE_FIRMWARE, (data,), BrickletParticulateMatter.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletParticulateMatter.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletParticulateMatter.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletParticulateMatter.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletParticulateMatter.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_WRITE_UID, (uid,), BrickletParticulateMatter.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_READ_UID, (), '', 12, BrickletParticulateMatter.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletParticulateMatter.FUNCTION_GET_IDENTITY, (), '', 33, BrickletParticulateMatter.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,593 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_performance_dc import BrickletPerformanceDC, GetMotion, GetPowerStatistics, GetGPIOConfiguration, GetCurrentVelocityCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_performance_dc import BrickletPerformanceDC, GetMotion, GetPowerStatistics, GetGPIOConfiguration, GetCurrentVelocityCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletPerformanceDCAsync(AsyncDevice, BrickletPerformanceDC):
+    """
+    Drives one brushed DC motor with up to 36V and 10A
+
+    asyncio variant of BrickletPerformanceDC for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_enabled(self, enabled):
+        """
+        Enables/Disables the driver chip. The driver parameters can be configured
+        (velocity, acceleration, etc) before it is enabled.
+        """
+        await self.check_validity()
+
+        enabled = bool(enabled)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_ENABLED, (enabled,), BrickletPerformanceDC.CODEC_SET_ENABLED_REQUEST, 0, '')
+
+    async def get_enabled(self):
+        """
+        Returns *true* if the driver chip is enabled, *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_ENABLED, (), '', 9, BrickletPerformanceDC.CODEC_GET_ENABLED_RESPONSE)
+
+    async def set_velocity(self, velocity):
+        """
+        Sets the velocity of the motor. Whereas -32767 is full speed backward,
+        0 is stop and 32767 is full speed forward. Depending on the
+        acceleration (see :func:`Set Motion`), the motor is not immediately
+        brought to the velocity but smoothly accelerated.
+
+        The velocity describes the duty cycle of the PWM with which the motor is
+        controlled, e.g. a velocity of 3277 sets a PWM with a 10% duty cycle.
+        You can not only control the duty cycle of the PWM but also the frequency,
+        see :func:`Set PWM Frequency`.
+        """
+        await self.check_validity()
+
+        velocity = int(velocity)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_VELOCITY, (velocity,), BrickletPerformanceDC.CODEC_SET_VELOCITY_REQUEST, 0, '')
+
+    async def get_velocity(self):
+        """
+        Returns the velocity as set by :func:`Set Velocity`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_VELOCITY, (), '', 10, BrickletPerformanceDC.CODEC_GET_VELOCITY_RESPONSE)
+
+    async def get_current_velocity(self):
+        """
+        Returns the *current* velocity of the motor. This value is different
+        from :func:`Get Velocity` whenever the motor is currently accelerating
+        to a goal set by :func:`Set Velocity`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_CURRENT_VELOCITY, (), '', 10, BrickletPerformanceDC.CODEC_GET_CURRENT_VELOCITY_RESPONSE)
+
+    async def set_motion(self, acceleration, deceleration):
+        """
+        Sets the acceleration and deceleration of the motor. It is given in *velocity/s*.
+        An acceleration of 10000 means, that every second the velocity is increased
+        by 10000 (or about 30% duty cycle).
+
+        For example: If the current velocity is 0 and you want to accelerate to a
+        velocity of 16000 (about 50% duty cycle) in 10 seconds, you should set
+        an acceleration of 1600.
+
+        If acceleration and deceleration is set to 0, there is no speed ramping, i.e. a
+        new velocity is immediately given to the motor.
+        """
+        await self.check_validity()
+
+        acceleration = int(acceleration)
+        deceleration = int(deceleration)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_MOTION, (acceleration, deceleration), BrickletPerformanceDC.CODEC_SET_MOTION_REQUEST, 0, '')
+
+    async def get_motion(self):
+        """
+        Returns the acceleration/deceleration as set by :func:`Set Motion`.
+        """
+        await self.check_validity()
+
+        return GetMotion(*await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_MOTION, (), '', 12, BrickletPerformanceDC.CODEC_GET_MOTION_RESPONSE))
+
+    async def full_brake(self):
+        """
+        Executes an active full brake.
+
+        .. warning::
+         This function is for emergency purposes,
+         where an immediate brake is necessary. Depending on the current velocity and
+         the strength of the motor, a full brake can be quite violent.
+
+        Call :func:`Set Velocity` with 0 if you just want to stop the motor.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_FULL_BRAKE, (), '', 0, '')
+
+    async def set_drive_mode(self, mode):
+        """
+        Sets the drive mode. Possible modes are:
+
+        * 0 = Drive/Brake
+        * 1 = Drive/Coast
+
+        These modes are different kinds of motor controls.
+
+        In Drive/Brake mode, the motor is always either driving or braking. There
+        is no freewheeling. Advantages are: A more linear correlation between
+        PWM and velocity, more exact accelerations and the possibility to drive
+        with slower velocities.
+
+        In Drive/Coast mode, the motor is always either driving or freewheeling.
+        Advantages are: Less current consumption and less demands on the motor and
+        driver chip.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_DRIVE_MODE, (mode,), BrickletPerformanceDC.CODEC_SET_DRIVE_MODE_REQUEST, 0, '')
+
+    async def get_drive_mode(self):
+        """
+        Returns the drive mode, as set by :func:`Set Drive Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_DRIVE_MODE, (), '', 9, BrickletPerformanceDC.CODEC_GET_DRIVE_MODE_RESPONSE)
+
+    async def set_pwm_frequency(self, frequency):
+        """
+        Sets the frequency of the PWM with which the motor is driven.
+        Often a high frequency
+        is less noisy and the motor runs smoother. However, with a low frequency
+        there are less switches and therefore fewer switching losses. Also with
+        most motors lower frequencies enable higher torque.
+
+        If you have no idea what all this means, just ignore this function and use
+        the default frequency, it will very likely work fine.
+        """
+        await self.check_validity()
+
+        frequency = int(frequency)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_PWM_FREQUENCY, (frequency,), BrickletPerformanceDC.CODEC_SET_PWM_FREQUENCY_REQUEST, 0, '')
+
+    async def get_pwm_frequency(self):
+        """
+        Returns the PWM frequency as set by :func:`Set PWM Frequency`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_PWM_FREQUENCY, (), '', 10, BrickletPerformanceDC.CODEC_GET_PWM_FREQUENCY_RESPONSE)
+
+    async def get_power_statistics(self):
+        """
+        Returns input voltage, current usage and temperature of the driver.
+        """
+        await self.check_validity()
+
+        return GetPowerStatistics(*await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_POWER_STATISTICS, (), '', 14, BrickletPerformanceDC.CODEC_GET_POWER_STATISTICS_RESPONSE))
+
+    async def set_thermal_shutdown(self, temperature):
+        """
+        Sets a temperature threshold that is used for thermal shutdown.
+
+        Additionally to this user defined threshold the driver chip will shut down at a
+        temperature of 150°C.
+
+        If a thermal shutdown is triggered the driver is disabled and has to be
+        explicitly re-enabled with :func:`Set Enabled`.
+        """
+        await self.check_validity()
+
+        temperature = int(temperature)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_THERMAL_SHUTDOWN, (temperature,), BrickletPerformanceDC.CODEC_SET_THERMAL_SHUTDOWN_REQUEST, 0, '')
+
+    async def get_thermal_shutdown(self):
+        """
+        Returns the thermal shutdown temperature as set by :func:`Set Thermal Shutdown`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_THERMAL_SHUTDOWN, (), '', 9, BrickletPerformanceDC.CODEC_GET_THERMAL_SHUTDOWN_RESPONSE)
+
+    async def set_gpio_configuration(self, channel, debounce, stop_deceleration):
+        """
+        Sets the GPIO configuration for the given channel.
+        You can configure a debounce and the deceleration that is used if the action is
+        configured as ``normal stop``. See :func:`Set GPIO Action`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        debounce = int(debounce)
+        stop_deceleration = int(stop_deceleration)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_GPIO_CONFIGURATION, (channel, debounce, stop_deceleration), BrickletPerformanceDC.CODEC_SET_GPIO_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_gpio_configuration(self, channel):
+        """
+        Returns the GPIO configuration for a channel as set by :func:`Set GPIO Configuration`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetGPIOConfiguration(*await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_GPIO_CONFIGURATION, (channel,), BrickletPerformanceDC.CODEC_GET_GPIO_CONFIGURATION_REQUEST, 12, BrickletPerformanceDC.CODEC_GET_GPIO_CONFIGURATION_RESPONSE))
+
+    async def set_gpio_action(self, channel, action):
+        """
+        Sets the GPIO action for the given channel.
+
+        The action can be a normal stop, a full brake or a callback. Each for a rising
+        edge or falling edge. The actions are a bitmask they can be used at the same time.
+        You can for example trigger a full brake and a callback at the same time or for
+        rising and falling edge.
+
+        The deceleration speed for the normal stop can be configured with
+        :func:`Set GPIO Configuration`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        action = int(action)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_GPIO_ACTION, (channel, action), BrickletPerformanceDC.CODEC_SET_GPIO_ACTION_REQUEST, 0, '')
+
+    async def get_gpio_action(self, channel):
+        """
+        Returns the GPIO action for a channel as set by :func:`Set GPIO Action`.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_GPIO_ACTION, (channel,), BrickletPerformanceDC.CODEC_GET_GPIO_ACTION_REQUEST, 12, BrickletPerformanceDC.CODEC_GET_GPIO_ACTION_RESPONSE)
+
+    async def get_gpio_state(self):
+        """
+        Returns the GPIO state for both channels. True if the state is ``high`` and
+        false if the state is ``low``.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_GPIO_STATE, (), '', 9, BrickletPerformanceDC.CODEC_GET_GPIO_STATE_RESPONSE)
+
+    async def set_error_led_config(self, config):
+        """
+        Configures the error LED to be either turned off, turned on, blink in
+        heartbeat mode or show an error.
+
+        If the LED is configured to show errors it has three different states:
+
+        * Off: No error present.
+        * 1s interval blinking: Input voltage too low (below 6V).
+        * 250ms interval blinking: Overtemperature or overcurrent.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_ERROR_LED_CONFIG, (config,), BrickletPerformanceDC.CODEC_SET_ERROR_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_error_led_config(self):
+        """
+        Returns the LED configuration as set by :func:`Set Error LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_ERROR_LED_CONFIG, (), '', 9, BrickletPerformanceDC.CODEC_GET_ERROR_LED_CONFIG_RESPONSE)
+
+    async def set_cw_led_config(self, config):
+        """
+        Configures the CW LED to be either turned off, turned on, blink in
+        heartbeat mode or if the motor turn clockwise.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_CW_LED_CONFIG, (config,), BrickletPerformanceDC.CODEC_SET_CW_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_cw_led_config(self):
+        """
+        Returns the LED configuration as set by :func:`Set CW LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_CW_LED_CONFIG, (), '', 9, BrickletPerformanceDC.CODEC_GET_CW_LED_CONFIG_RESPONSE)
+
+    async def set_ccw_led_config(self, config):
+        """
+        Configures the CCW LED to be either turned off, turned on, blink in
+        heartbeat mode or if the motor turn counter-clockwise.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_CCW_LED_CONFIG, (config,), BrickletPerformanceDC.CODEC_SET_CCW_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_ccw_led_config(self):
+        """
+        Returns the LED configuration as set by :func:`Set CCW LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_CCW_LED_CONFIG, (), '', 9, BrickletPerformanceDC.CODEC_GET_CCW_LED_CONFIG_RESPONSE)
+
+    async def set_gpio_led_config(self, channel, config):
+        """
+        Configures the GPIO LED to be either turned off, turned on, blink in
+        heartbeat mode or the GPIO state.
+
+        The GPIO LED can be configured for both channels.
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_GPIO_LED_CONFIG, (channel, config), BrickletPerformanceDC.CODEC_SET_GPIO_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_gpio_led_config(self, channel):
+        """
+        Returns the LED configuration as set by :func:`Set GPIO LED Config`
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_GPIO_LED_CONFIG, (channel,), BrickletPerformanceDC.CODEC_GET_GPIO_LED_CONFIG_REQUEST, 9, BrickletPerformanceDC.CODEC_GET_GPIO_LED_CONFIG_RESPONSE)
+
+    async def set_emergency_shutdown_callback_configuration(self, enabled):
+        """
+        Enable/Disable :cb:`Emergency Shutdown` callback.
+        """
+        await self.check_validity()
+
+        enabled = bool(enabled)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_EMERGENCY_SHUTDOWN_CALLBACK_CONFIGURATION, (enabled,), BrickletPerformanceDC.CODEC_SET_EMERGENCY_SHUTDOWN_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_emergency_shutdown_callback_configuration(self):
+        """
+        Returns the callback configuration as set by
+        :func:`Set Emergency Shutdown Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_EMERGENCY_SHUTDOWN_CALLBACK_CONFIGURATION, (), '', 9, BrickletPerformanceDC.CODEC_GET_EMERGENCY_SHUTDOWN_CALLBACK_CONFIGURATION_RESPONSE)
+
+    async def set_velocity_reached_callback_configuration(self, enabled):
+        """
+        Enable/Disable :cb:`Velocity Reached` callback.
+        """
+        await self.check_validity()
+
+        enabled = bool(enabled)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_VELOCITY_REACHED_CALLBACK_CONFIGURATION, (enabled,), BrickletPerformanceDC.CODEC_SET_VELOCITY_REACHED_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_velocity_reached_callback_configuration(self):
+        """
+        Returns the callback configuration as set by
+        :func:`Set Velocity Reached Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_VELOCITY_REACHED_CALLBACK_CONFIGURATION, (), '', 9, BrickletPerformanceDC.CODEC_GET_VELOCITY_REACHED_CALLBACK_CONFIGURATION_RESPONSE)
+
+    async def set_current_velocity_callback_configuration(self, period, value_has_to_change):
+        """
+        The period is the period with which the :cb:`Current Velocity`
+        callback is triggered periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change within the
+        period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_CURRENT_VELOCITY_CALLBACK_CONFIGURATION, (period, value_has_to_change), BrickletPerformanceDC.CODEC_SET_CURRENT_VELOCITY_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_current_velocity_callback_configuration(self):
+        """
+        Returns the callback configuration as set by
+        :func:`Set Current Velocity Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetCurrentVelocityCallbackConfiguration(*await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_CURRENT_VELOCITY_CALLBACK_CONFIGURATION, (), '', 13, BrickletPerformanceDC.CODEC_GET_CURRENT_VELOCITY_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletPerformanceDC.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletPerformanceDC.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletPerformanceDC.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletPerformanceDC.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletPerformanceDC.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_WRITE_FIRMWARE, (data,), BrickletPerformanceDC.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletPerformanceDC.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletPerformanceDC.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletPerformanceDC.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletPerformanceDC.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_WRITE_UID, (uid,), BrickletPerformanceDC.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_READ_UID, (), '', 12, BrickletPerformanceDC.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletPerformanceDC.FUNCTION_GET_IDENTITY, (), '', 33, BrickletPerformanceDC.CODEC_GET_IDENTITY_RESPONSE))
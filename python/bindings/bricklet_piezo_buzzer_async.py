@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_piezo_buzzer import BrickletPiezoBuzzer, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_piezo_buzzer import BrickletPiezoBuzzer, GetIdentity
+
+class BrickletPiezoBuzzerAsync(AsyncDevice, BrickletPiezoBuzzer):
+    """
+    Creates 1kHz beep
+
+    asyncio variant of BrickletPiezoBuzzer for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def beep(self, duration):
+        """
+        Beeps for the given duration.
+        """
+        await self.check_validity()
+
+        duration = int(duration)
+
+        await self.ipcon.send_request(self, BrickletPiezoBuzzer.FUNCTION_BEEP, (duration,), BrickletPiezoBuzzer.CODEC_BEEP_REQUEST, 0, '')
+
+    async def morse_code(self, morse):
+        """
+        Sets morse code that will be played by the piezo buzzer. The morse code
+        is given as a string consisting of "." (dot), "-" (minus) and " " (space)
+        for *dits*, *dahs* and *pauses*. Every other character is ignored.
+
+        For example: If you set the string "...---...", the piezo buzzer will beep
+        nine times with the durations "short short short long long long short
+        short short".
+        """
+        await self.check_validity()
+
+        morse = create_string(morse)
+
+        await self.ipcon.send_request(self, BrickletPiezoBuzzer.FUNCTION_MORSE_CODE, (morse,), BrickletPiezoBuzzer.CODEC_MORSE_CODE_REQUEST, 0, '')
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletPiezoBuzzer.FUNCTION_GET_IDENTITY, (), '', 33, BrickletPiezoBuzzer.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_piezo_speaker import BrickletPiezoSpeaker, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_piezo_speaker import BrickletPiezoSpeaker, GetIdentity
+
+class BrickletPiezoSpeakerAsync(AsyncDevice, BrickletPiezoSpeaker):
+    """
+    Creates beep with configurable frequency
+
+    asyncio variant of BrickletPiezoSpeaker for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def beep(self, duration, frequency):
+        """
+        Beeps with the given frequency for the given duration.
+
+        .. versionchanged:: 2.0.2$nbsp;(Plugin)
+           A duration of 0 stops the current beep if any, the frequency parameter is
+           ignored. A duration of 4294967295 results in an infinite beep.
+
+        The Piezo Speaker Bricklet can only approximate the frequency, it will play
+        the best possible match by applying the calibration (see :func:`Calibrate`).
+        """
+        await self.check_validity()
+
+        duration = int(duration)
+        frequency = int(frequency)
+
+        await self.ipcon.send_request(self, BrickletPiezoSpeaker.FUNCTION_BEEP, (duration, frequency), BrickletPiezoSpeaker.CODEC_BEEP_REQUEST, 0, '')
+
+    async def morse_code(self, morse, frequency):
+        """
+        Sets morse code that will be played by the piezo buzzer. The morse code
+        is given as a string consisting of "." (dot), "-" (minus) and " " (space)
+        for *dits*, *dahs* and *pauses*. Every other character is ignored.
+
+        For example: If you set the string "...---...", the piezo buzzer will beep
+        nine times with the durations "short short short long long long short
+        short short".
+        """
+        await self.check_validity()
+
+        morse = create_string(morse)
+        frequency = int(frequency)
+
+        await self.ipcon.send_request(self, BrickletPiezoSpeaker.FUNCTION_MORSE_CODE, (morse, frequency), BrickletPiezoSpeaker.CODEC_MORSE_CODE_REQUEST, 0, '')
+
+    async def calibrate(self):
+        """
+        The Piezo Speaker Bricklet can play 512 different tones. This function
+        plays each tone and measures the exact frequency back. The result is a
+        mapping between setting value and frequency. This mapping is stored
+        in the EEPROM and loaded on startup.
+
+        The Bricklet should come calibrated, you only need to call this
+        function (once) every time you reflash the Bricklet plugin.
+
+        Returns *true* after the calibration finishes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPiezoSpeaker.FUNCTION_CALIBRATE, (), '', 9, BrickletPiezoSpeaker.CODEC_CALIBRATE_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletPiezoSpeaker.FUNCTION_GET_IDENTITY, (), '', 33, BrickletPiezoSpeaker.CODEC_GET_IDENTITY_RESPONSE))
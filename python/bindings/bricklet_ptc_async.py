@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_ptc import BrickletPTC, GetTemperatureCallbackThreshold, GetResistanceCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_ptc import BrickletPTC, GetTemperatureCallbackThreshold, GetResistanceCallbackThreshold, GetIdentity
+
+class BrickletPTCAsync(AsyncDevice, BrickletPTC):
+    """
+    Reads temperatures from Pt100 und Pt1000 sensors
+
+    asyncio variant of BrickletPTC for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_temperature(self):
+        """
+        Returns the temperature of connected sensor.
+
+        If you want to get the temperature periodically, it is recommended
+        to use the :cb:`Temperature` callback and set the period with
+        :func:`Set Temperature Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPTC.FUNCTION_GET_TEMPERATURE, (), '', 12, BrickletPTC.CODEC_GET_TEMPERATURE_RESPONSE)
+
+    async def get_resistance(self):
+        """
+        Returns the value as measured by the MAX31865 precision delta-sigma ADC.
+
+        The value can be converted with the following formulas:
+
+        * Pt100:  resistance = (value * 390) / 32768
+        * Pt1000: resistance = (value * 3900) / 32768
+
+        If you want to get the resistance periodically, it is recommended
+        to use the :cb:`Resistance` callback and set the period with
+        :func:`Set Resistance Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPTC.FUNCTION_GET_RESISTANCE, (), '', 12, BrickletPTC.CODEC_GET_RESISTANCE_RESPONSE)
+
+    async def set_temperature_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Temperature` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Temperature` callback is only triggered if the temperature has
+        changed since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletPTC.FUNCTION_SET_TEMPERATURE_CALLBACK_PERIOD, (period,), BrickletPTC.CODEC_SET_TEMPERATURE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_temperature_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Temperature Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPTC.FUNCTION_GET_TEMPERATURE_CALLBACK_PERIOD, (), '', 12, BrickletPTC.CODEC_GET_TEMPERATURE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_resistance_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Resistance` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Resistance` callback is only triggered if the resistance has changed
+        since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletPTC.FUNCTION_SET_RESISTANCE_CALLBACK_PERIOD, (period,), BrickletPTC.CODEC_SET_RESISTANCE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_resistance_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Resistance Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPTC.FUNCTION_GET_RESISTANCE_CALLBACK_PERIOD, (), '', 12, BrickletPTC.CODEC_GET_RESISTANCE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_temperature_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Temperature Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the temperature is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the temperature is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the temperature is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the temperature is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletPTC.FUNCTION_SET_TEMPERATURE_CALLBACK_THRESHOLD, (option, min, max), BrickletPTC.CODEC_SET_TEMPERATURE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_temperature_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Temperature Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetTemperatureCallbackThreshold(*await self.ipcon.send_request(self, BrickletPTC.FUNCTION_GET_TEMPERATURE_CALLBACK_THRESHOLD, (), '', 17, BrickletPTC.CODEC_GET_TEMPERATURE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_resistance_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Resistance Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the temperature is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the temperature is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the temperature is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the temperature is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletPTC.FUNCTION_SET_RESISTANCE_CALLBACK_THRESHOLD, (option, min, max), BrickletPTC.CODEC_SET_RESISTANCE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_resistance_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Resistance Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetResistanceCallbackThreshold(*await self.ipcon.send_request(self, BrickletPTC.FUNCTION_GET_RESISTANCE_CALLBACK_THRESHOLD, (), '', 17, BrickletPTC.CODEC_GET_RESISTANCE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callback
+
+        * :cb:`Temperature Reached`,
+        * :cb:`Resistance Reached`
+
+        is triggered, if the threshold
+
+        * :func:`Set Temperature Callback Threshold`,
+        * :func:`Set Resistance Callback Threshold`
+
+        keeps being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletPTC.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletPTC.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPTC.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletPTC.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_noise_rejection_filter(self, filter):
+        """
+        Sets the noise rejection filter to either 50Hz (0) or 60Hz (1).
+        Noise from 50Hz or 60Hz power sources (including
+        harmonics of the AC power's fundamental frequency) is
+        attenuated by 82dB.
+        """
+        await self.check_validity()
+
+        filter = int(filter)
+
+        await self.ipcon.send_request(self, BrickletPTC.FUNCTION_SET_NOISE_REJECTION_FILTER, (filter,), BrickletPTC.CODEC_SET_NOISE_REJECTION_FILTER_REQUEST, 0, '')
+
+    async def get_noise_rejection_filter(self):
+        """
+        Returns the noise rejection filter option as set by
+        :func:`Set Noise Rejection Filter`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPTC.FUNCTION_GET_NOISE_REJECTION_FILTER, (), '', 9, BrickletPTC.CODEC_GET_NOISE_REJECTION_FILTER_RESPONSE)
+
+    async def is_sensor_connected(self):
+        """
+        Returns *true* if the sensor is connected correctly.
+
+        If this function
+        returns *false*, there is either no Pt100 or Pt1000 sensor connected,
+        the sensor is connected incorrectly or the sensor itself is faulty.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPTC.FUNCTION_IS_SENSOR_CONNECTED, (), '', 9, BrickletPTC.CODEC_IS_SENSOR_CONNECTED_RESPONSE)
+
+    async def set_wire_mode(self, mode):
+        """
+        Sets the wire mode of the sensor. Possible values are 2, 3 and 4 which
+        correspond to 2-, 3- and 4-wire sensors. The value has to match the jumper
+        configuration on the Bricklet.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        await self.ipcon.send_request(self, BrickletPTC.FUNCTION_SET_WIRE_MODE, (mode,), BrickletPTC.CODEC_SET_WIRE_MODE_REQUEST, 0, '')
+
+    async def get_wire_mode(self):
+        """
+        Returns the wire mode as set by :func:`Set Wire Mode`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPTC.FUNCTION_GET_WIRE_MODE, (), '', 9, BrickletPTC.CODEC_GET_WIRE_MODE_RESPONSE)
+
+    async def set_sensor_connected_callback_configuration(self, enabled):
+        """
+        If you enable this callback, the :cb:`Sensor Connected` callback is triggered
+        every time a Pt sensor is connected/disconnected.
+
+        .. versionadded:: 2.0.2$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        enabled = bool(enabled)
+
+        await self.ipcon.send_request(self, BrickletPTC.FUNCTION_SET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION, (enabled,), BrickletPTC.CODEC_SET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_sensor_connected_callback_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Sensor Connected Callback Configuration`.
+
+        .. versionadded:: 2.0.2$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletPTC.FUNCTION_GET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION, (), '', 9, BrickletPTC.CODEC_GET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletPTC.FUNCTION_GET_IDENTITY, (), '', 33, BrickletPTC.CODEC_GET_IDENTITY_RESPONSE))
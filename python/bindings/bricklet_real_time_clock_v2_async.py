@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_real_time_clock_v2 import BrickletRealTimeClockV2, GetDateTime, GetAlarm, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_real_time_clock_v2 import BrickletRealTimeClockV2, GetDateTime, GetAlarm, GetSPITFPErrorCount, GetIdentity
+
+class BrickletRealTimeClockV2Async(AsyncDevice, BrickletRealTimeClockV2):
+    """
+    Battery-backed real-time clock
+
+    asyncio variant of BrickletRealTimeClockV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_date_time(self, year, month, day, hour, minute, second, centisecond, weekday):
+        """
+        Sets the current date (including weekday) and the current time.
+
+        If the backup battery is installed then the real-time clock keeps date and
+        time even if the Bricklet is not powered by a Brick.
+
+        The real-time clock handles leap year and inserts the 29th of February
+        accordingly. But leap seconds, time zones and daylight saving time are not
+        handled.
+        """
+        await self.check_validity()
+
+        year = int(year)
+        month = int(month)
+        day = int(day)
+        hour = int(hour)
+        minute = int(minute)
+        second = int(second)
+        centisecond = int(centisecond)
+        weekday = int(weekday)
+
+        await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_SET_DATE_TIME, (year, month, day, hour, minute, second, centisecond, weekday), BrickletRealTimeClockV2.CODEC_SET_DATE_TIME_REQUEST, 0, '')
+
+    async def get_date_time(self):
+        """
+        Returns the current date (including weekday) and the current time of the
+        real-time.
+
+        The timestamp represents the current date and the the current time of the
+        real-time clock converted to milliseconds and is an offset to 2000-01-01 00:00:00.0000.
+        """
+        await self.check_validity()
+
+        return GetDateTime(*await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_GET_DATE_TIME, (), '', 25, BrickletRealTimeClockV2.CODEC_GET_DATE_TIME_RESPONSE))
+
+    async def get_timestamp(self):
+        """
+        Returns the current date and the time of the real-time clock converted to
+        milliseconds. The timestamp has an effective resolution of hundredths of a
+        second and is an offset to 2000-01-01 00:00:00.0000.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_GET_TIMESTAMP, (), '', 16, BrickletRealTimeClockV2.CODEC_GET_TIMESTAMP_RESPONSE)
+
+    async def set_offset(self, offset):
+        """
+        Sets the offset the real-time clock should compensate for in 2.17 ppm steps
+        between -277.76 ppm (-128) and +275.59 ppm (127).
+
+        The real-time clock time can deviate from the actual time due to the frequency
+        deviation of its 32.768 kHz crystal. Even without compensation (factory
+        default) the resulting time deviation should be at most ±20 ppm (±52.6
+        seconds per month).
+
+        This deviation can be calculated by comparing the same duration measured by the
+        real-time clock (``rtc_duration``) an accurate reference clock
+        (``ref_duration``).
+
+        For best results the configured offset should be set to 0 ppm first and then a
+        duration of at least 6 hours should be measured.
+
+        The new offset (``new_offset``) can be calculated from the currently configured
+        offset (``current_offset``) and the measured durations as follow::
+
+          new_offset = current_offset - round(1000000 * (rtc_duration - ref_duration) / rtc_duration / 2.17)
+
+        If you want to calculate the offset, then we recommend using the calibration
+        dialog in Brick Viewer, instead of doing it manually.
+
+        The offset is saved in the EEPROM of the Bricklet and only needs to be
+        configured once.
+        """
+        await self.check_validity()
+
+        offset = int(offset)
+
+        await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_SET_OFFSET, (offset,), BrickletRealTimeClockV2.CODEC_SET_OFFSET_REQUEST, 0, '')
+
+    async def get_offset(self):
+        """
+        Returns the offset as set by :func:`Set Offset`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_GET_OFFSET, (), '', 9, BrickletRealTimeClockV2.CODEC_GET_OFFSET_RESPONSE)
+
+    async def set_date_time_callback_configuration(self, period):
+        """
+        Sets the period with which the :cb:`Date Time` callback is triggered
+        periodically. A value of 0 turns the callback off.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_SET_DATE_TIME_CALLBACK_CONFIGURATION, (period,), BrickletRealTimeClockV2.CODEC_SET_DATE_TIME_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_date_time_callback_configuration(self):
+        """
+        Returns the period as set by :func:`Set Date Time Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_GET_DATE_TIME_CALLBACK_CONFIGURATION, (), '', 12, BrickletRealTimeClockV2.CODEC_GET_DATE_TIME_CALLBACK_CONFIGURATION_RESPONSE)
+
+    async def set_alarm(self, month, day, hour, minute, second, weekday, interval):
+        """
+        Configures a repeatable alarm. The :cb:`Alarm` callback is triggered if the
+        current date and time matches the configured alarm.
+
+        Setting a parameter to -1 means that it should be disabled and doesn't take part
+        in the match. Setting all parameters to -1 disables the alarm completely.
+
+        For example, to make the alarm trigger every day at 7:30 AM it can be
+        configured as (-1, -1, 7, 30, -1, -1, -1). The hour is set to match 7 and the
+        minute is set to match 30. The alarm is triggered if all enabled parameters
+        match.
+
+        The interval has a special role. It allows to make the alarm reconfigure itself.
+        This is useful if you need a repeated alarm that cannot be expressed by matching
+        the current date and time. For example, to make the alarm trigger every 23
+        seconds it can be configured as (-1, -1, -1, -1, -1, -1, 23). Internally the
+        Bricklet will take the current date and time, add 23 seconds to it and set the
+        result as its alarm. The first alarm will be triggered 23 seconds after the
+        call. Because the interval is not -1, the Bricklet will do the same again
+        internally, take the current date and time, add 23 seconds to it and set that
+        as its alarm. This results in a repeated alarm that triggers every 23 seconds.
+
+        The interval can also be used in combination with the other parameters. For
+        example, configuring the alarm as (-1, -1, 7, 30, -1, -1, 300) results in an
+        alarm that triggers every day at 7:30 AM and is then repeated every 5 minutes.
+        """
+        await self.check_validity()
+
+        month = int(month)
+        day = int(day)
+        hour = int(hour)
+        minute = int(minute)
+        second = int(second)
+        weekday = int(weekday)
+        interval = int(interval)
+
+        await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_SET_ALARM, (month, day, hour, minute, second, weekday, interval), BrickletRealTimeClockV2.CODEC_SET_ALARM_REQUEST, 0, '')
+
+    async def get_alarm(self):
+        """
+        Returns the alarm configuration as set by :func:`Set Alarm`.
+        """
+        await self.check_validity()
+
+        return GetAlarm(*await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_GET_ALARM, (), '', 18, BrickletRealTimeClockV2.CODEC_GET_ALARM_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletRealTimeClockV2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletRealTimeClockV2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletRealTimeClockV2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletRealTimeClockV2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletRealTimeClockV2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletRealTimeClockV2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletRealTimeClockV2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletRealTimeClockV2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletRealTimeClockV2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletRealTimeClockV2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_WRITE_UID, (uid,), BrickletRealTimeClockV2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_READ_UID, (), '', 12, BrickletRealTimeClockV2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletRealTimeClockV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletRealTimeClockV2.CODEC_GET_IDENTITY_RESPONSE))
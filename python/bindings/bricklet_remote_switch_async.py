@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_remote_switch import BrickletRemoteSwitch, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_remote_switch import BrickletRemoteSwitch, GetIdentity
+
+class BrickletRemoteSwitchAsync(AsyncDevice, BrickletRemoteSwitch):
+    """
+    Controls remote mains switches
+
+    asyncio variant of BrickletRemoteSwitch for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def switch_socket(self, house_code, receiver_code, switch_to):
+        """
+        This function is deprecated, use :func:`Switch Socket A` instead.
+        """
+        await self.check_validity()
+
+        house_code = int(house_code)
+        receiver_code = int(receiver_code)
+        switch_to = int(switch_to)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitch.FUNCTION_SWITCH_SOCKET, (house_code, receiver_code, switch_to), BrickletRemoteSwitch.CODEC_SWITCH_SOCKET_REQUEST, 0, '')
+
+    async def get_switching_state(self):
+        """
+        Returns the current switching state. If the current state is busy, the
+        Bricklet is currently sending a code to switch a socket. It will not
+        accept any requests to switch sockets until the state changes to ready.
+
+        How long the switching takes is dependent on the number of repeats, see
+        :func:`Set Repeats`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRemoteSwitch.FUNCTION_GET_SWITCHING_STATE, (), '', 9, BrickletRemoteSwitch.CODEC_GET_SWITCHING_STATE_RESPONSE)
+
+    async def set_repeats(self, repeats):
+        """
+        Sets the number of times the code is sent when one of the switch socket
+        functions is called. The repeats basically correspond to the amount of time
+        that a button of the remote is pressed.
+
+        Some dimmers are controlled by the length of a button pressed,
+        this can be simulated by increasing the repeats.
+        """
+        await self.check_validity()
+
+        repeats = int(repeats)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitch.FUNCTION_SET_REPEATS, (repeats,), BrickletRemoteSwitch.CODEC_SET_REPEATS_REQUEST, 0, '')
+
+    async def get_repeats(self):
+        """
+        Returns the number of repeats as set by :func:`Set Repeats`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRemoteSwitch.FUNCTION_GET_REPEATS, (), '', 9, BrickletRemoteSwitch.CODEC_GET_REPEATS_RESPONSE)
+
+    async def switch_socket_a(self, house_code, receiver_code, switch_to):
+        """
+        To switch a type A socket you have to give the house code, receiver code and the
+        state (on or off) you want to switch to.
+
+        A detailed description on how you can figure out the house and receiver code
+        can be found :ref:`here <remote_switch_bricklet_type_a_house_and_receiver_code>`.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        house_code = int(house_code)
+        receiver_code = int(receiver_code)
+        switch_to = int(switch_to)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitch.FUNCTION_SWITCH_SOCKET_A, (house_code, receiver_code, switch_to), BrickletRemoteSwitch.CODEC_SWITCH_SOCKET_A_REQUEST, 0, '')
+
+    async def switch_socket_b(self, address, unit, switch_to):
+        """
+        To switch a type B socket you have to give the address, unit and the state
+        (on or off) you want to switch to.
+
+        To switch all devices with the same address use 255 for the unit.
+
+        A detailed description on how you can teach a socket the address and unit can
+        be found :ref:`here <remote_switch_bricklet_type_b_address_and_unit>`.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        address = int(address)
+        unit = int(unit)
+        switch_to = int(switch_to)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitch.FUNCTION_SWITCH_SOCKET_B, (address, unit, switch_to), BrickletRemoteSwitch.CODEC_SWITCH_SOCKET_B_REQUEST, 0, '')
+
+    async def dim_socket_b(self, address, unit, dim_value):
+        """
+        To control a type B dimmer you have to give the address, unit and the
+        dim value you want to set the dimmer to.
+
+        A detailed description on how you can teach a dimmer the address and unit can
+        be found :ref:`here <remote_switch_bricklet_type_b_address_and_unit>`.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        address = int(address)
+        unit = int(unit)
+        dim_value = int(dim_value)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitch.FUNCTION_DIM_SOCKET_B, (address, unit, dim_value), BrickletRemoteSwitch.CODEC_DIM_SOCKET_B_REQUEST, 0, '')
+
+    async def switch_socket_c(self, system_code, device_code, switch_to):
+        """
+        To switch a type C socket you have to give the system code, device code and the
+        state (on or off) you want to switch to.
+
+        A detailed description on how you can figure out the system and device code
+        can be found :ref:`here <remote_switch_bricklet_type_c_system_and_device_code>`.
+
+        .. versionadded:: 2.0.1$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        system_code = create_char(system_code)
+        device_code = int(device_code)
+        switch_to = int(switch_to)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitch.FUNCTION_SWITCH_SOCKET_C, (system_code, device_code, switch_to), BrickletRemoteSwitch.CODEC_SWITCH_SOCKET_C_REQUEST, 0, '')
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletRemoteSwitch.FUNCTION_GET_IDENTITY, (), '', 33, BrickletRemoteSwitch.CODEC_GET_IDENTITY_RESPONSE))
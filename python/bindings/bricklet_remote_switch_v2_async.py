@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_remote_switch_v2 import BrickletRemoteSwitchV2, GetRemoteConfiguration, GetRemoteStatusA, GetRemoteStatusB, GetRemoteStatusC, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_remote_switch_v2 import BrickletRemoteSwitchV2, GetRemoteConfiguration, GetRemoteStatusA, GetRemoteStatusB, GetRemoteStatusC, GetSPITFPErrorCount, GetIdentity
+
+class BrickletRemoteSwitchV2Async(AsyncDevice, BrickletRemoteSwitchV2):
+    """
+    Controls remote mains switches and receives signals from remotes
+
+    asyncio variant of BrickletRemoteSwitchV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_switching_state(self):
+        """
+        Returns the current switching state. If the current state is busy, the
+        Bricklet is currently sending a code to switch a socket. It will not
+        accept any calls of switch socket functions until the state changes to ready.
+
+        How long the switching takes is dependent on the number of repeats, see
+        :func:`Set Repeats`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_GET_SWITCHING_STATE, (), '', 9, BrickletRemoteSwitchV2.CODEC_GET_SWITCHING_STATE_RESPONSE)
+
+    async def set_repeats(self, repeats):
+        """
+        Sets the number of times the code is sent when one of the Switch Socket
+        functions is called. The repeats basically correspond to the amount of time
+        that a button of the remote is pressed.
+
+        Some dimmers are controlled by the length of a button pressed,
+        this can be simulated by increasing the repeats.
+        """
+        await self.check_validity()
+
+        repeats = int(repeats)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_SET_REPEATS, (repeats,), BrickletRemoteSwitchV2.CODEC_SET_REPEATS_REQUEST, 0, '')
+
+    async def get_repeats(self):
+        """
+        Returns the number of repeats as set by :func:`Set Repeats`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_GET_REPEATS, (), '', 9, BrickletRemoteSwitchV2.CODEC_GET_REPEATS_RESPONSE)
+
+    async def switch_socket_a(self, house_code, receiver_code, switch_to):
+        """
+        To switch a type A socket you have to give the house code, receiver code and the
+        state (on or off) you want to switch to.
+
+        A detailed description on how you can figure out the house and receiver code
+        can be found :ref:`here <remote_switch_bricklet_type_a_house_and_receiver_code>`.
+        """
+        await self.check_validity()
+
+        house_code = int(house_code)
+        receiver_code = int(receiver_code)
+        switch_to = int(switch_to)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_SWITCH_SOCKET_A, (house_code, receiver_code, switch_to), BrickletRemoteSwitchV2.CODEC_SWITCH_SOCKET_A_REQUEST, 0, '')
+
+    async def switch_socket_b(self, address, unit, switch_to):
+        """
+        To switch a type B socket you have to give the address, unit and the state
+        (on or off) you want to switch to.
+
+        To switch all devices with the same address use 255 for the unit.
+
+        A detailed description on how you can teach a socket the address and unit can
+        be found :ref:`here <remote_switch_bricklet_type_b_address_and_unit>`.
+        """
+        await self.check_validity()
+
+        address = int(address)
+        unit = int(unit)
+        switch_to = int(switch_to)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_SWITCH_SOCKET_B, (address, unit, switch_to), BrickletRemoteSwitchV2.CODEC_SWITCH_SOCKET_B_REQUEST, 0, '')
+
+    async def dim_socket_b(self, address, unit, dim_value):
+        """
+        To control a type B dimmer you have to give the address, unit and the
+        dim value you want to set the dimmer to.
+
+        A detailed description on how you can teach a dimmer the address and unit can
+        be found :ref:`here <remote_switch_bricklet_type_b_address_and_unit>`.
+        """
+        await self.check_validity()
+
+        address = int(address)
+        unit = int(unit)
+        dim_value = int(dim_value)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_DIM_SOCKET_B, (address, unit, dim_value), BrickletRemoteSwitchV2.CODEC_DIM_SOCKET_B_REQUEST, 0, '')
+
+    async def switch_socket_c(self, system_code, device_code, switch_to):
+        """
+        To switch a type C socket you have to give the system code, device code and the
+        state (on or off) you want to switch to.
+
+        A detailed description on how you can figure out the system and device code
+        can be found :ref:`here <remote_switch_bricklet_type_c_system_and_device_code>`.
+        """
+        await self.check_validity()
+
+        system_code = create_char(system_code)
+        device_code = int(device_code)
+        switch_to = int(switch_to)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_SWITCH_SOCKET_C, (system_code, device_code, switch_to), BrickletRemoteSwitchV2.CODEC_SWITCH_SOCKET_C_REQUEST, 0, '')
+
+    async def set_remote_configuration(self, remote_type, minimum_repeats, callback_enabled):
+        """
+        Sets the configuration for **receiving** data from a remote of type A, B or C.
+
+        * Remote Type: A, B or C depending on the type of remote you want to receive.
+        * Minimum Repeats: The minimum number of repeated data packets until the callback
+          is triggered (if enabled).
+        * Callback Enabled: Enable or disable callback (see :cb:`Remote Status A` callback,
+          :cb:`Remote Status B` callback and :cb:`Remote Status C` callback).
+        """
+        await self.check_validity()
+
+        remote_type = int(remote_type)
+        minimum_repeats = int(minimum_repeats)
+        callback_enabled = bool(callback_enabled)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_SET_REMOTE_CONFIGURATION, (remote_type, minimum_repeats, callback_enabled), BrickletRemoteSwitchV2.CODEC_SET_REMOTE_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_remote_configuration(self):
+        """
+        Returns the remote configuration as set by :func:`Set Remote Configuration`
+        """
+        await self.check_validity()
+
+        return GetRemoteConfiguration(*await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_GET_REMOTE_CONFIGURATION, (), '', 12, BrickletRemoteSwitchV2.CODEC_GET_REMOTE_CONFIGURATION_RESPONSE))
+
+    async def get_remote_status_a(self):
+        """
+        Returns the house code, receiver code, switch state (on/off) and number of
+        repeats for remote type A.
+
+        Repeats == 0 means there was no button press. Repeats >= 1 means there
+        was a button press with the specified house/receiver code. The repeats are the
+        number of received identical data packets. The longer the button is pressed,
+        the higher the repeat number.
+
+        Use the callback to get this data automatically when a button is pressed,
+        see :func:`Set Remote Configuration` and :cb:`Remote Status A` callback.
+        """
+        await self.check_validity()
+
+        return GetRemoteStatusA(*await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_GET_REMOTE_STATUS_A, (), '', 13, BrickletRemoteSwitchV2.CODEC_GET_REMOTE_STATUS_A_RESPONSE))
+
+    async def get_remote_status_b(self):
+        """
+        Returns the address (unique per remote), unit (button number), switch state
+        (on/off) and number of repeats for remote type B.
+
+        If the remote supports dimming the dim value is used instead of the switch state.
+
+        If repeats=0 there was no button press. If repeats >= 1 there
+        was a button press with the specified address/unit. The repeats are the number of received
+        identical data packets. The longer the button is pressed, the higher the repeat number.
+
+        Use the callback to get this data automatically when a button is pressed,
+        see :func:`Set Remote Configuration` and :cb:`Remote Status B` callback.
+        """
+        await self.check_validity()
+
+        return GetRemoteStatusB(*await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_GET_REMOTE_STATUS_B, (), '', 17, BrickletRemoteSwitchV2.CODEC_GET_REMOTE_STATUS_B_RESPONSE))
+
+    async def get_remote_status_c(self):
+        """
+        Returns the system code, device code, switch state (on/off) and number of repeats for
+        remote type C.
+
+        If repeats=0 there was no button press. If repeats >= 1 there
+        was a button press with the specified system/device code. The repeats are the number of received
+        identical data packets. The longer the button is pressed, the higher the repeat number.
+
+        Use the callback to get this data automatically when a button is pressed,
+        see :func:`Set Remote Configuration` and :cb:`Remote Status C` callback.
+        """
+        await self.check_validity()
+
+        return GetRemoteStatusC(*await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_GET_REMOTE_STATUS_C, (), '', 13, BrickletRemoteSwitchV2.CODEC_GET_REMOTE_STATUS_C_RESPONSE))
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletRemoteSwitchV2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletRemoteSwitchV2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletRemoteSwitchV2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletRemoteSwitchV2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletRemoteSwitchV2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletRemoteSwitchV2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletRemoteSwitchV2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletRemoteSwitchV2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletRemoteSwitchV2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletRemoteSwitchV2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_WRITE_UID, (uid,), BrickletRemoteSwitchV2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_READ_UID, (), '', 12, BrickletRemoteSwitchV2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletRemoteSwitchV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletRemoteSwitchV2.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_rgb_led import BrickletRGBLED, GetRGBValue, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_rgb_led import BrickletRGBLED, GetRGBValue, GetIdentity
+
+class BrickletRGBLEDAsync(AsyncDevice, BrickletRGBLED):
+    """
+    Controls one RGB LED
+
+    asyncio variant of BrickletRGBLED for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_rgb_value(self, r, g, b):
+        """
+        Sets the *r*, *g* and *b* values for the LED.
+        """
+        await self.check_validity()
+
+        r = int(r)
+        g = int(g)
+        b = int(b)
+
+        await self.ipcon.send_request(self, BrickletRGBLED.FUNCTION_SET_RGB_VALUE, (r, g, b), BrickletRGBLED.CODEC_SET_RGB_VALUE_REQUEST, 0, '')
+
+    async def get_rgb_value(self):
+        """
+        Returns the *r*, *g* and *b* values of the LED as set by :func:`Set RGB Value`.
+        """
+        await self.check_validity()
+
+        return GetRGBValue(*await self.ipcon.send_request(self, BrickletRGBLED.FUNCTION_GET_RGB_VALUE, (), '', 11, BrickletRGBLED.CODEC_GET_RGB_VALUE_RESPONSE))
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletRGBLED.FUNCTION_GET_IDENTITY, (), '', 33, BrickletRGBLED.CODEC_GET_IDENTITY_RESPONSE))
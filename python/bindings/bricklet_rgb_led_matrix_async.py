@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_rgb_led_matrix import BrickletRGBLEDMatrix, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_rgb_led_matrix import BrickletRGBLEDMatrix, GetSPITFPErrorCount, GetIdentity
+
+class BrickletRGBLEDMatrixAsync(AsyncDevice, BrickletRGBLEDMatrix):
+    """
+    RGB LED Matrix with 8x8 pixel
+
+    asyncio variant of BrickletRGBLEDMatrix for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_red(self, red):
+        """
+        Sets the 64 red LED values of the matrix.
+        """
+        await self.check_validity()
+
+        red = list(map(int, red))
+
+        await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_SET_RED, (red,), BrickletRGBLEDMatrix.CODEC_SET_RED_REQUEST, 0, '')
+
+    async def get_red(self):
+        """
+        Returns the red LED values as set by :func:`Set Red`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_GET_RED, (), '', 72, BrickletRGBLEDMatrix.CODEC_GET_RED_RESPONSE)
+
+    async def set_green(self, green):
+        """
+        Sets the 64 green LED values of the matrix.
+        """
+        await self.check_validity()
+
+        green = list(map(int, green))
+
+        await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_SET_GREEN, (green,), BrickletRGBLEDMatrix.CODEC_SET_GREEN_REQUEST, 0, '')
+
+    async def get_green(self):
+        """
+        Returns the green LED values as set by :func:`Set Green`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_GET_GREEN, (), '', 72, BrickletRGBLEDMatrix.CODEC_GET_GREEN_RESPONSE)
+
+    async def set_blue(self, blue):
+        """
+        Sets the 64 blue LED values of the matrix.
+        """
+        await self.check_validity()
+
+        blue = list(map(int, blue))
+
+        await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_SET_BLUE, (blue,), BrickletRGBLEDMatrix.CODEC_SET_BLUE_REQUEST, 0, '')
+
+    async def get_blue(self):
+        """
+        Returns the blue LED values as set by :func:`Set Blue`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_GET_BLUE, (), '', 72, BrickletRGBLEDMatrix.CODEC_GET_BLUE_RESPONSE)
+
+    async def set_frame_duration(self, frame_duration):
+        """
+        Sets the frame duration.
+
+        Example: If you want to achieve 20 frames per second, you should
+        set the frame duration to 50ms (50ms * 20 = 1 second).
+
+        Set this value to 0 to turn the automatic frame write mechanism off.
+
+        Approach:
+
+        * Call :func:`Set Frame Duration` with value > 0.
+        * Set LED values for first frame with :func:`Set Red`, :func:`Set Green`, :func:`Set Blue`.
+        * Wait for :cb:`Frame Started` callback.
+        * Set LED values for second frame with :func:`Set Red`, :func:`Set Green`, :func:`Set Blue`.
+        * Wait for :cb:`Frame Started` callback.
+        * and so on.
+
+        For frame duration of 0 see :func:`Draw Frame`.
+        """
+        await self.check_validity()
+
+        frame_duration = int(frame_duration)
+
+        await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_SET_FRAME_DURATION, (frame_duration,), BrickletRGBLEDMatrix.CODEC_SET_FRAME_DURATION_REQUEST, 0, '')
+
+    async def get_frame_duration(self):
+        """
+        Returns the frame duration as set by :func:`Set Frame Duration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_GET_FRAME_DURATION, (), '', 10, BrickletRGBLEDMatrix.CODEC_GET_FRAME_DURATION_RESPONSE)
+
+    async def draw_frame(self):
+        """
+        If you set the frame duration to 0 (see :func:`Set Frame Duration`), you can use this
+        function to transfer the frame to the matrix.
+
+        Approach:
+
+        * Call :func:`Set Frame Duration` with 0.
+        * Set LED values for first frame with :func:`Set Red`, :func:`Set Green`, :func:`Set Blue`.
+        * Call :func:`Draw Frame`.
+        * Wait for :cb:`Frame Started` callback.
+        * Set LED values for second frame with :func:`Set Red`, :func:`Set Green`, :func:`Set Blue`.
+        * Call :func:`Draw Frame`.
+        * Wait for :cb:`Frame Started` callback.
+        * and so on.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_DRAW_FRAME, (), '', 0, '')
+
+    async def get_supply_voltage(self):
+        """
+        Returns the current supply voltage of the Bricklet.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_GET_SUPPLY_VOLTAGE, (), '', 10, BrickletRGBLEDMatrix.CODEC_GET_SUPPLY_VOLTAGE_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletRGBLEDMatrix.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletRGBLEDMatrix.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletRGBLEDMatrix.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletRGBLEDMatrix.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletRGBLEDMatrix.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_WRITE_FIRMWARE, (data,), BrickletRGBLEDMatrix.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletRGBLEDMatrix.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletRGBLEDMatrix.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletRGBLEDMatrix.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletRGBLEDMatrix.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_WRITE_UID, (uid,), BrickletRGBLEDMatrix.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_READ_UID, (), '', 12, BrickletRGBLEDMatrix.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletRGBLEDMatrix.FUNCTION_GET_IDENTITY, (), '', 33, BrickletRGBLEDMatrix.CODEC_GET_IDENTITY_RESPONSE))
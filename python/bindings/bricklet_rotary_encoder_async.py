@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_rotary_encoder import BrickletRotaryEncoder, GetCountCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_rotary_encoder import BrickletRotaryEncoder, GetCountCallbackThreshold, GetIdentity
+
+class BrickletRotaryEncoderAsync(AsyncDevice, BrickletRotaryEncoder):
+    """
+    360° rotary encoder with push-button
+
+    asyncio variant of BrickletRotaryEncoder for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_count(self, reset):
+        """
+        Returns the current count of the encoder. If you set reset
+        to true, the count is set back to 0 directly after the
+        current count is read.
+
+        The encoder has 24 steps per rotation
+
+        Turning the encoder to the left decrements the counter,
+        so a negative count is possible.
+        """
+        await self.check_validity()
+
+        reset = bool(reset)
+
+        return await self.ipcon.send_request(self, BrickletRotaryEncoder.FUNCTION_GET_COUNT, (reset,), BrickletRotaryEncoder.CODEC_GET_COUNT_REQUEST, 12, BrickletRotaryEncoder.CODEC_GET_COUNT_RESPONSE)
+
+    async def set_count_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Count` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Count` callback is only triggered if the count has changed since the
+        last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletRotaryEncoder.FUNCTION_SET_COUNT_CALLBACK_PERIOD, (period,), BrickletRotaryEncoder.CODEC_SET_COUNT_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_count_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Count Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRotaryEncoder.FUNCTION_GET_COUNT_CALLBACK_PERIOD, (), '', 12, BrickletRotaryEncoder.CODEC_GET_COUNT_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_count_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Count Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the count is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the count is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the count is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the count is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletRotaryEncoder.FUNCTION_SET_COUNT_CALLBACK_THRESHOLD, (option, min, max), BrickletRotaryEncoder.CODEC_SET_COUNT_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_count_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Count Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetCountCallbackThreshold(*await self.ipcon.send_request(self, BrickletRotaryEncoder.FUNCTION_GET_COUNT_CALLBACK_THRESHOLD, (), '', 17, BrickletRotaryEncoder.CODEC_GET_COUNT_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callback
+
+        * :cb:`Count Reached`
+
+        is triggered, if the thresholds
+
+        * :func:`Set Count Callback Threshold`
+
+        keeps being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletRotaryEncoder.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletRotaryEncoder.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRotaryEncoder.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletRotaryEncoder.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def is_pressed(self):
+        """
+        Returns *true* if the button is pressed and *false* otherwise.
+
+        It is recommended to use the :cb:`Pressed` and :cb:`Released` callbacks
+        to handle the button.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRotaryEncoder.FUNCTION_IS_PRESSED, (), '', 9, BrickletRotaryEncoder.CODEC_IS_PRESSED_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletRotaryEncoder.FUNCTION_GET_IDENTITY, (), '', 33, BrickletRotaryEncoder.CODEC_GET_IDENTITY_RESPONSE))
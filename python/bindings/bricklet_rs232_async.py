@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_rs232 import BrickletRS232, Read, GetConfiguration, ReadFrame, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_rs232 import BrickletRS232, Read, GetConfiguration, ReadFrame, GetIdentity
+
+class BrickletRS232Async(AsyncDevice, BrickletRS232):
+    """
+    Communicates with RS232 devices
+
+    asyncio variant of BrickletRS232 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def write(self, message, length):
+        """
+        Writes a string of up to 60 characters to the RS232 interface. The string
+        can be binary data, ASCII or similar is not necessary.
+
+        The length of the string has to be given as an additional parameter.
+
+        The return value is the number of bytes that could be written.
+
+        See :func:`Set Configuration` for configuration possibilities
+        regarding baudrate, parity and so on.
+        """
+        await self.check_validity()
+
+        message = create_char_list(message)
+        length = int(length)
+
+        return await self.ipcon.send_request(self, BrickletRS232.FUNCTION_WRITE, (message, length), BrickletRS232.CODEC_WRITE_REQUEST, 9, BrickletRS232.CODEC_WRITE_RESPONSE)
+
+    async def read(self):
+        """
+        Returns the currently buffered message. The maximum length
+        of message is 60. If the returned length is 0, no new data was available.
+
+        Instead of polling with this function, you can also use
+        callbacks. See :func:`Enable Read Callback` and :cb:`Read` callback.
+        """
+        await self.check_validity()
+
+        return Read(*await self.ipcon.send_request(self, BrickletRS232.FUNCTION_READ, (), '', 69, BrickletRS232.CODEC_READ_RESPONSE))
+
+    async def enable_read_callback(self):
+        """
+        Enables the :cb:`Read` callback. This will disable the :cb:`Frame Readable` callback.
+
+        By default the callback is disabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRS232.FUNCTION_ENABLE_READ_CALLBACK, (), '', 0, '')
+
+    async def disable_read_callback(self):
+        """
+        Disables the :cb:`Read` callback.
+
+        By default the callback is disabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRS232.FUNCTION_DISABLE_READ_CALLBACK, (), '', 0, '')
+
+    async def is_read_callback_enabled(self):
+        """
+        Returns *true* if the :cb:`Read` callback is enabled,
+        *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS232.FUNCTION_IS_READ_CALLBACK_ENABLED, (), '', 9, BrickletRS232.CODEC_IS_READ_CALLBACK_ENABLED_RESPONSE)
+
+    async def set_configuration(self, baudrate, parity, stopbits, wordlength, hardware_flowcontrol, software_flowcontrol):
+        """
+        Sets the configuration for the RS232 communication.
+
+        Hard-/Software flow control can either be on or off but not both simultaneously on.
+        """
+        await self.check_validity()
+
+        baudrate = int(baudrate)
+        parity = int(parity)
+        stopbits = int(stopbits)
+        wordlength = int(wordlength)
+        hardware_flowcontrol = int(hardware_flowcontrol)
+        software_flowcontrol = int(software_flowcontrol)
+
+        await self.ipcon.send_request(self, BrickletRS232.FUNCTION_SET_CONFIGURATION, (baudrate, parity, stopbits, wordlength, hardware_flowcontrol, software_flowcontrol), BrickletRS232.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        return GetConfiguration(*await self.ipcon.send_request(self, BrickletRS232.FUNCTION_GET_CONFIGURATION, (), '', 14, BrickletRS232.CODEC_GET_CONFIGURATION_RESPONSE))
+
+    async def set_break_condition(self, break_time):
+        """
+        Sets a break condition (the TX output is forced to a logic 0 state).
+        The parameter sets the hold-time of the break condition.
+
+        .. versionadded:: 2.0.2$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        break_time = int(break_time)
+
+        await self.ipcon.send_request(self, BrickletRS232.FUNCTION_SET_BREAK_CONDITION, (break_time,), BrickletRS232.CODEC_SET_BREAK_CONDITION_REQUEST, 0, '')
+
+    async def set_frame_readable_callback_configuration(self, frame_size):
+        """
+        Configures the :cb:`Frame Readable` callback. The frame size is the number of bytes, that have to be readable to trigger the callback.
+        A frame size of 0 disables the callback. A frame size greater than 0 enables the callback and disables the :cb:`Read` callback.
+
+        By default the callback is disabled.
+
+        .. versionadded:: 2.0.4$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        frame_size = int(frame_size)
+
+        await self.ipcon.send_request(self, BrickletRS232.FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION, (frame_size,), BrickletRS232.CODEC_SET_FRAME_READABLE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_frame_readable_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Frame Readable Callback Configuration`.
+
+        .. versionadded:: 2.0.4$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS232.FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION, (), '', 9, BrickletRS232.CODEC_GET_FRAME_READABLE_CALLBACK_CONFIGURATION_RESPONSE)
+
+    async def read_frame(self):
+        """
+        Returns up to one frame of bytes from the read buffer.
+        The frame size is configured with :func:`Set Frame Readable Callback Configuration`.
+        If the returned length is 0, no new data was available.
+
+        .. versionadded:: 2.0.4$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return ReadFrame(*await self.ipcon.send_request(self, BrickletRS232.FUNCTION_READ_FRAME, (), '', 69, BrickletRS232.CODEC_READ_FRAME_RESPONSE))
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletRS232.FUNCTION_GET_IDENTITY, (), '', 33, BrickletRS232.CODEC_GET_IDENTITY_RESPONSE))
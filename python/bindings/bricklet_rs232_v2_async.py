@@ -0,0 +1,420 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_rs232_v2 import BrickletRS232V2, ReadLowLevel, GetConfiguration, GetBufferConfig, GetBufferStatus, GetErrorCount, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_rs232_v2 import BrickletRS232V2, ReadLowLevel, GetConfiguration, GetBufferConfig, GetBufferStatus, GetErrorCount, GetSPITFPErrorCount, GetIdentity
+
+class BrickletRS232V2Async(AsyncDevice, BrickletRS232V2):
+    """
+    Communicates with RS232 devices
+
+    asyncio variant of BrickletRS232V2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def write_low_level(self, message_length, message_chunk_offset, message_chunk_data):
+        """
+        Writes characters to the RS232 interface. The characters can be binary data,
+        ASCII or similar is not necessary.
+
+        The return value is the number of characters that were written.
+
+        See :func:`Set Configuration` for configuration possibilities
+        regarding baud rate, parity and so on.
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        return await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_WRITE_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data), BrickletRS232V2.CODEC_WRITE_LOW_LEVEL_REQUEST, 9, BrickletRS232V2.CODEC_WRITE_LOW_LEVEL_RESPONSE)
+
+    async def read_low_level(self, length):
+        """
+        Returns up to *length* characters from receive buffer.
+
+        Instead of polling with this function, you can also use
+        callbacks. But note that this function will return available
+        data only when the read callback is disabled.
+        See :func:`Enable Read Callback` and :cb:`Read` callback.
+        """
+        await self.check_validity()
+
+        length = int(length)
+
+        return ReadLowLevel(*await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_READ_LOW_LEVEL, (length,), BrickletRS232V2.CODEC_READ_LOW_LEVEL_REQUEST, 72, BrickletRS232V2.CODEC_READ_LOW_LEVEL_RESPONSE))
+
+    async def enable_read_callback(self):
+        """
+        Enables the :cb:`Read` callback. This will disable the :cb:`Frame Readable` callback.
+
+        By default the callback is disabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_ENABLE_READ_CALLBACK, (), '', 0, '')
+
+    async def disable_read_callback(self):
+        """
+        Disables the :cb:`Read` callback.
+
+        By default the callback is disabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_DISABLE_READ_CALLBACK, (), '', 0, '')
+
+    async def is_read_callback_enabled(self):
+        """
+        Returns *true* if the :cb:`Read` callback is enabled,
+        *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_IS_READ_CALLBACK_ENABLED, (), '', 9, BrickletRS232V2.CODEC_IS_READ_CALLBACK_ENABLED_RESPONSE)
+
+    async def set_configuration(self, baudrate, parity, stopbits, wordlength, flowcontrol):
+        """
+        Sets the configuration for the RS232 communication.
+        """
+        await self.check_validity()
+
+        baudrate = int(baudrate)
+        parity = int(parity)
+        stopbits = int(stopbits)
+        wordlength = int(wordlength)
+        flowcontrol = int(flowcontrol)
+
+        await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_SET_CONFIGURATION, (baudrate, parity, stopbits, wordlength, flowcontrol), BrickletRS232V2.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        return GetConfiguration(*await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_GET_CONFIGURATION, (), '', 16, BrickletRS232V2.CODEC_GET_CONFIGURATION_RESPONSE))
+
+    async def set_buffer_config(self, send_buffer_size, receive_buffer_size):
+        """
+        Sets the send and receive buffer size in byte. In total the buffers have to be
+        10240 byte (10KiB) in size, the minimum buffer size is 1024 byte (1KiB) for each.
+
+        The current buffer content is lost if this function is called.
+
+        The send buffer holds data that is given by :func:`Write` and
+        can not be written yet. The receive buffer holds data that is
+        received through RS232 but could not yet be send to the
+        user, either by :func:`Read` or through :cb:`Read` callback.
+        """
+        await self.check_validity()
+
+        send_buffer_size = int(send_buffer_size)
+        receive_buffer_size = int(receive_buffer_size)
+
+        await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_SET_BUFFER_CONFIG, (send_buffer_size, receive_buffer_size), BrickletRS232V2.CODEC_SET_BUFFER_CONFIG_REQUEST, 0, '')
+
+    async def get_buffer_config(self):
+        """
+        Returns the buffer configuration as set by :func:`Set Buffer Config`.
+        """
+        await self.check_validity()
+
+        return GetBufferConfig(*await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_GET_BUFFER_CONFIG, (), '', 12, BrickletRS232V2.CODEC_GET_BUFFER_CONFIG_RESPONSE))
+
+    async def get_buffer_status(self):
+        """
+        Returns the currently used bytes for the send and received buffer.
+
+        See :func:`Set Buffer Config` for buffer size configuration.
+        """
+        await self.check_validity()
+
+        return GetBufferStatus(*await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_GET_BUFFER_STATUS, (), '', 12, BrickletRS232V2.CODEC_GET_BUFFER_STATUS_RESPONSE))
+
+    async def get_error_count(self):
+        """
+        Returns the current number of overrun and parity errors.
+        """
+        await self.check_validity()
+
+        return GetErrorCount(*await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_GET_ERROR_COUNT, (), '', 16, BrickletRS232V2.CODEC_GET_ERROR_COUNT_RESPONSE))
+
+    async def set_frame_readable_callback_configuration(self, frame_size):
+        """
+        Configures the :cb:`Frame Readable` callback. The frame size is the number of bytes, that have to be readable to trigger the callback.
+        A frame size of 0 disables the callback. A frame size greater than 0 enables the callback and disables the :cb:`Read` callback.
+
+        By default the callback is disabled.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        frame_size = int(frame_size)
+
+        await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION, (frame_size,), BrickletRS232V2.CODEC_SET_FRAME_READABLE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_frame_readable_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Frame Readable Callback Configuration`.
+
+        .. versionadded:: 2.0.3$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION, (), '', 10, BrickletRS232V2.CODEC_GET_FRAME_READABLE_CALLBACK_CONFIGURATION_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletRS232V2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletRS232V2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletRS232V2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletRS232V2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletRS232V2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletRS232V2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletRS232V2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletRS232V2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletRS232V2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletRS232V2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_WRITE_UID, (uid,), BrickletRS232V2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_READ_UID, (), '', 12, BrickletRS232V2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletRS232V2.CODEC_GET_IDENTITY_RESPONSE))
+
+    async def write(self, message):
+        """
+        Writes characters to the RS232 interface. The characters can be binary data,
+        ASCII or similar is not necessary.
+
+        The return value is the number of characters that were written.
+
+        See :func:`Set Configuration` for configuration possibilities
+        regarding baud rate, parity and so on.
+        """
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 60
+            ret = await self.write_low_level(message_length, message_chunk_offset, message_chunk_data)
+            message_written = ret
+        else:
+            message_written = 0
+
+            async with self.stream_lock:
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 60, '\0')
+                    ret = await self.write_low_level(message_length, message_chunk_offset, message_chunk_data)
+                    message_written += ret
+
+                    if ret < 60:
+                        break # either last chunk or short write
+
+                    message_chunk_offset += 60
+
+        return message_written
+
+    async def read(self, length):
+        """
+        Returns up to *length* characters from receive buffer.
+
+        Instead of polling with this function, you can also use
+        callbacks. But note that this function will return available
+        data only when the read callback is disabled.
+        See :func:`Enable Read Callback` and :cb:`Read` callback.
+        """
+        length = int(length)
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletRS232V2.CODEC_READ_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = ReadLowLevel(*await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_READ_LOW_LEVEL, (length,), BrickletRS232V2.CODEC_READ_LOW_LEVEL_REQUEST, 72, message_codec))
+            message_length = ret.message_length
+            message_out_of_sync = ret.message_chunk_offset != 0
+            message_data = self.create_stream_reassembler(message_length, 'c')
+            message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = ReadLowLevel(*await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_READ_LOW_LEVEL, (length,), BrickletRS232V2.CODEC_READ_LOW_LEVEL_REQUEST, 72, message_codec))
+                message_length = ret.message_length
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 60 < message_length:
+                    ret = ReadLowLevel(*await self.ipcon.send_request(self, BrickletRS232V2.FUNCTION_READ_LOW_LEVEL, (length,), BrickletRS232V2.CODEC_READ_LOW_LEVEL_REQUEST, 72, message_codec))
+                    message_length = ret.message_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return message_data.get_data(message_length)
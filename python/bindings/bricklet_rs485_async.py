@@ -0,0 +1,1171 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_rs485 import BrickletRS485, ReadLowLevel, GetRS485Configuration, GetModbusConfiguration, GetBufferConfig, GetBufferStatus, GetErrorCount, GetModbusCommonErrorCount, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_rs485 import BrickletRS485, ReadLowLevel, GetRS485Configuration, GetModbusConfiguration, GetBufferConfig, GetBufferStatus, GetErrorCount, GetModbusCommonErrorCount, GetSPITFPErrorCount, GetIdentity
+
+class BrickletRS485Async(AsyncDevice, BrickletRS485):
+    """
+    Communicates with RS485/Modbus devices with full- or half-duplex
+
+    asyncio variant of BrickletRS485 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def write_low_level(self, message_length, message_chunk_offset, message_chunk_data):
+        """
+        Writes characters to the RS485 interface. The characters can be binary data,
+        ASCII or similar is not necessary.
+
+        The return value is the number of characters that were written.
+
+        See :func:`Set RS485 Configuration` for configuration possibilities
+        regarding baudrate, parity and so on.
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_WRITE_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data), BrickletRS485.CODEC_WRITE_LOW_LEVEL_REQUEST, 9, BrickletRS485.CODEC_WRITE_LOW_LEVEL_RESPONSE)
+
+    async def read_low_level(self, length):
+        """
+        Returns up to *length* characters from receive buffer.
+
+        Instead of polling with this function, you can also use
+        callbacks. But note that this function will return available
+        data only when the read callback is disabled.
+        See :func:`Enable Read Callback` and :cb:`Read` callback.
+        """
+        await self.check_validity()
+
+        length = int(length)
+
+        return ReadLowLevel(*await self.ipcon.send_request(self, BrickletRS485.FUNCTION_READ_LOW_LEVEL, (length,), BrickletRS485.CODEC_READ_LOW_LEVEL_REQUEST, 72, BrickletRS485.CODEC_READ_LOW_LEVEL_RESPONSE))
+
+    async def enable_read_callback(self):
+        """
+        Enables the :cb:`Read` callback. This will disable the :cb:`Frame Readable` callback.
+
+        By default the callback is disabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_ENABLE_READ_CALLBACK, (), '', 0, '')
+
+    async def disable_read_callback(self):
+        """
+        Disables the :cb:`Read` callback.
+
+        By default the callback is disabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_DISABLE_READ_CALLBACK, (), '', 0, '')
+
+    async def is_read_callback_enabled(self):
+        """
+        Returns *true* if the :cb:`Read` callback is enabled,
+        *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_IS_READ_CALLBACK_ENABLED, (), '', 9, BrickletRS485.CODEC_IS_READ_CALLBACK_ENABLED_RESPONSE)
+
+    async def set_rs485_configuration(self, baudrate, parity, stopbits, wordlength, duplex):
+        """
+        Sets the configuration for the RS485 communication.
+        """
+        await self.check_validity()
+
+        baudrate = int(baudrate)
+        parity = int(parity)
+        stopbits = int(stopbits)
+        wordlength = int(wordlength)
+        duplex = int(duplex)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_SET_RS485_CONFIGURATION, (baudrate, parity, stopbits, wordlength, duplex), BrickletRS485.CODEC_SET_RS485_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_rs485_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set RS485 Configuration`.
+        """
+        await self.check_validity()
+
+        return GetRS485Configuration(*await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_RS485_CONFIGURATION, (), '', 16, BrickletRS485.CODEC_GET_RS485_CONFIGURATION_RESPONSE))
+
+    async def set_modbus_configuration(self, slave_address, master_request_timeout):
+        """
+        Sets the configuration for the RS485 Modbus communication. Available options:
+
+        * Slave Address: Address to be used as the Modbus slave address in Modbus slave mode. Valid Modbus slave address range is 1 to 247.
+        * Master Request Timeout: Specifies how long the master should wait for a response from a slave when in Modbus master mode.
+        """
+        await self.check_validity()
+
+        slave_address = int(slave_address)
+        master_request_timeout = int(master_request_timeout)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_SET_MODBUS_CONFIGURATION, (slave_address, master_request_timeout), BrickletRS485.CODEC_SET_MODBUS_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_modbus_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Modbus Configuration`.
+        """
+        await self.check_validity()
+
+        return GetModbusConfiguration(*await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_MODBUS_CONFIGURATION, (), '', 13, BrickletRS485.CODEC_GET_MODBUS_CONFIGURATION_RESPONSE))
+
+    async def set_mode(self, mode):
+        """
+        Sets the mode of the Bricklet in which it operates. Available options are
+
+        * RS485,
+        * Modbus Master RTU and
+        * Modbus Slave RTU.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_SET_MODE, (mode,), BrickletRS485.CODEC_SET_MODE_REQUEST, 0, '')
+
+    async def get_mode(self):
+        """
+        Returns the configuration as set by :func:`Set Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_MODE, (), '', 9, BrickletRS485.CODEC_GET_MODE_RESPONSE)
+
+    async def set_communication_led_config(self, config):
+        """
+        Sets the communication LED configuration. By default the LED shows RS485
+        communication traffic by flickering.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is off.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_SET_COMMUNICATION_LED_CONFIG, (config,), BrickletRS485.CODEC_SET_COMMUNICATION_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_communication_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Communication LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_COMMUNICATION_LED_CONFIG, (), '', 9, BrickletRS485.CODEC_GET_COMMUNICATION_LED_CONFIG_RESPONSE)
+
+    async def set_error_led_config(self, config):
+        """
+        Sets the error LED configuration.
+
+        By default the error LED turns on if there is any error (see :cb:`Error Count`
+        callback). If you call this function with the SHOW ERROR option again, the LED
+        will turn off until the next error occurs.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is off.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_SET_ERROR_LED_CONFIG, (config,), BrickletRS485.CODEC_SET_ERROR_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_error_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Error LED Config`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_ERROR_LED_CONFIG, (), '', 9, BrickletRS485.CODEC_GET_ERROR_LED_CONFIG_RESPONSE)
+
+    async def set_buffer_config(self, send_buffer_size, receive_buffer_size):
+        """
+        Sets the send and receive buffer size in byte. In sum there is
+        10240 byte (10KiB) buffer available and the minimum buffer size
+        is 1024 byte (1KiB) for both.
+
+        The current buffer content is lost if this function is called.
+
+        The send buffer holds data that was given by :func:`Write` and
+        could not be written yet. The receive buffer holds data that is
+        received through RS485 but could not yet be send to the
+        user, either by :func:`Read` or through :cb:`Read` callback.
+        """
+        await self.check_validity()
+
+        send_buffer_size = int(send_buffer_size)
+        receive_buffer_size = int(receive_buffer_size)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_SET_BUFFER_CONFIG, (send_buffer_size, receive_buffer_size), BrickletRS485.CODEC_SET_BUFFER_CONFIG_REQUEST, 0, '')
+
+    async def get_buffer_config(self):
+        """
+        Returns the buffer configuration as set by :func:`Set Buffer Config`.
+        """
+        await self.check_validity()
+
+        return GetBufferConfig(*await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_BUFFER_CONFIG, (), '', 12, BrickletRS485.CODEC_GET_BUFFER_CONFIG_RESPONSE))
+
+    async def get_buffer_status(self):
+        """
+        Returns the currently used bytes for the send and received buffer.
+
+        See :func:`Set Buffer Config` for buffer size configuration.
+        """
+        await self.check_validity()
+
+        return GetBufferStatus(*await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_BUFFER_STATUS, (), '', 12, BrickletRS485.CODEC_GET_BUFFER_STATUS_RESPONSE))
+
+    async def enable_error_count_callback(self):
+        """
+        Enables the :cb:`Error Count` callback.
+
+        By default the callback is disabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_ENABLE_ERROR_COUNT_CALLBACK, (), '', 0, '')
+
+    async def disable_error_count_callback(self):
+        """
+        Disables the :cb:`Error Count` callback.
+
+        By default the callback is disabled.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_DISABLE_ERROR_COUNT_CALLBACK, (), '', 0, '')
+
+    async def is_error_count_callback_enabled(self):
+        """
+        Returns *true* if the :cb:`Error Count` callback is enabled,
+        *false* otherwise.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_IS_ERROR_COUNT_CALLBACK_ENABLED, (), '', 9, BrickletRS485.CODEC_IS_ERROR_COUNT_CALLBACK_ENABLED_RESPONSE)
+
+    async def get_error_count(self):
+        """
+        Returns the current number of overrun and parity errors.
+        """
+        await self.check_validity()
+
+        return GetErrorCount(*await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_ERROR_COUNT, (), '', 16, BrickletRS485.CODEC_GET_ERROR_COUNT_RESPONSE))
+
+    async def get_modbus_common_error_count(self):
+        """
+        Returns the current number of errors occurred in Modbus mode.
+
+        * Timeout Error Count: Number of timeouts occurred.
+        * Checksum Error Count: Number of failures due to Modbus frame CRC16 checksum mismatch.
+        * Frame Too Big Error Count: Number of times frames were rejected because they exceeded maximum Modbus frame size which is 256 bytes.
+        * Illegal Function Error Count: Number of errors when an unimplemented or illegal function is requested. This corresponds to Modbus exception code 1.
+        * Illegal Data Address Error Count: Number of errors due to invalid data address. This corresponds to Modbus exception code 2.
+        * Illegal Data Value Error Count: Number of errors due to invalid data value. This corresponds to Modbus exception code 3.
+        * Slave Device Failure Error Count: Number of errors occurred on the slave device which were unrecoverable. This corresponds to Modbus exception code 4.
+        """
+        await self.check_validity()
+
+        return GetModbusCommonErrorCount(*await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_MODBUS_COMMON_ERROR_COUNT, (), '', 36, BrickletRS485.CODEC_GET_MODBUS_COMMON_ERROR_COUNT_RESPONSE))
+
+    async def modbus_slave_report_exception(self, request_id, exception_code):
+        """
+        In Modbus slave mode this function can be used to report a Modbus exception for
+        a Modbus master request.
+
+        * Request ID: Request ID of the request received by the slave.
+        * Exception Code: Modbus exception code to report to the Modbus master.
+        """
+        await self.check_validity()
+
+        request_id = int(request_id)
+        exception_code = int(exception_code)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_SLAVE_REPORT_EXCEPTION, (request_id, exception_code), BrickletRS485.CODEC_MODBUS_SLAVE_REPORT_EXCEPTION_REQUEST, 0, '')
+
+    async def modbus_slave_answer_read_coils_request_low_level(self, request_id, coils_length, coils_chunk_offset, coils_chunk_data):
+        """
+        In Modbus slave mode this function can be used to answer a master request to
+        read coils.
+
+        * Request ID: Request ID of the corresponding request that is being answered.
+        * Coils: Data that is to be sent to the Modbus master for the corresponding request.
+
+        This function must be called from the :cb:`Modbus Slave Read Coils Request` callback
+        with the Request ID as provided by the argument of the callback.
+        """
+        await self.check_validity()
+
+        request_id = int(request_id)
+        coils_length = int(coils_length)
+        coils_chunk_offset = int(coils_chunk_offset)
+        coils_chunk_data = list(map(bool, coils_chunk_data))
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_SLAVE_ANSWER_READ_COILS_REQUEST_LOW_LEVEL, (request_id, coils_length, coils_chunk_offset, coils_chunk_data), BrickletRS485.CODEC_MODBUS_SLAVE_ANSWER_READ_COILS_REQUEST_LOW_LEVEL_REQUEST, 0, '')
+
+    async def modbus_master_read_coils(self, slave_address, starting_address, count):
+        """
+        In Modbus master mode this function can be used to read coils from a slave. This
+        function creates a Modbus function code 1 request.
+
+        * Slave Address: Address of the target Modbus slave.
+        * Starting Address: Number of the first coil to read. For backwards compatibility reasons this parameter is called Starting Address. It is not an address, but instead a coil number in the range of 1 to 65536.
+        * Count: Number of coils to read.
+
+        Upon success the function will return a non-zero request ID which will represent
+        the current request initiated by the Modbus master. In case of failure the returned
+        request ID will be 0.
+
+        When successful this function will also invoke the :cb:`Modbus Master Read Coils Response`
+        callback. In this callback the Request ID provided by the callback argument must be
+        matched with the Request ID returned from this function to verify that the callback
+        is indeed for a particular request.
+        """
+        await self.check_validity()
+
+        slave_address = int(slave_address)
+        starting_address = int(starting_address)
+        count = int(count)
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_MASTER_READ_COILS, (slave_address, starting_address, count), BrickletRS485.CODEC_MODBUS_MASTER_READ_COILS_REQUEST, 9, BrickletRS485.CODEC_MODBUS_MASTER_READ_COILS_RESPONSE)
+
+    async def modbus_slave_answer_read_holding_registers_request_low_level(self, request_id, holding_registers_length, holding_registers_chunk_offset, holding_registers_chunk_data):
+        """
+        In Modbus slave mode this function can be used to answer a master request to
+        read holding registers.
+
+        * Request ID: Request ID of the corresponding request that is being answered.
+        * Holding Registers: Data that is to be sent to the Modbus master for the corresponding request.
+
+        This function must be called from the :cb:`Modbus Slave Read Holding Registers Request`
+        callback with the Request ID as provided by the argument of the callback.
+        """
+        await self.check_validity()
+
+        request_id = int(request_id)
+        holding_registers_length = int(holding_registers_length)
+        holding_registers_chunk_offset = int(holding_registers_chunk_offset)
+        holding_registers_chunk_data = list(map(int, holding_registers_chunk_data))
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_SLAVE_ANSWER_READ_HOLDING_REGISTERS_REQUEST_LOW_LEVEL, (request_id, holding_registers_length, holding_registers_chunk_offset, holding_registers_chunk_data), BrickletRS485.CODEC_MODBUS_SLAVE_ANSWER_READ_HOLDING_REGISTERS_REQUEST_LOW_LEVEL_REQUEST, 0, '')
+
+    async def modbus_master_read_holding_registers(self, slave_address, starting_address, count):
+        """
+        In Modbus master mode this function can be used to read holding registers from a slave.
+        This function creates a Modbus function code 3 request.
+
+        * Slave Address: Address of the target Modbus slave.
+        * Starting Address: Number of the first holding register to read. For backwards compatibility reasons this parameter is called Starting Address. It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is implicit and must be omitted.
+        * Count: Number of holding registers to read.
+
+        Upon success the function will return a non-zero request ID which will represent
+        the current request initiated by the Modbus master. In case of failure the returned
+        request ID will be 0.
+
+        When successful this function will also invoke the :cb:`Modbus Master Read Holding Registers Response`
+        callback. In this callback the Request ID provided by the callback argument must be matched
+        with the Request ID returned from this function to verify that the callback is indeed for a
+        particular request.
+        """
+        await self.check_validity()
+
+        slave_address = int(slave_address)
+        starting_address = int(starting_address)
+        count = int(count)
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_MASTER_READ_HOLDING_REGISTERS, (slave_address, starting_address, count), BrickletRS485.CODEC_MODBUS_MASTER_READ_HOLDING_REGISTERS_REQUEST, 9, BrickletRS485.CODEC_MODBUS_MASTER_READ_HOLDING_REGISTERS_RESPONSE)
+
+    async def modbus_slave_answer_write_single_coil_request(self, request_id):
+        """
+        In Modbus slave mode this function can be used to answer a master request to
+        write a single coil.
+
+        * Request ID: Request ID of the corresponding request that is being answered.
+
+        This function must be called from the :cb:`Modbus Slave Write Single Coil Request`
+        callback with the Request ID as provided by the arguments of the callback.
+        """
+        await self.check_validity()
+
+        request_id = int(request_id)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_COIL_REQUEST, (request_id,), BrickletRS485.CODEC_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_COIL_REQUEST_REQUEST, 0, '')
+
+    async def modbus_master_write_single_coil(self, slave_address, coil_address, coil_value):
+        """
+        In Modbus master mode this function can be used to write a single coil of a slave.
+        This function creates a Modbus function code 5 request.
+
+        * Slave Address: Address of the target Modbus slave.
+        * Coil Address: Number of the coil to be written. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a coil number in the range of 1 to 65536.
+        * Coil Value: Value to be written.
+
+        Upon success the function will return a non-zero request ID which will represent
+        the current request initiated by the Modbus master. In case of failure the returned
+        request ID will be 0.
+
+        When successful this function will also invoke the :cb:`Modbus Master Write Single Coil Response`
+        callback. In this callback the Request ID provided by the callback argument must be matched
+        with the Request ID returned from this function to verify that the callback is indeed for a
+        particular request.
+        """
+        await self.check_validity()
+
+        slave_address = int(slave_address)
+        coil_address = int(coil_address)
+        coil_value = bool(coil_value)
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_MASTER_WRITE_SINGLE_COIL, (slave_address, coil_address, coil_value), BrickletRS485.CODEC_MODBUS_MASTER_WRITE_SINGLE_COIL_REQUEST, 9, BrickletRS485.CODEC_MODBUS_MASTER_WRITE_SINGLE_COIL_RESPONSE)
+
+    async def modbus_slave_answer_write_single_register_request(self, request_id):
+        """
+        In Modbus slave mode this function can be used to answer a master request to
+        write a single register.
+
+        * Request ID: Request ID of the corresponding request that is being answered.
+
+        This function must be called from the :cb:`Modbus Slave Write Single Register Request`
+        callback with the Request ID, Register Address and Register Value as provided by
+        the arguments of the callback.
+        """
+        await self.check_validity()
+
+        request_id = int(request_id)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_REGISTER_REQUEST, (request_id,), BrickletRS485.CODEC_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_REGISTER_REQUEST_REQUEST, 0, '')
+
+    async def modbus_master_write_single_register(self, slave_address, register_address, register_value):
+        """
+        In Modbus master mode this function can be used to write a single holding register of a
+        slave. This function creates a Modbus function code 6 request.
+
+        * Slave Address: Address of the target Modbus slave.
+        * Register Address: Number of the holding register to be written. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is implicit and must be omitted.
+        * Register Value: Value to be written.
+
+        Upon success the function will return a non-zero request ID which will represent
+        the current request initiated by the Modbus master. In case of failure the returned
+        request ID will be 0.
+
+        When successful this function will also invoke the :cb:`Modbus Master Write Single Register Response`
+        callback. In this callback the Request ID provided by the callback argument must be matched
+        with the Request ID returned from this function to verify that the callback is indeed for a
+        particular request.
+        """
+        await self.check_validity()
+
+        slave_address = int(slave_address)
+        register_address = int(register_address)
+        register_value = int(register_value)
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_MASTER_WRITE_SINGLE_REGISTER, (slave_address, register_address, register_value), BrickletRS485.CODEC_MODBUS_MASTER_WRITE_SINGLE_REGISTER_REQUEST, 9, BrickletRS485.CODEC_MODBUS_MASTER_WRITE_SINGLE_REGISTER_RESPONSE)
+
+    async def modbus_slave_answer_write_multiple_coils_request(self, request_id):
+        """
+        In Modbus slave mode this function can be used to answer a master request to
+        write multiple coils.
+
+        * Request ID: Request ID of the corresponding request that is being answered.
+
+        This function must be called from the :cb:`Modbus Slave Write Multiple Coils Request`
+        callback with the Request ID of the callback.
+        """
+        await self.check_validity()
+
+        request_id = int(request_id)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_COILS_REQUEST, (request_id,), BrickletRS485.CODEC_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_COILS_REQUEST_REQUEST, 0, '')
+
+    async def modbus_master_write_multiple_coils_low_level(self, slave_address, starting_address, coils_length, coils_chunk_offset, coils_chunk_data):
+        """
+        In Modbus master mode this function can be used to write multiple coils of a slave.
+        This function creates a Modbus function code 15 request.
+
+        * Slave Address: Address of the target Modbus slave.
+        * Starting Address: Number of the first coil to write. For backwards compatibility reasons, this parameter is called Starting Address.It is not an address, but instead a coil number in the range of 1 to 65536.
+
+        Upon success the function will return a non-zero request ID which will represent
+        the current request initiated by the Modbus master. In case of failure the returned
+        request ID will be 0.
+
+        When successful this function will also invoke the :cb:`Modbus Master Write Multiple Coils Response`
+        callback. In this callback the Request ID provided by the callback argument must be matched
+        with the Request ID returned from this function to verify that the callback is indeed for a
+        particular request.
+        """
+        await self.check_validity()
+
+        slave_address = int(slave_address)
+        starting_address = int(starting_address)
+        coils_length = int(coils_length)
+        coils_chunk_offset = int(coils_chunk_offset)
+        coils_chunk_data = list(map(bool, coils_chunk_data))
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_COILS_LOW_LEVEL, (slave_address, starting_address, coils_length, coils_chunk_offset, coils_chunk_data), BrickletRS485.CODEC_MODBUS_MASTER_WRITE_MULTIPLE_COILS_LOW_LEVEL_REQUEST, 9, BrickletRS485.CODEC_MODBUS_MASTER_WRITE_MULTIPLE_COILS_LOW_LEVEL_RESPONSE)
+
+    async def modbus_slave_answer_write_multiple_registers_request(self, request_id):
+        """
+        In Modbus slave mode this function can be used to answer a master request to
+        write multiple registers.
+
+        * Request ID: Request ID of the corresponding request that is being answered.
+
+        This function must be called from the :cb:`Modbus Slave Write Multiple Registers Request`
+        callback with the Request ID of the callback.
+        """
+        await self.check_validity()
+
+        request_id = int(request_id)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_REGISTERS_REQUEST, (request_id,), BrickletRS485.CODEC_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_REGISTERS_REQUEST_REQUEST, 0, '')
+
+    async def modbus_master_write_multiple_registers_low_level(self, slave_address, starting_address, registers_length, registers_chunk_offset, registers_chunk_data):
+        """
+        In Modbus master mode this function can be used to write multiple registers of a slave.
+        This function creates a Modbus function code 16 request.
+
+        * Slave Address: Address of the target Modbus slave.
+        * Starting Address: Number of the first holding register to write. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is implicit and must be omitted.
+
+        Upon success the function will return a non-zero request ID which will represent
+        the current request initiated by the Modbus master. In case of failure the returned
+        request ID will be 0.
+
+        When successful this function will also invoke the :cb:`Modbus Master Write Multiple Registers Response`
+        callback. In this callback the Request ID provided by the callback argument must be matched
+        with the Request ID returned from this function to verify that the callback is indeed for a
+        particular request.
+        """
+        await self.check_validity()
+
+        slave_address = int(slave_address)
+        starting_address = int(starting_address)
+        registers_length = int(registers_length)
+        registers_chunk_offset = int(registers_chunk_offset)
+        registers_chunk_data = list(map(int, registers_chunk_data))
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_LOW_LEVEL, (slave_address, starting_address, registers_length, registers_chunk_offset, registers_chunk_data), BrickletRS485.CODEC_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_LOW_LEVEL_REQUEST, 9, BrickletRS485.CODEC_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_LOW_LEVEL_RESPONSE)
+
+    async def modbus_slave_answer_read_discrete_inputs_request_low_level(self, request_id, discrete_inputs_length, discrete_inputs_chunk_offset, discrete_inputs_chunk_data):
+        """
+        In Modbus slave mode this function can be used to answer a master request to
+        read discrete inputs.
+
+        * Request ID: Request ID of the corresponding request that is being answered.
+        * Discrete Inputs: Data that is to be sent to the Modbus master for the corresponding request.
+
+        This function must be called from the :cb:`Modbus Slave Read Discrete Inputs Request`
+        callback with the Request ID as provided by the argument of the callback.
+        """
+        await self.check_validity()
+
+        request_id = int(request_id)
+        discrete_inputs_length = int(discrete_inputs_length)
+        discrete_inputs_chunk_offset = int(discrete_inputs_chunk_offset)
+        discrete_inputs_chunk_data = list(map(bool, discrete_inputs_chunk_data))
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_SLAVE_ANSWER_READ_DISCRETE_INPUTS_REQUEST_LOW_LEVEL, (request_id, discrete_inputs_length, discrete_inputs_chunk_offset, discrete_inputs_chunk_data), BrickletRS485.CODEC_MODBUS_SLAVE_ANSWER_READ_DISCRETE_INPUTS_REQUEST_LOW_LEVEL_REQUEST, 0, '')
+
+    async def modbus_master_read_discrete_inputs(self, slave_address, starting_address, count):
+        """
+        In Modbus master mode this function can be used to read discrete inputs from a slave.
+        This function creates a Modbus function code 2 request.
+
+        * Slave Address: Address of the target Modbus slave.
+        * Starting Address: Number of the first discrete input to read. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a discrete input number in the range of 1 to 65536. The prefix digit 1 (for discrete input) is implicit and must be omitted.
+        * Count: Number of discrete inputs to read.
+
+        Upon success the function will return a non-zero request ID which will represent
+        the current request initiated by the Modbus master. In case of failure the returned
+        request ID will be 0.
+
+        When successful this function will also invoke the :cb:`Modbus Master Read Discrete Inputs Response`
+        callback. In this callback the Request ID provided by the callback argument must be matched
+        with the Request ID returned from this function to verify that the callback is indeed for a
+        particular request.
+        """
+        await self.check_validity()
+
+        slave_address = int(slave_address)
+        starting_address = int(starting_address)
+        count = int(count)
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_MASTER_READ_DISCRETE_INPUTS, (slave_address, starting_address, count), BrickletRS485.CODEC_MODBUS_MASTER_READ_DISCRETE_INPUTS_REQUEST, 9, BrickletRS485.CODEC_MODBUS_MASTER_READ_DISCRETE_INPUTS_RESPONSE)
+
+    async def modbus_slave_answer_read_input_registers_request_low_level(self, request_id, input_registers_length, input_registers_chunk_offset, input_registers_chunk_data):
+        """
+        In Modbus slave mode this function can be used to answer a master request to
+        read input registers.
+
+        * Request ID: Request ID of the corresponding request that is being answered.
+        * Input Registers: Data that is to be sent to the Modbus master for the corresponding request.
+
+        This function must be called from the :cb:`Modbus Slave Read Input Registers Request` callback
+        with the Request ID as provided by the argument of the callback.
+        """
+        await self.check_validity()
+
+        request_id = int(request_id)
+        input_registers_length = int(input_registers_length)
+        input_registers_chunk_offset = int(input_registers_chunk_offset)
+        input_registers_chunk_data = list(map(int, input_registers_chunk_data))
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_SLAVE_ANSWER_READ_INPUT_REGISTERS_REQUEST_LOW_LEVEL, (request_id, input_registers_length, input_registers_chunk_offset, input_registers_chunk_data), BrickletRS485.CODEC_MODBUS_SLAVE_ANSWER_READ_INPUT_REGISTERS_REQUEST_LOW_LEVEL_REQUEST, 0, '')
+
+    async def modbus_master_read_input_registers(self, slave_address, starting_address, count):
+        """
+        In Modbus master mode this function can be used to read input registers from a slave.
+        This function creates a Modbus function code 4 request.
+
+        * Slave Address: Address of the target Modbus slave.
+        * Starting Address: Number of the first input register to read. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead an input register number in the range of 1 to 65536. The prefix digit 3 (for input register) is implicit and must be omitted.
+        * Count: Number of input registers to read.
+
+        Upon success the function will return a non-zero request ID which will represent
+        the current request initiated by the Modbus master. In case of failure the returned
+        request ID will be 0.
+
+        When successful this function will also invoke the :cb:`Modbus Master Read Input Registers Response`
+        callback. In this callback the Request ID provided by the callback argument must be matched
+        with the Request ID returned from this function to verify that the callback is indeed for a
+        particular request.
+        """
+        await self.check_validity()
+
+        slave_address = int(slave_address)
+        starting_address = int(starting_address)
+        count = int(count)
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_MODBUS_MASTER_READ_INPUT_REGISTERS, (slave_address, starting_address, count), BrickletRS485.CODEC_MODBUS_MASTER_READ_INPUT_REGISTERS_REQUEST, 9, BrickletRS485.CODEC_MODBUS_MASTER_READ_INPUT_REGISTERS_RESPONSE)
+
+    async def set_frame_readable_callback_configuration(self, frame_size):
+        """
+        Configures the :cb:`Frame Readable` callback. The frame size is the number of bytes, that have to be readable to trigger the callback.
+        A frame size of 0 disables the callback. A frame size greater than 0 enables the callback and disables the :cb:`Read` callback.
+
+        By default the callback is disabled.
+
+        .. versionadded:: 2.0.5$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        frame_size = int(frame_size)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION, (frame_size,), BrickletRS485.CODEC_SET_FRAME_READABLE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_frame_readable_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Frame Readable Callback Configuration`.
+
+        .. versionadded:: 2.0.5$nbsp;(Plugin)
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION, (), '', 10, BrickletRS485.CODEC_GET_FRAME_READABLE_CALLBACK_CONFIGURATION_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletRS485.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletRS485.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletRS485.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletRS485.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletRS485.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_WRITE_FIRMWARE, (data,), BrickletRS485.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletRS485.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletRS485.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletRS485.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletRS485.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletRS485.FUNCTION_WRITE_UID, (uid,), BrickletRS485.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletRS485.FUNCTION_READ_UID, (), '', 12, BrickletRS485.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletRS485.FUNCTION_GET_IDENTITY, (), '', 33, BrickletRS485.CODEC_GET_IDENTITY_RESPONSE))
+
+    async def write(self, message):
+        """
+        Writes characters to the RS485 interface. The characters can be binary data,
+        ASCII or similar is not necessary.
+
+        The return value is the number of characters that were written.
+
+        See :func:`Set RS485 Configuration` for configuration possibilities
+        regarding baudrate, parity and so on.
+        """
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 60
+            ret = await self.write_low_level(message_length, message_chunk_offset, message_chunk_data)
+            message_written = ret
+        else:
+            message_written = 0
+
+            async with self.stream_lock:
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 60, '\0')
+                    ret = await self.write_low_level(message_length, message_chunk_offset, message_chunk_data)
+                    message_written += ret
+
+                    if ret < 60:
+                        break # either last chunk or short write
+
+                    message_chunk_offset += 60
+
+        return message_written
+
+    async def read(self, length):
+        """
+        Returns up to *length* characters from receive buffer.
+
+        Instead of polling with this function, you can also use
+        callbacks. But note that this function will return available
+        data only when the read callback is disabled.
+        See :func:`Enable Read Callback` and :cb:`Read` callback.
+        """
+        length = int(length)
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletRS485.CODEC_READ_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = ReadLowLevel(*await self.ipcon.send_request(self, BrickletRS485.FUNCTION_READ_LOW_LEVEL, (length,), BrickletRS485.CODEC_READ_LOW_LEVEL_REQUEST, 72, message_codec))
+            message_length = ret.message_length
+            message_out_of_sync = ret.message_chunk_offset != 0
+            message_data = self.create_stream_reassembler(message_length, 'c')
+            message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = ReadLowLevel(*await self.ipcon.send_request(self, BrickletRS485.FUNCTION_READ_LOW_LEVEL, (length,), BrickletRS485.CODEC_READ_LOW_LEVEL_REQUEST, 72, message_codec))
+                message_length = ret.message_length
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 60 < message_length:
+                    ret = ReadLowLevel(*await self.ipcon.send_request(self, BrickletRS485.FUNCTION_READ_LOW_LEVEL, (length,), BrickletRS485.CODEC_READ_LOW_LEVEL_REQUEST, 72, message_codec))
+                    message_length = ret.message_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return message_data.get_data(message_length)
+
+    async def modbus_slave_answer_read_coils_request(self, request_id, coils):
+        """
+        In Modbus slave mode this function can be used to answer a master request to
+        read coils.
+
+        * Request ID: Request ID of the corresponding request that is being answered.
+        * Coils: Data that is to be sent to the Modbus master for the corresponding request.
+
+        This function must be called from the :cb:`Modbus Slave Read Coils Request` callback
+        with the Request ID as provided by the argument of the callback.
+        """
+        request_id = int(request_id)
+        coils = create_number_list(coils, bool)
+
+        if len(coils) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Coils can be at most 65535 items long')
+
+        coils_length = len(coils)
+        coils_chunk_offset = 0
+
+        if coils_length == 0:
+            coils_chunk_data = [False] * 472
+            ret = await self.modbus_slave_answer_read_coils_request_low_level(request_id, coils_length, coils_chunk_offset, coils_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while coils_chunk_offset < coils_length:
+                    coils_chunk_data = create_chunk_data(coils, coils_chunk_offset, 472, False)
+                    requests.append((request_id, coils_length, coils_chunk_offset, coils_chunk_data))
+                    coils_chunk_offset += 472
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletRS485.FUNCTION_MODBUS_SLAVE_ANSWER_READ_COILS_REQUEST_LOW_LEVEL, requests, BrickletRS485.CODEC_MODBUS_SLAVE_ANSWER_READ_COILS_REQUEST_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def modbus_slave_answer_read_holding_registers_request(self, request_id, holding_registers):
+        """
+        In Modbus slave mode this function can be used to answer a master request to
+        read holding registers.
+
+        * Request ID: Request ID of the corresponding request that is being answered.
+        * Holding Registers: Data that is to be sent to the Modbus master for the corresponding request.
+
+        This function must be called from the :cb:`Modbus Slave Read Holding Registers Request`
+        callback with the Request ID as provided by the argument of the callback.
+        """
+        request_id = int(request_id)
+        holding_registers = create_number_list(holding_registers, int)
+
+        if len(holding_registers) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Holding Registers can be at most 65535 items long')
+
+        holding_registers_length = len(holding_registers)
+        holding_registers_chunk_offset = 0
+
+        if holding_registers_length == 0:
+            holding_registers_chunk_data = [0] * 29
+            ret = await self.modbus_slave_answer_read_holding_registers_request_low_level(request_id, holding_registers_length, holding_registers_chunk_offset, holding_registers_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while holding_registers_chunk_offset < holding_registers_length:
+                    holding_registers_chunk_data = create_chunk_data(holding_registers, holding_registers_chunk_offset, 29, 0)
+                    requests.append((request_id, holding_registers_length, holding_registers_chunk_offset, holding_registers_chunk_data))
+                    holding_registers_chunk_offset += 29
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletRS485.FUNCTION_MODBUS_SLAVE_ANSWER_READ_HOLDING_REGISTERS_REQUEST_LOW_LEVEL, requests, BrickletRS485.CODEC_MODBUS_SLAVE_ANSWER_READ_HOLDING_REGISTERS_REQUEST_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def modbus_master_write_multiple_coils(self, slave_address, starting_address, coils):
+        """
+        In Modbus master mode this function can be used to write multiple coils of a slave.
+        This function creates a Modbus function code 15 request.
+
+        * Slave Address: Address of the target Modbus slave.
+        * Starting Address: Number of the first coil to write. For backwards compatibility reasons, this parameter is called Starting Address.It is not an address, but instead a coil number in the range of 1 to 65536.
+
+        Upon success the function will return a non-zero request ID which will represent
+        the current request initiated by the Modbus master. In case of failure the returned
+        request ID will be 0.
+
+        When successful this function will also invoke the :cb:`Modbus Master Write Multiple Coils Response`
+        callback. In this callback the Request ID provided by the callback argument must be matched
+        with the Request ID returned from this function to verify that the callback is indeed for a
+        particular request.
+        """
+        slave_address = int(slave_address)
+        starting_address = int(starting_address)
+        coils = create_number_list(coils, bool)
+
+        if len(coils) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Coils can be at most 65535 items long')
+
+        coils_length = len(coils)
+        coils_chunk_offset = 0
+
+        if coils_length == 0:
+            coils_chunk_data = [False] * 440
+            ret = await self.modbus_master_write_multiple_coils_low_level(slave_address, starting_address, coils_length, coils_chunk_offset, coils_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while coils_chunk_offset < coils_length:
+                    coils_chunk_data = create_chunk_data(coils, coils_chunk_offset, 440, False)
+                    requests.append((slave_address, starting_address, coils_length, coils_chunk_offset, coils_chunk_data))
+                    coils_chunk_offset += 440
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletRS485.FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_COILS_LOW_LEVEL, requests, BrickletRS485.CODEC_MODBUS_MASTER_WRITE_MULTIPLE_COILS_LOW_LEVEL_REQUEST, 9, BrickletRS485.CODEC_MODBUS_MASTER_WRITE_MULTIPLE_COILS_LOW_LEVEL_RESPONSE)
+
+        return ret
+
+    async def modbus_master_write_multiple_registers(self, slave_address, starting_address, registers):
+        """
+        In Modbus master mode this function can be used to write multiple registers of a slave.
+        This function creates a Modbus function code 16 request.
+
+        * Slave Address: Address of the target Modbus slave.
+        * Starting Address: Number of the first holding register to write. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is implicit and must be omitted.
+
+        Upon success the function will return a non-zero request ID which will represent
+        the current request initiated by the Modbus master. In case of failure the returned
+        request ID will be 0.
+
+        When successful this function will also invoke the :cb:`Modbus Master Write Multiple Registers Response`
+        callback. In this callback the Request ID provided by the callback argument must be matched
+        with the Request ID returned from this function to verify that the callback is indeed for a
+        particular request.
+        """
+        slave_address = int(slave_address)
+        starting_address = int(starting_address)
+        registers = create_number_list(registers, int)
+
+        if len(registers) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Registers can be at most 65535 items long')
+
+        registers_length = len(registers)
+        registers_chunk_offset = 0
+
+        if registers_length == 0:
+            registers_chunk_data = [0] * 27
+            ret = await self.modbus_master_write_multiple_registers_low_level(slave_address, starting_address, registers_length, registers_chunk_offset, registers_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while registers_chunk_offset < registers_length:
+                    registers_chunk_data = create_chunk_data(registers, registers_chunk_offset, 27, 0)
+                    requests.append((slave_address, starting_address, registers_length, registers_chunk_offset, registers_chunk_data))
+                    registers_chunk_offset += 27
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletRS485.FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_LOW_LEVEL, requests, BrickletRS485.CODEC_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_LOW_LEVEL_REQUEST, 9, BrickletRS485.CODEC_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_LOW_LEVEL_RESPONSE)
+
+        return ret
+
+    async def modbus_slave_answer_read_discrete_inputs_request(self, request_id, discrete_inputs):
+        """
+        In Modbus slave mode this function can be used to answer a master request to
+        read discrete inputs.
+
+        * Request ID: Request ID of the corresponding request that is being answered.
+        * Discrete Inputs: Data that is to be sent to the Modbus master for the corresponding request.
+
+        This function must be called from the :cb:`Modbus Slave Read Discrete Inputs Request`
+        callback with the Request ID as provided by the argument of the callback.
+        """
+        request_id = int(request_id)
+        discrete_inputs = create_number_list(discrete_inputs, bool)
+
+        if len(discrete_inputs) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Discrete Inputs can be at most 65535 items long')
+
+        discrete_inputs_length = len(discrete_inputs)
+        discrete_inputs_chunk_offset = 0
+
+        if discrete_inputs_length == 0:
+            discrete_inputs_chunk_data = [False] * 472
+            ret = await self.modbus_slave_answer_read_discrete_inputs_request_low_level(request_id, discrete_inputs_length, discrete_inputs_chunk_offset, discrete_inputs_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while discrete_inputs_chunk_offset < discrete_inputs_length:
+                    discrete_inputs_chunk_data = create_chunk_data(discrete_inputs, discrete_inputs_chunk_offset, 472, False)
+                    requests.append((request_id, discrete_inputs_length, discrete_inputs_chunk_offset, discrete_inputs_chunk_data))
+                    discrete_inputs_chunk_offset += 472
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletRS485.FUNCTION_MODBUS_SLAVE_ANSWER_READ_DISCRETE_INPUTS_REQUEST_LOW_LEVEL, requests, BrickletRS485.CODEC_MODBUS_SLAVE_ANSWER_READ_DISCRETE_INPUTS_REQUEST_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def modbus_slave_answer_read_input_registers_request(self, request_id, input_registers):
+        """
+        In Modbus slave mode this function can be used to answer a master request to
+        read input registers.
+
+        * Request ID: Request ID of the corresponding request that is being answered.
+        * Input Registers: Data that is to be sent to the Modbus master for the corresponding request.
+
+        This function must be called from the :cb:`Modbus Slave Read Input Registers Request` callback
+        with the Request ID as provided by the argument of the callback.
+        """
+        request_id = int(request_id)
+        input_registers = create_number_list(input_registers, int)
+
+        if len(input_registers) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Input Registers can be at most 65535 items long')
+
+        input_registers_length = len(input_registers)
+        input_registers_chunk_offset = 0
+
+        if input_registers_length == 0:
+            input_registers_chunk_data = [0] * 29
+            ret = await self.modbus_slave_answer_read_input_registers_request_low_level(request_id, input_registers_length, input_registers_chunk_offset, input_registers_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while input_registers_chunk_offset < input_registers_length:
+                    input_registers_chunk_data = create_chunk_data(input_registers, input_registers_chunk_offset, 29, 0)
+                    requests.append((request_id, input_registers_length, input_registers_chunk_offset, input_registers_chunk_data))
+                    input_registers_chunk_offset += 29
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletRS485.FUNCTION_MODBUS_SLAVE_ANSWER_READ_INPUT_REGISTERS_REQUEST_LOW_LEVEL, requests, BrickletRS485.CODEC_MODBUS_SLAVE_ANSWER_READ_INPUT_REGISTERS_REQUEST_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_segment_display_4x7 import BrickletSegmentDisplay4x7, GetSegments, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_segment_display_4x7 import BrickletSegmentDisplay4x7, GetSegments, GetIdentity
+
+class BrickletSegmentDisplay4x7Async(AsyncDevice, BrickletSegmentDisplay4x7):
+    """
+    Four 7-segment displays with switchable colon
+
+    asyncio variant of BrickletSegmentDisplay4x7 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_segments(self, segments, brightness, colon):
+        """
+        The 7-segment display can be set with bitmaps. Every bit controls one
+        segment:
+
+        .. image:: /Images/Bricklets/bricklet_segment_display_4x7_bit_order.png
+           :scale: 100 %
+           :alt: Bit order of one segment
+           :align: center
+
+        For example to set a "5" you would want to activate segments 0, 2, 3, 5 and 6.
+        This is represented by the number 0b01101101 = 0x6d = 109.
+
+        The brightness can be set between 0 (dark) and 7 (bright). The colon
+        parameter turns the colon of the display on or off.
+        """
+        await self.check_validity()
+
+        segments = list(map(int, segments))
+        brightness = int(brightness)
+        colon = bool(colon)
+
+        await self.ipcon.send_request(self, BrickletSegmentDisplay4x7.FUNCTION_SET_SEGMENTS, (segments, brightness, colon), BrickletSegmentDisplay4x7.CODEC_SET_SEGMENTS_REQUEST, 0, '')
+
+    async def get_segments(self):
+        """
+        Returns the segment, brightness and color data as set by
+        :func:`Set Segments`.
+        """
+        await self.check_validity()
+
+        return GetSegments(*await self.ipcon.send_request(self, BrickletSegmentDisplay4x7.FUNCTION_GET_SEGMENTS, (), '', 14, BrickletSegmentDisplay4x7.CODEC_GET_SEGMENTS_RESPONSE))
+
+    async def start_counter(self, value_from, value_to, increment, length):
+        """
+        Starts a counter with the *from* value that counts to the *to*
+        value with the each step incremented by *increment*.
+        *length* is the pause between each increment.
+
+        Example: If you set *from* to 0, *to* to 100, *increment* to 1 and
+        *length* to 1000, a counter that goes from 0 to 100 with one second
+        pause between each increment will be started.
+
+        Using a negative increment allows to count backwards.
+
+        You can stop the counter at every time by calling :func:`Set Segments`.
+        """
+        await self.check_validity()
+
+        value_from = int(value_from)
+        value_to = int(value_to)
+        increment = int(increment)
+        length = int(length)
+
+        await self.ipcon.send_request(self, BrickletSegmentDisplay4x7.FUNCTION_START_COUNTER, (value_from, value_to, increment, length), BrickletSegmentDisplay4x7.CODEC_START_COUNTER_REQUEST, 0, '')
+
+    async def get_counter_value(self):
+        """
+        Returns the counter value that is currently shown on the display.
+
+        If there is no counter running a 0 will be returned.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletSegmentDisplay4x7.FUNCTION_GET_COUNTER_VALUE, (), '', 10, BrickletSegmentDisplay4x7.CODEC_GET_COUNTER_VALUE_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletSegmentDisplay4x7.FUNCTION_GET_IDENTITY, (), '', 33, BrickletSegmentDisplay4x7.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_segment_display_4x7_v2 import BrickletSegmentDisplay4x7V2, GetSegments, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_segment_display_4x7_v2 import BrickletSegmentDisplay4x7V2, GetSegments, GetSPITFPErrorCount, GetIdentity
+
+class BrickletSegmentDisplay4x7V2Async(AsyncDevice, BrickletSegmentDisplay4x7V2):
+    """
+    Four 7-segment displays with switchable dots
+
+    asyncio variant of BrickletSegmentDisplay4x7V2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_segments(self, digit0, digit1, digit2, digit3, colon, tick):
+        """
+        Sets the segments of the Segment Display 4x7 Bricklet 2.0 segment-by-segment.
+
+        The data is split into the four digits, two colon dots and the tick mark.
+
+        The indices of the segments in the digit and colon parameters are as follows:
+
+        .. image:: /Images/Bricklets/bricklet_segment_display_4x7_v2_segment_index.png
+           :scale: 100 %
+           :alt: Indices of segments
+           :align: center
+        """
+        await self.check_validity()
+
+        digit0 = list(map(bool, digit0))
+        digit1 = list(map(bool, digit1))
+        digit2 = list(map(bool, digit2))
+        digit3 = list(map(bool, digit3))
+        colon = list(map(bool, colon))
+        tick = bool(tick)
+
+        await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_SET_SEGMENTS, (digit0, digit1, digit2, digit3, colon, tick), BrickletSegmentDisplay4x7V2.CODEC_SET_SEGMENTS_REQUEST, 0, '')
+
+    async def get_segments(self):
+        """
+        Returns the segment data as set by :func:`Set Segments`.
+        """
+        await self.check_validity()
+
+        return GetSegments(*await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_GET_SEGMENTS, (), '', 14, BrickletSegmentDisplay4x7V2.CODEC_GET_SEGMENTS_RESPONSE))
+
+    async def set_brightness(self, brightness):
+        """
+        The brightness can be set between 0 (dark) and 7 (bright).
+        """
+        await self.check_validity()
+
+        brightness = int(brightness)
+
+        await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_SET_BRIGHTNESS, (brightness,), BrickletSegmentDisplay4x7V2.CODEC_SET_BRIGHTNESS_REQUEST, 0, '')
+
+    async def get_brightness(self):
+        """
+        Returns the brightness as set by :func:`Set Brightness`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_GET_BRIGHTNESS, (), '', 9, BrickletSegmentDisplay4x7V2.CODEC_GET_BRIGHTNESS_RESPONSE)
+
+    async def set_numeric_value(self, value):
+        """
+        Sets a numeric value for each of the digits. They represent:
+
+        * -2: minus sign
+        * -1: blank
+        * 0-9: 0-9
+        * 10: A
+        * 11: b
+        * 12: C
+        * 13: d
+        * 14: E
+        * 15: F
+
+        Example: A call with [-2, -1, 4, 2] will result in a display of "- 42".
+        """
+        await self.check_validity()
+
+        value = list(map(int, value))
+
+        await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_SET_NUMERIC_VALUE, (value,), BrickletSegmentDisplay4x7V2.CODEC_SET_NUMERIC_VALUE_REQUEST, 0, '')
+
+    async def set_selected_segment(self, segment, value):
+        """
+        Turns one specified segment on or off.
+
+        The indices of the segments are as follows:
+
+        .. image:: /Images/Bricklets/bricklet_segment_display_4x7_v2_selected_segment_index.png
+           :scale: 100 %
+           :alt: Indices of selected segments
+           :align: center
+        """
+        await self.check_validity()
+
+        segment = int(segment)
+        value = bool(value)
+
+        await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_SET_SELECTED_SEGMENT, (segment, value), BrickletSegmentDisplay4x7V2.CODEC_SET_SELECTED_SEGMENT_REQUEST, 0, '')
+
+    async def get_selected_segment(self, segment):
+        """
+        Returns the value of a single segment.
+        """
+        await self.check_validity()
+
+        segment = int(segment)
+
+        return await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_GET_SELECTED_SEGMENT, (segment,), BrickletSegmentDisplay4x7V2.CODEC_GET_SELECTED_SEGMENT_REQUEST, 9, BrickletSegmentDisplay4x7V2.CODEC_GET_SELECTED_SEGMENT_RESPONSE)
+
+    async def start_counter(self, value_from, value_to, increment, length):
+        """
+        Starts a counter with the *from* value that counts to the *to*
+        value with the each step incremented by *increment*.
+        *length* is the pause between each increment.
+
+        Example: If you set *from* to 0, *to* to 100, *increment* to 1 and
+        *length* to 1000, a counter that goes from 0 to 100 with one second
+        pause between each increment will be started.
+
+        Using a negative *increment* allows to count backwards.
+
+        You can stop the counter at every time by calling :func:`Set Segments`
+        or :func:`Set Numeric Value`.
+        """
+        await self.check_validity()
+
+        value_from = int(value_from)
+        value_to = int(value_to)
+        increment = int(increment)
+        length = int(length)
+
+        await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_START_COUNTER, (value_from, value_to, increment, length), BrickletSegmentDisplay4x7V2.CODEC_START_COUNTER_REQUEST, 0, '')
+
+    async def get_counter_value(self):
+        """
+        Returns the counter value that is currently shown on the display.
+
+        If there is no counter running a 0 will be returned.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_GET_COUNTER_VALUE, (), '', 10, BrickletSegmentDisplay4x7V2.CODEC_GET_COUNTER_VALUE_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletSegmentDisplay4x7V2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletSegmentDisplay4x7V2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletSegmentDisplay4x7V2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletSegmentDisplay4x7V2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletSegmentDisplay4x7V2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletSegmentDisplay4x7V2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletSegmentDisplay4x7V2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletSegmentDisplay4x7V2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletSegmentDisplay4x7V2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletSegmentDisplay4x7V2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_WRITE_UID, (uid,), BrickletSegmentDisplay4x7V2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_READ_UID, (), '', 12, BrickletSegmentDisplay4x7V2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletSegmentDisplay4x7V2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletSegmentDisplay4x7V2.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_solid_state_relay import BrickletSolidStateRelay, GetMonoflop, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_solid_state_relay import BrickletSolidStateRelay, GetMonoflop, GetIdentity
+
+class BrickletSolidStateRelayAsync(AsyncDevice, BrickletSolidStateRelay):
+    """
+    Controls AC and DC Solid State Relays
+
+    asyncio variant of BrickletSolidStateRelay for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_state(self, state):
+        """
+        Sets the state of the relays *true* means on and *false* means off.
+
+        A running monoflop timer will be aborted if this function is called.
+        """
+        await self.check_validity()
+
+        state = bool(state)
+
+        await self.ipcon.send_request(self, BrickletSolidStateRelay.FUNCTION_SET_STATE, (state,), BrickletSolidStateRelay.CODEC_SET_STATE_REQUEST, 0, '')
+
+    async def get_state(self):
+        """
+        Returns the state of the relay, *true* means on and *false* means off.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletSolidStateRelay.FUNCTION_GET_STATE, (), '', 9, BrickletSolidStateRelay.CODEC_GET_STATE_RESPONSE)
+
+    async def set_monoflop(self, state, time):
+        """
+        The first parameter  is the desired state of the relay (*true* means on
+        and *false* means off). The second parameter indicates the time that
+        the relay should hold the state.
+
+        If this function is called with the parameters (true, 1500):
+        The relay will turn on and in 1.5s it will turn off again.
+
+        A monoflop can be used as a failsafe mechanism. For example: Lets assume you
+        have a RS485 bus and a Solid State Relay Bricklet connected to one of the slave
+        stacks. You can now call this function every second, with a time parameter
+        of two seconds. The relay will be on all the time. If now the RS485
+        connection is lost, the relay will turn off in at most two seconds.
+        """
+        await self.check_validity()
+
+        state = bool(state)
+        time = int(time)
+
+        await self.ipcon.send_request(self, BrickletSolidStateRelay.FUNCTION_SET_MONOFLOP, (state, time), BrickletSolidStateRelay.CODEC_SET_MONOFLOP_REQUEST, 0, '')
+
+    async def get_monoflop(self):
+        """
+        Returns the current state and the time as set by
+        :func:`Set Monoflop` as well as the remaining time until the state flips.
+
+        If the timer is not running currently, the remaining time will be returned
+        as 0.
+        """
+        await self.check_validity()
+
+        return GetMonoflop(*await self.ipcon.send_request(self, BrickletSolidStateRelay.FUNCTION_GET_MONOFLOP, (), '', 17, BrickletSolidStateRelay.CODEC_GET_MONOFLOP_RESPONSE))
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletSolidStateRelay.FUNCTION_GET_IDENTITY, (), '', 33, BrickletSolidStateRelay.CODEC_GET_IDENTITY_RESPONSE))
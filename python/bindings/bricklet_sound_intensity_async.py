@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_sound_intensity import BrickletSoundIntensity, GetIntensityCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_sound_intensity import BrickletSoundIntensity, GetIntensityCallbackThreshold, GetIdentity
+
+class BrickletSoundIntensityAsync(AsyncDevice, BrickletSoundIntensity):
+    """
+    Measures sound intensity
+
+    asyncio variant of BrickletSoundIntensity for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_intensity(self):
+        """
+        Returns the current sound intensity.
+
+        The value corresponds to the
+        `upper envelop <https://en.wikipedia.org/wiki/Envelope_(waves)>`__
+        of the signal of the microphone capsule.
+
+        If you want to get the intensity periodically, it is recommended to use the
+        :cb:`Intensity` callback and set the period with
+        :func:`Set Intensity Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletSoundIntensity.FUNCTION_GET_INTENSITY, (), '', 10, BrickletSoundIntensity.CODEC_GET_INTENSITY_RESPONSE)
+
+    async def set_intensity_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Intensity` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Intensity` callback is only triggered if the intensity has changed
+        since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletSoundIntensity.FUNCTION_SET_INTENSITY_CALLBACK_PERIOD, (period,), BrickletSoundIntensity.CODEC_SET_INTENSITY_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_intensity_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Intensity Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletSoundIntensity.FUNCTION_GET_INTENSITY_CALLBACK_PERIOD, (), '', 12, BrickletSoundIntensity.CODEC_GET_INTENSITY_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_intensity_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Intensity Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the intensity is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the intensity is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the intensity is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the intensity is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletSoundIntensity.FUNCTION_SET_INTENSITY_CALLBACK_THRESHOLD, (option, min, max), BrickletSoundIntensity.CODEC_SET_INTENSITY_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_intensity_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Intensity Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetIntensityCallbackThreshold(*await self.ipcon.send_request(self, BrickletSoundIntensity.FUNCTION_GET_INTENSITY_CALLBACK_THRESHOLD, (), '', 13, BrickletSoundIntensity.CODEC_GET_INTENSITY_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callback
+
+        * :cb:`Intensity Reached`
+
+        is triggered, if the thresholds
+
+        * :func:`Set Intensity Callback Threshold`
+
+        keeps being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletSoundIntensity.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletSoundIntensity.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletSoundIntensity.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletSoundIntensity.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletSoundIntensity.FUNCTION_GET_IDENTITY, (), '', 33, BrickletSoundIntensity.CODEC_GET_IDENTITY_RESPONSE))
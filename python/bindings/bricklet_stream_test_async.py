@@ -0,0 +1,2544 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+#### __DEVICE_IS_NOT_RELEASED__ ####
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_stream_test import BrickletStreamTest, NormalWriteExtraOut2LowLevel, FixedWriteExtraOut2LowLevel, ShortWriteExtraOutPrefix1LowLevel, ShortWriteExtraOutPrefix2LowLevel, ShortWriteExtraOutSuffix1LowLevel, ShortWriteExtraOutSuffix2LowLevel, ShortWriteExtraFullLowLevel, SingleWriteExtraOut2LowLevel, ShortSingleWriteExtraOutPrefix1LowLevel, ShortSingleWriteExtraOutPrefix2LowLevel, ShortSingleWriteExtraOutSuffix1LowLevel, ShortSingleWriteExtraOutSuffix2LowLevel, ShortSingleWriteExtraFullLowLevel, NormalReadLowLevel, NormalReadExtraIn1LowLevel, NormalReadExtraIn2LowLevel, NormalReadExtraOutPrefix1LowLevel, NormalReadExtraOutPrefix2LowLevel, NormalReadExtraOutSuffix1LowLevel, NormalReadExtraOutSuffix2LowLevel, NormalReadExtraOutFullLowLevel, FixedReadLowLevel, FixedReadExtraIn1LowLevel, FixedReadExtraIn2LowLevel, FixedReadExtraOutPrefix1LowLevel, FixedReadExtraOutPrefix2LowLevel, FixedReadExtraOutSuffix1LowLevel, FixedReadExtraOutSuffix2LowLevel, FixedReadExtraOutFullLowLevel, SingleReadLowLevel, SingleReadExtraIn1LowLevel, SingleReadExtraIn2LowLevel, SingleReadExtraOutPrefix1LowLevel, SingleReadExtraOutPrefix2LowLevel, SingleReadExtraOutSuffix1LowLevel, SingleReadExtraOutSuffix2LowLevel, SingleReadExtraOutFullLowLevel, GetIdentity, NormalWriteExtraOut2, FixedWriteExtraOut2, ShortWriteExtraOutPrefix1, ShortWriteExtraOutPrefix2, ShortWriteExtraOutSuffix1, ShortWriteExtraOutSuffix2, ShortWriteExtraFull, SingleWriteExtraOut2, ShortSingleWriteExtraOutPrefix1, ShortSingleWriteExtraOutPrefix2, ShortSingleWriteExtraOutSuffix1, ShortSingleWriteExtraOutSuffix2, ShortSingleWriteExtraFull, NormalReadExtraOutPrefix1, NormalReadExtraOutPrefix2, NormalReadExtraOutSuffix1, NormalReadExtraOutSuffix2, NormalReadExtraOutFull, FixedReadExtraOutPrefix1, FixedReadExtraOutPrefix2, FixedReadExtraOutSuffix1, FixedReadExtraOutSuffix2, FixedReadExtraOutFull, SingleReadExtraOutPrefix1, SingleReadExtraOutPrefix2, SingleReadExtraOutSuffix1, SingleReadExtraOutSuffix2, SingleReadExtraOutFull
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_stream_test import BrickletStreamTest, NormalWriteExtraOut2LowLevel, FixedWriteExtraOut2LowLevel, ShortWriteExtraOutPrefix1LowLevel, ShortWriteExtraOutPrefix2LowLevel, ShortWriteExtraOutSuffix1LowLevel, ShortWriteExtraOutSuffix2LowLevel, ShortWriteExtraFullLowLevel, SingleWriteExtraOut2LowLevel, ShortSingleWriteExtraOutPrefix1LowLevel, ShortSingleWriteExtraOutPrefix2LowLevel, ShortSingleWriteExtraOutSuffix1LowLevel, ShortSingleWriteExtraOutSuffix2LowLevel, ShortSingleWriteExtraFullLowLevel, NormalReadLowLevel, NormalReadExtraIn1LowLevel, NormalReadExtraIn2LowLevel, NormalReadExtraOutPrefix1LowLevel, NormalReadExtraOutPrefix2LowLevel, NormalReadExtraOutSuffix1LowLevel, NormalReadExtraOutSuffix2LowLevel, NormalReadExtraOutFullLowLevel, FixedReadLowLevel, FixedReadExtraIn1LowLevel, FixedReadExtraIn2LowLevel, FixedReadExtraOutPrefix1LowLevel, FixedReadExtraOutPrefix2LowLevel, FixedReadExtraOutSuffix1LowLevel, FixedReadExtraOutSuffix2LowLevel, FixedReadExtraOutFullLowLevel, SingleReadLowLevel, SingleReadExtraIn1LowLevel, SingleReadExtraIn2LowLevel, SingleReadExtraOutPrefix1LowLevel, SingleReadExtraOutPrefix2LowLevel, SingleReadExtraOutSuffix1LowLevel, SingleReadExtraOutSuffix2LowLevel, SingleReadExtraOutFullLowLevel, GetIdentity, NormalWriteExtraOut2, FixedWriteExtraOut2, ShortWriteExtraOutPrefix1, ShortWriteExtraOutPrefix2, ShortWriteExtraOutSuffix1, ShortWriteExtraOutSuffix2, ShortWriteExtraFull, SingleWriteExtraOut2, ShortSingleWriteExtraOutPrefix1, ShortSingleWriteExtraOutPrefix2, ShortSingleWriteExtraOutSuffix1, ShortSingleWriteExtraOutSuffix2, ShortSingleWriteExtraFull, NormalReadExtraOutPrefix1, NormalReadExtraOutPrefix2, NormalReadExtraOutSuffix1, NormalReadExtraOutSuffix2, NormalReadExtraOutFull, FixedReadExtraOutPrefix1, FixedReadExtraOutPrefix2, FixedReadExtraOutSuffix1, FixedReadExtraOutSuffix2, FixedReadExtraOutFull, SingleReadExtraOutPrefix1, SingleReadExtraOutPrefix2, SingleReadExtraOutSuffix1, SingleReadExtraOutSuffix2, SingleReadExtraOutFull
+
+class BrickletStreamTestAsync(AsyncDevice, BrickletStreamTest):
+    """
+
+
+    asyncio variant of BrickletStreamTest for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def normal_write_low_level(self, message_length, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_NORMAL_WRITE_LOW_LEVEL_REQUEST, 0, '')
+
+    async def normal_write_extra_in_prefix_1_low_level(self, extra, message_length, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        extra = int(extra)
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, (extra, message_length, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL_REQUEST, 0, '')
+
+    async def normal_write_extra_in_prefix_2_low_level(self, extra_1, extra_2, message_length, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, (extra_1, extra_2, message_length, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL_REQUEST, 0, '')
+
+    async def normal_write_extra_in_suffix_1_low_level(self, message_length, message_chunk_offset, message_chunk_data, extra):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+        extra = int(extra)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data, extra), BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL_REQUEST, 0, '')
+
+    async def normal_write_extra_in_suffix_2_low_level(self, message_length, message_chunk_offset, message_chunk_data, extra_1, extra_2):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data, extra_1, extra_2), BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL_REQUEST, 0, '')
+
+    async def normal_write_extra_in_full_low_level(self, extra_1, message_length, extra_2, message_chunk_offset, extra_3, message_chunk_data, extra_4):
+        """
+
+        """
+        await self.check_validity()
+
+        extra_1 = int(extra_1)
+        message_length = int(message_length)
+        extra_2 = int(extra_2)
+        message_chunk_offset = int(message_chunk_offset)
+        extra_3 = int(extra_3)
+        message_chunk_data = create_char_list(message_chunk_data)
+        extra_4 = int(extra_4)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_IN_FULL_LOW_LEVEL, (extra_1, message_length, extra_2, message_chunk_offset, extra_3, message_chunk_data, extra_4), BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_IN_FULL_LOW_LEVEL_REQUEST, 0, '')
+
+    async def normal_write_extra_out_1_low_level(self, message_length, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        return await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL_RESPONSE)
+
+    async def normal_write_extra_out_2_low_level(self, message_length, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        return NormalWriteExtraOut2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL_REQUEST, 10, BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL_RESPONSE))
+
+    async def fixed_write_low_level(self, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_LOW_LEVEL, (message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_FIXED_WRITE_LOW_LEVEL_REQUEST, 0, '')
+
+    async def fixed_write_extra_in_prefix_1_low_level(self, extra, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        extra = int(extra)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, (extra, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL_REQUEST, 0, '')
+
+    async def fixed_write_extra_in_prefix_2_low_level(self, extra_1, extra_2, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, (extra_1, extra_2, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL_REQUEST, 0, '')
+
+    async def fixed_write_extra_in_suffix_1_low_level(self, message_chunk_offset, message_chunk_data, extra):
+        """
+
+        """
+        await self.check_validity()
+
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+        extra = int(extra)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, (message_chunk_offset, message_chunk_data, extra), BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL_REQUEST, 0, '')
+
+    async def fixed_write_extra_in_suffix_2_low_level(self, message_chunk_offset, message_chunk_data, extra_1, extra_2):
+        """
+
+        """
+        await self.check_validity()
+
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, (message_chunk_offset, message_chunk_data, extra_1, extra_2), BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL_REQUEST, 0, '')
+
+    async def fixed_write_extra_in_full_low_level(self, extra_1, message_chunk_offset, extra_2, message_chunk_data, extra_3):
+        """
+
+        """
+        await self.check_validity()
+
+        extra_1 = int(extra_1)
+        message_chunk_offset = int(message_chunk_offset)
+        extra_2 = int(extra_2)
+        message_chunk_data = create_char_list(message_chunk_data)
+        extra_3 = int(extra_3)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_IN_FULL_LOW_LEVEL, (extra_1, message_chunk_offset, extra_2, message_chunk_data, extra_3), BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_IN_FULL_LOW_LEVEL_REQUEST, 0, '')
+
+    async def fixed_write_extra_out_1_low_level(self, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        return await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL, (message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL_RESPONSE)
+
+    async def fixed_write_extra_out_2_low_level(self, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        return FixedWriteExtraOut2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL, (message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL_REQUEST, 10, BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL_RESPONSE))
+
+    async def short_write_low_level(self, message_length, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        return await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_WRITE_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_SHORT_WRITE_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_SHORT_WRITE_LOW_LEVEL_RESPONSE)
+
+    async def short_write_extra_in_prefix_1_low_level(self, extra, message_length, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        extra = int(extra)
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        return await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, (extra, message_length, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL_RESPONSE)
+
+    async def short_write_extra_in_prefix_2_low_level(self, extra_1, extra_2, message_length, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        return await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, (extra_1, extra_2, message_length, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL_RESPONSE)
+
+    async def short_write_extra_in_suffix_1_low_level(self, message_length, message_chunk_offset, message_chunk_data, extra):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+        extra = int(extra)
+
+        return await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data, extra), BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL_RESPONSE)
+
+    async def short_write_extra_in_suffix_2_low_level(self, message_length, message_chunk_offset, message_chunk_data, extra_1, extra_2):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        return await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data, extra_1, extra_2), BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL_RESPONSE)
+
+    async def short_write_extra_out_prefix_1_low_level(self, message_length, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        return ShortWriteExtraOutPrefix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL_REQUEST, 10, BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL_RESPONSE))
+
+    async def short_write_extra_out_prefix_2_low_level(self, message_length, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        return ShortWriteExtraOutPrefix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL_REQUEST, 11, BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL_RESPONSE))
+
+    async def short_write_extra_out_suffix_1_low_level(self, message_length, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        return ShortWriteExtraOutSuffix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL_REQUEST, 10, BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL_RESPONSE))
+
+    async def short_write_extra_out_suffix_2_low_level(self, message_length, message_chunk_offset, message_chunk_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_chunk_offset = int(message_chunk_offset)
+        message_chunk_data = create_char_list(message_chunk_data)
+
+        return ShortWriteExtraOutSuffix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, (message_length, message_chunk_offset, message_chunk_data), BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL_REQUEST, 11, BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL_RESPONSE))
+
+    async def short_write_extra_full_low_level(self, extra_1, message_length, extra_2, message_chunk_offset, extra_3, message_chunk_data, extra_4):
+        """
+
+        """
+        await self.check_validity()
+
+        extra_1 = int(extra_1)
+        message_length = int(message_length)
+        extra_2 = int(extra_2)
+        message_chunk_offset = int(message_chunk_offset)
+        extra_3 = int(extra_3)
+        message_chunk_data = create_char_list(message_chunk_data)
+        extra_4 = int(extra_4)
+
+        return ShortWriteExtraFullLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_WRITE_EXTRA_FULL_LOW_LEVEL, (extra_1, message_length, extra_2, message_chunk_offset, extra_3, message_chunk_data, extra_4), BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_FULL_LOW_LEVEL_REQUEST, 11, BrickletStreamTest.CODEC_SHORT_WRITE_EXTRA_FULL_LOW_LEVEL_RESPONSE))
+
+    async def single_write_low_level(self, message_length, message_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_WRITE_LOW_LEVEL, (message_length, message_data), BrickletStreamTest.CODEC_SINGLE_WRITE_LOW_LEVEL_REQUEST, 0, '')
+
+    async def single_write_extra_in_prefix_1_low_level(self, extra, message_length, message_data):
+        """
+
+        """
+        await self.check_validity()
+
+        extra = int(extra)
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, (extra, message_length, message_data), BrickletStreamTest.CODEC_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL_REQUEST, 0, '')
+
+    async def single_write_extra_in_prefix_2_low_level(self, extra_1, extra_2, message_length, message_data):
+        """
+
+        """
+        await self.check_validity()
+
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, (extra_1, extra_2, message_length, message_data), BrickletStreamTest.CODEC_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL_REQUEST, 0, '')
+
+    async def single_write_extra_in_suffix_1_low_level(self, message_length, message_data, extra):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+        extra = int(extra)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, (message_length, message_data, extra), BrickletStreamTest.CODEC_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL_REQUEST, 0, '')
+
+    async def single_write_extra_in_suffix_2_low_level(self, message_length, message_data, extra_1, extra_2):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, (message_length, message_data, extra_1, extra_2), BrickletStreamTest.CODEC_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL_REQUEST, 0, '')
+
+    async def single_write_extra_in_full_low_level(self, extra_1, message_length, extra_2, message_data, extra_3):
+        """
+
+        """
+        await self.check_validity()
+
+        extra_1 = int(extra_1)
+        message_length = int(message_length)
+        extra_2 = int(extra_2)
+        message_data = create_char_list(message_data)
+        extra_3 = int(extra_3)
+
+        await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_WRITE_EXTRA_IN_FULL_LOW_LEVEL, (extra_1, message_length, extra_2, message_data, extra_3), BrickletStreamTest.CODEC_SINGLE_WRITE_EXTRA_IN_FULL_LOW_LEVEL_REQUEST, 0, '')
+
+    async def single_write_extra_out_1_low_level(self, message_length, message_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+
+        return await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_WRITE_EXTRA_OUT_1_LOW_LEVEL, (message_length, message_data), BrickletStreamTest.CODEC_SINGLE_WRITE_EXTRA_OUT_1_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_SINGLE_WRITE_EXTRA_OUT_1_LOW_LEVEL_RESPONSE)
+
+    async def single_write_extra_out_2_low_level(self, message_length, message_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+
+        return SingleWriteExtraOut2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_WRITE_EXTRA_OUT_2_LOW_LEVEL, (message_length, message_data), BrickletStreamTest.CODEC_SINGLE_WRITE_EXTRA_OUT_2_LOW_LEVEL_REQUEST, 10, BrickletStreamTest.CODEC_SINGLE_WRITE_EXTRA_OUT_2_LOW_LEVEL_RESPONSE))
+
+    async def short_single_write_low_level(self, message_length, message_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+
+        return await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_SINGLE_WRITE_LOW_LEVEL, (message_length, message_data), BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_LOW_LEVEL_RESPONSE)
+
+    async def short_single_write_extra_in_prefix_1_low_level(self, extra, message_length, message_data):
+        """
+
+        """
+        await self.check_validity()
+
+        extra = int(extra)
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+
+        return await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, (extra, message_length, message_data), BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL_RESPONSE)
+
+    async def short_single_write_extra_in_prefix_2_low_level(self, extra_1, extra_2, message_length, message_data):
+        """
+
+        """
+        await self.check_validity()
+
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+
+        return await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, (extra_1, extra_2, message_length, message_data), BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL_RESPONSE)
+
+    async def short_single_write_extra_in_suffix_1_low_level(self, message_length, message_data, extra):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+        extra = int(extra)
+
+        return await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, (message_length, message_data, extra), BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL_RESPONSE)
+
+    async def short_single_write_extra_in_suffix_2_low_level(self, message_length, message_data, extra_1, extra_2):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        return await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, (message_length, message_data, extra_1, extra_2), BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL_RESPONSE)
+
+    async def short_single_write_extra_out_prefix_1_low_level(self, message_length, message_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+
+        return ShortSingleWriteExtraOutPrefix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL, (message_length, message_data), BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL_REQUEST, 10, BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL_RESPONSE))
+
+    async def short_single_write_extra_out_prefix_2_low_level(self, message_length, message_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+
+        return ShortSingleWriteExtraOutPrefix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL, (message_length, message_data), BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL_REQUEST, 11, BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL_RESPONSE))
+
+    async def short_single_write_extra_out_suffix_1_low_level(self, message_length, message_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+
+        return ShortSingleWriteExtraOutSuffix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, (message_length, message_data), BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL_REQUEST, 10, BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL_RESPONSE))
+
+    async def short_single_write_extra_out_suffix_2_low_level(self, message_length, message_data):
+        """
+
+        """
+        await self.check_validity()
+
+        message_length = int(message_length)
+        message_data = create_char_list(message_data)
+
+        return ShortSingleWriteExtraOutSuffix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, (message_length, message_data), BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL_REQUEST, 11, BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL_RESPONSE))
+
+    async def short_single_write_extra_full_low_level(self, extra_1, message_length, extra_2, message_data, extra_3):
+        """
+
+        """
+        await self.check_validity()
+
+        extra_1 = int(extra_1)
+        message_length = int(message_length)
+        extra_2 = int(extra_2)
+        message_data = create_char_list(message_data)
+        extra_3 = int(extra_3)
+
+        return ShortSingleWriteExtraFullLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SHORT_SINGLE_WRITE_EXTRA_FULL_LOW_LEVEL, (extra_1, message_length, extra_2, message_data, extra_3), BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_FULL_LOW_LEVEL_REQUEST, 11, BrickletStreamTest.CODEC_SHORT_SINGLE_WRITE_EXTRA_FULL_LOW_LEVEL_RESPONSE))
+
+    async def normal_read_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return NormalReadLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_NORMAL_READ_LOW_LEVEL_RESPONSE))
+
+    async def normal_read_extra_in_1_low_level(self, extra):
+        """
+
+        """
+        await self.check_validity()
+
+        extra = int(extra)
+
+        return NormalReadExtraIn1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL, (extra,), BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL_REQUEST, 72, BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL_RESPONSE))
+
+    async def normal_read_extra_in_2_low_level(self, extra_1, extra_2):
+        """
+
+        """
+        await self.check_validity()
+
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        return NormalReadExtraIn2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL, (extra_1, extra_2), BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL_REQUEST, 72, BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL_RESPONSE))
+
+    async def normal_read_extra_out_prefix_1_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return NormalReadExtraOutPrefix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL_RESPONSE))
+
+    async def normal_read_extra_out_prefix_2_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return NormalReadExtraOutPrefix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL_RESPONSE))
+
+    async def normal_read_extra_out_suffix_1_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return NormalReadExtraOutSuffix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL_RESPONSE))
+
+    async def normal_read_extra_out_suffix_2_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return NormalReadExtraOutSuffix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL_RESPONSE))
+
+    async def normal_read_extra_out_full_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return NormalReadExtraOutFullLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL_RESPONSE))
+
+    async def fixed_read_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return FixedReadLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_FIXED_READ_LOW_LEVEL_RESPONSE))
+
+    async def fixed_read_extra_in_1_low_level(self, extra):
+        """
+
+        """
+        await self.check_validity()
+
+        extra = int(extra)
+
+        return FixedReadExtraIn1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_IN_1_LOW_LEVEL, (extra,), BrickletStreamTest.CODEC_FIXED_READ_EXTRA_IN_1_LOW_LEVEL_REQUEST, 72, BrickletStreamTest.CODEC_FIXED_READ_EXTRA_IN_1_LOW_LEVEL_RESPONSE))
+
+    async def fixed_read_extra_in_2_low_level(self, extra_1, extra_2):
+        """
+
+        """
+        await self.check_validity()
+
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        return FixedReadExtraIn2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_IN_2_LOW_LEVEL, (extra_1, extra_2), BrickletStreamTest.CODEC_FIXED_READ_EXTRA_IN_2_LOW_LEVEL_REQUEST, 72, BrickletStreamTest.CODEC_FIXED_READ_EXTRA_IN_2_LOW_LEVEL_RESPONSE))
+
+    async def fixed_read_extra_out_prefix_1_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return FixedReadExtraOutPrefix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL_RESPONSE))
+
+    async def fixed_read_extra_out_prefix_2_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return FixedReadExtraOutPrefix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL_RESPONSE))
+
+    async def fixed_read_extra_out_suffix_1_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return FixedReadExtraOutSuffix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL_RESPONSE))
+
+    async def fixed_read_extra_out_suffix_2_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return FixedReadExtraOutSuffix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL_RESPONSE))
+
+    async def fixed_read_extra_out_full_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return FixedReadExtraOutFullLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL_RESPONSE))
+
+    async def single_read_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return SingleReadLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_SINGLE_READ_LOW_LEVEL_RESPONSE))
+
+    async def single_read_extra_in_1_low_level(self, extra):
+        """
+
+        """
+        await self.check_validity()
+
+        extra = int(extra)
+
+        return SingleReadExtraIn1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL, (extra,), BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL_REQUEST, 71, BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL_RESPONSE))
+
+    async def single_read_extra_in_2_low_level(self, extra_1, extra_2):
+        """
+
+        """
+        await self.check_validity()
+
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        return SingleReadExtraIn2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL, (extra_1, extra_2), BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL_REQUEST, 71, BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL_RESPONSE))
+
+    async def single_read_extra_out_prefix_1_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return SingleReadExtraOutPrefix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL_RESPONSE))
+
+    async def single_read_extra_out_prefix_2_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return SingleReadExtraOutPrefix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL_RESPONSE))
+
+    async def single_read_extra_out_suffix_1_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return SingleReadExtraOutSuffix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL_RESPONSE))
+
+    async def single_read_extra_out_suffix_2_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return SingleReadExtraOutSuffix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL_RESPONSE))
+
+    async def single_read_extra_out_full_low_level(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return SingleReadExtraOutFullLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_OUT_FULL_LOW_LEVEL, (), '', 72, BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_OUT_FULL_LOW_LEVEL_RESPONSE))
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_GET_IDENTITY, (), '', 33, BrickletStreamTest.CODEC_GET_IDENTITY_RESPONSE))
+
+    async def normal_write(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 60
+            ret = await self.normal_write_low_level(message_length, message_chunk_offset, message_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 60, '\0')
+                    requests.append((message_length, message_chunk_offset, message_chunk_data))
+                    message_chunk_offset += 60
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_LOW_LEVEL, requests, BrickletStreamTest.CODEC_NORMAL_WRITE_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def normal_write_extra_in_prefix_1(self, extra, message):
+        """
+
+        """
+        extra = int(extra)
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 59
+            ret = await self.normal_write_extra_in_prefix_1_low_level(extra, message_length, message_chunk_offset, message_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 59, '\0')
+                    requests.append((extra, message_length, message_chunk_offset, message_chunk_data))
+                    message_chunk_offset += 59
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, requests, BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def normal_write_extra_in_prefix_2(self, extra_1, extra_2, message):
+        """
+
+        """
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 58
+            ret = await self.normal_write_extra_in_prefix_2_low_level(extra_1, extra_2, message_length, message_chunk_offset, message_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 58, '\0')
+                    requests.append((extra_1, extra_2, message_length, message_chunk_offset, message_chunk_data))
+                    message_chunk_offset += 58
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, requests, BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def normal_write_extra_in_suffix_1(self, message, extra):
+        """
+
+        """
+        message = create_char_list(message)
+        extra = int(extra)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 59
+            ret = await self.normal_write_extra_in_suffix_1_low_level(message_length, message_chunk_offset, message_chunk_data, extra)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 59, '\0')
+                    requests.append((message_length, message_chunk_offset, message_chunk_data, extra))
+                    message_chunk_offset += 59
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, requests, BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def normal_write_extra_in_suffix_2(self, message, extra_1, extra_2):
+        """
+
+        """
+        message = create_char_list(message)
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 58
+            ret = await self.normal_write_extra_in_suffix_2_low_level(message_length, message_chunk_offset, message_chunk_data, extra_1, extra_2)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 58, '\0')
+                    requests.append((message_length, message_chunk_offset, message_chunk_data, extra_1, extra_2))
+                    message_chunk_offset += 58
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, requests, BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def normal_write_extra_in_full(self, extra_1, extra_2, extra_3, message, extra_4):
+        """
+
+        """
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        extra_3 = int(extra_3)
+        message = create_char_list(message)
+        extra_4 = int(extra_4)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 56
+            ret = await self.normal_write_extra_in_full_low_level(extra_1, message_length, extra_2, message_chunk_offset, extra_3, message_chunk_data, extra_4)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 56, '\0')
+                    requests.append((extra_1, message_length, extra_2, message_chunk_offset, extra_3, message_chunk_data, extra_4))
+                    message_chunk_offset += 56
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_IN_FULL_LOW_LEVEL, requests, BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_IN_FULL_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def normal_write_extra_out_1(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 60
+            ret = await self.normal_write_extra_out_1_low_level(message_length, message_chunk_offset, message_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 60, '\0')
+                    requests.append((message_length, message_chunk_offset, message_chunk_data))
+                    message_chunk_offset += 60
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL, requests, BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL_RESPONSE)
+
+        return ret
+
+    async def normal_write_extra_out_2(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 60
+            ret = await self.normal_write_extra_out_2_low_level(message_length, message_chunk_offset, message_chunk_data)
+        else:
+            await self.check_validity()
+
+            async with self.stream_lock:
+                requests = []
+
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 60, '\0')
+                    requests.append((message_length, message_chunk_offset, message_chunk_data))
+                    message_chunk_offset += 60
+
+                ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL, requests, BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL_REQUEST, 10, BrickletStreamTest.CODEC_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL_RESPONSE)
+
+        return NormalWriteExtraOut2(*ret)
+
+    async def fixed_write(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        message_length = 1000
+        message_chunk_offset = 0
+
+        if len(message) != message_length:
+            raise Error(Error.INVALID_PARAMETER, 'Message has to be exactly {0} items long'.format(message_length))
+
+        await self.check_validity()
+
+        async with self.stream_lock:
+            requests = []
+
+            while message_chunk_offset < message_length:
+                message_chunk_data = create_chunk_data(message, message_chunk_offset, 62, '\0')
+                requests.append((message_chunk_offset, message_chunk_data))
+                message_chunk_offset += 62
+
+            ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_LOW_LEVEL, requests, BrickletStreamTest.CODEC_FIXED_WRITE_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def fixed_write_extra_in_prefix_1(self, extra, message):
+        """
+
+        """
+        extra = int(extra)
+        message = create_char_list(message)
+
+        message_length = 1000
+        message_chunk_offset = 0
+
+        if len(message) != message_length:
+            raise Error(Error.INVALID_PARAMETER, 'Message has to be exactly {0} items long'.format(message_length))
+
+        await self.check_validity()
+
+        async with self.stream_lock:
+            requests = []
+
+            while message_chunk_offset < message_length:
+                message_chunk_data = create_chunk_data(message, message_chunk_offset, 61, '\0')
+                requests.append((extra, message_chunk_offset, message_chunk_data))
+                message_chunk_offset += 61
+
+            ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, requests, BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def fixed_write_extra_in_prefix_2(self, extra_1, extra_2, message):
+        """
+
+        """
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        message = create_char_list(message)
+
+        message_length = 1000
+        message_chunk_offset = 0
+
+        if len(message) != message_length:
+            raise Error(Error.INVALID_PARAMETER, 'Message has to be exactly {0} items long'.format(message_length))
+
+        await self.check_validity()
+
+        async with self.stream_lock:
+            requests = []
+
+            while message_chunk_offset < message_length:
+                message_chunk_data = create_chunk_data(message, message_chunk_offset, 60, '\0')
+                requests.append((extra_1, extra_2, message_chunk_offset, message_chunk_data))
+                message_chunk_offset += 60
+
+            ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, requests, BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def fixed_write_extra_in_suffix_1(self, message, extra):
+        """
+
+        """
+        message = create_char_list(message)
+        extra = int(extra)
+
+        message_length = 1000
+        message_chunk_offset = 0
+
+        if len(message) != message_length:
+            raise Error(Error.INVALID_PARAMETER, 'Message has to be exactly {0} items long'.format(message_length))
+
+        await self.check_validity()
+
+        async with self.stream_lock:
+            requests = []
+
+            while message_chunk_offset < message_length:
+                message_chunk_data = create_chunk_data(message, message_chunk_offset, 61, '\0')
+                requests.append((message_chunk_offset, message_chunk_data, extra))
+                message_chunk_offset += 61
+
+            ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, requests, BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def fixed_write_extra_in_suffix_2(self, message, extra_1, extra_2):
+        """
+
+        """
+        message = create_char_list(message)
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        message_length = 1000
+        message_chunk_offset = 0
+
+        if len(message) != message_length:
+            raise Error(Error.INVALID_PARAMETER, 'Message has to be exactly {0} items long'.format(message_length))
+
+        await self.check_validity()
+
+        async with self.stream_lock:
+            requests = []
+
+            while message_chunk_offset < message_length:
+                message_chunk_data = create_chunk_data(message, message_chunk_offset, 60, '\0')
+                requests.append((message_chunk_offset, message_chunk_data, extra_1, extra_2))
+                message_chunk_offset += 60
+
+            ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, requests, BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def fixed_write_extra_in_full(self, extra_1, extra_2, message, extra_3):
+        """
+
+        """
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        message = create_char_list(message)
+        extra_3 = int(extra_3)
+
+        message_length = 1000
+        message_chunk_offset = 0
+
+        if len(message) != message_length:
+            raise Error(Error.INVALID_PARAMETER, 'Message has to be exactly {0} items long'.format(message_length))
+
+        await self.check_validity()
+
+        async with self.stream_lock:
+            requests = []
+
+            while message_chunk_offset < message_length:
+                message_chunk_data = create_chunk_data(message, message_chunk_offset, 59, '\0')
+                requests.append((extra_1, message_chunk_offset, extra_2, message_chunk_data, extra_3))
+                message_chunk_offset += 59
+
+            ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_IN_FULL_LOW_LEVEL, requests, BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_IN_FULL_LOW_LEVEL_REQUEST, 8, '')
+
+        return ret
+
+    async def fixed_write_extra_out_1(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        message_length = 1000
+        message_chunk_offset = 0
+
+        if len(message) != message_length:
+            raise Error(Error.INVALID_PARAMETER, 'Message has to be exactly {0} items long'.format(message_length))
+
+        await self.check_validity()
+
+        async with self.stream_lock:
+            requests = []
+
+            while message_chunk_offset < message_length:
+                message_chunk_data = create_chunk_data(message, message_chunk_offset, 62, '\0')
+                requests.append((message_chunk_offset, message_chunk_data))
+                message_chunk_offset += 62
+
+            ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL, requests, BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL_REQUEST, 9, BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL_RESPONSE)
+
+        return ret
+
+    async def fixed_write_extra_out_2(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        message_length = 1000
+        message_chunk_offset = 0
+
+        if len(message) != message_length:
+            raise Error(Error.INVALID_PARAMETER, 'Message has to be exactly {0} items long'.format(message_length))
+
+        await self.check_validity()
+
+        async with self.stream_lock:
+            requests = []
+
+            while message_chunk_offset < message_length:
+                message_chunk_data = create_chunk_data(message, message_chunk_offset, 62, '\0')
+                requests.append((message_chunk_offset, message_chunk_data))
+                message_chunk_offset += 62
+
+            ret = await self.ipcon.send_stream_requests(self, BrickletStreamTest.FUNCTION_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL, requests, BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL_REQUEST, 10, BrickletStreamTest.CODEC_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL_RESPONSE)
+
+        return FixedWriteExtraOut2(*ret)
+
+    async def short_write(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 60
+            ret = await self.short_write_low_level(message_length, message_chunk_offset, message_chunk_data)
+            message_written = ret
+        else:
+            message_written = 0
+
+            async with self.stream_lock:
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 60, '\0')
+                    ret = await self.short_write_low_level(message_length, message_chunk_offset, message_chunk_data)
+                    message_written += ret
+
+                    if ret < 60:
+                        break # either last chunk or short write
+
+                    message_chunk_offset += 60
+
+        return message_written
+
+    async def short_write_extra_in_prefix_1(self, extra, message):
+        """
+
+        """
+        extra = int(extra)
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 59
+            ret = await self.short_write_extra_in_prefix_1_low_level(extra, message_length, message_chunk_offset, message_chunk_data)
+            message_written = ret
+        else:
+            message_written = 0
+
+            async with self.stream_lock:
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 59, '\0')
+                    ret = await self.short_write_extra_in_prefix_1_low_level(extra, message_length, message_chunk_offset, message_chunk_data)
+                    message_written += ret
+
+                    if ret < 59:
+                        break # either last chunk or short write
+
+                    message_chunk_offset += 59
+
+        return message_written
+
+    async def short_write_extra_in_prefix_2(self, extra_1, extra_2, message):
+        """
+
+        """
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 58
+            ret = await self.short_write_extra_in_prefix_2_low_level(extra_1, extra_2, message_length, message_chunk_offset, message_chunk_data)
+            message_written = ret
+        else:
+            message_written = 0
+
+            async with self.stream_lock:
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 58, '\0')
+                    ret = await self.short_write_extra_in_prefix_2_low_level(extra_1, extra_2, message_length, message_chunk_offset, message_chunk_data)
+                    message_written += ret
+
+                    if ret < 58:
+                        break # either last chunk or short write
+
+                    message_chunk_offset += 58
+
+        return message_written
+
+    async def short_write_extra_in_suffix_1(self, message, extra):
+        """
+
+        """
+        message = create_char_list(message)
+        extra = int(extra)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 59
+            ret = await self.short_write_extra_in_suffix_1_low_level(message_length, message_chunk_offset, message_chunk_data, extra)
+            message_written = ret
+        else:
+            message_written = 0
+
+            async with self.stream_lock:
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 59, '\0')
+                    ret = await self.short_write_extra_in_suffix_1_low_level(message_length, message_chunk_offset, message_chunk_data, extra)
+                    message_written += ret
+
+                    if ret < 59:
+                        break # either last chunk or short write
+
+                    message_chunk_offset += 59
+
+        return message_written
+
+    async def short_write_extra_in_suffix_2(self, message, extra_1, extra_2):
+        """
+
+        """
+        message = create_char_list(message)
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 58
+            ret = await self.short_write_extra_in_suffix_2_low_level(message_length, message_chunk_offset, message_chunk_data, extra_1, extra_2)
+            message_written = ret
+        else:
+            message_written = 0
+
+            async with self.stream_lock:
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 58, '\0')
+                    ret = await self.short_write_extra_in_suffix_2_low_level(message_length, message_chunk_offset, message_chunk_data, extra_1, extra_2)
+                    message_written += ret
+
+                    if ret < 58:
+                        break # either last chunk or short write
+
+                    message_chunk_offset += 58
+
+        return message_written
+
+    async def short_write_extra_out_prefix_1(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 60
+            ret = await self.short_write_extra_out_prefix_1_low_level(message_length, message_chunk_offset, message_chunk_data)
+            message_written = ret.message_chunk_written
+        else:
+            message_written = 0
+
+            async with self.stream_lock:
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 60, '\0')
+                    ret = await self.short_write_extra_out_prefix_1_low_level(message_length, message_chunk_offset, message_chunk_data)
+                    message_written += ret.message_chunk_written
+
+                    if ret.message_chunk_written < 60:
+                        break # either last chunk or short write
+
+                    message_chunk_offset += 60
+
+        return ShortWriteExtraOutPrefix1(ret.extra, message_written)
+
+    async def short_write_extra_out_prefix_2(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 60
+            ret = await self.short_write_extra_out_prefix_2_low_level(message_length, message_chunk_offset, message_chunk_data)
+            message_written = ret.message_chunk_written
+        else:
+            message_written = 0
+
+            async with self.stream_lock:
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 60, '\0')
+                    ret = await self.short_write_extra_out_prefix_2_low_level(message_length, message_chunk_offset, message_chunk_data)
+                    message_written += ret.message_chunk_written
+
+                    if ret.message_chunk_written < 60:
+                        break # either last chunk or short write
+
+                    message_chunk_offset += 60
+
+        return ShortWriteExtraOutPrefix2(ret.extra_1, ret.extra_2, message_written)
+
+    async def short_write_extra_out_suffix_1(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 60
+            ret = await self.short_write_extra_out_suffix_1_low_level(message_length, message_chunk_offset, message_chunk_data)
+            message_written = ret.message_chunk_written
+        else:
+            message_written = 0
+
+            async with self.stream_lock:
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 60, '\0')
+                    ret = await self.short_write_extra_out_suffix_1_low_level(message_length, message_chunk_offset, message_chunk_data)
+                    message_written += ret.message_chunk_written
+
+                    if ret.message_chunk_written < 60:
+                        break # either last chunk or short write
+
+                    message_chunk_offset += 60
+
+        return ShortWriteExtraOutSuffix1(message_written, ret.extra)
+
+    async def short_write_extra_out_suffix_2(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 60
+            ret = await self.short_write_extra_out_suffix_2_low_level(message_length, message_chunk_offset, message_chunk_data)
+            message_written = ret.message_chunk_written
+        else:
+            message_written = 0
+
+            async with self.stream_lock:
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 60, '\0')
+                    ret = await self.short_write_extra_out_suffix_2_low_level(message_length, message_chunk_offset, message_chunk_data)
+                    message_written += ret.message_chunk_written
+
+                    if ret.message_chunk_written < 60:
+                        break # either last chunk or short write
+
+                    message_chunk_offset += 60
+
+        return ShortWriteExtraOutSuffix2(message_written, ret.extra_1, ret.extra_2)
+
+    async def short_write_extra_full(self, extra_1, extra_2, extra_3, message, extra_4):
+        """
+
+        """
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        extra_3 = int(extra_3)
+        message = create_char_list(message)
+        extra_4 = int(extra_4)
+
+        if len(message) > 65535:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 65535 items long')
+
+        message_length = len(message)
+        message_chunk_offset = 0
+
+        if message_length == 0:
+            message_chunk_data = ['\0'] * 56
+            ret = await self.short_write_extra_full_low_level(extra_1, message_length, extra_2, message_chunk_offset, extra_3, message_chunk_data, extra_4)
+            message_written = ret.message_chunk_written
+        else:
+            message_written = 0
+
+            async with self.stream_lock:
+                while message_chunk_offset < message_length:
+                    message_chunk_data = create_chunk_data(message, message_chunk_offset, 56, '\0')
+                    ret = await self.short_write_extra_full_low_level(extra_1, message_length, extra_2, message_chunk_offset, extra_3, message_chunk_data, extra_4)
+                    message_written += ret.message_chunk_written
+
+                    if ret.message_chunk_written < 56:
+                        break # either last chunk or short write
+
+                    message_chunk_offset += 56
+
+        return ShortWriteExtraFull(ret.extra_5, message_written, ret.extra_6)
+
+    async def single_write(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 63:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 63 items long')
+
+        if message_length < 63:
+            message_data += ['\0'] * (63 - message_length)
+
+        return await self.single_write_low_level(message_length, message_data)
+
+    async def single_write_extra_in_prefix_1(self, extra, message):
+        """
+
+        """
+        extra = int(extra)
+        message = create_char_list(message)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 62:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 62 items long')
+
+        if message_length < 62:
+            message_data += ['\0'] * (62 - message_length)
+
+        return await self.single_write_extra_in_prefix_1_low_level(extra, message_length, message_data)
+
+    async def single_write_extra_in_prefix_2(self, extra_1, extra_2, message):
+        """
+
+        """
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        message = create_char_list(message)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 61:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 61 items long')
+
+        if message_length < 61:
+            message_data += ['\0'] * (61 - message_length)
+
+        return await self.single_write_extra_in_prefix_2_low_level(extra_1, extra_2, message_length, message_data)
+
+    async def single_write_extra_in_suffix_1(self, message, extra):
+        """
+
+        """
+        message = create_char_list(message)
+        extra = int(extra)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 62:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 62 items long')
+
+        if message_length < 62:
+            message_data += ['\0'] * (62 - message_length)
+
+        return await self.single_write_extra_in_suffix_1_low_level(message_length, message_data, extra)
+
+    async def single_write_extra_in_suffix_2(self, message, extra_1, extra_2):
+        """
+
+        """
+        message = create_char_list(message)
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 61:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 61 items long')
+
+        if message_length < 61:
+            message_data += ['\0'] * (61 - message_length)
+
+        return await self.single_write_extra_in_suffix_2_low_level(message_length, message_data, extra_1, extra_2)
+
+    async def single_write_extra_in_full(self, extra_1, extra_2, message, extra_3):
+        """
+
+        """
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        message = create_char_list(message)
+        extra_3 = int(extra_3)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 60:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 60 items long')
+
+        if message_length < 60:
+            message_data += ['\0'] * (60 - message_length)
+
+        return await self.single_write_extra_in_full_low_level(extra_1, message_length, extra_2, message_data, extra_3)
+
+    async def single_write_extra_out_1(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 63:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 63 items long')
+
+        if message_length < 63:
+            message_data += ['\0'] * (63 - message_length)
+
+        return await self.single_write_extra_out_1_low_level(message_length, message_data)
+
+    async def single_write_extra_out_2(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 63:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 63 items long')
+
+        if message_length < 63:
+            message_data += ['\0'] * (63 - message_length)
+
+        return SingleWriteExtraOut2(*await self.single_write_extra_out_2_low_level(message_length, message_data))
+
+    async def short_single_write(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 63:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 63 items long')
+
+        if message_length < 63:
+            message_data += ['\0'] * (63 - message_length)
+
+        return await self.short_single_write_low_level(message_length, message_data)
+
+    async def short_single_write_extra_in_prefix_1(self, extra, message):
+        """
+
+        """
+        extra = int(extra)
+        message = create_char_list(message)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 62:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 62 items long')
+
+        if message_length < 62:
+            message_data += ['\0'] * (62 - message_length)
+
+        return await self.short_single_write_extra_in_prefix_1_low_level(extra, message_length, message_data)
+
+    async def short_single_write_extra_in_prefix_2(self, extra_1, extra_2, message):
+        """
+
+        """
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        message = create_char_list(message)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 61:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 61 items long')
+
+        if message_length < 61:
+            message_data += ['\0'] * (61 - message_length)
+
+        return await self.short_single_write_extra_in_prefix_2_low_level(extra_1, extra_2, message_length, message_data)
+
+    async def short_single_write_extra_in_suffix_1(self, message, extra):
+        """
+
+        """
+        message = create_char_list(message)
+        extra = int(extra)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 62:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 62 items long')
+
+        if message_length < 62:
+            message_data += ['\0'] * (62 - message_length)
+
+        return await self.short_single_write_extra_in_suffix_1_low_level(message_length, message_data, extra)
+
+    async def short_single_write_extra_in_suffix_2(self, message, extra_1, extra_2):
+        """
+
+        """
+        message = create_char_list(message)
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 61:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 61 items long')
+
+        if message_length < 61:
+            message_data += ['\0'] * (61 - message_length)
+
+        return await self.short_single_write_extra_in_suffix_2_low_level(message_length, message_data, extra_1, extra_2)
+
+    async def short_single_write_extra_out_prefix_1(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 62:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 62 items long')
+
+        if message_length < 62:
+            message_data += ['\0'] * (62 - message_length)
+
+        return ShortSingleWriteExtraOutPrefix1(*await self.short_single_write_extra_out_prefix_1_low_level(message_length, message_data))
+
+    async def short_single_write_extra_out_prefix_2(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 62:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 62 items long')
+
+        if message_length < 62:
+            message_data += ['\0'] * (62 - message_length)
+
+        return ShortSingleWriteExtraOutPrefix2(*await self.short_single_write_extra_out_prefix_2_low_level(message_length, message_data))
+
+    async def short_single_write_extra_out_suffix_1(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 63:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 63 items long')
+
+        if message_length < 63:
+            message_data += ['\0'] * (63 - message_length)
+
+        return ShortSingleWriteExtraOutSuffix1(*await self.short_single_write_extra_out_suffix_1_low_level(message_length, message_data))
+
+    async def short_single_write_extra_out_suffix_2(self, message):
+        """
+
+        """
+        message = create_char_list(message)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 63:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 63 items long')
+
+        if message_length < 63:
+            message_data += ['\0'] * (63 - message_length)
+
+        return ShortSingleWriteExtraOutSuffix2(*await self.short_single_write_extra_out_suffix_2_low_level(message_length, message_data))
+
+    async def short_single_write_extra_full(self, extra_1, extra_2, message, extra_3):
+        """
+
+        """
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+        message = create_char_list(message)
+        extra_3 = int(extra_3)
+
+        message_length = len(message)
+        message_data = list(message) # make a copy so we can potentially extend it
+
+        if message_length > 60:
+            raise Error(Error.INVALID_PARAMETER, 'Message can be at most 60 items long')
+
+        if message_length < 60:
+            message_data += ['\0'] * (60 - message_length)
+
+        return ShortSingleWriteExtraFull(*await self.short_single_write_extra_full_low_level(extra_1, message_length, extra_2, message_data, extra_3))
+
+    async def normal_read(self):
+        """
+
+        """
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_NORMAL_READ_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = NormalReadLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_LOW_LEVEL, (), '', 72, message_codec))
+            message_length = ret.message_length
+            message_out_of_sync = ret.message_chunk_offset != 0
+            message_data = self.create_stream_reassembler(message_length, 'c')
+            message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = NormalReadLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_LOW_LEVEL, (), '', 72, message_codec))
+                message_length = ret.message_length
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 60 < message_length:
+                    ret = NormalReadLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_LOW_LEVEL, (), '', 72, message_codec))
+                    message_length = ret.message_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return message_data.get_data(message_length)
+
+    async def normal_read_extra_in_1(self, extra):
+        """
+
+        """
+        extra = int(extra)
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = NormalReadExtraIn1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL, (extra,), BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL_REQUEST, 72, message_codec))
+            message_length = ret.message_length
+            message_out_of_sync = ret.message_chunk_offset != 0
+            message_data = self.create_stream_reassembler(message_length, 'c')
+            message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = NormalReadExtraIn1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL, (extra,), BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL_REQUEST, 72, message_codec))
+                message_length = ret.message_length
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 60 < message_length:
+                    ret = NormalReadExtraIn1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL, (extra,), BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL_REQUEST, 72, message_codec))
+                    message_length = ret.message_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return message_data.get_data(message_length)
+
+    async def normal_read_extra_in_2(self, extra_1, extra_2):
+        """
+
+        """
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = NormalReadExtraIn2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL, (extra_1, extra_2), BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL_REQUEST, 72, message_codec))
+            message_length = ret.message_length
+            message_out_of_sync = ret.message_chunk_offset != 0
+            message_data = self.create_stream_reassembler(message_length, 'c')
+            message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = NormalReadExtraIn2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL, (extra_1, extra_2), BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL_REQUEST, 72, message_codec))
+                message_length = ret.message_length
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 60 < message_length:
+                    ret = NormalReadExtraIn2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL, (extra_1, extra_2), BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL_REQUEST, 72, message_codec))
+                    message_length = ret.message_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return message_data.get_data(message_length)
+
+    async def normal_read_extra_out_prefix_1(self):
+        """
+
+        """
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL_RESPONSE, 3)
+
+        async with self.stream_lock:
+            ret = NormalReadExtraOutPrefix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+            message_length = ret.message_length
+            message_out_of_sync = ret.message_chunk_offset != 0
+            message_data = self.create_stream_reassembler(message_length, 'c')
+            message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = NormalReadExtraOutPrefix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+                message_length = ret.message_length
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 59 < message_length:
+                    ret = NormalReadExtraOutPrefix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+                    message_length = ret.message_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return NormalReadExtraOutPrefix1(ret.extra, message_data.get_data(message_length))
+
+    async def normal_read_extra_out_prefix_2(self):
+        """
+
+        """
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL_RESPONSE, 4)
+
+        async with self.stream_lock:
+            ret = NormalReadExtraOutPrefix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+            message_length = ret.message_length
+            message_out_of_sync = ret.message_chunk_offset != 0
+            message_data = self.create_stream_reassembler(message_length, 'c')
+            message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = NormalReadExtraOutPrefix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+                message_length = ret.message_length
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 58 < message_length:
+                    ret = NormalReadExtraOutPrefix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+                    message_length = ret.message_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return NormalReadExtraOutPrefix2(ret.extra_1, ret.extra_2, message_data.get_data(message_length))
+
+    async def normal_read_extra_out_suffix_1(self):
+        """
+
+        """
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = NormalReadExtraOutSuffix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+            message_length = ret.message_length
+            message_out_of_sync = ret.message_chunk_offset != 0
+            message_data = self.create_stream_reassembler(message_length, 'c')
+            message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = NormalReadExtraOutSuffix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+                message_length = ret.message_length
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 59 < message_length:
+                    ret = NormalReadExtraOutSuffix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+                    message_length = ret.message_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return NormalReadExtraOutSuffix1(message_data.get_data(message_length), ret.extra)
+
+    async def normal_read_extra_out_suffix_2(self):
+        """
+
+        """
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = NormalReadExtraOutSuffix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+            message_length = ret.message_length
+            message_out_of_sync = ret.message_chunk_offset != 0
+            message_data = self.create_stream_reassembler(message_length, 'c')
+            message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = NormalReadExtraOutSuffix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+                message_length = ret.message_length
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 58 < message_length:
+                    ret = NormalReadExtraOutSuffix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+                    message_length = ret.message_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return NormalReadExtraOutSuffix2(message_data.get_data(message_length), ret.extra_1, ret.extra_2)
+
+    async def normal_read_extra_out_full(self):
+        """
+
+        """
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL_RESPONSE, 5)
+
+        async with self.stream_lock:
+            ret = NormalReadExtraOutFullLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL, (), '', 72, message_codec))
+            message_length = ret.message_length
+            message_out_of_sync = ret.message_chunk_offset != 0
+            message_data = self.create_stream_reassembler(message_length, 'c')
+            message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = NormalReadExtraOutFullLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL, (), '', 72, message_codec))
+                message_length = ret.message_length
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 56 < message_length:
+                    ret = NormalReadExtraOutFullLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL, (), '', 72, message_codec))
+                    message_length = ret.message_length
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return NormalReadExtraOutFull(ret.extra_1, ret.extra_2, ret.extra_3, message_data.get_data(message_length), ret.extra_4)
+
+    async def fixed_read(self):
+        """
+
+        """
+        message_length = 1000
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_FIXED_READ_LOW_LEVEL_RESPONSE, 1)
+
+        async with self.stream_lock:
+            ret = FixedReadLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_LOW_LEVEL, (), '', 72, message_codec))
+
+            if ret.message_chunk_offset == (1 << 16) - 1: # maximum chunk offset -> stream has no data
+                message_length = 0
+                message_out_of_sync = False
+                message_data = self.create_stream_reassembler(0, 'c')
+            else:
+                message_out_of_sync = ret.message_chunk_offset != 0
+                message_data = self.create_stream_reassembler(message_length, 'c')
+                message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = FixedReadLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_LOW_LEVEL, (), '', 72, message_codec))
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 62 < message_length:
+                    ret = FixedReadLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_LOW_LEVEL, (), '', 72, message_codec))
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return message_data.get_data(message_length)
+
+    async def fixed_read_extra_in_1(self, extra):
+        """
+
+        """
+        extra = int(extra)
+
+        message_length = 1000
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_FIXED_READ_EXTRA_IN_1_LOW_LEVEL_RESPONSE, 1)
+
+        async with self.stream_lock:
+            ret = FixedReadExtraIn1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_IN_1_LOW_LEVEL, (extra,), BrickletStreamTest.CODEC_FIXED_READ_EXTRA_IN_1_LOW_LEVEL_REQUEST, 72, message_codec))
+
+            if ret.message_chunk_offset == (1 << 16) - 1: # maximum chunk offset -> stream has no data
+                message_length = 0
+                message_out_of_sync = False
+                message_data = self.create_stream_reassembler(0, 'c')
+            else:
+                message_out_of_sync = ret.message_chunk_offset != 0
+                message_data = self.create_stream_reassembler(message_length, 'c')
+                message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = FixedReadExtraIn1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_IN_1_LOW_LEVEL, (extra,), BrickletStreamTest.CODEC_FIXED_READ_EXTRA_IN_1_LOW_LEVEL_REQUEST, 72, message_codec))
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 62 < message_length:
+                    ret = FixedReadExtraIn1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_IN_1_LOW_LEVEL, (extra,), BrickletStreamTest.CODEC_FIXED_READ_EXTRA_IN_1_LOW_LEVEL_REQUEST, 72, message_codec))
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return message_data.get_data(message_length)
+
+    async def fixed_read_extra_in_2(self, extra_1, extra_2):
+        """
+
+        """
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        message_length = 1000
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_FIXED_READ_EXTRA_IN_2_LOW_LEVEL_RESPONSE, 1)
+
+        async with self.stream_lock:
+            ret = FixedReadExtraIn2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_IN_2_LOW_LEVEL, (extra_1, extra_2), BrickletStreamTest.CODEC_FIXED_READ_EXTRA_IN_2_LOW_LEVEL_REQUEST, 72, message_codec))
+
+            if ret.message_chunk_offset == (1 << 16) - 1: # maximum chunk offset -> stream has no data
+                message_length = 0
+                message_out_of_sync = False
+                message_data = self.create_stream_reassembler(0, 'c')
+            else:
+                message_out_of_sync = ret.message_chunk_offset != 0
+                message_data = self.create_stream_reassembler(message_length, 'c')
+                message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = FixedReadExtraIn2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_IN_2_LOW_LEVEL, (extra_1, extra_2), BrickletStreamTest.CODEC_FIXED_READ_EXTRA_IN_2_LOW_LEVEL_REQUEST, 72, message_codec))
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 62 < message_length:
+                    ret = FixedReadExtraIn2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_IN_2_LOW_LEVEL, (extra_1, extra_2), BrickletStreamTest.CODEC_FIXED_READ_EXTRA_IN_2_LOW_LEVEL_REQUEST, 72, message_codec))
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return message_data.get_data(message_length)
+
+    async def fixed_read_extra_out_prefix_1(self):
+        """
+
+        """
+        message_length = 1000
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL_RESPONSE, 2)
+
+        async with self.stream_lock:
+            ret = FixedReadExtraOutPrefix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+
+            if ret.message_chunk_offset == (1 << 16) - 1: # maximum chunk offset -> stream has no data
+                message_length = 0
+                message_out_of_sync = False
+                message_data = self.create_stream_reassembler(0, 'c')
+            else:
+                message_out_of_sync = ret.message_chunk_offset != 0
+                message_data = self.create_stream_reassembler(message_length, 'c')
+                message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = FixedReadExtraOutPrefix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 61 < message_length:
+                    ret = FixedReadExtraOutPrefix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return FixedReadExtraOutPrefix1(ret.extra, message_data.get_data(message_length))
+
+    async def fixed_read_extra_out_prefix_2(self):
+        """
+
+        """
+        message_length = 1000
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL_RESPONSE, 3)
+
+        async with self.stream_lock:
+            ret = FixedReadExtraOutPrefix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+
+            if ret.message_chunk_offset == (1 << 16) - 1: # maximum chunk offset -> stream has no data
+                message_length = 0
+                message_out_of_sync = False
+                message_data = self.create_stream_reassembler(0, 'c')
+            else:
+                message_out_of_sync = ret.message_chunk_offset != 0
+                message_data = self.create_stream_reassembler(message_length, 'c')
+                message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = FixedReadExtraOutPrefix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 60 < message_length:
+                    ret = FixedReadExtraOutPrefix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return FixedReadExtraOutPrefix2(ret.extra_1, ret.extra_2, message_data.get_data(message_length))
+
+    async def fixed_read_extra_out_suffix_1(self):
+        """
+
+        """
+        message_length = 1000
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL_RESPONSE, 1)
+
+        async with self.stream_lock:
+            ret = FixedReadExtraOutSuffix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+
+            if ret.message_chunk_offset == (1 << 16) - 1: # maximum chunk offset -> stream has no data
+                message_length = 0
+                message_out_of_sync = False
+                message_data = self.create_stream_reassembler(0, 'c')
+            else:
+                message_out_of_sync = ret.message_chunk_offset != 0
+                message_data = self.create_stream_reassembler(message_length, 'c')
+                message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = FixedReadExtraOutSuffix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 61 < message_length:
+                    ret = FixedReadExtraOutSuffix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return FixedReadExtraOutSuffix1(message_data.get_data(message_length), ret.extra)
+
+    async def fixed_read_extra_out_suffix_2(self):
+        """
+
+        """
+        message_length = 1000
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL_RESPONSE, 1)
+
+        async with self.stream_lock:
+            ret = FixedReadExtraOutSuffix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+
+            if ret.message_chunk_offset == (1 << 16) - 1: # maximum chunk offset -> stream has no data
+                message_length = 0
+                message_out_of_sync = False
+                message_data = self.create_stream_reassembler(0, 'c')
+            else:
+                message_out_of_sync = ret.message_chunk_offset != 0
+                message_data = self.create_stream_reassembler(message_length, 'c')
+                message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = FixedReadExtraOutSuffix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 60 < message_length:
+                    ret = FixedReadExtraOutSuffix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return FixedReadExtraOutSuffix2(message_data.get_data(message_length), ret.extra_1, ret.extra_2)
+
+    async def fixed_read_extra_out_full(self):
+        """
+
+        """
+        message_length = 1000
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL_RESPONSE, 3)
+
+        async with self.stream_lock:
+            ret = FixedReadExtraOutFullLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL, (), '', 72, message_codec))
+
+            if ret.message_chunk_offset == (1 << 16) - 1: # maximum chunk offset -> stream has no data
+                message_length = 0
+                message_out_of_sync = False
+                message_data = self.create_stream_reassembler(0, 'c')
+            else:
+                message_out_of_sync = ret.message_chunk_offset != 0
+                message_data = self.create_stream_reassembler(message_length, 'c')
+                message_data.add_chunk(ret.message_chunk_data)
+
+            while not message_out_of_sync and message_data.offset < message_length:
+                ret = FixedReadExtraOutFullLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL, (), '', 72, message_codec))
+                message_out_of_sync = ret.message_chunk_offset != message_data.offset
+                message_data.add_chunk(ret.message_chunk_data)
+
+            if message_out_of_sync: # discard remaining stream to bring it back in-sync
+                while ret.message_chunk_offset + 59 < message_length:
+                    ret = FixedReadExtraOutFullLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL, (), '', 72, message_codec))
+
+                raise Error(Error.STREAM_OUT_OF_SYNC, 'Message stream is out-of-sync')
+
+        return FixedReadExtraOutFull(ret.extra_1, ret.extra_2, message_data.get_data(message_length), ret.extra_3)
+
+    async def single_read(self):
+        """
+
+        """
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_SINGLE_READ_LOW_LEVEL_RESPONSE, 1)
+        ret = SingleReadLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_LOW_LEVEL, (), '', 72, message_codec))
+
+        return self.create_stream_data(ret.message_data, ret.message_length, 'c')
+
+    async def single_read_extra_in_1(self, extra):
+        """
+
+        """
+        extra = int(extra)
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL_RESPONSE, 1)
+        ret = SingleReadExtraIn1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL, (extra,), BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL_REQUEST, 71, message_codec))
+
+        return self.create_stream_data(ret.message_data, ret.message_length, 'c')
+
+    async def single_read_extra_in_2(self, extra_1, extra_2):
+        """
+
+        """
+        extra_1 = int(extra_1)
+        extra_2 = int(extra_2)
+
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL_RESPONSE, 1)
+        ret = SingleReadExtraIn2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL, (extra_1, extra_2), BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL_REQUEST, 71, message_codec))
+
+        return self.create_stream_data(ret.message_data, ret.message_length, 'c')
+
+    async def single_read_extra_out_prefix_1(self):
+        """
+
+        """
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL_RESPONSE, 2)
+        ret = SingleReadExtraOutPrefix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+
+        return SingleReadExtraOutPrefix1(ret.extra, self.create_stream_data(ret.message_data, ret.message_length, 'c'))
+
+    async def single_read_extra_out_prefix_2(self):
+        """
+
+        """
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL_RESPONSE, 3)
+        ret = SingleReadExtraOutPrefix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+
+        return SingleReadExtraOutPrefix2(ret.extra_1, ret.extra_2, self.create_stream_data(ret.message_data, ret.message_length, 'c'))
+
+    async def single_read_extra_out_suffix_1(self):
+        """
+
+        """
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL_RESPONSE, 1)
+        ret = SingleReadExtraOutSuffix1LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, (), '', 72, message_codec))
+
+        return SingleReadExtraOutSuffix1(self.create_stream_data(ret.message_data, ret.message_length, 'c'), ret.extra)
+
+    async def single_read_extra_out_suffix_2(self):
+        """
+
+        """
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL_RESPONSE, 1)
+        ret = SingleReadExtraOutSuffix2LowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, (), '', 72, message_codec))
+
+        return SingleReadExtraOutSuffix2(self.create_stream_data(ret.message_data, ret.message_length, 'c'), ret.extra_1, ret.extra_2)
+
+    async def single_read_extra_out_full(self):
+        """
+
+        """
+        await self.check_validity()
+
+        message_codec = self.get_stream_codec(BrickletStreamTest.CODEC_SINGLE_READ_EXTRA_OUT_FULL_LOW_LEVEL_RESPONSE, 3)
+        ret = SingleReadExtraOutFullLowLevel(*await self.ipcon.send_request(self, BrickletStreamTest.FUNCTION_SINGLE_READ_EXTRA_OUT_FULL_LOW_LEVEL, (), '', 72, message_codec))
+
+        return SingleReadExtraOutFull(ret.extra_1, ret.extra_2, self.create_stream_data(ret.message_data, ret.message_length, 'c'), ret.extra_3)
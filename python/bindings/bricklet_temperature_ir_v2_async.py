@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_temperature_ir_v2 import BrickletTemperatureIRV2, GetAmbientTemperatureCallbackConfiguration, GetObjectTemperatureCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_temperature_ir_v2 import BrickletTemperatureIRV2, GetAmbientTemperatureCallbackConfiguration, GetObjectTemperatureCallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletTemperatureIRV2Async(AsyncDevice, BrickletTemperatureIRV2):
+    """
+    Measures contactless object temperature between -70°C and +380°C
+
+    asyncio variant of BrickletTemperatureIRV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_ambient_temperature(self):
+        """
+        Returns the ambient temperature of the sensor.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`Ambient Temperature` callback. You can set the callback configuration
+        with :func:`Set Ambient Temperature Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_GET_AMBIENT_TEMPERATURE, (), '', 10, BrickletTemperatureIRV2.CODEC_GET_AMBIENT_TEMPERATURE_RESPONSE)
+
+    async def set_ambient_temperature_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`Ambient Temperature` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`Ambient Temperature` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_SET_AMBIENT_TEMPERATURE_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletTemperatureIRV2.CODEC_SET_AMBIENT_TEMPERATURE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_ambient_temperature_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Ambient Temperature Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetAmbientTemperatureCallbackConfiguration(*await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_GET_AMBIENT_TEMPERATURE_CALLBACK_CONFIGURATION, (), '', 18, BrickletTemperatureIRV2.CODEC_GET_AMBIENT_TEMPERATURE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_object_temperature(self):
+        """
+        Returns the object temperature of the sensor, i.e. the temperature
+        of the surface of the object the sensor is aimed at.
+
+        The temperature of different materials is dependent on their `emissivity
+        <https://en.wikipedia.org/wiki/Emissivity>`__. The emissivity of the material
+        can be set with :func:`Set Emissivity`.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`Object Temperature` callback. You can set the callback configuration
+        with :func:`Set Object Temperature Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_GET_OBJECT_TEMPERATURE, (), '', 10, BrickletTemperatureIRV2.CODEC_GET_OBJECT_TEMPERATURE_RESPONSE)
+
+    async def set_object_temperature_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`Object Temperature` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`Object Temperature` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_SET_OBJECT_TEMPERATURE_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletTemperatureIRV2.CODEC_SET_OBJECT_TEMPERATURE_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_object_temperature_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set Object Temperature Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetObjectTemperatureCallbackConfiguration(*await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_GET_OBJECT_TEMPERATURE_CALLBACK_CONFIGURATION, (), '', 18, BrickletTemperatureIRV2.CODEC_GET_OBJECT_TEMPERATURE_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_emissivity(self, emissivity):
+        """
+        Sets the `emissivity <https://en.wikipedia.org/wiki/Emissivity>`__ that is
+        used to calculate the surface temperature as returned by
+        :func:`Get Object Temperature`.
+
+        The emissivity is usually given as a value between 0.0 and 1.0. A list of
+        emissivities of different materials can be found
+        `here <https://www.infrared-thermography.com/material.htm>`__.
+
+        The parameter of :func:`Set Emissivity` has to be given with a factor of
+        65535 (16-bit). For example: An emissivity of 0.1 can be set with the
+        value 6553, an emissivity of 0.5 with the value 32767 and so on.
+
+        .. note::
+         If you need a precise measurement for the object temperature, it is
+         absolutely crucial that you also provide a precise emissivity.
+
+        The emissivity is stored in non-volatile memory and will still be
+        used after a restart or power cycle of the Bricklet.
+        """
+        await self.check_validity()
+
+        emissivity = int(emissivity)
+
+        await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_SET_EMISSIVITY, (emissivity,), BrickletTemperatureIRV2.CODEC_SET_EMISSIVITY_REQUEST, 0, '')
+
+    async def get_emissivity(self):
+        """
+        Returns the emissivity as set by :func:`Set Emissivity`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_GET_EMISSIVITY, (), '', 10, BrickletTemperatureIRV2.CODEC_GET_EMISSIVITY_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletTemperatureIRV2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletTemperatureIRV2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletTemperatureIRV2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletTemperatureIRV2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletTemperatureIRV2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletTemperatureIRV2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletTemperatureIRV2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletTemperatureIRV2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletTemperatureIRV2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletTemperatureIRV2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_WRITE_UID, (uid,), BrickletTemperatureIRV2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_READ_UID, (), '', 12, BrickletTemperatureIRV2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletTemperatureIRV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletTemperatureIRV2.CODEC_GET_IDENTITY_RESPONSE))
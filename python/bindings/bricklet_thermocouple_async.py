@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_thermocouple import BrickletThermocouple, GetTemperatureCallbackThreshold, GetConfiguration, GetErrorState, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_thermocouple import BrickletThermocouple, GetTemperatureCallbackThreshold, GetConfiguration, GetErrorState, GetIdentity
+
+class BrickletThermocoupleAsync(AsyncDevice, BrickletThermocouple):
+    """
+    Measures temperature with thermocouples
+
+    asyncio variant of BrickletThermocouple for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_temperature(self):
+        """
+        Returns the temperature of the thermocouple.
+
+        If you want to get the temperature periodically, it is recommended
+        to use the :cb:`Temperature` callback and set the period with
+        :func:`Set Temperature Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletThermocouple.FUNCTION_GET_TEMPERATURE, (), '', 12, BrickletThermocouple.CODEC_GET_TEMPERATURE_RESPONSE)
+
+    async def set_temperature_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Temperature` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Temperature` callback is only triggered if the temperature has changed
+        since the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletThermocouple.FUNCTION_SET_TEMPERATURE_CALLBACK_PERIOD, (period,), BrickletThermocouple.CODEC_SET_TEMPERATURE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_temperature_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Temperature Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletThermocouple.FUNCTION_GET_TEMPERATURE_CALLBACK_PERIOD, (), '', 12, BrickletThermocouple.CODEC_GET_TEMPERATURE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_temperature_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Temperature Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the temperature is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the temperature is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the temperature is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the temperature is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletThermocouple.FUNCTION_SET_TEMPERATURE_CALLBACK_THRESHOLD, (option, min, max), BrickletThermocouple.CODEC_SET_TEMPERATURE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_temperature_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Temperature Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetTemperatureCallbackThreshold(*await self.ipcon.send_request(self, BrickletThermocouple.FUNCTION_GET_TEMPERATURE_CALLBACK_THRESHOLD, (), '', 17, BrickletThermocouple.CODEC_GET_TEMPERATURE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callback
+
+        * :cb:`Temperature Reached`
+
+        is triggered, if the threshold
+
+        * :func:`Set Temperature Callback Threshold`
+
+        keeps being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletThermocouple.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletThermocouple.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletThermocouple.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletThermocouple.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def set_configuration(self, averaging, thermocouple_type, filter):
+        """
+        You can configure averaging size, thermocouple type and frequency
+        filtering.
+
+        Available averaging sizes are 1, 2, 4, 8 and 16 samples.
+
+        As thermocouple type you can use B, E, J, K, N, R, S and T. If you have a
+        different thermocouple or a custom thermocouple you can also use
+        G8 and G32. With these types the returned value will not be in °C/100,
+        it will be calculated by the following formulas:
+
+        * G8: ``value = 8 * 1.6 * 2^17 * Vin``
+        * G32: ``value = 32 * 1.6 * 2^17 * Vin``
+
+        where Vin is the thermocouple input voltage.
+
+        The frequency filter can be either configured to 50Hz or to 60Hz. You should
+        configure it according to your utility frequency.
+
+        The conversion time depends on the averaging and filter configuration, it can
+        be calculated as follows:
+
+        * 60Hz: ``time = 82 + (samples - 1) * 16.67``
+        * 50Hz: ``time = 98 + (samples - 1) * 20``
+        """
+        await self.check_validity()
+
+        averaging = int(averaging)
+        thermocouple_type = int(thermocouple_type)
+        filter = int(filter)
+
+        await self.ipcon.send_request(self, BrickletThermocouple.FUNCTION_SET_CONFIGURATION, (averaging, thermocouple_type, filter), BrickletThermocouple.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        return GetConfiguration(*await self.ipcon.send_request(self, BrickletThermocouple.FUNCTION_GET_CONFIGURATION, (), '', 11, BrickletThermocouple.CODEC_GET_CONFIGURATION_RESPONSE))
+
+    async def get_error_state(self):
+        """
+        Returns the current error state. There are two possible errors:
+
+        * Over/Under Voltage and
+        * Open Circuit.
+
+        Over/Under Voltage happens for voltages below 0V or above 3.3V. In this case
+        it is very likely that your thermocouple is defective. An Open Circuit error
+        indicates that there is no thermocouple connected.
+
+        You can use the :cb:`Error State` callback to automatically get triggered
+        when the error state changes.
+        """
+        await self.check_validity()
+
+        return GetErrorState(*await self.ipcon.send_request(self, BrickletThermocouple.FUNCTION_GET_ERROR_STATE, (), '', 10, BrickletThermocouple.CODEC_GET_ERROR_STATE_RESPONSE))
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletThermocouple.FUNCTION_GET_IDENTITY, (), '', 33, BrickletThermocouple.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_tilt import BrickletTilt, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_tilt import BrickletTilt, GetIdentity
+
+class BrickletTiltAsync(AsyncDevice, BrickletTilt):
+    """
+    Detects inclination of Bricklet (tilt switch open/closed)
+
+    asyncio variant of BrickletTilt for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_tilt_state(self):
+        """
+        Returns the current tilt state. The state can either be
+
+        * 0 = Closed: The ball in the tilt switch closes the circuit.
+        * 1 = Open: The ball in the tilt switch does not close the circuit.
+        * 2 = Closed Vibrating: The tilt switch is in motion (rapid change between open and close).
+
+        .. image:: /Images/Bricklets/bricklet_tilt_mechanics.jpg
+           :scale: 100 %
+           :alt: Tilt states
+           :align: center
+           :target: ../../_images/Bricklets/bricklet_tilt_mechanics.jpg
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletTilt.FUNCTION_GET_TILT_STATE, (), '', 9, BrickletTilt.CODEC_GET_TILT_STATE_RESPONSE)
+
+    async def enable_tilt_state_callback(self):
+        """
+        Enables the :cb:`Tilt State` callback.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletTilt.FUNCTION_ENABLE_TILT_STATE_CALLBACK, (), '', 0, '')
+
+    async def disable_tilt_state_callback(self):
+        """
+        Disables the :cb:`Tilt State` callback.
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletTilt.FUNCTION_DISABLE_TILT_STATE_CALLBACK, (), '', 0, '')
+
+    async def is_tilt_state_callback_enabled(self):
+        """
+        Returns *true* if the :cb:`Tilt State` callback is enabled.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletTilt.FUNCTION_IS_TILT_STATE_CALLBACK_ENABLED, (), '', 9, BrickletTilt.CODEC_IS_TILT_STATE_CALLBACK_ENABLED_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletTilt.FUNCTION_GET_IDENTITY, (), '', 33, BrickletTilt.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_uv_light_v2 import BrickletUVLightV2, GetUVACallbackConfiguration, GetUVBCallbackConfiguration, GetUVICallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_uv_light_v2 import BrickletUVLightV2, GetUVACallbackConfiguration, GetUVBCallbackConfiguration, GetUVICallbackConfiguration, GetSPITFPErrorCount, GetIdentity
+
+class BrickletUVLightV2Async(AsyncDevice, BrickletUVLightV2):
+    """
+    Measures UV-A, UV-B and UV index
+
+    asyncio variant of BrickletUVLightV2 for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_uva(self):
+        """
+        Returns the UVA intensity of the sensor.
+        The sensor has not weighted the intensity with the erythemal
+        action spectrum to get the skin-affecting irradiation. Therefore, you cannot
+        just divide the value by 250 to get the UVA index. To get the UV index use
+        :func:`Get UVI`.
+
+        If the sensor is saturated, then -1 is returned, see :func:`Set Configuration`.
+
+        If you want to get the intensity periodically, it is recommended to use the
+        :cb:`UVA` callback and set the period with
+        :func:`Set UVA Callback Configuration`.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`UVA` callback. You can set the callback configuration
+        with :func:`Set UVA Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_GET_UVA, (), '', 12, BrickletUVLightV2.CODEC_GET_UVA_RESPONSE)
+
+    async def set_uva_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`UVA` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`UVA` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_SET_UVA_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletUVLightV2.CODEC_SET_UVA_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_uva_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set UVA Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetUVACallbackConfiguration(*await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_GET_UVA_CALLBACK_CONFIGURATION, (), '', 22, BrickletUVLightV2.CODEC_GET_UVA_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_uvb(self):
+        """
+        Returns the UVB intensity of the sensor.
+        The sensor has not weighted the intensity with the erythemal
+        action spectrum to get the skin-affecting irradiation. Therefore, you cannot
+        just divide the value by 250 to get the UVB index. To get the UV index use
+        :func:`Get UVI`.
+
+        If the sensor is saturated, then -1 is returned, see :func:`Set Configuration`.
+
+        If you want to get the intensity periodically, it is recommended to use the
+        :cb:`UVB` callback and set the period with
+        :func:`Set UVB Callback Configuration`.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`UVB` callback. You can set the callback configuration
+        with :func:`Set UVB Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_GET_UVB, (), '', 12, BrickletUVLightV2.CODEC_GET_UVB_RESPONSE)
+
+    async def set_uvb_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`UVB` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`UVB` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_SET_UVB_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletUVLightV2.CODEC_SET_UVB_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_uvb_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set UVB Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetUVBCallbackConfiguration(*await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_GET_UVB_CALLBACK_CONFIGURATION, (), '', 22, BrickletUVLightV2.CODEC_GET_UVB_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def get_uvi(self):
+        """
+        Returns the UV index of the sensor, the index is given in 1/10.
+
+        If the sensor is saturated, then -1 is returned, see :func:`Set Configuration`.
+
+        If you want to get the intensity periodically, it is recommended to use the
+        :cb:`UVI` callback and set the period with
+        :func:`Set UVI Callback Configuration`.
+
+
+        If you want to get the value periodically, it is recommended to use the
+        :cb:`UVI` callback. You can set the callback configuration
+        with :func:`Set UVI Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_GET_UVI, (), '', 12, BrickletUVLightV2.CODEC_GET_UVI_RESPONSE)
+
+    async def set_uvi_callback_configuration(self, period, value_has_to_change, option, min, max):
+        """
+        The period is the period with which the :cb:`UVI` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        If the `value has to change`-parameter is set to true, the callback is only
+        triggered after the value has changed. If the value didn't change
+        within the period, the callback is triggered immediately on change.
+
+        If it is set to false, the callback is continuously triggered with the period,
+        independent of the value.
+
+        It is furthermore possible to constrain the callback with thresholds.
+
+        The `option`-parameter together with min/max sets a threshold for the :cb:`UVI` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Threshold is turned off"
+         "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+         "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+         "'<'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+         "'>'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+
+        If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+        """
+        await self.check_validity()
+
+        period = int(period)
+        value_has_to_change = bool(value_has_to_change)
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_SET_UVI_CALLBACK_CONFIGURATION, (period, value_has_to_change, option, min, max), BrickletUVLightV2.CODEC_SET_UVI_CALLBACK_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_uvi_callback_configuration(self):
+        """
+        Returns the callback configuration as set by :func:`Set UVI Callback Configuration`.
+        """
+        await self.check_validity()
+
+        return GetUVICallbackConfiguration(*await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_GET_UVI_CALLBACK_CONFIGURATION, (), '', 22, BrickletUVLightV2.CODEC_GET_UVI_CALLBACK_CONFIGURATION_RESPONSE))
+
+    async def set_configuration(self, integration_time):
+        """
+        Sets the configuration of the sensor. The integration time can be configured
+        between 50 and 800 ms. With a shorter integration time the sensor reading updates
+        more often but contains more noise. With a longer integration the sensor reading
+        contains less noise but updates less often.
+
+        With a longer integration time (especially 800 ms) and a higher UV intensity the
+        sensor can be saturated. If this happens the UVA/UVB/UVI readings are all -1.
+        In this case you need to choose a shorter integration time.
+        """
+        await self.check_validity()
+
+        integration_time = int(integration_time)
+
+        await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_SET_CONFIGURATION, (integration_time,), BrickletUVLightV2.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_GET_CONFIGURATION, (), '', 9, BrickletUVLightV2.CODEC_GET_CONFIGURATION_RESPONSE)
+
+    async def get_spitfp_error_count(self):
+        """
+        Returns the error count for the communication between Brick and Bricklet.
+
+        The errors are divided into
+
+        * ACK checksum errors,
+        * message checksum errors,
+        * framing errors and
+        * overflow errors.
+
+        The errors counts are for errors that occur on the Bricklet side. All
+        Bricks have a similar function that returns the errors on the Brick side.
+        """
+        await self.check_validity()
+
+        return GetSPITFPErrorCount(*await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_GET_SPITFP_ERROR_COUNT, (), '', 24, BrickletUVLightV2.CODEC_GET_SPITFP_ERROR_COUNT_RESPONSE))
+
+    async def set_bootloader_mode(self, mode):
+        """
+        Sets the bootloader mode and returns the status after the requested
+        mode change was instigated.
+
+        You can change from bootloader mode to firmware mode and vice versa. A change
+        from bootloader mode to firmware mode will only take place if the entry function,
+        device identifier and CRC are present and correct.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        mode = int(mode)
+
+        return await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_SET_BOOTLOADER_MODE, (mode,), BrickletUVLightV2.CODEC_SET_BOOTLOADER_MODE_REQUEST, 9, BrickletUVLightV2.CODEC_SET_BOOTLOADER_MODE_RESPONSE)
+
+    async def get_bootloader_mode(self):
+        """
+        Returns the current bootloader mode, see :func:`Set Bootloader Mode`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_GET_BOOTLOADER_MODE, (), '', 9, BrickletUVLightV2.CODEC_GET_BOOTLOADER_MODE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        Sets the firmware pointer for :func:`Write Firmware`. The pointer has
+        to be increased by chunks of size 64. The data is written to flash
+        every 4 chunks (which equals to one page of size 256).
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), BrickletUVLightV2.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        Writes 64 Bytes of firmware at the position as written by
+        :func:`Set Write Firmware Pointer` before. The firmware is written
+        to flash every 4 chunks.
+
+        You can only write firmware in bootloader mode.
+
+        This function is used by Brick Viewer during flashing. It should not be
+        necessary to call it in a normal user program.
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_WRITE_FIRMWARE, (data,), BrickletUVLightV2.CODEC_WRITE_FIRMWARE_REQUEST, 9, BrickletUVLightV2.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def set_status_led_config(self, config):
+        """
+        Sets the status LED configuration. By default the LED shows
+        communication traffic between Brick and Bricklet, it flickers once
+        for every 10 received data packets.
+
+        You can also turn the LED permanently on/off or show a heartbeat.
+
+        If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+        """
+        await self.check_validity()
+
+        config = int(config)
+
+        await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_SET_STATUS_LED_CONFIG, (config,), BrickletUVLightV2.CODEC_SET_STATUS_LED_CONFIG_REQUEST, 0, '')
+
+    async def get_status_led_config(self):
+        """
+        Returns the configuration as set by :func:`Set Status LED Config`
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_GET_STATUS_LED_CONFIG, (), '', 9, BrickletUVLightV2.CODEC_GET_STATUS_LED_CONFIG_RESPONSE)
+
+    async def get_chip_temperature(self):
+        """
+        Returns the temperature as measured inside the microcontroller. The
+        value returned is not the ambient temperature!
+
+        The temperature is only proportional to the real temperature and it has bad
+        accuracy. Practically it is only useful as an indicator for
+        temperature changes.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_GET_CHIP_TEMPERATURE, (), '', 10, BrickletUVLightV2.CODEC_GET_CHIP_TEMPERATURE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the Bricklet. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_WRITE_UID, (uid,), BrickletUVLightV2.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_READ_UID, (), '', 12, BrickletUVLightV2.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletUVLightV2.FUNCTION_GET_IDENTITY, (), '', 33, BrickletUVLightV2.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .bricklet_voltage_current import BrickletVoltageCurrent, GetConfiguration, GetCalibration, GetCurrentCallbackThreshold, GetVoltageCallbackThreshold, GetPowerCallbackThreshold, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from bricklet_voltage_current import BrickletVoltageCurrent, GetConfiguration, GetCalibration, GetCurrentCallbackThreshold, GetVoltageCallbackThreshold, GetPowerCallbackThreshold, GetIdentity
+
+class BrickletVoltageCurrentAsync(AsyncDevice, BrickletVoltageCurrent):
+    """
+    Measures power, DC voltage and DC current up to 720W/36V/20A
+
+    asyncio variant of BrickletVoltageCurrent for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_current(self):
+        """
+        Returns the current.
+
+        If you want to get the current periodically, it is recommended to use the
+        :cb:`Current` callback and set the period with
+        :func:`Set Current Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_CURRENT, (), '', 12, BrickletVoltageCurrent.CODEC_GET_CURRENT_RESPONSE)
+
+    async def get_voltage(self):
+        """
+        Returns the voltage.
+
+        If you want to get the voltage periodically, it is recommended to use the
+        :cb:`Voltage` callback and set the period with
+        :func:`Set Voltage Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_VOLTAGE, (), '', 12, BrickletVoltageCurrent.CODEC_GET_VOLTAGE_RESPONSE)
+
+    async def get_power(self):
+        """
+        Returns the power.
+
+        If you want to get the power periodically, it is recommended to use the
+        :cb:`Power` callback and set the period with
+        :func:`Set Power Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_POWER, (), '', 12, BrickletVoltageCurrent.CODEC_GET_POWER_RESPONSE)
+
+    async def set_configuration(self, averaging, voltage_conversion_time, current_conversion_time):
+        """
+        Sets the configuration of the Voltage/Current Bricklet. It is
+        possible to configure number of averages as well as
+        voltage and current conversion time.
+        """
+        await self.check_validity()
+
+        averaging = int(averaging)
+        voltage_conversion_time = int(voltage_conversion_time)
+        current_conversion_time = int(current_conversion_time)
+
+        await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_SET_CONFIGURATION, (averaging, voltage_conversion_time, current_conversion_time), BrickletVoltageCurrent.CODEC_SET_CONFIGURATION_REQUEST, 0, '')
+
+    async def get_configuration(self):
+        """
+        Returns the configuration as set by :func:`Set Configuration`.
+        """
+        await self.check_validity()
+
+        return GetConfiguration(*await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_CONFIGURATION, (), '', 11, BrickletVoltageCurrent.CODEC_GET_CONFIGURATION_RESPONSE))
+
+    async def set_calibration(self, gain_multiplier, gain_divisor):
+        """
+        Since the shunt resistor that is used to measure the current is not
+        perfectly precise, it needs to be calibrated by a multiplier and
+        divisor if a very precise reading is needed.
+
+        For example, if you are expecting a measurement of 1000mA and you
+        are measuring 1023mA, you can calibrate the Voltage/Current Bricklet
+        by setting the multiplier to 1000 and the divisor to 1023.
+        """
+        await self.check_validity()
+
+        gain_multiplier = int(gain_multiplier)
+        gain_divisor = int(gain_divisor)
+
+        await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_SET_CALIBRATION, (gain_multiplier, gain_divisor), BrickletVoltageCurrent.CODEC_SET_CALIBRATION_REQUEST, 0, '')
+
+    async def get_calibration(self):
+        """
+        Returns the calibration as set by :func:`Set Calibration`.
+        """
+        await self.check_validity()
+
+        return GetCalibration(*await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_CALIBRATION, (), '', 12, BrickletVoltageCurrent.CODEC_GET_CALIBRATION_RESPONSE))
+
+    async def set_current_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Current` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Current` callback is only triggered if the current has changed since
+        the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_SET_CURRENT_CALLBACK_PERIOD, (period,), BrickletVoltageCurrent.CODEC_SET_CURRENT_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_current_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Current Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_CURRENT_CALLBACK_PERIOD, (), '', 12, BrickletVoltageCurrent.CODEC_GET_CURRENT_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_voltage_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Voltage` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Voltage` callback is only triggered if the voltage has changed since
+        the last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_SET_VOLTAGE_CALLBACK_PERIOD, (period,), BrickletVoltageCurrent.CODEC_SET_VOLTAGE_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_voltage_callback_period(self):
+        """
+        Returns the period as set by :func:`Set Voltage Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD, (), '', 12, BrickletVoltageCurrent.CODEC_GET_VOLTAGE_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_power_callback_period(self, period):
+        """
+        Sets the period with which the :cb:`Power` callback is triggered
+        periodically. A value of 0 turns the callback off.
+
+        The :cb:`Power` callback is only triggered if the power has changed since the
+        last triggering.
+        """
+        await self.check_validity()
+
+        period = int(period)
+
+        await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_SET_POWER_CALLBACK_PERIOD, (period,), BrickletVoltageCurrent.CODEC_SET_POWER_CALLBACK_PERIOD_REQUEST, 0, '')
+
+    async def get_power_callback_period(self):
+        """
+        Returns the period as set by :func:`Get Power Callback Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_POWER_CALLBACK_PERIOD, (), '', 12, BrickletVoltageCurrent.CODEC_GET_POWER_CALLBACK_PERIOD_RESPONSE)
+
+    async def set_current_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Current Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the current is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the current is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the current is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the current is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_SET_CURRENT_CALLBACK_THRESHOLD, (option, min, max), BrickletVoltageCurrent.CODEC_SET_CURRENT_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_current_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Current Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetCurrentCallbackThreshold(*await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD, (), '', 17, BrickletVoltageCurrent.CODEC_GET_CURRENT_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_voltage_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Voltage Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the voltage is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the voltage is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the voltage is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the voltage is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_SET_VOLTAGE_CALLBACK_THRESHOLD, (option, min, max), BrickletVoltageCurrent.CODEC_SET_VOLTAGE_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_voltage_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Voltage Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetVoltageCallbackThreshold(*await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD, (), '', 17, BrickletVoltageCurrent.CODEC_GET_VOLTAGE_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_power_callback_threshold(self, option, min, max):
+        """
+        Sets the thresholds for the :cb:`Power Reached` callback.
+
+        The following options are possible:
+
+        .. csv-table::
+         :header: "Option", "Description"
+         :widths: 10, 100
+
+         "'x'",    "Callback is turned off"
+         "'o'",    "Callback is triggered when the power is *outside* the min and max values"
+         "'i'",    "Callback is triggered when the power is *inside* the min and max values"
+         "'<'",    "Callback is triggered when the power is smaller than the min value (max is ignored)"
+         "'>'",    "Callback is triggered when the power is greater than the min value (max is ignored)"
+        """
+        await self.check_validity()
+
+        option = create_char(option)
+        min = int(min)
+        max = int(max)
+
+        await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_SET_POWER_CALLBACK_THRESHOLD, (option, min, max), BrickletVoltageCurrent.CODEC_SET_POWER_CALLBACK_THRESHOLD_REQUEST, 0, '')
+
+    async def get_power_callback_threshold(self):
+        """
+        Returns the threshold as set by :func:`Set Power Callback Threshold`.
+        """
+        await self.check_validity()
+
+        return GetPowerCallbackThreshold(*await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_POWER_CALLBACK_THRESHOLD, (), '', 17, BrickletVoltageCurrent.CODEC_GET_POWER_CALLBACK_THRESHOLD_RESPONSE))
+
+    async def set_debounce_period(self, debounce):
+        """
+        Sets the period with which the threshold callbacks
+
+        * :cb:`Current Reached`,
+        * :cb:`Voltage Reached`,
+        * :cb:`Power Reached`
+
+        are triggered, if the thresholds
+
+        * :func:`Set Current Callback Threshold`,
+        * :func:`Set Voltage Callback Threshold`,
+        * :func:`Set Power Callback Threshold`
+
+        keep being reached.
+        """
+        await self.check_validity()
+
+        debounce = int(debounce)
+
+        await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_SET_DEBOUNCE_PERIOD, (debounce,), BrickletVoltageCurrent.CODEC_SET_DEBOUNCE_PERIOD_REQUEST, 0, '')
+
+    async def get_debounce_period(self):
+        """
+        Returns the debounce period as set by :func:`Set Debounce Period`.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_DEBOUNCE_PERIOD, (), '', 12, BrickletVoltageCurrent.CODEC_GET_DEBOUNCE_PERIOD_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Bricklet is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+        A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+        position 'z'.
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, BrickletVoltageCurrent.FUNCTION_GET_IDENTITY, (), '', 33, BrickletVoltageCurrent.CODEC_GET_IDENTITY_RESPONSE))
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+import importlib
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+# device identifier -> (module name, class name, display name). the device
+# modules are imported on first lookup, importing all of them here would make
+# importing this module slow
+DEVICE_MODULES = {
+    11: ('brick_dc', 'BrickDC', 'DC Brick'),
+    111: ('brick_hat', 'BrickHAT', 'HAT Brick'),
+    112: ('brick_hat_zero', 'BrickHATZero', 'HAT Zero Brick'),
+    16: ('brick_imu', 'BrickIMU', 'IMU Brick'),
+    18: ('brick_imu_v2', 'BrickIMUV2', 'IMU Brick 2.0'),
+    13: ('brick_master', 'BrickMaster', 'Master Brick'),
+    17: ('brick_red', 'BrickRED', 'RED Brick'),
+    14: ('brick_servo', 'BrickServo', 'Servo Brick'),
+    19: ('brick_silent_stepper', 'BrickSilentStepper', 'Silent Stepper Brick'),
+    15: ('brick_stepper', 'BrickStepper', 'Stepper Brick'),
+    250: ('bricklet_accelerometer', 'BrickletAccelerometer', 'Accelerometer Bricklet'),
+    2130: ('bricklet_accelerometer_v2', 'BrickletAccelerometerV2', 'Accelerometer Bricklet 2.0'),
+    297: ('bricklet_air_quality', 'BrickletAirQuality', 'Air Quality Bricklet'),
+    21: ('bricklet_ambient_light', 'BrickletAmbientLight', 'Ambient Light Bricklet'),
+    259: ('bricklet_ambient_light_v2', 'BrickletAmbientLightV2', 'Ambient Light Bricklet 2.0'),
+    2131: ('bricklet_ambient_light_v3', 'BrickletAmbientLightV3', 'Ambient Light Bricklet 3.0'),
+    219: ('bricklet_analog_in', 'BrickletAnalogIn', 'Analog In Bricklet'),
+    251: ('bricklet_analog_in_v2', 'BrickletAnalogInV2', 'Analog In Bricklet 2.0'),
+    295: ('bricklet_analog_in_v3', 'BrickletAnalogInV3', 'Analog In Bricklet 3.0'),
+    220: ('bricklet_analog_out', 'BrickletAnalogOut', 'Analog Out Bricklet'),
+    256: ('bricklet_analog_out_v2', 'BrickletAnalogOutV2', 'Analog Out Bricklet 2.0'),
+    2115: ('bricklet_analog_out_v3', 'BrickletAnalogOutV3', 'Analog Out Bricklet 3.0'),
+    221: ('bricklet_barometer', 'BrickletBarometer', 'Barometer Bricklet'),
+    2117: ('bricklet_barometer_v2', 'BrickletBarometerV2', 'Barometer Bricklet 2.0'),
+    270: ('bricklet_can', 'BrickletCAN', 'CAN Bricklet'),
+    2107: ('bricklet_can_v2', 'BrickletCANV2', 'CAN Bricklet 2.0'),
+    262: ('bricklet_co2', 'BrickletCO2', 'CO2 Bricklet'),
+    2147: ('bricklet_co2_v2', 'BrickletCO2V2', 'CO2 Bricklet 2.0'),
+    243: ('bricklet_color', 'BrickletColor', 'Color Bricklet'),
+    2128: ('bricklet_color_v2', 'BrickletColorV2', 'Color Bricklet 2.0'),
+    2153: ('bricklet_compass', 'BrickletCompass', 'Compass Bricklet'),
+    23: ('bricklet_current12', 'BrickletCurrent12', 'Current12 Bricklet'),
+    24: ('bricklet_current25', 'BrickletCurrent25', 'Current25 Bricklet'),
+    2165: ('bricklet_dc_v2', 'BrickletDCV2', 'DC Bricklet 2.0'),
+    25: ('bricklet_distance_ir', 'BrickletDistanceIR', 'Distance IR Bricklet'),
+    2125: ('bricklet_distance_ir_v2', 'BrickletDistanceIRV2', 'Distance IR Bricklet 2.0'),
+    229: ('bricklet_distance_us', 'BrickletDistanceUS', 'Distance US Bricklet'),
+    299: ('bricklet_distance_us_v2', 'BrickletDistanceUSV2', 'Distance US Bricklet 2.0'),
+    285: ('bricklet_dmx', 'BrickletDMX', 'DMX Bricklet'),
+    230: ('bricklet_dual_button', 'BrickletDualButton', 'Dual Button Bricklet'),
+    2119: ('bricklet_dual_button_v2', 'BrickletDualButtonV2', 'Dual Button Bricklet 2.0'),
+    26: ('bricklet_dual_relay', 'BrickletDualRelay', 'Dual Relay Bricklet'),
+    260: ('bricklet_dust_detector', 'BrickletDustDetector', 'Dust Detector Bricklet'),
+    2146: ('bricklet_e_paper_296x128', 'BrickletEPaper296x128', 'E-Paper 296x128 Bricklet'),
+    2152: ('bricklet_energy_monitor', 'BrickletEnergyMonitor', 'Energy Monitor Bricklet'),
+    222: ('bricklet_gps', 'BrickletGPS', 'GPS Bricklet'),
+    276: ('bricklet_gps_v2', 'BrickletGPSV2', 'GPS Bricklet 2.0'),
+    240: ('bricklet_hall_effect', 'BrickletHallEffect', 'Hall Effect Bricklet'),
+    2132: ('bricklet_hall_effect_v2', 'BrickletHallEffectV2', 'Hall Effect Bricklet 2.0'),
+    27: ('bricklet_humidity', 'BrickletHumidity', 'Humidity Bricklet'),
+    283: ('bricklet_humidity_v2', 'BrickletHumidityV2', 'Humidity Bricklet 2.0'),
+    2161: ('bricklet_imu_v3', 'BrickletIMUV3', 'IMU Bricklet 3.0'),
+    258: ('bricklet_industrial_analog_out', 'BrickletIndustrialAnalogOut', 'Industrial Analog Out Bricklet'),
+    2116: ('bricklet_industrial_analog_out_v2', 'BrickletIndustrialAnalogOutV2', 'Industrial Analog Out Bricklet 2.0'),
+    293: ('bricklet_industrial_counter', 'BrickletIndustrialCounter', 'Industrial Counter Bricklet'),
+    223: ('bricklet_industrial_digital_in_4', 'BrickletIndustrialDigitalIn4', 'Industrial Digital In 4 Bricklet'),
+    2100: ('bricklet_industrial_digital_in_4_v2', 'BrickletIndustrialDigitalIn4V2', 'Industrial Digital In 4 Bricklet 2.0'),
+    224: ('bricklet_industrial_digital_out_4', 'BrickletIndustrialDigitalOut4', 'Industrial Digital Out 4 Bricklet'),
+    2124: ('bricklet_industrial_digital_out_4_v2', 'BrickletIndustrialDigitalOut4V2', 'Industrial Digital Out 4 Bricklet 2.0'),
+    228: ('bricklet_industrial_dual_0_20ma', 'BrickletIndustrialDual020mA', 'Industrial Dual 0-20mA Bricklet'),
+    2120: ('bricklet_industrial_dual_0_20ma_v2', 'BrickletIndustrialDual020mAV2', 'Industrial Dual 0-20mA Bricklet 2.0'),
+    2162: ('bricklet_industrial_dual_ac_relay', 'BrickletIndustrialDualACRelay', 'Industrial Dual AC Relay Bricklet'),
+    249: ('bricklet_industrial_dual_analog_in', 'BrickletIndustrialDualAnalogIn', 'Industrial Dual Analog In Bricklet'),
+    2121: ('bricklet_industrial_dual_analog_in_v2', 'BrickletIndustrialDualAnalogInV2', 'Industrial Dual Analog In Bricklet 2.0'),
+    284: ('bricklet_industrial_dual_relay', 'BrickletIndustrialDualRelay', 'Industrial Dual Relay Bricklet'),
+    2164: ('bricklet_industrial_ptc', 'BrickletIndustrialPTC', 'Industrial PTC Bricklet'),
+    225: ('bricklet_industrial_quad_relay', 'BrickletIndustrialQuadRelay', 'Industrial Quad Relay Bricklet'),
+    2102: ('bricklet_industrial_quad_relay_v2', 'BrickletIndustrialQuadRelayV2', 'Industrial Quad Relay Bricklet 2.0'),
+    28: ('bricklet_io16', 'BrickletIO16', 'IO-16 Bricklet'),
+    2114: ('bricklet_io16_v2', 'BrickletIO16V2', 'IO-16 Bricklet 2.0'),
+    29: ('bricklet_io4', 'BrickletIO4', 'IO-4 Bricklet'),
+    2111: ('bricklet_io4_v2', 'BrickletIO4V2', 'IO-4 Bricklet 2.0'),
+    2122: ('bricklet_isolator', 'BrickletIsolator', 'Isolator Bricklet'),
+    210: ('bricklet_joystick', 'BrickletJoystick', 'Joystick Bricklet'),
+    2138: ('bricklet_joystick_v2', 'BrickletJoystickV2', 'Joystick Bricklet 2.0'),
+    255: ('bricklet_laser_range_finder', 'BrickletLaserRangeFinder', 'Laser Range Finder Bricklet'),
+    2144: ('bricklet_laser_range_finder_v2', 'BrickletLaserRangeFinderV2', 'Laser Range Finder Bricklet 2.0'),
+    298: ('bricklet_lcd_128x64', 'BrickletLCD128x64', 'LCD 128x64 Bricklet'),
+    211: ('bricklet_lcd_16x2', 'BrickletLCD16x2', 'LCD 16x2 Bricklet'),
+    212: ('bricklet_lcd_20x4', 'BrickletLCD20x4', 'LCD 20x4 Bricklet'),
+    231: ('bricklet_led_strip', 'BrickletLEDStrip', 'LED Strip Bricklet'),
+    2103: ('bricklet_led_strip_v2', 'BrickletLEDStripV2', 'LED Strip Bricklet 2.0'),
+    241: ('bricklet_line', 'BrickletLine', 'Line Bricklet'),
+    213: ('bricklet_linear_poti', 'BrickletLinearPoti', 'Linear Poti Bricklet'),
+    2139: ('bricklet_linear_poti_v2', 'BrickletLinearPotiV2', 'Linear Poti Bricklet 2.0'),
+    253: ('bricklet_load_cell', 'BrickletLoadCell', 'Load Cell Bricklet'),
+    2104: ('bricklet_load_cell_v2', 'BrickletLoadCellV2', 'Load Cell Bricklet 2.0'),
+    232: ('bricklet_moisture', 'BrickletMoisture', 'Moisture Bricklet'),
+    233: ('bricklet_motion_detector', 'BrickletMotionDetector', 'Motion Detector Bricklet'),
+    292: ('bricklet_motion_detector_v2', 'BrickletMotionDetectorV2', 'Motion Detector Bricklet 2.0'),
+    267: ('bricklet_motorized_linear_poti', 'BrickletMotorizedLinearPoti', 'Motorized Linear Poti Bricklet'),
+    234: ('bricklet_multi_touch', 'BrickletMultiTouch', 'Multi Touch Bricklet'),
+    2129: ('bricklet_multi_touch_v2', 'BrickletMultiTouchV2', 'Multi Touch Bricklet 2.0'),
+    286: ('bricklet_nfc', 'BrickletNFC', 'NFC Bricklet'),
+    246: ('bricklet_nfc_rfid', 'BrickletNFCRFID', 'NFC/RFID Bricklet'),
+    263: ('bricklet_oled_128x64', 'BrickletOLED128x64', 'OLED 128x64 Bricklet'),
+    2112: ('bricklet_oled_128x64_v2', 'BrickletOLED128x64V2', 'OLED 128x64 Bricklet 2.0'),
+    264: ('bricklet_oled_64x48', 'BrickletOLED64x48', 'OLED 64x48 Bricklet'),
+    2123: ('bricklet_one_wire', 'BrickletOneWire', 'One Wire Bricklet'),
+    288: ('bricklet_outdoor_weather', 'BrickletOutdoorWeather', 'Outdoor Weather Bricklet'),
+    2110: ('bricklet_particulate_matter', 'BrickletParticulateMatter', 'Particulate Matter Bricklet'),
+    2156: ('bricklet_performance_dc', 'BrickletPerformanceDC', 'Performance DC Bricklet'),
+    214: ('bricklet_piezo_buzzer', 'BrickletPiezoBuzzer', 'Piezo Buzzer Bricklet'),
+    242: ('bricklet_piezo_speaker', 'BrickletPiezoSpeaker', 'Piezo Speaker Bricklet'),
+    2145: ('bricklet_piezo_speaker_v2', 'BrickletPiezoSpeakerV2', 'Piezo Speaker Bricklet 2.0'),
+    226: ('bricklet_ptc', 'BrickletPTC', 'PTC Bricklet'),
+    2101: ('bricklet_ptc_v2', 'BrickletPTCV2', 'PTC Bricklet 2.0'),
+    268: ('bricklet_real_time_clock', 'BrickletRealTimeClock', 'Real-Time Clock Bricklet'),
+    2106: ('bricklet_real_time_clock_v2', 'BrickletRealTimeClockV2', 'Real-Time Clock Bricklet 2.0'),
+    235: ('bricklet_remote_switch', 'BrickletRemoteSwitch', 'Remote Switch Bricklet'),
+    289: ('bricklet_remote_switch_v2', 'BrickletRemoteSwitchV2', 'Remote Switch Bricklet 2.0'),
+    271: ('bricklet_rgb_led', 'BrickletRGBLED', 'RGB LED Bricklet'),
+    282: ('bricklet_rgb_led_button', 'BrickletRGBLEDButton', 'RGB LED Button Bricklet'),
+    272: ('bricklet_rgb_led_matrix', 'BrickletRGBLEDMatrix', 'RGB LED Matrix Bricklet'),
+    2127: ('bricklet_rgb_led_v2', 'BrickletRGBLEDV2', 'RGB LED Bricklet 2.0'),
+    236: ('bricklet_rotary_encoder', 'BrickletRotaryEncoder', 'Rotary Encoder Bricklet'),
+    294: ('bricklet_rotary_encoder_v2', 'BrickletRotaryEncoderV2', 'Rotary Encoder Bricklet 2.0'),
+    215: ('bricklet_rotary_poti', 'BrickletRotaryPoti', 'Rotary Poti Bricklet'),
+    2140: ('bricklet_rotary_poti_v2', 'BrickletRotaryPotiV2', 'Rotary Poti Bricklet 2.0'),
+    254: ('bricklet_rs232', 'BrickletRS232', 'RS232 Bricklet'),
+    2108: ('bricklet_rs232_v2', 'BrickletRS232V2', 'RS232 Bricklet 2.0'),
+    277: ('bricklet_rs485', 'BrickletRS485', 'RS485 Bricklet'),
+    237: ('bricklet_segment_display_4x7', 'BrickletSegmentDisplay4x7', 'Segment Display 4x7 Bricklet'),
+    2137: ('bricklet_segment_display_4x7_v2', 'BrickletSegmentDisplay4x7V2', 'Segment Display 4x7 Bricklet 2.0'),
+    2157: ('bricklet_servo_v2', 'BrickletServoV2', 'Servo Bricklet 2.0'),
+    2166: ('bricklet_silent_stepper_v2', 'BrickletSilentStepperV2', 'Silent Stepper Bricklet 2.0'),
+    244: ('bricklet_solid_state_relay', 'BrickletSolidStateRelay', 'Solid State Relay Bricklet'),
+    296: ('bricklet_solid_state_relay_v2', 'BrickletSolidStateRelayV2', 'Solid State Relay Bricklet 2.0'),
+    238: ('bricklet_sound_intensity', 'BrickletSoundIntensity', 'Sound Intensity Bricklet'),
+    290: ('bricklet_sound_pressure_level', 'BrickletSoundPressureLevel', 'Sound Pressure Level Bricklet'),
+    216: ('bricklet_temperature', 'BrickletTemperature', 'Temperature Bricklet'),
+    217: ('bricklet_temperature_ir', 'BrickletTemperatureIR', 'Temperature IR Bricklet'),
+    291: ('bricklet_temperature_ir_v2', 'BrickletTemperatureIRV2', 'Temperature IR Bricklet 2.0'),
+    2113: ('bricklet_temperature_v2', 'BrickletTemperatureV2', 'Temperature Bricklet 2.0'),
+    278: ('bricklet_thermal_imaging', 'BrickletThermalImaging', 'Thermal Imaging Bricklet'),
+    266: ('bricklet_thermocouple', 'BrickletThermocouple', 'Thermocouple Bricklet'),
+    2109: ('bricklet_thermocouple_v2', 'BrickletThermocoupleV2', 'Thermocouple Bricklet 2.0'),
+    239: ('bricklet_tilt', 'BrickletTilt', 'Tilt Bricklet'),
+    265: ('bricklet_uv_light', 'BrickletUVLight', 'UV Light Bricklet'),
+    2118: ('bricklet_uv_light_v2', 'BrickletUVLightV2', 'UV Light Bricklet 2.0'),
+    218: ('bricklet_voltage', 'BrickletVoltage', 'Voltage Bricklet'),
+    227: ('bricklet_voltage_current', 'BrickletVoltageCurrent', 'Voltage/Current Bricklet'),
+    2105: ('bricklet_voltage_current_v2', 'BrickletVoltageCurrentV2', 'Voltage/Current Bricklet 2.0'),
+    279: ('bricklet_xmc1400_breakout', 'BrickletXMC1400Breakout', 'XMC1400 Breakout Bricklet')
+}
+
+class DeviceClasses(Mapping):
+    def __init__(self):
+        self.classes = {}
+
+    def __getitem__(self, device_identifier):
+        device_class = self.classes.get(device_identifier)
+
+        if device_class == None:
+            module_name, class_name, _ = DEVICE_MODULES[device_identifier]
+            package = __name__.rpartition('.')[0]
+
+            if len(package) > 0:
+                module = importlib.import_module('.' + module_name, package)
+            else:
+                module = importlib.import_module(module_name)
+
+            device_class = getattr(module, class_name)
+            self.classes[device_identifier] = device_class
+
+        return device_class
+
+    def __iter__(self):
+        return iter(DEVICE_MODULES)
+
+    def __len__(self):
+        return len(DEVICE_MODULES)
+
+DEVICE_CLASSES = DeviceClasses()
+
+def get_device_class(device_identifier):
+    return DEVICE_CLASSES[device_identifier]
+
+def get_device_display_name(device_identifier):
+    return DEVICE_MODULES[device_identifier][2]
+
+def create_device(device_identifier, uid, ipcon):
+    return get_device_class(device_identifier)(uid, ipcon)
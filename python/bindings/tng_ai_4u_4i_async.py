@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+#### __DEVICE_IS_NOT_RELEASED__ ####
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .tng_ai_4u_4i import TNGAI4U4I, GetValues, GetVoltages, GetCurrents, GetSelectedVoltage, GetSelectedCurrent, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from tng_ai_4u_4i import TNGAI4U4I, GetValues, GetVoltages, GetCurrents, GetSelectedVoltage, GetSelectedCurrent, GetIdentity
+
+class TNGAI4U4IAsync(AsyncDevice, TNGAI4U4I):
+    """
+    TBD
+
+    asyncio variant of TNGAI4U4I for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def get_values(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return GetValues(*await self.ipcon.send_request(self, TNGAI4U4I.FUNCTION_GET_VALUES, (), '', 48, TNGAI4U4I.CODEC_GET_VALUES_RESPONSE))
+
+    async def get_voltages(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return GetVoltages(*await self.ipcon.send_request(self, TNGAI4U4I.FUNCTION_GET_VOLTAGES, (), '', 32, TNGAI4U4I.CODEC_GET_VOLTAGES_RESPONSE))
+
+    async def get_currents(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return GetCurrents(*await self.ipcon.send_request(self, TNGAI4U4I.FUNCTION_GET_CURRENTS, (), '', 32, TNGAI4U4I.CODEC_GET_CURRENTS_RESPONSE))
+
+    async def get_selected_voltage(self, channel):
+        """
+
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetSelectedVoltage(*await self.ipcon.send_request(self, TNGAI4U4I.FUNCTION_GET_SELECTED_VOLTAGE, (channel,), TNGAI4U4I.CODEC_GET_SELECTED_VOLTAGE_REQUEST, 20, TNGAI4U4I.CODEC_GET_SELECTED_VOLTAGE_RESPONSE))
+
+    async def get_selected_current(self, channel):
+        """
+
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetSelectedCurrent(*await self.ipcon.send_request(self, TNGAI4U4I.FUNCTION_GET_SELECTED_CURRENT, (channel,), TNGAI4U4I.CODEC_GET_SELECTED_CURRENT_REQUEST, 20, TNGAI4U4I.CODEC_GET_SELECTED_CURRENT_RESPONSE))
+
+    async def get_timestamp(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, TNGAI4U4I.FUNCTION_GET_TIMESTAMP, (), '', 16, TNGAI4U4I.CODEC_GET_TIMESTAMP_RESPONSE)
+
+    async def copy_firmware(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, TNGAI4U4I.FUNCTION_COPY_FIRMWARE, (), '', 9, TNGAI4U4I.CODEC_COPY_FIRMWARE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, TNGAI4U4I.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), TNGAI4U4I.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, TNGAI4U4I.FUNCTION_WRITE_FIRMWARE, (data,), TNGAI4U4I.CODEC_WRITE_FIRMWARE_REQUEST, 9, TNGAI4U4I.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the TNG module. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, TNGAI4U4I.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, TNGAI4U4I.FUNCTION_WRITE_UID, (uid,), TNGAI4U4I.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, TNGAI4U4I.FUNCTION_READ_UID, (), '', 12, TNGAI4U4I.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Brick is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position is the position in the stack from '0' (bottom) to '8' (top).
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, TNGAI4U4I.FUNCTION_GET_IDENTITY, (), '', 33, TNGAI4U4I.CODEC_GET_IDENTITY_RESPONSE))
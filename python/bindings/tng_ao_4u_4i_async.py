@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+#############################################################
+# This file was automatically generated on 2026-10-17.      #
+#                                                           #
+# Python Bindings Version 2.1.29                            #
+#                                                           #
+# If you have a bugfix for this file and want to commit it, #
+# please fix the bug in the generator. You can find a link  #
+# to the generators git repository on tinkerforge.com       #
+#############################################################
+
+#### __DEVICE_IS_NOT_RELEASED__ ####
+
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .tng_ao_4u_4i import TNGAO4U4I, GetValues, GetVoltages, GetCurrents, GetSelectedVoltage, GetSelectedCurrent, GetIdentity
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from tng_ao_4u_4i import TNGAO4U4I, GetValues, GetVoltages, GetCurrents, GetSelectedVoltage, GetSelectedCurrent, GetIdentity
+
+class TNGAO4U4IAsync(AsyncDevice, TNGAO4U4I):
+    """
+    TBD
+
+    asyncio variant of TNGAO4U4I for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    """
+
+    async def set_values(self, timestamp, voltages, currents):
+        """
+
+        """
+        await self.check_validity()
+
+        timestamp = int(timestamp)
+        voltages = list(map(int, voltages))
+        currents = list(map(int, currents))
+
+        await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_SET_VALUES, (timestamp, voltages, currents), TNGAO4U4I.CODEC_SET_VALUES_REQUEST, 0, '')
+
+    async def get_values(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return GetValues(*await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_GET_VALUES, (), '', 48, TNGAO4U4I.CODEC_GET_VALUES_RESPONSE))
+
+    async def set_voltages(self, timestamp, voltages):
+        """
+
+        """
+        await self.check_validity()
+
+        timestamp = int(timestamp)
+        voltages = list(map(int, voltages))
+
+        await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_SET_VOLTAGES, (timestamp, voltages), TNGAO4U4I.CODEC_SET_VOLTAGES_REQUEST, 0, '')
+
+    async def get_voltages(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return GetVoltages(*await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_GET_VOLTAGES, (), '', 32, TNGAO4U4I.CODEC_GET_VOLTAGES_RESPONSE))
+
+    async def set_currents(self, timestamp, currents):
+        """
+
+        """
+        await self.check_validity()
+
+        timestamp = int(timestamp)
+        currents = list(map(int, currents))
+
+        await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_SET_CURRENTS, (timestamp, currents), TNGAO4U4I.CODEC_SET_CURRENTS_REQUEST, 0, '')
+
+    async def get_currents(self):
+        """
+
+        """
+        await self.check_validity()
+
+        return GetCurrents(*await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_GET_CURRENTS, (), '', 32, TNGAO4U4I.CODEC_GET_CURRENTS_RESPONSE))
+
+    async def set_selected_voltage(self, channel, timestamp, voltage):
+        """
+
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        timestamp = int(timestamp)
+        voltage = int(voltage)
+
+        await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_SET_SELECTED_VOLTAGE, (channel, timestamp, voltage), TNGAO4U4I.CODEC_SET_SELECTED_VOLTAGE_REQUEST, 0, '')
+
+    async def get_selected_voltage(self, channel):
+        """
+
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetSelectedVoltage(*await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_GET_SELECTED_VOLTAGE, (channel,), TNGAO4U4I.CODEC_GET_SELECTED_VOLTAGE_REQUEST, 20, TNGAO4U4I.CODEC_GET_SELECTED_VOLTAGE_RESPONSE))
+
+    async def set_selected_current(self, channel, timestamp, current):
+        """
+
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+        timestamp = int(timestamp)
+        current = int(current)
+
+        await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_SET_SELECTED_CURRENT, (channel, timestamp, current), TNGAO4U4I.CODEC_SET_SELECTED_CURRENT_REQUEST, 0, '')
+
+    async def get_selected_current(self, channel):
+        """
+
+        """
+        await self.check_validity()
+
+        channel = int(channel)
+
+        return GetSelectedCurrent(*await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_GET_SELECTED_CURRENT, (channel,), TNGAO4U4I.CODEC_GET_SELECTED_CURRENT_REQUEST, 20, TNGAO4U4I.CODEC_GET_SELECTED_CURRENT_RESPONSE))
+
+    async def get_timestamp(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_GET_TIMESTAMP, (), '', 16, TNGAO4U4I.CODEC_GET_TIMESTAMP_RESPONSE)
+
+    async def copy_firmware(self):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_COPY_FIRMWARE, (), '', 9, TNGAO4U4I.CODEC_COPY_FIRMWARE_RESPONSE)
+
+    async def set_write_firmware_pointer(self, pointer):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        pointer = int(pointer)
+
+        await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_SET_WRITE_FIRMWARE_POINTER, (pointer,), TNGAO4U4I.CODEC_SET_WRITE_FIRMWARE_POINTER_REQUEST, 0, '')
+
+    async def write_firmware(self, data):
+        """
+        TODO
+        """
+        await self.check_validity()
+
+        data = list(map(int, data))
+
+        return await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_WRITE_FIRMWARE, (data,), TNGAO4U4I.CODEC_WRITE_FIRMWARE_REQUEST, 9, TNGAO4U4I.CODEC_WRITE_FIRMWARE_RESPONSE)
+
+    async def reset(self):
+        """
+        Calling this function will reset the TNG module. All configurations
+        will be lost.
+
+        After a reset you have to create new device objects,
+        calling functions on the existing ones will result in
+        undefined behavior!
+        """
+        await self.check_validity()
+
+        await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_RESET, (), '', 0, '')
+
+    async def write_uid(self, uid):
+        """
+        Writes a new UID into flash. If you want to set a new UID
+        you have to decode the Base58 encoded UID string into an
+        integer first.
+
+        We recommend that you use Brick Viewer to change the UID.
+        """
+        await self.check_validity()
+
+        uid = int(uid)
+
+        await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_WRITE_UID, (uid,), TNGAO4U4I.CODEC_WRITE_UID_REQUEST, 0, '')
+
+    async def read_uid(self):
+        """
+        Returns the current UID as an integer. Encode as
+        Base58 to get the usual string version.
+        """
+        await self.check_validity()
+
+        return await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_READ_UID, (), '', 12, TNGAO4U4I.CODEC_READ_UID_RESPONSE)
+
+    async def get_identity(self):
+        """
+        Returns the UID, the UID where the Brick is connected to,
+        the position, the hardware and firmware version as well as the
+        device identifier.
+
+        The position is the position in the stack from '0' (bottom) to '8' (top).
+
+        The device identifier numbers can be found :ref:`here <device_identifier>`.
+        |device_identifier_constant|
+        """
+        return GetIdentity(*await self.ipcon.send_request(self, TNGAO4U4I.FUNCTION_GET_IDENTITY, (), '', 33, TNGAO4U4I.CODEC_GET_IDENTITY_RESPONSE))
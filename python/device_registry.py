@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Matthias Bolte <matthias@tinkerforge.com>
+#
+# Redistribution and use in source and binary forms of this file,
+# with or without modification, are permitted. See the Creative
+# Commons Zero (CC0 1.0) License for more details.
+
+import os
+import json
+import threading
+
+try:
+    from .ip_connection import IPConnection
+except (ValueError, ImportError):
+    from ip_connection import IPConnection
+
+class DeviceRegistry(object):
+    SNAPSHOT_VERSION = 1 # internal
+
+    class Entry(object):
+        def __init__(self, uid, connected_uid, position, hardware_version,
+                     firmware_version, device_identifier, endpoint):
+            self.uid = uid
+            self.connected_uid = connected_uid
+            self.position = position
+            self.hardware_version = hardware_version
+            self.firmware_version = firmware_version
+            self.device_identifier = device_identifier
+            self.endpoint = endpoint # (host, port) of the Brick Daemon or WIFI/Ethernet Extension
+            self.device = None # created on first get_device call
+            self.from_snapshot = False # not confirmed by an enumerate callback yet
+
+        def to_dict(self):
+            return {'uid': self.uid,
+                    'connected_uid': self.connected_uid,
+                    'position': self.position,
+                    'hardware_version': list(self.hardware_version),
+                    'firmware_version': list(self.firmware_version),
+                    'device_identifier': self.device_identifier,
+                    'endpoint': list(self.endpoint) if self.endpoint is not None else None}
+
+        @staticmethod
+        def from_dict(data):
+            return DeviceRegistry.Entry(data['uid'],
+                                        data['connected_uid'],
+                                        data['position'],
+                                        tuple(data['hardware_version']),
+                                        tuple(data['firmware_version']),
+                                        data['device_identifier'],
+                                        tuple(data['endpoint']) if data['endpoint'] is not None else None)
+
+    def __init__(self, ipcon, snapshot_filename=None, create_device=None):
+        """
+        Creates a registry of the devices reachable through the given IP
+        Connection or IP Connection Pool *ipcon*. The registry is updated by
+        the enumerate callbacks of *ipcon* and indexes the devices by UID,
+        device identifier, topology and endpoint. Device objects are created
+        on first use via the device factory. A different factory function
+        with the same signature as create_device of the device factory can be
+        given as *create_device*.
+
+        The registry follows the enumerate callbacks as enumerate listener of
+        *ipcon*, an enumerate callback registered with *ipcon* stays
+        untouched and can be registered at any time.
+
+        If *snapshot_filename* is given and the file exists, the registry is
+        warm-started from the snapshot written by save_snapshot. The entries
+        of the snapshot are replaced by the next enumerate callbacks.
+        """
+
+        self.ipcon = ipcon
+        self.snapshot_filename = snapshot_filename
+        self.lock = threading.Lock()
+        self.entries = {} # uid -> Entry, protected by lock
+        self.uids_by_device_identifier = {} # device identifier -> set of uids, protected by lock
+        self.uids_by_connected_uid = {} # connected uid -> set of uids, protected by lock
+        self.uids_by_endpoint = {} # (host, port) -> set of uids, protected by lock
+
+        if create_device is None:
+            try:
+                from .device_factory import create_device
+            except (ValueError, ImportError):
+                from device_factory import create_device
+
+        self.create_device = create_device
+
+        if snapshot_filename is not None and os.path.exists(snapshot_filename):
+            self.load_snapshot(snapshot_filename)
+
+        ipcon.add_enumerate_listener(self.handle_enumerate)
+
+    def close(self):
+        """
+        Stops following the enumerate callbacks of the IP Connection. The
+        entries of the registry are kept.
+        """
+
+        self.ipcon.remove_enumerate_listener(self.handle_enumerate)
+
+    def handle_enumerate(self, uid, connected_uid, position, hardware_version,
+                         firmware_version, device_identifier, enumeration_type):
+        """
+        Updates the registry with the values of an enumerate callback. This
+        is added as enumerate listener of the IP Connection and only needs to
+        be called directly if the registry is fed manually.
+        """
+
+        if enumeration_type == IPConnection.ENUMERATION_TYPE_DISCONNECTED:
+            with self.lock:
+                self.remove_entry(uid)
+        else:
+            entry = DeviceRegistry.Entry(uid, connected_uid, position, tuple(hardware_version),
+                                         tuple(firmware_version), device_identifier,
+                                         self.get_endpoint_of_uid(uid))
+
+            with self.lock:
+                previous = self.entries.get(uid)
+
+                # keep the device object, if the device didn't change
+                if previous is not None and previous.device_identifier == device_identifier:
+                    entry.device = previous.device
+
+                self.remove_entry(uid)
+                self.add_entry(entry)
+
+    def get_entry(self, uid):
+        """
+        Returns the registry entry of the device with the given *uid*, or
+        *None* if the device is not known. An entry has the attributes uid,
+        connected_uid, position, hardware_version, firmware_version,
+        device_identifier and endpoint as (host, port) tuple.
+        """
+
+        with self.lock:
+            return self.entries.get(uid)
+
+    def get_entries(self, device_identifier=None, endpoint=None):
+        """
+        Returns the list of registry entries, sorted by UID. If given, only
+        entries with the given *device_identifier* and reachable through the
+        given *endpoint* (host, port) are returned.
+        """
+
+        with self.lock:
+            uids = None
+
+            if device_identifier is not None:
+                uids = self.uids_by_device_identifier.get(device_identifier, set())
+
+            if endpoint is not None:
+                endpoint_uids = self.uids_by_endpoint.get(tuple(endpoint), set())
+                uids = endpoint_uids if uids is None else uids & endpoint_uids
+
+            if uids is None:
+                uids = self.entries.keys()
+
+            return [self.entries[uid] for uid in sorted(uids)]
+
+    def get_children(self, uid):
+        """
+        Returns the list of registry entries of the devices connected to the
+        device with the given *uid*, sorted by their position.
+        """
+
+        with self.lock:
+            return sorted([self.entries[child_uid] for child_uid in self.uids_by_connected_uid.get(uid, ())],
+                          key=lambda entry: (entry.position, entry.uid))
+
+    def get_parent(self, uid):
+        """
+        Returns the registry entry of the device that the device with the
+        given *uid* is connected to, or *None* if it is not known.
+        """
+
+        with self.lock:
+            entry = self.entries.get(uid)
+
+            if entry is None:
+                return None
+
+            return self.entries.get(entry.connected_uid)
+
+    def get_roots(self):
+        """
+        Returns the list of registry entries of the devices that are not
+        connected to another known device, sorted by UID. These are the roots
+        of the topology trees that can be walked with get_children.
+        """
+
+        with self.lock:
+            return [self.entries[uid] for uid in sorted(self.entries)
+                    if self.entries[uid].connected_uid not in self.entries]
+
+    def get_device(self, uid):
+        """
+        Returns the device object for the device with the given *uid*. The
+        object is created via the device factory on the first call and
+        reused afterwards. Raises a KeyError if the device is not known.
+        """
+
+        with self.lock:
+            entry = self.entries[uid]
+
+            if entry.device is None:
+                entry.device = self.create_device(entry.device_identifier, uid, self.ipcon)
+
+            return entry.device
+
+    def save_snapshot(self, filename=None):
+        """
+        Writes the current registry entries to the given file, or to the
+        snapshot file given to the constructor, so that a later registry can
+        be warm-started from it.
+        """
+
+        if filename is None:
+            filename = self.snapshot_filename
+
+        with self.lock:
+            snapshot = {'version': DeviceRegistry.SNAPSHOT_VERSION,
+                        'entries': [self.entries[uid].to_dict() for uid in sorted(self.entries)]}
+
+        tmp_filename = filename + '.tmp'
+
+        with open(tmp_filename, 'w') as f:
+            json.dump(snapshot, f)
+
+        # replace atomically, so that a crash doesn't leave a broken snapshot
+        getattr(os, 'replace', os.rename)(tmp_filename, filename)
+
+    def load_snapshot(self, filename):
+        """
+        Adds the entries of the given snapshot file written by save_snapshot
+        to the registry. Entries that are already known from enumerate
+        callbacks are kept.
+        """
+
+        with open(filename, 'r') as f:
+            snapshot = json.load(f)
+
+        if snapshot.get('version') != DeviceRegistry.SNAPSHOT_VERSION:
+            raise ValueError('Unsupported snapshot version {0}'.format(snapshot.get('version')))
+
+        with self.lock:
+            for data in snapshot['entries']:
+                entry = DeviceRegistry.Entry.from_dict(data)
+                entry.from_snapshot = True
+
+                if entry.uid not in self.entries:
+                    self.add_entry(entry)
+
+    # internal
+    def get_endpoint_of_uid(self, uid):
+        ipcon = self.ipcon
+
+        # an IP Connection Pool knows the endpoint of each device
+        if hasattr(ipcon, 'get_endpoint'):
+            ipcon = ipcon.get_endpoint(uid)
+
+            if ipcon is None:
+                return None
+
+        return (ipcon.host, ipcon.port)
+
+    # internal
+    def add_entry(self, entry):
+        # NOTE: assumes that lock is locked
+
+        self.entries[entry.uid] = entry
+        self.uids_by_device_identifier.setdefault(entry.device_identifier, set()).add(entry.uid)
+        self.uids_by_connected_uid.setdefault(entry.connected_uid, set()).add(entry.uid)
+
+        if entry.endpoint is not None:
+            self.uids_by_endpoint.setdefault(entry.endpoint, set()).add(entry.uid)
+
+    # internal
+    def remove_entry(self, uid):
+        # NOTE: assumes that lock is locked
+
+        entry = self.entries.pop(uid, None)
+
+        if entry is None:
+            return
+
+        for index, key in [(self.uids_by_device_identifier, entry.device_identifier),
+                           (self.uids_by_connected_uid, entry.connected_uid),
+                           (self.uids_by_endpoint, entry.endpoint)]:
+            uids = index.get(key)
+
+            if uids is not None:
+                uids.discard(uid)
+
+                if len(uids) == 0:
+                    del index[key]
@@ -60,9 +60,9 @@ class PythonBindingsDevice(python_common.PythonDevice):
 from collections import namedtuple
 
 try:
-    from .ip_connection import Device, IPConnection, Error, create_char, create_char_list, create_string, create_chunk_data
+    from .ip_connection import Device, IPConnection, Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list, get_payload_codec
 except ValueError:
-    from ip_connection import Device, IPConnection, Error, create_char, create_char_list, create_string, create_chunk_data
+    from ip_connection import Device, IPConnection, Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list, get_payload_codec
 
 """
 
@@ -74,10 +74,8 @@ except ValueError:
         return template.format(self.get_generator().get_header_comment('hash'),
                                released)
 
-    def get_python_namedtuples(self):
-        tuples = ''
-        template = """{0} = namedtuple('{1}', [{2}])
-"""
+    def get_python_namedtuple_definitions(self):
+        definitions = [] # [(name, tuple name, params)]
 
         for packet in self.get_packets('function'):
             if len(packet.get_elements(direction='out')) < 2:
@@ -95,7 +93,7 @@ except ValueError:
             for element in packet.get_elements(direction='out'):
                 params.append("'{0}'".format(element.get_name().under))
 
-            tuples += template.format(name.camel, name_tup, ", ".join(params))
+            definitions.append((name.camel, name_tup, params))
 
         for packet in self.get_packets('function'):
             if not packet.has_high_level():
@@ -116,7 +114,17 @@ except ValueError:
             for element in packet.get_elements(direction='out', high_level=True):
                 params.append("'{0}'".format(element.get_name().under))
 
-            tuples += template.format(name.camel, name_tup, ", ".join(params))
+            definitions.append((name.camel, name_tup, params))
+
+        return definitions
+
+    def get_python_namedtuples(self):
+        tuples = ''
+        template = """{0} = namedtuple('{1}', [{2}])
+"""
+
+        for name, name_tup, params in self.get_python_namedtuple_definitions():
+            tuples += template.format(name, name_tup, ", ".join(params))
 
         return tuples
 
@@ -172,44 +180,46 @@ class {0}(Device):
 
         return '\n' + self.get_formatted_constants(constant_format)
 
-    def get_python_init_method(self):
-        template = """
-    def __init__(self, uid, ipcon):
-        \"\"\"
-        Creates an object with the unique device ID *uid* and adds it to
-        the IP Connection *ipcon*.
-        \"\"\"
-        Device.__init__(self, uid, ipcon, {0}.DEVICE_IDENTIFIER, {0}.DEVICE_DISPLAY_NAME)
-
-        self.api_version = ({1}, {2}, {3})
-
-"""
-        response_expected = ''
+    def get_python_payload_codecs(self):
+        codecs = ''
+        template = "    CODEC_{0}_{1} = get_payload_codec('{2}') # internal\n"
 
         for packet in self.get_packets('function'):
-            response_expected += '        self.response_expected[{0}.FUNCTION_{1}] = {0}.RESPONSE_EXPECTED_{2}\n' \
-                                 .format(self.get_python_class_name(), packet.get_name().upper,
-                                         packet.get_response_expected().upper())
+            in_f = packet.get_python_format_list('in')
+            out_f = packet.get_python_format_list('out')
 
-        return template.format(self.get_python_class_name(), *self.get_api_version()) + common.wrap_non_empty('', response_expected, '\n')
+            if len(in_f) > 0:
+                codecs += template.format(packet.get_name().upper, 'REQUEST', in_f)
 
-    def get_python_callback_formats(self):
-        callback_formats = ''
-        template = "        self.callback_formats[{0}.CALLBACK_{1}] = ({2}, '{3}')\n"
+            if len(out_f) > 0:
+                codecs += template.format(packet.get_name().upper, 'RESPONSE', out_f)
 
         for packet in self.get_packets('callback'):
-            callback_formats += template.format(self.get_python_class_name(),
-                                                packet.get_name().upper,
-                                                packet.get_response_size(),
-                                                packet.get_python_format_list('out'))
+            codecs += template.format('CALLBACK', packet.get_name().upper, packet.get_python_format_list('out'))
 
-        return callback_formats + '\n'
+        return common.wrap_non_empty('\n', codecs, '')
 
-    def get_python_high_level_callbacks(self):
+    def get_python_tables(self):
+        response_expected = ''
+        callback_formats = ''
         high_level_callbacks = ''
-        template = "        self.high_level_callbacks[{0}.CALLBACK_{1}] = [{4}, {{'fixed_length': {2}, 'single_chunk': {3}}}, None]\n"
+        stable_functions = ''
+        side_effect_free_functions = ''
+
+        for packet in self.get_packets('function'):
+            response_expected += '        FUNCTION_{0}: Device.RESPONSE_EXPECTED_{1},\n' \
+                                 .format(packet.get_name().upper, packet.get_response_expected().upper())
+
+            if packet.is_stable():
+                stable_functions += 'FUNCTION_{0}, '.format(packet.get_name().upper)
+
+            if packet.is_side_effect_free():
+                side_effect_free_functions += 'FUNCTION_{0}, '.format(packet.get_name().upper)
 
         for packet in self.get_packets('callback'):
+            callback_formats += '        CALLBACK_{0}: ({1}, CODEC_CALLBACK_{0}),\n' \
+                                .format(packet.get_name().upper, packet.get_response_size())
+
             stream = packet.get_high_level('stream_*')
 
             if stream != None:
@@ -218,38 +228,77 @@ class {0}(Device):
                 for element in packet.get_elements(direction='out'):
                     roles.append(element.get_role())
 
-                high_level_callbacks += template.format(self.get_python_class_name(),
-                                                        packet.get_name(skip=-2).upper,
-                                                        stream.get_fixed_length(),
-                                                        stream.has_single_chunk(),
-                                                        repr(tuple(roles)))
+                high_level_callbacks += "        CALLBACK_{0}: ({1}, {{'fixed_length': {2}, 'single_chunk': {3}, 'item_format': '{4}'}}),\n" \
+                                        .format(packet.get_name(skip=-2).upper,
+                                                repr(tuple(roles)),
+                                                stream.get_fixed_length(),
+                                                stream.has_single_chunk(),
+                                                python_common.PythonElement.python_struct_formats[stream.get_data_element().get_type()])
+
+        template = """
+    # internal, shared by all instances
+    RESPONSE_EXPECTED = Device.create_response_expected({{
+{0}    }})
+    CALLBACK_FORMATS = {{{1}}}
+    HIGH_LEVEL_CALLBACKS = {{{2}}}
+    STABLE_FUNCTIONS = frozenset([{3}])
+    SIDE_EFFECT_FREE_FUNCTIONS = frozenset([{4}])
+
+    __slots__ = ()
+"""
+
+        return template.format(response_expected,
+                               common.wrap_non_empty('\n', callback_formats, '    '),
+                               common.wrap_non_empty('\n', high_level_callbacks, '    '),
+                               stable_functions.rstrip(', '),
+                               side_effect_free_functions.rstrip(', '))
+
+    def get_python_init_method(self):
+        template = """
+    def __init__(self, uid, ipcon):
+        \"\"\"
+        Creates an object with the unique device ID *uid* and adds it to
+        the IP Connection *ipcon*.
+        \"\"\"
+        Device.__init__(self, uid, ipcon, {0}.DEVICE_IDENTIFIER, {0}.DEVICE_DISPLAY_NAME)
+
+        self.api_version = ({1}, {2}, {3})
+
+"""
 
-        return high_level_callbacks
+        return template.format(self.get_python_class_name(), *self.get_api_version())
 
     def get_python_add_device(self):
         return '        ipcon.add_device(self)\n'
 
-    def get_python_methods(self):
+    def get_python_methods(self, asynchronous=False):
+        # the asyncio variant has the same methods, but as coroutines that
+        # await every request
+        if asynchronous:
+            tokens = {'def_': 'async def', 'await_': 'await ', 'async_': 'async '}
+        else:
+            tokens = {'def_': 'def', 'await_': '', 'async_': ''}
+
         m_tup = """
-    def {0}(self{8}{4}):
+    {def_} {0}(self{8}{4}):
         \"\"\"
         {10}
         \"\"\"{11}{12}
-        return {1}(*self.ipcon.send_request(self, {2}.FUNCTION_{3}, ({4}{9}), '{5}', {6}, '{7}'))
+        return {1}(*{await_}self.ipcon.send_request(self, {2}.FUNCTION_{3}, ({4}{9}), {5}, {6}, {7}))
 """
         m_ret = """
-    def {0}(self{7}{3}):
+    {def_} {0}(self{7}{3}):
         \"\"\"
         {9}
         \"\"\"{10}{11}
-        return self.ipcon.send_request(self, {1}.FUNCTION_{2}, ({3}{8}), '{4}', {5}, '{6}')
+        return {await_}self.ipcon.send_request(self, {1}.FUNCTION_{2}, ({3}{8}), {4}, {5}, {6})
 """
         m_nor = """
-    def {0}(self{5}{3}):
+    {def_} {0}(self{5}{3}):
         \"\"\"
         {7}
         \"\"\"{8}{9}
-        self.ipcon.send_request(self, {1}.FUNCTION_{2}, ({3}{6}), '{4}', 0, '')
+        {await_}self.ipcon.send_request(self, {1}.FUNCTION_{2}, ({3}{6}), {4}, 0, '')
 """
         methods = ''
         cls = self.get_python_class_name()
@@ -270,28 +319,36 @@ class {0}(Device):
                 if not ',' in par:
                     ct = ','
 
-            in_f = packet.get_python_format_list('in')
+            if len(packet.get_python_format_list('in')) > 0:
+                in_f = '{0}.CODEC_{1}_REQUEST'.format(cls, nh)
+            else:
+                in_f = "''"
+
             out_l = packet.get_response_size()
-            out_f = packet.get_python_format_list('out')
+
+            if len(packet.get_python_format_list('out')) > 0:
+                out_f = '{0}.CODEC_{1}_RESPONSE'.format(cls, nh)
+            else:
+                out_f = "''"
 
             if packet.get_function_id() == 255: # <device>.get_identity
                 check = ''
             else:
-                check = '\n        self.check_validity()\n'
+                check = '\n        {0}self.check_validity()\n'.format(tokens['await_'])
 
             coercions = common.wrap_non_empty('\n        ', packet.get_python_parameter_coercions(), '\n')
             out_c = len(packet.get_elements(direction='out'))
 
             if out_c > 1:
-                methods += m_tup.format(ns, nb, cls, nh, par, in_f, out_l, out_f, cp, ct, doc, check, coercions)
+                methods += m_tup.format(ns, nb, cls, nh, par, in_f, out_l, out_f, cp, ct, doc, check, coercions, **tokens)
             elif out_c == 1:
-                methods += m_ret.format(ns, cls, nh, par, in_f, out_l, out_f, cp, ct, doc, check, coercions)
+                methods += m_ret.format(ns, cls, nh, par, in_f, out_l, out_f, cp, ct, doc, check, coercions, **tokens)
             else:
-                methods += m_nor.format(ns, cls, nh, par, in_f, cp, ct, doc, check, coercions)
+                methods += m_nor.format(ns, cls, nh, par, in_f, cp, ct, doc, check, coercions, **tokens)
 
         # high-level
         template_stream_in = """
-    def {function_name}(self{high_level_parameters}):
+    {def_} {function_name}(self{high_level_parameters}):
         \"\"\"
         {doc}
         \"\"\"{coercions}
@@ -303,17 +360,23 @@ class {0}(Device):
 
         if {stream_name_under}_length == 0:
             {stream_name_under}_chunk_data = [{chunk_padding}] * {chunk_cardinality}
-            ret = self.{function_name}_low_level({parameters})
+            ret = {await_}self.{function_name}_low_level({parameters})
         else:
-            with self.stream_lock:
+            {await_}self.check_validity()
+
+            {async_}with self.stream_lock:
+                requests = []
+
                 while {stream_name_under}_chunk_offset < {stream_name_under}_length:
                     {stream_name_under}_chunk_data = create_chunk_data({stream_name_under}, {stream_name_under}_chunk_offset, {chunk_cardinality}, {chunk_padding})
-                    ret = self.{function_name}_low_level({parameters})
+                    requests.append(({parameters}))
                     {stream_name_under}_chunk_offset += {chunk_cardinality}
+
+                ret = {await_}self.ipcon.send_stream_requests(self, {send_stream_requests_arguments})
 {result}
 """
         template_stream_in_fixed_length = """
-    def {function_name}(self{high_level_parameters}):
+    {def_} {function_name}(self{high_level_parameters}):
         \"\"\"
         {doc}
         \"\"\"{coercions}
@@ -323,11 +386,17 @@ class {0}(Device):
         if len({stream_name_under}) != {stream_name_under}_length:
             raise Error(Error.INVALID_PARAMETER, '{stream_name_space} has to be exactly {{0}} items long'.format({stream_name_under}_length))
 
-        with self.stream_lock:
+        {await_}self.check_validity()
+
+        {async_}with self.stream_lock:
+            requests = []
+
             while {stream_name_under}_chunk_offset < {stream_name_under}_length:
                 {stream_name_under}_chunk_data = create_chunk_data({stream_name_under}, {stream_name_under}_chunk_offset, {chunk_cardinality}, {chunk_padding})
-                ret = self.{function_name}_low_level({parameters})
+                requests.append(({parameters}))
                 {stream_name_under}_chunk_offset += {chunk_cardinality}
+
+            ret = {await_}self.ipcon.send_stream_requests(self, {send_stream_requests_arguments})
 {result}
 """
         template_stream_in_result = """
@@ -335,7 +404,7 @@ class {0}(Device):
         template_stream_in_namedtuple_result = """
         return {result_camel_name}(*ret)"""
         template_stream_in_short_write = """
-    def {function_name}(self{high_level_parameters}):
+    {def_} {function_name}(self{high_level_parameters}):
         \"\"\"
         {doc}
         \"\"\"{coercions}
@@ -347,15 +416,15 @@ class {0}(Device):
 
         if {stream_name_under}_length == 0:
             {stream_name_under}_chunk_data = [{chunk_padding}] * {chunk_cardinality}
-            ret = self.{function_name}_low_level({parameters})
+            ret = {await_}self.{function_name}_low_level({parameters})
             {chunk_written_0}
         else:
             {stream_name_under}_written = 0
 
-            with self.stream_lock:
+            {async_}with self.stream_lock:
                 while {stream_name_under}_chunk_offset < {stream_name_under}_length:
                     {stream_name_under}_chunk_data = create_chunk_data({stream_name_under}, {stream_name_under}_chunk_offset, {chunk_cardinality}, {chunk_padding})
-                    ret = self.{function_name}_low_level({parameters})
+                    ret = {await_}self.{function_name}_low_level({parameters})
                     {chunk_written_n}
 
                     if {chunk_written_test} < {chunk_cardinality}:
@@ -375,7 +444,7 @@ class {0}(Device):
         template_stream_in_short_write_namedtuple_result = """
         return {result_camel_name}({result_fields})"""
         template_stream_in_single_chunk = """
-    def {function_name}(self{high_level_parameters}):
+    {def_} {function_name}(self{high_level_parameters}):
         \"\"\"
         {doc}
         \"\"\"{coercions}
@@ -390,27 +459,32 @@ class {0}(Device):
 {result}
 """
         template_stream_in_single_chunk_result = """
-        return self.{function_name}_low_level({parameters})"""
+        return {await_}self.{function_name}_low_level({parameters})"""
         template_stream_in_single_chunk_namedtuple_result = """
-        return {result_camel_name}(*self.{function_name}_low_level({parameters}))"""
+        return {result_camel_name}(*{await_}self.{function_name}_low_level({parameters}))"""
         template_stream_out = """
-    def {function_name}(self{high_level_parameters}):
+    {def_} {function_name}(self{high_level_parameters}):
         \"\"\"
         {doc}
         \"\"\"{coercions}{fixed_length}
-        with self.stream_lock:
-            ret = self.{function_name}_low_level({parameters}){dynamic_length_3}
+        {await_}self.check_validity()
+
+        {stream_name_under}_codec = self.get_stream_codec({response_codec}, {chunk_data_index})
+
+        {async_}with self.stream_lock:
+            ret = {low_level_request}{dynamic_length_3}
             {chunk_offset_check}{stream_name_under}_out_of_sync = ret.{stream_name_under}_chunk_offset != 0
-            {chunk_offset_check_indent}{stream_name_under}_data = ret.{stream_name_under}_chunk_data
+            {chunk_offset_check_indent}{stream_name_under}_data = self.create_stream_reassembler({stream_name_under}_length, '{item_format}')
+            {chunk_offset_check_indent}{stream_name_under}_data.add_chunk(ret.{stream_name_under}_chunk_data)
 
-            while not {stream_name_under}_out_of_sync and len({stream_name_under}_data) < {stream_name_under}_length:
-                ret = self.{function_name}_low_level({parameters}){dynamic_length_4}
-                {stream_name_under}_out_of_sync = ret.{stream_name_under}_chunk_offset != len({stream_name_under}_data)
-                {stream_name_under}_data += ret.{stream_name_under}_chunk_data
+            while not {stream_name_under}_out_of_sync and {stream_name_under}_data.offset < {stream_name_under}_length:
+                ret = {low_level_request}{dynamic_length_4}
+                {stream_name_under}_out_of_sync = ret.{stream_name_under}_chunk_offset != {stream_name_under}_data.offset
+                {stream_name_under}_data.add_chunk(ret.{stream_name_under}_chunk_data)
 
             if {stream_name_under}_out_of_sync: # discard remaining stream to bring it back in-sync
                 while ret.{stream_name_under}_chunk_offset + {chunk_cardinality} < {stream_name_under}_length:
-                    ret = self.{function_name}_low_level({parameters}){dynamic_length_5}
+                    ret = {low_level_request}{dynamic_length_5}
 
                 raise Error(Error.STREAM_OUT_OF_SYNC, '{stream_name_space} stream is out-of-sync')
 {result}
@@ -424,21 +498,24 @@ class {0}(Device):
             if ret.{stream_name_under}_chunk_offset == (1 << {shift_size}) - 1: # maximum chunk offset -> stream has no data
                 {stream_name_under}_length = 0
                 {stream_name_under}_out_of_sync = False
-                {stream_name_under}_data = ()
+                {stream_name_under}_data = self.create_stream_reassembler(0, '{item_format}')
             else:
                 """
         template_stream_out_single_chunk = """
-    def {function_name}(self{high_level_parameters}):
+    {def_} {function_name}(self{high_level_parameters}):
         \"\"\"
         {doc}
         \"\"\"{coercions}
-        ret = self.{function_name}_low_level({parameters})
+        {await_}self.check_validity()
+
+        {stream_name_under}_codec = self.get_stream_codec({response_codec}, {chunk_data_index})
+        ret = {low_level_request}
 {result}
 """
         template_stream_out_result = """
-        return {stream_name_under}_data[:{stream_name_under}_length]"""
+        return {stream_name_under}_data.get_data({stream_name_under}_length)"""
         template_stream_out_single_chunk_result = """
-        return ret.{stream_name_under}_data[:ret.{stream_name_under}_length]"""
+        return self.create_stream_data(ret.{stream_name_under}_data, ret.{stream_name_under}_length, '{item_format}')"""
         template_stream_out_namedtuple_result = """
         return {result_name}({result_fields})"""
 
@@ -447,6 +524,14 @@ class {0}(Device):
             stream_out = packet.get_high_level('stream_out')
 
             if stream_in != None:
+                if len(packet.get_python_format_list('out')) > 0:
+                    out_f = '{0}.CODEC_{1}_RESPONSE'.format(cls, packet.get_name().upper)
+                else:
+                    out_f = "''"
+
+                send_stream_requests_arguments = '{0}.FUNCTION_{1}, requests, {0}.CODEC_{1}_REQUEST, {2}, {3}' \
+                                                 .format(cls, packet.get_name().upper, packet.get_response_size(), out_f)
+
                 if stream_in.get_fixed_length() != None:
                     template = template_stream_in_fixed_length
                 elif stream_in.has_short_write() and stream_in.has_single_chunk():
@@ -472,14 +557,16 @@ class {0}(Device):
                     if len(packet.get_elements(direction='out', high_level=True)) < 2:
                         if stream_in.has_single_chunk():
                             result = template_stream_in_single_chunk_result.format(function_name=packet.get_name(skip=-2).under,
-                                                                                   parameters=packet.get_python_parameters())
+                                                                                   parameters=packet.get_python_parameters(),
+                                                                                   **tokens)
                         else:
                             result = template_stream_in_short_write_result.format(stream_name_under=stream_in.get_name().under)
                     else:
                         if stream_in.has_single_chunk():
                             result = template_stream_in_single_chunk_namedtuple_result.format(function_name=packet.get_name(skip=-2).under,
                                                                                               parameters=packet.get_python_parameters(),
-                                                                                              result_camel_name=packet.get_name(skip=-2).camel)
+                                                                                              result_camel_name=packet.get_name(skip=-2).camel,
+                                                                                              **tokens)
                         else:
                             fields = []
 
@@ -499,14 +586,16 @@ class {0}(Device):
                     if len(packet.get_elements(direction='out', high_level=True)) < 2:
                         if stream_in.has_single_chunk():
                             result = template_stream_in_single_chunk_result.format(function_name=packet.get_name(skip=-2).under,
-                                                                                   parameters=packet.get_python_parameters())
+                                                                                   parameters=packet.get_python_parameters(),
+                                                                                   **tokens)
                         else:
                             result = template_stream_in_result
                     else:
                         if stream_in.has_single_chunk():
                             result = template_stream_in_single_chunk_namedtuple_result.format(function_name=packet.get_name(skip=-2).under,
                                                                                               parameters=packet.get_python_parameters(),
-                                                                                              result_camel_name=packet.get_name(skip=-2).camel)
+                                                                                              result_camel_name=packet.get_name(skip=-2).camel,
+                                                                                              **tokens)
                         else:
                             result = template_stream_in_namedtuple_result.format(result_camel_name=packet.get_name(skip=-2).camel)
 
@@ -524,15 +613,36 @@ class {0}(Device):
                                            chunk_written_0=chunk_written_0,
                                            chunk_written_n=chunk_written_n,
                                            chunk_written_test=chunk_written_test,
-                                           result=result)
+                                           send_stream_requests_arguments=send_stream_requests_arguments,
+                                           result=result,
+                                           **tokens)
             elif stream_out != None:
+                item_format = python_common.PythonElement.python_struct_formats[stream_out.get_data_element().get_type()]
+                chunk_data_index = packet.get_elements(direction='out').index(stream_out.get_chunk_data_element())
+                parameters = packet.get_python_parameters()
+
+                if len(packet.get_python_format_list('in')) > 0:
+                    in_f = '{0}.CODEC_{1}_REQUEST'.format(cls, packet.get_name().upper)
+                else:
+                    in_f = "''"
+
+                if parameters != '' and not ',' in parameters:
+                    parameters += ','
+
+                # the low-level getter is not used, because it unpacks the
+                # chunk data as tuple regardless of the stream result mode
+                low_level_request = '{0}(*{await_}self.ipcon.send_request(self, {1}.FUNCTION_{2}, ({3}), {4}, {5}, {6}_codec))' \
+                                    .format(packet.get_name().camel, cls, packet.get_name().upper, parameters, in_f,
+                                            packet.get_response_size(), stream_out.get_name().under, **tokens)
+
                 if stream_out.get_fixed_length() != None:
                     fixed_length = template_stream_out_fixed_length.format(stream_name_under=stream_out.get_name().under,
                                                                            fixed_length=stream_out.get_fixed_length())
                     dynamic_length = ''
                     shift_size = int(stream_out.get_chunk_offset_element().get_type().replace('uint', ''))
                     chunk_offset_check = template_stream_out_chunk_offset_check.format(stream_name_under=stream_out.get_name().under,
-                                                                                       shift_size=shift_size)
+                                                                                       shift_size=shift_size,
+                                                                                       item_format=item_format)
                     chunk_offset_check_indent = '    '
                 else:
                     fixed_length = ''
@@ -542,7 +652,8 @@ class {0}(Device):
 
                 if len(packet.get_elements(direction='out', high_level=True)) < 2:
                     if stream_out.has_single_chunk():
-                        result = template_stream_out_single_chunk_result.format(stream_name_under=stream_out.get_name().under)
+                        result = template_stream_out_single_chunk_result.format(stream_name_under=stream_out.get_name().under,
+                                                                                item_format=item_format)
                     else:
                         result = template_stream_out_result.format(stream_name_under=stream_out.get_name().under)
                 else:
@@ -551,9 +662,9 @@ class {0}(Device):
                     for element in packet.get_elements(direction='out', high_level=True):
                         if element.get_role() == 'stream_data':
                             if stream_out.has_single_chunk():
-                                fields.append('ret.{0}_data[:ret.{0}_length]'.format(stream_out.get_name().under))
+                                fields.append("self.create_stream_data(ret.{0}_data, ret.{0}_length, '{1}')".format(stream_out.get_name().under, item_format))
                             else:
-                                fields.append('{0}_data[:{0}_length]'.format(stream_out.get_name().under))
+                                fields.append('{0}_data.get_data({0}_length)'.format(stream_out.get_name().under))
                         else:
                             fields.append('ret.{0}'.format(element.get_name().under))
 
@@ -579,7 +690,12 @@ class {0}(Device):
                                            chunk_offset_check=chunk_offset_check,
                                            chunk_offset_check_indent=chunk_offset_check_indent,
                                            chunk_cardinality=stream_out.get_chunk_data_element().get_cardinality(),
-                                           result=result)
+                                           item_format=item_format,
+                                           response_codec='{0}.CODEC_{1}_RESPONSE'.format(cls, packet.get_name().upper),
+                                           chunk_data_index=chunk_data_index,
+                                           low_level_request=low_level_request,
+                                           result=result,
+                                           **tokens)
 
         return methods
 
@@ -598,6 +714,55 @@ class {0}(Device):
             self.registered_callbacks[callback_id] = function
 """
 
+    def get_python_async_import(self):
+        template = """# -*- coding: utf-8 -*-
+{header}{released}
+try:
+    from .ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from .ip_connection_async import AsyncDevice
+    from .{import_name} import {names}
+except ImportError:
+    from ip_connection import Error, create_char, create_char_list, create_string, create_chunk_data, create_number_list
+    from ip_connection_async import AsyncDevice
+    from {import_name} import {names}
+"""
+
+        if not self.is_released():
+            released = '\n#### __DEVICE_IS_NOT_RELEASED__ ####\n'
+        else:
+            released = ''
+
+        names = [self.get_python_class_name()]
+
+        for name, _, _ in self.get_python_namedtuple_definitions():
+            names.append(name)
+
+        return template.format(header=self.get_generator().get_header_comment('hash'),
+                               released=released,
+                               import_name=self.get_python_import_name(),
+                               names=', '.join(names))
+
+    def get_python_async_class(self):
+        template = """
+class {0}Async(AsyncDevice, {0}):
+    \"\"\"
+    {1}
+
+    asyncio variant of {0} for use with an AsyncIPConnection.
+    All functions that communicate with the device are coroutines.
+    \"\"\"
+"""
+
+        return template.format(self.get_python_class_name(),
+                               common.select_lang(self.get_description()))
+
+    def get_python_async_source(self):
+        source  = self.get_python_async_import()
+        source += self.get_python_async_class()
+        source += self.get_python_methods(asynchronous=True)
+
+        return common.strip_trailing_whitespace(source)
+
     def get_python_old_name(self):
         template = """
 {0} = {1} # for backward compatibility
@@ -612,9 +777,9 @@ class {0}(Device):
         source += self.get_python_callback_id_definitions()
         source += self.get_python_function_id_definitions()
         source += self.get_python_constants()
+        source += self.get_python_payload_codecs()
+        source += self.get_python_tables()
         source += self.get_python_init_method()
-        source += self.get_python_callback_formats()
-        source += self.get_python_high_level_callbacks()
         source += self.get_python_add_device()
         source += self.get_python_methods()
         source += self.get_python_register_callback_method()
@@ -652,7 +817,12 @@ class PythonBindingsPacket(python_common.PythonPacket):
         for element in self.get_elements(direction='in', high_level=high_level):
             name = element.get_name().under
 
-            coercions.append('{0} = {1}'.format(name, element.get_python_parameter_coercion().format(name)))
+            if high_level and element.get_role() == 'stream_data' and element.get_type() not in ['char', 'string']:
+                coercion = 'create_number_list({0}, {1})'.format(name, element.get_python_type(cardinality=1))
+            else:
+                coercion = element.get_python_parameter_coercion().format(name)
+
+            coercions.append('{0} = {1}'.format(name, coercion))
 
         return '\n        '.join(coercions)
 
@@ -679,49 +849,87 @@ class PythonBindingsGenerator(python_common.PythonGeneratorTrait, common.Binding
         with open(os.path.join(self.get_bindings_dir(), filename), 'w') as f:
             f.write(device.get_python_source())
 
-        self.device_factory_all_classes.append((device.get_python_import_name(), device.get_python_class_name()))
+        filename_async = '{0}_{1}_async.py'.format(device.get_category().under, device.get_name().under)
+
+        with open(os.path.join(self.get_bindings_dir(), filename_async), 'w') as f:
+            f.write(device.get_python_async_source())
+
+        device_factory_class = (device.get_python_import_name(), device.get_python_class_name(),
+                                device.get_device_identifier(), device.get_long_display_name())
+
+        self.device_factory_all_classes.append(device_factory_class)
 
         if device.is_released():
-            self.device_factory_released_classes.append((device.get_python_import_name(), device.get_python_class_name()))
+            self.device_factory_released_classes.append(device_factory_class)
             self.device_display_names.append((device.get_device_identifier(), device.get_long_display_name()))
             self.released_files.append(filename)
+            self.released_files.append(filename_async)
 
     def finish(self):
-        template_import = """try:
-    from .{0} import {1}
-except ValueError:
-    from {0} import {1}
-"""
         template = """# -*- coding: utf-8 -*-
-{0}
-{1}
+{header}
+import importlib
 
-DEVICE_CLASSES = {{
-{2}
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+# device identifier -> (module name, class name, display name). the device
+# modules are imported on first lookup, importing all of them here would make
+# importing this module slow
+DEVICE_MODULES = {{
+    {entries}
 }}
 
+class DeviceClasses(Mapping):
+    def __init__(self):
+        self.classes = {{}}
+
+    def __getitem__(self, device_identifier):
+        device_class = self.classes.get(device_identifier)
+
+        if device_class == None:
+            module_name, class_name, _ = DEVICE_MODULES[device_identifier]
+            package = __name__.rpartition('.')[0]
+
+            if len(package) > 0:
+                module = importlib.import_module('.' + module_name, package)
+            else:
+                module = importlib.import_module(module_name)
+
+            device_class = getattr(module, class_name)
+            self.classes[device_identifier] = device_class
+
+        return device_class
+
+    def __iter__(self):
+        return iter(DEVICE_MODULES)
+
+    def __len__(self):
+        return len(DEVICE_MODULES)
+
+DEVICE_CLASSES = DeviceClasses()
+
 def get_device_class(device_identifier):
     return DEVICE_CLASSES[device_identifier]
 
 def get_device_display_name(device_identifier):
-    return get_device_class(device_identifier).DEVICE_DISPLAY_NAME
+    return DEVICE_MODULES[device_identifier][2]
 
 def create_device(device_identifier, uid, ipcon):
     return get_device_class(device_identifier)(uid, ipcon)
 """
         for filename, device_factory_classes in [('device_factory_all.py', self.device_factory_all_classes),
                                                  ('device_factory.py', self.device_factory_released_classes)]:
-            imports = []
-            classes = []
+            entries = []
 
-            for import_name, class_name in sorted(device_factory_classes):
-                imports.append(template_import.format(import_name, class_name))
-                classes.append('    {0}.DEVICE_IDENTIFIER: {0},'.format(class_name))
+            for import_name, class_name, device_identifier, device_display_name in sorted(device_factory_classes):
+                entries.append("{0}: ('{1}', '{2}', '{3}')".format(device_identifier, import_name, class_name, device_display_name))
 
             with open(os.path.join(self.get_bindings_dir(), filename), 'w') as f:
-                f.write(template.format(self.get_header_comment('hash'),
-                                        '\n'.join(imports),
-                                        '\n'.join(classes)))
+                f.write(template.format(header=self.get_header_comment('hash'),
+                                        entries=',\n    '.join(entries)))
 
         template = """# -*- coding: utf-8 -*-
 {header}
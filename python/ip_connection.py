@@ -16,6 +16,9 @@ import hmac
 import hashlib
 import errno
 import threading
+import array
+import bisect
+from collections import deque
 
 try:
     import queue # Python 3
@@ -28,6 +31,12 @@ if not 'INTERNAL_DEVICE_DISPLAY_NAMES' in globals():
     except ValueError:
         from device_display_names import get_device_display_name
 
+# internal
+if hasattr(time, 'monotonic'):
+    get_monotonic_time = time.monotonic
+else:
+    get_monotonic_time = time.time # Python 2
+
 # internal
 def get_uid_from_data(data):
     return struct.unpack('<I', data[0:4])[0]
@@ -48,6 +57,28 @@ def get_sequence_number_from_data(data):
 def get_error_code_from_data(data):
     return (struct.unpack('<B', data[7:8])[0] >> 6) & 0x03
 
+# internal
+def check_response(response, function_id, length_ret):
+    error_code = get_error_code_from_data(response)
+
+    if error_code == 0:
+        if length_ret == 0:
+            length_ret = 8 # setter with response-expected enabled
+
+        if len(response) != length_ret:
+            msg = 'Expected response of {0} byte for function ID {1}, got {2} byte instead' \
+                  .format(length_ret, function_id, len(response))
+            raise Error(Error.WRONG_RESPONSE_LENGTH, msg)
+    elif error_code == 1:
+        msg = 'Got invalid parameter for function {0}'.format(function_id)
+        raise Error(Error.INVALID_PARAMETER, msg)
+    elif error_code == 2:
+        msg = 'Function {0} is not supported'.format(function_id)
+        raise Error(Error.NOT_SUPPORTED, msg)
+    else:
+        msg = 'Function {0} returned an unknown error'.format(function_id)
+        raise Error(Error.UNKNOWN_ERROR_CODE, msg)
+
 BASE58 = '123456789abcdefghijkmnopqrstuvwxyzABCDEFGHJKLMNPQRSTUVWXYZ'
 
 # internal
@@ -90,15 +121,130 @@ def uid64_to_uid32(uid64):
 
     return uid32
 
+CAPTURE_FILE_MAGIC = b'TFPCAP\x01\x00' # internal
+CAPTURE_RECORD_HEADER = struct.Struct('<dB') # internal, timestamp and direction
+
+def read_capture_file(filename):
+    # yields the (timestamp, direction, packet) tuples of a capture file written
+    # by IPConnection.start_capture. timestamps are monotonic times in seconds
+    with open(filename, 'rb') as f:
+        if f.read(len(CAPTURE_FILE_MAGIC)) != CAPTURE_FILE_MAGIC:
+            raise ValueError('{0} is not a capture file'.format(filename))
+
+        while True:
+            header = f.read(CAPTURE_RECORD_HEADER.size)
+
+            if len(header) < CAPTURE_RECORD_HEADER.size:
+                break
+
+            timestamp, direction = CAPTURE_RECORD_HEADER.unpack(header)
+            packet = f.read(8)
+
+            if len(packet) < 8:
+                break
+
+            packet += f.read(get_length_from_data(packet) - 8)
+
+            yield timestamp, direction, packet
+
+# internal
+def copy_result(result):
+    # results with multiple values are lists, give each caller of a shared
+    # result its own list
+    if isinstance(result, list):
+        return list(result)
+
+    return result
+
+# internal
+def create_number_list(value, number_type):
+    # buffer-protocol objects such as array.array or numpy.ndarray are passed
+    # through as is and converted chunk-wise by create_chunk_data, unless their
+    # items are floats that have to be converted to int like for other values
+    try:
+        item_format = memoryview(value).format
+    except TypeError:
+        return list(map(number_type, value))
+
+    if number_type == int and item_format[-1:] in ['e', 'f', 'd']:
+        return list(map(number_type, value))
+
+    return value
+
 # internal
 def create_chunk_data(data, chunk_offset, chunk_length, chunk_padding):
     chunk_data = data[chunk_offset:chunk_offset + chunk_length]
 
+    if not isinstance(chunk_data, list):
+        if hasattr(chunk_data, 'tolist'): # array.array, memoryview, numpy.ndarray
+            chunk_data = chunk_data.tolist()
+        else: # bytes, bytearray
+            chunk_data = list(bytearray(chunk_data))
+
     if len(chunk_data) < chunk_length:
         chunk_data += [chunk_padding] * (chunk_length - len(chunk_data))
 
     return chunk_data
 
+# internal
+class StreamReassembler(object):
+    # item format -> array.array typecode, char streams are always reassembled as tuple
+    ARRAY_TYPECODES = {'b': 'b', 'B': 'B', 'h': 'h', 'H': 'H', 'i': 'i', 'I': 'I',
+                       'q': 'q', 'Q': 'Q', 'f': 'f', '!': 'B'}
+
+    def __init__(self, length, result_mode=0, item_format=None):
+        if result_mode != 0 and item_format in StreamReassembler.ARRAY_TYPECODES:
+            self.result_mode = result_mode
+            self.item_format = item_format
+            self.typecode = StreamReassembler.ARRAY_TYPECODES[item_format]
+            self.data = array.array(self.typecode, [0]) * length
+        else:
+            self.result_mode = 0
+            self.item_format = None
+            self.typecode = None
+            self.data = [None] * length # chunks are copied into place instead of concatenated
+
+        self.offset = 0 # number of items received so far, including padding of the last chunk
+
+    def add_chunk(self, chunk_data):
+        if self.typecode != None:
+            if isinstance(chunk_data, bytes): # little-endian items, see the raw field of PayloadCodec
+                raw_data = chunk_data
+                chunk_data = array.array(self.typecode)
+
+                if sys.hexversion < 0x03000000:
+                    chunk_data.fromstring(raw_data)
+                else:
+                    chunk_data.frombytes(raw_data)
+
+                if sys.byteorder == 'big':
+                    chunk_data.byteswap()
+            else:
+                chunk_data = array.array(self.typecode, chunk_data)
+
+        end = self.offset + len(chunk_data)
+
+        self.data[self.offset:end] = chunk_data # grows for the padding of the last chunk
+        self.offset = end
+
+    def get_data(self, length):
+        if self.result_mode == 0:
+            return tuple(self.data[:length])
+
+        del self.data[length:]
+
+        if self.result_mode == 1: # Device.STREAM_RESULT_MODE_ARRAY
+            return self.data
+
+        import numpy
+
+        if self.item_format == '!':
+            dtype = numpy.bool_
+        else:
+            dtype = self.typecode
+
+        return numpy.frombuffer(self.data, dtype=dtype)
+
 if sys.hexversion < 0x03000000:
     # internal
     def create_char(value): # return str with len() == 1 and ord() <= 255
@@ -328,6 +474,196 @@ def unpack_payload(data, form):
 
 # UNPACK_PAYLOAD_CUT_HERE
 
+# internal
+class PayloadCodec(object):
+    # precompiled form of pack_payload and unpack_payload. the form string is
+    # parsed once into a single struct.Struct and a list of per-element fields
+    # that describe how to convert between element values and struct values
+
+    FIELD_VALUE = 0
+    FIELD_VALUE_LIST = 1
+    FIELD_BOOL = 2
+    FIELD_BOOL_LIST = 3
+    FIELD_CHAR = 4
+    FIELD_CHAR_LIST = 5
+    FIELD_STRING = 6
+    FIELD_RAW = 7
+
+    def __init__(self, form, raw_field=None):
+        # the number list element with index raw_field is unpacked as bytes
+        # containing its little-endian items instead of as tuple, so that
+        # stream chunks can be copied into an array as is
+        self.form = form
+        self.raw_field = raw_field
+        self.fields = [] # [(kind, cardinality, start, end)], start and end index into the struct values
+        self.plain = True # only single value elements, no conversion required
+
+        struct_form = '<'
+        start = 0
+
+        for f in form.split(' '):
+            if len(f) == 0:
+                continue
+
+            cardinality = int(f[:-1]) if len(f) > 1 else 1
+            t = f[-1]
+
+            if len(self.fields) == raw_field and len(f) > 1 and t not in ['!', 'c', 's']:
+                kind = PayloadCodec.FIELD_RAW
+                count = 1
+                struct_form += '{0}s'.format(cardinality * struct.calcsize('<' + t))
+            elif t == '!':
+                if len(f) > 1:
+                    kind = PayloadCodec.FIELD_BOOL_LIST
+                    count = int(math.ceil(cardinality / 8.0))
+                    struct_form += '{0}B'.format(count)
+                else:
+                    kind = PayloadCodec.FIELD_BOOL
+                    count = 1
+                    struct_form += '?'
+            elif t == 'c':
+                kind = PayloadCodec.FIELD_CHAR_LIST if len(f) > 1 else PayloadCodec.FIELD_CHAR
+                count = 1
+                struct_form += '{0}s'.format(cardinality)
+            elif t == 's':
+                kind = PayloadCodec.FIELD_STRING
+                count = 1
+                struct_form += '{0}s'.format(cardinality)
+            else:
+                kind = PayloadCodec.FIELD_VALUE_LIST if len(f) > 1 else PayloadCodec.FIELD_VALUE
+                count = cardinality
+                struct_form += f
+
+            if kind != PayloadCodec.FIELD_VALUE:
+                self.plain = False
+
+            self.fields.append((kind, cardinality, start, start + count))
+            start += count
+
+        self.struct = struct.Struct(struct_form)
+        self.size = self.struct.size
+
+    def pack(self, data):
+        if self.plain:
+            return self.struct.pack(*data)
+
+        values = []
+
+        for (kind, cardinality, _, _), d in zip(self.fields, data):
+            if kind == PayloadCodec.FIELD_VALUE or kind == PayloadCodec.FIELD_BOOL:
+                values.append(d)
+            elif kind == PayloadCodec.FIELD_VALUE_LIST:
+                if len(d) != cardinality:
+                    raise struct.error('pack expected {0} items for packing (got {1})'.format(cardinality, len(d)))
+
+                values.extend(d)
+            elif kind == PayloadCodec.FIELD_RAW:
+                values.append(bytes(d))
+            elif kind == PayloadCodec.FIELD_BOOL_LIST:
+                if len(d) != cardinality:
+                    raise ValueError('Incorrect bool list length')
+
+                p = [0] * int(math.ceil(cardinality / 8.0))
+
+                for i, b in enumerate(d):
+                    if b:
+                        p[i // 8] |= 1 << (i % 8)
+
+                values.extend(p)
+            elif kind == PayloadCodec.FIELD_CHAR:
+                if sys.hexversion < 0x03000000:
+                    values.append(d)
+                else:
+                    values.append(bytes([ord(d)]))
+            elif kind == PayloadCodec.FIELD_CHAR_LIST:
+                if len(d) != cardinality:
+                    raise struct.error('pack expected {0} items for packing (got {1})'.format(cardinality, len(d)))
+
+                if sys.hexversion < 0x03000000:
+                    values.append(''.join(d))
+                else:
+                    values.append(bytes(map(ord, d)))
+            else: # string
+                if sys.hexversion < 0x03000000:
+                    values.append(d)
+                else:
+                    values.append(bytes(map(ord, d)))
+
+        return self.struct.pack(*values)
+
+    def unpack(self, data):
+        values = self.struct.unpack_from(data)
+
+        if self.plain:
+            if len(values) == 1:
+                return values[0]
+            else:
+                return list(values)
+
+        ret = []
+
+        for kind, cardinality, start, end in self.fields:
+            if kind == PayloadCodec.FIELD_VALUE:
+                ret.append(values[start])
+            elif kind == PayloadCodec.FIELD_VALUE_LIST:
+                ret.append(values[start:end])
+            elif kind == PayloadCodec.FIELD_RAW:
+                ret.append(values[start])
+            elif kind == PayloadCodec.FIELD_BOOL:
+                ret.append(values[start])
+            elif kind == PayloadCodec.FIELD_BOOL_LIST:
+                x = values[start:end]
+                ret.append(tuple([x[i // 8] & (1 << (i % 8)) != 0 for i in range(cardinality)]))
+            elif kind == PayloadCodec.FIELD_CHAR:
+                if sys.hexversion < 0x03000000:
+                    ret.append(values[start])
+                else:
+                    ret.append(chr(values[start][0]))
+            elif kind == PayloadCodec.FIELD_CHAR_LIST:
+                if sys.hexversion < 0x03000000:
+                    ret.append(tuple(values[start]))
+                else:
+                    ret.append(tuple(values[start].decode('latin-1')))
+            else: # string
+                if sys.hexversion < 0x03000000:
+                    s = values[start]
+                else:
+                    s = values[start].decode('latin-1')
+
+                i = s.find('\x00')
+
+                if i >= 0:
+                    s = s[:i]
+
+                ret.append(s)
+
+        if len(ret) == 1:
+            return ret[0]
+        else:
+            return ret
+
+payload_codecs = {} # internal, form or (form, raw field) -> PayloadCodec
+
+# internal
+def get_payload_codec(form, raw_field=None):
+    if isinstance(form, PayloadCodec):
+        if form.raw_field == raw_field:
+            return form
+
+        form = form.form
+
+    if raw_field == None:
+        key = form
+    else:
+        key = (form, raw_field)
+
+    codec = payload_codecs.get(key)
+
+    if codec == None:
+        codec = payload_codecs.setdefault(key, PayloadCodec(form, raw_field))
+
+    return codec
+
 class Error(Exception):
     TIMEOUT = -1
     NOT_ADDED = -6 # obsolete since v2.0
@@ -370,6 +706,47 @@ class Device(object):
     RESPONSE_EXPECTED_TRUE = 2 # setter
     RESPONSE_EXPECTED_FALSE = 3 # setter, default
 
+    CALLBACK_QUEUE_POLICY_BLOCK = 0 # default
+    CALLBACK_QUEUE_POLICY_DROP_OLDEST = 1
+    CALLBACK_QUEUE_POLICY_LATEST_VALUE = 2
+
+    STREAM_RESULT_MODE_TUPLE = 0 # default
+    STREAM_RESULT_MODE_ARRAY = 1
+    STREAM_RESULT_MODE_NUMPY = 2
+
+    # class-level tables shared by all instances of a device class. classes
+    # that leave them as None get per-instance tables filled by their __init__
+    RESPONSE_EXPECTED = None # internal, tuple of 256 flags, see create_response_expected
+    CALLBACK_FORMATS = None # internal, callback ID -> (length, codec)
+    HIGH_LEVEL_CALLBACKS = None # internal, high-level callback ID -> (roles, options)
+    STABLE_FUNCTIONS = None # internal, frozenset of function IDs
+    SIDE_EFFECT_FREE_FUNCTIONS = None # internal, frozenset of function IDs
+
+    __slots__ = ('replaced', 'uid', 'uid_string', 'ipcon', 'device_identifier', 'device_display_name',
+                 'device_identifier_lock', 'device_identifier_check', 'wrong_device_display_name',
+                 'api_version', 'registered_callbacks', 'callback_formats', 'high_level_callbacks',
+                 'high_level_streams', 'callback_queue_policies', 'stable_functions',
+                 'side_effect_free_functions', 'stream_result_mode', 'stream_lock', 'response_expected',
+                 '__weakref__')
+
+    class RequestBatch(object):
+        def __init__(self, device):
+            self.device = device
+            self.requests = []
+            self.results = None
+
+        def add(self, function_id, data, form, length_ret, form_ret):
+            self.requests.append((self.device, function_id, data, form, length_ret, form_ret))
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            if exc_type is None:
+                self.device.check_validity()
+
+                self.results = self.device.ipcon.send_requests(self.requests)
+
     # internal
     def __init__(self, uid, ipcon, device_identifier, device_display_name):
         uid_ = base58decode(uid)
@@ -394,19 +771,49 @@ class Device(object):
         self.wrong_device_display_name = '?' # protected by device_identifier_lock
         self.api_version = (0, 0, 0)
         self.registered_callbacks = {}
-        self.callback_formats = {}
-        self.high_level_callbacks = {}
-        self.expected_response_function_id = None # protected by request_lock
-        self.expected_response_sequence_number = None # protected by request_lock
-        self.response_queue = queue.Queue()
-        self.request_lock = threading.Lock()
+        self.high_level_streams = None # high-level callback ID -> StreamReassembler, created on first use
+        self.callback_queue_policies = {}
+        self.stream_result_mode = Device.STREAM_RESULT_MODE_TUPLE
         self.stream_lock = threading.Lock()
 
-        self.response_expected = [Device.RESPONSE_EXPECTED_INVALID_FUNCTION_ID] * 256
-        self.response_expected[IPConnection.FUNCTION_ADC_CALIBRATE] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[IPConnection.FUNCTION_GET_ADC_CALIBRATION] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[IPConnection.FUNCTION_READ_BRICKLET_UID] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
-        self.response_expected[IPConnection.FUNCTION_WRITE_BRICKLET_UID] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+        if self.RESPONSE_EXPECTED != None:
+            self.response_expected = self.RESPONSE_EXPECTED # copied on first write, see set_response_expected
+        else:
+            self.response_expected = list(Device.create_response_expected({}))
+
+        if self.CALLBACK_FORMATS != None:
+            self.callback_formats = self.CALLBACK_FORMATS
+        else:
+            self.callback_formats = {}
+
+        if self.HIGH_LEVEL_CALLBACKS != None:
+            self.high_level_callbacks = self.HIGH_LEVEL_CALLBACKS
+        else:
+            self.high_level_callbacks = {}
+
+        if self.STABLE_FUNCTIONS != None:
+            self.stable_functions = self.STABLE_FUNCTIONS # getters whose results don't change, can be cached
+        else:
+            self.stable_functions = set()
+
+        if self.SIDE_EFFECT_FREE_FUNCTIONS != None:
+            self.side_effect_free_functions = self.SIDE_EFFECT_FREE_FUNCTIONS # getters without side effects, can be coalesced
+        else:
+            self.side_effect_free_functions = set()
+
+    # internal
+    @staticmethod
+    def create_response_expected(flags):
+        response_expected = [Device.RESPONSE_EXPECTED_INVALID_FUNCTION_ID] * 256
+        response_expected[IPConnection.FUNCTION_ADC_CALIBRATE] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+        response_expected[IPConnection.FUNCTION_GET_ADC_CALIBRATION] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+        response_expected[IPConnection.FUNCTION_READ_BRICKLET_UID] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+        response_expected[IPConnection.FUNCTION_WRITE_BRICKLET_UID] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+
+        for function_id, flag in flags.items():
+            response_expected[function_id] = flag
+
+        return tuple(response_expected)
 
     def get_api_version(self):
         """
@@ -470,6 +877,9 @@ class Device(object):
         if flag == Device.RESPONSE_EXPECTED_ALWAYS_TRUE:
             raise ValueError('Response Expected flag cannot be changed for function ID {0}'.format(function_id))
 
+        if isinstance(self.response_expected, tuple):
+            self.response_expected = list(self.response_expected) # copy-on-write of the class-level table
+
         if bool(response_expected):
             self.response_expected[function_id] = Device.RESPONSE_EXPECTED_TRUE
         else:
@@ -486,10 +896,133 @@ class Device(object):
         else:
             flag = Device.RESPONSE_EXPECTED_FALSE
 
+        if isinstance(self.response_expected, tuple):
+            self.response_expected = list(self.response_expected) # copy-on-write of the class-level table
+
         for i in range(len(self.response_expected)):
             if self.response_expected[i] in [Device.RESPONSE_EXPECTED_TRUE, Device.RESPONSE_EXPECTED_FALSE]:
                 self.response_expected[i] = flag
 
+    def set_callback_queue_policy(self, callback_id, policy):
+        """
+        Changes how callbacks of the callback specified by the *callback_id*
+        parameter are queued if the callback functions cannot keep up with
+        the incoming callbacks:
+
+        - CALLBACK_QUEUE_POLICY_BLOCK: Wait until there is room in the
+          callback queue. This stops the IP Connection from receiving further
+          data, including responses to getter calls. This is the default.
+        - CALLBACK_QUEUE_POLICY_DROP_OLDEST: Drop the oldest callback with a
+          non-blocking policy from the full callback queue. If there is none,
+          the new callback is dropped instead.
+        - CALLBACK_QUEUE_POLICY_LATEST_VALUE: Replace a callback of this
+          device with the same callback ID that is still waiting in the queue
+          with the new one. Only the latest value is reported. If the queue
+          is full otherwise, the callback is handled as with
+          CALLBACK_QUEUE_POLICY_DROP_OLDEST.
+
+        The callback queue is bounded only if a size was set with the
+        set_callback_queue_size function of the IP Connection. The policy
+        cannot be changed for high-level callbacks, because those are
+        reassembled from multiple low-level callbacks.
+        """
+
+        if callback_id not in self.callback_formats:
+            raise ValueError('Invalid callback ID {0}'.format(callback_id))
+
+        if -callback_id in self.high_level_callbacks:
+            raise ValueError('Callback ID {0} belongs to a high-level callback'.format(callback_id))
+
+        if policy not in [Device.CALLBACK_QUEUE_POLICY_BLOCK,
+                          Device.CALLBACK_QUEUE_POLICY_DROP_OLDEST,
+                          Device.CALLBACK_QUEUE_POLICY_LATEST_VALUE]:
+            raise ValueError('Invalid callback queue policy {0}'.format(policy))
+
+        self.callback_queue_policies[callback_id] = policy
+
+    def get_callback_queue_policy(self, callback_id):
+        """
+        Returns the callback queue policy for the callback specified by the
+        *callback_id* parameter as set by set_callback_queue_policy.
+        """
+
+        if callback_id not in self.callback_formats:
+            raise ValueError('Invalid callback ID {0}'.format(callback_id))
+
+        return self.callback_queue_policies.get(callback_id, Device.CALLBACK_QUEUE_POLICY_BLOCK)
+
+    def get_callback_drop_count(self, callback_id):
+        """
+        Returns the number of callbacks of the callback specified by the
+        *callback_id* parameter that were dropped or replaced by a newer one
+        due to their callback queue policy.
+        """
+
+        return self.ipcon.callback_drop_counts.get((self.uid, callback_id), 0)
+
+    def set_stream_result_mode(self, mode):
+        """
+        Changes the type of the stream data returned by high-level stream
+        getters and passed to high-level stream callbacks of this device:
+
+        - STREAM_RESULT_MODE_TUPLE: A tuple of values. This is the default.
+        - STREAM_RESULT_MODE_ARRAY: An array.array with a typecode matching
+          the value type. Bools are returned with typecode 'B'.
+        - STREAM_RESULT_MODE_NUMPY: A numpy.ndarray with a dtype matching the
+          value type. This requires NumPy to be installed.
+
+        Streams of chars are always returned as tuple.
+        """
+
+        if mode not in [Device.STREAM_RESULT_MODE_TUPLE,
+                        Device.STREAM_RESULT_MODE_ARRAY,
+                        Device.STREAM_RESULT_MODE_NUMPY]:
+            raise ValueError('Invalid stream result mode {0}'.format(mode))
+
+        if mode == Device.STREAM_RESULT_MODE_NUMPY:
+            import numpy # raises ImportError if NumPy is not available
+
+        self.stream_result_mode = mode
+
+    def get_stream_result_mode(self):
+        """
+        Returns the stream result mode as set by set_stream_result_mode.
+        """
+
+        return self.stream_result_mode
+
+    def batch(self):
+        """
+        Returns a context manager that collects low-level requests for this
+        device via its add(function_id, data, form, length_ret, form_ret)
+        method. On leaving the context all collected requests are sent at
+        once using the send_requests function of the IP Connection. Their
+        results are stored in the results list of the batch afterwards.
+        """
+
+        return Device.RequestBatch(self)
+
+    # internal
+    def get_stream_codec(self, form, chunk_data_index):
+        # unless the stream is reassembled as tuple, its chunk data is unpacked
+        # as bytes and copied into the stream array without a detour via tuple
+        if self.stream_result_mode == Device.STREAM_RESULT_MODE_TUPLE:
+            return form
+
+        return get_payload_codec(form, chunk_data_index)
+
+    # internal
+    def create_stream_reassembler(self, length, item_format):
+        return StreamReassembler(length, self.stream_result_mode, item_format)
+
+    # internal
+    def create_stream_data(self, data, length, item_format):
+        stream = self.create_stream_reassembler(length, item_format)
+
+        stream.add_chunk(data)
+
+        return stream.get_data(length)
+
     # internal
     def check_validity(self):
         if self.replaced:
@@ -520,6 +1053,8 @@ class BrickDaemon(Device):
     FUNCTION_GET_AUTHENTICATION_NONCE = 1
     FUNCTION_AUTHENTICATE = 2
 
+    __slots__ = ()
+
     def __init__(self, uid, ipcon):
         Device.__init__(self, uid, ipcon, 0, 'Brick Daemon')
 
@@ -574,6 +1109,12 @@ class IPConnection(object):
     QUEUE_PACKET = 2
 
     DISCONNECT_PROBE_INTERVAL = 5
+    RECEIVE_BUFFER_SIZE = 65536 # internal
+
+    ENUMERATE_CODEC = get_payload_codec('8s 8s c 3B 3B H B') # internal
+
+    CAPTURE_DIRECTION_RECEIVED = 0
+    CAPTURE_DIRECTION_SENT = 1
 
     class CallbackContext(object):
         def __init__(self):
@@ -581,6 +1122,285 @@ class IPConnection(object):
             self.thread = None
             self.packet_dispatch_allowed = False
             self.lock = None
+            self.worker_queues = []
+            self.worker_threads = []
+
+        def set_blocking(self, blocking):
+            for callback_queue in [self.queue] + self.worker_queues:
+                callback_queue.set_blocking(blocking)
+
+        def is_current_thread(self):
+            current_thread = threading.current_thread()
+
+            return current_thread is self.thread or current_thread in self.worker_threads
+
+    class CallbackQueue(object):
+        def __init__(self, max_size, count_dropped_callback):
+            self.max_size = max_size # maximum number of queued packets, 0 means unbounded
+            self.count_dropped_callback = count_dropped_callback
+            self.items = deque() # [kind, data, policy, key, receive_time] lists
+            self.packet_count = 0
+            self.latest_items = {} # (uid, function_id) -> queued item
+            self.blocking = True
+            self.block_allowed = True # False if the thread putting packets must never wait
+            self.condition = threading.Condition()
+
+        def qsize(self):
+            return len(self.items)
+
+        # meta and exit items are never blocked or dropped
+        def put(self, item):
+            with self.condition:
+                self.items.append([item[0], item[1], Device.CALLBACK_QUEUE_POLICY_BLOCK, None, None])
+                self.condition.notify_all()
+
+        def put_packet(self, packet, device, receive_time=None):
+            key = (get_uid_from_data(packet), get_function_id_from_data(packet))
+
+            if device is not None:
+                policy = device.callback_queue_policies.get(key[1], Device.CALLBACK_QUEUE_POLICY_BLOCK)
+            else:
+                policy = Device.CALLBACK_QUEUE_POLICY_BLOCK
+
+            if policy == Device.CALLBACK_QUEUE_POLICY_BLOCK and not self.block_allowed:
+                policy = Device.CALLBACK_QUEUE_POLICY_DROP_OLDEST
+
+            with self.condition:
+                if policy == Device.CALLBACK_QUEUE_POLICY_LATEST_VALUE:
+                    item = self.latest_items.get(key)
+
+                    if item is not None:
+                        item[1] = packet
+                        item[4] = receive_time
+                        self.count_dropped_callback(key)
+                        return
+
+                while self.max_size > 0 and self.packet_count >= self.max_size:
+                    if policy != Device.CALLBACK_QUEUE_POLICY_BLOCK:
+                        if not self.drop_oldest():
+                            self.count_dropped_callback(key)
+                            return
+                    elif self.blocking:
+                        self.condition.wait()
+                    else:
+                        break # disconnecting, queued packets are discarded anyway
+
+                item = [IPConnection.QUEUE_PACKET, packet, policy, key, receive_time]
+
+                if policy == Device.CALLBACK_QUEUE_POLICY_LATEST_VALUE:
+                    self.latest_items[key] = item
+
+                self.items.append(item)
+                self.packet_count += 1
+                self.condition.notify_all()
+
+        # assumes that condition is locked
+        def drop_oldest(self):
+            for i, item in enumerate(self.items):
+                if item[2] != Device.CALLBACK_QUEUE_POLICY_BLOCK:
+                    del self.items[i]
+                    self.forget(item)
+                    self.count_dropped_callback(item[3])
+
+                    return True
+
+            return False
+
+        # assumes that condition is locked
+        def forget(self, item):
+            if item[0] == IPConnection.QUEUE_PACKET:
+                self.packet_count -= 1
+
+                if self.latest_items.get(item[3]) is item:
+                    del self.latest_items[item[3]]
+
+        def get(self):
+            with self.condition:
+                while len(self.items) == 0:
+                    self.condition.wait()
+
+                item = self.items.popleft()
+
+                self.forget(item)
+                self.condition.notify_all()
+
+                return item[0], item[1], item[4]
+
+        def set_blocking(self, blocking):
+            with self.condition:
+                self.blocking = blocking
+                self.condition.notify_all()
+
+    class CaptureWriter(object):
+        def __init__(self, f):
+            self.file = f # protected by lock
+            self.lock = threading.Lock()
+
+            self.file.write(CAPTURE_FILE_MAGIC)
+
+        def write(self, direction, data):
+            timestamp = get_monotonic_time()
+
+            with self.lock:
+                if self.file is None:
+                    return # capture stopped in the meantime
+
+                # data might be a batch of packets, record them one by one
+                offset = 0
+
+                while offset < len(data):
+                    length = get_length_from_data(data[offset:offset + 5])
+
+                    self.file.write(CAPTURE_RECORD_HEADER.pack(timestamp, direction))
+                    self.file.write(data[offset:offset + length])
+
+                    offset += length
+
+        def close(self):
+            with self.lock:
+                self.file.close()
+                self.file = None
+
+    class Metrics(object):
+        LATENCY_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, float('inf')) # upper bounds in seconds
+
+        class Histogram(object):
+            def __init__(self):
+                self.count = 0
+                self.total = 0.0
+                self.min = None
+                self.max = None
+                self.buckets = [0] * len(IPConnection.Metrics.LATENCY_BUCKETS)
+
+            def add(self, value):
+                self.count += 1
+                self.total += value
+
+                if self.min is None or value < self.min:
+                    self.min = value
+
+                if self.max is None or value > self.max:
+                    self.max = value
+
+                self.buckets[bisect.bisect_left(IPConnection.Metrics.LATENCY_BUCKETS, value)] += 1
+
+            def get_snapshot(self):
+                return {'count': self.count,
+                        'mean': self.total / self.count,
+                        'min': self.min,
+                        'max': self.max,
+                        'buckets': list(zip(IPConnection.Metrics.LATENCY_BUCKETS, self.buckets))}
+
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.reset(get_monotonic_time())
+
+        # assumes that lock is locked
+        def reset(self, start_time):
+            self.start_time = start_time
+            self.request_latencies = {} # (uid, function_id) -> Histogram
+            self.callback_counts = {} # (uid, function_id) -> count
+            self.callback_delays = {} # (uid, function_id) -> Histogram
+            self.error_counts = {} # error code -> count
+            self.bytes_in = 0
+            self.bytes_out = 0
+
+        def add_request_latency(self, key, latency):
+            with self.lock:
+                histogram = self.request_latencies.get(key)
+
+                if histogram is None:
+                    histogram = IPConnection.Metrics.Histogram()
+                    self.request_latencies[key] = histogram
+
+                histogram.add(latency)
+
+        def add_callback(self, key):
+            with self.lock:
+                self.callback_counts[key] = self.callback_counts.get(key, 0) + 1
+
+        def add_callback_delay(self, key, delay):
+            with self.lock:
+                histogram = self.callback_delays.get(key)
+
+                if histogram is None:
+                    histogram = IPConnection.Metrics.Histogram()
+                    self.callback_delays[key] = histogram
+
+                histogram.add(delay)
+
+        def add_error(self, error_code):
+            with self.lock:
+                self.error_counts[error_code] = self.error_counts.get(error_code, 0) + 1
+
+        def add_bytes_in(self, count):
+            with self.lock:
+                self.bytes_in += count
+
+        def add_bytes_out(self, count):
+            with self.lock:
+                self.bytes_out += count
+
+        def get_snapshot(self, reset):
+            now = get_monotonic_time()
+
+            def encode_key(key):
+                return (base58encode(key[0]), key[1])
+
+            with self.lock:
+                duration = now - self.start_time
+                snapshot = {'time': now,
+                            'duration': duration,
+                            'requests': dict((encode_key(key), histogram.get_snapshot())
+                                             for key, histogram in self.request_latencies.items()),
+                            'callbacks': dict((encode_key(key), {'count': count,
+                                                                 'rate': count / duration if duration > 0 else 0.0})
+                                              for key, count in self.callback_counts.items()),
+                            'callback_delays': dict((encode_key(key), histogram.get_snapshot())
+                                                    for key, histogram in self.callback_delays.items()),
+                            'errors': dict(self.error_counts),
+                            'bytes_in': self.bytes_in,
+                            'bytes_out': self.bytes_out}
+
+                if reset:
+                    self.reset(now)
+
+            return snapshot
+
+    class CoalescedRequest(object):
+        def __init__(self):
+            self.event = threading.Event()
+            self.result = None
+            self.error = None
+
+        def set_result(self, result, error):
+            self.result = result
+            self.error = error
+            self.event.set()
+
+        def wait_for_result(self):
+            self.event.wait()
+
+            if self.error is not None:
+                raise self.error
+
+            return self.result
+
+    class PendingRequest(object):
+        def __init__(self, key):
+            self.key = key # (uid, function_id, sequence_number)
+            self.event = threading.Event()
+            self.response = None
+            self.send_time = None # only set if metrics are enabled
+
+        def set_response(self, response):
+            self.response = response
+            self.event.set()
+
+        def wait_for_response(self, timeout):
+            self.event.wait(timeout)
+
+            return self.response
 
     def __init__(self):
         """
@@ -591,6 +1411,7 @@ class IPConnection(object):
         self.host = None
         self.port = None
         self.timeout = 2.5
+        self.stream_window_size = 1
         self.auto_reconnect = True
         self.auto_reconnect_allowed = False
         self.auto_reconnect_pending = False
@@ -598,11 +1419,14 @@ class IPConnection(object):
         self.connect_failure_callback = None
         self.sequence_number_lock = threading.Lock()
         self.next_sequence_number = 0 # protected by sequence_number_lock
+        self.pending_requests = {} # protected by pending_requests_condition
+        self.pending_requests_condition = threading.Condition()
         self.authentication_lock = threading.Lock() # protects authentication handshake
         self.next_authentication_nonce = 0 # protected by authentication_lock
         self.devices = {}
         self.replace_lock = threading.Lock() # used to synchronize replacements in the devices dict
         self.registered_callbacks = {}
+        self.enumerate_listeners = () # replaced as a whole, so that it can be read without lock
         self.socket = None # protected by socket_lock
         self.socket_id = 0 # protected by socket_lock
         self.socket_lock = threading.Lock()
@@ -610,9 +1434,22 @@ class IPConnection(object):
         self.receive_flag = False
         self.receive_thread = None
         self.callback = None
+        self.callback_worker_count = 1
+        self.callback_queue_size = 0
+        self.callback_drop_counts = {} # protected by callback_drop_lock
+        self.callback_drop_lock = threading.Lock()
         self.disconnect_probe_flag = False
         self.disconnect_probe_queue = None
         self.disconnect_probe_thread = None
+        self.metrics = None
+        self.metrics_reporter_stop = None
+        self.capture = None
+        self.request_coalescing = False
+        self.result_cache_ttl = 0
+        self.coalesced_requests = {} # (uid, function_id, payload) -> CoalescedRequest, protected by coalescing_lock
+        self.result_cache = {} # (uid, function_id, payload) -> (expiry time, result), protected by coalescing_lock
+        self.coalescing_lock = threading.Lock()
+        self.callback_receive_time = threading.local()
         self.waiter = threading.Semaphore()
         self.brickd = BrickDaemon('2', self)
 
@@ -668,7 +1505,7 @@ class IPConnection(object):
                              IPConnection.DISCONNECT_REASON_REQUEST, None)))
         callback.queue.put((IPConnection.QUEUE_EXIT, None))
 
-        if threading.current_thread() is not callback.thread:
+        if not callback.is_current_thread():
             callback.thread.join()
 
     def authenticate(self, secret):
@@ -775,76 +1612,368 @@ class IPConnection(object):
 
         return self.timeout
 
-    def enumerate(self):
+    def set_stream_window_size(self, size):
         """
-        Broadcasts an enumerate request. All devices will respond with an
-        enumerate callback.
+        Sets the maximum number of chunks that high-level stream setters send
+        before waiting for the response to the first of them. This only
+        affects stream setters that send a response, that is if the response
+        expected flag of their low-level function is enabled. Stream setters
+        with short write support always wait for each response, because
+        a short write ends the stream.
+
+        The size can be at most 15, the number of sequence numbers available
+        to match responses to requests.
+
+        Default value is 1, every chunk waits for its response.
         """
 
-        request, _, _ = self.create_packet_header(None, 8, IPConnection.FUNCTION_ENUMERATE)
+        size = int(size)
 
-        self.send(request)
+        if size < 1 or size > 15:
+            raise ValueError('Stream window size has to be in [1..15]')
 
-    def wait(self):
+        self.stream_window_size = size
+
+    def get_stream_window_size(self):
+        """
+        Returns the stream window size as set by set_stream_window_size.
         """
-        Stops the current thread until unwait is called.
 
-        This is useful if you rely solely on callbacks for events, if you want
-        to wait for a specific callback or if the IP Connection was created in
-        a thread.
+        return self.stream_window_size
 
-        Wait and unwait act in the same way as "acquire" and "release" of a
-        semaphore.
+    def set_callback_worker_count(self, count):
         """
-        self.waiter.acquire()
-
-    def unwait(self):
+        Sets the number of worker threads that execute device callbacks. With
+        more than one worker the callbacks are distributed by device UID, so
+        that a slow callback function of one device does not delay the
+        callbacks of devices handled by other workers. The callbacks of a
+        single device are always executed in order by the same worker. The
+        connected and disconnected callbacks are still executed by the
+        callback thread.
+
+        The new count takes effect the next time the callback thread is
+        started, that is on the next call of connect after a disconnect.
+
+        Default value is 1, all callbacks are executed by the callback thread.
         """
-        Unwaits the thread previously stopped by wait.
 
-        Wait and unwait act in the same way as "acquire" and "release" of
-        a semaphore.
+        count = int(count)
+
+        if count < 1:
+            raise ValueError('Callback worker count has to be at least 1')
+
+        self.callback_worker_count = count
+
+    def get_callback_worker_count(self):
+        """
+        Returns the callback worker count as set by set_callback_worker_count.
         """
-        self.waiter.release()
 
-    def register_callback(self, callback_id, function):
+        return self.callback_worker_count
+
+    def get_callback_queue_depths(self):
         """
-        Registers the given *function* with the given *callback_id*.
+        Returns a list with the number of callbacks waiting to be executed
+        for each callback worker. With a single worker this is the number of
+        items in the queue of the callback thread. Returns an empty list if
+        the callback thread is not running.
         """
-        if function is None:
-            self.registered_callbacks.pop(callback_id, None)
-        else:
-            self.registered_callbacks[callback_id] = function
 
-    # internal
-    def connect_unlocked(self, is_auto_reconnect):
-        # NOTE: assumes that socket is None and socket_lock is locked
+        callback = self.callback
 
-        # create callback thread and queue
-        if self.callback is None:
-            try:
-                self.callback = IPConnection.CallbackContext()
-                self.callback.queue = queue.Queue()
-                self.callback.packet_dispatch_allowed = False
-                self.callback.lock = threading.Lock()
-                self.callback.thread = threading.Thread(name='Callback-Processor',
-                                                        target=self.callback_loop,
-                                                        args=(self.callback,))
-                self.callback.thread.daemon = True
-                self.callback.thread.start()
-            except:
-                self.callback = None
-                raise
+        if callback is None:
+            return []
 
-        # create and connect socket
-        try:
-            tmp = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            tmp.settimeout(5)
-            tmp.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-            tmp.connect((self.host, self.port))
+        if len(callback.worker_queues) > 0:
+            return [worker_queue.qsize() for worker_queue in callback.worker_queues]
 
-            if sys.platform == 'win32':
-                # for some unknown reason the socket recv() call does not
+        return [callback.queue.qsize()]
+
+    def set_callback_queue_size(self, size):
+        """
+        Sets the maximum number of callbacks that can wait to be executed in
+        the callback queue, or in the queue of each callback worker. What
+        happens if a queue is full depends on the callback queue policy of
+        each callback, see the set_callback_queue_policy function of the
+        devices.
+
+        The new size takes effect the next time the callback thread is
+        started, that is on the next call of connect after a disconnect.
+
+        Default value is 0, the callback queue is unbounded.
+        """
+
+        size = int(size)
+
+        if size < 0:
+            raise ValueError('Callback queue size cannot be negative')
+
+        self.callback_queue_size = size
+
+    def get_callback_queue_size(self):
+        """
+        Returns the callback queue size as set by set_callback_queue_size.
+        """
+
+        return self.callback_queue_size
+
+    def get_callback_drop_count(self):
+        """
+        Returns the total number of callbacks of all devices that were dropped
+        or replaced by a newer one due to their callback queue policy.
+        """
+
+        with self.callback_drop_lock:
+            return sum(self.callback_drop_counts.values())
+
+    def set_metrics_enabled(self, enabled):
+        """
+        Enables or disables the collection of metrics: request latencies and
+        error counts per device function, callback rates and delays, callback
+        queue depths and the number of bytes sent and received. Disabling the
+        metrics discards the collected values and stops the metrics reporter.
+
+        Default value is *False*. Disabled metrics have no runtime cost.
+        """
+
+        if enabled:
+            if self.metrics is None:
+                self.metrics = IPConnection.Metrics()
+        else:
+            self.set_metrics_reporter(None)
+            self.metrics = None
+
+    def get_metrics_enabled(self):
+        """
+        Returns *True* if metrics are enabled, as set by set_metrics_enabled.
+        """
+
+        return self.metrics is not None
+
+    def get_metrics(self, reset=False):
+        """
+        Returns a snapshot of the metrics collected since they were enabled or
+        last reset as a dict, or *None* if metrics are disabled. If *reset* is
+        *True* then the metrics are reset after taking the snapshot.
+
+        The snapshot contains:
+
+        * time: monotonic time of the snapshot in seconds
+        * duration: seconds since the metrics were enabled or reset
+        * requests: request latency histogram per (UID, function ID)
+        * callbacks: count and rate per second per (UID, function ID)
+        * callback_delays: histogram of the time between receiving and
+          dispatching a callback per (UID, function ID)
+        * callback_queue_depths: as returned by get_callback_queue_depths
+        * callback_drop_count: as returned by get_callback_drop_count
+        * errors: count per Error code, for example Error.TIMEOUT
+        * bytes_in and bytes_out: number of bytes received and sent
+
+        A histogram is a dict with count, mean, min, max in seconds and a
+        list of (upper bound, count) buckets.
+        """
+
+        metrics = self.metrics
+
+        if metrics is None:
+            return None
+
+        snapshot = metrics.get_snapshot(reset)
+        snapshot['callback_queue_depths'] = self.get_callback_queue_depths()
+        snapshot['callback_drop_count'] = self.get_callback_drop_count()
+
+        return snapshot
+
+    def set_metrics_reporter(self, reporter, interval=10.0):
+        """
+        Sets a function that is called with a snapshot of the metrics, as
+        returned by get_metrics, every *interval* seconds while metrics are
+        enabled. The function is called from a separate reporter thread.
+        Pass *None* to remove the reporter.
+        """
+
+        if self.metrics_reporter_stop is not None:
+            self.metrics_reporter_stop.set()
+            self.metrics_reporter_stop = None
+
+        if reporter is None:
+            return
+
+        interval = float(interval)
+
+        if interval <= 0:
+            raise ValueError('Metrics reporter interval has to be positive')
+
+        self.metrics_reporter_stop = threading.Event()
+
+        thread = threading.Thread(name='Metrics-Reporter',
+                                  target=self.metrics_reporter_loop,
+                                  args=(reporter, interval, self.metrics_reporter_stop))
+        thread.daemon = True
+        thread.start()
+
+    def get_callback_receive_time(self):
+        """
+        Returns the monotonic time in seconds at which the callback that is
+        currently executed in the calling thread was received, or *None* if
+        metrics are disabled or the calling thread is not executing a callback.
+        """
+
+        return getattr(self.callback_receive_time, 'value', None)
+
+    def set_request_coalescing(self, coalescing):
+        """
+        Enables or disables the coalescing of concurrent identical getter
+        calls. If enabled, a getter call with the same device, function and
+        parameters as a getter call that is still waiting for its response
+        doesn't send another request, but shares the pending response.
+        Functions that return a value but change the device state, such as
+        reading a frame, are never coalesced.
+
+        Default value is *False*.
+        """
+
+        self.request_coalescing = bool(coalescing)
+
+    def get_request_coalescing(self):
+        """
+        Returns *True* if request coalescing is enabled, as set by
+        set_request_coalescing.
+        """
+
+        return self.request_coalescing
+
+    def set_result_cache_ttl(self, ttl):
+        """
+        Sets the time in seconds for which the results of getters that never
+        change while a device is running, such as get_identity, are cached.
+        The cache is cleared on every (re-)connect.
+
+        Default value is 0, results are not cached.
+        """
+
+        ttl = float(ttl)
+
+        if ttl < 0:
+            raise ValueError('Result cache TTL cannot be negative')
+
+        self.result_cache_ttl = ttl
+
+        if ttl == 0:
+            self.clear_result_cache()
+
+    def get_result_cache_ttl(self):
+        """
+        Returns the result cache TTL as set by set_result_cache_ttl.
+        """
+
+        return self.result_cache_ttl
+
+    def start_capture(self, filename):
+        """
+        Starts recording every packet sent and received by this IP Connection
+        with its direction and a monotonic timestamp to the given file. The
+        file can be replayed with a ReplayIPConnection. Start the capture
+        before creating and using the devices, so that their identity checks
+        are recorded as well.
+        """
+
+        if self.capture is not None:
+            raise ValueError('Capture is already started')
+
+        self.capture = IPConnection.CaptureWriter(open(filename, 'wb'))
+
+    def stop_capture(self):
+        """
+        Stops the recording started by start_capture and closes the file.
+        """
+
+        capture = self.capture
+        self.capture = None
+
+        if capture is not None:
+            capture.close()
+
+    def enumerate(self):
+        """
+        Broadcasts an enumerate request. All devices will respond with an
+        enumerate callback.
+        """
+
+        request, _, _ = self.create_packet_header(None, 8, IPConnection.FUNCTION_ENUMERATE)
+
+        self.send(request)
+
+    def wait(self):
+        """
+        Stops the current thread until unwait is called.
+
+        This is useful if you rely solely on callbacks for events, if you want
+        to wait for a specific callback or if the IP Connection was created in
+        a thread.
+
+        Wait and unwait act in the same way as "acquire" and "release" of a
+        semaphore.
+        """
+        self.waiter.acquire()
+
+    def unwait(self):
+        """
+        Unwaits the thread previously stopped by wait.
+
+        Wait and unwait act in the same way as "acquire" and "release" of
+        a semaphore.
+        """
+        self.waiter.release()
+
+    def register_callback(self, callback_id, function):
+        """
+        Registers the given *function* with the given *callback_id*.
+        """
+        if function is None:
+            self.registered_callbacks.pop(callback_id, None)
+        else:
+            self.registered_callbacks[callback_id] = function
+
+    def add_enumerate_listener(self, listener):
+        """
+        Adds the given *listener* function that is called with the same
+        arguments as the enumerate callback for every enumerate callback.
+        In contrast to register_callback this doesn't replace the registered
+        enumerate callback, so multiple components can follow the enumerate
+        callbacks at the same time. Listeners are called before the
+        registered enumerate callback.
+        """
+
+        self.enumerate_listeners = self.enumerate_listeners + (listener,)
+
+    def remove_enumerate_listener(self, listener):
+        """
+        Removes the given *listener* function added by add_enumerate_listener.
+        """
+
+        self.enumerate_listeners = tuple([l for l in self.enumerate_listeners if l != listener])
+
+    # internal
+    def connect_unlocked(self, is_auto_reconnect):
+        # NOTE: assumes that socket is None and socket_lock is locked
+
+        # cached results might be outdated after a reconnect
+        self.clear_result_cache()
+
+        # create callback thread and queue
+        if self.callback is None:
+            self.callback = self.create_callback()
+
+        # create and connect socket
+        try:
+            tmp = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            tmp.settimeout(5)
+            tmp.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            tmp.connect((self.host, self.port))
+
+            if sys.platform == 'win32':
+                # for some unknown reason the socket recv() call does not
                 # immediate return on Windows if the socket gets shut down on
                 # disconnect. the socket recv() call will still block for
                 # several seconds before it returns. this in turn blocks the
@@ -874,7 +2003,7 @@ class IPConnection(object):
                     if not is_auto_reconnect:
                         self.callback.queue.put((IPConnection.QUEUE_EXIT, None))
 
-                        if threading.current_thread() is not self.callback.thread:
+                        if not self.callback.is_current_thread():
                             self.callback.thread.join()
 
                         self.callback = None
@@ -906,7 +2035,7 @@ class IPConnection(object):
                 if not is_auto_reconnect:
                     self.callback.queue.put((IPConnection.QUEUE_EXIT, None))
 
-                    if threading.current_thread() is not self.callback.thread:
+                    if not self.callback.is_current_thread():
                         self.callback.thread.join()
 
                     self.callback = None
@@ -916,6 +2045,7 @@ class IPConnection(object):
 
         # create receive thread
         self.callback.packet_dispatch_allowed = True
+        self.callback.set_blocking(True)
 
         try:
             self.receive_flag = True
@@ -935,7 +2065,7 @@ class IPConnection(object):
                 if not is_auto_reconnect:
                     self.callback.queue.put((IPConnection.QUEUE_EXIT, None))
 
-                    if threading.current_thread() is not self.callback.thread:
+                    if not self.callback.is_current_thread():
                         self.callback.thread.join()
 
                     self.callback = None
@@ -955,6 +2085,38 @@ class IPConnection(object):
                                  (IPConnection.CALLBACK_CONNECTED,
                                   connect_reason, None)))
 
+    # internal
+    def create_callback(self):
+        callback = IPConnection.CallbackContext()
+        callback.queue = IPConnection.CallbackQueue(self.callback_queue_size,
+                                                    self.count_dropped_callback)
+        callback.packet_dispatch_allowed = False
+        callback.lock = threading.Lock()
+
+        if self.callback_worker_count > 1:
+            for i in range(self.callback_worker_count):
+                worker_queue = IPConnection.CallbackQueue(self.callback_queue_size,
+                                                          self.count_dropped_callback)
+                worker_thread = threading.Thread(name='Callback-Worker-{0}'.format(i),
+                                                 target=self.callback_worker_loop,
+                                                 args=(callback, worker_queue))
+                worker_thread.daemon = True
+
+                callback.worker_queues.append(worker_queue)
+                callback.worker_threads.append(worker_thread)
+
+        callback.thread = threading.Thread(name='Callback-Processor',
+                                           target=self.callback_loop,
+                                           args=(callback,))
+        callback.thread.daemon = True
+
+        for worker_thread in callback.worker_threads:
+            worker_thread.start()
+
+        callback.thread.start()
+
+        return callback
+
     # internal
     def disconnect_unlocked(self):
         # NOTE: assumes that socket is not None and socket_lock is locked
@@ -967,7 +2129,7 @@ class IPConnection(object):
         # stop dispatching packet callbacks before ending the receive
         # thread to avoid timeout exceptions due to callback functions
         # trying to call getters
-        if threading.current_thread() is not self.callback.thread:
+        if not self.callback.is_current_thread():
             # FIXME: cannot hold callback lock here because this can
             #        deadlock due to an ordering problem with the socket lock
             #with self.callback.lock:
@@ -976,6 +2138,9 @@ class IPConnection(object):
         else:
             self.callback.packet_dispatch_allowed = False
 
+        # the receive thread might be blocked on a full callback queue
+        self.callback.set_blocking(False)
+
         # end receive thread
         self.receive_flag = False
 
@@ -1009,14 +2174,17 @@ class IPConnection(object):
 
     # internal
     def receive_loop(self, socket_id):
-        if sys.hexversion < 0x03000000:
-            pending_data = ''
-        else:
-            pending_data = bytes()
+        # receive into a preallocated buffer and copy complete packets out of
+        # it. only the trailing incomplete packet (less than 256 bytes) is moved
+        # to the front of the buffer after each receive, instead of copying the
+        # whole pending data for every packet
+        buffer = bytearray(IPConnection.RECEIVE_BUFFER_SIZE)
+        view = memoryview(buffer)
+        pending_length = 0
 
         while self.receive_flag:
             try:
-                data = self.socket.recv(8192)
+                received = self.socket.recv_into(view[pending_length:])
             except socket.timeout:
                 continue
             except socket.error:
@@ -1028,28 +2196,41 @@ class IPConnection(object):
                     self.handle_disconnect_by_peer(IPConnection.DISCONNECT_REASON_ERROR, socket_id, False)
                 break
 
-            if len(data) == 0:
+            if received == 0:
                 if self.receive_flag:
                     self.handle_disconnect_by_peer(IPConnection.DISCONNECT_REASON_SHUTDOWN, socket_id, False)
                 break
 
-            pending_data += data
+            pending_length = self.handle_received_data(buffer, view, pending_length + received)
 
-            while self.receive_flag:
-                if len(pending_data) < 8:
-                    # Wait for complete header
-                    break
+    # internal
+    def handle_received_data(self, buffer, view, end):
+        # handles all complete packets in the buffer and returns the length of
+        # the remaining incomplete packet, that got moved to the buffer start
+        start = 0
+
+        while self.receive_flag:
+            if end - start < 8:
+                # Wait for complete header
+                break
 
-                length = get_length_from_data(pending_data)
+            length = buffer[start + 4]
 
-                if len(pending_data) < length:
-                    # Wait for complete packet
-                    break
+            if end - start < length:
+                # Wait for complete packet
+                break
 
-                packet = pending_data[0:length]
-                pending_data = pending_data[length:]
+            packet = view[start:start + length].tobytes()
+            start += length
 
-                self.handle_response(packet)
+            self.handle_response(packet)
+
+        pending_length = end - start
+
+        if pending_length > 0 and start > 0:
+            buffer[:pending_length] = buffer[start:end]
+
+        return pending_length
 
     # internal
     def dispatch_meta(self, function_id, parameter, socket_id):
@@ -1117,8 +2298,9 @@ class IPConnection(object):
 
         if function_id == IPConnection.CALLBACK_ENUMERATE:
             cb = self.registered_callbacks.get(IPConnection.CALLBACK_ENUMERATE)
+            listeners = self.enumerate_listeners
 
-            if cb == None:
+            if cb == None and len(listeners) == 0:
                 return
 
             if len(packet) != 34:
@@ -1126,10 +2308,15 @@ class IPConnection(object):
 
             uid, connected_uid, position, hardware_version, \
                 firmware_version, device_identifier, enumeration_type = \
-                unpack_payload(payload, '8s 8s c 3B 3B H B')
+                IPConnection.ENUMERATE_CODEC.unpack(payload)
 
-            cb(uid, connected_uid, position, hardware_version,
-               firmware_version, device_identifier, enumeration_type)
+            for listener in listeners:
+                listener(uid, connected_uid, position, hardware_version,
+                         firmware_version, device_identifier, enumeration_type)
+
+            if cb != None:
+                cb(uid, connected_uid, position, hardware_version,
+                   firmware_version, device_identifier, enumeration_type)
 
             return
 
@@ -1143,14 +2330,21 @@ class IPConnection(object):
         except Error:
             return # silently ignoring callback for invalid device
 
+        self.dispatch_callback(device, packet)
+
+    # internal
+    def dispatch_callback(self, device, packet):
+        function_id = get_function_id_from_data(packet)
+        payload = packet[8:]
+
         if -function_id in device.high_level_callbacks:
-            hlcb = device.high_level_callbacks[-function_id] # [roles, options, data]
+            hlcb = device.high_level_callbacks[-function_id] # (roles, options)
             length, form = device.callback_formats[function_id] # FIXME: currently assuming that low-level callback has more than one element
 
             if len(packet) != length:
                 return # silently ignoring callback with wrong length
 
-            llvalues = unpack_payload(payload, form)
+            llvalues = get_payload_codec(device.get_stream_codec(form, hlcb[0].index('stream_chunk_data'))).unpack(payload)
             has_data = False
             data = None
 
@@ -1166,28 +2360,38 @@ class IPConnection(object):
 
             chunk_data = llvalues[hlcb[0].index('stream_chunk_data')]
 
-            if hlcb[2] == None: # no stream in-progress
+            # the stream state is per instance, while the high-level callback
+            # table can be shared by all instances of the device class
+            if device.high_level_streams == None:
+                device.high_level_streams = {}
+
+            stream = device.high_level_streams.get(-function_id)
+
+            if stream == None: # no stream in-progress
                 if chunk_offset == 0: # stream starts
-                    hlcb[2] = chunk_data
+                    stream = device.create_stream_reassembler(length, hlcb[1].get('item_format'))
+                    stream.add_chunk(chunk_data)
 
-                    if len(hlcb[2]) >= length: # stream complete
+                    if stream.offset >= length: # stream complete
                         has_data = True
-                        data = hlcb[2][:length]
-                        hlcb[2] = None
+                        data = stream.get_data(length)
+                        stream = None
                 else: # ignore tail of current stream, wait for next stream start
                     pass
             else: # stream in-progress
-                if chunk_offset != len(hlcb[2]): # stream out-of-sync
+                if chunk_offset != stream.offset: # stream out-of-sync
                     has_data = True
                     data = None
-                    hlcb[2] = None
+                    stream = None
                 else: # stream in-sync
-                    hlcb[2] += chunk_data
+                    stream.add_chunk(chunk_data)
 
-                    if len(hlcb[2]) >= length: # stream complete
+                    if stream.offset >= length: # stream complete
                         has_data = True
-                        data = hlcb[2][:length]
-                        hlcb[2] = None
+                        data = stream.get_data(length)
+                        stream = None
+
+            device.high_level_streams[-function_id] = stream
 
             cb = device.registered_callbacks.get(-function_id)
 
@@ -1213,30 +2417,85 @@ class IPConnection(object):
             if len(packet) != length:
                 return # silently ignoring callback with wrong length
 
-            if len(form) == 0:
+            codec = get_payload_codec(form)
+
+            if len(codec.fields) == 0:
                 cb()
-            elif ' ' not in form:
-                cb(unpack_payload(payload, form))
+            elif len(codec.fields) == 1:
+                cb(codec.unpack(payload))
             else:
-                cb(*unpack_payload(payload, form))
+                cb(*codec.unpack(payload))
 
     # internal
     def callback_loop(self, callback):
         while True:
-            kind, data = callback.queue.get()
+            kind, data, receive_time = callback.queue.get()
 
             # FIXME: cannot hold callback lock here because this can
             #        deadlock due to an ordering problem with the socket lock
             #with callback.lock:
             if True:
                 if kind == IPConnection.QUEUE_EXIT:
+                    for worker_queue in callback.worker_queues:
+                        worker_queue.put((IPConnection.QUEUE_EXIT, None))
+
+                    for worker_thread in callback.worker_threads:
+                        worker_thread.join()
+
                     break
                 elif kind == IPConnection.QUEUE_META:
                     self.dispatch_meta(*data)
                 elif kind == IPConnection.QUEUE_PACKET:
+                    if len(callback.worker_queues) > 0:
+                        # shard packets by UID, so that the callbacks of a
+                        # device are always dispatched by the same worker in
+                        # the order they were received
+                        uid = get_uid_from_data(data)
+                        worker_index = uid % len(callback.worker_queues)
+
+                        callback.worker_queues[worker_index].put_packet(data, self.devices.get(uid), receive_time)
                     # don't dispatch callbacks when the receive thread isn't running
-                    if callback.packet_dispatch_allowed:
-                        self.dispatch_packet(data)
+                    elif callback.packet_dispatch_allowed:
+                        self.dispatch_queued_packet(data, receive_time)
+
+    # internal
+    def callback_worker_loop(self, callback, worker_queue):
+        while True:
+            kind, data, receive_time = worker_queue.get()
+
+            if kind == IPConnection.QUEUE_EXIT:
+                break
+            elif kind == IPConnection.QUEUE_PACKET:
+                # don't dispatch callbacks when the receive thread isn't running
+                if callback.packet_dispatch_allowed:
+                    self.dispatch_queued_packet(data, receive_time)
+
+    # internal
+    def dispatch_queued_packet(self, packet, receive_time):
+        metrics = self.metrics
+
+        # receive_time is only set if metrics were enabled on receive
+        if receive_time is None or metrics is None:
+            self.dispatch_packet(packet)
+            return
+
+        metrics.add_callback_delay((get_uid_from_data(packet), get_function_id_from_data(packet)),
+                                   get_monotonic_time() - receive_time)
+
+        self.callback_receive_time.value = receive_time
+
+        try:
+            self.dispatch_packet(packet)
+        finally:
+            self.callback_receive_time.value = None
+
+    # internal
+    def metrics_reporter_loop(self, reporter, interval, stop):
+        while not stop.wait(interval):
+            snapshot = self.get_metrics()
+
+            if snapshot is not None:
+                reporter(snapshot)
 
     # internal
     # NOTE: the disconnect probe thread is not allowed to hold the socket_lock at any
@@ -1271,75 +2530,330 @@ class IPConnection(object):
     def send(self, packet):
         with self.socket_lock:
             if self.socket is None:
+                if self.metrics is not None:
+                    self.metrics.add_error(Error.NOT_CONNECTED)
+
                 raise Error(Error.NOT_CONNECTED, 'Not connected')
 
             try:
                 with self.socket_send_lock:
-                    while True:
+                    # record before sending, the response might be received
+                    # before the send call returns
+                    if self.capture is not None:
+                        self.capture.write(IPConnection.CAPTURE_DIRECTION_SENT, packet)
+
+                    offset = 0
+
+                    # a batch of packets might not be sent in one go
+                    while offset < len(packet):
                         try:
-                            self.socket.send(packet)
-                            break
+                            offset += self.socket.send(packet[offset:])
                         except socket.timeout:
                             continue
             except socket.error:
+                if self.metrics is not None:
+                    self.metrics.add_error(Error.NOT_CONNECTED)
+
                 self.handle_disconnect_by_peer(IPConnection.DISCONNECT_REASON_ERROR, None, True)
                 raise Error(Error.NOT_CONNECTED, 'Not connected', suppress_context=True)
 
             self.disconnect_probe_flag = False
 
+            if self.metrics is not None:
+                self.metrics.add_bytes_out(len(packet))
+
     # internal
     def send_request(self, device, function_id, data, form, length_ret, form_ret):
-        payload = pack_payload(data, form)
-        header, response_expected, sequence_number = self.create_packet_header(device, 8 + len(payload), function_id)
-        request = header + payload
+        # form and form_ret can be given as PayloadCodec objects or as form strings
+        if (self.request_coalescing or self.result_cache_ttl > 0) and \
+           function_id in device.side_effect_free_functions:
+            return self.send_coalesced_request(device, function_id, data, form, length_ret, form_ret)
 
-        if response_expected:
-            with device.request_lock:
-                device.expected_response_function_id = function_id
-                device.expected_response_sequence_number = sequence_number
+        return self.send_single_request(device, function_id, data, form, length_ret, form_ret)
 
-                try:
+    # internal
+    def send_coalesced_request(self, device, function_id, data, form, length_ret, form_ret):
+        key = (device.uid, function_id, get_payload_codec(form).pack(data))
+        cacheable = self.result_cache_ttl > 0 and function_id in device.stable_functions
+        coalesced_request = None
+
+        with self.coalescing_lock:
+            if cacheable:
+                cached = self.result_cache.get(key)
+
+                if cached is not None and cached[0] > get_monotonic_time():
+                    return copy_result(cached[1])
+
+            if self.request_coalescing:
+                coalesced_request = self.coalesced_requests.get(key)
+
+                if coalesced_request is not None:
+                    is_leader = False
+                else:
+                    coalesced_request = IPConnection.CoalescedRequest()
+                    is_leader = True
+
+                    self.coalesced_requests[key] = coalesced_request
+
+        if coalesced_request is not None and not is_leader:
+            return copy_result(coalesced_request.wait_for_result())
+
+        result = None
+        error = None
+
+        try:
+            result = self.send_single_request(device, function_id, data, form, length_ret, form_ret)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            with self.coalescing_lock:
+                if coalesced_request is not None:
+                    del self.coalesced_requests[key]
+
+                if cacheable and error is None and self.result_cache_ttl > 0:
+                    self.result_cache[key] = (get_monotonic_time() + self.result_cache_ttl, result)
+
+            if coalesced_request is not None:
+                coalesced_request.set_result(result, error)
+
+        return copy_result(result)
+
+    # internal
+    def clear_result_cache(self):
+        with self.coalescing_lock:
+            self.result_cache = {}
+
+    # internal
+    def send_single_request(self, device, function_id, data, form, length_ret, form_ret):
+        request, pending_request = self.create_request(device, function_id, data, form, self.timeout)
+
+        if pending_request is None:
+            self.send(request)
+            return
+
+        try:
+            self.send(request)
+
+            response = pending_request.wait_for_response(self.timeout)
+        finally:
+            self.remove_pending_request(pending_request)
+
+        return self.unpack_response(response, function_id, length_ret, form_ret)
+
+    def send_requests(self, requests):
+        """
+        Sends a list of low-level requests at once and returns the list of
+        their results in the same order. Each request is a tuple of
+        (device, function_id, data, form, length_ret, form_ret), as passed
+        to send_request. The result of a request without response is *None*.
+
+        The requests are written to the socket with as few send calls as
+        possible. A function of a device can only have 15 requests in-flight,
+        further requests for it are sent when earlier ones are done. If any
+        request fails then the first error is raised after all responses
+        have been received or have timed out.
+        """
+
+        requests = list(requests)
+        results = []
+        error = None
+
+        while len(results) < len(requests):
+            # a function of a device can only have 15 requests in-flight at the
+            # same time, because they are matched by their sequence number
+            chunk = []
+            in_flight = {}
+
+            for request in requests[len(results) + len(chunk):]:
+                device, function_id = request[:2]
+
+                if device.get_response_expected(function_id):
+                    key = (device.uid, function_id)
+
+                    if in_flight.get(key, 0) == 15:
+                        break
+
+                    in_flight[key] = in_flight.get(key, 0) + 1
+
+                chunk.append(request)
+
+            pending_requests = []
+
+            try:
+                packets = []
+
+                for device, function_id, data, form, _, _ in chunk:
+                    # don't wait for a free sequence number while holding
+                    # unsent ones, another batch might wait for those. send
+                    # the requests created so far, the rest follows later
+                    if len(packets) == 0:
+                        timeout = self.timeout
+                    else:
+                        timeout = 0
+
+                    try:
+                        packet, pending_request = self.create_request(device, function_id, data, form, timeout)
+                    except Error as e:
+                        if e.value != Error.TIMEOUT or len(packets) == 0:
+                            raise
+
+                        chunk = chunk[:len(packets)]
+                        break
+
+                    packets.append(packet)
+                    pending_requests.append(pending_request)
+
+                self.send(b''.join(packets))
+
+                deadline = get_monotonic_time() + self.timeout
+
+                for request, pending_request in zip(chunk, pending_requests):
+                    if pending_request is None:
+                        results.append(None)
+                        continue
+
+                    response = pending_request.wait_for_response(max(deadline - get_monotonic_time(), 0))
+
+                    try:
+                        results.append(self.unpack_response(response, request[1], request[4], request[5]))
+                    except Error as e:
+                        if error is None:
+                            error = e
+
+                        results.append(None)
+            finally:
+                for pending_request in pending_requests:
+                    if pending_request is not None:
+                        self.remove_pending_request(pending_request)
+
+        if error is not None:
+            raise error
+
+        return results
+
+    # internal
+    def send_stream_requests(self, device, function_id, requests, form, length_ret, form_ret):
+        # sends the chunk requests of a stream in order, keeping up to
+        # stream_window_size of them in-flight. returns the result of the
+        # last request, as the sequential loop over the low-level function did
+        in_flight = deque()
+        ret = None
+
+        try:
+            for data in requests:
+                request, pending_request = self.create_request(device, function_id, data, form, self.timeout)
+
+                if pending_request is None:
                     self.send(request)
+                    continue
 
-                    while True:
-                        response = device.response_queue.get(True, self.timeout)
-
-                        if function_id == get_function_id_from_data(response) and \
-                           sequence_number == get_sequence_number_from_data(response):
-                            # ignore old responses that arrived after the timeout expired, but before setting
-                            # expected_response_function_id and expected_response_sequence_number back to None
-                            break
-                except queue.Empty:
-                    msg = 'Did not receive response for function {0} in time'.format(function_id)
-                    raise Error(Error.TIMEOUT, msg, suppress_context=True)
-                finally:
-                    device.expected_response_function_id = None
-                    device.expected_response_sequence_number = None
-
-            error_code = get_error_code_from_data(response)
-
-            if error_code == 0:
-                if length_ret == 0:
-                    length_ret = 8 # setter with response-expected enabled
-
-                if len(response) != length_ret:
-                    msg = 'Expected response of {0} byte for function ID {1}, got {2} byte instead' \
-                          .format(length_ret, function_id, len(response))
-                    raise Error(Error.WRONG_RESPONSE_LENGTH, msg)
-            elif error_code == 1:
-                msg = 'Got invalid parameter for function {0}'.format(function_id)
-                raise Error(Error.INVALID_PARAMETER, msg)
-            elif error_code == 2:
-                msg = 'Function {0} is not supported'.format(function_id)
-                raise Error(Error.NOT_SUPPORTED, msg)
-            else:
-                msg = 'Function {0} returned an unknown error'.format(function_id)
-                raise Error(Error.UNKNOWN_ERROR_CODE, msg)
+                in_flight.append(pending_request)
+                self.send(request)
+
+                if len(in_flight) >= self.stream_window_size:
+                    ret = self.wait_for_stream_response(in_flight, function_id, length_ret, form_ret)
+
+            while len(in_flight) > 0:
+                ret = self.wait_for_stream_response(in_flight, function_id, length_ret, form_ret)
+        finally:
+            for pending_request in in_flight:
+                self.remove_pending_request(pending_request)
+
+        return ret
+
+    # internal
+    def wait_for_stream_response(self, in_flight, function_id, length_ret, form_ret):
+        pending_request = in_flight.popleft()
+
+        try:
+            response = pending_request.wait_for_response(self.timeout)
+        finally:
+            self.remove_pending_request(pending_request)
+
+        return self.unpack_response(response, function_id, length_ret, form_ret)
+
+    # internal
+    def create_request(self, device, function_id, data, form, timeout=None):
+        payload = get_payload_codec(form).pack(data)
+
+        if device.get_response_expected(function_id):
+            # multiple requests to the same device can be in-flight at the same
+            # time. their responses are matched by uid, function ID and sequence
+            # number in handle_response
+            pending_request = self.add_pending_request(device, function_id, timeout)
+
+            if pending_request is None:
+                msg = 'No free sequence number for function {0} in time'.format(function_id)
+                raise Error(Error.TIMEOUT, msg)
 
-            if len(form_ret) > 0:
-                return unpack_payload(response[8:], form_ret)
+            header, _, _ = self.create_packet_header(device, 8 + len(payload), function_id,
+                                                     pending_request.key[2])
+
+            if self.metrics is not None:
+                pending_request.send_time = get_monotonic_time()
         else:
-            self.send(request)
+            pending_request = None
+            header, _, _ = self.create_packet_header(device, 8 + len(payload), function_id)
+
+        return header + payload, pending_request
+
+    # internal
+    def unpack_response(self, response, function_id, length_ret, form_ret):
+        try:
+            if response is None:
+                msg = 'Did not receive response for function {0} in time'.format(function_id)
+                raise Error(Error.TIMEOUT, msg)
+
+            check_response(response, function_id, length_ret)
+        except Error as e:
+            if self.metrics is not None:
+                self.metrics.add_error(e.value)
+
+            raise
+
+        codec_ret = get_payload_codec(form_ret)
+
+        if len(codec_ret.fields) > 0:
+            return codec_ret.unpack(response[8:])
+
+    # internal
+    def add_pending_request(self, device, function_id, timeout=None):
+        # returns None if no sequence number got free within the timeout
+        if timeout is not None:
+            deadline = get_monotonic_time() + timeout
+
+        with self.pending_requests_condition:
+            while True:
+                # try all 15 sequence numbers, one of them might not be in use
+                # for this function of this device
+                for _ in range(15):
+                    key = (device.uid, function_id, self.get_next_sequence_number())
+
+                    if key not in self.pending_requests:
+                        pending_request = IPConnection.PendingRequest(key)
+                        self.pending_requests[key] = pending_request
+
+                        return pending_request
+
+                if timeout is None:
+                    self.pending_requests_condition.wait()
+                else:
+                    remaining = deadline - get_monotonic_time()
+
+                    if remaining <= 0:
+                        return None
+
+                    self.pending_requests_condition.wait(remaining)
+
+    # internal
+    def remove_pending_request(self, pending_request):
+        with self.pending_requests_condition:
+            del self.pending_requests[pending_request.key]
+
+            # the waiters can wait for different functions and devices, wake
+            # all of them so the one for the freed sequence number sees it
+            self.pending_requests_condition.notify_all()
 
     # internal
     def get_next_sequence_number(self):
@@ -1354,10 +2868,23 @@ class IPConnection(object):
 
         function_id = get_function_id_from_data(packet)
         sequence_number = get_sequence_number_from_data(packet)
+        metrics = self.metrics
+        receive_time = None
+
+        if metrics is not None:
+            receive_time = get_monotonic_time()
+            metrics.add_bytes_in(len(packet))
+
+        if self.capture is not None:
+            self.capture.write(IPConnection.CAPTURE_DIRECTION_RECEIVED, packet)
 
         if sequence_number == 0 and function_id == IPConnection.CALLBACK_ENUMERATE:
-            if IPConnection.CALLBACK_ENUMERATE in self.registered_callbacks:
-                self.callback.queue.put((IPConnection.QUEUE_PACKET, packet))
+            if IPConnection.CALLBACK_ENUMERATE in self.registered_callbacks or \
+               len(self.enumerate_listeners) > 0:
+                if metrics is not None:
+                    metrics.add_callback((get_uid_from_data(packet), function_id))
+
+                self.callback.queue.put_packet(packet, None, receive_time)
 
             return
 
@@ -1370,17 +2897,29 @@ class IPConnection(object):
         if sequence_number == 0:
             if function_id in device.registered_callbacks or \
                -function_id in device.high_level_callbacks:
-                self.callback.queue.put((IPConnection.QUEUE_PACKET, packet))
+                if metrics is not None:
+                    metrics.add_callback((uid, function_id))
+
+                self.callback.queue.put_packet(packet, device, receive_time)
 
             return
 
-        if device.expected_response_function_id == function_id and \
-           device.expected_response_sequence_number == sequence_number:
-            device.response_queue.put(packet)
+        pending_request = self.pending_requests.get((uid, function_id, sequence_number))
+
+        if pending_request is not None:
+            if metrics is not None and pending_request.send_time is not None:
+                metrics.add_request_latency((uid, function_id), receive_time - pending_request.send_time)
+
+            pending_request.set_response(packet)
             return
 
         # Response seems to be OK, but can't be handled
 
+    # internal
+    def count_dropped_callback(self, key):
+        with self.callback_drop_lock:
+            self.callback_drop_counts[key] = self.callback_drop_counts.get(key, 0) + 1
+
     # internal
     def handle_disconnect_by_peer(self, disconnect_reason, socket_id, disconnect_immediately):
         # NOTE: assumes that socket_lock is locked if disconnect_immediately is true
@@ -1395,11 +2934,13 @@ class IPConnection(object):
                                   disconnect_reason, socket_id)))
 
     # internal
-    def create_packet_header(self, device, length, function_id):
+    def create_packet_header(self, device, length, function_id, sequence_number=None):
         uid = IPConnection.BROADCAST_UID
-        sequence_number = self.get_next_sequence_number()
         r_bit = 0
 
+        if sequence_number is None:
+            sequence_number = self.get_next_sequence_number()
+
         if device is not None:
             uid = device.uid
 
@@ -1448,3 +2989,133 @@ class IPConnection(object):
                                     12, 'I')
 
         return base58encode(uid_int)
+
+class ReplayIPConnection(IPConnection):
+    def __init__(self, filename, speed=1.0):
+        """
+        Creates an IP Connection that replays a capture file written by
+        IPConnection.start_capture instead of connecting to a Brick Daemon or
+        WIFI/Ethernet Extension. Devices are created with it as usual.
+
+        The recorded callbacks are replayed with their original timing divided
+        by *speed*, or as fast as possible if *speed* is 0. Requests are
+        answered with the next recorded response of the same function of the
+        same device. Requests without recorded response time out.
+        """
+
+        IPConnection.__init__(self)
+
+        self.records = list(read_capture_file(filename))
+        self.speed = float(speed)
+        self.replay_responses = {} # (uid, function_id) -> deque of responses, protected by replay_lock
+        self.replay_lock = threading.Lock()
+
+    def connect(self, host, port):
+        """
+        Not supported, use replay instead.
+        """
+
+        raise Error(Error.NOT_SUPPORTED, 'Replay connection cannot connect')
+
+    def replay(self):
+        """
+        Feeds the received packets of the capture file through the receive
+        path. Blocks until all packets are replayed and their callbacks
+        were executed by the callback thread.
+        """
+
+        with self.socket_lock:
+            if self.callback is not None:
+                raise Error(Error.ALREADY_CONNECTED, 'Replay is already in progress')
+
+            callbacks = []
+            responses = {}
+
+            for timestamp, direction, packet in self.records:
+                if direction != IPConnection.CAPTURE_DIRECTION_RECEIVED:
+                    continue
+
+                if get_sequence_number_from_data(packet) == 0:
+                    callbacks.append((timestamp, packet))
+                else:
+                    key = (get_uid_from_data(packet), get_function_id_from_data(packet))
+
+                    responses.setdefault(key, deque()).append(packet)
+
+            with self.replay_lock:
+                self.replay_responses = responses
+
+            self.callback = self.create_callback()
+            self.callback.packet_dispatch_allowed = True
+            self.receive_flag = True
+
+        buffer = bytearray(IPConnection.RECEIVE_BUFFER_SIZE)
+        view = memoryview(buffer)
+
+        try:
+            if len(callbacks) > 0:
+                start_time = get_monotonic_time()
+                first_timestamp = callbacks[0][0]
+
+            for timestamp, packet in callbacks:
+                if self.speed > 0:
+                    delay = start_time + (timestamp - first_timestamp) / self.speed - get_monotonic_time()
+
+                    if delay > 0:
+                        time.sleep(delay)
+
+                buffer[:len(packet)] = packet
+
+                self.handle_received_data(buffer, view, len(packet))
+        finally:
+            self.receive_flag = False
+
+            # the queued callbacks might still send requests, keep answering
+            # them until the callback thread is done
+            callback = self.callback
+
+            callback.queue.put((IPConnection.QUEUE_EXIT, None))
+
+            if not callback.is_current_thread():
+                callback.thread.join()
+
+            with self.socket_lock:
+                self.callback = None
+
+    def get_connection_state(self):
+        """
+        Returns CONNECTION_STATE_CONNECTED while replaying and
+        CONNECTION_STATE_DISCONNECTED otherwise.
+        """
+
+        if self.callback is not None:
+            return IPConnection.CONNECTION_STATE_CONNECTED
+
+        return IPConnection.CONNECTION_STATE_DISCONNECTED
+
+    # internal
+    def send(self, packet):
+        if self.callback is None:
+            raise Error(Error.NOT_CONNECTED, 'Not replaying')
+
+        # data might be a batch of requests, answer them one by one
+        offset = 0
+
+        while offset < len(packet):
+            length = get_length_from_data(packet[offset:offset + 5])
+            request = packet[offset:offset + length]
+            offset += length
+
+            if (struct.unpack('<B', request[6:7])[0] >> 3) & 1 == 0:
+                continue # no response expected
+
+            with self.replay_lock:
+                responses = self.replay_responses.get((get_uid_from_data(request), get_function_id_from_data(request)))
+
+                if not responses:
+                    continue # no recorded response left, the request will time out
+
+                response = responses.popleft()
+
+            # the recorded response has the sequence number of the recorded request
+            self.handle_response(response[:6] + request[6:7] + response[7:])
@@ -0,0 +1,618 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2012-2015, 2017, 2019-2020, 2026 Matthias Bolte <matthias@tinkerforge.com>
+# Copyright (C) 2011-2012 Olaf Lüke <olaf@tinkerforge.com>
+#
+# Redistribution and use in source and binary forms of this file,
+# with or without modification, are permitted. See the Creative
+# Commons Zero (CC0 1.0) License for more details.
+
+import sys
+
+if sys.hexversion < 0x3070000:
+    raise Exception('Python >= 3.7 required')
+
+import struct
+import socket
+import os
+import hmac
+import hashlib
+import threading
+import asyncio
+from collections import deque
+
+try:
+    from .ip_connection import IPConnection, Device, BrickDaemon, Error, get_uid_from_data, get_length_from_data, \
+                               get_function_id_from_data, get_sequence_number_from_data, check_response, \
+                               get_payload_codec
+except ImportError:
+    from ip_connection import IPConnection, Device, BrickDaemon, Error, get_uid_from_data, get_length_from_data, \
+                              get_function_id_from_data, get_sequence_number_from_data, check_response, \
+                              get_payload_codec
+
+try:
+    from .device_display_names import get_device_display_name
+except ImportError:
+    from device_display_names import get_device_display_name
+
+# internal
+async def iterate_callbacks(registered_callbacks, callback_id):
+    values_queue = asyncio.Queue()
+
+    def callback(*values):
+        values_queue.put_nowait(values)
+
+    registered_callbacks[callback_id] = callback
+
+    try:
+        while True:
+            values = await values_queue.get()
+
+            if len(values) == 1:
+                yield values[0]
+            else:
+                yield values
+    finally:
+        if registered_callbacks.get(callback_id) is callback:
+            registered_callbacks.pop(callback_id)
+
+class AsyncDevice(object):
+    """
+    Mixin that turns a generated device class into its asyncio variant. All
+    functions that communicate with the device are coroutines and callbacks
+    can be consumed as async iterators via the callbacks function.
+    """
+
+    def __init__(self, uid, ipcon):
+        super().__init__(uid, ipcon)
+
+        self.device_identifier_lock = asyncio.Lock()
+        self.stream_lock = asyncio.Lock()
+
+    def callbacks(self, callback_id):
+        """
+        Returns an async iterator that yields the values of the callback with
+        the given *callback_id*. Callbacks with multiple values are yielded as
+        tuple. While the iterator is in use it replaces any function registered
+        for this *callback_id*.
+        """
+
+        return iterate_callbacks(self.registered_callbacks, callback_id)
+
+    # internal
+    async def check_validity(self):
+        if self.replaced:
+            raise Error(Error.DEVICE_REPLACED, 'Device has been replaced')
+
+        if self.device_identifier < 0:
+            return
+
+        if self.device_identifier_check == Device.DEVICE_IDENTIFIER_CHECK_MATCH:
+            return
+
+        async with self.device_identifier_lock:
+            if self.device_identifier_check == Device.DEVICE_IDENTIFIER_CHECK_PENDING:
+                device_identifier = (await self.ipcon.send_request(self, 255, (), '', 33, '8s 8s c 3B 3B H'))[5] # <device>.get_identity
+
+                if device_identifier == self.device_identifier:
+                    self.device_identifier_check = Device.DEVICE_IDENTIFIER_CHECK_MATCH
+                else:
+                    self.device_identifier_check = Device.DEVICE_IDENTIFIER_CHECK_MISMATCH
+                    self.wrong_device_display_name = get_device_display_name(device_identifier)
+
+            if self.device_identifier_check == Device.DEVICE_IDENTIFIER_CHECK_MISMATCH:
+                raise Error(Error.WRONG_DEVICE_TYPE,
+                            'UID {0} belongs to a {1} instead of the expected {2}'
+                            .format(self.uid_string, self.wrong_device_display_name, self.device_display_name))
+
+class AsyncBrickDaemon(AsyncDevice, BrickDaemon):
+    async def get_authentication_nonce(self):
+        return await self.ipcon.send_request(self, BrickDaemon.FUNCTION_GET_AUTHENTICATION_NONCE, (), '', 12, '4B')
+
+    async def authenticate(self, client_nonce, digest):
+        await self.ipcon.send_request(self, BrickDaemon.FUNCTION_AUTHENTICATE, (client_nonce, digest), '4B 20B', 0, '')
+
+class AsyncIPConnection(object):
+    FUNCTION_ENUMERATE = IPConnection.FUNCTION_ENUMERATE
+    FUNCTION_DISCONNECT_PROBE = IPConnection.FUNCTION_DISCONNECT_PROBE
+
+    CALLBACK_ENUMERATE = IPConnection.CALLBACK_ENUMERATE
+    CALLBACK_CONNECTED = IPConnection.CALLBACK_CONNECTED
+    CALLBACK_DISCONNECTED = IPConnection.CALLBACK_DISCONNECTED
+
+    BROADCAST_UID = IPConnection.BROADCAST_UID
+
+    # enumeration_type parameter to the enumerate callback
+    ENUMERATION_TYPE_AVAILABLE = IPConnection.ENUMERATION_TYPE_AVAILABLE
+    ENUMERATION_TYPE_CONNECTED = IPConnection.ENUMERATION_TYPE_CONNECTED
+    ENUMERATION_TYPE_DISCONNECTED = IPConnection.ENUMERATION_TYPE_DISCONNECTED
+
+    # connect_reason parameter to the connected callback
+    CONNECT_REASON_REQUEST = IPConnection.CONNECT_REASON_REQUEST
+    CONNECT_REASON_AUTO_RECONNECT = IPConnection.CONNECT_REASON_AUTO_RECONNECT
+
+    # disconnect_reason parameter to the disconnected callback
+    DISCONNECT_REASON_REQUEST = IPConnection.DISCONNECT_REASON_REQUEST
+    DISCONNECT_REASON_ERROR = IPConnection.DISCONNECT_REASON_ERROR
+    DISCONNECT_REASON_SHUTDOWN = IPConnection.DISCONNECT_REASON_SHUTDOWN
+
+    # returned by get_connection_state
+    CONNECTION_STATE_DISCONNECTED = IPConnection.CONNECTION_STATE_DISCONNECTED
+    CONNECTION_STATE_CONNECTED = IPConnection.CONNECTION_STATE_CONNECTED
+    CONNECTION_STATE_PENDING = IPConnection.CONNECTION_STATE_PENDING
+
+    DISCONNECT_PROBE_INTERVAL = IPConnection.DISCONNECT_PROBE_INTERVAL
+    ENUMERATE_CODEC = IPConnection.ENUMERATE_CODEC # internal
+
+    def __init__(self):
+        """
+        Creates an asyncio based IP Connection object. It can be used in the
+        same way as the thread based IP Connection, but its functions that
+        communicate with the Brick Daemon are coroutines. It is required for
+        the constructor of the asyncio variants of the Bricks and Bricklets.
+
+        Callbacks are dispatched directly from the receive task running in
+        the event loop of the connection. Registered callback functions should
+        therefore return quickly, alternatively the callbacks function can be
+        used to consume callbacks as async iterators.
+        """
+
+        self.host = None
+        self.port = None
+        self.timeout = 2.5
+        self.stream_window_size = 1
+        self.auto_reconnect = True
+        self.auto_reconnect_allowed = False
+        self.auto_reconnect_pending = False
+        self.sequence_number_lock = threading.Lock()
+        self.next_sequence_number = 0 # protected by sequence_number_lock
+        self.next_authentication_nonce = 0
+        self.pending_requests = {} # (uid, function_id, sequence_number) -> future
+        self.pending_request_done = None # asyncio.Event, created in the event loop on first use
+        self.devices = {}
+        self.replace_lock = threading.Lock() # used to synchronize replacements in the devices dict
+        self.registered_callbacks = {}
+        self.reader = None
+        self.writer = None
+        self.connection_id = 0
+        self.receive_task = None
+        self.disconnect_probe_task = None
+        self.disconnect_probe_flag = False
+        self.auto_reconnect_task = None
+        self.brickd = AsyncBrickDaemon('2', self)
+
+    async def connect(self, host, port):
+        """
+        Creates a TCP/IP connection to the given *host* and *port*. The host
+        and port can point to a Brick Daemon or to a WIFI/Ethernet Extension.
+
+        Returns when the connection is established and throws an exception if
+        there is no Brick Daemon or WIFI/Ethernet Extension listening at the
+        given host and port.
+        """
+
+        if self.writer is not None:
+            raise Error(Error.ALREADY_CONNECTED,
+                        'Already connected to {0}:{1}'.format(self.host, self.port))
+
+        self.host = host
+        self.port = port
+
+        await self.connect_unlocked(False)
+
+    async def disconnect(self):
+        """
+        Disconnects the TCP/IP connection from the Brick Daemon or the
+        WIFI/Ethernet Extension.
+        """
+
+        self.auto_reconnect_allowed = False
+
+        if self.auto_reconnect_pending:
+            # abort pending auto reconnect
+            self.auto_reconnect_pending = False
+            self.auto_reconnect_task.cancel()
+            self.auto_reconnect_task = None
+        else:
+            if self.writer is None:
+                raise Error(Error.NOT_CONNECTED, 'Not connected')
+
+            await self.disconnect_unlocked()
+
+        self.dispatch_meta(AsyncIPConnection.CALLBACK_DISCONNECTED, AsyncIPConnection.DISCONNECT_REASON_REQUEST)
+
+    async def authenticate(self, secret):
+        """
+        Performs an authentication handshake with the connected Brick Daemon or
+        WIFI/Ethernet Extension. See IPConnection.authenticate for details.
+        """
+
+        try:
+            secret_bytes = secret.encode('ascii')
+        except UnicodeEncodeError:
+            raise Error(Error.NON_ASCII_CHAR_IN_SECRET, 'Authentication secret contains non-ASCII characters')
+
+        if self.next_authentication_nonce == 0:
+            self.next_authentication_nonce = struct.unpack('<I', os.urandom(4))[0]
+
+        server_nonce = await self.brickd.get_authentication_nonce()
+        client_nonce = struct.unpack('<4B', struct.pack('<I', self.next_authentication_nonce))
+        self.next_authentication_nonce = (self.next_authentication_nonce + 1) % (1 << 32)
+
+        h = hmac.new(secret_bytes, digestmod=hashlib.sha1)
+
+        h.update(struct.pack('<4B', *server_nonce))
+        h.update(struct.pack('<4B', *client_nonce))
+
+        digest = struct.unpack('<20B', h.digest())
+        h = None
+
+        await self.brickd.authenticate(client_nonce, digest)
+
+    def get_connection_state(self):
+        """
+        Can return the following states:
+
+        - CONNECTION_STATE_DISCONNECTED: No connection is established.
+        - CONNECTION_STATE_CONNECTED: A connection to the Brick Daemon or
+          the WIFI/Ethernet Extension is established.
+        - CONNECTION_STATE_PENDING: IP Connection is currently trying to
+          connect.
+        """
+
+        if self.writer is not None:
+            return AsyncIPConnection.CONNECTION_STATE_CONNECTED
+        elif self.auto_reconnect_pending:
+            return AsyncIPConnection.CONNECTION_STATE_PENDING
+        else:
+            return AsyncIPConnection.CONNECTION_STATE_DISCONNECTED
+
+    def set_auto_reconnect(self, auto_reconnect):
+        """
+        Enables or disables auto-reconnect. If auto-reconnect is enabled,
+        the IP Connection will try to reconnect to the previously given
+        host and port, if the connection is lost.
+
+        Default value is *True*.
+        """
+
+        self.auto_reconnect = bool(auto_reconnect)
+
+        if not self.auto_reconnect:
+            # abort potentially pending auto reconnect
+            self.auto_reconnect_allowed = False
+
+    def get_auto_reconnect(self):
+        """
+        Returns *true* if auto-reconnect is enabled, *false* otherwise.
+        """
+
+        return self.auto_reconnect
+
+    def set_timeout(self, timeout):
+        """
+        Sets the timeout in seconds for getters and for setters for which the
+        response expected flag is activated.
+
+        Default timeout is 2.5.
+        """
+
+        timeout = float(timeout)
+
+        if timeout < 0:
+            raise ValueError('Timeout cannot be negative')
+
+        self.timeout = timeout
+
+    def get_timeout(self):
+        """
+        Returns the timeout as set by set_timeout.
+        """
+
+        return self.timeout
+
+    set_stream_window_size = IPConnection.set_stream_window_size
+    get_stream_window_size = IPConnection.get_stream_window_size
+
+    async def enumerate(self):
+        """
+        Broadcasts an enumerate request. All devices will respond with an
+        enumerate callback.
+        """
+
+        request, _, _ = self.create_packet_header(None, 8, AsyncIPConnection.FUNCTION_ENUMERATE)
+
+        await self.send(request)
+
+    def register_callback(self, callback_id, function):
+        """
+        Registers the given *function* with the given *callback_id*.
+        """
+        if function is None:
+            self.registered_callbacks.pop(callback_id, None)
+        else:
+            self.registered_callbacks[callback_id] = function
+
+    def callbacks(self, callback_id):
+        """
+        Returns an async iterator that yields the values of the callback with
+        the given *callback_id*. Callbacks with multiple values are yielded as
+        tuple. While the iterator is in use it replaces any function registered
+        for this *callback_id*.
+        """
+
+        return iterate_callbacks(self.registered_callbacks, callback_id)
+
+    # internal
+    async def connect_unlocked(self, is_auto_reconnect):
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), 5)
+
+        writer.get_extra_info('socket').setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        self.reader = reader
+        self.writer = writer
+        self.connection_id += 1
+        self.disconnect_probe_flag = True
+        self.receive_task = asyncio.ensure_future(self.receive_loop(self.connection_id))
+        self.disconnect_probe_task = asyncio.ensure_future(self.disconnect_probe_loop())
+        self.auto_reconnect_allowed = False
+        self.auto_reconnect_pending = False
+
+        if is_auto_reconnect:
+            connect_reason = AsyncIPConnection.CONNECT_REASON_AUTO_RECONNECT
+        else:
+            connect_reason = AsyncIPConnection.CONNECT_REASON_REQUEST
+
+        self.dispatch_meta(AsyncIPConnection.CALLBACK_CONNECTED, connect_reason)
+
+    # internal
+    async def disconnect_unlocked(self):
+        writer = self.writer
+
+        self.reader = None
+        self.writer = None
+
+        for task in [self.disconnect_probe_task, self.receive_task]:
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+
+        self.disconnect_probe_task = None
+        self.receive_task = None
+
+        writer.close()
+
+        try:
+            await writer.wait_closed()
+        except (OSError, asyncio.CancelledError):
+            pass
+
+    # internal
+    add_device = IPConnection.add_device
+
+    # internal
+    dispatch_callback = IPConnection.dispatch_callback
+
+    # internal
+    get_next_sequence_number = IPConnection.get_next_sequence_number
+
+    # internal
+    create_packet_header = IPConnection.create_packet_header
+
+    # internal
+    def dispatch_meta(self, function_id, parameter):
+        cb = self.registered_callbacks.get(function_id)
+
+        if cb != None:
+            cb(parameter)
+
+    # internal
+    def dispatch_packet(self, packet):
+        if get_function_id_from_data(packet) == AsyncIPConnection.CALLBACK_ENUMERATE:
+            cb = self.registered_callbacks.get(AsyncIPConnection.CALLBACK_ENUMERATE)
+
+            if cb == None:
+                return
+
+            if len(packet) != 34:
+                return # silently ignoring callback with wrong length
+
+            cb(*AsyncIPConnection.ENUMERATE_CODEC.unpack(packet[8:]))
+
+            return
+
+        device = self.devices.get(get_uid_from_data(packet))
+
+        if device == None:
+            return
+
+        if device.replaced or device.device_identifier_check == Device.DEVICE_IDENTIFIER_CHECK_MISMATCH:
+            return # silently ignoring callback for invalid device
+
+        if device.device_identifier >= 0 and device.device_identifier_check == Device.DEVICE_IDENTIFIER_CHECK_PENDING:
+            # the device identifier check needs a response that is received by
+            # this task, so it cannot be awaited here
+            asyncio.ensure_future(self.dispatch_packet_after_check(device, packet))
+            return
+
+        self.dispatch_callback(device, packet)
+
+    # internal
+    async def dispatch_packet_after_check(self, device, packet):
+        try:
+            await device.check_validity()
+        except Error:
+            return # silently ignoring callback for invalid device
+
+        self.dispatch_callback(device, packet)
+
+    # internal
+    async def receive_loop(self, connection_id):
+        reader = self.reader
+
+        while True:
+            try:
+                header = await reader.readexactly(8)
+                packet = header + await reader.readexactly(get_length_from_data(header) - 8)
+            except asyncio.IncompleteReadError:
+                self.handle_disconnect_by_peer(AsyncIPConnection.DISCONNECT_REASON_SHUTDOWN, connection_id)
+                break
+            except OSError:
+                self.handle_disconnect_by_peer(AsyncIPConnection.DISCONNECT_REASON_ERROR, connection_id)
+                break
+
+            self.handle_response(packet)
+
+    # internal
+    async def disconnect_probe_loop(self):
+        request, _, _ = self.create_packet_header(None, 8, AsyncIPConnection.FUNCTION_DISCONNECT_PROBE)
+
+        while True:
+            await asyncio.sleep(AsyncIPConnection.DISCONNECT_PROBE_INTERVAL)
+
+            if self.disconnect_probe_flag:
+                try:
+                    self.writer.write(request)
+                    await self.writer.drain()
+                except OSError:
+                    self.handle_disconnect_by_peer(AsyncIPConnection.DISCONNECT_REASON_ERROR, self.connection_id)
+                    break
+            else:
+                self.disconnect_probe_flag = True
+
+    # internal
+    async def send(self, packet):
+        if self.writer is None:
+            raise Error(Error.NOT_CONNECTED, 'Not connected')
+
+        try:
+            self.writer.write(packet)
+            await self.writer.drain()
+        except OSError:
+            self.handle_disconnect_by_peer(AsyncIPConnection.DISCONNECT_REASON_ERROR, self.connection_id)
+            raise Error(Error.NOT_CONNECTED, 'Not connected', suppress_context=True)
+
+        self.disconnect_probe_flag = False
+
+    # internal
+    async def send_request(self, device, function_id, data, form, length_ret, form_ret):
+        # form and form_ret can be given as PayloadCodec objects or as form strings
+        payload = get_payload_codec(form).pack(data)
+
+        if not device.get_response_expected(function_id):
+            header, _, _ = self.create_packet_header(device, 8 + len(payload), function_id)
+
+            await self.send(header + payload)
+
+            return None
+
+        # try all 15 sequence numbers, one of them might not be in use for this
+        # function of this device. if all are in use then wait for one of the
+        # pending requests to be done
+        while True:
+            for _ in range(15):
+                key = (device.uid, function_id, self.get_next_sequence_number())
+
+                if key not in self.pending_requests:
+                    break
+            else:
+                if self.pending_request_done is None:
+                    self.pending_request_done = asyncio.Event()
+
+                self.pending_request_done.clear()
+                await self.pending_request_done.wait()
+                continue
+
+            break
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending_requests[key] = future
+
+        try:
+            header, _, _ = self.create_packet_header(device, 8 + len(payload), function_id, key[2])
+
+            await self.send(header + payload)
+
+            response = await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            msg = 'Did not receive response for function {0} in time'.format(function_id)
+            raise Error(Error.TIMEOUT, msg, suppress_context=True)
+        finally:
+            self.pending_requests.pop(key)
+
+            if self.pending_request_done is not None:
+                self.pending_request_done.set()
+
+        check_response(response, function_id, length_ret)
+
+        codec_ret = get_payload_codec(form_ret)
+
+        if len(codec_ret.fields) > 0:
+            return codec_ret.unpack(response[8:])
+
+    # internal
+    def handle_response(self, packet):
+        self.disconnect_probe_flag = False
+
+        function_id = get_function_id_from_data(packet)
+        sequence_number = get_sequence_number_from_data(packet)
+
+        if sequence_number == 0:
+            self.dispatch_packet(packet)
+            return
+
+        future = self.pending_requests.get((get_uid_from_data(packet), function_id, sequence_number))
+
+        if future is not None and not future.done():
+            future.set_result(packet)
+
+    # internal
+    async def send_stream_requests(self, device, function_id, requests, form, length_ret, form_ret):
+        # see IPConnection.send_stream_requests. the requests are started in
+        # order and each one writes its packet before it awaits anything
+        in_flight = deque()
+        ret = None
+
+        try:
+            for data in requests:
+                in_flight.append(asyncio.ensure_future(self.send_request(device, function_id, data, form,
+                                                                         length_ret, form_ret)))
+
+                if len(in_flight) >= self.stream_window_size:
+                    ret = await in_flight.popleft()
+
+            while len(in_flight) > 0:
+                ret = await in_flight.popleft()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        return ret
+
+    # internal
+    def handle_disconnect_by_peer(self, disconnect_reason, connection_id):
+        if self.writer is None or self.connection_id != connection_id:
+            return # already disconnected or reconnected in the meantime
+
+        self.auto_reconnect_allowed = True
+        self.auto_reconnect_task = asyncio.ensure_future(self.handle_disconnect(disconnect_reason))
+
+    # internal
+    async def handle_disconnect(self, disconnect_reason):
+        await self.disconnect_unlocked()
+
+        self.dispatch_meta(AsyncIPConnection.CALLBACK_DISCONNECTED, disconnect_reason)
+
+        if self.auto_reconnect and self.auto_reconnect_allowed:
+            self.auto_reconnect_pending = True
+
+            while self.auto_reconnect_allowed and self.writer is None:
+                # wait a moment here, otherwise the next connect attempt will
+                # succeed, even if there is no open server socket
+                await asyncio.sleep(0.1)
+
+                try:
+                    await self.connect_unlocked(True)
+                except (OSError, asyncio.TimeoutError):
+                    pass
+
+        self.auto_reconnect_pending = False
+        self.auto_reconnect_task = None
@@ -0,0 +1,622 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2026 Matthias Bolte <matthias@tinkerforge.com>
+#
+# Redistribution and use in source and binary forms of this file,
+# with or without modification, are permitted. See the Creative
+# Commons Zero (CC0 1.0) License for more details.
+
+import sys
+
+if sys.hexversion < 0x3040000:
+    raise Exception('Python >= 3.4 required')
+
+import struct
+import socket
+import selectors
+import threading
+import time
+from collections import deque
+
+try:
+    from .ip_connection import IPConnection, Error, base58encode, base58decode, uid64_to_uid32, get_uid_from_data, \
+                               get_length_from_data, get_function_id_from_data, get_sequence_number_from_data, \
+                               get_monotonic_time
+except ImportError:
+    from ip_connection import IPConnection, Error, base58encode, base58decode, uid64_to_uid32, get_uid_from_data, \
+                              get_length_from_data, get_function_id_from_data, get_sequence_number_from_data, \
+                              get_monotonic_time
+
+class PooledIPConnection(IPConnection):
+    def __init__(self, pool):
+        """
+        Represents the connection to one Brick Daemon or WIFI/Ethernet
+        Extension of an IP Connection Pool. Endpoints are created by the
+        connect function of the pool and should not be created directly.
+
+        An endpoint can be used like an IP Connection to authenticate, to
+        enumerate and to (dis-)connect this single connection, and to
+        register connected and disconnected callbacks for it. Devices are
+        added to the pool instead.
+        """
+
+        IPConnection.__init__(self)
+
+        self.pool = pool
+        self.timeout = pool.timeout
+        self.auto_reconnect = pool.auto_reconnect
+        self.callback = pool.callback # shared by all endpoints of the pool
+        self.receive_buffer = bytearray(IPConnection.RECEIVE_BUFFER_SIZE)
+        self.receive_view = memoryview(self.receive_buffer)
+        self.receive_pending_length = 0 # only used by the selector thread
+
+    def disconnect(self):
+        """
+        Disconnects this endpoint from its Brick Daemon or WIFI/Ethernet
+        Extension. The other endpoints of the pool stay connected.
+        """
+
+        with self.socket_lock:
+            self.auto_reconnect_allowed = False
+
+            if self.auto_reconnect_pending:
+                # abort potentially pending auto reconnect
+                self.auto_reconnect_pending = False
+            else:
+                if self.socket is None:
+                    raise Error(Error.NOT_CONNECTED, 'Not connected')
+
+                self.disconnect_unlocked()
+
+        self.callback.queue.put((IPConnection.QUEUE_META,
+                                 (self, IPConnection.CALLBACK_DISCONNECTED,
+                                  IPConnection.DISCONNECT_REASON_REQUEST, None)))
+
+    def authenticate(self, secret):
+        """
+        Performs an authentication handshake with the Brick Daemon or
+        WIFI/Ethernet Extension of this endpoint, see the authenticate
+        function of the IP Connection. Afterwards the devices behind this
+        endpoint are enumerated again, because an endpoint with
+        authentication enabled ignored the enumerate request sent on connect.
+        """
+
+        IPConnection.authenticate(self, secret)
+
+        self.enumerate()
+
+    # internal
+    def connect_unlocked(self, is_auto_reconnect):
+        # NOTE: assumes that socket is None and socket_lock is locked
+
+        tmp = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+
+        try:
+            tmp.settimeout(5)
+            tmp.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            tmp.connect((self.host, self.port))
+            tmp.settimeout(None)
+        except:
+            tmp.close()
+            raise
+
+        self.socket = tmp
+        self.socket_id += 1
+        self.disconnect_probe_flag = True
+        self.receive_flag = True
+        self.receive_pending_length = 0
+
+        # the selector thread of the pool receives for all endpoints
+        self.pool.register_endpoint(self)
+
+        self.auto_reconnect_allowed = False
+        self.auto_reconnect_pending = False
+
+        if is_auto_reconnect:
+            connect_reason = IPConnection.CONNECT_REASON_AUTO_RECONNECT
+        else:
+            connect_reason = IPConnection.CONNECT_REASON_REQUEST
+
+        self.callback.queue.put((IPConnection.QUEUE_META,
+                                 (self, IPConnection.CALLBACK_CONNECTED,
+                                  connect_reason, None)))
+
+        # learn the UIDs of the devices behind this endpoint. cannot use send
+        # here, because it would lock the socket_lock again. if authentication
+        # is enabled this is ignored and repeated by authenticate
+        request, _, _ = self.create_packet_header(None, 8, IPConnection.FUNCTION_ENUMERATE)
+
+        try:
+            with self.socket_send_lock:
+                self.socket.sendall(request)
+        except socket.error:
+            pass # the selector thread will notice the broken connection
+
+    # internal
+    def disconnect_unlocked(self):
+        # NOTE: assumes that socket is not None and socket_lock is locked
+
+        self.receive_flag = False
+        self.pool.unregister_endpoint(self)
+
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass
+
+        self.socket.close()
+        self.socket = None
+
+    # internal
+    def receive_available(self, socket_id):
+        # called by the selector thread if the socket is readable. returns
+        # False if the connection got lost
+        try:
+            received = self.socket.recv_into(self.receive_view[self.receive_pending_length:])
+        except socket.error:
+            if self.receive_flag:
+                self.handle_disconnect_by_peer(IPConnection.DISCONNECT_REASON_ERROR, socket_id, False)
+
+            return False
+
+        if received == 0:
+            if self.receive_flag:
+                self.handle_disconnect_by_peer(IPConnection.DISCONNECT_REASON_SHUTDOWN, socket_id, False)
+
+            return False
+
+        self.receive_pending_length = self.handle_received_data(self.receive_buffer, self.receive_view,
+                                                                self.receive_pending_length + received)
+
+        return True
+
+    # internal
+    def send_disconnect_probe(self, socket_id):
+        # called by the selector thread every DISCONNECT_PROBE_INTERVAL seconds.
+        # returns False if the connection got lost
+        if not self.disconnect_probe_flag:
+            self.disconnect_probe_flag = True
+            return True
+
+        request, _, _ = self.create_packet_header(None, 8, IPConnection.FUNCTION_DISCONNECT_PROBE)
+
+        try:
+            with self.socket_send_lock:
+                self.socket.sendall(request)
+        except socket.error:
+            self.handle_disconnect_by_peer(IPConnection.DISCONNECT_REASON_ERROR, socket_id, False)
+            return False
+
+        return True
+
+    # internal
+    def handle_response(self, packet):
+        self.disconnect_probe_flag = False
+
+        function_id = get_function_id_from_data(packet)
+        sequence_number = get_sequence_number_from_data(packet)
+
+        if sequence_number == 0 and function_id == IPConnection.CALLBACK_ENUMERATE:
+            if len(packet) == 34:
+                self.pool.update_route(get_uid_from_data(packet), self, packet[33])
+        elif sequence_number != 0:
+            # responses to requests of this endpoint itself, e.g. authentication
+            key = (get_uid_from_data(packet), function_id, sequence_number)
+            pending_request = self.pending_requests.get(key)
+
+            if pending_request is not None:
+                pending_request.set_response(packet)
+                return
+
+        self.pool.handle_response(packet)
+
+    # internal
+    def handle_disconnect_by_peer(self, disconnect_reason, socket_id, disconnect_immediately):
+        # NOTE: assumes that socket_lock is locked if disconnect_immediately is true
+
+        self.auto_reconnect_allowed = True
+
+        if disconnect_immediately:
+            self.disconnect_unlocked()
+
+        self.callback.queue.put((IPConnection.QUEUE_META,
+                                 (self, IPConnection.CALLBACK_DISCONNECTED,
+                                  disconnect_reason, socket_id)))
+
+    # internal
+    def dispatch_meta(self, function_id, parameter, socket_id):
+        # endpoint specific callbacks take precedence over the ones of the pool
+        cb = self.registered_callbacks.get(function_id, self.pool.registered_callbacks.get(function_id))
+
+        if function_id == IPConnection.CALLBACK_CONNECTED:
+            if cb != None:
+                cb(parameter)
+        elif function_id == IPConnection.CALLBACK_DISCONNECTED:
+            if parameter != IPConnection.DISCONNECT_REASON_REQUEST:
+                with self.socket_lock:
+                    # don't close the socket if it got disconnected or
+                    # reconnected in the meantime
+                    if self.socket is not None and self.socket_id == socket_id:
+                        self.disconnect_unlocked()
+
+            if cb != None:
+                cb(parameter)
+
+            if parameter != IPConnection.DISCONNECT_REASON_REQUEST and \
+               self.auto_reconnect and self.auto_reconnect_allowed:
+                with self.socket_lock:
+                    if self.auto_reconnect_pending:
+                        return
+
+                    self.auto_reconnect_pending = True
+
+                # don't block the callback thread, it is shared by all endpoints
+                thread = threading.Thread(name='Auto-Reconnect', target=self.auto_reconnect_loop)
+                thread.daemon = True
+                thread.start()
+
+    # internal
+    def auto_reconnect_loop(self):
+        while True:
+            # FIXME: wait a moment here, otherwise the next connect
+            # attempt will succeed, even if there is no open server
+            # socket. the first receive will then fail directly
+            time.sleep(0.1)
+
+            with self.socket_lock:
+                if not self.auto_reconnect_allowed or self.socket is not None:
+                    self.auto_reconnect_pending = False
+                    return
+
+                try:
+                    self.connect_unlocked(True)
+                    return
+                except:
+                    pass
+
+class IPConnectionPool(IPConnection):
+    def __init__(self):
+        """
+        Creates an IP Connection Pool object that multiplexes the connections
+        to multiple Brick Daemons or WIFI/Ethernet Extensions through a single
+        receive thread. It can be used like an IP Connection for the
+        constructors of Bricks and Bricklets.
+
+        Every call of connect adds another endpoint to the pool. Requests of
+        a device are sent to the endpoint that reported the device in its
+        enumerate callbacks. All endpoints share the callback thread and the
+        callback workers of the pool.
+
+        The receive thread of the pool never waits for room in a bounded
+        callback queue, because that would stall all endpoints. Callbacks
+        with CALLBACK_QUEUE_POLICY_BLOCK are handled as with
+        CALLBACK_QUEUE_POLICY_DROP_OLDEST instead.
+
+        Requires Python 3.4 or newer.
+        """
+
+        IPConnection.__init__(self)
+
+        self.endpoints = [] # protected by socket_lock
+        self.routes = {} # uid -> endpoint, protected by routes_condition
+        self.routes_condition = threading.Condition()
+        self.selector = None
+        self.selector_flag = False
+        self.selector_thread = None
+        self.selector_commands = deque()
+        self.selector_wakeup = None # (receiving socket, sending socket)
+
+    def connect(self, host, port):
+        """
+        Creates a TCP/IP connection to the given *host* and *port* and adds it
+        to the pool as a new endpoint, which is returned. The devices behind
+        the endpoint are enumerated immediately to learn their UIDs.
+
+        Requests to a device whose endpoint is not known yet wait for the
+        enumerate callbacks up to the timeout of the pool. If authentication
+        is enabled, the devices are enumerated after authenticating the
+        endpoint.
+        """
+
+        with self.socket_lock:
+            if self.callback is None:
+                self.start()
+
+            endpoint = PooledIPConnection(self)
+
+            self.endpoints.append(endpoint)
+
+        try:
+            endpoint.connect(host, port)
+        except:
+            with self.socket_lock:
+                self.endpoints.remove(endpoint)
+
+            raise
+
+        return endpoint
+
+    def disconnect(self):
+        """
+        Disconnects all endpoints of the pool and stops its threads.
+        """
+
+        with self.socket_lock:
+            if self.callback is None:
+                raise Error(Error.NOT_CONNECTED, 'Not connected')
+
+            endpoints = self.endpoints
+            self.endpoints = []
+
+        for endpoint in endpoints:
+            try:
+                endpoint.disconnect()
+            except Error:
+                pass # already disconnected
+
+        with self.socket_lock:
+            callback = self.callback
+            self.callback = None
+
+            self.run_in_selector(self.stop_selector)
+
+            if threading.current_thread() is not self.selector_thread:
+                self.selector_thread.join()
+
+            self.selector_thread = None
+
+        with self.routes_condition:
+            self.routes = {}
+
+        # do this outside of socket_lock to allow calling (dis-)connect from
+        # the callbacks while blocking on the join call here
+        callback.queue.put((IPConnection.QUEUE_EXIT, None))
+
+        if not callback.is_current_thread():
+            callback.thread.join()
+
+    def authenticate(self, secret):
+        """
+        Performs an authentication handshake with all connected endpoints.
+        Use the authenticate function of an endpoint to authenticate a single
+        endpoint, for example in its connected callback after an
+        auto-reconnect.
+        """
+
+        for endpoint in self.get_endpoints():
+            if endpoint.get_connection_state() == IPConnection.CONNECTION_STATE_CONNECTED:
+                endpoint.authenticate(secret)
+
+    def get_connection_state(self):
+        """
+        Returns CONNECTION_STATE_CONNECTED if at least one endpoint is
+        connected, CONNECTION_STATE_PENDING if at least one endpoint is
+        trying to reconnect and CONNECTION_STATE_DISCONNECTED otherwise.
+        """
+
+        states = [endpoint.get_connection_state() for endpoint in self.get_endpoints()]
+
+        if IPConnection.CONNECTION_STATE_CONNECTED in states:
+            return IPConnection.CONNECTION_STATE_CONNECTED
+        elif IPConnection.CONNECTION_STATE_PENDING in states:
+            return IPConnection.CONNECTION_STATE_PENDING
+        else:
+            return IPConnection.CONNECTION_STATE_DISCONNECTED
+
+    def set_auto_reconnect(self, auto_reconnect):
+        """
+        Enables or disables auto-reconnect for all endpoints.
+
+        Default value is *True*.
+        """
+
+        IPConnection.set_auto_reconnect(self, auto_reconnect)
+
+        for endpoint in self.get_endpoints():
+            endpoint.set_auto_reconnect(auto_reconnect)
+
+    def set_timeout(self, timeout):
+        """
+        Sets the timeout in seconds for getters and for setters for which the
+        response expected flag is activated, for all endpoints.
+
+        Default timeout is 2.5.
+        """
+
+        IPConnection.set_timeout(self, timeout)
+
+        for endpoint in self.get_endpoints():
+            endpoint.set_timeout(timeout)
+
+    def get_endpoints(self):
+        """
+        Returns the list of endpoints added by connect.
+        """
+
+        with self.socket_lock:
+            return list(self.endpoints)
+
+    def get_endpoint(self, uid):
+        """
+        Returns the endpoint that reported the device with the given *uid* in
+        its enumerate callbacks, or *None* if the device is not known.
+        """
+
+        try:
+            uid_ = base58decode(uid)
+        except Error:
+            return None
+
+        if uid_ > (1 << 32) - 1:
+            uid_ = uid64_to_uid32(uid_)
+
+        with self.routes_condition:
+            return self.routes.get(uid_)
+
+    # internal
+    def start(self):
+        # NOTE: assumes that socket_lock is locked
+
+        self.callback = self.create_callback()
+        self.callback.packet_dispatch_allowed = True
+
+        # the selector thread fills the callback queue. if it blocked on a
+        # full queue, the callback thread could wait for it in run_in_selector
+        # while handling a disconnected callback and both would deadlock
+        self.callback.queue.block_allowed = False
+
+        try:
+            self.selector = selectors.DefaultSelector()
+            self.selector_wakeup = socket.socketpair()
+            self.selector_wakeup[0].setblocking(False)
+            self.selector.register(self.selector_wakeup[0], selectors.EVENT_READ, None)
+            self.selector_flag = True
+            self.selector_thread = threading.Thread(name='Brickd-Selector',
+                                                    target=self.selector_loop,
+                                                    args=(self.selector,))
+            self.selector_thread.daemon = True
+            self.selector_thread.start()
+        except:
+            self.callback.queue.put((IPConnection.QUEUE_EXIT, None))
+            self.callback.thread.join()
+            self.callback = None
+            raise
+
+    # internal
+    def selector_loop(self, selector):
+        next_disconnect_probe = get_monotonic_time() + IPConnection.DISCONNECT_PROBE_INTERVAL
+
+        while self.selector_flag:
+            events = selector.select(max(next_disconnect_probe - get_monotonic_time(), 0))
+
+            for key, _ in events:
+                if key.data is None: # wakeup
+                    try:
+                        key.fileobj.recv(4096)
+                    except socket.error:
+                        pass
+
+                    continue
+
+                endpoint, socket_id = key.data
+
+                if not endpoint.receive_available(socket_id):
+                    selector.unregister(key.fileobj)
+
+            while len(self.selector_commands) > 0:
+                function, done = self.selector_commands.popleft()
+
+                try:
+                    function()
+                finally:
+                    done.set()
+
+            if get_monotonic_time() >= next_disconnect_probe:
+                next_disconnect_probe = get_monotonic_time() + IPConnection.DISCONNECT_PROBE_INTERVAL
+
+                for key in list(selector.get_map().values()):
+                    if key.data is None:
+                        continue
+
+                    endpoint, socket_id = key.data
+
+                    if not endpoint.send_disconnect_probe(socket_id):
+                        selector.unregister(key.fileobj)
+
+        selector.close()
+
+        for wakeup_socket in self.selector_wakeup:
+            wakeup_socket.close()
+
+    # internal
+    def stop_selector(self):
+        self.selector_flag = False
+
+    # internal
+    def run_in_selector(self, function):
+        # changes to the selector have to be done by the selector thread
+        # itself, because the selector is not thread-safe
+        if threading.current_thread() is self.selector_thread:
+            function()
+            return
+
+        done = threading.Event()
+
+        self.selector_commands.append((function, done))
+        self.selector_wakeup[1].send(b'\0')
+
+        done.wait()
+
+    # internal
+    def register_endpoint(self, endpoint):
+        self.run_in_selector(lambda: self.selector.register(endpoint.socket, selectors.EVENT_READ,
+                                                            (endpoint, endpoint.socket_id)))
+
+    # internal
+    def unregister_endpoint(self, endpoint):
+        def unregister():
+            try:
+                self.selector.unregister(endpoint.socket)
+            except KeyError:
+                pass # already unregistered by the selector thread due to an error
+
+        self.run_in_selector(unregister)
+
+    # internal
+    def update_route(self, uid, endpoint, enumeration_type):
+        with self.routes_condition:
+            if enumeration_type == IPConnection.ENUMERATION_TYPE_DISCONNECTED:
+                if self.routes.get(uid) is endpoint:
+                    del self.routes[uid]
+            else:
+                self.routes[uid] = endpoint
+                self.routes_condition.notify_all()
+
+    # internal
+    def get_endpoint_for_uid(self, uid):
+        deadline = get_monotonic_time() + self.timeout
+
+        with self.routes_condition:
+            while True:
+                endpoint = self.routes.get(uid)
+
+                if endpoint is not None:
+                    return endpoint
+
+                remaining = deadline - get_monotonic_time()
+
+                if remaining <= 0:
+                    raise Error(Error.NOT_CONNECTED,
+                                'No endpoint reported a device with UID {0}'.format(base58encode(uid)))
+
+                self.routes_condition.wait(remaining)
+
+    # internal
+    def send(self, packet):
+        # a batch of packets from send_requests can contain packets for
+        # multiple endpoints, route each of them by its UID
+        routed = {} # endpoint -> list of packets
+        offset = 0
+
+        while offset < len(packet):
+            uid = struct.unpack_from('<I', packet, offset)[0]
+            length = packet[offset + 4]
+
+            if uid == IPConnection.BROADCAST_UID:
+                endpoints = [endpoint for endpoint in self.get_endpoints() if endpoint.socket is not None]
+
+                if len(endpoints) == 0:
+                    raise Error(Error.NOT_CONNECTED, 'Not connected')
+            else:
+                endpoints = [self.get_endpoint_for_uid(uid)]
+
+            for endpoint in endpoints:
+                routed.setdefault(endpoint, []).append(packet[offset:offset + length])
+
+            offset += length
+
+        for endpoint, packets in routed.items():
+            endpoint.send(b''.join(packets))
+
+    # internal
+    def dispatch_meta(self, endpoint, function_id, parameter, socket_id):
+        endpoint.dispatch_meta(function_id, parameter, socket_id)
@@ -1,8 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
 import sys
-from ip_connection import create_char, create_char_list, create_string, pack_payload, unpack_payload
+import array
+import tempfile
+import struct
+import socket
+import threading
+from ip_connection import create_char, create_char_list, create_string, pack_payload, unpack_payload, get_payload_codec, \
+                          create_number_list, create_chunk_data, StreamReassembler, IPConnection, Device, \
+                          read_capture_file, ReplayIPConnection
 
 def b(value):
     if sys.hexversion < 0x03000000:
@@ -159,3 +167,987 @@ assert(unpack_payload(b('abc\xff\0'), '5s') == 'abc\xff')
 assert(unpack_payload(b('a'), 'c') == 'a')
 assert(unpack_payload(b('abc'), '3c') == ('a', 'b', 'c'))
 assert(unpack_payload(b('a\xff\0'), '3c') == ('a', '\xff', '\0'))
+
+#
+# get_payload_codec
+#
+
+assert(get_payload_codec('h') is get_payload_codec('h'))
+assert(get_payload_codec(get_payload_codec('h')) is get_payload_codec('h'))
+
+for data, form in [((-1234,), 'h'),
+                   ((1, 2, 3), 'B H I'),
+                   (((1, -2, 3), 4.5), '3b f'),
+                   ((True,), '!'),
+                   ((False, 42), '! B'),
+                   (([True, False, True, True, False, False, False, False, True],), '9!'),
+                   (('a',), 'c'),
+                   ((['a', 'b', '\xff'],), '3c'),
+                   (('abc',), '5s'),
+                   (('abc\xff',), '5s'),
+                   (('12345678', 'abc', 'z', (1, 2, 3), (4, 5, 6), 17), '8s 8s c 3B 3B H'),
+                   (((1 << 63, 1), [True] * 16, 'foo'), '2Q 16! 3s')]:
+    packed = pack_payload(data, form)
+    codec = get_payload_codec(form)
+
+    assert(codec.pack(data) == packed)
+    assert(codec.size == len(packed))
+    assert(codec.unpack(packed) == unpack_payload(packed, form))
+    assert(codec.unpack(packed + b('\0\0')) == unpack_payload(packed + b('\0\0'), form))
+
+assert(get_payload_codec('').pack(()) == b(''))
+
+# a number list can be unpacked as its little-endian bytes, other lists not
+raw_codec = get_payload_codec('H H 3h 2!', 2)
+
+assert(raw_codec is get_payload_codec(get_payload_codec('H H 3h 2!'), 2))
+assert(raw_codec is not get_payload_codec('H H 3h 2!'))
+assert(raw_codec.unpack(pack_payload((5, 0, (1, -2, 3), [True, False]), 'H H 3h 2!')) == \
+       [5, 0, b('\x01\x00\xfe\xff\x03\x00'), (True, False)])
+assert(get_payload_codec('3c', 0).unpack(b('abc')) == ('a', 'b', 'c'))
+
+try:
+    get_payload_codec('3!').pack(([True, False],))
+    assert(False)
+except ValueError:
+    pass
+
+try:
+    get_payload_codec('3c').pack((['a', 'b'],))
+    assert(False)
+except struct.error:
+    pass
+
+#
+# StreamReassembler
+#
+
+stream = StreamReassembler(10)
+stream.add_chunk((0, 1, 2, 3))
+assert(stream.offset == 4)
+stream.add_chunk((4, 5, 6, 7))
+stream.add_chunk((8, 9, 0, 0)) # last chunk is padded
+assert(stream.offset == 12)
+assert(stream.get_data(10) == tuple(range(10)))
+assert(StreamReassembler(0).get_data(0) == ())
+
+stream = StreamReassembler(5, Device.STREAM_RESULT_MODE_ARRAY, 'H')
+stream.add_chunk((1000, 2000, 3000))
+stream.add_chunk((4000, 5000, 0))
+assert(stream.get_data(5) == array.array('H', [1000, 2000, 3000, 4000, 5000]))
+
+stream = StreamReassembler(5, Device.STREAM_RESULT_MODE_ARRAY, 'h')
+stream.add_chunk(b('\x01\x00\xfe\xff\x03\x00')) # raw chunk data
+stream.add_chunk((4, -5, 0))
+assert(stream.get_data(5) == array.array('h', [1, -2, 3, 4, -5]))
+
+stream = StreamReassembler(3, Device.STREAM_RESULT_MODE_ARRAY, '!')
+stream.add_chunk((True, False, True, False))
+assert(stream.get_data(3) == array.array('B', [1, 0, 1]))
+
+stream = StreamReassembler(2, Device.STREAM_RESULT_MODE_ARRAY, 'c') # chars are always reassembled as tuple
+stream.add_chunk(('a', 'b'))
+assert(stream.get_data(2) == ('a', 'b'))
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if numpy != None:
+    stream = StreamReassembler(4, Device.STREAM_RESULT_MODE_NUMPY, 'h')
+    stream.add_chunk((-1, 2))
+    stream.add_chunk((-3, 4))
+    data = stream.get_data(4)
+    assert(data.dtype == numpy.int16)
+    assert(data.tolist() == [-1, 2, -3, 4])
+
+#
+# create_number_list and create_chunk_data
+#
+
+assert(create_number_list((1, 2.0, True), int) == [1, 2, 1])
+assert(create_chunk_data([1, 2, 3], 2, 3, 0) == [3, 0, 0])
+
+if sys.hexversion >= 0x03000000: # array.array has no buffer interface in Python 2
+    data = array.array('H', [1, 2, 3, 4, 5])
+
+    assert(create_number_list(data, int) is data)
+    assert(create_chunk_data(data, 3, 3, 0) == [4, 5, 0])
+
+    # float items are converted for int streams, as for other sequences
+    data = array.array('d', [1.5, -2.5, 3.0])
+
+    assert(create_number_list(data, int) == [1, -2, 3])
+    assert(create_number_list(data, float) is data)
+
+    if numpy != None:
+        assert(create_number_list(numpy.array([1.5, 2.5], dtype=numpy.float32), int) == [1, 2])
+
+for data in [bytearray([1, 2, 3]), b('\x01\x02\x03')]:
+    assert(create_number_list(data, int) is data)
+    assert(create_chunk_data(data, 1, 3, 0) == [2, 3, 0])
+
+#
+# pipelined requests
+#
+
+def recv_exactly(sock, length):
+    data = b('')
+
+    while len(data) < length:
+        chunk = sock.recv(length - len(data))
+
+        if len(chunk) == 0:
+            break # disconnected
+
+        data += chunk
+
+    return data
+
+def answer_requests_in_reverse_order(server, count):
+    client, _ = server.accept()
+    requests = []
+
+    while len(requests) < count:
+        request = recv_exactly(client, 8)
+
+        if struct.unpack('<B', request[5:6])[0] != IPConnection.FUNCTION_DISCONNECT_PROBE:
+            requests.append(request)
+
+    for request in reversed(requests):
+        uid, _, function_id, sequence_number_and_options, _ = struct.unpack('<IBBBB', request)
+        client.sendall(struct.pack('<IBBBBI', uid, 12, function_id, sequence_number_and_options, 0, function_id * 100))
+
+    while len(client.recv(8)) > 0: # wait for disconnect
+        pass
+
+    client.close()
+
+server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+server.bind(('127.0.0.1', 0))
+server.listen(1)
+server_thread = threading.Thread(target=answer_requests_in_reverse_order, args=(server, 6))
+server_thread.start()
+
+ipcon = IPConnection()
+device = Device('abc', ipcon, -1, 'Test Device')
+ipcon.add_device(device)
+results = {}
+
+for function_id in range(1, 7):
+    device.response_expected[function_id] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+
+def call_getter(function_id):
+    results[function_id] = ipcon.send_request(device, function_id, (), '', 12, 'I')
+
+ipcon.connect(*server.getsockname())
+
+getter_threads = [threading.Thread(target=call_getter, args=(function_id,)) for function_id in range(1, 7)]
+
+for thread in getter_threads:
+    thread.start()
+
+for thread in getter_threads:
+    thread.join()
+
+ipcon.disconnect()
+server_thread.join()
+server.close()
+
+assert(results == dict([(function_id, function_id * 100) for function_id in range(1, 7)]))
+assert(len(ipcon.pending_requests) == 0)
+
+# a freed sequence number wakes the waiter for its function, even if a waiter
+# for another function of the device started to wait before
+full_requests = [[ipcon.add_pending_request(device, function_id) for _ in range(15)] for function_id in [1, 2]]
+added_requests = {}
+
+def add_pending_request_when_free(function_id):
+    added_requests[function_id] = ipcon.add_pending_request(device, function_id)
+
+waiter_threads = [threading.Thread(target=add_pending_request_when_free, args=(function_id,)) for function_id in [2, 1]]
+
+for thread in waiter_threads:
+    thread.daemon = True
+    thread.start()
+    threading.Event().wait(0.1)
+
+ipcon.remove_pending_request(full_requests[0].pop())
+waiter_threads[1].join(1)
+
+assert(1 in added_requests)
+assert(2 not in added_requests)
+
+ipcon.remove_pending_request(full_requests[1].pop())
+waiter_threads[0].join(1)
+
+assert(2 in added_requests)
+
+for pending_request in full_requests[0] + full_requests[1] + list(added_requests.values()):
+    ipcon.remove_pending_request(pending_request)
+
+assert(len(ipcon.pending_requests) == 0)
+
+#
+# batched requests
+#
+
+server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+server.bind(('127.0.0.1', 0))
+server.listen(1)
+server_thread = threading.Thread(target=answer_requests_in_reverse_order, args=(server, 6))
+server_thread.start()
+
+ipcon.connect(*server.getsockname())
+
+with device.batch() as batch:
+    for function_id in range(1, 7):
+        batch.add(function_id, (), '', 12, 'I')
+
+ipcon.disconnect()
+server_thread.join()
+server.close()
+
+assert(batch.results == [function_id * 100 for function_id in range(1, 7)])
+assert(len(ipcon.pending_requests) == 0)
+
+# batches don't wait for free sequence numbers while holding unsent ones, so
+# concurrent batches for the same function can't block each other
+def answer_requests_immediately(server, count):
+    client, _ = server.accept()
+    answered = 0
+
+    while answered < count:
+        request = recv_exactly(client, 8)
+
+        if len(request) < 8:
+            break # disconnected
+
+        uid, _, function_id, sequence_number_and_options, _ = struct.unpack('<IBBBB', request)
+
+        if function_id != IPConnection.FUNCTION_DISCONNECT_PROBE:
+            client.sendall(struct.pack('<IBBBBI', uid, 12, function_id, sequence_number_and_options, 0, function_id * 100))
+            answered += 1
+
+    while len(client.recv(8)) > 0: # wait for disconnect
+        pass
+
+    client.close()
+
+server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+server.bind(('127.0.0.1', 0))
+server.listen(1)
+server_thread = threading.Thread(target=answer_requests_immediately, args=(server, 30))
+server_thread.start()
+
+ipcon.set_timeout(0.5)
+ipcon.connect(*server.getsockname())
+
+batch_results = []
+
+def send_batch():
+    batch_results.append(ipcon.send_requests([(device, 1, (), '', 12, 'I')] * 10))
+
+# 10 of the 15 sequence numbers are held by requests that are not sent yet
+held_requests = [ipcon.add_pending_request(device, 1) for _ in range(10)]
+batch_thread = threading.Thread(target=send_batch)
+batch_thread.daemon = True
+batch_thread.start()
+batch_thread.join(5)
+
+assert(not batch_thread.is_alive())
+
+for pending_request in held_requests:
+    ipcon.remove_pending_request(pending_request)
+
+batch_threads = [threading.Thread(target=send_batch) for _ in range(2)]
+
+for thread in batch_threads:
+    thread.daemon = True
+    thread.start()
+
+for thread in batch_threads:
+    thread.join(5)
+
+    assert(not thread.is_alive())
+
+ipcon.disconnect()
+server_thread.join()
+server.close()
+ipcon.set_timeout(2.5)
+
+assert(batch_results == [[100] * 10] * 3)
+assert(len(ipcon.pending_requests) == 0)
+
+#
+# callback workers
+#
+
+def send_callbacks(server, packets):
+    client, _ = server.accept()
+
+    client.sendall(b('').join(packets))
+
+    while len(client.recv(8)) > 0: # wait for disconnect
+        pass
+
+    client.close()
+
+slow_device = Device('2', ipcon, -1, 'Slow Device') # UID 1
+fast_device = Device('3', ipcon, -1, 'Fast Device') # UID 2
+ipcon.add_device(slow_device)
+ipcon.add_device(fast_device)
+
+callback_order = []
+fast_device_done = threading.Event()
+
+def slow_callback(value):
+    fast_device_done.wait(5)
+    callback_order.append((slow_device.uid, value, threading.current_thread().name))
+
+def fast_callback(value):
+    callback_order.append((fast_device.uid, value, threading.current_thread().name))
+
+    if value == 9:
+        fast_device_done.set()
+
+for cb_device, function in [(slow_device, slow_callback), (fast_device, fast_callback)]:
+    cb_device.callback_formats[42] = (12, 'I')
+    cb_device.registered_callbacks[42] = function
+
+packets = []
+
+for value in range(10):
+    for cb_device in [slow_device, fast_device]:
+        packets.append(struct.pack('<IBBBBI', cb_device.uid, 12, 42, 0, 0, value))
+
+server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+server.bind(('127.0.0.1', 0))
+server.listen(1)
+server_thread = threading.Thread(target=send_callbacks, args=(server, packets))
+server_thread.start()
+
+ipcon.set_callback_worker_count(2)
+assert(ipcon.get_callback_worker_count() == 2)
+assert(ipcon.get_callback_queue_depths() == [])
+
+ipcon.connect(*server.getsockname())
+
+assert(len(ipcon.get_callback_queue_depths()) == 2)
+
+fast_device_done.wait(5)
+
+while len(callback_order) < 20:
+    threading.Event().wait(0.01)
+
+ipcon.disconnect()
+server_thread.join()
+server.close()
+
+# the blocked callbacks of the slow device did not delay the fast device
+assert([entry[0] for entry in callback_order[:10]] == [fast_device.uid] * 10)
+
+for cb_device in [slow_device, fast_device]:
+    entries = [entry for entry in callback_order if entry[0] == cb_device.uid]
+
+    assert([entry[1] for entry in entries] == list(range(10)))
+    assert(len(set([entry[2] for entry in entries])) == 1)
+
+#
+# callback queue policies
+#
+
+def send_callbacks_after_first(server, packets, first_dispatched):
+    client, _ = server.accept()
+
+    client.sendall(packets[0])
+    first_dispatched.wait(5)
+    client.sendall(b('').join(packets[1:]))
+
+    while len(client.recv(8)) > 0: # wait for disconnect
+        pass
+
+    client.close()
+
+ipcon.set_callback_worker_count(1)
+ipcon.set_callback_queue_size(2)
+assert(ipcon.get_callback_queue_size() == 2)
+
+for policy, expected_values, expected_drop_count in [(Device.CALLBACK_QUEUE_POLICY_LATEST_VALUE, [0, 9], 8),
+                                                     (Device.CALLBACK_QUEUE_POLICY_DROP_OLDEST, [0, 8, 9], 7)]:
+    values = []
+    first_dispatched = threading.Event()
+    callback_released = threading.Event()
+    drop_count = slow_device.get_callback_drop_count(42)
+
+    def policy_callback(value):
+        values.append(value)
+        first_dispatched.set()
+        callback_released.wait(5)
+
+    slow_device.registered_callbacks[42] = policy_callback
+    slow_device.set_callback_queue_policy(42, policy)
+    assert(slow_device.get_callback_queue_policy(42) == policy)
+
+    packets = [struct.pack('<IBBBBI', slow_device.uid, 12, 42, 0, 0, value) for value in range(10)]
+
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    server_thread = threading.Thread(target=send_callbacks_after_first, args=(server, packets, first_dispatched))
+    server_thread.start()
+
+    ipcon.connect(*server.getsockname())
+
+    while slow_device.get_callback_drop_count(42) - drop_count < expected_drop_count:
+        threading.Event().wait(0.01)
+
+    callback_released.set()
+
+    while len(values) < len(expected_values):
+        threading.Event().wait(0.01)
+
+    ipcon.disconnect()
+    server_thread.join()
+    server.close()
+
+    assert(values == expected_values)
+    assert(slow_device.get_callback_drop_count(42) - drop_count == expected_drop_count)
+
+assert(ipcon.get_callback_drop_count() == 15)
+
+try:
+    slow_device.set_callback_queue_policy(43, Device.CALLBACK_QUEUE_POLICY_BLOCK)
+    assert(False)
+except ValueError:
+    pass
+
+#
+# high-level callbacks
+#
+
+stream_values = []
+stream_device = Device('4', ipcon, -1, 'Stream Device')
+stream_device.callback_formats[50] = (16, 'H H 2H')
+stream_device.high_level_callbacks[-50] = [('stream_length', 'stream_chunk_offset', 'stream_chunk_data'),
+                                           {'fixed_length': None, 'single_chunk': False, 'item_format': 'H'}, None]
+stream_device.registered_callbacks[-50] = stream_values.append
+
+try:
+    stream_device.set_callback_queue_policy(50, Device.CALLBACK_QUEUE_POLICY_DROP_OLDEST)
+    assert(False)
+except ValueError:
+    pass
+
+assert(stream_device.get_callback_queue_policy(50) == Device.CALLBACK_QUEUE_POLICY_BLOCK)
+
+for chunk_offset, chunk_data in [(2, (9, 9)), # tail of a previous stream is ignored
+                                 (0, (1, 2)), (2, (3, 4)), (4, (5, 0)), # complete stream
+                                 (0, (6, 7)), (4, (8, 0))]: # out-of-sync stream
+    ipcon.dispatch_callback(stream_device, struct.pack('<IBBBBHH2H', stream_device.uid, 16, 50, 0, 0, 5, chunk_offset, *chunk_data))
+
+assert(stream_values == [(1, 2, 3, 4, 5), None])
+
+stream_device.set_stream_result_mode(Device.STREAM_RESULT_MODE_ARRAY)
+assert(stream_device.get_stream_result_mode() == Device.STREAM_RESULT_MODE_ARRAY)
+
+for chunk_offset, chunk_data in [(0, (1, 2)), (2, (3, 4)), (4, (5, 0))]:
+    ipcon.dispatch_callback(stream_device, struct.pack('<IBBBBHH2H', stream_device.uid, 16, 50, 0, 0, 5, chunk_offset, *chunk_data))
+
+assert(stream_values[-1] == array.array('H', [1, 2, 3, 4, 5]))
+
+#
+# windowed stream requests
+#
+
+def answer_requests_after_window(server, count, window):
+    client, _ = server.accept()
+    requests = []
+
+    while len(requests) < count:
+        request = recv_exactly(client, 8)
+        request += recv_exactly(client, struct.unpack('<B', request[4:5])[0] - 8)
+
+        if struct.unpack('<B', request[5:6])[0] == IPConnection.FUNCTION_DISCONNECT_PROBE:
+            continue
+
+        requests.append(request)
+
+        # answer only once the whole window is in-flight, then one by one
+        if len(requests) >= window:
+            for request in requests[-1 if len(requests) > window else 0:]:
+                uid, _, function_id, sequence_number_and_options, _, chunk_offset = struct.unpack('<IBBBBI', request)
+                client.sendall(struct.pack('<IBBBBI', uid, 12, function_id, sequence_number_and_options, 0, chunk_offset))
+
+    while len(client.recv(8)) > 0: # wait for disconnect
+        pass
+
+    client.close()
+
+server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+server.bind(('127.0.0.1', 0))
+server.listen(1)
+server_thread = threading.Thread(target=answer_requests_after_window, args=(server, 10, 4))
+server_thread.start()
+
+ipcon.set_stream_window_size(4)
+assert(ipcon.get_stream_window_size() == 4)
+
+ipcon.connect(*server.getsockname())
+
+ret = ipcon.send_stream_requests(device, 1, [(chunk_offset,) for chunk_offset in range(0, 100, 10)], 'I', 12, 'I')
+
+ipcon.disconnect()
+server_thread.join()
+server.close()
+
+assert(ret == 90) # result of the last chunk
+assert(len(ipcon.pending_requests) == 0)
+
+#
+# metrics
+#
+
+metrics_ipcon = IPConnection()
+metrics_device = Device('abc', metrics_ipcon, -1, 'Test Device')
+metrics_ipcon.add_device(metrics_device)
+receive_times = []
+
+for function_id in range(1, 7):
+    metrics_device.response_expected[function_id] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+
+metrics_device.callback_formats[42] = (12, 'I')
+metrics_device.registered_callbacks[42] = lambda value: receive_times.append(metrics_ipcon.get_callback_receive_time())
+
+assert(metrics_ipcon.get_metrics() == None)
+
+metrics_ipcon.set_metrics_enabled(True)
+assert(metrics_ipcon.get_metrics_enabled())
+
+server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+server.bind(('127.0.0.1', 0))
+server.listen(1)
+server_thread = threading.Thread(target=answer_requests_in_reverse_order, args=(server, 6))
+server_thread.start()
+
+metrics_ipcon.connect(*server.getsockname())
+
+with metrics_device.batch() as batch:
+    for function_id in range(1, 7):
+        batch.add(function_id, (), '', 12, 'I')
+
+metrics_ipcon.disconnect()
+server_thread.join()
+server.close()
+
+server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+server.bind(('127.0.0.1', 0))
+server.listen(1)
+server_thread = threading.Thread(target=send_callbacks, args=(server, [struct.pack('<IBBBBI', metrics_device.uid, 12, 42, 0, 0, 0)] * 3))
+server_thread.start()
+
+metrics_ipcon.set_timeout(0.1)
+metrics_ipcon.connect(*server.getsockname())
+
+try:
+    metrics_ipcon.send_request(metrics_device, 1, (), '', 12, 'I') # never answered
+    assert(False)
+except Exception as e:
+    assert(e.value == e.TIMEOUT)
+
+while len(receive_times) < 3:
+    threading.Event().wait(0.01)
+
+metrics_ipcon.disconnect()
+server_thread.join()
+server.close()
+
+snapshot = metrics_ipcon.get_metrics(reset=True)
+
+assert(sorted(snapshot['requests'].keys()) == [('abc', function_id) for function_id in range(1, 7)])
+assert(snapshot['requests'][('abc', 1)]['count'] == 1)
+assert(sum(count for _, count in snapshot['requests'][('abc', 1)]['buckets']) == 1)
+assert(snapshot['callbacks'][('abc', 42)]['count'] == 3)
+assert(snapshot['callback_delays'][('abc', 42)]['count'] == 3)
+assert(snapshot['errors'] == {-1: 1})
+assert(snapshot['bytes_out'] == 7 * 8)
+assert(snapshot['bytes_in'] == 9 * 12)
+assert(None not in receive_times and receive_times == sorted(receive_times))
+assert(metrics_ipcon.get_metrics()['bytes_in'] == 0)
+
+reports = []
+metrics_ipcon.set_metrics_reporter(reports.append, 0.01)
+
+while len(reports) < 2:
+    threading.Event().wait(0.01)
+
+metrics_ipcon.set_metrics_enabled(False)
+assert(metrics_ipcon.get_metrics() == None)
+
+#
+# capture and replay
+#
+
+capture_fd, capture_filename = tempfile.mkstemp(suffix='.tfpcap')
+os.close(capture_fd)
+
+capture_ipcon = IPConnection()
+capture_device = Device('abc', capture_ipcon, -1, 'Test Device')
+capture_ipcon.add_device(capture_device)
+captured_values = []
+
+for function_id in range(1, 7):
+    capture_device.response_expected[function_id] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+
+capture_device.callback_formats[42] = (12, 'I')
+capture_device.registered_callbacks[42] = captured_values.append
+
+server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+server.bind(('127.0.0.1', 0))
+server.listen(1)
+server_thread = threading.Thread(target=answer_requests_in_reverse_order, args=(server, 6))
+server_thread.start()
+
+capture_ipcon.start_capture(capture_filename)
+capture_ipcon.connect(*server.getsockname())
+
+with capture_device.batch() as batch:
+    for function_id in range(1, 7):
+        batch.add(function_id, (), '', 12, 'I')
+
+capture_ipcon.disconnect()
+server_thread.join()
+server.close()
+
+server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+server.bind(('127.0.0.1', 0))
+server.listen(1)
+server_thread = threading.Thread(target=send_callbacks, args=(server, [struct.pack('<IBBBBI', capture_device.uid, 12, 42, 0, 0, value) for value in range(5)]))
+server_thread.start()
+
+capture_ipcon.connect(*server.getsockname())
+
+while len(captured_values) < 5:
+    threading.Event().wait(0.01)
+
+capture_ipcon.disconnect()
+capture_ipcon.stop_capture()
+server_thread.join()
+server.close()
+
+records = list(read_capture_file(capture_filename))
+
+assert([direction for _, direction, _ in records] == [IPConnection.CAPTURE_DIRECTION_SENT] * 6 + [IPConnection.CAPTURE_DIRECTION_RECEIVED] * 11)
+assert([timestamp for timestamp, _, _ in records] == sorted(timestamp for timestamp, _, _ in records))
+
+replay_ipcon = ReplayIPConnection(capture_filename, speed=0)
+replay_device = Device('abc', replay_ipcon, -1, 'Test Device')
+replay_ipcon.add_device(replay_device)
+replayed_results = []
+
+for function_id in range(1, 7):
+    replay_device.response_expected[function_id] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+
+def replayed_callback(value):
+    if value == 0:
+        # requests are answered with the recorded responses
+        replayed_results.extend(replay_ipcon.send_request(replay_device, function_id, (), '', 12, 'I') for function_id in range(1, 7))
+
+    captured_values.append(value)
+
+replay_device.callback_formats[42] = (12, 'I')
+replay_device.registered_callbacks[42] = replayed_callback
+
+replay_ipcon.replay()
+os.remove(capture_filename)
+
+assert(captured_values == list(range(5)) * 2)
+assert(replayed_results == [function_id * 100 for function_id in range(1, 7)])
+assert(replay_ipcon.get_connection_state() == IPConnection.CONNECTION_STATE_DISCONNECTED)
+
+#
+# request coalescing and result cache
+#
+
+def answer_requests_slowly(server, received_requests):
+    client, _ = server.accept()
+
+    while True:
+        request = recv_exactly(client, 8)
+
+        if len(request) < 8:
+            break
+
+        uid, _, function_id, sequence_number_and_options, _ = struct.unpack('<IBBBB', request)
+
+        if function_id == IPConnection.FUNCTION_DISCONNECT_PROBE:
+            continue
+
+        received_requests.append(function_id)
+        threading.Event().wait(0.2) # give concurrent getter calls time to pile up
+        client.sendall(struct.pack('<IBBBBI', uid, 12, function_id, sequence_number_and_options, 0, len(received_requests)))
+
+    client.close()
+
+coalescing_ipcon = IPConnection()
+coalescing_device = Device('abc', coalescing_ipcon, -1, 'Test Device')
+coalescing_ipcon.add_device(coalescing_device)
+received_requests = []
+results = []
+
+for function_id in [1, 2, 3]:
+    coalescing_device.response_expected[function_id] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+
+coalescing_device.side_effect_free_functions.update([1, 2])
+coalescing_device.stable_functions.add(2)
+
+server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+server.bind(('127.0.0.1', 0))
+server.listen(1)
+server_thread = threading.Thread(target=answer_requests_slowly, args=(server, received_requests))
+server_thread.start()
+
+coalescing_ipcon.set_request_coalescing(True)
+assert(coalescing_ipcon.get_request_coalescing())
+
+coalescing_ipcon.connect(*server.getsockname())
+
+getter_threads = [threading.Thread(target=lambda: results.append(coalescing_ipcon.send_request(coalescing_device, 1, (), '', 12, 'I')))
+                  for _ in range(5)]
+
+for thread in getter_threads:
+    thread.start()
+
+for thread in getter_threads:
+    thread.join()
+
+# the five concurrent calls shared one request
+assert(received_requests == [1])
+assert(results == [1] * 5)
+assert(len(coalescing_ipcon.coalesced_requests) == 0)
+
+# function 3 has a response, but side effects (like reading a frame), each
+# concurrent call has to send its own request
+results = []
+reader_threads = [threading.Thread(target=lambda: results.append(coalescing_ipcon.send_request(coalescing_device, 3, (), '', 12, 'I')))
+                  for _ in range(3)]
+
+for thread in reader_threads:
+    thread.start()
+
+for thread in reader_threads:
+    thread.join()
+
+assert(received_requests == [1, 3, 3, 3])
+assert(sorted(results) == [2, 3, 4])
+
+coalescing_ipcon.set_request_coalescing(False)
+coalescing_ipcon.set_result_cache_ttl(60)
+assert(coalescing_ipcon.get_result_cache_ttl() == 60)
+
+# only stable functions are cached
+results = [coalescing_ipcon.send_request(coalescing_device, function_id, (), '', 12, 'I') for function_id in [2, 2, 1, 1]]
+
+coalescing_ipcon.disconnect()
+server_thread.join()
+server.close()
+
+assert(received_requests == [1, 3, 3, 3, 2, 1, 1])
+assert(results == [5, 5, 6, 7])
+
+#
+# device registry
+#
+
+from device_registry import DeviceRegistry
+
+class RegistryTestDevice(Device):
+    DEVICE_IDENTIFIER = 2131
+
+    def __init__(self, uid, ipcon):
+        Device.__init__(self, uid, ipcon, RegistryTestDevice.DEVICE_IDENTIFIER, 'Registry Test Device')
+
+def create_registry_test_device(device_identifier, uid, ipcon):
+    assert(device_identifier == RegistryTestDevice.DEVICE_IDENTIFIER)
+
+    return RegistryTestDevice(uid, ipcon)
+
+registry_ipcon = IPConnection()
+registry = DeviceRegistry(registry_ipcon, create_device=create_registry_test_device)
+enumerated_uids = []
+
+# an enumerate callback registered after the registry doesn't replace it
+registry_ipcon.register_callback(IPConnection.CALLBACK_ENUMERATE, lambda uid, *args: enumerated_uids.append((uid, len(registry.get_entries()))))
+
+for uid, connected_uid, position, device_identifier in [('6qb', '0', '0', 13), # Master Brick
+                                                        ('XYZ', '6qb', 'b', 2131), # Ambient Light Bricklet 3.0
+                                                        ('ABC', '6qb', 'a', 2131),
+                                                        ('old', '6qb', 'c', 2131)]:
+    registry_ipcon.dispatch_packet(struct.pack('<IBBBB', 0, 34, IPConnection.CALLBACK_ENUMERATE, 0, 0) +
+                                   IPConnection.ENUMERATE_CODEC.pack((uid, connected_uid, position, (1, 0, 0), (2, 0, 0),
+                                                                      device_identifier, IPConnection.ENUMERATION_TYPE_AVAILABLE)))
+
+registry.handle_enumerate('old', '6qb', 'c', (1, 0, 0), (2, 0, 0), 2131, IPConnection.ENUMERATION_TYPE_DISCONNECTED)
+
+# the registry is updated before the enumerate callback is called
+assert(enumerated_uids == [('6qb', 1), ('XYZ', 2), ('ABC', 3), ('old', 4)])
+assert([entry.uid for entry in registry.get_entries()] == ['6qb', 'ABC', 'XYZ'])
+assert([entry.uid for entry in registry.get_entries(device_identifier=2131)] == ['ABC', 'XYZ'])
+assert([entry.uid for entry in registry.get_roots()] == ['6qb'])
+assert([entry.uid for entry in registry.get_children('6qb')] == ['ABC', 'XYZ'])
+assert(registry.get_parent('XYZ').uid == '6qb')
+assert(registry.get_entry('old') == None)
+
+registry_device = registry.get_device('XYZ')
+
+assert(isinstance(registry_device, RegistryTestDevice))
+assert(registry.get_device('XYZ') is registry_device)
+
+registry.close()
+registry_ipcon.dispatch_packet(struct.pack('<IBBBB', 0, 34, IPConnection.CALLBACK_ENUMERATE, 0, 0) +
+                               IPConnection.ENUMERATE_CODEC.pack(('new', '6qb', 'd', (1, 0, 0), (2, 0, 0),
+                                                                  2131, IPConnection.ENUMERATION_TYPE_AVAILABLE)))
+
+assert(enumerated_uids[-1] == ('new', 3))
+assert(registry.get_entry('new') == None)
+
+snapshot_fd, snapshot_filename = tempfile.mkstemp(suffix='.json')
+os.close(snapshot_fd)
+registry.save_snapshot(snapshot_filename)
+
+warm_registry = DeviceRegistry(IPConnection(), snapshot_filename, create_registry_test_device)
+os.remove(snapshot_filename)
+
+assert([entry.uid for entry in warm_registry.get_entries()] == ['6qb', 'ABC', 'XYZ'])
+assert(warm_registry.get_entry('XYZ').from_snapshot)
+assert(warm_registry.get_entry('XYZ').hardware_version == (1, 0, 0))
+
+#
+# connection pool
+#
+
+if sys.hexversion >= 0x03040000:
+    import hmac
+    import hashlib
+    from ip_connection import base58decode
+    from ip_connection_pool import IPConnectionPool
+
+    def answer_enumerate_and_getters(server, uid, value, secret=None):
+        client, _ = server.accept()
+        authenticated = secret is None
+        server_nonce = b('\x01\x02\x03\x04')
+
+        while True:
+            request = recv_exactly(client, 8)
+
+            if len(request) < 8:
+                break
+
+            request += recv_exactly(client, struct.unpack('<B', request[4:5])[0] - 8)
+            request_uid, _, function_id, sequence_number_and_options, _ = struct.unpack('<IBBBB', request[:8])
+
+            if request_uid == 1 and function_id == 1: # get_authentication_nonce
+                client.sendall(struct.pack('<IBBBB', 1, 12, function_id, sequence_number_and_options, 0) + server_nonce)
+            elif request_uid == 1 and function_id == 2: # authenticate
+                h = hmac.new(secret.encode('ascii'), digestmod=hashlib.sha1)
+                h.update(server_nonce)
+                h.update(request[8:12])
+
+                if h.digest() != request[12:32]:
+                    break
+
+                authenticated = True
+                client.sendall(struct.pack('<IBBBB', 1, 8, function_id, sequence_number_and_options, 0))
+            elif not authenticated:
+                continue # a Brick Daemon with authentication enabled ignores everything else
+            elif function_id == IPConnection.FUNCTION_ENUMERATE:
+                client.sendall(struct.pack('<IBBBB8s8sc3B3BHB', base58decode(uid), 34, IPConnection.CALLBACK_ENUMERATE,
+                                           0, 0, b(uid), b('0'), b('a'), 1, 0, 0, 1, 0, 0, 0,
+                                           IPConnection.ENUMERATION_TYPE_AVAILABLE))
+            elif function_id == 1 and request_uid == base58decode(uid):
+                client.sendall(struct.pack('<IBBBBI', request_uid, 12, function_id, sequence_number_and_options, 0, value))
+
+        client.close()
+
+    pool = IPConnectionPool()
+    servers = []
+    server_threads = []
+
+    for uid, value in [('abc', 111), ('def', 222)]:
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(('127.0.0.1', 0))
+        server.listen(1)
+        server_thread = threading.Thread(target=answer_enumerate_and_getters, args=(server, uid, value))
+        server_thread.start()
+        servers.append(server)
+        server_threads.append(server_thread)
+
+    endpoints = [pool.connect(*server.getsockname()) for server in servers]
+    pool_devices = [Device(uid, pool, -1, 'Test Device') for uid in ['abc', 'def']]
+
+    for pool_device in pool_devices:
+        pool_device.response_expected[1] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+        pool_device.device_identifier_check = Device.DEVICE_IDENTIFIER_CHECK_MATCH
+        pool.add_device(pool_device)
+
+    results = [pool.send_request(pool_device, 1, (), '', 12, 'I') for pool_device in pool_devices]
+
+    with pool_devices[1].batch() as batch:
+        for i in range(3):
+            batch.add(1, (), '', 12, 'I')
+
+    assert(pool.get_endpoint('def') is endpoints[1])
+
+    pool.disconnect()
+
+    for server, server_thread in zip(servers, server_threads):
+        server_thread.join()
+        server.close()
+
+    assert(results == [111, 222])
+    assert(batch.results == [222, 222, 222])
+    assert(pool.get_connection_state() == IPConnection.CONNECTION_STATE_DISCONNECTED)
+    assert(pool.get_endpoint('def') is None)
+
+    # the enumerate request sent on connect is ignored, if authentication is
+    # enabled. authenticate has to enumerate again
+    pool = IPConnectionPool()
+    pool.set_timeout(1)
+
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    server_thread = threading.Thread(target=answer_enumerate_and_getters, args=(server, 'ghi', 333, 'My Secret'))
+    server_thread.start()
+
+    endpoint = pool.connect(*server.getsockname())
+    pool.authenticate('My Secret')
+
+    pool_device = Device('ghi', pool, -1, 'Test Device')
+    pool_device.response_expected[1] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+    pool_device.device_identifier_check = Device.DEVICE_IDENTIFIER_CHECK_MATCH
+    pool.add_device(pool_device)
+
+    result = pool.send_request(pool_device, 1, (), '', 12, 'I')
+
+    assert(pool.get_endpoint('ghi') is endpoint)
+
+    pool.disconnect()
+    server_thread.join()
+    server.close()
+
+    assert(result == 333)
+
+    # the selector thread of a pool must not wait for room in a full callback
+    # queue, callbacks with the blocking policy are dropped instead
+    dropped_keys = []
+    pool_queue = IPConnection.CallbackQueue(1, dropped_keys.append)
+    pool_queue.block_allowed = False
+
+    for value in range(3):
+        pool_queue.put_packet(struct.pack('<IBBBBI', 1, 12, 42, 0, 0, value), None)
+
+    assert(pool_queue.qsize() == 1)
+    assert(dropped_keys == [(1, 42), (1, 42)])
+    assert(struct.unpack('<I', pool_queue.get()[1][8:])[0] == 2)
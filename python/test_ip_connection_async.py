@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+
+if sys.hexversion < 0x3070000:
+    print('Python >= 3.7 required')
+    sys.exit(0)
+
+import struct
+import asyncio
+from ip_connection import IPConnection, Device, Error
+from ip_connection_async import AsyncIPConnection, AsyncDevice
+
+class TestDevice(Device):
+    def __init__(self, uid, ipcon):
+        Device.__init__(self, uid, ipcon, -1, 'Test Device')
+
+        for function_id in range(1, 11):
+            self.response_expected[function_id] = Device.RESPONSE_EXPECTED_ALWAYS_TRUE
+
+        self.callback_formats[42] = (12, 'I')
+
+        ipcon.add_device(self)
+
+class AsyncTestDevice(AsyncDevice, TestDevice):
+    pass
+
+async def read_request(reader):
+    # returns (uid, function_id, sequence_number_and_options) or None if disconnected,
+    # disconnect probes are skipped
+    while True:
+        try:
+            header = await reader.readexactly(8)
+            await reader.readexactly(struct.unpack('<B', header[4:5])[0] - 8)
+        except (asyncio.IncompleteReadError, OSError):
+            return None
+
+        uid, _, function_id, sequence_number_and_options, _ = struct.unpack('<IBBBB', header)
+
+        if function_id != IPConnection.FUNCTION_DISCONNECT_PROBE:
+            return uid, function_id, sequence_number_and_options
+
+def create_response(request, value):
+    uid, function_id, sequence_number_and_options = request
+
+    return struct.pack('<IBBBBI', uid, 12, function_id, sequence_number_and_options, 0, value)
+
+async def run_with_server(handle_client, test):
+    server = await asyncio.start_server(handle_client, '127.0.0.1', 0)
+    ipcon = AsyncIPConnection()
+    device = AsyncTestDevice('abc', ipcon)
+
+    try:
+        await ipcon.connect(*server.sockets[0].getsockname())
+
+        return await test(ipcon, device)
+    finally:
+        if ipcon.get_connection_state() != AsyncIPConnection.CONNECTION_STATE_DISCONNECTED:
+            await ipcon.disconnect()
+
+        server.close()
+        await server.wait_closed()
+
+#
+# request/response matching
+#
+
+async def answer_requests_in_reverse_order(reader, writer):
+    requests = []
+
+    while len(requests) < 6:
+        requests.append(await read_request(reader))
+
+    for request in reversed(requests):
+        writer.write(create_response(request, request[1] * 100))
+
+    await writer.drain()
+    await read_request(reader) # wait for disconnect
+
+async def call_getters(ipcon, device):
+    results = await asyncio.gather(*[ipcon.send_request(device, function_id, (), '', 12, 'I')
+                                     for function_id in range(1, 7)])
+
+    assert(len(ipcon.pending_requests) == 0)
+
+    return results
+
+results = asyncio.run(run_with_server(answer_requests_in_reverse_order, call_getters))
+
+assert(results == [function_id * 100 for function_id in range(1, 7)])
+
+#
+# timeout
+#
+
+async def answer_nothing(reader, writer):
+    await read_request(reader)
+    await read_request(reader) # wait for disconnect
+
+async def call_unanswered_getter(ipcon, device):
+    ipcon.set_timeout(0.2)
+
+    try:
+        await ipcon.send_request(device, 7, (), '', 12, 'I')
+    except Error as e:
+        assert(e.value == Error.TIMEOUT)
+    else:
+        assert(False)
+
+    assert(len(ipcon.pending_requests) == 0)
+
+asyncio.run(run_with_server(answer_nothing, call_unanswered_getter))
+
+#
+# waiting for a free sequence number
+#
+
+max_unanswered = []
+
+async def answer_requests_after_15(reader, writer):
+    requests = []
+
+    while len(requests) < 15:
+        requests.append(await read_request(reader))
+
+    # all 15 sequence numbers are in use, the next request has to wait
+    try:
+        requests.append(await asyncio.wait_for(read_request(reader), 0.2))
+    except asyncio.TimeoutError:
+        pass
+
+    max_unanswered.append(len(requests))
+
+    for request in requests:
+        writer.write(create_response(request, 100))
+
+    while True:
+        request = await read_request(reader)
+
+        if request == None:
+            break
+
+        writer.write(create_response(request, 100))
+
+async def call_20_getters(ipcon, device):
+    results = await asyncio.gather(*[ipcon.send_request(device, 1, (), '', 12, 'I') for _ in range(20)])
+
+    assert(len(ipcon.pending_requests) == 0)
+
+    return results
+
+results = asyncio.run(run_with_server(answer_requests_after_15, call_20_getters))
+
+assert(max_unanswered == [15])
+assert(results == [100] * 20)
+
+#
+# callbacks
+#
+
+async def answer_with_callbacks(reader, writer):
+    request = await read_request(reader)
+
+    writer.write(create_response(request, 0))
+
+    for value in range(3):
+        writer.write(struct.pack('<IBBBBI', request[0], 12, 42, 0, 0, value))
+
+    await writer.drain()
+    await read_request(reader) # wait for disconnect
+
+async def consume_callbacks(ipcon, device):
+    values = []
+    callbacks = device.callbacks(42)
+
+    # the first step registers the callback and waits for the first value
+    first_value = asyncio.ensure_future(callbacks.__anext__())
+
+    await asyncio.sleep(0)
+    assert(42 in device.registered_callbacks)
+    await ipcon.send_request(device, 10, (), '', 12, 'I')
+
+    values.append(await first_value)
+
+    async for value in callbacks:
+        values.append(value)
+
+        if len(values) == 3:
+            break
+
+    await callbacks.aclose()
+    assert(42 not in device.registered_callbacks)
+
+    return values
+
+values = asyncio.run(run_with_server(answer_with_callbacks, consume_callbacks))
+
+assert(values == [0, 1, 2])
+
+#
+# auto-reconnect
+#
+
+connection_count = [0]
+
+async def disconnect_first_connection(reader, writer):
+    connection_count[0] += 1
+
+    if connection_count[0] == 1:
+        await read_request(reader)
+        writer.close()
+        return
+
+    request = await read_request(reader)
+
+    writer.write(create_response(request, 500))
+    await writer.drain()
+    await read_request(reader) # wait for disconnect
+
+async def call_getter_after_reconnect(ipcon, device):
+    meta_callbacks = []
+    reconnected = asyncio.Event()
+
+    def connected(reason):
+        meta_callbacks.append(('connected', reason))
+        reconnected.set()
+
+    ipcon.register_callback(AsyncIPConnection.CALLBACK_CONNECTED, connected)
+    ipcon.register_callback(AsyncIPConnection.CALLBACK_DISCONNECTED,
+                            lambda reason: meta_callbacks.append(('disconnected', reason)))
+
+    ipcon.set_timeout(0.2)
+
+    try:
+        await ipcon.send_request(device, 1, (), '', 12, 'I') # closes the first connection
+    except Error:
+        pass
+
+    await asyncio.wait_for(reconnected.wait(), 5)
+
+    result = await ipcon.send_request(device, 1, (), '', 12, 'I')
+
+    assert(meta_callbacks == [('disconnected', AsyncIPConnection.DISCONNECT_REASON_SHUTDOWN),
+                              ('connected', AsyncIPConnection.CONNECT_REASON_AUTO_RECONNECT)])
+
+    return result
+
+result = asyncio.run(run_with_server(disconnect_first_connection, call_getter_after_reconnect))
+
+assert(connection_count == [2])
+assert(result == 500)
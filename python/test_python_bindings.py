@@ -51,12 +51,21 @@ if 'generators' not in sys.modules:
 
 from generators import common
 
+def is_async_source(path):
+    return path.endswith('_async.py')
+
 class PythonTester(common.Tester):
     def __init__(self, root_dir, python, extra_paths):
         common.Tester.__init__(self, 'python', '.py', root_dir, comment=python, subdirs=['examples', 'source'], extra_paths=extra_paths)
 
         self.python = python
 
+    def handle_source(self, tmp_dir, path, extra):
+        if self.python != 'python3' and is_async_source(path):
+            return # asyncio variants require Python 3.7
+
+        common.Tester.handle_source(self, tmp_dir, path, extra)
+
     def test(self, cookie, tmp_dir, path, extra):
         args = [self.python,
                 '-c',
@@ -70,6 +79,12 @@ class PylintTester(common.Tester):
 
         self.python = python
 
+    def handle_source(self, tmp_dir, path, extra):
+        if self.python != 'python3' and is_async_source(path):
+            return # asyncio variants require Python 3.7
+
+        common.Tester.handle_source(self, tmp_dir, path, extra)
+
     def test(self, cookie, tmp_dir, path, extra):
         teardown = None
 
@@ -95,6 +110,39 @@ class PylintTester(common.Tester):
 
         self.execute(cookie, args, teardown=teardown)
 
+class ImportTimeTester(common.Tester):
+    CODE = """
+import sys
+import time
+sys.path.insert(0, "{0}")
+start = time.time()
+import tinkerforge.device_factory
+imported = time.time()
+tinkerforge.device_factory.get_device_class(13) # Master Brick
+looked_up = time.time()
+device_modules = [name for name in sys.modules if name.startswith('tinkerforge.brick')]
+print('import device_factory: {{0:.1f}} ms, first lookup: {{1:.1f}} ms'.format((imported - start) * 1000, (looked_up - imported) * 1000))
+assert len(device_modules) == 1, 'device_factory imported {{0}} device modules eagerly'.format(len(device_modules))
+"""
+
+    def __init__(self, root_dir, python):
+        common.Tester.__init__(self, 'python', '.py', root_dir, comment='{0} import time'.format(python), subdirs=['source'])
+
+        self.python = python
+
+    def handle_source(self, tmp_dir, path, extra):
+        if os.path.basename(path) != 'device_factory.py':
+            return
+
+        common.Tester.handle_source(self, tmp_dir, path, extra)
+
+    def test(self, cookie, tmp_dir, path, extra):
+        args = [self.python,
+                '-c',
+                self.CODE.format(os.path.join(tmp_dir, 'source'))]
+
+        self.execute(cookie, args)
+
 def test(root_dir):
     extra_paths = [os.path.join(root_dir, '../../weather-station/demo/starter_kit_weather_station_demo/main.py'),
                    os.path.join(root_dir, '../../weather-station/write_to_lcd/python/weather_station.py'),
@@ -126,6 +174,9 @@ def test(root_dir):
     if not PythonTester(root_dir, 'python3', extra_paths).run():
         return False
 
+    if not ImportTimeTester(root_dir, 'python3').run():
+        return False
+
     # FIXME: doesn't handle PyQt related super false-positves yet
     return PylintTester(root_dir, 'python3', 'pylint3', []).run()#extra_paths).run()
 
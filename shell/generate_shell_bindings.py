@@ -578,11 +578,11 @@ class ShellBindingsGenerator(shell_common.ShellGeneratorTrait, common.BindingsGe
         if not device.is_released():
             return
 
-        self.call_devices.append("'{0}': call_{1}_{2}".format(device.get_shell_device_name(),
+        self.call_devices.append("'{0}': 'call_{1}_{2}'".format(device.get_shell_device_name(),
                                                               device.get_name().under,
                                                               device.get_category().under))
 
-        self.dispatch_devices.append("'{0}': dispatch_{1}_{2}".format(device.get_shell_device_name(),
+        self.dispatch_devices.append("'{0}': 'dispatch_{1}_{2}'".format(device.get_shell_device_name(),
                                                                       device.get_name().under,
                                                                       device.get_category().under))
 
@@ -640,11 +640,16 @@ def get_device_display_name(device_identifier):
 
         shell.write('\n\n\n' + ipcon + '\n\n\n')
 
+        # the device code is embedded as strings and only compiled for the
+        # device that is used, see load_device_function
+        device_sources = []
+
         for filename in sorted(self.part_files):
             if filename.endswith('.part'):
                 with open(os.path.join(bindings_dir, filename), 'r') as f:
-                    shell.write(f.read())
+                    device_sources.append("'{0}': {1}".format(filename[:-len('.part')], repr(f.read())))
 
+        shell.write('\ndevice_sources = {\n' + ',\n'.join(device_sources) + '\n}\n')
         shell.write('\ncall_devices = {\n' + ',\n'.join(sorted(self.call_devices)) + '\n}\n')
         shell.write('\ndispatch_devices = {\n' + ',\n'.join(sorted(self.dispatch_devices)) + '\n}\n')
 
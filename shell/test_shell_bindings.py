@@ -80,8 +80,47 @@ class ShellExamplesTester(common.Tester):
     def check_success(self, exit_code, output):
         return exit_code == 0 and output.strip() in ['', 'Press key to exit', '>>> skipping']
 
+class StartupTimeTester(common.Tester):
+    CODE = """
+import sys
+import time
+import runpy
+import subprocess
+path = "{0}"
+runs = 5
+for argv in [['--version'], ['call', '--list-devices'], ['call', 'ambient-light-v3-bricklet', '--list-functions']]:
+    start = time.time()
+    for i in range(runs):
+        subprocess.check_output([sys.executable, path] + argv)
+    print('tinkerforge {{0}}: {{1:.1f}} ms'.format(' '.join(argv), (time.time() - start) / runs * 1000))
+load_device_function = runpy.run_path(path, run_name='startup_time')['load_device_function']
+load_device_function('ambient-light-v3-bricklet', 'call_ambient_light_v3_bricklet')
+namespace = load_device_function.__globals__
+device_classes = [name for name, value in namespace.items() if isinstance(value, type) and issubclass(value, namespace['Device']) and value not in [namespace['Device'], namespace['BrickDaemon']]]
+assert device_classes == ['AmbientLightV3Bricklet'], 'compiled {{0}} device classes instead of one'.format(len(device_classes))
+"""
+
+    def __init__(self, root_dir):
+        common.Tester.__init__(self, 'shell', '', root_dir, comment='startup time', subdirs=[''])
+
+    def handle_source(self, tmp_dir, path, extra):
+        if os.path.basename(path) != 'tinkerforge':
+            return
+
+        common.Tester.handle_source(self, tmp_dir, path, extra)
+
+    def test(self, cookie, tmp_dir, path, extra):
+        args = [sys.executable,
+                '-c',
+                self.CODE.format(path)]
+
+        self.execute(cookie, args)
+
 def test(root_dir):
-    return ShellExamplesTester(root_dir).run()
+    if not ShellExamplesTester(root_dir).run():
+        return False
+
+    return StartupTimeTester(root_dir).run()
 
 if __name__ == '__main__':
     common.dockerize('shell', __file__)